@@ -0,0 +1,191 @@
+import argparse
+import json
+import os
+import random
+import sys
+
+# main.analyze_game_log(GameDetailRecords 를 바로 훑는 방식)가 예전 MessageToDict 기반 구현과 같은 통계/화료역을 내는지 점검.
+# 합성 패보를 games 개 만들어 두 구현에 같이 넣고, 하나라도 결과가 다르면 그 패보를 보여 주고 종료 코드 1 로 끝난다.
+# 합성 패보는 국마다 type 1(국 시작/쯔모/화료/유국 등 결과 Wrapper)과 type 2(타패, 리치, 쯔모, 치/펑/깡, 론 입력)
+# 액션을 무작위로 섞는다. 국 종료(화료/유국) 없이 끝나는 패보, 론이 국의 첫 입력인 경우, val 이 0 인 역도 들어간다.
+# iter_game_events / ROUND_END_RECORDS 를 고치면 이 점검을 같이 돌린다.
+#
+#   python -m bench.analyze [--games 300] [--seed 1]
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# 국 종료가 아닌 type 1 결과 (RecordLiuJu 는 예전 구현도 국 종료로 세지 않았다)
+OTHER_RECORDS = [".lq.RecordNewRound", ".lq.RecordDealTile", ".lq.RecordDiscardTile", ".lq.RecordChiPengGang",
+                 ".lq.RecordLiuJu"]
+
+
+def reference_analyze(game_details):
+    # user-004 이전 구현: MessageToDict 로 바꾼 뒤 base64 로 인코딩된 result 앞부분으로 국 종료를 찾는다.
+    import ms.protocol_lazy as pb
+    from google.protobuf.json_format import MessageToDict
+    from han_constants import HAN
+
+    actions = MessageToDict(game_details).get("actions", [])
+
+    current_kyoku = 0
+    stats = {
+        seat: {key: set() for key in ("ron", "tsumo", "houju", "riichi", "furo", "dama", "chase_riichi")}
+        for seat in range(4)
+    }
+    riichi_declared_in_kyoku = set()
+    prev_action = None
+
+    for action in actions:
+        if (
+            action.get("type") == 1 and
+            isinstance(action.get("result"), str) and
+            (action["result"].startswith("Cg4ub") or action["result"].startswith("ChAub"))
+        ):
+            current_kyoku += 1
+            riichi_declared_in_kyoku.clear()
+            prev_action = None
+            continue
+
+        if (
+            action.get("type") == 2 and
+            action.get("userInput", {}).get("type") == 3 and
+            action["userInput"].get("cpg", {}).get("type") == 9
+        ):
+            attacker = action["userInput"].get("seat", 0)
+            defender = prev_action["userInput"].get("seat", 0) if prev_action else 0
+            stats[attacker]["ron"].add(current_kyoku)
+            stats[defender]["houju"].add(current_kyoku)
+            if current_kyoku not in stats[attacker]["riichi"] and current_kyoku not in stats[attacker]["furo"]:
+                stats[attacker]["dama"].add(current_kyoku)
+
+        if action.get("type") == 2 and action.get("userInput", {}).get("operation", {}).get("type") == 8:
+            seat = action["userInput"].get("seat", 0)
+            stats[seat]["tsumo"].add(current_kyoku)
+            if current_kyoku not in stats[seat]["riichi"] and current_kyoku not in stats[seat]["furo"]:
+                stats[seat]["dama"].add(current_kyoku)
+
+        if action.get("type") == 2 and action.get("userInput", {}).get("operation", {}).get("type") == 7:
+            seat = action["userInput"].get("seat", 0)
+            if any(other_seat != seat for other_seat in riichi_declared_in_kyoku):
+                stats[seat]["chase_riichi"].add(current_kyoku)
+            stats[seat]["riichi"].add(current_kyoku)
+            riichi_declared_in_kyoku.add(seat)
+
+        if (
+            action.get("type") == 2 and
+            action.get("userInput", {}).get("type") == 3 and
+            action["userInput"].get("cpg", {}).get("type") in [2, 3, 5]
+        ):
+            seat = action["userInput"].get("seat", 0)
+            stats[seat]["furo"].add(current_kyoku)
+
+        if action["type"] != 1:
+            prev_action = action
+
+    result = {
+        "total_kyoku": current_kyoku,
+        "players": {
+            seat: {
+                "ron": len(stats[seat]["ron"]),
+                "tsumo": len(stats[seat]["tsumo"]),
+                "houju": len(stats[seat]["houju"]),
+                "riichi": len(stats[seat]["riichi"]),
+                "furo": len(stats[seat]["furo"]),
+                "hora": len(stats[seat]["ron"] | stats[seat]["tsumo"]),
+                "dama": len(stats[seat]["dama"]),
+                "chase_riichi": len(stats[seat]["chase_riichi"]),
+            }
+            for seat in range(4)
+        },
+    }
+
+    hules = []
+    round_record_wrapper = pb.Wrapper()
+    for record in (action.result for action in game_details.actions if action.type == 1):
+        round_record_wrapper.ParseFromString(record)
+        if round_record_wrapper.name == ".lq.RecordHule":
+            record_hule = pb.RecordHule()
+            record_hule.ParseFromString(round_record_wrapper.data)
+            hule = MessageToDict(record_hule)["hules"][0]
+            for fan in hule["fans"]:
+                if "val" in fan:
+                    fan_id = fan["id"]
+                    fan_name = HAN.get(fan_id, f"알 수 없는 역({fan_id})")
+                    hules.append([hule.get("seat", 0), fan_name, fan.get("val", 0)])
+
+    return result, hules
+
+
+def build_game(rng):
+    # 합성 패보 한 판 (fetchGameRecord 의 ResGameRecord.data 모양)
+    import ms.protocol_lazy as pb
+
+    details = pb.GameDetailRecords(version=210715)
+
+    def add_result(name, message=None):
+        data = message.SerializeToString() if message is not None else b""
+        details.actions.add(type=1, result=pb.Wrapper(name=name, data=data).SerializeToString())
+
+    for _ in range(rng.randint(1, 12)):
+        add_result(".lq.RecordNewRound")
+        for _ in range(rng.randint(0, 30)):
+            seat = rng.randrange(4)
+            kind = rng.random()
+            if kind < 0.1:
+                add_result(rng.choice(OTHER_RECORDS))
+            elif kind < 0.5:
+                details.actions.add(type=2, user_input={"seat": seat, "operation": {"type": rng.choice([1, 1, 7, 8])}})
+            elif kind < 0.9:
+                details.actions.add(type=2, user_input={"seat": seat, "type": 3, "cpg": {"type": rng.randrange(10)}})
+            else:
+                details.actions.add(type=2, user_input={"seat": seat, "type": rng.randrange(4)})
+
+        end = rng.random()
+        if end < 0.6:
+            record_hule = pb.RecordHule()
+            for _ in range(rng.randint(1, 2)):
+                hule = record_hule.hules.add(seat=rng.randrange(4), zimo=rng.random() < 0.5)
+                for _ in range(rng.randint(1, 5)):
+                    hule.fans.add(id=rng.randrange(1, 70), val=rng.choice([0, 1, 1, 2, 13]))
+            add_result(".lq.RecordHule", record_hule)
+        elif end < 0.9:
+            add_result(".lq.RecordNoTile", pb.RecordNoTile(liujumanguan=rng.random() < 0.1))
+        # 나머지는 국 종료 없이 다음 국(또는 패보 끝)으로 넘어간다
+
+    return pb.Wrapper(name=".lq.GameDetailRecords", data=details.SerializeToString()).SerializeToString()
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--games", type=int, default=300)
+    parser.add_argument("--seed", type=int, default=1)
+    args = parser.parse_args()
+
+    sys.path.insert(0, ROOT)
+    import main as app
+    import ms.protocol_lazy as pb
+    from fake_gateway import RECORD_FIXTURE, build_game_record_data
+    from ms.base import wrapper_data
+
+    rng = random.Random(args.seed)
+    with open(RECORD_FIXTURE, "rb") as f:
+        games = [build_game_record_data(f.read())]
+    games += [build_game(rng) for _ in range(args.games)]
+
+    mismatches = []
+    for i, data in enumerate(games):
+        game_details = pb.GameDetailRecords()
+        game_details.ParseFromString(wrapper_data(data))
+        expected = reference_analyze(game_details)
+        actual = app.decode_game_statistics(data)
+        if actual != expected:
+            mismatches.append({"game": i, "expected": expected, "actual": actual})
+
+    print(json.dumps({"games": len(games), "mismatches": len(mismatches)}, indent=2))
+    for mismatch in mismatches[:3]:
+        print(f"MISMATCH {json.dumps(mismatch, ensure_ascii=False, default=str)}", file=sys.stderr)
+    return 1 if mismatches else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,97 @@
+import argparse
+import json
+import os
+import resource
+import sys
+import time
+import tracemalloc
+
+# 패보 한 판(fetchGameRecord 의 ResGameRecord.data)을 통계로 바꾸는 동안의 할당량을 tracemalloc 으로 잰다.
+#   wrapper:  예전 방식. Wrapper 를 파싱해 data(패보 전체)를 bytes 로 꺼낸 뒤 GameDetailRecords 로 파싱한다.
+#   inplace:  main.decode_game_statistics 방식. Wrapper.data 를 memoryview 로 바로 넘긴다.
+#   reuse:    GameDetailRecords 하나를 Clear() 해 가며 재사용하는 방식. upb 는 Clear() 에서 arena 를 돌려주지 않아
+#             파싱할 때마다 프로세스 메모리(maxrss)가 늘어난다. 그래서 채널/디코더는 메시지를 재사용하지 않는다.
+# tracemalloc 은 파이썬 할당만 본다 (upb arena 는 보이지 않으므로 reuse 는 maxrss 로 잰다).
+#
+#   python -m bench.decode [--games 200] [--kyoku 500]
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def measure(fn, data, games):
+    tracemalloc.start()
+    peaks = []
+    start = time.perf_counter()
+    for _ in range(games):
+        tracemalloc.reset_peak()
+        base, _ = tracemalloc.get_traced_memory()
+        fn(data)
+        peaks.append(tracemalloc.get_traced_memory()[1] - base)
+    elapsed = time.perf_counter() - start
+    tracemalloc.stop()
+    return {"peak_kb_per_game": round(max(peaks) / 1024, 1), "ms_per_game": round(elapsed / games * 1000, 3)}
+
+
+def maxrss_growth_mb(fn, data, games):
+    before = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    for _ in range(games):
+        fn(data)
+    return round((resource.getrusage(resource.RUSAGE_SELF).ru_maxrss - before) / 1024, 1)
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--games", type=int, default=200)
+    parser.add_argument("--kyoku", type=int, default=500, help="합성 패보의 국 수")
+    args = parser.parse_args()
+
+    sys.path.insert(0, ROOT)
+    import main as app
+    import ms.protocol_lazy as pb
+    from fake_gateway import RECORD_FIXTURE, build_game_record_data
+    from ms.base import wrapper_data
+
+    with open(RECORD_FIXTURE, "rb") as f:
+        data = build_game_record_data(f.read(), args.kyoku)
+
+    def parse_wrapper(data):
+        record_wrapper = pb.Wrapper()
+        record_wrapper.ParseFromString(data)
+        game_details = pb.GameDetailRecords()
+        game_details.ParseFromString(record_wrapper.data)
+        return game_details
+
+    def parse_inplace(data):
+        game_details = pb.GameDetailRecords()
+        game_details.ParseFromString(wrapper_data(data))
+        return game_details
+
+    reused = pb.GameDetailRecords()
+
+    def parse_reuse(data):
+        reused.Clear()
+        reused.ParseFromString(wrapper_data(data))
+        return reused
+
+    assert parse_wrapper(data) == parse_inplace(data) == parse_reuse(data)
+    print(json.dumps({
+        "record_bytes": len(data),
+        # 파싱 단계만
+        "parse": {
+            "wrapper": measure(parse_wrapper, data, args.games),
+            "inplace": measure(parse_inplace, data, args.games),
+        },
+        # 파싱 + analyze_game_log
+        "statistics": {
+            "wrapper": measure(lambda data: app.analyze_game_log(parse_wrapper(data)), data, args.games),
+            "inplace": measure(app.decode_game_statistics, data, args.games),
+        },
+        # 프로세스 메모리 증가 (inplace 를 먼저 재야 reuse 증가분이 가려지지 않는다)
+        "maxrss_growth_mb": {
+            "inplace": maxrss_growth_mb(parse_inplace, data, args.games),
+            "reuse": maxrss_growth_mb(parse_reuse, data, args.games),
+        },
+    }, indent=2))
+
+if __name__ == "__main__":
+    main()
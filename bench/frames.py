@@ -0,0 +1,68 @@
+import argparse
+import json
+import os
+import sys
+import timeit
+
+# 큰 패보 응답 프레임(type 3 + idx + Wrapper(ResGameRecord))을 ResGameRecord 로 푸는 비용.
+#   copy:     예전 방식. msg[3:] 로 잘라 Wrapper 를 파싱하고, 꺼낸 data 로 다시 응답을 파싱한다.
+#   zerocopy: MSRPCChannel 의 현재 방식. 헤더는 struct 로 읽고, Wrapper.data 는 프레임을 가리키는 memoryview 로 넘긴다.
+#
+#   python -m bench.frames [--kyoku 50 500 1500] [--number 200]
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def build_frame(pb, hule_result, kyoku_count):
+    from fake_gateway import build_game_record_data
+
+    res = pb.ResGameRecord(data=build_game_record_data(hule_result, kyoku_count))
+    return b"\x03\x01\x00" + pb.Wrapper(data=res.SerializeToString()).SerializeToString()
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--kyoku", type=int, nargs="+", default=[50, 500, 1500], help="합성 패보의 국 수 (프레임 크기)")
+    parser.add_argument("--number", type=int, default=200)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    sys.path.insert(0, ROOT)
+    import ms.protocol_lazy as pb
+    from fake_gateway import RECORD_FIXTURE
+    from ms.base import _FRAME_IDX, _wrapper_data
+
+    with open(RECORD_FIXTURE, "rb") as f:
+        hule_result = f.read()
+
+    results = []
+    for kyoku_count in args.kyoku:
+        frame = build_frame(pb, hule_result, kyoku_count)
+
+        def copy():
+            idx = int.from_bytes(frame[1:3], "little")
+            wrapper = pb.Wrapper()
+            wrapper.ParseFromString(frame[3:])
+            res = pb.ResGameRecord()
+            res.ParseFromString(wrapper.data)
+            return idx, res
+
+        def zerocopy():
+            idx, = _FRAME_IDX.unpack_from(frame, 1)
+            res = pb.ResGameRecord()
+            res.ParseFromString(_wrapper_data(frame, 3))
+            return idx, res
+
+        assert copy()[1] == zerocopy()[1]
+        row = {"frame_bytes": len(frame)}
+        for name, fn in (("copy", copy), ("zerocopy", zerocopy)):
+            best = min(timeit.repeat(fn, number=args.number, repeat=args.repeat)) / args.number
+            row[f"{name}_us"] = round(best * 1e6, 2)
+        row["speedup"] = round(row["copy_us"] / row["zerocopy_us"], 2)
+        results.append(row)
+
+    print(json.dumps(results, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,60 @@
+import argparse
+import asyncio
+import json
+import os
+import sys
+import time
+
+# 한 MSRPCChannel 위에서 fetchGameRecord 를 여러 개 동시에 보냈을 때의 처리량.
+# 가짜 게이트웨이(fake_gateway.py)에 응답 지연을 주고, 동시 요청 수(concurrency)별로 초당 처리 건수를 잰다.
+#
+#   python -m bench.pipeline [--calls 500] [--latency 0.05] [--concurrency 1 8 64 256] [--max-in-flight 64]
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+async def run(calls, latency, concurrencies, max_in_flight):
+    sys.path.insert(0, ROOT)
+    import ms.protocol_lazy as pb
+    from fake_gateway import FakeGateway
+    from ms.base import MSRPCChannel
+    from ms.rpc_lazy import Lobby
+
+    results = {}
+    async with FakeGateway(games=calls, latency=latency) as gateway:
+        channel = MSRPCChannel(f"ws://{gateway.domain}/gateway", timeout=30, max_in_flight=max_in_flight)
+        await channel.connect(gateway.ms_host)
+        lobby = Lobby(channel)
+        uuids = [record.uuid for record in gateway.contest_records]
+
+        for concurrency in concurrencies:
+            semaphore = asyncio.Semaphore(concurrency)
+
+            async def fetch(uuid):
+                async with semaphore:
+                    await lobby.fetch_game_record(pb.ReqGameRecord(game_uuid=uuid))
+
+            start = time.perf_counter()
+            await asyncio.gather(*(fetch(uuid) for uuid in uuids))
+            elapsed = time.perf_counter() - start
+            results[str(concurrency)] = {"elapsed_s": round(elapsed, 4), "calls_per_s": round(calls / elapsed, 1)}
+
+        await channel.close()
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--calls", type=int, default=500)
+    parser.add_argument("--latency", type=float, default=0.05, help="가짜 게이트웨이 응답 지연(초)")
+    parser.add_argument("--concurrency", type=int, nargs="+", default=[1, 8, 64, 256])
+    parser.add_argument("--max-in-flight", type=int, default=64)
+    args = parser.parse_args()
+
+    results = asyncio.run(run(args.calls, args.latency, args.concurrency, args.max_in_flight))
+    print(json.dumps({"calls": args.calls, "latency_s": args.latency, "max_in_flight": args.max_in_flight,
+                      "concurrency": results}, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,211 @@
+import argparse
+import asyncio
+import json
+import os
+import sys
+import time
+
+# MSRPCChannel 재접속 / 재전송 / 세션 재개 실패 경로 점검.
+# 가짜 게이트웨이(fake_gateway.py)의 disconnect_rate 로 연결을 끊어 가며 아래를 확인하고, 하나라도 어긋나면 종료 코드 1 로 끝난다.
+#   disconnects:       요청 묶음이 끊김을 겪어도 모두 제 응답으로 끝나고, 끝난 뒤 _inflight / _pending_pkts 가 비어 있다
+#   long_outage:       재접속 대기(backoff)가 요청 timeout 보다 길어도 재전송된 요청이 timeout 나지 않는다
+#   no_replay:         replay=False 요청은 끊기면 MSRPCConnectionError 로 끝나고 서버에 다시 보내지지 않는다
+#   rejected_resume:   resume hook 이 거절되면 hook 을 되풀이하지 않고 채널이 실패하며, 이후 요청도 바로 실패한다
+#
+#   python -m bench.reconnect [--calls 200] [--disconnect-rate 0.02] [--seed 1]
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def channel_state(channel):
+    return {
+        "inflight": len(channel._inflight),
+        "pending_pkts": len(channel._pending_pkts),
+        "unreplayable": len(channel._unreplayable),
+    }
+
+
+async def fetch_batch(gateway, calls, timeout, reconnect_backoff):
+    # calls 개의 fetchGameRecord 를 한꺼번에 보내고, 제 uuid 로 답을 받은 수와 실패 목록을 돌려준다.
+    import ms.protocol_lazy as pb
+    from ms.base import MSRPCChannel
+    from ms.rpc_lazy import Lobby, Route
+
+    channel = MSRPCChannel(
+        f"ws://{gateway.domain}/gateway", timeout=timeout, reconnect=True, reconnect_backoff=reconnect_backoff,
+        max_reconnect_attempts=50,
+    )
+    await channel.connect(gateway.ms_host)
+    channel.add_resume_hook(lambda: Route(channel).request_connection(pb.ReqRequestConnection()))
+    lobby = Lobby(channel)
+    uuids = [record.uuid for record in gateway.contest_records[:calls]]
+
+    async def fetch(uuid):
+        res = await lobby.fetch_game_record(pb.ReqGameRecord(game_uuid=uuid))
+        if res.head.uuid != uuid:
+            raise AssertionError(f"response for {res.head.uuid!r} answered request for {uuid!r}")
+
+    start = time.perf_counter()
+    results = await asyncio.gather(*(fetch(uuid) for uuid in uuids), return_exceptions=True)
+    elapsed = time.perf_counter() - start
+    state = channel_state(channel)
+    await channel.close()
+
+    errors = [repr(result) for result in results if isinstance(result, BaseException)]
+    result = {
+        "calls": len(uuids),
+        "ok": len(uuids) - len(errors),
+        "disconnects": gateway.disconnects,
+        "elapsed_s": round(elapsed, 3),
+        "state_after": state,
+        "errors": errors[:5],
+    }
+    failures = []
+    if errors:
+        failures.append(f"{len(errors)}/{len(uuids)} requests failed, e.g. {errors[0]}")
+    if not gateway.disconnects:
+        failures.append("the gateway never disconnected; raise --disconnect-rate or --calls")
+    if any(state.values()):
+        failures.append(f"channel state not empty after the batch: {state}")
+    return result, failures
+
+
+async def check_disconnects(calls, disconnect_rate, seed):
+    from fake_gateway import FakeGateway
+
+    async with FakeGateway(games=calls, latency=0.01, disconnect_rate=disconnect_rate, seed=seed) as gateway:
+        return await fetch_batch(gateway, calls, timeout=10, reconnect_backoff=0.05)
+
+
+async def check_long_outage(calls, disconnect_rate, seed):
+    from fake_gateway import FakeGateway
+
+    # backoff 0.8초 > timeout 0.5초: 재접속을 기다리는 동안 timeout 시계가 멈춰야 통과한다
+    async with FakeGateway(games=calls, latency=0.01, disconnect_rate=disconnect_rate, seed=seed) as gateway:
+        return await fetch_batch(gateway, calls, timeout=0.5, reconnect_backoff=0.8)
+
+
+async def check_no_replay(seed):
+    import ms.protocol_lazy as pb
+    from fake_gateway import FakeGateway
+    from ms.base import MSRPCChannel, MSRPCConnectionError
+    from ms.rpc_lazy import Lobby
+
+    failures = []
+    async with FakeGateway(latency=0.2, seed=seed) as gateway:
+        channel = MSRPCChannel(f"ws://{gateway.domain}/gateway", timeout=5, reconnect=True, reconnect_backoff=0.01)
+        await channel.connect(gateway.ms_host)
+        lobby = Lobby(channel)
+
+        pay = asyncio.ensure_future(lobby.pay_month_ticket(pb.ReqCommon(), replay=False))
+        await asyncio.sleep(0.05)
+        # 다음 요청을 받는 순간 연결을 끊는다 (그 요청은 replay 대상이라 재접속 후 다시 보내진다)
+        gateway.disconnect_rate = 1.0
+        heartbeat = asyncio.ensure_future(lobby.heatbeat(pb.ReqHeatBeat()))
+        await asyncio.sleep(0.05)
+        gateway.disconnect_rate = 0.0
+
+        try:
+            await pay
+            failures.append("a replay=False request completed across a disconnect")
+        except MSRPCConnectionError:
+            pass
+        try:
+            await heartbeat
+        except Exception as e:
+            failures.append(f"the replayed request failed: {e!r}")
+        state = channel_state(channel)
+        await channel.close()
+        pay_count = gateway.requests.count(".lq.Lobby.payMonthTicket")
+
+    if pay_count != 1:
+        failures.append(f"payMonthTicket reached the gateway {pay_count} times")
+    if any(state.values()):
+        failures.append(f"channel state not empty afterwards: {state}")
+    return {"pay_month_ticket_sent": pay_count, "state_after": state}, failures
+
+
+async def check_rejected_resume(seed):
+    import ms.protocol_lazy as pb
+    from fake_gateway import FakeGateway
+    from ms.base import MSRPCChannel, MSRPCConnectionError
+    from ms.rpc_lazy import Lobby
+
+    failures = []
+    async with FakeGateway(seed=seed) as gateway:
+        channel = MSRPCChannel(f"ws://{gateway.domain}/gateway", timeout=5, reconnect=True, reconnect_backoff=0.01)
+        await channel.connect(gateway.ms_host)
+        lobby = Lobby(channel)
+        hook_runs = 0
+
+        async def rejected_login():
+            nonlocal hook_runs
+            hook_runs += 1
+            raise RuntimeError("oauth2Login reconnect rejected")
+
+        channel.add_resume_hook(rejected_login)
+        gateway.disconnect_rate = 1.0
+        try:
+            await lobby.heatbeat(pb.ReqHeatBeat())
+            failures.append("the request completed although the resume was rejected")
+        except MSRPCConnectionError:
+            pass
+        gateway.disconnect_rate = 0.0
+
+        # 실패한 채널이 스스로 다시 붙어 hook 을 되풀이하지 않는지 잠시 지켜본다
+        await asyncio.sleep(0.5)
+        started = time.perf_counter()
+        try:
+            await lobby.heatbeat(pb.ReqHeatBeat())
+            failures.append("a request after the failure completed")
+        except MSRPCConnectionError:
+            pass
+        later_call_s = time.perf_counter() - started
+        state = channel_state(channel)
+        await channel.close()
+
+    if hook_runs != 1:
+        failures.append(f"the rejected resume hook ran {hook_runs} times")
+    if gateway.disconnects != 1:
+        failures.append(f"the channel reconnected after failing ({gateway.disconnects} disconnects)")
+    if later_call_s > 0.1:
+        failures.append(f"a request after the failure took {later_call_s:.3f}s to fail")
+    if any(state.values()):
+        failures.append(f"channel state not empty afterwards: {state}")
+    return {"hook_runs": hook_runs, "disconnects": gateway.disconnects, "state_after": state}, failures
+
+
+async def run(calls, disconnect_rate, seed):
+    sys.path.insert(0, ROOT)
+    checks = {
+        "disconnects": check_disconnects(calls, disconnect_rate, seed),
+        "long_outage": check_long_outage(calls, disconnect_rate, seed),
+        "no_replay": check_no_replay(seed),
+        "rejected_resume": check_rejected_resume(seed),
+    }
+    results = {}
+    failures = []
+    for name, check in checks.items():
+        results[name], check_failures = await check
+        failures.extend(f"{name}: {failure}" for failure in check_failures)
+    return results, failures
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--calls", type=int, default=200)
+    parser.add_argument("--disconnect-rate", type=float, default=0.02, help="요청을 받고 연결을 끊을 확률")
+    parser.add_argument("--seed", type=int, default=1)
+    args = parser.parse_args()
+
+    results, failures = asyncio.run(run(args.calls, args.disconnect_rate, args.seed))
+    results["failures"] = failures
+    print(json.dumps(results, indent=2))
+
+    for failure in failures:
+        print(f"FAILED {failure}", file=sys.stderr)
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,139 @@
+import argparse
+import asyncio
+import json
+import logging
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+# 시작 비용 벤치마크.
+#   imports:   새 인터프리터에서 각 모듈 import 에 걸린 시간
+#   handshake: 로컬 가짜 게이트웨이(fake_gateway.py)를 상대로 한 discover() / connect_fastest() / login() 시간
+# 결과는 JSON 으로 내보내고, thresholds.json 의 상한을 넘는 항목이 있으면 종료 코드 1 로 끝난다.
+# import 상한은 같은 실행에서 잰 eager import(ms.protocol_pb2 / ms.rpc) 중앙값의 배수라, 기계가 빠르든 느리든
+# 같은 기준으로 비교된다 (배수는 여러 번 잰 비율 중 가장 큰 값의 약 1.5배 이상). handshake 상한은 중앙값(ms)이고 측정값의 약 4배다.
+#
+#   python -m bench.startup [--repeat 5] [--output bench_output.txt] [--thresholds bench/thresholds.json]
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+DEFAULT_THRESHOLDS = os.path.join(os.path.dirname(os.path.abspath(__file__)), "thresholds.json")
+IMPORT_TARGETS = ["ms.protocol_pb2", "ms.rpc", "ms.protocol_lazy", "ms.rpc_lazy", "main"]
+
+
+def summarize(samples, cold=None):
+    # cold: 지연 import(aiohttp 등)가 포함된 첫 회 값. 중앙값(=threshold 비교값)에서는 빠진다.
+    return {
+        "first_ms": round((samples[0] if cold is None else cold) * 1000, 3),
+        "median_ms": round(statistics.median(samples) * 1000, 3),
+        "min_ms": round(min(samples) * 1000, 3),
+        "samples_ms": [round(sample * 1000, 3) for sample in samples],
+    }
+
+
+def measure_import(module, repeat):
+    code = f"import time; t = time.perf_counter(); import {module}; print(time.perf_counter() - t)"
+    samples = []
+    for _ in range(repeat):
+        out = subprocess.check_output([sys.executable, "-c", code], cwd=ROOT, stderr=subprocess.DEVNULL)
+        samples.append(float(out.decode().strip().splitlines()[-1]))
+    return summarize(samples)
+
+
+async def measure_handshake(repeat):
+    from fake_gateway import FakeGateway
+
+    async with FakeGateway() as gateway:
+        # main 은 import 시점에 환경변수를 읽으므로 가짜 게이트웨이 주소를 먼저 넣는다. 캐시 파일은 쓰지 않는다.
+        os.environ.update(
+            MS_HOST=gateway.ms_host,
+            MS_GATEWAY_SCHEME="ws",
+            DISCOVERY_CACHE_PATH="",
+            ROUTE_STATS_PATH="",
+        )
+        import main
+        logging.getLogger().setLevel(logging.WARNING)
+
+        # 첫 회(콜드 스타트)는 first_ms 로만 남기고, 중앙값은 그 뒤 repeat 회로 낸다.
+        samples = {"discover": [], "connect": [], "login": []}
+        for _ in range(repeat + 1):
+            start = time.perf_counter()
+            routes, client_version_string, product_version, _ = await main.discover(use_cache=False)
+            discovered = time.perf_counter()
+            lobby, channel = await main.connect_fastest(routes)
+            connected = time.perf_counter()
+            try:
+                if not await main.login(lobby, client_version_string, product_version):
+                    raise RuntimeError("login against the fake gateway failed")
+                logged_in = time.perf_counter()
+            finally:
+                await channel.close()
+
+            samples["discover"].append(discovered - start)
+            samples["connect"].append(connected - discovered)
+            samples["login"].append(logged_in - connected)
+
+    return {phase: summarize(values[1:], cold=values[0]) for phase, values in samples.items()}
+
+
+def check_thresholds(results, thresholds):
+    # thresholds: {"imports": {"ms.rpc_lazy": {"max_ratio": 1.0, "of": "ms.rpc"}, ...}, "handshake": {"login": 20, ...}}
+    # 숫자는 중앙값 상한(ms), {"max_ratio", "of"} 는 같은 구역에서 잰 "of" 항목 중앙값에 대한 배수 상한이다.
+    regressions = []
+    for section, limits in thresholds.items():
+        measured_section = results.get(section, {})
+        for name, limit in limits.items():
+            measured = measured_section.get(name)
+            if measured is None:
+                continue
+            if isinstance(limit, dict):
+                baseline = measured_section.get(limit["of"])
+                if baseline is None or not baseline["median_ms"]:
+                    continue
+                ratio = measured["median_ms"] / baseline["median_ms"]
+                if ratio > limit["max_ratio"]:
+                    regressions.append(
+                        f"{section}.{name}: {measured['median_ms']}ms = {ratio:.2f} x {limit['of']} "
+                        f"> {limit['max_ratio']} x {limit['of']}"
+                    )
+            elif measured["median_ms"] > limit:
+                regressions.append(f"{section}.{name}: {measured['median_ms']}ms > {limit}ms")
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--output", help="결과 JSON 을 쓸 파일 (없으면 stdout)")
+    parser.add_argument("--thresholds", default=DEFAULT_THRESHOLDS)
+    parser.add_argument("--skip-handshake", action="store_true")
+    args = parser.parse_args()
+
+    results = {"python": sys.version.split()[0], "imports": {}}
+    for module in IMPORT_TARGETS:
+        results["imports"][module] = measure_import(module, args.repeat)
+    if not args.skip_handshake:
+        sys.path.insert(0, ROOT)
+        results["handshake"] = asyncio.run(measure_handshake(args.repeat))
+
+    thresholds = {}
+    if args.thresholds and os.path.exists(args.thresholds):
+        with open(args.thresholds, "r", encoding="utf-8") as f:
+            thresholds = json.load(f)
+    results["regressions"] = check_thresholds(results, thresholds)
+
+    output = json.dumps(results, indent=2)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            f.write(output + "\n")
+    else:
+        print(output)
+
+    for regression in results["regressions"]:
+        print(f"REGRESSION {regression}", file=sys.stderr)
+    return 1 if results["regressions"] else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
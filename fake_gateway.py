@@ -0,0 +1,241 @@
+import argparse
+import asyncio
+import json
+import logging
+import os
+import random
+import time
+from http import HTTPStatus
+
+import websockets
+
+import ms.protocol_lazy as pb
+from ms.rpc_lazy import Lobby, Route
+
+# 로컬에서 작혼 서버 흉내를 내는 가짜 게이트웨이.
+# HTTP 로 version.json / index.html / v{version}/config.json / api/clientgate/routes 를 돌려주고,
+# /gateway 에서는 MSRPCChannel 과 같은 형식(타입 바이트 + 2바이트 little-endian idx + Wrapper)으로 RPC 에 답한다.
+# main.py 를 MS_HOST=http://127.0.0.1:{port}/ MS_GATEWAY_SCHEME=ws 로 띄우면 실제 서버 없이 connect_and_login() 이 돈다.
+#
+# 대회 기록(fetchCustomizedContestGameRecords)과 패보(fetchGameRecord)는 fixture 로 답한다.
+#   - 기본값: record.bin(직렬화된 .lq.RecordHule Wrapper)을 화료 결과로 쓰는 합성 패보 games 개
+#   - record_cache_dir: RecordCache 에 받아둔 실제 패보가 있으면 그 uuid 로는 원본을 그대로 돌려준다
+# latency 는 응답마다 넣는 지연(초), drop_rate 는 응답하지 않고 버릴 확률(→ 클라이언트 timeout),
+# disconnect_rate 는 요청을 받은 자리에서 연결을 끊을 확률(→ 재접속/재전송 경로)이다.
+#
+#   python fake_gateway.py --port 8080 --latency 0.05 --drop-rate 0.01 --games 500
+
+SERVICES = {"Lobby": Lobby, "Route": Route}
+RECORD_FIXTURE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "record.bin")
+CONTEST_PAGE_SIZE = 10
+
+
+def build_game_record_data(hule_result, kyoku_count=8):
+    # fetchGameRecord 의 ResGameRecord.data 모양(.lq.GameDetailRecords 를 담은 Wrapper)으로 합성 패보를 만든다.
+    # 국마다: 0번 리치 → 1번 후로 → 2번 타패 → 0번 론 → hule_result(화료 결과 Wrapper) 순서.
+    details = pb.GameDetailRecords(version=210715)
+    for _ in range(kyoku_count):
+        details.actions.add(type=2, user_input={"seat": 0, "operation": {"type": 7}})
+        details.actions.add(type=2, user_input={"seat": 1, "type": 3, "cpg": {"type": 2}})
+        details.actions.add(type=2, user_input={"seat": 2, "operation": {"type": 1}})
+        details.actions.add(type=2, user_input={"seat": 0, "type": 3, "cpg": {"type": 9}})
+        details.actions.add(type=1, result=hule_result)
+    return pb.Wrapper(name=".lq.GameDetailRecords", data=details.SerializeToString()).SerializeToString()
+
+
+def build_contest_records(count, start_time=None, interval=1800):
+    # 대회 기록 목록. 서버처럼 최신 게임이 앞에 온다.
+    if start_time is None:
+        start_time = int(time.time()) - count * interval
+    records = []
+    for i in range(count):
+        record = pb.RecordGame(
+            uuid=f"fake-{i:06d}",
+            start_time=start_time + i * interval,
+            end_time=start_time + i * interval + interval - 60,
+        )
+        for seat in range(4):
+            record.accounts.add(account_id=100 + seat, seat=seat, nickname=f"player{seat}")
+            record.result.players.add(seat=seat, total_point=25000 + (1 - seat) * 5000, part_point_1=25000)
+        records.append(record)
+    records.reverse()
+    return records
+
+
+class FakeGateway:
+
+    def __init__(self, host="127.0.0.1", port=0, version="0.11.0.w", product_version="4.0.0", latency=0.0,
+                 drop_rate=0.0, disconnect_rate=0.0, games=50, record_fixture=RECORD_FIXTURE,
+                 record_cache_dir=None, seed=None):
+        self.host = host
+        self.port = port
+        self.version = version
+        self.product_version = product_version
+        self.latency = latency
+        self.drop_rate = drop_rate
+        self.disconnect_rate = disconnect_rate
+        self.requests = []
+        self.dropped = 0
+        self.disconnects = 0
+        self._random = random.Random(seed)
+
+        with open(record_fixture, "rb") as f:
+            self.game_record_data = build_game_record_data(f.read())
+        self.contest_records = build_contest_records(games)
+        self._records_by_uuid = {record.uuid: record for record in self.contest_records}
+        self._record_cache = None
+        if record_cache_dir:
+            from record_cache import RecordCache
+            self._record_cache = RecordCache(record_cache_dir)
+
+        self._handlers = {
+            ".lq.Route.requestConnection": lambda data: pb.ResRequestConnection(timestamp=int(time.time() * 1000)),
+            ".lq.Lobby.heatbeat": lambda data: pb.ResCommon(),
+            ".lq.Lobby.oauth2Auth": lambda data: pb.ResOauth2Auth(access_token="fake-access-token"),
+            ".lq.Lobby.oauth2Check": lambda data: pb.ResOauth2Check(has_account=True),
+            ".lq.Lobby.oauth2Login": lambda data: pb.ResLogin(account_id=1),
+            ".lq.Lobby.payMonthTicket": lambda data: pb.ResPayMonthTicket(resource_id=101001, resource_count=1),
+            ".lq.Lobby.fetchCustomizedContestGameRecords": self._fetch_contest_records,
+            ".lq.Lobby.fetchGameRecord": self._fetch_game_record,
+        }
+        self._server = None
+
+    @property
+    def ms_host(self):
+        return f"http://{self.host}:{self.port}/"
+
+    @property
+    def domain(self):
+        return f"{self.host}:{self.port}"
+
+    def add_handler(self, name, handler):
+        # handler(data: bytes) -> 응답 메시지. 등록되지 않은 메서드는 rpc 테이블의 응답 클래스 기본값으로 답한다.
+        self._handlers[name] = handler
+
+    async def start(self):
+        self._server = await websockets.serve(
+            self._handle, self.host, self.port, process_request=self._process_request
+        )
+        self.port = self._server.sockets[0].getsockname()[1]
+        logging.info(f"fake gateway listening on {self.ms_host}")
+
+    async def stop(self):
+        self._server.close()
+        await self._server.wait_closed()
+
+    async def __aenter__(self):
+        await self.start()
+        return self
+
+    async def __aexit__(self, *exc):
+        await self.stop()
+
+    def _process_request(self, path, request_headers):
+        path = path.split("?", 1)[0]
+        if path == "/gateway":
+            return None
+        if path == "/version.json":
+            return self._json({"version": self.version})
+        if path == "/index.html":
+            body = f'<script>var config = {{productVersion: "{self.product_version}"}};</script>'
+            return HTTPStatus.OK, [("Content-Type", "text/html")], body.encode()
+        if path == f"/v{self.version}/config.json":
+            return self._json({"ip": [{"gateways": [{"url": self.ms_host.rstrip("/")}]}]})
+        if path == "/api/clientgate/routes":
+            return self._json({"data": {"routes": [{"id": "fake-1", "domain": self.domain}]}})
+        return HTTPStatus.NOT_FOUND, [], b"not found"
+
+    def _json(self, obj):
+        return HTTPStatus.OK, [("Content-Type", "application/json")], json.dumps(obj).encode()
+
+    def _fetch_contest_records(self, data):
+        req = pb.ReqFetchCustomizedContestGameRecords()
+        req.ParseFromString(data)
+        start = req.last_index
+        page = self.contest_records[start:start + CONTEST_PAGE_SIZE]
+        next_index = start + len(page) if start + len(page) < len(self.contest_records) else 0
+        return pb.ResFetchCustomizedContestGameRecords(record_list=page, next_index=next_index)
+
+    def _fetch_game_record(self, data):
+        req = pb.ReqGameRecord()
+        req.ParseFromString(data)
+        res = pb.ResGameRecord()
+        cached = self._record_cache.get(req.game_uuid) if self._record_cache is not None else None
+        if cached is not None:
+            res.data = cached
+        elif req.game_uuid in self._records_by_uuid:
+            res.head.CopyFrom(self._records_by_uuid[req.game_uuid])
+            res.data = self.game_record_data
+        else:
+            res.error.code = 1203
+        return res
+
+    def respond(self, name, data):
+        handler = self._handlers.get(name)
+        if handler is not None:
+            return handler(data)
+        _, package, service, method = name.split(".")
+        return SERVICES[service](None).get_res_class(method)()
+
+    async def _handle(self, ws):
+        replies = set()
+        try:
+            async for msg in ws:
+                if msg[0] != 2:  # REQUEST 만 처리한다
+                    continue
+                if self.disconnect_rate and self._random.random() < self.disconnect_rate:
+                    self.disconnects += 1
+                    # close handshake 를 기다리지 않고 TCP 를 바로 닫는다. ws.close() 는 클라이언트가 파이프라인해 둔
+                    # 요청이 수신 큐(max_queue)를 채우면 close frame 을 못 읽어 close_timeout(10초)까지 끈다.
+                    ws.fail_connection(1011, "fake gateway disconnect")
+                    return
+                # 요청마다 따로 답해서, 지연이 있어도 파이프라인된 요청들이 줄지어 기다리지 않게 한다.
+                reply = asyncio.create_task(self._reply(ws, msg))
+                replies.add(reply)
+                reply.add_done_callback(replies.discard)
+        finally:
+            for reply in replies:
+                reply.cancel()
+
+    async def _reply(self, ws, msg):
+        wrapper = pb.Wrapper()
+        wrapper.ParseFromString(msg[3:])
+        self.requests.append(wrapper.name)
+        res = self.respond(wrapper.name, wrapper.data)
+        if self.latency:
+            await asyncio.sleep(self.latency)
+        if self.drop_rate and self._random.random() < self.drop_rate:
+            self.dropped += 1
+            return
+        try:
+            await ws.send(b"\x03" + msg[1:3] + pb.Wrapper(data=res.SerializeToString()).SerializeToString())
+        except websockets.exceptions.ConnectionClosed:
+            pass
+
+
+async def serve(args):
+    gateway = FakeGateway(
+        args.host, args.port, latency=args.latency, drop_rate=args.drop_rate, disconnect_rate=args.disconnect_rate,
+        games=args.games, record_fixture=args.record_fixture, record_cache_dir=args.record_cache_dir, seed=args.seed,
+    )
+    async with gateway:
+        print(f"MS_HOST={gateway.ms_host} MS_GATEWAY_SCHEME=ws", flush=True)
+        await asyncio.Future()
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8080)
+    parser.add_argument("--latency", type=float, default=0.0, help="응답마다 넣을 지연(초)")
+    parser.add_argument("--drop-rate", type=float, default=0.0, help="응답을 버릴 확률")
+    parser.add_argument("--disconnect-rate", type=float, default=0.0, help="요청을 받고 연결을 끊을 확률")
+    parser.add_argument("--games", type=int, default=50, help="대회 기록에 넣을 합성 게임 수")
+    parser.add_argument("--record-fixture", default=RECORD_FIXTURE)
+    parser.add_argument("--record-cache-dir", help="RecordCache 디렉터리 (있으면 실제 패보를 돌려준다)")
+    parser.add_argument("--seed", type=int)
+    try:
+        asyncio.run(serve(parser.parse_args()))
+    except KeyboardInterrupt:
+        pass
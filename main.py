@@ -1,35 +1,77 @@
+import argparse
 import asyncio
 import logging
-import random
 import re
 import sys
 import time
 import uuid
 import json
-import aiohttp
 import os
-import gspread
 import pytz
 
 from datetime import datetime
 from dotenv import load_dotenv
-from ms.base import MSRPCChannel
-from ms.rpc import Lobby
-import ms.protocol_pb2 as pb
+from ms.base import MSRPCChannel, MSRPCConnectionError, MSRPCTimeoutError, wrapper_data
+from ms.rpc_lazy import Lobby
+import ms.protocol_lazy as pb
 from google.protobuf.json_format import MessageToJson
 from google.protobuf.json_format import MessageToDict
-from oauth2client.service_account import ServiceAccountCredentials
 
 from han_constants import HAN
+from record_cache import RecordCache
+from route_stats import RouteStats, rank_routes
+from sync_state import SyncState
 
 load_dotenv()
 uid = os.getenv("UID", "default_uid")
 token = os.getenv("TOKEN", "default_token")
 TOURNAMENT_ID = int(os.getenv("TOURNAMENT_ID", 0))
+# 패보(fetchGameRecord)를 동시에 몇 개까지 요청할지. 하나의 MSRPCChannel 위에서 idx 로 구분되어 병렬 처리된다.
+FETCH_CONCURRENCY = int(os.getenv("FETCH_CONCURRENCY", 8))
+# RPC 응답 대기 기본 제한시간(초). 게이트웨이가 응답을 떨어뜨려도 cron 이 무한정 멈추지 않게 한다.
+RPC_TIMEOUT = float(os.getenv("MS_RPC_TIMEOUT", 30))
+# websocket 이 끊기면 자동으로 다시 연결해 세션을 이어 붙이고, 응답을 못 받은 요청을 다시 보낸다 (MS_RECONNECT=0 이면 끔).
+RPC_RECONNECT = os.getenv("MS_RECONNECT", "1") == "1"
+RPC_MAX_RECONNECT_ATTEMPTS = int(os.getenv("MS_MAX_RECONNECT_ATTEMPTS", 5))
+# 한 채널에서 동시에 응답을 기다릴 수 있는 요청 수. 넘치면 send_request 가 자리가 날 때까지 기다린다.
+RPC_MAX_IN_FLIGHT = int(os.getenv("MS_MAX_IN_FLIGHT", 64))
+# 로그인 후 채널이 보내는 heatbeat 주기(초). 긴 백필 중에 서버가 유휴 연결을 끊지 않게 한다.
+HEARTBEAT_INTERVAL = float(os.getenv("MS_HEARTBEAT_INTERVAL", 60))
+# tickets 모드: 여러 계정의 월정액권을 한 번에 수령할 때 쓰는 계정 목록 파일과 동시 세션 수
+ACCOUNTS_FILE = os.getenv("ACCOUNTS_FILE", "accounts.json")
+ACCOUNT_PARALLELISM = int(os.getenv("ACCOUNT_PARALLELISM", 5))
+# daemon 모드 작업 주기(초)와 재연결 최대 대기 시간(초)
+DAEMON_TICKET_INTERVAL = float(os.getenv("DAEMON_TICKET_INTERVAL", 6 * 3600))
+DAEMON_SYNC_INTERVAL = float(os.getenv("DAEMON_SYNC_INTERVAL", 300))
+DAEMON_MAX_BACKOFF = float(os.getenv("DAEMON_MAX_BACKOFF", 300))
+# 받아온 패보 원본을 보관할 디렉터리. 비워두면 캐시를 쓰지 않는다.
+RECORD_CACHE_DIR = os.getenv("RECORD_CACHE_DIR", ".cache/records")
+
+SPREADSHEET_NAME = "카일색 대회전 기록지"
+# 여러 대회를 한 번에 동기화할 때: TOURNAMENTS='{"대회ID": "스프레드시트 이름", ...}'
+# 없으면 TOURNAMENT_ID 하나를 SPREADSHEET_NAME 에 기록한다.
+TOURNAMENTS = os.getenv("TOURNAMENTS")
+DATA_SHEET = "데이터"
+STATISTICS_SHEET = "국 통계"
+HULES_SHEET = "화료역"
+
+# 이미 시트에 올린 uuid 를 기록하는 로컬 인덱스. 평소에는 이것만 보고 중복을 거른다.
+SYNC_STATE_PATH = os.getenv("SYNC_STATE_PATH", ".cache/sync_state.sqlite3")
+# 이 주기(초)마다 한 번씩 시트의 패보 링크 열을 읽어 인덱스를 맞춘다. RECONCILE_UUIDS=1 이면 이번 실행에서 강제로 맞춘다.
+UUID_RECONCILE_INTERVAL = float(os.getenv("UUID_RECONCILE_INTERVAL", 7 * 24 * 3600))
+FORCE_RECONCILE_UUIDS = os.getenv("RECONCILE_UUIDS") == "1"
+# 마지막으로 반영한 endTime 보다 이만큼(초) 이전 기록까지는 다시 확인한다 (늦게 목록에 올라오는 게임 대비, 중복은 uuid 인덱스가 거른다).
+HIGH_WATER_OVERLAP = int(os.getenv("HIGH_WATER_OVERLAP", 3600))
+# 시트에 한 번의 batchUpdate 로 같이 올리는 게임 수 (데이터/국 통계/화료역 행을 게임 단위로 묶어 보낸다)
+SHEET_BATCH_GAMES = int(os.getenv("SHEET_BATCH_GAMES", 500))
+# 패보를 이 횟수만큼 (실행을 넘어) 받지 못한 게임은 통계 없이 데이터 행만 올리고 high-water mark 를 더 붙잡지 않는다.
+MAX_RECORD_FETCH_ATTEMPTS = int(os.getenv("MAX_RECORD_FETCH_ATTEMPTS", 5))
 
 deviceId = f"web|{uid}"
 
-MS_HOST = "https://mahjongsoul.game.yo-star.com/"
+# MS_HOST / MS_GATEWAY_SCHEME 는 로컬 가짜 게이트웨이(fake_gateway.py)로 벤치마크할 때만 바꾼다.
+MS_HOST = os.getenv("MS_HOST", "https://mahjongsoul.game.yo-star.com/")
+GATEWAY_SCHEME = os.getenv("MS_GATEWAY_SCHEME", "wss")
 PASSPORT_HOST = "https://passport.mahjongsoul.com/"
 
 # EN(yo-star) 서버 기준 로그인 파라미터 (원본 최신 WebGL 로그인 방식)
@@ -43,6 +85,13 @@ CURRENCY_PLATFORMS = [1, 4, 5, 9, 12]
 # 그대로 쓴다 (하드코딩값은 작혼이 리소스를 올릴 때마다 다시 깨진다 — 2026-08-20에 재발해서
 # 매 5분 cron이 조용히 계속 실패하고 있었음).
 RESOURCE_VERSION_OVERRIDE = os.getenv("MS_RESOURCE_VERSION")
+# version / productVersion / 게이트웨이 / route 목록을 저장해 두는 파일과 유효 시간(초).
+# 유효한 캐시가 있으면 HTTP 탐색 4단계를 건너뛰고 바로 websocket 에 붙는다. 비워두면 캐시를 쓰지 않는다.
+DISCOVERY_CACHE_PATH = os.getenv("DISCOVERY_CACHE_PATH", ".cache/discovery.json")
+DISCOVERY_CACHE_TTL = float(os.getenv("DISCOVERY_CACHE_TTL", 6 * 3600))
+# route 별 연결 지연 통계를 저장하는 파일과, route 후보에 연결을 시험해 볼 때의 제한시간(초)
+ROUTE_STATS_PATH = os.getenv("ROUTE_STATS_PATH", ".cache/route_stats.json")
+ROUTE_PROBE_TIMEOUT = float(os.getenv("ROUTE_PROBE_TIMEOUT", 3))
 DEVICE = {
     "platform": "pc",
     "hardware": "pc",
@@ -84,63 +133,309 @@ def build_request_connection(route_id):
     return data
 
 
+class ClientVersionMismatch(Exception):
+    # oauth2Auth 가 code 151 로 거절됨: client_version_string 이 작혼 클라이언트의 최신 resource 버전과 다르다.
+    pass
+
+
+class GameRecordUnavailable(Exception):
+    # fetchGameRecord 가 에러를 돌려줬거나 data 도 data_url 도 못 쓴다: 빈 통계를 시트에 올리지 않도록 건너뛴다.
+    pass
+
+
+def log_client_version_mismatch(client_version_string):
+    logging.error(
+        "code 151: client_version_string 이 작혼 클라이언트의 최신 resource 버전과 "
+        f"맞지 않을 때 발생합니다 (현재 사용값: {client_version_string}).\n"
+        "  1) 브라우저에서 작혼(EN) 로그인 후 개발자도구 콘솔에 다음을 실행:\n"
+        "       GameMgr.Inst.client_version_string   (예: 'WebGL_2022-0.16.212')\n"
+        "  2) 출력의 'WebGL_2022-' 뒤 숫자(resource 버전)를 MS_RESOURCE_VERSION 환경변수/Secret 에 설정\n"
+        "     (예: MS_RESOURCE_VERSION=0.16.212)"
+    )
+
+
+async def connect_and_login(account_uid=uid, account_token=token):
+    # 로그인까지 마친 (lobby, channel, client_version_string) 을 돌려준다. 실패하면 None.
+    # 캐시된 탐색 결과의 route 에 하나도 연결하지 못하거나 151 이 나면 (캐시는 login 에서 지워짐)
+    # 새로 탐색해서 한 번 더 시도한다.
+    use_cache = True
+    while True:
+        routes, client_version_string, product_version, from_cache = await discover(use_cache)
+        try:
+            lobby, channel = await connect_fastest(routes)
+        except ConnectionError:
+            if not from_cache:
+                raise
+            logging.warning("캐시된 route 에 모두 연결하지 못해 게이트웨이 정보를 새로 받아 다시 연결합니다")
+            invalidate_discovery_cache()
+            use_cache = False
+            continue
+        try:
+            access_token = await login(lobby, client_version_string, product_version, account_uid, account_token)
+            if access_token:
+                start_session(lobby, channel, access_token, client_version_string, product_version)
+                return lobby, channel, client_version_string
+        except ClientVersionMismatch:
+            if from_cache:
+                logging.warning("캐시된 버전 정보로 151 이 발생해 게이트웨이 정보를 새로 받아 다시 로그인합니다")
+                await channel.close()
+                use_cache = False
+                continue
+            log_client_version_mismatch(client_version_string)
+        except BaseException:
+            await channel.close()
+            raise
+        await channel.close()
+        return None
+
+
+def start_session(lobby, channel, access_token, client_version_string, product_version):
+    # 로그인을 마친 채널에 oauth2Login 재개 훅과 heartbeat 를 붙인다.
+    # 재개 훅이 없으면 다시 연결된 채널이 로그인되지 않은 세션으로 요청을 replay 한다.
+    async def resume_login():
+        req = build_oauth2_login_request(access_token, client_version_string, product_version, reconnect=True)
+        res = await lobby.oauth2_login(req)
+        if res.error.code:
+            # 거절된 재로그인으로 계속 요청을 보내면 에러 응답만 돌아온다. 채널을 실패시킨다.
+            raise RuntimeError(f"oauth2Login reconnect 거절됨 (code {res.error.code})")
+        logging.info("세션을 다시 이어 붙였습니다 (oauth2Login reconnect)")
+
+    channel.add_resume_hook(resume_login)
+    channel.start_heartbeat(HEARTBEAT_INTERVAL)
+
+
 async def main():
-    lobby, channel, client_version_string, product_version = await connect()
+    session = await connect_and_login()
+    if session is None:
+        return False
+    lobby, channel, client_version_string = session
     try:
-        return await login(lobby, client_version_string, product_version)
+        # 일일 월정액권(월간패스) 보상 수령
+        await getMonthlyTicket(lobby)
+
+        await sync_tournaments(lobby, client_version_string, load_tournaments())
+        return True
     finally:
         await channel.close()
 
 
-async def connect():
-    async with aiohttp.ClientSession() as session:
-        async with session.get("{}version.json".format(MS_HOST)) as res:
-            version = await res.json()
-            logging.info(f"Version: {version}")
-            version = version["version"]
+# 세션을 다시 열어야 하는 작업 실패. 나머지 예외는 작업만 다시 돌린다.
+SESSION_ERRORS = (MSRPCConnectionError, MSRPCTimeoutError)
+
+
+async def run_daemon():
+    # 상주 모드: 로그인한 세션 하나를 계속 유지하면서 월정액권 수령 / 대회 동기화를 주기적으로 돌린다.
+    # heatbeat 는 채널이 알아서 보낸다. 작업이 연결 문제(연결 끊김, 응답 timeout)로 실패하면 세션을 닫고
+    # 백오프 후 다시 연결·로그인한다. 그 밖의 실패(시트, sqlite 등)는 세션을 그대로 두고 그 작업만 백오프 후 다시 돌린다.
+    # 재연결 백오프는 작업이 성공했을 때만 처음으로 돌아간다 (로그인 성공만으로는 돌아가지 않는다).
+    tournaments = load_tournaments()
 
-        # productVersion(index.html) 은 client_version.package 용, resource 버전은 별도(RESOURCE_VERSION).
-        # client_version_string = WebGL_2022-{resource} 이어야 oauth2Auth 가 통과한다.
-        async with session.get("{}index.html".format(MS_HOST)) as res:
-            index_html = await res.text()
-        match = re.search(r'productVersion\s*:\s*["\']([^"\']+)["\']', index_html)
-        product_version = match.group(1) if match else "0.0.0"
-        resource_version = RESOURCE_VERSION_OVERRIDE or product_version
-        client_version_string = f"WebGL_2022-{resource_version}"
-        logging.info(f"productVersion: {product_version}, resource: {resource_version}, client_version_string: {client_version_string}")
+    async def month_ticket(lobby, client_version_string):
+        await getMonthlyTicket(lobby)
+
+    async def sync(lobby, client_version_string):
+        await sync_tournaments(lobby, client_version_string, tournaments)
+
+    jobs = [
+        ("month_ticket", DAEMON_TICKET_INTERVAL, month_ticket),
+    ]
+    if tournaments:
+        jobs.append(("sync", DAEMON_SYNC_INTERVAL, sync))
+    # 세션이 바뀌어도 유지되는 작업별 다음 실행 시각과 실패 백오프. 연결 문제로 실패한 작업은 재연결 직후 다시 돈다.
+    next_run = {name: 0 for name, _, _ in jobs}
+    job_backoff = {name: 1 for name, _, _ in jobs}
+
+    backoff = 1
+    while True:
+        try:
+            session = await connect_and_login()
+        except Exception:
+            logging.exception("연결 실패")
+            session = None
+        if session is None:
+            logging.warning(f"{backoff}초 후 다시 연결합니다")
+            await asyncio.sleep(backoff)
+            backoff = min(backoff * 2, DAEMON_MAX_BACKOFF)
+            continue
+
+        lobby, channel, client_version_string = session
+        try:
+            while True:
+                now = time.monotonic()
+                for name, interval, job in jobs:
+                    if next_run[name] <= now:
+                        logging.info(f"daemon job: {name}")
+                        try:
+                            await job(lobby, client_version_string)
+                        except SESSION_ERRORS:
+                            raise
+                        except Exception:
+                            logging.exception(f"daemon job {name} 실패, {job_backoff[name]}초 후 다시 돌립니다")
+                            next_run[name] = time.monotonic() + job_backoff[name]
+                            job_backoff[name] = min(job_backoff[name] * 2, DAEMON_MAX_BACKOFF)
+                            continue
+                        backoff = job_backoff[name] = 1
+                        next_run[name] = time.monotonic() + interval
+                await asyncio.sleep(max(min(next_run.values()) - time.monotonic(), 0))
+        except SESSION_ERRORS:
+            logging.exception(f"daemon 작업 중 연결이 끊겼습니다, {backoff}초 후 다시 연결합니다")
+        finally:
+            await channel.close()
+        await asyncio.sleep(backoff)
+        backoff = min(backoff * 2, DAEMON_MAX_BACKOFF)
+
+
+async def connect_fastest(routes):
+    route_stats = RouteStats(ROUTE_STATS_PATH)
+    ranked_routes = await rank_routes(routes, route_stats, ROUTE_PROBE_TIMEOUT, use_ssl=GATEWAY_SCHEME == "wss")
+    return await open_channel_with_failover(ranked_routes, route_stats)
+
+
+async def open_channel_with_failover(ranked_routes, route_stats):
+    # 빠른 route 부터 연결하고, websocket 연결이나 requestConnection 이 실패하면 다음 route 로 넘어간다.
+    last_error = None
+    for route in ranked_routes:
+        try:
+            return await open_channel(route)
+        except Exception as e:
+            logging.warning(f"route {route['id']} 연결 실패, 다음 route 로 넘어갑니다: {e!r}")
+            route_stats.record_failure(route["id"])
+            route_stats.save()
+            last_error = e
+    raise ConnectionError("모든 route 연결에 실패했습니다") from last_error
+
+
+def client_version_string_for(product_version):
+    # productVersion(index.html) 은 client_version.package 용, resource 버전은 별도(RESOURCE_VERSION).
+    # client_version_string = WebGL_2022-{resource} 이어야 oauth2Auth 가 통과한다.
+    resource_version = RESOURCE_VERSION_OVERRIDE or product_version
+    return f"WebGL_2022-{resource_version}"
+
+
+def load_discovery_cache():
+    try:
+        with open(DISCOVERY_CACHE_PATH, "r", encoding="utf-8") as f:
+            cached = json.load(f)
+    except (FileNotFoundError, json.JSONDecodeError):
+        return None
+    if time.time() - cached.get("fetched_at", 0) > DISCOVERY_CACHE_TTL:
+        return None
+    return cached
+
+
+def save_discovery_cache(version, product_version, gateway_url, routes):
+    directory = os.path.dirname(DISCOVERY_CACHE_PATH)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    cached = {
+        "version": version,
+        "product_version": product_version,
+        "gateway_url": gateway_url,
+        "routes": routes,
+        "fetched_at": time.time(),
+    }
+    tmp_path = DISCOVERY_CACHE_PATH + ".tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(cached, f)
+    os.replace(tmp_path, DISCOVERY_CACHE_PATH)
+
+
+def invalidate_discovery_cache():
+    try:
+        os.remove(DISCOVERY_CACHE_PATH)
+    except FileNotFoundError:
+        pass
 
-        async with session.get("{}v{}/config.json".format(MS_HOST, version)) as res:
-            config = await res.json()
-            logging.info(f"Config: {config}")
 
-            url = config["ip"][0]["gateways"][0]["url"]
-            logging.info(f"url: {url}")
+async def discover(use_cache=True):
+    # (routes, client_version_string, product_version, from_cache)
+    if use_cache and DISCOVERY_CACHE_PATH:
+        cached = load_discovery_cache()
+        if cached is not None:
+            product_version = cached["product_version"]
+            logging.info(f"Using cached discovery: version {cached['version']}, productVersion {product_version}")
+            return cached["routes"], client_version_string_for(product_version), product_version, True
 
-        async with session.get(url + "/api/clientgate/routes") as res:
-            json_data = await res.json()
-            routes = [r for r in json_data['data']['routes'] if r.get('id') and r.get('domain')]
+    # 탐색 캐시가 살아 있으면 aiohttp 자체가 필요 없으므로 여기서 불러온다 (import 비용이 크다).
+    import aiohttp
 
-            logging.info(f"Available routes: {[(r['id'], r['domain']) for r in routes]}")
+    # index.html 과 version.json → config.json → routes 사슬은 서로 독립이라 동시에 돌린다.
+    # 전체 소요 시간은 두 갈래 중 긴 쪽(사슬)만큼이 된다. 같은 호스트 요청은 커넥터의 keep-alive 연결과 DNS 캐시를 같이 쓴다.
+    connector = aiohttp.TCPConnector(ttl_dns_cache=300, keepalive_timeout=30)
+    async with aiohttp.ClientSession(connector=connector) as session:
+        product_version, (version, url, routes) = await asyncio.gather(
+            fetch_product_version(session),
+            fetch_gateway_routes(session),
+        )
+    client_version_string = client_version_string_for(product_version)
+    logging.info(f"productVersion: {product_version}, client_version_string: {client_version_string}")
 
-            route = random.choice(routes)
-            endpoint = "wss://{}/gateway".format(route['domain'])
+    if DISCOVERY_CACHE_PATH:
+        save_discovery_cache(version, product_version, url, routes)
 
+    return routes, client_version_string, product_version, False
+
+
+async def fetch_product_version(session):
+    async with session.get("{}index.html".format(MS_HOST)) as res:
+        index_html = await res.text()
+    match = re.search(r'productVersion\s*:\s*["\']([^"\']+)["\']', index_html)
+    return match.group(1) if match else "0.0.0"
+
+
+async def fetch_gateway_routes(session):
+    async with session.get("{}version.json".format(MS_HOST)) as res:
+        version = await res.json()
+        logging.info(f"Version: {version}")
+        version = version["version"]
+
+    async with session.get("{}v{}/config.json".format(MS_HOST, version)) as res:
+        config = await res.json()
+        logging.info(f"Config: {config}")
+
+        url = config["ip"][0]["gateways"][0]["url"]
+        logging.info(f"url: {url}")
+
+    async with session.get(url + "/api/clientgate/routes") as res:
+        json_data = await res.json()
+        routes = [r for r in json_data['data']['routes'] if r.get('id') and r.get('domain')]
+
+        logging.info(f"Available routes: {[(r['id'], r['domain']) for r in routes]}")
+
+    return version, url, routes
+
+
+async def open_channel(route):
+    endpoint = "{}://{}/gateway".format(GATEWAY_SCHEME, route['domain'])
     logging.info(f"Chosen route: {route['id']} endpoint: {endpoint}")
-    channel = MSRPCChannel(endpoint)
+    channel = MSRPCChannel(
+        endpoint, timeout=RPC_TIMEOUT, reconnect=RPC_RECONNECT, max_reconnect_attempts=RPC_MAX_RECONNECT_ATTEMPTS,
+        max_in_flight=RPC_MAX_IN_FLIGHT,
+    )
 
     lobby = Lobby(channel)
 
     await channel.connect(MS_HOST)
 
     # 세션 확립: requestConnection(route_id 문자열) 이 선행되어야 oauth2Auth 가 통과한다.
-    await channel.send_request(".lq.Route.requestConnection", build_request_connection(route['id']))
+    async def request_connection():
+        await channel.send_request(".lq.Route.requestConnection", build_request_connection(route['id']))
+
+    try:
+        await request_connection()
+    except BaseException:
+        await channel.close()
+        raise
     logging.info("Connection was established")
 
-    return lobby, channel, client_version_string, product_version
+    # 연결이 끊겼다 다시 붙으면 세션 확립부터 다시 한다 (oauth2Login 재개는 로그인 후 따로 등록).
+    channel.add_resume_hook(request_connection)
 
+    return lobby, channel
 
-async def login(lobby, client_version_string, product_version):
-    logging.info("Login with username and password")
+
+async def login(lobby, client_version_string, product_version, account_uid=uid, account_token=token):
+    logging.info(f"Login with uid {account_uid}")
 
     heartBeat = pb.ReqHeatBeat()
     heartBeat.no_operation_counter = 1
@@ -149,8 +444,8 @@ async def login(lobby, client_version_string, product_version):
     # oauth2Auth: passport 중간 로그인을 거치지 않고 사용자 TOKEN 을 code 로 직접 사용한다.
     reqOauth2Auth = pb.ReqOauth2Auth()
     reqOauth2Auth.type = OAUTH_TYPE
-    reqOauth2Auth.code = token
-    reqOauth2Auth.uid = uid
+    reqOauth2Auth.code = account_token
+    reqOauth2Auth.uid = account_uid
     reqOauth2Auth.client_version_string = client_version_string
 
     res = await lobby.oauth2_auth(reqOauth2Auth)
@@ -160,14 +455,9 @@ async def login(lobby, client_version_string, product_version):
         err_code = res.error.code if res.HasField("error") else None
         logging.error(f"Login Error (oauth2Auth): {res}")
         if err_code == 151:
-            logging.error(
-                "code 151: client_version_string 이 작혼 클라이언트의 최신 resource 버전과 "
-                f"맞지 않을 때 발생합니다 (현재 사용값: {client_version_string}).\n"
-                "  1) 브라우저에서 작혼(EN) 로그인 후 개발자도구 콘솔에 다음을 실행:\n"
-                "       GameMgr.Inst.client_version_string   (예: 'WebGL_2022-0.16.212')\n"
-                "  2) 출력의 'WebGL_2022-' 뒤 숫자(resource 버전)를 MS_RESOURCE_VERSION 환경변수/Secret 에 설정\n"
-                "     (예: MS_RESOURCE_VERSION=0.16.212)"
-            )
+            # 저장해 둔 버전 정보가 낡았을 수 있으므로 탐색 캐시를 버린다.
+            invalidate_discovery_cache()
+            raise ClientVersionMismatch(client_version_string)
         return False
 
     reqOauth2Check = pb.ReqOauth2Check()
@@ -179,10 +469,18 @@ async def login(lobby, client_version_string, product_version):
         logging.error(resOauth2Check)
         return False
 
+    reqOauth2Login = build_oauth2_login_request(access_token, client_version_string, product_version)
+    resOauth2Login = await lobby.oauth2_login(reqOauth2Login)
+
+    # 세션 재개(oauth2Login reconnect=True)에 다시 쓸 수 있도록 access token 을 돌려준다.
+    return access_token
+
+
+def build_oauth2_login_request(access_token, client_version_string, product_version, reconnect=False):
     reqOauth2Login = pb.ReqOauth2Login()
     reqOauth2Login.type = OAUTH_TYPE
     reqOauth2Login.access_token = access_token
-    reqOauth2Login.reconnect = False
+    reqOauth2Login.reconnect = reconnect
     reqOauth2Login.device.CopyFrom(pb.ClientDeviceInfo(**DEVICE))
     reqOauth2Login.random_key = str(uuid.uuid1())
     reqOauth2Login.client_version.CopyFrom(
@@ -193,97 +491,327 @@ async def login(lobby, client_version_string, product_version):
     for currency_platform in CURRENCY_PLATFORMS:
         reqOauth2Login.currency_platforms.append(currency_platform)
     reqOauth2Login.tag = SERVER_TAG
-
-    resOauth2Login = await lobby.oauth2_login(reqOauth2Login)
-
-    # 일일 월정액권(월간패스) 보상 수령
-    await getMonthlyTicket(lobby)
-
-    req = pb.ReqFetchCustomizedContestGameRecords(unique_id=TOURNAMENT_ID)
-    res = await lobby.fetch_customized_contest_game_records(req)
-    res_dict = MessageToDict(res)
-
-    records = res_dict.get("recordList", [])
-
-    data_sheet = connect_to_data_sheet()
-    existing_uuids = get_existing_uuids(data_sheet)
-    statistics_sheet = connect_to_statistics_sheet()
-    hules_sheet = connect_to_hules_sheet()
+    return reqOauth2Login
+
+
+async def sync_tournaments(lobby, client_version_string, tournaments):
+    # 여러 대회를 하나의 로그인 세션 위에서 동시에 동기화한다.
+    # 구글 인증은 처음 시트가 필요할 때 한 번만 하고, 패보 동시 요청 수는 대회 전체에 걸쳐 FETCH_CONCURRENCY 로 묶는다.
+    sync_state = SyncState(SYNC_STATE_PATH)
+    record_cache = RecordCache(RECORD_CACHE_DIR) if RECORD_CACHE_DIR else None
+    semaphore = asyncio.Semaphore(FETCH_CONCURRENCY)
+    sheets_client = None
+    sheet_sinks = {}
+    sheets_lock = asyncio.Lock()
+
+    async def open_sheet_sink(spreadsheet_name):
+        nonlocal sheets_client
+        # gspread/oauth2client 는 import 만으로 수백 ms 가 걸려, 시트에 쓸 일이 생겼을 때만 불러온다.
+        from sheets import SheetSink, authorize
+
+        # 인증도 blocking 호출이라 스레드에서 돌린다. 동시에 시트를 여는 대회끼리는 한 번만 인증하고,
+        # 같은 스프레드시트에 쓰는 대회끼리는 sink 하나를 같이 써서 쓰기가 차례로 나가게 한다.
+        async with sheets_lock:
+            if sheets_client is None:
+                sheets_client = await asyncio.to_thread(authorize)
+            if spreadsheet_name not in sheet_sinks:
+                sheet_sinks[spreadsheet_name] = await SheetSink.open(sheets_client, spreadsheet_name)
+            return sheet_sinks[spreadsheet_name]
+
+    # 대회끼리는 서로 격리한다: 한 대회가 실패해도 나머지는 끝까지 돌고 (동기화 기록까지 남기고),
+    # sync_state 는 모든 대회가 끝난 뒤에 닫는다. 실패는 대회별로 남기고 첫 실패를 다시 올린다.
+    try:
+        results = await asyncio.gather(*(
+            sync_tournament(
+                lobby, client_version_string, tournament_id, spreadsheet_name,
+                open_sheet_sink, sync_state, record_cache, semaphore,
+            )
+            for tournament_id, spreadsheet_name in tournaments.items()
+        ), return_exceptions=True)
+    finally:
+        sync_state.close()
+        if record_cache is not None:
+            await asyncio.to_thread(record_cache.flush)
+
+    failures = [(tournament_id, result) for tournament_id, result in zip(tournaments, results)
+                if isinstance(result, BaseException)]
+    for tournament_id, error in failures:
+        logging.error(f"[{tournament_id}] 대회 동기화 실패", exc_info=error)
+    if failures:
+        raise failures[0][1]
+
+
+async def sync_tournament(lobby, client_version_string, tournament_id, spreadsheet_name,
+                          open_sheet_sink, sync_state, record_cache, semaphore):
+    high_water = sync_state.get_high_water(tournament_id)
+
+    # reconcile 은 기록을 받기 전에 한다. 인덱스에만 있던 (시트에서 지워졌거나 쓰다 실패한) 게임은 high-water mark 보다
+    # 이전일 수 있으므로, 그런 게임이 있거나 강제로 맞췄으면 처음부터 다시 받아 빠진 게임을 다시 올린다.
+    sheet_sink = None
+    if FORCE_RECONCILE_UUIDS or sync_state.reconcile_due(tournament_id, UUID_RECONCILE_INTERVAL):
+        sheet_sink = await open_sheet_sink(spreadsheet_name)
+        existing_uuids = await asyncio.to_thread(get_existing_uuids, await sheet_sink.worksheet(DATA_SHEET))
+        only_local, only_sheet = sync_state.reconcile(tournament_id, existing_uuids)
+        logging.info(f"[{tournament_id}] uuid 인덱스를 시트와 맞췄습니다 (인덱스에만 있던 것: {only_local}, 시트에만 있던 것: {only_sheet})")
+        if (only_local or FORCE_RECONCILE_UUIDS) and high_water:
+            logging.info(f"[{tournament_id}] high-water mark 를 지우고 대회 기록을 처음부터 다시 확인합니다")
+            high_water = 0
+            sync_state.set_high_water(tournament_id, high_water)
+
+    records = await fetch_contest_records_since(lobby, tournament_id, max(high_water - HIGH_WATER_OVERLAP, 0))
 
     new_rows = []
     for record in records:
-        if record["uuid"] not in existing_uuids:
-            new_rows.append((record["startTime"], record))
+        if not sync_state.is_synced(tournament_id, record.uuid):
+            new_rows.append((record.start_time, MessageToDict(record)))
 
     new_rows.sort(key=lambda x: int(x[0]))
 
-    rows_to_append = []
+    game_statistics = await fetch_game_statistics_bulk(
+        lobby, [r[1] for r in new_rows], client_version_string, cache=record_cache, semaphore=semaphore
+    )
+
+    # 시트에 올릴 게임마다 (데이터 행, 국 통계 행들, 화료역 행들)
+    games = []
+    skipped_end_times = []
+    for r, game_statistic in zip(new_rows, game_statistics):
+        if game_statistic is None:
+            # 응답을 못 받은 게임은 시트에 올리지 않는다. 다음 실행 때 새 기록으로 다시 잡힌다.
+            # 계속 받지 못하는 게임이 high-water mark 를 영영 붙잡지 않도록, 여러 번 실패하면 데이터 행만 올린다.
+            attempts = sync_state.record_fetch_failure(tournament_id, r[1]["uuid"])
+            if attempts < MAX_RECORD_FETCH_ATTEMPTS:
+                skipped_end_times.append(int(r[1]["endTime"]))
+                continue
+            logging.warning(f"[{tournament_id}] {r[1]['uuid']} 패보를 {attempts}번 받지 못해 통계 없이 데이터 행만 올립니다")
+            parsed_row, _ = parse_game_record(r[1])
+            games.append((parsed_row, [], []))
+            continue
+        games.append(game_sheet_rows(r[1], *game_statistic))
+
+    if games and sheet_sink is None:
+        sheet_sink = await open_sheet_sink(spreadsheet_name)
+    # 세 시트의 행은 게임 묶음마다 한 번의 batchUpdate 로 같이 쓴다 (전부 쓰이거나 전부 안 쓰인다).
+    # 쓰인 묶음은 바로 인덱스에 남겨, 뒤 묶음이 실패해도 다음 실행이 같은 행을 또 붙이지 않는다.
+    for start in range(0, len(games), SHEET_BATCH_GAMES):
+        batch = games[start:start + SHEET_BATCH_GAMES]
+        await sheet_sink.append_rows({
+            DATA_SHEET: [game[0] for game in batch],
+            STATISTICS_SHEET: [row for game in batch for row in game[1]],
+            HULES_SHEET: [row for game in batch for row in game[2]],
+        })
+        sync_state.mark_synced(tournament_id, [game[0][-1] for game in batch])
+
+    # 건너뛴 게임이 있으면 그 게임 직전까지만 high-water mark 를 올려 다음 실행에서 다시 받게 한다.
+    new_high_water = max((record.end_time for record in records), default=high_water)
+    if skipped_end_times:
+        new_high_water = min(new_high_water, min(skipped_end_times) - 1)
+    if new_high_water > high_water:
+        sync_state.set_high_water(tournament_id, new_high_water)
+
+    print(f"[{tournament_id}] 총 {len(games)}개의 새로운 게임 기록이 추가되었습니다.")
+
+
+
+def game_sheet_rows(record, statistics, hules):
+    # 게임 하나의 (데이터 행, 국 통계 행들, 화료역 행들)
+    parsed_row, seat_map = parse_game_record(record)
     statistics_rows = []
     hule_rows = []
-    for r in new_rows:
-        parsed_row, seat_map = parse_game_record(r[1])
-        rows_to_append.append(parsed_row)
-        statistics, hules = await get_game_statistics(lobby, r[1]["uuid"], client_version_string)
-        
-        for seat in range(4):
-            seat_stats = statistics["players"].get(seat, {})
-            row = [
-                r[1]["uuid"],
-                seat_map[seat],
-                statistics["total_kyoku"],
-                seat_stats.get("riichi", 0),
-                seat_stats.get("hora", 0),
-                seat_stats.get("tsumo", 0),
-                seat_stats.get("ron", 0),
-                seat_stats.get("houju", 0),
-                seat_stats.get("furo", 0),
-                seat_stats.get("dama", 0),
-                seat_stats.get("chase_riichi", 0),
-            ]
-            statistics_rows.append(row)
-        for hule in hules:
-            row = [r[1]["uuid"], seat_map[hule[0]], hule[1], hule[2]]
-            hule_rows.append(row)
-
-
-    if rows_to_append:
-        data_sheet.append_rows(rows_to_append, value_input_option="USER_ENTERED")
-        statistics_sheet.append_rows(statistics_rows, value_input_option="USER_ENTERED")
-        hules_sheet.append_rows(hule_rows, value_input_option="USER_ENTERED")
-
-    print(f"총 {len(new_rows)}개의 새로운 게임 기록이 추가되었습니다.")
-
-    return True
+
+    for seat in range(4):
+        seat_stats = statistics["players"].get(seat, {})
+        row = [
+            record["uuid"],
+            seat_map[seat],
+            statistics["total_kyoku"],
+            seat_stats.get("riichi", 0),
+            seat_stats.get("hora", 0),
+            seat_stats.get("tsumo", 0),
+            seat_stats.get("ron", 0),
+            seat_stats.get("houju", 0),
+            seat_stats.get("furo", 0),
+            seat_stats.get("dama", 0),
+            seat_stats.get("chase_riichi", 0),
+        ]
+        statistics_rows.append(row)
+    for hule in hules:
+        row = [record["uuid"], seat_map[hule[0]], hule[1], hule[2]]
+        hule_rows.append(row)
+    return parsed_row, statistics_rows, hule_rows
+
+
+async def recompute_statistics(lobby, client_version_string, tournaments):
+    # 데이터 시트에 올라 있는 게임의 국 통계/화료역을 패보 캐시로 다시 계산해 두 시트를 통째로 다시 쓴다
+    # (analyze_game_log 를 고쳤거나 통계 시트를 지웠을 때). 대회 기록 목록(좌석별 계정)만 새로 받고,
+    # 패보는 캐시에 없을 때만 받는다. 한 스프레드시트를 여러 대회가 같이 쓰면 그 대회들을 모아 한 번에 다시 쓴다.
+    from sheets import SheetSink, authorize
+
+    record_cache = RecordCache(RECORD_CACHE_DIR) if RECORD_CACHE_DIR else None
+    semaphore = asyncio.Semaphore(FETCH_CONCURRENCY)
+    sheets_client = await asyncio.to_thread(authorize)
+
+    tournaments_by_spreadsheet = {}
+    for tournament_id, spreadsheet_name in tournaments.items():
+        tournaments_by_spreadsheet.setdefault(spreadsheet_name, []).append(tournament_id)
+
+    try:
+        for spreadsheet_name, tournament_ids in tournaments_by_spreadsheet.items():
+            sheet_sink = await SheetSink.open(sheets_client, spreadsheet_name)
+            sheet_uuids = await asyncio.to_thread(get_existing_uuids, await sheet_sink.worksheet(DATA_SHEET))
+            sheet_uuids.discard("")
+
+            records = {}
+            for tournament_id in tournament_ids:
+                for record in await fetch_contest_records_since(lobby, tournament_id, 0):
+                    if record.uuid in sheet_uuids:
+                        records[record.uuid] = record
+            if len(records) < len(sheet_uuids):
+                logging.warning(f"[{spreadsheet_name}] 대회 기록에서 찾지 못한 게임 {len(sheet_uuids) - len(records)}개는 통계에서 빠집니다")
+
+            record_dicts = [MessageToDict(record) for record in sorted(records.values(), key=lambda r: r.start_time)]
+            cached = sum(record["uuid"] in record_cache for record in record_dicts) if record_cache is not None else 0
+            logging.info(f"[{spreadsheet_name}] 게임 {len(record_dicts)}개의 통계를 다시 계산합니다 (캐시: {cached}개)")
+            game_statistics = await fetch_game_statistics_bulk(
+                lobby, record_dicts, client_version_string, cache=record_cache, semaphore=semaphore
+            )
+            failed = sum(game_statistic is None for game_statistic in game_statistics)
+            if failed:
+                # 일부만 다시 쓰면 받지 못한 게임의 통계가 시트에서 사라진다.
+                raise RuntimeError(f"[{spreadsheet_name}] 패보 {failed}개를 받지 못해 통계 시트를 다시 쓰지 않습니다")
+
+            statistics_rows = []
+            hule_rows = []
+            for record, game_statistic in zip(record_dicts, game_statistics):
+                _, game_statistics_rows, game_hule_rows = game_sheet_rows(record, *game_statistic)
+                statistics_rows.extend(game_statistics_rows)
+                hule_rows.extend(game_hule_rows)
+            await sheet_sink.replace_rows({STATISTICS_SHEET: statistics_rows, HULES_SHEET: hule_rows})
+            print(f"[{spreadsheet_name}] 게임 {len(record_dicts)}개의 국 통계/화료역을 다시 썼습니다.")
+    finally:
+        if record_cache is not None:
+            await asyncio.to_thread(record_cache.flush)
+
+
+async def recompute():
+    session = await connect_and_login()
+    if session is None:
+        return False
+    lobby, channel, client_version_string = session
+    try:
+        await recompute_statistics(lobby, client_version_string, load_tournaments())
+        return True
+    finally:
+        await channel.close()
 
 
 async def getMonthlyTicket(lobby):
     # payMonthTicket: 오늘자 월정액권(월간패스) 보상을 수령한다. 이미 받았으면 에러 코드가 돌아오지만 무시한다.
-    resPay = await lobby.pay_month_ticket(pb.ReqCommon())
+    # 재접속 후 다시 보내면 두 번 수령될 수 있어 replay 하지 않는다 (끊기면 MSRPCConnectionError).
+    resPay = await lobby.pay_month_ticket(pb.ReqCommon(), replay=False)
     logging.info(f"payMonthTicket: {MessageToDict(resPay)}")
 
     resInfo = await lobby.fetch_month_ticket_info(pb.ReqCommon())
     logging.info(f"fetchMonthTicketInfo: {MessageToDict(resInfo)}")
 
-def connect_to_data_sheet():
-    scope = ["https://spreadsheets.google.com/feeds", "https://www.googleapis.com/auth/drive"]
-    creds = ServiceAccountCredentials.from_json_keyfile_name("credentials.json", scope)
-    client = gspread.authorize(creds)
-    sheet = client.open("카일색 대회전 기록지").worksheet("데이터")
-    return sheet
-
-def connect_to_statistics_sheet():
-    scope = ["https://spreadsheets.google.com/feeds", "https://www.googleapis.com/auth/drive"]
-    creds = ServiceAccountCredentials.from_json_keyfile_name("credentials.json", scope)
-    client = gspread.authorize(creds)
-    sheet = client.open("카일색 대회전 기록지").worksheet("국 통계")
-    return sheet
-
-def connect_to_hules_sheet():
-    scope = ["https://spreadsheets.google.com/feeds", "https://www.googleapis.com/auth/drive"]
-    creds = ServiceAccountCredentials.from_json_keyfile_name("credentials.json", scope)
-    client = gspread.authorize(creds)
-    sheet = client.open("카일색 대회전 기록지").worksheet("화료역")
-    return sheet
+    return resPay, resInfo
+
+
+async def claim_month_tickets(accounts, parallelism=ACCOUNT_PARALLELISM):
+    # 계정 여러 개의 월정액권을 동시에 수령한다. 게이트웨이 탐색은 모든 계정이 같이 쓰고,
+    # 계정마다 자기 채널로 connect → login → payMonthTicket → fetchMonthTicketInfo 를 돈다.
+    # connect_and_login 과 같이, 캐시된 탐색 결과로 연결이 모두 실패하거나 151 이 나면 새로 탐색해서 다시 시도한다.
+    route_stats = RouteStats(ROUTE_STATS_PATH)
+    semaphore = asyncio.Semaphore(parallelism)
+    gateway_lock = asyncio.Lock()
+    gateway = None
+
+    async def get_gateway(stale=None):
+        # (ranked_routes, client_version_string, product_version, from_cache)
+        # stale: 실패한 탐색 결과. 다른 계정이 아직 새로 받지 않았을 때만 캐시를 버리고 다시 탐색한다.
+        nonlocal gateway
+        async with gateway_lock:
+            if gateway is None or gateway is stale:
+                use_cache = gateway is None
+                if not use_cache:
+                    invalidate_discovery_cache()
+                routes, client_version_string, product_version, from_cache = await discover(use_cache)
+                ranked_routes = await rank_routes(
+                    routes, route_stats, ROUTE_PROBE_TIMEOUT, use_ssl=GATEWAY_SCHEME == "wss"
+                )
+                gateway = (ranked_routes, client_version_string, product_version, from_cache)
+            return gateway
+
+    async def claim(account):
+        result = {"uid": account["uid"], "ok": False}
+        async with semaphore:
+            try:
+                current = await get_gateway()
+                while True:
+                    ranked_routes, client_version_string, product_version, from_cache = current
+                    try:
+                        lobby, channel = await open_channel_with_failover(ranked_routes, route_stats)
+                    except ConnectionError:
+                        if not from_cache:
+                            raise
+                        logging.warning(f"[{account['uid']}] 캐시된 route 에 모두 연결하지 못해 게이트웨이 정보를 새로 받습니다")
+                        current = await get_gateway(stale=current)
+                        continue
+                    try:
+                        access_token = await login(lobby, client_version_string, product_version,
+                                                   account["uid"], account["token"])
+                        if not access_token:
+                            result["error"] = "login failed"
+                            return result
+                        start_session(lobby, channel, access_token, client_version_string, product_version)
+                        resPay, resInfo = await getMonthlyTicket(lobby)
+                        break
+                    except ClientVersionMismatch:
+                        if not from_cache:
+                            log_client_version_mismatch(client_version_string)
+                            raise
+                        logging.warning(f"[{account['uid']}] 캐시된 버전 정보로 151 이 발생해 게이트웨이 정보를 새로 받습니다")
+                        current = await get_gateway(stale=current)
+                    finally:
+                        await channel.close()
+            except Exception as e:
+                logging.exception(f"[{account['uid']}] 월정액권 수령 실패")
+                result["error"] = repr(e)
+                return result
+
+        if resInfo.error.code:
+            result["error"] = f"fetchMonthTicketInfo code {resInfo.error.code}"
+            return result
+        result["ok"] = True
+        result["pay_error_code"] = resPay.error.code
+        result["resource_count"] = resPay.resource_count
+        result["ticket_end_time"] = resInfo.month_ticket_info.end_time
+        return result
+
+    results = await asyncio.gather(*(claim(account) for account in accounts))
+
+    for result in results:
+        if result["ok"]:
+            end_time = format_time(result["ticket_end_time"]) if result["ticket_end_time"] else "-"
+            logging.info(
+                f"[{result['uid']}] OK payMonthTicket code={result['pay_error_code']} "
+                f"count={result['resource_count']} 월정액권 만료={end_time}"
+            )
+        else:
+            logging.error(f"[{result['uid']}] FAILED {result['error']}")
+    logging.info(f"월정액권 수령: {sum(r['ok'] for r in results)}/{len(results)} 계정 성공")
+
+    return results
+
+
+def load_accounts(path=ACCOUNTS_FILE):
+    # [{"uid": "...", "token": "..."}, ...]
+    with open(path, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+def load_tournaments():
+    if TOURNAMENTS:
+        return {int(tournament_id): name for tournament_id, name in json.loads(TOURNAMENTS).items()}
+    return {TOURNAMENT_ID: SPREADSHEET_NAME} if TOURNAMENT_ID else {}
 
 def format_time(ts):
     KST = pytz.timezone('Asia/Seoul')
@@ -347,47 +875,135 @@ async def fetchGameRecordList(lobby):
     with open("result.txt", "w", encoding="utf-8") as f:
         f.write(json_string)
 
-async def get_game_statistics(lobby, uuid, client_version_string):
+async def fetch_contest_records_since(lobby, tournament_id, since):
+    # 대회 기록을 페이지 단위(last_index/next_index)로 받되, endTime 이 since 이하인 기록이 나오면 거기서 멈춘다.
+    # 조용한 날에는 첫 페이지 한 번으로 끝나고, 새 기록(pb.RecordGame)만 돌려준다.
+    records = []
+    last_index = 0
+    while True:
+        req = pb.ReqFetchCustomizedContestGameRecords(unique_id=tournament_id, last_index=last_index)
+        res = await lobby.fetch_customized_contest_game_records(req)
+        page = [record for record in res.record_list if record.end_time > since]
+        records.extend(page)
+
+        if len(page) < len(res.record_list) or not res.next_index or res.next_index == last_index:
+            return records
+        last_index = res.next_index
+
+async def fetch_game_statistics_bulk(lobby, records, client_version_string, concurrency=FETCH_CONCURRENCY, cache=None,
+                                     semaphore=None):
+    # 패보를 최대 concurrency 개씩 동시에 받아온다. gather 는 입력 순서를 유지하므로
+    # records(startTime 순 정렬)와 같은 순서로 결과가 돌아와 시트 행 순서가 그대로 유지된다.
+    # 여러 대회가 동시 요청 수 한도를 나눠 써야 하면 semaphore 를 넘긴다.
+    if semaphore is None:
+        semaphore = asyncio.Semaphore(concurrency)
+
+    async def fetch(record):
+        async with semaphore:
+            try:
+                return await get_game_statistics(lobby, record["uuid"], client_version_string, cache=cache)
+            except MSRPCTimeoutError as e:
+                logging.warning(f"fetchGameRecord timeout, skipping {record['uuid']}: {e}")
+                return None
+            except GameRecordUnavailable as e:
+                logging.warning(f"fetchGameRecord failed, skipping {record['uuid']}: {e}")
+                return None
+
+    return await asyncio.gather(*(fetch(record) for record in records))
+
+async def fetch_game_record_data(lobby, uuid, client_version_string, cache=None):
+    # 패보 원본(Wrapper 직렬화 bytes). 캐시에 있으면 네트워크를 타지 않는다.
+    if cache is not None:
+        data = cache.get(uuid)
+        if data is not None:
+            return data
+
     req = pb.ReqGameRecord()
     req.game_uuid = uuid
     req.client_version_string = client_version_string
     res = await lobby.fetch_game_record(req)
+    if res.error.code:
+        raise GameRecordUnavailable(f"code {res.error.code}")
+    data = res.data
+    if not data:
+        # 오래된 패보는 data 대신 data_url 로 내려온다. 받아온 내용은 data 와 같은 Wrapper 직렬화 bytes 다.
+        if not res.data_url:
+            raise GameRecordUnavailable("empty data")
+        data = await download_game_record(res.data_url)
+
+    if cache is not None:
+        # blob 쓰기(fsync)는 blocking 이라 이벤트 루프 밖에서 한다. index.json 은 sync_tournaments 끝에서 한 번 쓴다.
+        await asyncio.to_thread(cache.put, uuid, data)
+    return data
 
-    record_wrapper = pb.Wrapper()
-    record_wrapper.ParseFromString(res.data)
-
-    game_details = pb.GameDetailRecords()
-    game_details.ParseFromString(record_wrapper.data)
-
-    result = analyze_game_log(MessageToDict(game_details))
+async def download_game_record(data_url):
+    import aiohttp
 
-    ## 화료역 추가하는 코드
-    records = [action.result for action in game_details.actions if action.type == 1]
+    try:
+        async with aiohttp.ClientSession(timeout=aiohttp.ClientTimeout(total=RPC_TIMEOUT)) as session:
+            async with session.get(data_url) as res:
+                res.raise_for_status()
+                data = await res.read()
+    except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+        raise GameRecordUnavailable(f"data_url download failed: {e!r}") from e
+    if not data:
+        raise GameRecordUnavailable("empty data_url")
+    return data
 
-    game_records_count = len(records)
-    logging.info("Found {} game records".format(game_records_count))
+async def get_game_statistics(lobby, uuid, client_version_string, cache=None):
+    data = await fetch_game_record_data(lobby, uuid, client_version_string, cache=cache)
+    return decode_game_statistics(data)
 
-    hules = []
-    round_record_wrapper = pb.Wrapper()
+def decode_game_statistics(data):
+    # 패보 Wrapper 의 data 는 복사하지 않고 memoryview 로 바로 GameDetailRecords 에 넘긴다 (패보 한 판이 수백 KB).
+    game_details = pb.GameDetailRecords()
+    game_details.ParseFromString(wrapper_data(data))
+    return analyze_game_log(game_details)
+
+# 국이 끝났음을 나타내는 type 1 액션의 Wrapper.name (화료, 유국)
+ROUND_END_RECORDS = {".lq.RecordHule", ".lq.RecordNoTile"}
+
+def iter_game_events(game_details: pb.GameDetailRecords):
+    # 액션을 한 번씩만 훑으면서 통계/화료역에 필요한 이벤트를 순서대로 내보낸다.
+    #   ("hule", seat, [(fan_id, val), ...])  화료 (국 종료 이벤트보다 먼저 나온다)
+    #   ("kyoku_end",)                         국 종료 (화료, 유국)
+    #   ("ron", attacker, defender) / ("tsumo", seat) / ("riichi", seat) / ("furo", seat)
+    # 결과 메시지는 액션마다 새로 만든다. upb 메시지를 Clear()/ParseFromString 으로 다시 쓰면
+    # 이전 내용이 arena 에 남아 패보 하나를 도는 동안 메모리가 계속 늘어난다 (ms.base.wrapper_data 참고).
+    prev_action = None
 
-    for i in range(0, game_records_count):
-        round_record_wrapper.ParseFromString(records[i])
+    for action in game_details.actions:
+        if action.type == 1:
+            result_wrapper = pb.Wrapper()
+            result_wrapper.ParseFromString(action.result)
+            if result_wrapper.name == ".lq.RecordHule":
+                record_hule = pb.RecordHule()
+                record_hule.ParseFromString(result_wrapper.data)
+                hule = record_hule.hules[0]
+                yield "hule", hule.seat, [(fan.id, fan.val) for fan in hule.fans if fan.val]
+            if result_wrapper.name in ROUND_END_RECORDS:
+                prev_action = None
+                yield ("kyoku_end",)
+            continue
 
-        if round_record_wrapper.name == ".lq.RecordHule":
-            record_hule = pb.RecordHule()
-            record_hule.ParseFromString(round_record_wrapper.data)
-            hule = MessageToDict(record_hule)["hules"][0]
-            for fan in hule["fans"]:
-                if "val" in fan:
-                    fan_id = fan["id"]
-                    fan_name = HAN.get(fan_id, f"알 수 없는 역({fan_id})")
-                    hules.append([hule.get("seat", 0), fan_name, fan.get("val", 0)])
+        if action.type == 2:
+            user_input = action.user_input
+            seat = user_input.seat
 
-    return result, hules
+            if user_input.type == 3 and user_input.cpg.type == 9:
+                defender = prev_action.user_input.seat if prev_action is not None else 0
+                yield "ron", seat, defender
+            if user_input.operation.type == 8:
+                yield "tsumo", seat
+            if user_input.operation.type == 7:
+                yield "riichi", seat
+            if user_input.type == 3 and user_input.cpg.type in (2, 3, 5):
+                yield "furo", seat
 
-def analyze_game_log(log_json: dict) -> dict:
-    actions = log_json.get("actions", [])
+        prev_action = action
 
+def analyze_game_log(game_details: pb.GameDetailRecords):
+    # iter_game_events 한 번으로 국 통계와 화료역 목록을 같이 만든다.
     current_kyoku = 0
     stats = {
         seat: {
@@ -400,30 +1016,21 @@ def analyze_game_log(log_json: dict) -> dict:
             "chase_riichi": set()
         } for seat in range(4)
     }
+    hules = []
 
     riichi_declared_in_kyoku = set()  # 현재 국에서 누가 리치했는지 저장
-    prev_action = None
 
-    for action in actions:
+    for event in iter_game_events(game_details):
+        kind = event[0]
+
         # 1. 국 종료 (다음 국으로 이동)
-        if (
-            action.get("type") == 1 and
-            isinstance(action.get("result"), str) and
-            (action["result"].startswith("Cg4ub") or action["result"].startswith("ChAub"))
-        ):
+        if kind == "kyoku_end":
             current_kyoku += 1
             riichi_declared_in_kyoku.clear()
-            prev_action = None
-            continue
 
         # 2. 론
-        if (
-            action.get("type") == 2 and
-            action.get("userInput", {}).get("type") == 3 and
-            action["userInput"].get("cpg", {}).get("type") == 9
-        ):
-            attacker = action["userInput"].get("seat", 0)
-            defender = prev_action["userInput"].get("seat", 0) if prev_action else 0
+        elif kind == "ron":
+            _, attacker, defender = event
             stats[attacker]["ron"].add(current_kyoku)
             stats[defender]["houju"].add(current_kyoku)
 
@@ -432,11 +1039,8 @@ def analyze_game_log(log_json: dict) -> dict:
                 stats[attacker]["dama"].add(current_kyoku)
 
         # 3. 쯔모
-        if (
-            action.get("type") == 2 and
-            action.get("userInput", {}).get("operation", {}).get("type") == 8
-        ):
-            seat = action["userInput"].get("seat", 0)
+        elif kind == "tsumo":
+            seat = event[1]
             stats[seat]["tsumo"].add(current_kyoku)
 
             # 다마텐 체크
@@ -444,11 +1048,8 @@ def analyze_game_log(log_json: dict) -> dict:
                 stats[seat]["dama"].add(current_kyoku)
 
         # 4. 리치
-        if (
-            action.get("type") == 2 and
-            action.get("userInput", {}).get("operation", {}).get("type") == 7
-        ):
-            seat = action["userInput"].get("seat", 0)
+        elif kind == "riichi":
+            seat = event[1]
 
             # 추격 리치 조건: 이미 다른 사람이 리치한 경우
             if any(other_seat != seat for other_seat in riichi_declared_in_kyoku):
@@ -458,19 +1059,18 @@ def analyze_game_log(log_json: dict) -> dict:
             riichi_declared_in_kyoku.add(seat)
 
         # 5. 후로
-        if (
-            action.get("type") == 2 and
-            action.get("userInput", {}).get("type") == 3 and
-            action["userInput"].get("cpg", {}).get("type") in [2, 3, 5]
-        ):
-            seat = action["userInput"].get("seat", 0)
-            stats[seat]["furo"].add(current_kyoku)
+        elif kind == "furo":
+            stats[event[1]]["furo"].add(current_kyoku)
 
-        if action["type"] != 1:
-            prev_action = action
+        # 6. 화료역
+        elif kind == "hule":
+            _, seat, fans = event
+            for fan_id, val in fans:
+                fan_name = HAN.get(fan_id, f"알 수 없는 역({fan_id})")
+                hules.append([seat, fan_name, val])
 
     # 요약 결과
-    return {
+    result = {
         "total_kyoku": current_kyoku,
         "players": {
             seat: {
@@ -486,6 +1086,7 @@ def analyze_game_log(log_json: dict) -> dict:
             for seat in range(4)
         }
     }
+    return result, hules
 
 async def load_and_process_game_log2(lobby, uuid, version_to_force):
     logging.info("Loading game log")
@@ -529,7 +1130,25 @@ def print_data_as_json(data, type):
     logging.info("{} json {}".format(type, json))
 
 if __name__ == "__main__":
-    result = asyncio.run(main())
+    parser = argparse.ArgumentParser()
+    parser.add_argument(
+        "mode", nargs="?", default="sync", choices=["sync", "tickets", "daemon", "recompute"],
+        help="sync: 월정액권 수령 + 대회 기록 동기화 (기본), tickets: ACCOUNTS_FILE 의 모든 계정 월정액권 수령, "
+             "daemon: 세션을 유지하며 위 작업을 주기적으로 실행, "
+             "recompute: 패보 캐시로 국 통계/화료역 시트를 다시 계산해 다시 쓰기",
+    )
+    args = parser.parse_args()
+
+    if args.mode == "daemon":
+        asyncio.run(run_daemon())
+        result = True
+    elif args.mode == "recompute":
+        result = asyncio.run(recompute())
+    elif args.mode == "tickets":
+        results = asyncio.run(claim_month_tickets(load_accounts()))
+        result = all(r["ok"] for r in results)
+    else:
+        result = asyncio.run(main())
     if not result:
         logging.error("main() failed — exiting with non-zero status so CI reflects the real outcome")
         sys.exit(1)
@@ -1,96 +1,524 @@
 import asyncio
+import collections
+import contextvars
+import functools
+import inspect
+import logging
+import struct
+
 import websockets
 
-from ms.protocol_pb2 import Wrapper
+import ms.protocol_lazy as pb
+
+HEARTBEAT_METHOD = '.lq.Lobby.heatbeat'
+
+# Request indices run 0 .. MAX_REQ_IDX - 1 and wrap around
+MAX_REQ_IDX = 60007
+
+# Frame headers: type byte + little-endian request index
+_FRAME_HEADER = struct.Struct('<BH')
+_FRAME_IDX = struct.Struct('<H')
+
+# Wrapper field tags: name (field 1) and data (field 2), both length-delimited
+_WRAPPER_NAME_TAG = 0x0a
+_WRAPPER_DATA_TAG = 0x12
+
+# Set while resume hooks run, so their requests bypass the "wait until reconnected" gate
+_resuming = contextvars.ContextVar('resuming', default=False)
+
+
+def _encode_varint(value):
+    out = bytearray()
+    while value > 0x7f:
+        out.append(value & 0x7f | 0x80)
+        value >>= 7
+    out.append(value)
+    return bytes(out)
+
+
+@functools.lru_cache(maxsize=None)
+def wrapper_name_field(name):
+    # Wrapper.name (field 1) pre-serialized; generated services ship these in their _names tables
+    encoded = name.encode('utf-8')
+    return bytes((_WRAPPER_NAME_TAG,)) + _encode_varint(len(encoded)) + encoded
+
+
+def _read_varint(buf, pos):
+    result = shift = 0
+    while True:
+        byte = buf[pos]
+        pos += 1
+        result |= (byte & 0x7f) << shift
+        if not byte & 0x80:
+            return result, pos
+        shift += 7
+
+
+def _wrapper_data(frame, pos):
+    # Wrapper.data of the Wrapper serialized at frame[pos:], as a memoryview into the frame.
+    # Returns None if the bytes are not a plain name/data Wrapper; the caller falls back to protobuf.
+    end = len(frame)
+    start = stop = pos
+    try:
+        while pos < end:
+            tag = frame[pos]
+            length, pos = _read_varint(frame, pos + 1)
+            if tag == _WRAPPER_DATA_TAG:
+                start, stop = pos, pos + length
+            elif tag != _WRAPPER_NAME_TAG:
+                return None
+            pos += length
+    except IndexError:
+        return None
+    if pos != end:
+        return None
+    return memoryview(frame)[start:stop]
+
+
+def wrapper_data(buf):
+    # Wrapper.data of a serialized Wrapper as a memoryview into buf, without building a Wrapper message
+    # or copying the payload. Parse the result straight into the message it holds.
+    # (Keeping one Wrapper around and reusing it with Clear() is no cheaper: the upb backend does not
+    # free a message's arena on Clear(), so every parse into a reused message grows it.)
+    data = _wrapper_data(buf, 0)
+    if data is None:
+        wrapper = pb.Wrapper()
+        wrapper.ParseFromString(buf)
+        data = wrapper.data
+    return data
+
+
+class MSRPCTimeoutError(asyncio.TimeoutError):
+
+    def __init__(self, name, idx, timeout):
+        super().__init__('{} (idx {}) timed out after {}s'.format(name, idx, timeout))
+        self.name = name
+        self.idx = idx
+        self.timeout = timeout
+
+
+class MSRPCConnectionError(ConnectionError):
+    pass
+
+
+class NotificationBus:
+    # Fans server-pushed frames (NOTIFY, and REQUEST frames sent by the server) out to subscribers.
+    # The dispatcher only enqueues; a fixed pool of workers decodes each payload once into its pb
+    # class (the last part of Wrapper.name, e.g. '.lq.NotifyAccountUpdate', unless subscribe() names
+    # one) and calls every subscriber with that message. Undecodable names get the raw bytes.
+    # The queue is bounded: when it is full the oldest notification is dropped, so a flood never
+    # blocks the dispatcher and RPC responses keep flowing. Hook exceptions are logged and kept in
+    # `errors` rather than lost in orphaned tasks.
+
+    def __init__(self, workers=4, max_queue=1024, max_errors=100):
+        self._subscribers = {}
+        self._classes = {}
+        self._queue = asyncio.Queue(max_queue)
+        self._worker_count = workers
+        self._workers = []
+        self.errors = collections.deque(maxlen=max_errors)
+        self.metrics = {'published': 0, 'delivered': 0, 'dropped': 0, 'undecodable': 0, 'hook_errors': 0}
+
+    def subscribe(self, name, hook, message_class=None):
+        # hook(message): plain function or coroutine function
+        self._subscribers.setdefault(name, []).append(hook)
+        if message_class is not None:
+            self._classes[name] = message_class
+        elif name not in self._classes:
+            self._classes[name] = getattr(pb, name.rsplit('.', 1)[-1], None)
+
+    def publish(self, name, data):
+        if name not in self._subscribers:
+            return
+        if not self._workers:
+            self._workers = [asyncio.create_task(self._worker()) for _ in range(self._worker_count)]
+        if self._queue.full():
+            self._queue.get_nowait()
+            self._queue.task_done()
+            self.metrics['dropped'] += 1
+        self._queue.put_nowait((name, data))
+        self.metrics['published'] += 1
+
+    async def drain(self):
+        # Waits until every queued notification has been delivered
+        await self._queue.join()
+
+    async def close(self):
+        for worker in self._workers:
+            worker.cancel()
+        await asyncio.gather(*self._workers, return_exceptions=True)
+        self._workers = []
+
+    def _decode(self, name, data):
+        message_class = self._classes.get(name)
+        if message_class is None:
+            return data
+        message = message_class()
+        message.ParseFromString(data)
+        return message
+
+    async def _worker(self):
+        while True:
+            name, data = await self._queue.get()
+            try:
+                await self._deliver(name, data)
+            finally:
+                self._queue.task_done()
+            # Queue.get() does not yield while items are waiting; give the dispatcher a turn
+            await asyncio.sleep(0)
+
+    async def _deliver(self, name, data):
+        try:
+            message = self._decode(name, data)
+        except Exception as e:
+            self.metrics['undecodable'] += 1
+            logging.warning('NotificationBus: cannot decode {}: {!r}'.format(name, e))
+            return
+        for hook in self._subscribers[name]:
+            try:
+                result = hook(message)
+                if inspect.isawaitable(result):
+                    await result
+                self.metrics['delivered'] += 1
+            except Exception as e:
+                self.metrics['hook_errors'] += 1
+                self.errors.append((name, e))
+                logging.exception('NotificationBus: hook for {} failed'.format(name))
 
 
 class MSRPCChannel:
 
-    def __init__(self, endpoint):
+    def __init__(self, endpoint, timeout=None, reconnect=False, max_reconnect_attempts=5,
+                 reconnect_backoff=1.0, max_reconnect_backoff=30.0, max_in_flight=64,
+                 notify_workers=4, max_queued_notifications=1024):
+        if not 0 < max_in_flight < MAX_REQ_IDX:
+            raise ValueError('max_in_flight must be between 1 and {}'.format(MAX_REQ_IDX - 1))
         self._endpoint = endpoint
-        self._req_events = {}
+        self._timeout = timeout
         self._new_req_idx = 1
-        self._res = {}
-        self._hooks = {}
+        self.notifications = NotificationBus(notify_workers, max_queued_notifications)
+
+        # idx -> future of the response payload (Wrapper.data), for every request holding an index.
+        # At most max_in_flight requests hold one at a time; further callers wait in send_request.
+        self._inflight = {}
+        self._window = asyncio.Semaphore(max_in_flight)
+        # indices whose request timed out, so a response arriving afterwards counts as late rather than unmatched
+        self._abandoned = set()
+        self.metrics = {'responses': 0, 'timeouts': 0, 'late_responses': 0, 'unmatched_responses': 0}
+
+        # reconnect: on disconnect, reconnect with exponential backoff, run the resume hooks
+        # (e.g. requestConnection + oauth2Login(reconnect=True)) and replay unanswered requests.
+        # Without it every pending request fails with MSRPCConnectionError.
+        self._reconnect = reconnect
+        self._max_reconnect_attempts = max_reconnect_attempts
+        self._reconnect_backoff = reconnect_backoff
+        self._max_reconnect_backoff = max_reconnect_backoff
+        # reconnect attempts since the last successful resume; a failed resume does not reset it
+        self._reconnect_attempts = 0
+        self._resume_hooks = []
+        # idx -> packet of sent requests that are replayed after a resume
+        self._pending_pkts = {}
+        # indices of sent requests that opted out of replay; they fail on disconnect instead
+        self._unreplayable = set()
+        # time spent reconnecting (the request timeout clock is stopped meanwhile)
+        self._outage_started = None
+        self._outage_total = 0.0
+        self._ready = asyncio.Event()
+        self._resumer = None
+        self._failure = None
+        self._closing = False
+
+        self._heartbeat = None
+        self._no_operation_counter = 0
 
         self._ws = None
+        self._origin = None
         self._msg_dispatcher = None
 
-    def add_hook(self, msg_type, hook):
-        if msg_type not in self._hooks:
-            self._hooks[msg_type] = []
-        self._hooks[msg_type].append(hook)
+    def add_hook(self, msg_type, hook, message_class=None):
+        # hook(message) is called with the payload decoded into message_class (see NotificationBus)
+        self.notifications.subscribe(msg_type, hook, message_class)
+
+    def add_resume_hook(self, hook):
+        # hook: coroutine function without arguments, awaited in registration order after a reconnect
+        self._resume_hooks.append(hook)
 
     def unwrap(self, wrapped):
-        wrapper = Wrapper()
+        wrapper = pb.Wrapper()
         wrapper.ParseFromString(wrapped)
         return wrapper
 
-    def wrap(self, name, data):
-        wrapper = Wrapper()
-        wrapper.name = name
-        wrapper.data = data
-        return wrapper.SerializeToString()
-
     async def connect(self, ms_host):
+        self._origin = ms_host
         self._ws = await websockets.connect(self._endpoint, origin=ms_host)
+        self._ready.set()
         self._msg_dispatcher = asyncio.create_task(self.dispatch_msg())
 
+    def start_heartbeat(self, interval):
+        # Sends Lobby.heatbeat every `interval` seconds until close(); call it once logged in.
+        if self._heartbeat is None:
+            self._heartbeat = asyncio.create_task(self._heartbeat_loop(interval))
+
+    async def _heartbeat_loop(self, interval):
+        while True:
+            await asyncio.sleep(interval)
+            # no_operation_counter: heartbeats sent since the last real request
+            self._no_operation_counter += 1
+            req = pb.ReqHeatBeat(no_operation_counter=self._no_operation_counter)
+            try:
+                await self.send_request(HEARTBEAT_METHOD, req.SerializeToString())
+            except MSRPCTimeoutError as e:
+                logging.warning('heartbeat failed: {}'.format(e))
+            except MSRPCConnectionError:
+                return
+
     async def close(self):
-        self._msg_dispatcher.cancel()
+        self._closing = True
+        if self._failure is None:
+            # fail every request still waiting (and any sent after close) instead of leaving it parked
+            self._fail(MSRPCConnectionError('channel closed'))
+        current = asyncio.current_task()
+        tasks = [task for task in (self._heartbeat, self._resumer, self._msg_dispatcher)
+                 if task is not None and task is not current]
+        for task in tasks:
+            task.cancel()
         try:
-            await self._msg_dispatcher
-        except asyncio.CancelledError:
-            pass
+            # wait for the cancelled tasks so none is left running (or logging) after close() returns
+            for task in tasks:
+                try:
+                    await task
+                except asyncio.CancelledError:
+                    pass
         finally:
             await self._ws.close()
+            await self.notifications.close()
+        if self.metrics['timeouts'] or self.metrics['unmatched_responses']:
+            logging.info('MSRPCChannel metrics: {}'.format(self.metrics))
 
     async def dispatch_msg(self):
         while True:
-            msg = await self._ws.recv()
+            try:
+                msg = await self._ws.recv()
+            except (websockets.exceptions.ConnectionClosed, OSError) as e:
+                if self._closing or self._failure is not None or not await self._handle_disconnect(e):
+                    return
+                continue
+            # Frames are read in place (memoryview / struct) rather than sliced into copies
             type_byte = msg[0]
             if type_byte == 1:  # NOTIFY
-                wrapper = self.unwrap(msg[1:])
-                for hook in self._hooks.get(wrapper.name, []):
-                    asyncio.create_task(hook(wrapper.data))
+                wrapper = self.unwrap(memoryview(msg)[1:])
+                self.notifications.publish(wrapper.name, wrapper.data)
             elif type_byte == 2:  # REQUEST
-                wrapper = self.unwrap(msg[3:])
-                for hook in self._hooks.get(wrapper.name, []):
-                    asyncio.create_task(hook(wrapper.data))
+                wrapper = self.unwrap(memoryview(msg)[3:])
+                self.notifications.publish(wrapper.name, wrapper.data)
             elif type_byte == 3:  # RESPONSE
-                idx = int.from_bytes(msg[1:3], 'little')
-                if not idx in self._req_events:
+                idx, = _FRAME_IDX.unpack_from(msg, 1)
+                fut = self._inflight.get(idx)
+                if fut is None or fut.done():
+                    self._count_stray_response(idx)
                     continue
-                self._res[idx] = msg
-                self._req_events[idx].set()
+                self.metrics['responses'] += 1
+                data = _wrapper_data(msg, 3)
+                if data is None:
+                    data = self.unwrap(memoryview(msg)[3:]).data
+                fut.set_result(data)
 
-    async def send_request(self, name, msg):
-        idx = self._new_req_idx
-        self._new_req_idx = (self._new_req_idx + 1) % 60007
+    def _count_stray_response(self, idx):
+        if idx in self._abandoned:
+            self._abandoned.discard(idx)
+            self.metrics['late_responses'] += 1
+            logging.debug('MSRPCChannel: late response for idx {}'.format(idx))
+        else:
+            self.metrics['unmatched_responses'] += 1
+            logging.warning('MSRPCChannel: response for unknown idx {}'.format(idx))
+
+    async def _handle_disconnect(self, exc):
+        # Returns True once a new websocket is up (the session is resumed in the background),
+        # False if the channel gave up and failed every pending request.
+        self._set_down()
+        if self._resumer is not None:
+            self._resumer.cancel()
+            self._resumer = None
+
+        lost = MSRPCConnectionError('connection to {} lost before the response'.format(self._endpoint))
+        for idx in self._unreplayable:
+            fut = self._inflight.get(idx)
+            if fut is not None and not fut.done():
+                fut.set_exception(lost)
+        self._unreplayable.clear()
+
+        if self._reconnect:
+            while self._reconnect_attempts < self._max_reconnect_attempts:
+                delay = min(self._reconnect_backoff * 2 ** self._reconnect_attempts, self._max_reconnect_backoff)
+                self._reconnect_attempts += 1
+                logging.warning('MSRPCChannel disconnected ({!r}), reconnecting in {}s'.format(exc, delay))
+                await asyncio.sleep(delay)
+                try:
+                    self._ws = await websockets.connect(self._endpoint, origin=self._origin)
+                except (websockets.exceptions.WebSocketException, OSError, asyncio.TimeoutError) as e:
+                    exc = e
+                    continue
+                self._resumer = asyncio.create_task(self._resume())
+                return True
+
+        self._fail(MSRPCConnectionError('connection to {} lost: {!r}'.format(self._endpoint, exc)))
+        return False
+
+    async def _resume(self):
+        _resuming.set(True)
+        try:
+            for hook in self._resume_hooks:
+                await hook()
+            for pkt in list(self._pending_pkts.values()):
+                await self._ws.send(pkt)
+        except (websockets.exceptions.ConnectionClosed, OSError, asyncio.TimeoutError) as e:
+            # the dispatcher notices the broken socket and starts the next reconnect round
+            logging.warning('MSRPCChannel resume failed: {!r}'.format(e))
+            await self._ws.close()
+            return
+        except Exception as e:
+            # e.g. re-authentication rejected: retrying will not help. _failure stops the
+            # dispatcher from treating the close below as another disconnect.
+            logging.error('MSRPCChannel resume failed: {!r}'.format(e))
+            self._fail(MSRPCConnectionError('session resume failed: {!r}'.format(e)))
+            await self._ws.close()
+            return
+        self._reconnect_attempts = 0
+        self._set_up()
 
-        wrapped = self.wrap(name, msg)
-        pkt = b'\x02' + idx.to_bytes(2, 'little') + wrapped
+    def _set_down(self):
+        if self._outage_started is None:
+            self._outage_started = asyncio.get_running_loop().time()
+        self._ready.clear()
 
-        evt = asyncio.Event()
-        self._req_events[idx] = evt
+    def _set_up(self):
+        if self._outage_started is not None:
+            self._outage_total += asyncio.get_running_loop().time() - self._outage_started
+            self._outage_started = None
+        self._ready.set()
 
-        await self._ws.send(pkt)
-        await evt.wait()
+    def _outage_time(self):
+        total = self._outage_total
+        if self._outage_started is not None:
+            total += asyncio.get_running_loop().time() - self._outage_started
+        return total
 
-        if not idx in self._res:
-            return None
-        res = self._res[idx]
-        del self._res[idx]
+    def _fail(self, exc):
+        self._failure = exc
+        self._set_up()
+        for fut in self._inflight.values():
+            if not fut.done():
+                fut.set_exception(exc)
 
-        if idx in self._req_events:
-            del self._req_events[idx]
+    def _alloc_idx(self):
+        # Next index not held by a live request. The window keeps fewer than MAX_REQ_IDX
+        # requests in flight, so a free slot always exists.
+        idx = self._new_req_idx
+        while idx in self._inflight:
+            idx = (idx + 1) % MAX_REQ_IDX
+        self._new_req_idx = (idx + 1) % MAX_REQ_IDX
+        self._abandoned.discard(idx)
+        return idx
 
-        body = self.unwrap(res[3:])
+    async def send_request(self, name, msg, timeout=None, name_field=None, replay=True):
+        # Returns the response payload (Wrapper.data), usually as a memoryview into the received frame
+        # rather than bytes: ParseFromString accepts either, callers that keep the payload take bytes(...).
+        # name_field: wrapper_name_field(name), if the caller already has it.
+        # timeout: seconds to wait for the response once the request is sent; None falls back to the
+        # channel default. Waiting for a window slot or for a reconnect does not count against it.
+        # replay: resend the request after a reconnect if it was unanswered. Pass False for calls that
+        # must not run twice (e.g. payMonthTicket); those fail with MSRPCConnectionError instead.
+        if timeout is None:
+            timeout = self._timeout
+        if name != HEARTBEAT_METHOD:
+            self._no_operation_counter = 0
 
-        return body.data
+        if name_field is None:
+            name_field = wrapper_name_field(name)
+        # The Wrapper is written by hand: name field, then data field (omitted when empty, as protobuf does)
+        data_field = bytes((_WRAPPER_DATA_TAG,)) + _encode_varint(len(msg)) if msg else b''
+        resuming = _resuming.get()
+
+        # Resume hooks skip the window: the requests holding it may be waiting for that very resume
+        if not resuming:
+            await self._window.acquire()
+        idx = self._alloc_idx()
+        fut = asyncio.get_running_loop().create_future()
+        self._inflight[idx] = fut
+        pkt = b''.join((_FRAME_HEADER.pack(2, idx), name_field, data_field, msg))
+
+        try:
+            if not resuming:
+                await self._ready.wait()
+            if self._failure is not None:
+                raise self._failure
+            if not resuming:
+                if replay:
+                    self._pending_pkts[idx] = pkt
+                else:
+                    self._unreplayable.add(idx)
+            try:
+                await self._ws.send(pkt)
+            except (websockets.exceptions.ConnectionClosed, OSError):
+                if resuming or not replay or not self._reconnect:
+                    raise MSRPCConnectionError('connection to {} lost'.format(self._endpoint))
+                # left in _pending_pkts: replayed once the session is resumed
+            return await self._wait_response(fut, timeout, resuming)
+        except asyncio.TimeoutError:
+            self._abandoned.add(idx)
+            self.metrics['timeouts'] += 1
+            raise MSRPCTimeoutError(name, idx, timeout) from None
+        finally:
+            del self._inflight[idx]
+            if fut.done():
+                if not fut.cancelled():
+                    fut.exception()  # failed by _fail() before it was awaited; don't log it as unretrieved
+            else:
+                fut.cancel()
+            self._pending_pkts.pop(idx, None)
+            self._unreplayable.discard(idx)
+            if not resuming:
+                self._window.release()
+
+    async def _wait_response(self, fut, timeout, resuming):
+        # Waits up to `timeout` seconds of connected time: the clock stops while the channel is
+        # reconnecting, so an outage longer than the timeout does not fail requests that get replayed.
+        # Resume hooks run during the outage itself and get the plain timeout.
+        if timeout is None:
+            return await fut
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + timeout
+        outage = self._outage_time()
+        while True:
+            remaining = deadline - loop.time()
+            if remaining > 0:
+                done, _ = await asyncio.wait((fut,), timeout=remaining)
+                if done:
+                    return fut.result()
+            if resuming:
+                raise asyncio.TimeoutError
+            if not self._ready.is_set():
+                ready = asyncio.ensure_future(self._ready.wait())
+                try:
+                    await asyncio.wait((fut, ready), return_when=asyncio.FIRST_COMPLETED)
+                finally:
+                    ready.cancel()
+                if fut.done():
+                    return fut.result()
+            paused = self._outage_time() - outage
+            if paused <= 0:
+                raise asyncio.TimeoutError
+            outage += paused
+            deadline += paused
 
 
 class MSRPCService:
+    # Generated services may define _names: method -> (full method name, wrapper_name_field(full name))
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        # method -> (full method name, Wrapper name field, response class), resolved on first call
+        cls._calls = {}
 
     def __init__(self, channel):
         self._channel = channel
@@ -107,11 +535,20 @@ class MSRPCService:
     def get_res_class(self, method):
         raise NotImplementedError
 
-    async def call_method(self, method, req):
-        msg = req.SerializeToString()
-        name = '.{}.{}.{}'.format(self.get_package_name(), self.get_service_name(), method)
-        res_msg = await self._channel.send_request(name, msg)
-        res_class = self.get_res_class(method)
+    def _resolve_call(self, method):
+        names = getattr(self, '_names', None)
+        if names is not None and method in names:
+            name, name_field = names[method]
+        else:
+            name = '.{}.{}.{}'.format(self.get_package_name(), self.get_service_name(), method)
+            name_field = wrapper_name_field(name)
+        call = self._calls[method] = (name, name_field, self.get_res_class(method))
+        return call
+
+    async def call_method(self, method, req, timeout=None, replay=True):
+        name, name_field, res_class = self._calls.get(method) or self._resolve_call(method)
+        res_msg = await self._channel.send_request(name, req.SerializeToString(), timeout=timeout,
+                                                   name_field=name_field, replay=replay)
         res = res_class()
         res.ParseFromString(res_msg)
         return res
@@ -2,6 +2,7 @@
 import re
 import sys
 
+from google.protobuf import descriptor_pb2
 from google.protobuf.compiler import plugin_pb2 as plugin
 
 header = '''# -*- coding: utf-8 -*-
@@ -39,8 +40,120 @@ class {class_name}(MSRPCService):
 dict_template = '        \'{method_name}\': pb.{type_name},'
 
 func_template = '''
-    async def {func_name}(self, req):
-        return await self.call_method('{method_name}', req)'''
+    async def {func_name}(self, req, timeout=None, replay=True):
+        return await self.call_method('{method_name}', req, timeout=timeout, replay=replay)'''
+
+# Lazy variant (plugin parameter "lazy"): protocol_lazy.py only registers the file descriptor and
+# builds message classes on first attribute access; rpc_lazy.py keeps class names as strings and
+# resolves service methods through __getattr__, so importing them costs next to nothing.
+lazy_pb_tplt = '''# -*- coding: utf-8 -*-
+# Generated.  DO NOT EDIT!
+
+from google.protobuf import descriptor_pool
+from google.protobuf import message_factory
+from google.protobuf.internal import enum_type_wrapper
+
+DESCRIPTOR = descriptor_pool.Default().AddSerializedFile({serialized!r})
+
+
+_classes = {{}}
+
+
+def _message_class(desc):
+    # upb only holds generated classes weakly, so a parsed sub-message can outlive its class.
+    # Keep every class reachable from desc alive here, and expose nested types as attributes like protocol_pb2.
+    cls = _classes.get(desc.full_name)
+    if cls is None:
+        cls = _classes[desc.full_name] = message_factory.GetMessageClass(desc)
+        for nested in desc.nested_types:
+            setattr(cls, nested.name, _message_class(nested))
+        for enum in desc.enum_types:
+            setattr(cls, enum.name, enum_type_wrapper.EnumTypeWrapper(enum))
+        for field in desc.fields:
+            if field.message_type is not None:
+                _message_class(field.message_type)
+    return cls
+
+
+def __getattr__(name):
+    desc = DESCRIPTOR.message_types_by_name.get(name)
+    if desc is not None:
+        value = _message_class(desc)
+    elif name in DESCRIPTOR.enum_types_by_name:
+        value = enum_type_wrapper.EnumTypeWrapper(DESCRIPTOR.enum_types_by_name[name])
+    else:
+        raise AttributeError('module {{!r}} has no attribute {{!r}}'.format(__name__, name))
+    globals()[name] = value
+    return value
+'''
+
+lazy_header = '''# -*- coding: utf-8 -*-
+# Generated.  DO NOT EDIT!
+
+import ms.protocol_lazy as pb
+from ms.base import MSRPCService
+'''
+
+lazy_cls_tplt = '''
+class {class_name}(MSRPCService):
+    version = None
+
+    _req = {{
+{req_list}
+    }}
+    _res = {{
+{res_list}
+    }}
+    _methods = {{
+{method_list}
+    }}
+    # method -> (full method name, pre-serialized Wrapper.name field) for the request path
+    _names = {{
+{name_list}
+    }}
+
+    def get_package_name(self):
+        return '{package_name}'
+
+    def get_service_name(self):
+        return '{class_name}'
+
+    def get_req_class(self, method):
+        return getattr(pb, {class_name}._req[method])
+
+    def get_res_class(self, method):
+        return getattr(pb, {class_name}._res[method])
+
+    def __getattr__(self, name):
+        method = {class_name}._methods.get(name)
+        if method is None:
+            raise AttributeError("{{!r}} object has no attribute {{!r}}".format(type(self).__name__, name))
+
+        async def call(req, timeout=None, replay=True):
+            return await self.call_method(method, req, timeout=timeout, replay=replay)
+
+        call.__name__ = name
+        setattr(self, name, call)
+        return call
+'''
+
+lazy_dict_template = '        \'{key}\': \'{value}\','
+lazy_name_template = '        \'{key}\': ({name!r}, {field!r}),'
+
+
+def encode_varint(value):
+    out = bytearray()
+    while value > 0x7f:
+        out.append(value & 0x7f | 0x80)
+        value >>= 7
+    out.append(value)
+    return bytes(out)
+
+
+def wrapper_name_field(name):
+    # Wrapper.name (field 1, length-delimited) exactly as protobuf serializes it
+    encoded = name.encode('utf-8')
+    return b'\x0a' + encode_varint(len(encoded)) + encoded
 
 
 def to_snake_case(name):
@@ -48,7 +161,68 @@ def to_snake_case(name):
     return re.sub('([a-z0-9])([A-Z])', r'\1_\2', s1).lower()
 
 
+def serialized_descriptor(proto_file):
+    # Same bytes protoc's python generator embeds in protocol_pb2.py, so both modules can share the pool
+    fdp = descriptor_pb2.FileDescriptorProto()
+    fdp.CopyFrom(proto_file)
+    fdp.ClearField('source_code_info')
+    for msg in fdp.message_type:
+        clear_json_names(msg)
+    return fdp.SerializeToString()
+
+
+def clear_json_names(msg):
+    for field in msg.field:
+        field.ClearField('json_name')
+    for field in msg.extension:
+        field.ClearField('json_name')
+    for nested in msg.nested_type:
+        clear_json_names(nested)
+
+
+def generate_lazy_code(request, response):
+    for proto_file in request.proto_file:
+        package_name = proto_file.package
+
+        services = []
+        for srv in proto_file.service:
+            class_name = srv.name
+            req_list = []
+            res_list = []
+            method_list = []
+            name_list = []
+            for mtd in srv.method:
+                method_name = mtd.name
+                req_name = mtd.input_type.rsplit('.', 1)[-1]
+                res_name = mtd.output_type.rsplit('.', 1)[-1]
+                full_name = '.{}.{}.{}'.format(package_name, class_name, method_name)
+                req_list.append(lazy_dict_template.format(key=method_name, value=req_name))
+                res_list.append(lazy_dict_template.format(key=method_name, value=res_name))
+                method_list.append(lazy_dict_template.format(key=to_snake_case(method_name), value=method_name))
+                name_list.append(lazy_name_template.format(key=method_name, name=full_name,
+                                                           field=wrapper_name_field(full_name)))
+
+            services.append(lazy_cls_tplt.format(package_name=package_name,
+                                                 class_name=class_name,
+                                                 req_list='\n'.join(req_list),
+                                                 res_list='\n'.join(res_list),
+                                                 method_list='\n'.join(method_list),
+                                                 name_list='\n'.join(name_list)))
+
+        f = response.file.add()
+        f.name = 'rpc_lazy.py'
+        f.content = lazy_header + '\n' + '\n'.join(services)
+
+        f = response.file.add()
+        f.name = 'protocol_lazy.py'
+        f.content = lazy_pb_tplt.format(serialized=serialized_descriptor(proto_file))
+
+
 def generate_code(request, response):
+    if 'lazy' in request.parameter.split(','):
+        generate_lazy_code(request, response)
+        return
+
     for proto_file in request.proto_file:
         package_name = proto_file.package
 
@@ -0,0 +1,39 @@
+# -*- coding: utf-8 -*-
+# Generated.  DO NOT EDIT!
+
+from google.protobuf import descriptor_pool
+from google.protobuf import message_factory
+from google.protobuf.internal import enum_type_wrapper
+
+DESCRIPTOR = descriptor_pool.Default().AddSerializedFile(b'\n\x0eprotocol.proto\x12\x02lq"c\n\x13NotifyRoomGameStart\x12\x10\n\x08game_url\x18\x01 \x01(\t\x12\x15\n\rconnect_token\x18\x02 \x01(\t\x12\x11\n\tgame_uuid\x18\x03 \x01(\t\x12\x10\n\x08location\x18\x04 \x01(\t"{\n\x14NotifyMatchGameStart\x12\x10\n\x08game_url\x18\x01 \x01(\t\x12\x15\n\rconnect_token\x18\x02 \x01(\t\x12\x11\n\tgame_uuid\x18\x03 \x01(\t\x12\x15\n\rmatch_mode_id\x18\x04 \x01(\r\x12\x10\n\x08location\x18\x05 \x01(\t"\xc2\x01\n\x15NotifyRoomPlayerReady\x12\x12\n\naccount_id\x18\x01 \x01(\r\x12\r\n\x05ready\x18\x02 \x01(\x08\x12A\n\x0caccount_list\x18\x03 \x01(\x0b2+.lq.NotifyRoomPlayerReady.AccountReadyState\x12\x0b\n\x03seq\x18\x04 \x01(\r\x1a6\n\x11AccountReadyState\x12\x12\n\naccount_id\x18\x01 \x01(\r\x12\r\n\x05ready\x18\x02 \x01(\x08"\xd4\x01\n\x18NotifyRoomPlayerDressing\x12\x12\n\naccount_id\x18\x01 \x01(\r\x12\x10\n\x08dressing\x18\x02 \x01(\x08\x12G\n\x0caccount_list\x18\x03 \x01(\x0b21.lq.NotifyRoomPlayerDressing.AccountDressingState\x12\x0b\n\x03seq\x18\x04 \x01(\r\x1a<\n\x14AccountDressingState\x12\x12\n\naccount_id\x18\x01 \x01(\r\x12\x10\n\x08dressing\x18\x02 \x01(\x08"\xac\x01\n\x16NotifyRoomPlayerUpdate\x12\x10\n\x08owner_id\x18\x03 \x01(\r\x12\x13\n\x0brobot_count\x18\x04 \x01(\r\x12\'\n\x0bplayer_list\x18\x05 \x03(\x0b2\x12.lq.PlayerGameView\x12\x0b\n\x03seq\x18\x06 \x01(\r\x12"\n\x06robots\x18\x07 \x03(\x0b2\x12.lq.PlayerGameView\x12\x11\n\tpositions\x18\x08 \x03(\r"\x13\n\x11NotifyRoomKickOut"Z\n\x17NotifyFriendStateChange\x12\x11\n\ttarget_id\x18\x01 \x01(\r\x12,\n\x0cactive_state\x18\x02 \x01(\x0b2\x16.lq.AccountActiveState"M\n\x16NotifyFriendViewChange\x12\x11\n\ttarget_id\x18\x01 \x01(\r\x12 \n\x04base\x18\x02 \x01(\x0b2\x12.lq.PlayerBaseView"R\n\x12NotifyFriendChange\x12\x12\n\naccount_id\x18\x01 \x01(\r\x12\x0c\n\x04type\x18\x02 \x01(\r\x12\x1a\n\x06friend\x18\x03 \x01(\x0b2\n.lq.Friend"R\n\x14NotifyNewFriendApply\x12\x12\n\naccount_id\x18\x01 \x01(\r\x12\x12\n\napply_time\x18\x02 \x01(\r\x12\x12\n\nremoved_id\x18\x03 \x01(\r"X\n\x13NotifyClientMessage\x12"\n\x06sender\x18\x01 \x01(\x0b2\x12.lq.PlayerBaseView\x12\x0c\n\x04type\x18\x02 \x01(\r\x12\x0f\n\x07content\x18\x03 \x01(\t"8\n\x13NotifyAccountUpdate\x12!\n\x06update\x18\x01 \x01(\x0b2\x11.lq.AccountUpdate"\x14\n\x12NotifyAnotherLogin"\x15\n\x13NotifyAccountLogout"\x96\x01\n\x18NotifyAnnouncementUpdate\x12D\n\x0bupdate_list\x18\x01 \x03(\x0b2/.lq.NotifyAnnouncementUpdate.AnnouncementUpdate\x1a4\n\x12AnnouncementUpdate\x12\x0c\n\x04lang\x18\x01 \x01(\t\x12\x10\n\x08platform\x18\x02 \x01(\t"\'\n\rNotifyNewMail\x12\x16\n\x04mail\x18\x01 \x01(\x0b2\x08.lq.Mail"(\n\x10NotifyDeleteMail\x12\x14\n\x0cmail_id_list\x18\x01 \x03(\r",\n\x16NotifyReviveCoinUpdate\x12\x12\n\nhas_gained\x18\x01 \x01(\x08"r\n\x15NotifyDailyTaskUpdate\x12$\n\nprogresses\x18\x01 \x03(\x0b2\x10.lq.TaskProgress\x12\x1c\n\x14max_daily_task_count\x18\x02 \x01(\r\x12\x15\n\rrefresh_count\x18\x03 \x01(\r"@\n\x18NotifyActivityTaskUpdate\x12$\n\nprogresses\x18\x01 \x03(\x0b2\x10.lq.TaskProgress"F\n\x1eNotifyActivityPeriodTaskUpdate\x12$\n\nprogresses\x18\x01 \x03(\x0b2\x10.lq.TaskProgress"E\n\x1dNotifyAccountRandomTaskUpdate\x12$\n\nprogresses\x18\x01 \x03(\x0b2\x10.lq.TaskProgress"N\n\x1fNotifyActivitySegmentTaskUpdate\x12+\n\nprogresses\x18\x01 \x03(\x0b2\x17.lq.SegmentTaskProgress"\xbb\x04\n\x14NotifyActivityUpdate\x127\n\x04list\x18\x01 \x03(\x0b2).lq.NotifyActivityUpdate.FeedActivityData\x1a\xe9\x03\n\x10FeedActivityData\x12\x13\n\x0bactivity_id\x18\x01 \x01(\r\x12\x12\n\nfeed_count\x18\x02 \x01(\r\x12X\n\x13friend_receive_data\x18\x03 \x01(\x0b2;.lq.NotifyActivityUpdate.FeedActivityData.CountWithTimeData\x12U\n\x10friend_send_data\x18\x04 \x01(\x0b2;.lq.NotifyActivityUpdate.FeedActivityData.CountWithTimeData\x12I\n\ngift_inbox\x18\x05 \x03(\x0b25.lq.NotifyActivityUpdate.FeedActivityData.GiftBoxData\x1a<\n\x11CountWithTimeData\x12\r\n\x05count\x18\x01 \x01(\r\x12\x18\n\x10last_update_time\x18\x02 \x01(\r\x1ar\n\x0bGiftBoxData\x12\n\n\x02id\x18\x01 \x01(\r\x12\x0f\n\x07item_id\x18\x02 \x01(\r\x12\r\n\x05count\x18\x03 \x01(\r\x12\x17\n\x0ffrom_account_id\x18\x04 \x01(\r\x12\x0c\n\x04time\x18\x05 \x01(\r\x12\x10\n\x08received\x18\x06 \x01(\r"\xaf\x01\n NotifyAccountChallengeTaskUpdate\x12$\n\nprogresses\x18\x01 \x03(\x0b2\x10.lq.TaskProgress\x12\r\n\x05level\x18\x02 \x01(\r\x12\x15\n\rrefresh_count\x18\x03 \x01(\r\x12\x13\n\x0bmatch_count\x18\x04 \x01(\r\x12\x11\n\tticket_id\x18\x05 \x01(\r\x12\x17\n\x0frewarded_season\x18\x06 \x03(\r"\x12\n\x10NotifyNewComment"\x15\n\x13NotifyRollingNotice"\x16\n\x14NotifyMaintainNotice"\x17\n\x15NotifyGiftSendRefresh"3\n\x10NotifyShopUpdate\x12\x1f\n\tshop_info\x18\x01 \x01(\x0b2\x0c.lq.ShopInfo"\x16\n\x14NotifyIntervalUpdate"\xb7\x01\n\x14NotifyVipLevelChange\x12\x12\n\ngift_limit\x18\x01 \x01(\r\x12\x18\n\x10friend_max_count\x18\x02 \x01(\r\x12\x1e\n\x16zhp_free_refresh_limit\x18\x03 \x01(\r\x12\x1e\n\x16zhp_cost_refresh_limit\x18\x04 \x01(\r\x12\x13\n\x0bbuddy_bonus\x18\x05 \x01(\x02\x12\x1c\n\x14record_collect_limit\x18\x06 \x01(\r";\n\x13NotifyServerSetting\x12$\n\x08settings\x18\x01 \x01(\x0b2\x12.lq.ServerSettings"\xdc\x01\n\x0fNotifyPayResult\x12\x12\n\npay_result\x18\x01 \x01(\r\x12\x10\n\x08order_id\x18\x02 \x01(\t\x12\x10\n\x08goods_id\x18\x03 \x01(\r\x12\x18\n\x10new_month_ticket\x18\x04 \x01(\r\x12;\n\x0fresource_modify\x18\x05 \x03(\x0b2".lq.NotifyPayResult.ResourceModify\x1a:\n\x0eResourceModify\x12\n\n\x02id\x18\x01 \x01(\r\x12\r\n\x05count\x18\x02 \x01(\r\x12\r\n\x05final\x18\x03 \x01(\r"y\n\x1dNotifyCustomContestAccountMsg\x12\x11\n\tunique_id\x18\x01 \x01(\r\x12\x12\n\naccount_id\x18\x02 \x01(\r\x12\x0e\n\x06sender\x18\x03 \x01(\t\x12\x0f\n\x07content\x18\x04 \x01(\t\x12\x10\n\x08verified\x18\x05 \x01(\r"\xb1\x01\n\x1cNotifyCustomContestSystemMsg\x12\x11\n\tunique_id\x18\x01 \x01(\r\x12\x0c\n\x04type\x18\x02 \x01(\r\x12\x0c\n\x04uuid\x18\x03 \x01(\t\x122\n\ngame_start\x18\x04 \x01(\x0b2\x1e.lq.CustomizedContestGameStart\x12.\n\x08game_end\x18\x05 \x01(\x0b2\x1c.lq.CustomizedContestGameEnd"!\n\x12NotifyMatchTimeout\x12\x0b\n\x03sid\x18\x01 \x01(\t" \n\x11NotifyMatchFailed\x12\x0b\n\x03sid\x18\x01 \x01(\t"<\n\x18NotifyCustomContestState\x12\x11\n\tunique_id\x18\x01 \x01(\r\x12\r\n\x05state\x18\x02 \x01(\r"T\n\x14NotifyActivityChange\x12$\n\x0enew_activities\x18\x01 \x03(\x0b2\x0c.lq.Activity\x12\x16\n\x0eend_activities\x18\x02 \x03(\r"H\n\x0fNotifyAFKResult\x12\x0c\n\x04type\x18\x01 \x01(\r\x12\x14\n\x0cban_end_time\x18\x02 \x01(\r\x12\x11\n\tgame_uuid\x18\x03 \x01(\t"\x1a\n\x18NotifyLoginQueueFinished"\xb8\x05\n\x18NotifyGameFinishRewardV2\x12\x0f\n\x07mode_id\x18\x01 \x01(\r\x12>\n\x0clevel_change\x18\x02 \x01(\x0b2(.lq.NotifyGameFinishRewardV2.LevelChange\x12<\n\x0bmatch_chest\x18\x03 \x01(\x0b2\'.lq.NotifyGameFinishRewardV2.MatchChest\x12B\n\x0emain_character\x18\x04 \x01(\x0b2*.lq.NotifyGameFinishRewardV2.MainCharacter\x12B\n\x0echaracter_gift\x18\x05 \x01(\x0b2*.lq.NotifyGameFinishRewardV2.CharacterGift\x12(\n\x06badges\x18\x06 \x03(\x0b2\x18.lq.BadgeAchieveProgress\x1a^\n\x0bLevelChange\x12 \n\x06origin\x18\x01 \x01(\x0b2\x10.lq.AccountLevel\x12\x1f\n\x05final\x18\x02 \x01(\x0b2\x10.lq.AccountLevel\x12\x0c\n\x04type\x18\x03 \x01(\r\x1aq\n\nMatchChest\x12\x10\n\x08chest_id\x18\x01 \x01(\r\x12\x0e\n\x06origin\x18\x02 \x01(\r\x12\r\n\x05final\x18\x03 \x01(\r\x12\x11\n\tis_graded\x18\x04 \x01(\x08\x12\x1f\n\x07rewards\x18\x05 \x03(\x0b2\x0e.lq.RewardSlot\x1a8\n\rMainCharacter\x12\r\n\x05level\x18\x01 \x01(\r\x12\x0b\n\x03exp\x18\x02 \x01(\r\x12\x0b\n\x03add\x18\x03 \x01(\r\x1aN\n\rCharacterGift\x12\x0e\n\x06origin\x18\x01 \x01(\r\x12\r\n\x05final\x18\x02 \x01(\r\x12\x0b\n\x03add\x18\x03 \x01(\r\x12\x11\n\tis_graded\x18\x04 \x01(\x08"\xa4\x01\n\x16NotifyActivityRewardV2\x12B\n\x0factivity_reward\x18\x01 \x03(\x0b2).lq.NotifyActivityRewardV2.ActivityReward\x1aF\n\x0eActivityReward\x12\x13\n\x0bactivity_id\x18\x01 \x01(\r\x12\x1f\n\x07rewards\x18\x02 \x03(\x0b2\x0e.lq.RewardSlot"\x8e\x01\n\x15NotifyActivityPointV2\x12@\n\x0factivity_points\x18\x01 \x03(\x0b2\'.lq.NotifyActivityPointV2.ActivityPoint\x1a3\n\rActivityPoint\x12\x13\n\x0bactivity_id\x18\x01 \x01(\r\x12\r\n\x05point\x18\x02 \x01(\r"\xa0\x01\n\x18NotifyLeaderboardPointV2\x12I\n\x12leaderboard_points\x18\x01 \x03(\x0b2-.lq.NotifyLeaderboardPointV2.LeaderboardPoint\x1a9\n\x10LeaderboardPoint\x12\x16\n\x0eleaderboard_id\x18\x01 \x01(\r\x12\r\n\x05point\x18\x02 \x01(\r"1\n\x10NotifySeerReport\x12\x1d\n\x06report\x18\x01 \x01(\x0b2\r.lq.SeerBrief"<\n\x18NotifyConnectionShutdown\x12\x0e\n\x06reason\x18\x01 \x01(\r\x12\x10\n\x08close_at\x18\x02 \x01(\r"Q\n\x05Error\x12\x0c\n\x04code\x18\x01 \x01(\r\x12\x12\n\nu32_params\x18\x02 \x03(\r\x12\x12\n\nstr_params\x18\x03 \x03(\t\x12\x12\n\njson_param\x18\x04 \x01(\t"%\n\x07Wrapper\x12\x0c\n\x04name\x18\x01 \x01(\t\x12\x0c\n\x04data\x18\x02 \x01(\x0c"@\n\x0fNetworkEndpoint\x12\x0e\n\x06family\x18\x01 \x01(\t\x12\x0f\n\x07address\x18\x02 \x01(\t\x12\x0c\n\x04port\x18\x03 \x01(\r"\x0b\n\tReqCommon"%\n\tResCommon\x12\x18\n\x05error\x18\x01 \x01(\x0b2\t.lq.Error"O\n\x10ResAccountUpdate\x12\x18\n\x05error\x18\x01 \x01(\x0b2\t.lq.Error\x12!\n\x06update\x18\x02 \x01(\x0b2\x11.lq.AccountUpdate"(\n\rAntiAddiction\x12\x17\n\x0fonline_duration\x18\x01 \x01(\r"\x7f\n\x0fHighestHuRecord\x12\x0e\n\x06fanshu\x18\x01 \x01(\r\x12\x0f\n\x07doranum\x18\x02 \x01(\r\x12\r\n\x05title\x18\x03 \x01(\t\x12\r\n\x05hands\x18\x04 \x03(\t\x12\x0c\n\x04ming\x18\x05 \x03(\t\x12\r\n\x05hupai\x18\x06 \x01(\t\x12\x10\n\x08title_id\x18\x07 \x01(\r"\xb6\x06\n\x17AccountMahjongStatistic\x12\x1d\n\x15final_position_counts\x18\x01 \x03(\r\x12>\n\x0crecent_round\x18\x02 \x01(\x0b2(.lq.AccountMahjongStatistic.RoundSummary\x128\n\trecent_hu\x18\x03 \x01(\x0b2%.lq.AccountMahjongStatistic.HuSummary\x12\'\n\nhighest_hu\x18\x04 \x01(\x0b2\x13.lq.HighestHuRecord\x12G\n\x14recent_20_hu_summary\x18\x06 \x01(\x0b2).lq.AccountMahjongStatistic.Liqi20Summary\x12G\n\x14recent_10_hu_summary\x18\x07 \x01(\x0b2).lq.AccountMahjongStatistic.LiQi10Summary\x12E\n\x15recent_10_game_result\x18\x08 \x03(\x0b2&.lq.AccountMahjongStatistic.GameResult\x1ad\n\x0cRoundSummary\x12\x13\n\x0btotal_count\x18\x01 \x01(\r\x12\x12\n\nrong_count\x18\x02 \x01(\r\x12\x12\n\nzimo_count\x18\x03 \x01(\r\x12\x17\n\x0ffangchong_count\x18\x04 \x01(\r\x1aM\n\tHuSummary\x12\x13\n\x0btotal_count\x18\x01 \x01(\r\x12\x18\n\x10dora_round_count\x18\x02 \x01(\r\x12\x11\n\ttotal_fan\x18\x03 \x01(\r\x1aZ\n\rLiqi20Summary\x12\x13\n\x0btotal_count\x18\x01 \x01(\r\x12\x1a\n\x12total_lidora_count\x18\x02 \x01(\r\x12\x18\n\x10average_hu_point\x18\x03 \x01(\r\x1a>\n\rLiQi10Summary\x12\x17\n\x0ftotal_xuanshang\x18\x01 \x01(\r\x12\x14\n\x0ctotal_fanshu\x18\x02 \x01(\r\x1a/\n\nGameResult\x12\x0c\n\x04rank\x18\x01 \x01(\r\x12\x13\n\x0bfinal_point\x18\x02 \x01(\x05"\x8a\x01\n\x14AccountStatisticData\x12\x18\n\x10mahjong_category\x18\x01 \x01(\r\x12\x15\n\rgame_category\x18\x02 \x01(\r\x12.\n\tstatistic\x18\x03 \x01(\x0b2\x1b.lq.AccountMahjongStatistic\x12\x11\n\tgame_type\x18\x04 \x01(\r")\n\x0cAccountLevel\x12\n\n\x02id\x18\x01 \x01(\r\x12\r\n\x05score\x18\x02 \x01(\r"M\n\x08ViewSlot\x12\x0c\n\x04slot\x18\x01 \x01(\r\x12\x0f\n\x07item_id\x18\x02 \x01(\r\x12\x0c\n\x04type\x18\x03 \x01(\r\x12\x14\n\x0citem_id_list\x18\x04 \x03(\r"[\n\nFavoriteHu\x12\x10\n\x08category\x18\x01 \x01(\r\x12\x0c\n\x04type\x18\x02 \x01(\r\x12\x1f\n\x02hu\x18\x03 \x01(\x0b2\x13.lq.HighestHuRecord\x12\x0c\n\x04mode\x18\x04 \x01(\r"\xbf\x08\n\x07Account\x12\x12\n\naccount_id\x18\x01 \x01(\r\x12\x10\n\x08nickname\x18\x02 \x01(\t\x12\x12\n\nlogin_time\x18\x03 \x01(\r\x12\x13\n\x0blogout_time\x18\x04 \x01(\r\x12\x0f\n\x07room_id\x18\x05 \x01(\r\x12)\n\x0eanti_addiction\x18\x06 \x01(\x0b2\x11.lq.AntiAddiction\x12\r\n\x05title\x18\x07 \x01(\r\x12\x11\n\tsignature\x18\x08 \x01(\t\x12\r\n\x05email\x18\t \x01(\t\x12\x14\n\x0cemail_verify\x18\n \x01(\r\x12\x0c\n\x04gold\x18\x0b \x01(\r\x12\x0f\n\x07diamond\x18\x0c \x01(\r\x12\x11\n\tavatar_id\x18\r \x01(\r\x12\x0b\n\x03vip\x18\x0e \x01(\r\x12\x10\n\x08birthday\x18\x0f \x01(\x05\x12\r\n\x05phone\x18\x10 \x01(\t\x12\x14\n\x0cphone_verify\x18\x11 \x01(\r\x125\n\x10platform_diamond\x18\x12 \x03(\x0b2\x1b.lq.Account.PlatformDiamond\x12\x1f\n\x05level\x18\x15 \x01(\x0b2\x10.lq.AccountLevel\x12 \n\x06level3\x18\x16 \x01(\x0b2\x10.lq.AccountLevel\x12\x14\n\x0cavatar_frame\x18\x17 \x01(\r\x12\x13\n\x0bskin_ticket\x18\x18 \x01(\r\x12<\n\x14platform_skin_ticket\x18\x19 \x03(\x0b2\x1e.lq.Account.PlatformSkinTicket\x12\x10\n\x08verified\x18\x1a \x01(\r\x124\n\x10challenge_levels\x18\x1b \x03(\x0b2\x1a.lq.Account.ChallengeLevel\x12\x14\n\x0cfrozen_state\x18\x1d \x01(\r\x127\n\x11achievement_count\x18\x1c \x03(\x0b2\x1c.lq.Account.AchievementCount\x12\x15\n\rloading_image\x18\x1e \x03(\r\x12#\n\x0bfavorite_hu\x18" \x03(\x0b2\x0e.lq.FavoriteHu\x12!\n\x06badges\x18# \x03(\x0b2\x11.lq.Account.Badge\x1a,\n\x0fPlatformDiamond\x12\n\n\x02id\x18\x01 \x01(\r\x12\r\n\x05count\x18\x02 \x01(\r\x1a/\n\x12PlatformSkinTicket\x12\n\n\x02id\x18\x01 \x01(\r\x12\r\n\x05count\x18\x02 \x01(\r\x1a=\n\x0eChallengeLevel\x12\x0e\n\x06season\x18\x01 \x01(\r\x12\r\n\x05level\x18\x02 \x01(\r\x12\x0c\n\x04rank\x18\x03 \x01(\r\x1a/\n\x10AchievementCount\x12\x0c\n\x04rare\x18\x01 \x01(\r\x12\r\n\x05count\x18\x02 \x01(\r\x1aD\n\x05Badge\x12\n\n\x02id\x18\x01 \x01(\r\x12\x15\n\rachieved_time\x18\x02 \x01(\r\x12\x18\n\x10achieved_counter\x18\x03 \x01(\r"-\n\x10AccountOwnerData\x12\x19\n\x11unlock_characters\x18\x01 \x03(\r"\x85\x11\n\rAccountUpdate\x124\n\tnumerical\x18\x01 \x03(\x0b2!.lq.AccountUpdate.NumericalUpdate\x124\n\tcharacter\x18\x02 \x01(\x0b2!.lq.AccountUpdate.CharacterUpdate\x12\x1a\n\x03bag\x18\x03 \x01(\x0b2\r.lq.BagUpdate\x128\n\x0bachievement\x18\x04 \x01(\x0b2#.lq.AccountUpdate.AchievementUpdate\x12#\n\x07shilian\x18\x05 \x01(\x0b2\x12.lq.AccountShiLian\x125\n\ndaily_task\x18\x06 \x01(\x0b2!.lq.AccountUpdate.DailyTaskUpdate\x12,\n\x05title\x18\x07 \x01(\x0b2\x1d.lq.AccountUpdate.TitleUpdate\x12\x1a\n\x12new_recharged_list\x18\x08 \x03(\r\x123\n\ractivity_task\x18\t \x01(\x0b2\x1c.lq.AccountUpdate.TaskUpdate\x128\n\x12activity_flip_task\x18\n \x01(\x0b2\x1c.lq.AccountUpdate.TaskUpdate\x12:\n\x14activity_period_task\x18\x0b \x01(\x0b2\x1c.lq.AccountUpdate.TaskUpdate\x12:\n\x14activity_random_task\x18\x0c \x01(\x0b2\x1c.lq.AccountUpdate.TaskUpdate\x12;\n\tchallenge\x18\r \x01(\x0b2(.lq.AccountUpdate.AccountChallengeUpdate\x128\n\x08ab_match\x18\x0e \x01(\x0b2&.lq.AccountUpdate.AccountABMatchUpdate\x12+\n\x08activity\x18\x0f \x01(\x0b2\x19.lq.AccountActivityUpdate\x12B\n\x15activity_segment_task\x18\x10 \x01(\x0b2#.lq.AccountUpdate.SegmentTaskUpdate\x129\n\x0cmonth_ticket\x18\x11 \x01(\x0b2#.lq.AccountUpdate.MonthTicketUpdate\x12=\n\x0emain_character\x18\x12 \x01(\x0b2%.lq.AccountUpdate.MainCharacterUpdate\x12,\n\x05badge\x18\x13 \x01(\x0b2\x1d.lq.AccountUpdate.BadgeUpdate\x1a,\n\x0fNumericalUpdate\x12\n\n\x02id\x18\x01 \x01(\r\x12\r\n\x05final\x18\x03 \x01(\r\x1aw\n\x0fCharacterUpdate\x12!\n\ncharacters\x18\x02 \x03(\x0b2\r.lq.Character\x12\r\n\x05skins\x18\x03 \x03(\r\x12\x18\n\x10finished_endings\x18\x04 \x03(\r\x12\x18\n\x10rewarded_endings\x18\x05 \x03(\r\x1aX\n\x11AchievementUpdate\x12+\n\nprogresses\x18\x01 \x03(\x0b2\x17.lq.AchievementProgress\x12\x16\n\x0erewarded_group\x18\x02 \x03(\r\x1aJ\n\x0fDailyTaskUpdate\x12$\n\nprogresses\x18\x01 \x03(\x0b2\x10.lq.TaskProgress\x12\x11\n\ttask_list\x18\x02 \x03(\r\x1a8\n\x0bTitleUpdate\x12\x12\n\nnew_titles\x18\x01 \x03(\r\x12\x15\n\rremove_titles\x18\x02 \x03(\r\x1aE\n\nTaskUpdate\x12$\n\nprogresses\x18\x01 \x03(\x0b2\x10.lq.TaskProgress\x12\x11\n\ttask_list\x18\x02 \x03(\r\x1a\xb8\x01\n\x16AccountChallengeUpdate\x12$\n\nprogresses\x18\x01 \x03(\x0b2\x10.lq.TaskProgress\x12\r\n\x05level\x18\x02 \x01(\r\x12\x15\n\rrefresh_count\x18\x03 \x01(\r\x12\x13\n\x0bmatch_count\x18\x04 \x01(\r\x12\x11\n\tticket_id\x18\x05 \x01(\r\x12\x11\n\ttask_list\x18\x06 \x03(\r\x12\x17\n\x0frewarded_season\x18\x07 \x03(\r\x1a\xfd\x01\n\x14AccountABMatchUpdate\x12\x10\n\x08match_id\x18\x01 \x01(\r\x12\x13\n\x0bmatch_count\x18\x02 \x01(\r\x12\x14\n\x0cbuy_in_count\x18\x03 \x01(\r\x12\r\n\x05point\x18\x04 \x01(\r\x12\x10\n\x08rewarded\x18\x05 \x01(\x08\x12J\n\x0fmatch_max_point\x18\x06 \x03(\x0b21.lq.AccountUpdate.AccountABMatchUpdate.MatchPoint\x12\x0c\n\x04quit\x18\x07 \x01(\x08\x1a-\n\nMatchPoint\x12\x10\n\x08match_id\x18\x01 \x01(\r\x12\r\n\x05point\x18\x02 \x01(\r\x1aS\n\x11SegmentTaskUpdate\x12+\n\nprogresses\x18\x01 \x03(\x0b2\x17.lq.SegmentTaskProgress\x12\x11\n\ttask_list\x18\x02 \x03(\r\x1a<\n\x11MonthTicketUpdate\x12\x10\n\x08end_time\x18\x01 \x01(\r\x12\x15\n\rlast_pay_time\x18\x02 \x01(\r\x1a<\n\x13MainCharacterUpdate\x12\x14\n\x0ccharacter_id\x18\x01 \x01(\r\x12\x0f\n\x07skin_id\x18\x02 \x01(\r\x1a;\n\x0bBadgeUpdate\x12,\n\nprogresses\x18\x01 \x03(\x0b2\x18.lq.BadgeAchieveProgress"E\n\x0cGameMetaData\x12\x0f\n\x07room_id\x18\x01 \x01(\r\x12\x0f\n\x07mode_id\x18\x02 \x01(\r\x12\x13\n\x0bcontest_uid\x18\x03 \x01(\r"Y\n\x12AccountPlayingGame\x12\x11\n\tgame_uuid\x18\x01 \x01(\t\x12\x10\n\x08category\x18\x02 \x01(\r\x12\x1e\n\x04meta\x18\x03 \x01(\x0b2\x10.lq.GameMetaData"8\n\x0fRandomCharacter\x12\x14\n\x0ccharacter_id\x18\x01 \x01(\r\x12\x0f\n\x07skin_id\x18\x02 \x01(\r"\xa2\x03\n\x10AccountCacheView\x12\x15\n\rcache_version\x18\x01 \x01(\r\x12\x12\n\naccount_id\x18\x02 \x01(\r\x12\x10\n\x08nickname\x18\x03 \x01(\t\x12\x12\n\nlogin_time\x18\x04 \x01(\r\x12\x13\n\x0blogout_time\x18\x05 \x01(\r\x12\x11\n\tis_online\x18\x06 \x01(\x08\x12\x0f\n\x07room_id\x18\x07 \x01(\r\x12\r\n\x05title\x18\x08 \x01(\r\x12\x11\n\tavatar_id\x18\t \x01(\r\x12\x0b\n\x03vip\x18\n \x01(\r\x12\x1f\n\x05level\x18\x0b \x01(\x0b2\x10.lq.AccountLevel\x12,\n\x0cplaying_game\x18\x0c \x01(\x0b2\x16.lq.AccountPlayingGame\x12 \n\x06level3\x18\r \x01(\x0b2\x10.lq.AccountLevel\x12\x14\n\x0cavatar_frame\x18\x0e \x01(\r\x12\x10\n\x08verified\x18\x0f \x01(\r\x12\x14\n\x0cban_deadline\x18\x10 \x01(\r\x12\x13\n\x0bcomment_ban\x18\x11 \x01(\r\x12\x11\n\tban_state\x18\x12 \x01(\r"\xd6\x01\n\x0ePlayerBaseView\x12\x12\n\naccount_id\x18\x01 \x01(\r\x12\x11\n\tavatar_id\x18\x02 \x01(\r\x12\r\n\x05title\x18\x03 \x01(\r\x12\x10\n\x08nickname\x18\x04 \x01(\t\x12\x1f\n\x05level\x18\x05 \x01(\x0b2\x10.lq.AccountLevel\x12 \n\x06level3\x18\x06 \x01(\x0b2\x10.lq.AccountLevel\x12\x14\n\x0cavatar_frame\x18\x07 \x01(\r\x12\x10\n\x08verified\x18\x08 \x01(\r\x12\x11\n\tis_banned\x18\t \x01(\r"\x82\x02\n\x0ePlayerGameView\x12\x12\n\naccount_id\x18\x01 \x01(\r\x12\x11\n\tavatar_id\x18\x02 \x01(\r\x12\r\n\x05title\x18\x03 \x01(\r\x12\x10\n\x08nickname\x18\x04 \x01(\t\x12\x1f\n\x05level\x18\x05 \x01(\x0b2\x10.lq.AccountLevel\x12 \n\tcharacter\x18\x06 \x01(\x0b2\r.lq.Character\x12 \n\x06level3\x18\x07 \x01(\x0b2\x10.lq.AccountLevel\x12\x14\n\x0cavatar_frame\x18\x08 \x01(\r\x12\x10\n\x08verified\x18\t \x01(\r\x12\x1b\n\x05views\x18\n \x03(\x0b2\x0c.lq.ViewSlot"#\n\x0bGameSetting\x12\x14\n\x0cemoji_switch\x18\x01 \x01(\r"\xc4\x01\n\x08GameMode\x12\x0c\n\x04mode\x18\x01 \x01(\r\x12\n\n\x02ai\x18\x04 \x01(\x08\x12\x12\n\nextendinfo\x18\x05 \x01(\t\x12\'\n\x0bdetail_rule\x18\x06 \x01(\x0b2\x12.lq.GameDetailRule\x12:\n\x13testing_environment\x18\x07 \x01(\x0b2\x1d.lq.GameTestingEnvironmentSet\x12%\n\x0cgame_setting\x18\x08 \x01(\x0b2\x0f.lq.GameSetting"Y\n\x19GameTestingEnvironmentSet\x12\x0f\n\x07paixing\x18\x01 \x01(\r\x12\x12\n\nleft_count\x18\x02 \x01(\r\x12\x17\n\x0ffield_spell_var\x18\x03 \x01(\r"\xf5\x0c\n\x0eGameDetailRule\x12\x12\n\ntime_fixed\x18\x01 \x01(\r\x12\x10\n\x08time_add\x18\x02 \x01(\r\x12\x12\n\ndora_count\x18\x03 \x01(\r\x12\x0f\n\x07shiduan\x18\x04 \x01(\r\x12\x12\n\ninit_point\x18\x05 \x01(\r\x12\x0f\n\x07fandian\x18\x06 \x01(\r\x12\x11\n\tcan_jifei\x18\x07 \x01(\x08\x12\x16\n\x0etianbian_value\x18\x08 \x01(\r\x12\x16\n\x0eliqibang_value\x18\t \x01(\r\x12\x17\n\x0fchangbang_value\x18\n \x01(\r\x12\x15\n\rnoting_fafu_1\x18\x0b \x01(\r\x12\x15\n\rnoting_fafu_2\x18\x0c \x01(\r\x12\x15\n\rnoting_fafu_3\x18\r \x01(\r\x12\x19\n\x11have_liujumanguan\x18\x0e \x01(\x08\x12\x1c\n\x14have_qieshangmanguan\x18\x0f \x01(\x08\x12\x16\n\x0ehave_biao_dora\x18\x10 \x01(\x08\x12\x1b\n\x13have_gang_biao_dora\x18\x11 \x01(\x08\x12"\n\x1aming_dora_immediately_open\x18\x12 \x01(\x08\x12\x14\n\x0chave_li_dora\x18\x13 \x01(\x08\x12\x19\n\x11have_gang_li_dora\x18\x14 \x01(\x08\x12\x19\n\x11have_sifenglianda\x18\x15 \x01(\x08\x12\x18\n\x10have_sigangsanle\x18\x16 \x01(\x08\x12\x17\n\x0fhave_sijializhi\x18\x17 \x01(\x08\x12\x1b\n\x13have_jiuzhongjiupai\x18\x18 \x01(\x08\x12\x17\n\x0fhave_sanjiahele\x18\x19 \x01(\x08\x12\x14\n\x0chave_toutiao\x18\x1a \x01(\x08\x12\x1b\n\x13have_helelianzhuang\x18\x1b \x01(\x08\x12\x18\n\x10have_helezhongju\x18\x1c \x01(\x08\x12\x1e\n\x16have_tingpailianzhuang\x18\x1d \x01(\x08\x12\x1b\n\x13have_tingpaizhongju\x18\x1e \x01(\x08\x12\x11\n\thave_yifa\x18\x1f \x01(\x08\x12\x16\n\x0ehave_nanruxiru\x18  \x01(\x08\x12\x18\n\x10jingsuanyuandian\x18! \x01(\r\x12\x13\n\x0bshunweima_2\x18" \x01(\x05\x12\x13\n\x0bshunweima_3\x18# \x01(\x05\x12\x13\n\x0bshunweima_4\x18$ \x01(\x05\x12\x14\n\x0cbianjietishi\x18% \x01(\x08\x12\x10\n\x08ai_level\x18& \x01(\r\x12\x14\n\x0chave_zimosun\x18\' \x01(\x08\x12\x1d\n\x15disable_multi_yukaman\x18( \x01(\x08\x12\r\n\x05fanfu\x18) \x01(\r\x12\x11\n\tguyi_mode\x18* \x01(\r\x12\x12\n\ndora3_mode\x18+ \x01(\r\x12\x17\n\x0fbegin_open_mode\x18, \x01(\r\x12\x14\n\x0cjiuchao_mode\x18- \x01(\r\x12\x11\n\tmuyu_mode\x18. \x01(\r\x12\x11\n\topen_hand\x18/ \x01(\r\x12\x14\n\x0cxuezhandaodi\x180 \x01(\r\x12\x14\n\x0chuansanzhang\x181 \x01(\r\x12\x0f\n\x07chuanma\x182 \x01(\r\x12\x16\n\x0ereveal_discard\x183 \x01(\r\x12\x18\n\x10field_spell_mode\x184 \x01(\r\x12\x10\n\x08zhanxing\x185 \x01(\r\x12\x15\n\rtianming_mode\x186 \x01(\r\x12\x1a\n\x12disable_leijiyiman\x18< \x01(\x08\x12\x1e\n\x16disable_double_yakuman\x18> \x01(\r\x12!\n\x19disable_composite_yakuman\x18? \x01(\r\x12\x14\n\x0cenable_shiti\x18@ \x01(\r\x12\x1c\n\x14enable_nontsumo_liqi\x18A \x01(\r\x12#\n\x1bdisable_double_wind_four_fu\x18B \x01(\r\x12\x1d\n\x15disable_angang_guoshi\x18C \x01(\r\x12\x14\n\x0cenable_renhe\x18D \x01(\r\x12%\n\x1denable_baopai_extend_settings\x18E \x01(\r\x12\x16\n\x0eyongchang_mode\x18F \x01(\r\x12\x17\n\x0fhunzhiyiji_mode\x18G \x01(\r\x12\x1b\n\x13wanxiangxiuluo_mode\x18H \x01(\r\x12\x1b\n\x13beishuizhizhan_mode\x18I \x01(\r"\xc3\x02\n\x04Room\x12\x0f\n\x07room_id\x18\x01 \x01(\r\x12\x10\n\x08owner_id\x18\x02 \x01(\r\x12\x1a\n\x04mode\x18\x03 \x01(\x0b2\x0c.lq.GameMode\x12\x18\n\x10max_player_count\x18\x04 \x01(\r\x12#\n\x07persons\x18\x05 \x03(\x0b2\x12.lq.PlayerGameView\x12\x12\n\nready_list\x18\x06 \x03(\r\x12\x12\n\nis_playing\x18\x07 \x01(\x08\x12\x13\n\x0bpublic_live\x18\x08 \x01(\x08\x12\x13\n\x0brobot_count\x18\t \x01(\r\x12\x15\n\rtournament_id\x18\n \x01(\r\x12\x0b\n\x03seq\x18\x0b \x01(\r\x12\x10\n\x08pre_rule\x18\x0c \x01(\t\x12"\n\x06robots\x18\r \x03(\x0b2\x12.lq.PlayerGameView\x12\x11\n\tpositions\x18\x0e \x03(\r"\xc1\x01\n\rGameEndResult\x12-\n\x07players\x18\x01 \x03(\x0b2\x1c.lq.GameEndResult.PlayerItem\x1a\x80\x01\n\nPlayerItem\x12\x0c\n\x04seat\x18\x01 \x01(\r\x12\x13\n\x0btotal_point\x18\x02 \x01(\x05\x12\x14\n\x0cpart_point_1\x18\x03 \x01(\x05\x12\x14\n\x0cpart_point_2\x18\x04 \x01(\x05\x12\x15\n\rgrading_score\x18\x05 \x01(\x05\x12\x0c\n\x04gold\x18\x06 \x01(\x05"M\n\x0fGameConnectInfo\x12\x15\n\rconnect_token\x18\x02 \x01(\t\x12\x11\n\tgame_uuid\x18\x03 \x01(\t\x12\x10\n\x08location\x18\x04 \x01(\t"0\n\x0eItemGainRecord\x12\x0f\n\x07item_id\x18\x01 \x01(\r\x12\r\n\x05count\x18\x02 \x01(\r"d\n\x0fItemGainRecords\x12\x13\n\x0brecord_time\x18\x01 \x01(\r\x12\x17\n\x0flimit_source_id\x18\x02 \x01(\r\x12#\n\x07records\x18\x03 \x03(\x0b2\x12.lq.ItemGainRecord"g\n\x11FakeRandomRecords\x12\x0f\n\x07item_id\x18\x01 \x01(\r\x12\x17\n\x0fspecial_item_id\x18\x02 \x01(\r\x12\x12\n\ngain_count\x18\x03 \x01(\r\x12\x14\n\x0cgain_history\x18\x04 \x03(\r"&\n\x04Item\x12\x0f\n\x07item_id\x18\x01 \x01(\r\x12\r\n\x05stack\x18\x02 \x01(\r"N\n\x03Bag\x12\x17\n\x05items\x18\x01 \x03(\x0b2\x08.lq.Item\x12.\n\x11daily_gain_record\x18\x02 \x03(\x0b2\x13.lq.ItemGainRecords"b\n\tBagUpdate\x12\x1e\n\x0cupdate_items\x18\x01 \x03(\x0b2\x08.lq.Item\x125\n\x18update_daily_gain_record\x18\x02 \x03(\x0b2\x13.lq.ItemGainRecords"\'\n\nRewardSlot\x12\n\n\x02id\x18\x01 \x01(\r\x12\r\n\x05count\x18\x02 \x01(\r"M\n\nOpenResult\x12\x1e\n\x06reward\x18\x01 \x01(\x0b2\x0e.lq.RewardSlot\x12\x1f\n\x07replace\x18\x02 \x01(\x0b2\x0e.lq.RewardSlot"\x97\x01\n\x10RewardPlusResult\x12\n\n\x02id\x18\x01 \x01(\r\x12\r\n\x05count\x18\x02 \x01(\r\x12/\n\x08exchange\x18\x03 \x01(\x0b2\x1d.lq.RewardPlusResult.Exchange\x1a7\n\x08Exchange\x12\n\n\x02id\x18\x01 \x01(\r\x12\r\n\x05count\x18\x02 \x01(\r\x12\x10\n\x08exchange\x18\x03 \x01(\r"g\n\rExecuteReward\x12\x1e\n\x06reward\x18\x01 \x01(\x0b2\x0e.lq.RewardSlot\x12\x1f\n\x07replace\x18\x02 \x01(\x0b2\x0e.lq.RewardSlot\x12\x15\n\rreplace_count\x18\x03 \x01(\r"*\n\rExecuteResult\x12\n\n\x02id\x18\x01 \x01(\r\x12\r\n\x05count\x18\x02 \x01(\x05",\n\x0bI18nContext\x12\x0c\n\x04lang\x18\x01 \x01(\t\x12\x0f\n\x07context\x18\x02 \x01(\t"\xa5\x02\n\x04Mail\x12\x0f\n\x07mail_id\x18\x01 \x01(\r\x12\r\n\x05state\x18\x02 \x01(\r\x12\x17\n\x0ftake_attachment\x18\x03 \x01(\x08\x12\r\n\x05title\x18\x04 \x01(\t\x12\x0f\n\x07content\x18\x05 \x01(\t\x12#\n\x0battachments\x18\x06 \x03(\x0b2\x0e.lq.RewardSlot\x12\x13\n\x0bcreate_time\x18\x07 \x01(\r\x12\x13\n\x0bexpire_time\x18\x08 \x01(\r\x12\x14\n\x0creference_id\x18\t \x01(\r\x12#\n\ntitle_i18n\x18\n \x03(\x0b2\x0f.lq.I18nContext\x12%\n\x0ccontent_i18n\x18\x0b \x03(\x0b2\x0f.lq.I18nContext\x12\x13\n\x0btemplate_id\x18\x0c \x01(\r"m\n\x13AchievementProgress\x12\n\n\x02id\x18\x01 \x01(\r\x12\x0f\n\x07counter\x18\x02 \x01(\r\x12\x10\n\x08achieved\x18\x03 \x01(\x08\x12\x10\n\x08rewarded\x18\x04 \x01(\x08\x12\x15\n\rachieved_time\x18\x05 \x01(\r"d\n\x14BadgeAchieveProgress\x12\n\n\x02id\x18\x01 \x01(\r\x12\x0f\n\x07counter\x18\x02 \x01(\r\x12\x18\n\x10achieved_counter\x18\x03 \x01(\r\x12\x15\n\rachieved_time\x18\x04 \x01(\r"\x97\x04\n\x1aAccountStatisticByGameMode\x12\x0c\n\x04mode\x18\x01 \x01(\r\x12\x16\n\x0egame_count_sum\x18\x02 \x01(\r\x12\x1b\n\x13game_final_position\x18\x03 \x03(\r\x12\x11\n\tfly_count\x18\x04 \x01(\r\x12\x15\n\rgold_earn_sum\x18\x05 \x01(\x02\x12\x17\n\x0fround_count_sum\x18\x06 \x01(\r\x12\x12\n\ndadian_sum\x18\x07 \x01(\x02\x12>\n\tround_end\x18\x08 \x03(\x0b2+.lq.AccountStatisticByGameMode.RoundEndData\x12\x16\n\x0eming_count_sum\x18\t \x01(\r\x12\x16\n\x0eliqi_count_sum\x18\n \x01(\r\x12\x15\n\rxun_count_sum\x18\x0b \x01(\r\x12\x1a\n\x12highest_lianzhuang\x18\x0c \x01(\r\x12\x16\n\x0escore_earn_sum\x18\r \x01(\r\x12<\n\nrank_score\x18\x0e \x03(\x0b2(.lq.AccountStatisticByGameMode.RankScore\x1a)\n\x0cRoundEndData\x12\x0c\n\x04type\x18\x01 \x01(\r\x12\x0b\n\x03sum\x18\x02 \x01(\r\x1a;\n\tRankScore\x12\x0c\n\x04rank\x18\x01 \x01(\r\x12\x11\n\tscore_sum\x18\x02 \x01(\x05\x12\r\n\x05count\x18\x03 \x01(\r"4\n\x15AccountStatisticByFan\x12\x0e\n\x06fan_id\x18\x01 \x01(\r\x12\x0b\n\x03sum\x18\x02 \x01(\r"l\n\x12AccountFanAchieved\x12\x18\n\x10mahjong_category\x18\x01 \x01(\r\x12&\n\x03fan\x18\x02 \x03(\x0b2\x19.lq.AccountStatisticByFan\x12\x14\n\x0cliujumanguan\x18\x03 \x01(\r"\xb7\x01\n\x16AccountDetailStatistic\x121\n\tgame_mode\x18\x01 \x03(\x0b2\x1e.lq.AccountStatisticByGameMode\x12&\n\x03fan\x18\x02 \x03(\x0b2\x19.lq.AccountStatisticByFan\x12\x14\n\x0cliujumanguan\x18\x03 \x01(\r\x12,\n\x0cfan_achieved\x18\x04 \x03(\x0b2\x16.lq.AccountFanAchieved"j\n AccountDetailStatisticByCategory\x12\x10\n\x08category\x18\x01 \x01(\r\x124\n\x10detail_statistic\x18\x02 \x01(\x0b2\x1a.lq.AccountDetailStatistic"\xd1\n\n\x18AccountDetailStatisticV2\x129\n\x15friend_room_statistic\x18\x01 \x01(\x0b2\x1a.lq.AccountDetailStatistic\x12B\n\x0erank_statistic\x18\x02 \x01(\x0b2*.lq.AccountDetailStatisticV2.RankStatistic\x12]\n\x1ccustomized_contest_statistic\x18\x03 \x01(\x0b27.lq.AccountDetailStatisticV2.CustomizedContestStatistic\x12;\n\x17leisure_match_statistic\x18\x04 \x01(\x0b2\x1a.lq.AccountDetailStatistic\x12R\n\x19challenge_match_statistic\x18\x05 \x01(\x0b2/.lq.AccountDetailStatisticV2.ChallengeStatistic\x12<\n\x18activity_match_statistic\x18\x06 \x01(\x0b2\x1a.lq.AccountDetailStatistic\x126\n\x12ab_match_statistic\x18\x07 \x01(\x0b2\x1a.lq.AccountDetailStatistic\x1a\xbd\x03\n\rRankStatistic\x12L\n\x0ftotal_statistic\x18\x01 \x01(\x0b23.lq.AccountDetailStatisticV2.RankStatistic.RankData\x12L\n\x0fmonth_statistic\x18\x02 \x01(\x0b23.lq.AccountDetailStatisticV2.RankStatistic.RankData\x12\x1a\n\x12month_refresh_time\x18\x03 \x01(\r\x1a\xf3\x01\n\x08RankData\x127\n\x13all_level_statistic\x18\x01 \x01(\x0b2\x1a.lq.AccountDetailStatistic\x12Z\n\x0flevel_data_list\x18\x02 \x03(\x0b2A.lq.AccountDetailStatisticV2.RankStatistic.RankData.RankLevelData\x1aR\n\rRankLevelData\x12\x12\n\nrank_level\x18\x01 \x01(\r\x12-\n\tstatistic\x18\x02 \x01(\x0b2\x1a.lq.AccountDetailStatistic\x1a\xa2\x01\n\x1aCustomizedContestStatistic\x123\n\x0ftotal_statistic\x18\x01 \x01(\x0b2\x1a.lq.AccountDetailStatistic\x123\n\x0fmonth_statistic\x18\x02 \x01(\x0b2\x1a.lq.AccountDetailStatistic\x12\x1a\n\x12month_refresh_time\x18\x03 \x01(\r\x1a\xea\x01\n\x12ChallengeStatistic\x12.\n\nall_season\x18\x01 \x01(\x0b2\x1a.lq.AccountDetailStatistic\x12T\n\x10season_data_list\x18\x02 \x03(\x0b2:.lq.AccountDetailStatisticV2.ChallengeStatistic.SeasonData\x1aN\n\nSeasonData\x12\x11\n\tseason_id\x18\x01 \x01(\r\x12-\n\tstatistic\x18\x02 \x01(\x0b2\x1a.lq.AccountDetailStatistic"-\n\x0eAccountShiLian\x12\x0c\n\x04step\x18\x01 \x01(\r\x12\r\n\x05state\x18\x02 \x01(\r"\x98\x02\n\x10ClientDeviceInfo\x12\x10\n\x08platform\x18\x01 \x01(\t\x12\x10\n\x08hardware\x18\x02 \x01(\t\x12\n\n\x02os\x18\x03 \x01(\t\x12\x12\n\nos_version\x18\x04 \x01(\t\x12\x12\n\nis_browser\x18\x05 \x01(\x08\x12\x10\n\x08software\x18\x06 \x01(\t\x12\x15\n\rsale_platform\x18\x07 \x01(\t\x12\x17\n\x0fhardware_vendor\x18\x08 \x01(\t\x12\x14\n\x0cmodel_number\x18\t \x01(\t\x12\x14\n\x0cscreen_width\x18\n \x01(\r\x12\x15\n\rscreen_height\x18\x0b \x01(\r\x12\x12\n\nuser_agent\x18\x0c \x01(\t\x12\x13\n\x0bscreen_type\x18\r \x01(\r"6\n\x11ClientVersionInfo\x12\x10\n\x08resource\x18\x01 \x01(\t\x12\x0f\n\x07package\x18\x02 \x01(\t"P\n\x0cAnnouncement\x12\n\n\x02id\x18\x01 \x01(\r\x12\r\n\x05title\x18\x02 \x01(\t\x12\x0f\n\x07content\x18\x03 \x01(\t\x12\x14\n\x0cheader_image\x18\x04 \x01(\t"v\n\x0cTaskProgress\x12\n\n\x02id\x18\x01 \x01(\r\x12\x0f\n\x07counter\x18\x02 \x01(\r\x12\x10\n\x08achieved\x18\x03 \x01(\x08\x12\x10\n\x08rewarded\x18\x04 \x01(\x08\x12\x0e\n\x06failed\x18\x05 \x01(\x08\x12\x15\n\rrewarded_time\x18\x06 \x01(\r"Z\n\nGameConfig\x12\x10\n\x08category\x18\x01 \x01(\r\x12\x1a\n\x04mode\x18\x02 \x01(\x0b2\x0c.lq.GameMode\x12\x1e\n\x04meta\x18\x03 \x01(\x0b2\x10.lq.GameMetaData"P\n\x08RPGState\x12\x16\n\x0eplayer_damaged\x18\x01 \x01(\r\x12\x17\n\x0fmonster_damaged\x18\x02 \x01(\r\x12\x13\n\x0bmonster_seq\x18\x03 \x01(\r"\xd0\x01\n\x0bRPGActivity\x12\x13\n\x0bactivity_id\x18\x01 \x01(\r\x12\x16\n\x0elast_show_uuid\x18\x05 \x01(\t\x12\x18\n\x10last_played_uuid\x18\x06 \x01(\t\x12#\n\rcurrent_state\x18\x07 \x01(\x0b2\x0c.lq.RPGState\x12%\n\x0flast_show_state\x18\x08 \x01(\x0b2\x0c.lq.RPGState\x12\x18\n\x10received_rewards\x18\t \x03(\r\x12\x14\n\x0clast_show_id\x18\n \x01(\r"\xc8\x01\n\x11ActivityArenaData\x12\x11\n\twin_count\x18\x01 \x01(\r\x12\x12\n\nlose_count\x18\x02 \x01(\r\x12\x13\n\x0bactivity_id\x18\x03 \x01(\r\x12\x12\n\nenter_time\x18\x04 \x01(\r\x12\x19\n\x11daily_enter_count\x18\x05 \x01(\r\x12\x18\n\x10daily_enter_time\x18\x06 \x01(\r\x12\x15\n\rmax_win_count\x18\x07 \x01(\r\x12\x17\n\x0ftotal_win_count\x18\x08 \x01(\r"\xaa\x03\n\x10FeedActivityData\x12\x13\n\x0bactivity_id\x18\x01 \x01(\r\x12\x12\n\nfeed_count\x18\x02 \x01(\r\x12C\n\x13friend_receive_data\x18\x03 \x01(\x0b2&.lq.FeedActivityData.CountWithTimeData\x12@\n\x10friend_send_data\x18\x04 \x01(\x0b2&.lq.FeedActivityData.CountWithTimeData\x124\n\ngift_inbox\x18\x05 \x03(\x0b2 .lq.FeedActivityData.GiftBoxData\x1a<\n\x11CountWithTimeData\x12\r\n\x05count\x18\x01 \x01(\r\x12\x18\n\x10last_update_time\x18\x02 \x01(\r\x1ar\n\x0bGiftBoxData\x12\n\n\x02id\x18\x01 \x01(\r\x12\x0f\n\x07item_id\x18\x02 \x01(\r\x12\r\n\x05count\x18\x03 \x01(\r\x12\x17\n\x0ffrom_account_id\x18\x04 \x01(\r\x12\x0c\n\x04time\x18\x05 \x01(\r\x12\x10\n\x08received\x18\x06 \x01(\r"\x94\x01\n\x13SegmentTaskProgress\x12\n\n\x02id\x18\x01 \x01(\r\x12\x0f\n\x07counter\x18\x02 \x01(\r\x12\x10\n\x08achieved\x18\x03 \x01(\x08\x12\x10\n\x08rewarded\x18\x04 \x01(\x08\x12\x0e\n\x06failed\x18\x05 \x01(\x08\x12\x14\n\x0creward_count\x18\x06 \x01(\r\x12\x16\n\x0eachieved_count\x18\x07 \x01(\r"Y\n\x10MineActivityData\x12\x1c\n\tdig_point\x18\x01 \x03(\x0b2\t.lq.Point\x12\x1b\n\x03map\x18\x02 \x03(\x0b2\x0e.lq.MineReward\x12\n\n\x02id\x18\x03 \x01(\r"\xd1\x05\n\x15AccountActivityUpdate\x12\'\n\tmine_data\x18\x01 \x03(\x0b2\x14.lq.MineActivityData\x12!\n\x08rpg_data\x18\x02 \x03(\x0b2\x0f.lq.RPGActivity\x12\'\n\tfeed_data\x18\x03 \x03(\x0b2\x14.lq.ActivityFeedData\x12\'\n\tspot_data\x18\x04 \x03(\x0b2\x14.lq.ActivitySpotData\x124\n\x10friend_gift_data\x18\x05 \x03(\x0b2\x1a.lq.ActivityFriendGiftData\x12-\n\x0cupgrade_data\x18\x06 \x03(\x0b2\x17.lq.ActivityUpgradeData\x12/\n\ngacha_data\x18\x07 \x03(\x0b2\x1b.lq.ActivityGachaUpdateData\x123\n\x0fsimulation_data\x18\x08 \x03(\x0b2\x1a.lq.ActivitySimulationData\x123\n\x0ecombining_data\x18\t \x03(\x0b2\x1b.lq.ActivityCombiningLQData\x12-\n\x0cvillage_data\x18\n \x03(\x0b2\x17.lq.ActivityVillageData\x12/\n\rfestival_data\x18\x0b \x03(\x0b2\x18.lq.ActivityFestivalData\x12+\n\x0bisland_data\x18\x0c \x03(\x0b2\x16.lq.ActivityIslandData\x12)\n\nstory_data\x18\x0e \x03(\x0b2\x15.lq.ActivityStoryData\x120\n\x0echoose_up_data\x18\x0f \x03(\x0b2\x18.lq.ActivityChooseUpData\x120\n\x12simulation_v2_data\x18\x10 \x03(\x0b2\x14.lq.SimulationV2Data";\n\x1aActivityCombiningWorkbench\x12\x10\n\x08craft_id\x18\x01 \x01(\r\x12\x0b\n\x03pos\x18\x02 \x01(\r"\xde\x01\n\x19ActivityCombiningMenuData\x12\x12\n\nmenu_group\x18\x01 \x01(\r\x12<\n\tgenerated\x18\x02 \x03(\x0b2).lq.ActivityCombiningMenuData.MenuRequire\x12B\n\x0fmulti_generated\x18\x03 \x03(\x0b2).lq.ActivityCombiningMenuData.MenuRequire\x1a+\n\x0bMenuRequire\x12\r\n\x05level\x18\x01 \x01(\r\x12\r\n\x05count\x18\x02 \x01(\r"\x87\x01\n\x1aActivityCombiningOrderData\x12\n\n\x02id\x18\x01 \x01(\r\x12\x0b\n\x03pos\x18\x02 \x01(\r\x12\x12\n\nunlock_day\x18\x04 \x01(\r\x12\x0f\n\x07char_id\x18\x05 \x01(\r\x12\x19\n\x11finished_craft_id\x18\x06 \x03(\r\x12\x10\n\x08craft_id\x18\x07 \x03(\r"\xf9\x01\n\x17ActivityCombiningLQData\x12\x13\n\x0bactivity_id\x18\x01 \x01(\r\x121\n\tworkbench\x18\x02 \x03(\x0b2\x1e.lq.ActivityCombiningWorkbench\x12.\n\x06orders\x18\x03 \x03(\x0b2\x1e.lq.ActivityCombiningOrderData\x123\n\x0brecycle_bin\x18\x04 \x01(\x0b2\x1e.lq.ActivityCombiningWorkbench\x12\x16\n\x0eunlocked_craft\x18\x05 \x03(\r\x12\x19\n\x11daily_bonus_count\x18\x06 \x01(\r"9\n\x19ActivityCombiningPoolData\x12\r\n\x05group\x18\x01 \x01(\r\x12\r\n\x05count\x18\x02 \x01(\r"\xee\x03\n\x15ActivityCombiningData\x12\x13\n\x0bactivity_id\x18\x01 \x01(\r\x121\n\tworkbench\x18\x02 \x03(\x0b2\x1e.lq.ActivityCombiningWorkbench\x12.\n\x06orders\x18\x03 \x03(\x0b2\x1e.lq.ActivityCombiningOrderData\x123\n\x0brecycle_bin\x18\x04 \x01(\x0b2\x1e.lq.ActivityCombiningWorkbench\x12+\n\x04menu\x18\x05 \x01(\x0b2\x1d.lq.ActivityCombiningMenuData\x12\x18\n\x10current_order_id\x18\x06 \x01(\r\x122\n\x05bonus\x18\x07 \x01(\x0b2#.lq.ActivityCombiningData.BonusData\x12\x16\n\x0eunlocked_craft\x18\x08 \x03(\r\x121\n\ncraft_pool\x18\t \x03(\x0b2\x1d.lq.ActivityCombiningPoolData\x121\n\norder_pool\x18\n \x03(\x0b2\x1d.lq.ActivityCombiningPoolData\x1a/\n\tBonusData\x12\r\n\x05count\x18\x01 \x01(\r\x12\x13\n\x0bupdate_time\x18\x02 \x01(\r"*\n\rVillageReward\x12\n\n\x02id\x18\x01 \x01(\r\x12\r\n\x05count\x18\x02 \x01(\r"U\n\x13VillageBuildingData\x12\n\n\x02id\x18\x01 \x01(\r\x12!\n\x06reward\x18\x03 \x03(\x0b2\x11.lq.VillageReward\x12\x0f\n\x07workers\x18\x04 \x03(\r"\x8e\x01\n\x0fVillageTripData\x12\x13\n\x0bstart_round\x18\x01 \x01(\r\x12\x0f\n\x07dest_id\x18\x02 \x01(\r\x12!\n\x06reward\x18\x03 \x03(\x0b2\x11.lq.VillageReward\x12\r\n\x05level\x18\x04 \x01(\r\x12#\n\x04info\x18\x05 \x01(\x0b2\x15.lq.VillageTargetInfo"6\n\x0fVillageTaskData\x12\n\n\x02id\x18\x01 \x01(\r\x12\x17\n\x0fcompleted_count\x18\x02 \x01(\r"l\n\x11VillageTargetInfo\x12\x10\n\x08nickname\x18\x01 \x01(\t\x12\x0e\n\x06avatar\x18\x02 \x01(\r\x12\x14\n\x0cavatar_frame\x18\x03 \x01(\r\x12\r\n\x05title\x18\x04 \x01(\r\x12\x10\n\x08verified\x18\x05 \x01(\r"\xac\x01\n\x13ActivityVillageData\x12\x13\n\x0bactivity_id\x18\x01 \x01(\r\x12*\n\tbuildings\x18\x02 \x03(\x0b2\x17.lq.VillageBuildingData\x12!\n\x04trip\x18\x03 \x03(\x0b2\x13.lq.VillageTripData\x12"\n\x05tasks\x18\x06 \x03(\x0b2\x13.lq.VillageTaskData\x12\r\n\x05round\x18\x07 \x01(\r"5\n\x0fTimeCounterData\x12\r\n\x05count\x18\x01 \x01(\r\x12\x13\n\x0bupdate_time\x18\x02 \x01(\r";\n\x15SignedTimeCounterData\x12\r\n\x05count\x18\x01 \x01(\x05\x12\x13\n\x0bupdate_time\x18\x02 \x01(\r"D\n\x14FestivalProposalData\x12\n\n\x02id\x18\x01 \x01(\r\x12\x13\n\x0bproposal_id\x18\x02 \x01(\r\x12\x0b\n\x03pos\x18\x03 \x01(\r"\xae\x01\n\x14ActivityFestivalData\x12\x13\n\x0bactivity_id\x18\x01 \x01(\r\x12\r\n\x05level\x18\x02 \x01(\r\x12/\n\rproposal_list\x18\x03 \x03(\x0b2\x18.lq.FestivalProposalData\x12\x12\n\nevent_list\x18\x04 \x03(\r\x12-\n\nbuy_record\x18\x05 \x01(\x0b2\x19.lq.SignedTimeCounterData"\xbe\x01\n\x10SimulationV2Data\x12\x13\n\x0bactivity_id\x18\x01 \x01(\r\x12*\n\x06season\x18\x02 \x01(\x0b2\x1a.lq.SimulationV2SeasonData\x12\x15\n\rhighest_score\x18\x03 \x01(\x05\x12(\n\x07upgrade\x18\x04 \x01(\x0b2\x17.lq.SimulationV2Ability\x12\x12\n\nevent_pool\x18\x05 \x03(\r\x12\x14\n\x0cseason_count\x18\x06 \x01(\r"]\n\x11IslandBagItemData\x12\n\n\x02id\x18\x01 \x01(\r\x12\x0b\n\x03pos\x18\x02 \x03(\r\x12\x0e\n\x06rotate\x18\x03 \x01(\r\x12\x10\n\x08goods_id\x18\x04 \x01(\r\x12\r\n\x05price\x18\x05 \x01(\r"Q\n\rIslandBagData\x12\n\n\x02id\x18\x01 \x01(\r\x12\x0e\n\x06matrix\x18\x02 \x01(\t\x12$\n\x05items\x18\x03 \x03(\x0b2\x15.lq.IslandBagItemData"G\n\x0fIslandGoodsData\x12\x10\n\x08goods_id\x18\x01 \x01(\r\x12\r\n\x05count\x18\x02 \x01(\x05\x12\x13\n\x0bupdate_time\x18\x03 \x01(\r"z\n\x0eIslandZoneData\x12\n\n\x02id\x18\x01 \x01(\r\x120\n\rcurrency_used\x18\x02 \x01(\x0b2\x19.lq.SignedTimeCounterData\x12*\n\rgoods_records\x18\x03 \x03(\x0b2\x13.lq.IslandGoodsData"{\n\x12ActivityIslandData\x12\x13\n\x0bactivity_id\x18\x01 \x01(\r\x12\x0c\n\x04zone\x18\x02 \x01(\r\x12\x1f\n\x04bags\x18\x03 \x03(\x0b2\x11.lq.IslandBagData\x12!\n\x05zones\x18\x04 \x03(\x0b2\x12.lq.IslandZoneData":\n\x10AmuletEffectData\x12\n\n\x02id\x18\x01 \x01(\r\x12\x0b\n\x03uid\x18\x02 \x01(\r\x12\r\n\x05store\x18\x03 \x03(\x03"+\n\x0eAmuletBuffData\x12\n\n\x02id\x18\x01 \x01(\r\x12\r\n\x05store\x18\x03 \x03(\x03"P\n\x13AmuletGameShopGoods\x12\n\n\x02id\x18\x01 \x01(\r\x12\x0c\n\x04sold\x18\x02 \x01(\x08\x12\x10\n\x08goods_id\x18\x03 \x01(\r\x12\r\n\x05price\x18\x04 \x01(\r"F\n\x16AmuletActivityTingInfo\x12\x0c\n\x04tile\x18\x01 \x01(\t\x12\x0b\n\x03fan\x18\x02 \x01(\x04\x12\x11\n\tting_tile\x18\x03 \x01(\t"4\n\x19AmuletShowDesktopTileData\x12\n\n\x02id\x18\x01 \x01(\r\x12\x0b\n\x03pos\x18\x02 \x01(\r"\x83\x01\n\x13AmuletGameOperation\x12\x0c\n\x04type\x18\x01 \x01(\r\x12/\n\x04gang\x18\x02 \x03(\x0b2!.lq.AmuletGameOperation.GangTiles\x12\x11\n\teffect_id\x18\x03 \x01(\r\x1a\x1a\n\tGangTiles\x12\r\n\x05tiles\x18\x01 \x03(\r"\x9b\x01\n\x12AmuletGameShopData\x12&\n\x05goods\x18\x01 \x03(\x0b2\x17.lq.AmuletGameShopGoods\x12\x13\n\x0beffect_list\x18\x02 \x03(\r\x12\x1a\n\x12shop_refresh_count\x18\x03 \x01(\r\x12\x15\n\rrefresh_price\x18\x04 \x01(\r\x12\x15\n\rnext_goods_id\x18\x05 \x01(\r"\xa7\x05\n\x14AmuletGameUpdateData\x12$\n\x0ctile_replace\x18\x01 \x03(\x0b2\x0e.lq.AmuletTile\x12\x11\n\ttian_dora\x18\x02 \x03(\t\x12\x0c\n\x04dora\x18\x04 \x03(\r\x12\r\n\x05hands\x18\x07 \x03(\r\x12 \n\x04ming\x18\x08 \x03(\x0b2\x12.lq.AmuletMingInfo\x12)\n\x0beffect_list\x18\t \x03(\x0b2\x14.lq.AmuletEffectData\x12\'\n\tbuff_list\x18\n \x03(\x0b2\x14.lq.AmuletEffectData\x12\r\n\x05point\x18\r \x01(\t\x12\x0c\n\x04coin\x18\x0e \x01(\r\x12\r\n\x05stage\x18\x16 \x01(\r\x12\x16\n\x0edesktop_remain\x18\x1a \x01(\r\x129\n\x12show_desktop_tiles\x18\x1c \x03(\x0b2\x1d.lq.AmuletShowDesktopTileData\x12-\n\tting_list\x18\x1e \x03(\x0b2\x1a.lq.AmuletActivityTingInfo\x12/\n\x0enext_operation\x18\x1f \x03(\x0b2\x17.lq.AmuletGameOperation\x12\x14\n\x0cused_desktop\x18" \x03(\r\x12.\n\nhighest_hu\x18# \x01(\x0b2\x1a.lq.ActivityAmuletHuRecord\x12)\n\x07records\x18$ \x01(\x0b2\x18.lq.ActivityAmuletRecord\x12\x13\n\x0breward_pack\x18% \x03(\r\x12\x15\n\rreward_effect\x18& \x03(\r\x12/\n\ntile_score\x18+ \x03(\x0b2\x1b.lq.AmuletGameTileScoreData\x12\x16\n\x0ereward_pack_id\x18/ \x01(\r"`\n\x14AmuletGameRecordData\x12\x0b\n\x03key\x18\x01 \x01(\r\x12\x11\n\tint_value\x18\x02 \x01(\x05\x12\x11\n\tstr_value\x18\x03 \x01(\t\x12\x15\n\rint_arr_value\x18\x04 \x03(\x05"6\n\x17AmuletGameTileScoreData\x12\x0c\n\x04tile\x18\x01 \x01(\t\x12\r\n\x05score\x18\x02 \x01(\t"\xb2\t\n\x0eAmuletGameData\x12\x1c\n\x04pool\x18\x01 \x03(\x0b2\x0e.lq.AmuletTile\x12$\n\x0ctile_replace\x18\x02 \x03(\x0b2\x0e.lq.AmuletTile\x12\x11\n\ttian_dora\x18\x03 \x03(\t\x12\x10\n\x08mountain\x18\x04 \x03(\r\x12\x0c\n\x04dora\x18\x05 \x03(\r\x12\r\n\x05hands\x18\x07 \x03(\r\x12 \n\x04ming\x18\x08 \x03(\x0b2\x12.lq.AmuletMingInfo\x12)\n\x0beffect_list\x18\t \x03(\x0b2\x14.lq.AmuletEffectData\x12%\n\tbuff_list\x18\n \x03(\x0b2\x12.lq.AmuletBuffData\x12\r\n\x05level\x18\x0b \x01(\r\x12\r\n\x05point\x18\r \x01(\t\x12\x0c\n\x04coin\x18\x0e \x01(\r\x12$\n\x04shop\x18\x10 \x01(\x0b2\x16.lq.AmuletGameShopData\x12\x0c\n\x04used\x18\x14 \x03(\r\x12\x11\n\tboss_buff\x18\x15 \x03(\r\x12\r\n\x05stage\x18\x16 \x01(\r\x12\x0f\n\x07desktop\x18\x18 \x03(\r\x12\x14\n\x0cshow_desktop\x18\x19 \x03(\r\x12\x16\n\x0edesktop_remain\x18\x1a \x01(\r\x12\x18\n\x10free_effect_list\x18\x1b \x03(\r\x129\n\x12show_desktop_tiles\x18\x1c \x03(\x0b2\x1d.lq.AmuletShowDesktopTileData\x12\x19\n\x11change_tile_count\x18\x1d \x01(\r\x12-\n\tting_list\x18\x1e \x03(\x0b2\x1a.lq.AmuletActivityTingInfo\x12/\n\x0enext_operation\x18\x1f \x03(\x0b2\x17.lq.AmuletGameOperation\x12*\n\x0eshop_buff_list\x18  \x03(\x0b2\x12.lq.AmuletBuffData\x12 \n\x18remain_change_tile_count\x18! \x01(\x05\x12\x14\n\x0cused_desktop\x18" \x03(\r\x12\x12\n\nafter_gang\x18# \x01(\r\x12-\n\x0brecord_data\x18$ \x03(\x0b2\x18.lq.AmuletGameRecordData\x12+\n\x0fskill_buff_list\x18% \x03(\x0b2\x12.lq.AmuletBuffData\x12\x18\n\x10max_effect_count\x18& \x01(\r\x12.\n\nhighest_hu\x18\' \x01(\x0b2\x1a.lq.ActivityAmuletHuRecord\x12\x1b\n\x13total_consumed_coin\x18( \x01(\r\x12\x14\n\x0cboss_buff_id\x18) \x03(\r\x12\x13\n\x0blocked_tile\x18* \x03(\r\x12/\n\ntile_score\x18+ \x03(\x0b2\x1b.lq.AmuletGameTileScoreData\x12\x19\n\x11locked_tile_count\x18, \x01(\r\x12\x13\n\x0breward_pack\x18- \x03(\r\x12\x15\n\rreward_effect\x18. \x03(\r\x12\x16\n\x0ereward_pack_id\x18/ \x01(\r\x12\x1f\n\x17total_change_tile_count\x180 \x01(\r"r\n\x18ActivityAmuletUpdateData\x12\x13\n\x0bactivity_id\x18\x01 \x01(\r\x12-\n\x0bgame_update\x18\x02 \x01(\x0b2\x18.lq.AmuletGameUpdateData\x12\x12\n\ngame_empty\x18\x03 \x01(\x08",\n\x0fAmuletSkillData\x12\n\n\x02id\x18\x01 \x01(\r\x12\r\n\x05level\x18\x02 \x01(\r"?\n\x19ActivityAmuletUpgradeData\x12"\n\x05skill\x18\x02 \x03(\x0b2\x13.lq.AmuletSkillData"C\n\x14ActivityAmuletRecord\x12\x19\n\x11effect_gain_count\x18\x01 \x01(\r\x12\x10\n\x08hu_count\x18\x02 \x01(\r"O\n\x16ActivityAmuletHuRecord\x12\r\n\x05point\x18\x01 \x01(\t\x12\x0b\n\x03pai\x18\x02 \x01(\t\x12\x0b\n\x03fan\x18\x03 \x01(\t\x12\x0c\n\x04base\x18\x04 \x01(\t"\x85\x01\n!ActivityAmuletIllustratedBookData\x12\x19\n\x11effect_collection\x18\x01 \x03(\r\x12.\n\nhighest_hu\x18\x02 \x01(\x0b2\x1a.lq.ActivityAmuletHuRecord\x12\x15\n\rhighest_level\x18\x03 \x01(\r"<\n\x16ActivityAmuletTaskData\x12"\n\x08progress\x18\x01 \x03(\x0b2\x10.lq.TaskProgress"\xf7\x01\n\x12ActivityAmuletData\x12\x13\n\x0bactivity_id\x18\x01 \x01(\r\x12 \n\x04game\x18\x02 \x01(\x0b2\x12.lq.AmuletGameData\x12\x0f\n\x07version\x18\x03 \x01(\r\x12.\n\x07upgrade\x18\x04 \x01(\x0b2\x1d.lq.ActivityAmuletUpgradeData\x12?\n\x10illustrated_book\x18\x05 \x01(\x0b2%.lq.ActivityAmuletIllustratedBookData\x12(\n\x04task\x18\x06 \x01(\x0b2\x1a.lq.ActivityAmuletTaskData"\xc0\x03\n\x10ActivityFeedData\x12\x13\n\x0bactivity_id\x18\x01 \x01(\r\x12\x12\n\nfeed_count\x18\x02 \x01(\r\x12C\n\x13friend_receive_data\x18\x03 \x01(\x0b2&.lq.ActivityFeedData.CountWithTimeData\x12@\n\x10friend_send_data\x18\x04 \x01(\x0b2&.lq.ActivityFeedData.CountWithTimeData\x124\n\ngift_inbox\x18\x05 \x03(\x0b2 .lq.ActivityFeedData.GiftBoxData\x12\x14\n\x0cmax_inbox_id\x18\x06 \x01(\r\x1a<\n\x11CountWithTimeData\x12\r\n\x05count\x18\x01 \x01(\r\x12\x18\n\x10last_update_time\x18\x02 \x01(\r\x1ar\n\x0bGiftBoxData\x12\n\n\x02id\x18\x01 \x01(\r\x12\x0f\n\x07item_id\x18\x02 \x01(\r\x12\r\n\x05count\x18\x03 \x01(\r\x12\x17\n\x0ffrom_account_id\x18\x04 \x01(\r\x12\x0c\n\x04time\x18\x05 \x01(\r\x12\x10\n\x08received\x18\x06 \x01(\r"\x8d\x01\n\x11UnlockedStoryData\x12\x10\n\x08story_id\x18\x01 \x01(\r\x12\x17\n\x0ffinished_ending\x18\x02 \x03(\r\x12\x17\n\x0frewarded_ending\x18\x03 \x03(\r\x12\x17\n\x0ffinish_rewarded\x18\x04 \x01(\r\x12\x1b\n\x13all_finish_rewarded\x18\x05 \x01(\r"W\n\x11ActivityStoryData\x12\x13\n\x0bactivity_id\x18\x01 \x01(\r\x12-\n\x0eunlocked_story\x18\x02 \x03(\x0b2\x15.lq.UnlockedStoryData"`\n\x14ActivityChooseUpData\x12\x13\n\x0bactivity_id\x18\x01 \x01(\r\x12\x10\n\x08chest_id\x18\x02 \x01(\r\x12\x11\n\tselection\x18\x03 \x01(\r\x12\x0e\n\x06is_end\x18\x04 \x01(\r"\xce\x03\n\x16ActivityFriendGiftData\x12\x13\n\x0bactivity_id\x18\x01 \x01(\r\x12\x14\n\x0cmax_inbox_id\x18\x02 \x01(\r\x12B\n\x0creceive_data\x18\x03 \x01(\x0b2,.lq.ActivityFriendGiftData.CountWithTimeData\x12?\n\tsend_data\x18\x04 \x01(\x0b2,.lq.ActivityFriendGiftData.CountWithTimeData\x12:\n\ngift_inbox\x18\x05 \x03(\x0b2&.lq.ActivityFriendGiftData.GiftBoxData\x1aT\n\x11CountWithTimeData\x12\r\n\x05count\x18\x01 \x01(\r\x12\x18\n\x10last_update_time\x18\x02 \x01(\r\x12\x16\n\x0esend_friend_id\x18\x03 \x03(\r\x1ar\n\x0bGiftBoxData\x12\n\n\x02id\x18\x01 \x01(\r\x12\x0f\n\x07item_id\x18\x02 \x01(\r\x12\r\n\x05count\x18\x03 \x01(\r\x12\x17\n\x0ffrom_account_id\x18\x04 \x01(\r\x12\x0c\n\x04time\x18\x05 \x01(\r\x12\x10\n\x08received\x18\x06 \x01(\r"\xa5\x01\n\x13ActivityUpgradeData\x12\x13\n\x0bactivity_id\x18\x01 \x01(\r\x122\n\x06groups\x18\x02 \x03(\x0b2".lq.ActivityUpgradeData.LevelGroup\x12\x16\n\x0ereceived_level\x18\x03 \x01(\r\x1a-\n\nLevelGroup\x12\x10\n\x08group_id\x18\x01 \x01(\r\x12\r\n\x05level\x18\x02 \x01(\r"(\n\x0bGachaRecord\x12\n\n\x02id\x18\x01 \x01(\r\x12\r\n\x05count\x18\x02 \x01(\r"I\n\x11ActivityGachaData\x12\x13\n\x0bactivity_id\x18\x01 \x01(\r\x12\x1f\n\x06gained\x18\x02 \x03(\x0b2\x0f.lq.GachaRecord"e\n\x17ActivityGachaUpdateData\x12\x13\n\x0bactivity_id\x18\x01 \x01(\r\x12\x1f\n\x06gained\x18\x02 \x03(\x0b2\x0f.lq.GachaRecord\x12\x14\n\x0cremain_count\x18\x03 \x01(\r"N\n#ActivitySimulationGameRecordMessage\x12\x0c\n\x04type\x18\x01 \x01(\r\x12\x0c\n\x04args\x18\x02 \x03(\r\x12\x0b\n\x03xun\x18\x03 \x01(\r"\xa9\x01\n\x1cActivitySimulationGameRecord\x12\r\n\x05round\x18\x01 \x01(\r\x12\r\n\x05seats\x18\x02 \x03(\r\x12\x0c\n\x04uuid\x18\x03 \x01(\t\x12\x12\n\nstart_time\x18\x04 \x01(\r\x12\x0e\n\x06scores\x18\x05 \x03(\x05\x129\n\x08messages\x18\x06 \x03(\x0b2\'.lq.ActivitySimulationGameRecordMessage"\x83\x01\n\x1eActivitySimulationDailyContest\x12\x0b\n\x03day\x18\x01 \x01(\r\x12\x12\n\ncharacters\x18\x02 \x03(\r\x121\n\x07records\x18\x03 \x03(\x0b2 .lq.ActivitySimulationGameRecord\x12\r\n\x05round\x18\x04 \x01(\r"f\n\x1dActivitySimulationTrainRecord\x12\x0c\n\x04time\x18\x01 \x01(\r\x12\x14\n\x0cmodify_stats\x18\x02 \x03(\x05\x12\x13\n\x0bfinal_stats\x18\x03 \x03(\r\x12\x0c\n\x04type\x18\x04 \x01(\r"\xce\x01\n\x16ActivitySimulationData\x12\x13\n\x0bactivity_id\x18\x01 \x01(\r\x12\r\n\x05stats\x18\x02 \x03(\r\x12\x1b\n\x13stamina_update_time\x18\x03 \x01(\r\x129\n\rdaily_contest\x18\x04 \x03(\x0b2".lq.ActivitySimulationDailyContest\x128\n\rtrain_records\x18\x05 \x03(\x0b2!.lq.ActivitySimulationTrainRecord"\xb1\x01\n\x10ActivitySpotData\x12\x13\n\x0bactivity_id\x18\x01 \x01(\r\x12,\n\x05spots\x18\x03 \x03(\x0b2\x1d.lq.ActivitySpotData.SpotData\x1aZ\n\x08SpotData\x12\x11\n\tunique_id\x18\x01 \x01(\r\x12\x10\n\x08rewarded\x18\x02 \x01(\r\x12\x17\n\x0funlocked_ending\x18\x03 \x03(\r\x12\x10\n\x08unlocked\x18\x04 \x01(\r"\x8d\x01\n\x12AccountActiveState\x12\x12\n\naccount_id\x18\x01 \x01(\r\x12\x12\n\nlogin_time\x18\x02 \x01(\r\x12\x13\n\x0blogout_time\x18\x03 \x01(\r\x12\x11\n\tis_online\x18\x04 \x01(\x08\x12\'\n\x07playing\x18\x05 \x01(\x0b2\x16.lq.AccountPlayingGame"a\n\x06Friend\x12 \n\x04base\x18\x01 \x01(\x0b2\x12.lq.PlayerBaseView\x12%\n\x05state\x18\x02 \x01(\x0b2\x16.lq.AccountActiveState\x12\x0e\n\x06remark\x18\x03 \x01(\t"\x1d\n\x05Point\x12\t\n\x01x\x18\x01 \x01(\r\x12\t\n\x01y\x18\x02 \x01(\r"K\n\nMineReward\x12\x18\n\x05point\x18\x01 \x01(\x0b2\t.lq.Point\x12\x11\n\treward_id\x18\x02 \x01(\r\x12\x10\n\x08received\x18\x03 \x01(\x08"O\n\x0cGameLiveUnit\x12\x11\n\ttimestamp\x18\x01 \x01(\r\x12\x17\n\x0faction_category\x18\x02 \x01(\r\x12\x13\n\x0baction_data\x18\x03 \x01(\x0c"4\n\x0fGameLiveSegment\x12!\n\x07actions\x18\x01 \x03(\x0b2\x10.lq.GameLiveUnit"=\n\x12GameLiveSegmentUri\x12\x12\n\nsegment_id\x18\x01 \x01(\r\x12\x13\n\x0bsegment_uri\x18\x02 \x01(\t"\x8d\x01\n\x0cGameLiveHead\x12\x0c\n\x04uuid\x18\x01 \x01(\t\x12\x12\n\nstart_time\x18\x02 \x01(\r\x12#\n\x0bgame_config\x18\x03 \x01(\x0b2\x0e.lq.GameConfig\x12#\n\x07players\x18\x04 \x03(\x0b2\x12.lq.PlayerGameView\x12\x11\n\tseat_list\x18\x05 \x03(\r"(\n\x11GameNewRoundState\x12\x13\n\x0bseat_states\x18\x01 \x03(\r"\x1e\n\rGameEndAction\x12\r\n\x05state\x18\x01 \x01(\r"\x10\n\x0eGameNoopAction"\x7f\n\x0bCommentItem\x12\x12\n\ncomment_id\x18\x01 \x01(\r\x12\x11\n\ttimestamp\x18\x02 \x01(\r\x12%\n\tcommenter\x18\x03 \x01(\x0b2\x12.lq.PlayerBaseView\x12\x0f\n\x07content\x18\x04 \x01(\t\x12\x11\n\tis_banned\x18\x05 \x01(\r"\x89\x01\n\rRollingNotice\x12\x0f\n\x07content\x18\x02 \x01(\t\x12\x12\n\nstart_time\x18\x03 \x01(\r\x12\x10\n\x08end_time\x18\x04 \x01(\r\x12\x17\n\x0frepeat_interval\x18\x05 \x01(\r\x12\x13\n\x0brepeat_time\x18\x07 \x03(\r\x12\x13\n\x0brepeat_type\x18\x08 \x01(\r"\'\n\x0eMaintainNotice\x12\x15\n\rmaintain_time\x18\x01 \x01(\r"q\n\x0cBillingGoods\x12\n\n\x02id\x18\x01 \x01(\t\x12\x0c\n\x04name\x18\x02 \x01(\t\x12\x0c\n\x04desc\x18\x03 \x01(\t\x12\x0c\n\x04icon\x18\x04 \x01(\t\x12\x13\n\x0bresource_id\x18\x05 \x01(\r\x12\x16\n\x0eresource_count\x18\x06 \x01(\r"<\n\x0cBillShortcut\x12\n\n\x02id\x18\x01 \x01(\r\x12\r\n\x05count\x18\x02 \x01(\r\x12\x11\n\tdealPrice\x18\x03 \x01(\r"u\n\x0eBillingProduct\x12\x1f\n\x05goods\x18\x01 \x01(\x0b2\x10.lq.BillingGoods\x12\x15\n\rcurrency_code\x18\x02 \x01(\t\x12\x16\n\x0ecurrency_price\x18\x03 \x01(\r\x12\x13\n\x0bsort_weight\x18\x04 \x01(\r"\xa4\x01\n\tCharacter\x12\x0e\n\x06charid\x18\x01 \x01(\r\x12\r\n\x05level\x18\x02 \x01(\r\x12\x0b\n\x03exp\x18\x03 \x01(\r\x12\x1b\n\x05views\x18\x04 \x03(\x0b2\x0c.lq.ViewSlot\x12\x0c\n\x04skin\x18\x05 \x01(\r\x12\x13\n\x0bis_upgraded\x18\x06 \x01(\x08\x12\x13\n\x0bextra_emoji\x18\x07 \x03(\r\x12\x16\n\x0erewarded_level\x18\x08 \x03(\r"&\n\tBuyRecord\x12\n\n\x02id\x18\x01 \x01(\r\x12\r\n\x05count\x18\x02 \x01(\r"\xca\x01\n\x07ZHPShop\x12\r\n\x05goods\x18\x01 \x03(\r\x12"\n\x0bbuy_records\x18\x02 \x03(\x0b2\r.lq.BuyRecord\x12.\n\x0cfree_refresh\x18\x03 \x01(\x0b2\x18.lq.ZHPShop.RefreshCount\x12.\n\x0ccost_refresh\x18\x04 \x01(\x0b2\x18.lq.ZHPShop.RefreshCount\x1a,\n\x0cRefreshCount\x12\r\n\x05count\x18\x01 \x01(\r\x12\r\n\x05limit\x18\x02 \x01(\r"F\n\x0fMonthTicketInfo\x12\n\n\x02id\x18\x01 \x01(\r\x12\x10\n\x08end_time\x18\x02 \x01(\r\x12\x15\n\rlast_pay_time\x18\x03 \x01(\r"c\n\x08ShopInfo\x12\x18\n\x03zhp\x18\x01 \x01(\x0b2\x0b.lq.ZHPShop\x12"\n\x0bbuy_records\x18\x02 \x03(\x0b2\r.lq.BuyRecord\x12\x19\n\x11last_refresh_time\x18\x03 \x01(\r">\n\x14ChangeNicknameRecord\x12\x0c\n\x04from\x18\x01 \x01(\t\x12\n\n\x02to\x18\x02 \x01(\t\x12\x0c\n\x04time\x18\x03 \x01(\r"\x9e\x01\n\x0eServerSettings\x12+\n\x0fpayment_setting\x18\x03 \x01(\x0b2\x12.lq.PaymentSetting\x120\n\x12payment_setting_v2\x18\x04 \x01(\x0b2\x14.lq.PaymentSettingV2\x12-\n\x10nickname_setting\x18\x05 \x01(\x0b2\x13.lq.NicknameSetting"4\n\x0fNicknameSetting\x12\x0e\n\x06enable\x18\x01 \x01(\r\x12\x11\n\tnicknames\x18\x02 \x03(\t"\xed\x03\n\x10PaymentSettingV2\x12\x14\n\x0copen_payment\x18\x01 \x01(\r\x12B\n\x11payment_platforms\x18\x02 \x03(\x0b2\'.lq.PaymentSettingV2.PaymentSettingUnit\x1a\x86\x01\n\x0fPaymentMaintain\x12\x12\n\nstart_time\x18\x01 \x01(\r\x12\x10\n\x08end_time\x18\x02 \x01(\r\x12\x1a\n\x12goods_click_action\x18\x03 \x01(\r\x12\x18\n\x10goods_click_text\x18\x04 \x01(\t\x12\x17\n\x0fenabled_channel\x18\x05 \x03(\t\x1a\xf5\x01\n\x12PaymentSettingUnit\x12\x10\n\x08platform\x18\x01 \x01(\t\x12\x0f\n\x07is_show\x18\x02 \x01(\x08\x12\x1a\n\x12goods_click_action\x18\x03 \x01(\r\x12\x18\n\x10goods_click_text\x18\x04 \x01(\t\x126\n\x08maintain\x18\x05 \x01(\x0b2$.lq.PaymentSettingV2.PaymentMaintain\x12!\n\x19enable_for_frozen_account\x18\x06 \x01(\x08\x12\x12\n\nextra_data\x18\x07 \x01(\t\x12\x17\n\x0fenabled_channel\x18\x08 \x03(\t"\xdf\x02\n\x0ePaymentSetting\x12\x14\n\x0copen_payment\x18\x01 \x01(\r\x12\x1e\n\x16payment_info_show_type\x18\x02 \x01(\r\x12\x14\n\x0cpayment_info\x18\x03 \x01(\t\x12-\n\x06wechat\x18\x04 \x01(\x0b2\x1d.lq.PaymentSetting.WechatData\x12-\n\x06alipay\x18\x05 \x01(\x0b2\x1d.lq.PaymentSetting.AlipayData\x1a\\\n\nWechatData\x12\x16\n\x0edisable_create\x18\x01 \x01(\x08\x12\x1f\n\x17payment_source_platform\x18\x02 \x01(\r\x12\x15\n\renable_credit\x18\x03 \x01(\x08\x1aE\n\nAlipayData\x12\x16\n\x0edisable_create\x18\x01 \x01(\x08\x12\x1f\n\x17payment_source_platform\x18\x02 \x01(\r",\n\x0eAccountSetting\x12\x0b\n\x03key\x18\x01 \x01(\r\x12\r\n\x05value\x18\x02 \x01(\r"h\n\tChestData\x12\x10\n\x08chest_id\x18\x01 \x01(\r\x12\x18\n\x10total_open_count\x18\x02 \x01(\r\x12\x15\n\rconsume_count\x18\x03 \x01(\r\x12\x18\n\x10face_black_count\x18\x04 \x01(\r"t\n\x0bChestDataV2\x12\x10\n\x08chest_id\x18\x01 \x01(\r\x12\x18\n\x10total_open_count\x18\x02 \x01(\r\x12\x18\n\x10face_black_count\x18\x03 \x01(\r\x12\x1f\n\x17ticket_face_black_count\x18\x04 \x01(\r"d\n\tFaithData\x12\x10\n\x08faith_id\x18\x01 \x01(\r\x12\x18\n\x10total_open_count\x18\x02 \x01(\r\x12\x15\n\rconsume_count\x18\x03 \x01(\r\x12\x14\n\x0cmodify_count\x18\x04 \x01(\x05"\x9c\x02\n\x15CustomizedContestBase\x12\x11\n\tunique_id\x18\x01 \x01(\r\x12\x12\n\ncontest_id\x18\x02 \x01(\r\x12\x14\n\x0ccontest_name\x18\x03 \x01(\t\x12\r\n\x05state\x18\x04 \x01(\r\x12\x12\n\ncreator_id\x18\x05 \x01(\r\x12\x13\n\x0bcreate_time\x18\x06 \x01(\r\x12\x12\n\nstart_time\x18\x07 \x01(\r\x12\x13\n\x0bfinish_time\x18\x08 \x01(\r\x12\x0c\n\x04open\x18\t \x01(\x08\x12\x14\n\x0ccontest_type\x18\n \x01(\r\x12\x15\n\rpublic_notice\x18\x0b \x01(\t\x12\x13\n\x0bcheck_state\x18\x0c \x01(\r\x12\x15\n\rchecking_name\x18\r \x01(\t"C\n\x17CustomizedContestExtend\x12\x11\n\tunique_id\x18\x01 \x01(\r\x12\x15\n\rpublic_notice\x18\x02 \x01(\t"\xf4\x01\n\x19CustomizedContestAbstract\x12\x11\n\tunique_id\x18\x01 \x01(\r\x12\x12\n\ncontest_id\x18\x02 \x01(\r\x12\x14\n\x0ccontest_name\x18\x03 \x01(\t\x12\r\n\x05state\x18\x04 \x01(\r\x12\x12\n\ncreator_id\x18\x05 \x01(\r\x12\x13\n\x0bcreate_time\x18\x06 \x01(\r\x12\x12\n\nstart_time\x18\x07 \x01(\r\x12\x13\n\x0bfinish_time\x18\x08 \x01(\r\x12\x0c\n\x04open\x18\t \x01(\x08\x12\x15\n\rpublic_notice\x18\n \x01(\t\x12\x14\n\x0ccontest_type\x18\x0b \x01(\r"\xce\x03\n\x17CustomizedContestDetail\x12\x11\n\tunique_id\x18\x01 \x01(\r\x12\x12\n\ncontest_id\x18\x02 \x01(\r\x12\x14\n\x0ccontest_name\x18\x03 \x01(\t\x12\r\n\x05state\x18\x04 \x01(\r\x12\x12\n\ncreator_id\x18\x05 \x01(\r\x12\x13\n\x0bcreate_time\x18\x06 \x01(\r\x12\x12\n\nstart_time\x18\x07 \x01(\r\x12\x13\n\x0bfinish_time\x18\x08 \x01(\r\x12\x0c\n\x04open\x18\t \x01(\x08\x12\x11\n\trank_rule\x18\n \x01(\r\x12\x1f\n\tgame_mode\x18\x0b \x01(\x0b2\x0c.lq.GameMode\x12\x16\n\x0eprivate_notice\x18\x0c \x01(\t\x12\x17\n\x0fobserver_switch\x18\r \x01(\r\x12\x14\n\x0cemoji_switch\x18\x0e \x01(\r\x12\x14\n\x0ccontest_type\x18\x0f \x01(\r\x12\x19\n\x11disable_broadcast\x18\x10 \x01(\r\x12\x19\n\x11signup_start_time\x18\x11 \x01(\r\x12\x17\n\x0fsignup_end_time\x18\x12 \x01(\r\x12\x13\n\x0bsignup_type\x18\x13 \x01(\r\x12\x12\n\nauto_match\x18\x14 \x01(\r"}\n\x1dCustomizedContestPlayerReport\x12\x11\n\trank_rule\x18\x01 \x01(\r\x12\x0c\n\x04rank\x18\x02 \x01(\r\x12\r\n\x05point\x18\x03 \x01(\x05\x12\x12\n\ngame_ranks\x18\x04 \x03(\r\x12\x18\n\x10total_game_count\x18\x05 \x01(\r"\x84\x04\n\nRecordGame\x12\x0c\n\x04uuid\x18\x01 \x01(\t\x12\x12\n\nstart_time\x18\x02 \x01(\r\x12\x10\n\x08end_time\x18\x03 \x01(\r\x12\x1e\n\x06config\x18\x05 \x01(\x0b2\x0e.lq.GameConfig\x12,\n\x08accounts\x18\x0b \x03(\x0b2\x1a.lq.RecordGame.AccountInfo\x12!\n\x06result\x18\x0c \x01(\x0b2\x11.lq.GameEndResult\x12*\n\x06robots\x18\r \x03(\x0b2\x1a.lq.RecordGame.AccountInfo\x12\x15\n\rstandard_rule\x18\x0e \x01(\r\x1a\x8d\x02\n\x0bAccountInfo\x12\x12\n\naccount_id\x18\x01 \x01(\r\x12\x0c\n\x04seat\x18\x02 \x01(\r\x12\x10\n\x08nickname\x18\x03 \x01(\t\x12\x11\n\tavatar_id\x18\x04 \x01(\r\x12 \n\tcharacter\x18\x05 \x01(\x0b2\r.lq.Character\x12\r\n\x05title\x18\x06 \x01(\r\x12\x1f\n\x05level\x18\x07 \x01(\x0b2\x10.lq.AccountLevel\x12 \n\x06level3\x18\x08 \x01(\x0b2\x10.lq.AccountLevel\x12\x14\n\x0cavatar_frame\x18\t \x01(\r\x12\x10\n\x08verified\x18\n \x01(\r\x12\x1b\n\x05views\x18\x0b \x03(\x0b2\x0c.lq.ViewSlot"\xb3\x01\n\x0fRecordListEntry\x12\x0f\n\x07version\x18\x01 \x01(\r\x12\x0c\n\x04uuid\x18\x02 \x01(\t\x12\x12\n\nstart_time\x18\x03 \x01(\r\x12\x10\n\x08end_time\x18\x04 \x01(\r\x12\x0b\n\x03tag\x18\x05 \x01(\r\x12\x0e\n\x06subtag\x18\x06 \x01(\r\x12\'\n\x07players\x18\x07 \x03(\x0b2\x16.lq.RecordPlayerResult\x12\x15\n\rstandard_rule\x18\x08 \x01(\r"\xb0\x02\n\x12RecordPlayerResult\x12\x0c\n\x04rank\x18\x01 \x01(\r\x12\x12\n\naccount_id\x18\x02 \x01(\r\x12\x10\n\x08nickname\x18\x03 \x01(\t\x12\x1f\n\x05level\x18\x04 \x01(\x0b2\x10.lq.AccountLevel\x12 \n\x06level3\x18\x05 \x01(\x0b2\x10.lq.AccountLevel\x12\x0c\n\x04seat\x18\x06 \x01(\r\x12\n\n\x02pt\x18\x07 \x01(\x05\x12\r\n\x05point\x18\x08 \x01(\x05\x12\x13\n\x0bmax_hu_type\x18\t \x01(\r\x12\x13\n\x0baction_liqi\x18\n \x01(\r\x12\x13\n\x0baction_rong\x18\x0b \x01(\r\x12\x13\n\x0baction_zimo\x18\x0c \x01(\r\x12\x14\n\x0caction_chong\x18\r \x01(\r\x12\x10\n\x08verified\x18\x0e \x01(\r"\x80\x01\n\x1aCustomizedContestGameStart\x124\n\x07players\x18\x01 \x03(\x0b2#.lq.CustomizedContestGameStart.Item\x1a,\n\x04Item\x12\x12\n\naccount_id\x18\x01 \x01(\r\x12\x10\n\x08nickname\x18\x02 \x01(\t"\x91\x01\n\x18CustomizedContestGameEnd\x122\n\x07players\x18\x01 \x03(\x0b2!.lq.CustomizedContestGameEnd.Item\x1aA\n\x04Item\x12\x12\n\naccount_id\x18\x01 \x01(\r\x12\x10\n\x08nickname\x18\x02 \x01(\t\x12\x13\n\x0btotal_point\x18\x03 \x01(\x05"S\n\x08Activity\x12\x13\n\x0bactivity_id\x18\x01 \x01(\r\x12\x12\n\nstart_time\x18\x02 \x01(\r\x12\x10\n\x08end_time\x18\x03 \x01(\r\x12\x0c\n\x04type\x18\x04 \x01(\t"4\n\x0eExchangeRecord\x12\x13\n\x0bexchange_id\x18\x01 \x01(\r\x12\r\n\x05count\x18\x02 \x01(\r"^\n\x1cActivityAccumulatedPointData\x12\x13\n\x0bactivity_id\x18\x01 \x01(\r\x12\r\n\x05point\x18\x02 \x01(\x05\x12\x1a\n\x12gained_reward_list\x18\x03 \x03(\r"l\n\x15ActivityRankPointData\x12\x16\n\x0eleaderboard_id\x18\x01 \x01(\r\x12\r\n\x05point\x18\x02 \x01(\x05\x12\x15\n\rgained_reward\x18\x03 \x01(\x08\x12\x15\n\rgainable_time\x18\x04 \x01(\r"\xb9\x03\n\x0fGameRoundHuData\x12(\n\x05hupai\x18\x01 \x01(\x0b2\x19.lq.GameRoundHuData.HuPai\x12%\n\x04fans\x18\x02 \x03(\x0b2\x17.lq.GameRoundHuData.Fan\x12\r\n\x05score\x18\x03 \x01(\r\x12\x0b\n\x03xun\x18\x04 \x01(\r\x12\x10\n\x08title_id\x18\x05 \x01(\r\x12\x0f\n\x07fan_sum\x18\x06 \x01(\r\x12\x0e\n\x06fu_sum\x18\x07 \x01(\r\x12\x15\n\ryakuman_count\x18\x08 \x01(\r\x12\x17\n\x0fbiao_dora_count\x18\t \x01(\r\x12\x16\n\x0ered_dora_count\x18\n \x01(\r\x12\x15\n\rli_dora_count\x18\x0b \x01(\r\x12\x13\n\x0bbabei_count\x18\x0c \x01(\r\x12\x18\n\x10xuan_shang_count\x18\r \x01(\r\x12\x16\n\x0epai_left_count\x18\x0e \x01(\r\x1a1\n\x05HuPai\x12\x0c\n\x04tile\x18\x01 \x01(\t\x12\x0c\n\x04seat\x18\x02 \x01(\r\x12\x0c\n\x04liqi\x18\x03 \x01(\r\x1a-\n\x03Fan\x12\n\n\x02id\x18\x01 \x01(\r\x12\r\n\x05count\x18\x02 \x01(\r\x12\x0b\n\x03fan\x18\x03 \x01(\r"R\n\x1cGameRoundPlayerFangChongInfo\x12\x0c\n\x04seat\x18\x01 \x01(\r\x12\x0c\n\x04tile\x18\x02 \x01(\t\x12\x16\n\x0epai_left_count\x18\x03 \x01(\r"\x98\x02\n\x15GameRoundPlayerResult\x12\x0c\n\x04type\x18\x01 \x01(\r\x12\r\n\x05hands\x18\x02 \x03(\t\x12\x0c\n\x04ming\x18\x03 \x03(\t\x12\x11\n\tliqi_type\x18\x04 \x01(\r\x12\x0f\n\x07is_fulu\x18\x05 \x01(\x08\x12\x17\n\x0fis_liujumanguan\x18\x06 \x01(\x08\x12\x13\n\x0blian_zhuang\x18\x07 \x01(\r\x12\x1f\n\x02hu\x18\x08 \x01(\x0b2\x13.lq.GameRoundHuData\x124\n\nfangchongs\x18\t \x03(\x0b2 .lq.GameRoundPlayerFangChongInfo\x12\x16\n\x0eliqi_fangchong\x18\n \x01(\x08\x12\x13\n\x0bliqi_failed\x18\x0b \x01(\x08"Y\n\x0fGameRoundPlayer\x12\r\n\x05score\x18\x01 \x01(\x05\x12\x0c\n\x04rank\x18\x02 \x01(\r\x12)\n\x06result\x18\x03 \x01(\x0b2\x19.lq.GameRoundPlayerResult"R\n\x11GameRoundSnapshot\x12\n\n\x02ju\x18\x01 \x01(\r\x12\x0b\n\x03ben\x18\x02 \x01(\r\x12$\n\x07players\x18\x03 \x03(\x0b2\x13.lq.GameRoundPlayer"\xbb\x07\n\x11GameFinalSnapshot\x12\x0c\n\x04uuid\x18\x01 \x01(\t\x12\r\n\x05state\x18\x02 \x01(\r\x12\x10\n\x08category\x18\x03 \x01(\r\x12\x1a\n\x04mode\x18\x04 \x01(\x0b2\x0c.lq.GameMode\x12\x1e\n\x04meta\x18\x05 \x01(\x0b2\x10.lq.GameMetaData\x12=\n\x0fcalculate_param\x18\x06 \x01(\x0b2$.lq.GameFinalSnapshot.CalculateParam\x12\x13\n\x0bcreate_time\x18\x07 \x01(\r\x12\x12\n\nstart_time\x18\x08 \x01(\r\x12\x13\n\x0bfinish_time\x18\t \x01(\r\x12-\n\x05seats\x18\n \x03(\x0b2\x1e.lq.GameFinalSnapshot.GameSeat\x12%\n\x06rounds\x18\x0b \x03(\x0b2\x15.lq.GameRoundSnapshot\x12)\n\raccount_views\x18\x0c \x03(\x0b2\x12.lq.PlayerGameView\x128\n\rfinal_players\x18\r \x03(\x0b2!.lq.GameFinalSnapshot.FinalPlayer\x12/\n\x08afk_info\x18\x0e \x03(\x0b2\x1d.lq.GameFinalSnapshot.AFKInfo\x12\'\n\x0brobot_views\x18\x0f \x03(\x0b2\x12.lq.PlayerGameView\x1aS\n\x0eCalculateParam\x12\x12\n\ninit_point\x18\x01 \x01(\r\x12\x18\n\x10jingsuanyuandian\x18\x02 \x01(\r\x12\x13\n\x0brank_points\x18\x03 \x03(\x05\x1a\x88\x01\n\x08GameSeat\x12\x0c\n\x04type\x18\x01 \x01(\r\x12\x12\n\naccount_id\x18\x02 \x01(\r\x12,\n\x0fnotify_endpoint\x18\x03 \x01(\x0b2\x13.lq.NetworkEndpoint\x12\x16\n\x0eclient_address\x18\x04 \x01(\t\x12\x14\n\x0cis_connected\x18\x05 \x01(\x08\x1a\x81\x01\n\x0bFinalPlayer\x12\x0c\n\x04seat\x18\x01 \x01(\r\x12\x13\n\x0btotal_point\x18\x02 \x01(\x05\x12\x14\n\x0cpart_point_1\x18\x03 \x01(\x05\x12\x14\n\x0cpart_point_2\x18\x04 \x01(\x05\x12\x15\n\rgrading_score\x18\x05 \x01(\x05\x12\x0c\n\x04gold\x18\x06 \x01(\x05\x1aE\n\x07AFKInfo\x12\x17\n\x0fdeal_tile_count\x18\x01 \x01(\r\x12\x13\n\x0bmoqie_count\x18\x02 \x01(\r\x12\x0c\n\x04seat\x18\x03 \x01(\r"Z\n\x13RecordCollectedData\x12\x0c\n\x04uuid\x18\x01 \x01(\t\x12\x0f\n\x07remarks\x18\x02 \x01(\t\x12\x12\n\nstart_time\x18\x03 \x01(\r\x12\x10\n\x08end_time\x18\x04 \x01(\r"\x92\n\n\x11ContestDetailRule\x12\x12\n\ninit_point\x18\x05 \x01(\r\x12\x0f\n\x07fandian\x18\x06 \x01(\r\x12\x11\n\tcan_jifei\x18\x07 \x01(\x08\x12\x16\n\x0etianbian_value\x18\x08 \x01(\r\x12\x16\n\x0eliqibang_value\x18\t \x01(\r\x12\x17\n\x0fchangbang_value\x18\n \x01(\r\x12\x15\n\rnoting_fafu_1\x18\x0b \x01(\r\x12\x15\n\rnoting_fafu_2\x18\x0c \x01(\r\x12\x15\n\rnoting_fafu_3\x18\r \x01(\r\x12\x19\n\x11have_liujumanguan\x18\x0e \x01(\x08\x12\x1c\n\x14have_qieshangmanguan\x18\x0f \x01(\x08\x12\x16\n\x0ehave_biao_dora\x18\x10 \x01(\x08\x12\x1b\n\x13have_gang_biao_dora\x18\x11 \x01(\x08\x12"\n\x1aming_dora_immediately_open\x18\x12 \x01(\x08\x12\x14\n\x0chave_li_dora\x18\x13 \x01(\x08\x12\x19\n\x11have_gang_li_dora\x18\x14 \x01(\x08\x12\x19\n\x11have_sifenglianda\x18\x15 \x01(\x08\x12\x18\n\x10have_sigangsanle\x18\x16 \x01(\x08\x12\x17\n\x0fhave_sijializhi\x18\x17 \x01(\x08\x12\x1b\n\x13have_jiuzhongjiupai\x18\x18 \x01(\x08\x12\x17\n\x0fhave_sanjiahele\x18\x19 \x01(\x08\x12\x14\n\x0chave_toutiao\x18\x1a \x01(\x08\x12\x1b\n\x13have_helelianzhuang\x18\x1b \x01(\x08\x12\x18\n\x10have_helezhongju\x18\x1c \x01(\x08\x12\x1e\n\x16have_tingpailianzhuang\x18\x1d \x01(\x08\x12\x1b\n\x13have_tingpaizhongju\x18\x1e \x01(\x08\x12\x11\n\thave_yifa\x18\x1f \x01(\x08\x12\x16\n\x0ehave_nanruxiru\x18  \x01(\x08\x12\x18\n\x10jingsuanyuandian\x18! \x01(\r\x12\x13\n\x0bshunweima_2\x18" \x01(\x05\x12\x13\n\x0bshunweima_3\x18# \x01(\x05\x12\x13\n\x0bshunweima_4\x18$ \x01(\x05\x12\x14\n\x0cbianjietishi\x18% \x01(\x08\x12\x10\n\x08ai_level\x18& \x01(\r\x12\x14\n\x0chave_zimosun\x18\' \x01(\x08\x12\x1d\n\x15disable_multi_yukaman\x18( \x01(\x08\x12\x11\n\tguyi_mode\x18) \x01(\r\x12\x1a\n\x12disable_leijiyiman\x18* \x01(\x08\x12\x12\n\ndora3_mode\x18+ \x01(\r\x12\x14\n\x0cxuezhandaodi\x18, \x01(\r\x12\x14\n\x0chuansanzhang\x18- \x01(\r\x12\x0f\n\x07chuanma\x18. \x01(\r\x12\x1e\n\x16disable_double_yakuman\x18> \x01(\r\x12!\n\x19disable_composite_yakuman\x18? \x01(\r\x12\x14\n\x0cenable_shiti\x18@ \x01(\r\x12\x1c\n\x14enable_nontsumo_liqi\x18A \x01(\r\x12#\n\x1bdisable_double_wind_four_fu\x18B \x01(\r\x12\x1d\n\x15disable_angang_guoshi\x18C \x01(\r\x12\x14\n\x0cenable_renhe\x18D \x01(\r\x12%\n\x1denable_baopai_extend_settings\x18E \x01(\r\x12\r\n\x05fanfu\x18F \x01(\r"\xb3\x01\n\x13ContestDetailRuleV2\x12(\n\tgame_rule\x18\x01 \x01(\x0b2\x15.lq.ContestDetailRule\x125\n\nextra_rule\x18\x02 \x01(\x0b2!.lq.ContestDetailRuleV2.ExtraRule\x1a;\n\tExtraRule\x12\x16\n\x0erequired_level\x18\x01 \x01(\r\x12\x16\n\x0emax_game_count\x18\x02 \x01(\r"\xab\x01\n\x0fGameRuleSetting\x12\x12\n\nround_type\x18\x01 \x01(\r\x12\x0f\n\x07shiduan\x18\x02 \x01(\x08\x12\x12\n\ndora_count\x18\x03 \x01(\r\x12\x15\n\rthinking_type\x18\x04 \x01(\r\x12\x17\n\x0fuse_detail_rule\x18\x05 \x01(\x08\x12/\n\x0edetail_rule_v2\x18\x06 \x01(\x0b2\x17.lq.ContestDetailRuleV2"\xad\x01\n\x11RecordTingPaiInfo\x12\x0c\n\x04tile\x18\x01 \x01(\t\x12\x0e\n\x06haveyi\x18\x02 \x01(\x08\x12\r\n\x05yiman\x18\x03 \x01(\x08\x12\r\n\x05count\x18\x04 \x01(\r\x12\n\n\x02fu\x18\x05 \x01(\r\x12\x17\n\x0fbiao_dora_count\x18\x06 \x01(\r\x12\x12\n\nyiman_zimo\x18\x07 \x01(\x08\x12\x12\n\ncount_zimo\x18\x08 \x01(\r\x12\x0f\n\x07fu_zimo\x18\t \x01(\r"m\n\x16RecordNoTilePlayerInfo\x12\x0f\n\x07tingpai\x18\x03 \x01(\x08\x12\x0c\n\x04hand\x18\x04 \x03(\t\x12$\n\x05tings\x18\x05 \x03(\x0b2\x15.lq.RecordTingPaiInfo\x12\x0e\n\x06liuman\x18\x06 \x01(\x08"\xcb\x03\n\x0eRecordHuleInfo\x12\x0c\n\x04hand\x18\x01 \x03(\t\x12\x0c\n\x04ming\x18\x02 \x03(\t\x12\x0f\n\x07hu_tile\x18\x03 \x01(\t\x12\x0c\n\x04seat\x18\x04 \x01(\r\x12\x0c\n\x04zimo\x18\x05 \x01(\x08\x12\x0e\n\x06qinjia\x18\x06 \x01(\x08\x12\x0c\n\x04liqi\x18\x07 \x01(\x08\x12\r\n\x05doras\x18\x08 \x03(\t\x12\x10\n\x08li_doras\x18\t \x03(\t\x12\r\n\x05yiman\x18\n \x01(\x08\x12\r\n\x05count\x18\x0b \x01(\r\x12.\n\x04fans\x18\x0c \x03(\x0b2 .lq.RecordHuleInfo.RecordFanInfo\x12\n\n\x02fu\x18\r \x01(\r\x12\x16\n\x0epoint_zimo_qin\x18\x0e \x01(\r\x12\x17\n\x0fpoint_zimo_xian\x18\x0f \x01(\r\x12\x10\n\x08title_id\x18\x10 \x01(\r\x12\x11\n\tpoint_sum\x18\x11 \x01(\r\x12\x0e\n\x06dadian\x18\x12 \x01(\r\x12\x14\n\x0cis_jue_zhang\x18\x13 \x01(\x08\x12\x0b\n\x03xun\x18\x14 \x01(\r\x12\x11\n\tting_type\x18\x15 \x01(\r\x12\x11\n\tting_mian\x18\x16 \x01(\r\x1a(\n\rRecordFanInfo\x12\x0b\n\x03val\x18\x01 \x01(\r\x12\n\n\x02id\x18\x02 \x01(\r"B\n\x0fRecordHulesInfo\x12\x0c\n\x04seat\x18\x01 \x01(\x05\x12!\n\x05hules\x18\x02 \x03(\x0b2\x12.lq.RecordHuleInfo"-\n\x0fRecordLiujuInfo\x12\x0c\n\x04seat\x18\x01 \x01(\r\x12\x0c\n\x04type\x18\x02 \x01(\r"U\n\x10RecordNoTileInfo\x12\x14\n\x0cliujumanguan\x18\x01 \x01(\x08\x12+\n\x07players\x18\x02 \x03(\x0b2\x1a.lq.RecordNoTilePlayerInfo"r\n\x0eRecordLiqiInfo\x12\x0c\n\x04seat\x18\x01 \x01(\r\x12\r\n\x05score\x18\x02 \x01(\r\x12\x0c\n\x04is_w\x18\x03 \x01(\x08\x12\x14\n\x0cis_zhen_ting\x18\x04 \x01(\x08\x12\x0b\n\x03xun\x18\x05 \x01(\r\x12\x12\n\nis_success\x18\x06 \x01(\x08"W\n\x0eRecordGangInfo\x12\x0c\n\x04seat\x18\x01 \x01(\r\x12\x0c\n\x04type\x18\x02 \x01(\r\x12\x0b\n\x03pai\x18\x03 \x01(\t\x12\x0f\n\x07is_dora\x18\x04 \x01(\x08\x12\x0b\n\x03xun\x18\x05 \x01(\r"S\n\x0fRecordBaBeiInfo\x12\x0c\n\x04seat\x18\x01 \x01(\r\x12\x10\n\x08is_zi_mo\x18\x02 \x01(\x08\x12\x10\n\x08is_chong\x18\x03 \x01(\x08\x12\x0e\n\x06is_bei\x18\x04 \x01(\x08"O\n\x10RecordPeiPaiInfo\x12\x12\n\ndora_count\x18\x01 \x01(\r\x12\x14\n\x0cr_dora_count\x18\x02 \x01(\r\x12\x11\n\tbei_count\x18\x03 \x01(\r"\xfb\x02\n\x0fRecordRoundInfo\x12\x0c\n\x04name\x18\x01 \x01(\t\x12\r\n\x05chang\x18\x02 \x01(\r\x12\n\n\x02ju\x18\x03 \x01(\r\x12\x0b\n\x03ben\x18\x04 \x01(\r\x12\x0e\n\x06scores\x18\x05 \x03(\r\x12&\n\nliqi_infos\x18\x07 \x03(\x0b2\x12.lq.RecordLiqiInfo\x12&\n\ngang_infos\x18\x08 \x03(\x0b2\x12.lq.RecordGangInfo\x12*\n\x0cpeipai_infos\x18\t \x03(\x0b2\x14.lq.RecordPeiPaiInfo\x12(\n\x0bbabai_infos\x18\n \x03(\x0b2\x13.lq.RecordBaBeiInfo\x12\'\n\nhules_info\x18\x0b \x01(\x0b2\x13.lq.RecordHulesInfo\x12\'\n\nliuju_info\x18\x0c \x01(\x0b2\x13.lq.RecordLiujuInfo\x12*\n\x0cno_tile_info\x18\r \x01(\x0b2\x14.lq.RecordNoTileInfo"@\n\x14RecordAnalysisedData\x12(\n\x0bround_infos\x18\x01 \x03(\x0b2\x13.lq.RecordRoundInfo"<\n\x08VoteData\x12\x13\n\x0bactivity_id\x18\x01 \x01(\r\x12\x0c\n\x04vote\x18\x02 \x01(\r\x12\r\n\x05count\x18\x03 \x01(\r"V\n\x10ActivityBuffData\x12\x0f\n\x07buff_id\x18\x01 \x01(\r\x12\r\n\x05level\x18\x05 \x01(\r\x12\r\n\x05count\x18\x06 \x01(\r\x12\x13\n\x0bupdate_time\x18\x07 \x01(\r"\x96\x04\n\x17AccountResourceSnapshot\x12=\n\x08bag_item\x18\x01 \x03(\x0b2+.lq.AccountResourceSnapshot.BagItemSnapshot\x12>\n\x08currency\x18\x02 \x03(\x0b2,.lq.AccountResourceSnapshot.CurrencySnapshot\x128\n\x05title\x18\x03 \x01(\x0b2).lq.AccountResourceSnapshot.TitleSnapshot\x12A\n\nused_title\x18\x04 \x01(\x0b2-.lq.AccountResourceSnapshot.UsedTitleSnapshot\x12\x18\n\x10currency_convert\x18\x05 \x01(\r\x1aX\n\x0fBagItemSnapshot\x12\x13\n\x0bresource_id\x18\x01 \x01(\r\x12\x16\n\x0eresource_count\x18\x02 \x01(\r\x12\x18\n\x10resource_version\x18\x03 \x01(\r\x1a?\n\x10CurrencySnapshot\x12\x13\n\x0bcurrency_id\x18\x01 \x01(\r\x12\x16\n\x0ecurrency_count\x18\x02 \x01(\r\x1a#\n\rTitleSnapshot\x12\x12\n\ntitle_list\x18\x01 \x03(\r\x1a%\n\x11UsedTitleSnapshot\x12\x10\n\x08title_id\x18\x01 \x01(\r"\xd8\x03\n\x18AccountCharacterSnapshot\x12\x1a\n\x12created_characters\x18\x01 \x03(\r\x12)\n\x12removed_characters\x18\x02 \x03(\x0b2\r.lq.Character\x12*\n\x13modified_characters\x18\x03 \x03(\x0b2\r.lq.Character\x12J\n\x0emain_character\x18\x04 \x01(\x0b22.lq.AccountCharacterSnapshot.MainCharacterSnapshot\x129\n\x05skins\x18\x05 \x01(\x0b2*.lq.AccountCharacterSnapshot.SkinsSnapshot\x12G\n\x11hidden_characters\x18\x06 \x01(\x0b2,.lq.AccountCharacterSnapshot.HiddenCharacter\x1a-\n\x15MainCharacterSnapshot\x12\x14\n\x0ccharacter_id\x18\x01 \x01(\r\x1a"\n\rSkinsSnapshot\x12\x11\n\tskin_list\x18\x01 \x03(\r\x1a&\n\x0fHiddenCharacter\x12\x13\n\x0bhidden_list\x18\x01 \x03(\r"\xc1\x02\n\x11AccountMailRecord\x12\x15\n\rcreated_mails\x18\x01 \x03(\r\x129\n\rremoved_mails\x18\x02 \x03(\x0b2".lq.AccountMailRecord.MailSnapshot\x12:\n\x0emodified_mails\x18\x03 \x03(\x0b2".lq.AccountMailRecord.MailSnapshot\x1a\x9d\x01\n\x0cMailSnapshot\x12\x0f\n\x07mail_id\x18\x01 \x01(\r\x12\x14\n\x0creference_id\x18\x02 \x01(\r\x12\x13\n\x0bcreate_time\x18\x03 \x01(\r\x12\x13\n\x0bexpire_time\x18\x04 \x01(\r\x12\x17\n\x0ftake_attachment\x18\x05 \x01(\r\x12#\n\x0battachments\x18\x06 \x03(\x0b2\x0e.lq.RewardSlot"\xb2\x02\n\x1aAccountAchievementSnapshot\x12-\n\x0cachievements\x18\x01 \x03(\x0b2\x17.lq.AchievementProgress\x12L\n\x0erewarded_group\x18\x02 \x01(\x0b24.lq.AccountAchievementSnapshot.RewardedGroupSnapshot\x12B\n\x07version\x18\x03 \x01(\x0b21.lq.AccountAchievementSnapshot.AchievementVersion\x1a,\n\x15RewardedGroupSnapshot\x12\x13\n\x0brewarded_id\x18\x01 \x01(\r\x1a%\n\x12AchievementVersion\x12\x0f\n\x07version\x18\x01 \x01(\r"\xe9\x07\n\x13AccountMiscSnapshot\x12!\n\nfaith_data\x18\x01 \x01(\x0b2\r.lq.FaithData\x12K\n\x11vip_reward_gained\x18\x02 \x01(\x0b20.lq.AccountMiscSnapshot.AccountVIPRewardSnapshot\x12/\n\x03vip\x18\x03 \x01(\x0b2".lq.AccountMiscSnapshot.AccountVIP\x12\x1f\n\tshop_info\x18\x04 \x01(\x0b2\x0c.lq.ShopInfo\x12H\n\x0cmonth_ticket\x18\x05 \x01(\x0b22.lq.AccountMiscSnapshot.AccountMonthTicketSnapshot\x12>\n\trecharged\x18\x06 \x01(\x0b2+.lq.AccountMiscSnapshot.AccountRechargeInfo\x12M\n\x0fmonth_ticket_v2\x18\x07 \x01(\x0b24.lq.AccountMiscSnapshot.AccountMonthTicketSnapshotV2\x1a,\n\x18AccountVIPRewardSnapshot\x12\x10\n\x08rewarded\x18\x01 \x03(\r\x1ar\n\x0fMonthTicketInfo\x12\n\n\x02id\x18\x01 \x01(\r\x12\x10\n\x08end_time\x18\x02 \x01(\r\x12\x15\n\rlast_pay_time\x18\x03 \x01(\r\x12\x19\n\x11record_start_time\x18\x04 \x01(\r\x12\x0f\n\x07history\x18\x05 \x03(\r\x1aV\n\x1aAccountMonthTicketSnapshot\x128\n\x07tickets\x18\x01 \x03(\x0b2\'.lq.AccountMiscSnapshot.MonthTicketInfo\x1a\x19\n\nAccountVIP\x12\x0b\n\x03vip\x18\x01 \x01(\r\x1a\xac\x01\n\x13AccountRechargeInfo\x12K\n\x07records\x18\x01 \x03(\x0b2:.lq.AccountMiscSnapshot.AccountRechargeInfo.RechargeRecord\x12\x10\n\x08has_data\x18\x02 \x01(\r\x1a6\n\x0eRechargeRecord\x12\r\n\x05level\x18\x01 \x01(\r\x12\x15\n\rrecharge_time\x18\x02 \x01(\r\x1as\n\x1cAccountMonthTicketSnapshotV2\x12\x10\n\x08end_time\x18\x01 \x01(\r\x12\x15\n\rlast_pay_time\x18\x02 \x01(\r\x12\x19\n\x11record_start_time\x18\x03 \x01(\r\x12\x0f\n\x07history\x18\x04 \x03(\r"/\n\x15AccountGiftCodeRecord\x12\x16\n\x0eused_gift_code\x18\x01 \x03(\t"\x96\x02\n\x05AccSn\x12-\n\x08resource\x18\x01 \x01(\x0b2\x1b.lq.AccountResourceSnapshot\x12/\n\tcharacter\x18\x02 \x01(\x0b2\x1c.lq.AccountCharacterSnapshot\x12#\n\x04mail\x18\x03 \x01(\x0b2\x15.lq.AccountMailRecord\x123\n\x0bachievement\x18\x04 \x01(\x0b2\x1e.lq.AccountAchievementSnapshot\x12%\n\x04misc\x18\x05 \x01(\x0b2\x17.lq.AccountMiscSnapshot\x12,\n\tgift_code\x18\x06 \x01(\x0b2\x19.lq.AccountGiftCodeRecord"=\n\x07AccSnDa\x12\x12\n\naccount_id\x18\x01 \x01(\r\x12\x0c\n\x04time\x18\x02 \x01(\r\x12\x10\n\x08snapshot\x18\x03 \x01(\x0c"e\n\x0fTransparentData\x12\x0e\n\x06method\x18\x01 \x01(\t\x12\x0c\n\x04data\x18\x02 \x01(\x0c\x12\x0f\n\x07session\x18\x03 \x01(\t\x12#\n\x06remote\x18\x04 \x01(\x0b2\x13.lq.NetworkEndpoint"&\n\nAmuletTile\x12\n\n\x02id\x18\x01 \x01(\r\x12\x0c\n\x04tile\x18\x02 \x01(\t"B\n\tAmuletFan\x12\n\n\x02id\x18\x01 \x01(\r\x12\x0b\n\x03val\x18\x02 \x01(\x03\x12\r\n\x05count\x18\x03 \x01(\r\x12\r\n\x05yiman\x18\x04 \x01(\x08")\n\rAmuletReplace\x12\n\n\x02id\x18\x01 \x01(\r\x12\x0c\n\x04tile\x18\x02 \x01(\t"1\n\x0eAmuletMingInfo\x12\x0c\n\x04type\x18\x01 \x01(\r\x12\x11\n\ttile_list\x18\x02 \x03(\r"\x8b\x05\n\x18AmuletActivityHookEffect\x12\x10\n\x08add_dora\x18\x01 \x03(\r\x12\x15\n\radd_tian_dora\x18\x03 \x03(\t\x12L\n\nadd_effect\x18\x04 \x03(\x0b28.lq.AmuletActivityHookEffect.AmuletActivityAddHookEffect\x12\x15\n\rremove_effect\x18\x05 \x03(\r\x12\x10\n\x08add_buff\x18\x06 \x03(\r\x12\x13\n\x0bremove_buff\x18\x07 \x03(\r\x12\x10\n\x08add_coin\x18\t \x01(\x05\x12\'\n\x0ctile_replace\x18\x0b \x03(\x0b2\x11.lq.AmuletReplace\x12\x0f\n\x07add_fan\x18\x0c \x01(\t\x12\x10\n\x08add_base\x18\r \x01(\t\x12!\n\nmodify_fan\x18\x0e \x03(\x0b2\r.lq.AmuletFan\x12\n\n\x02id\x18\x0f \x01(\r\x12\x13\n\x0bmodify_dora\x18\x10 \x01(\x08\x12\x0b\n\x03uid\x18\x11 \x01(\r\x12\x15\n\radd_show_tile\x18\x12 \x03(\r\x12\x16\n\x0eadd_dora_count\x18\x13 \x01(\x05\x12\x18\n\x10add_dora_no_hook\x18\x14 \x03(\r\x12\x18\n\x10add_coin_no_hook\x18\x15 \x01(\x05\x123\n\x0eadd_tile_score\x18\x16 \x03(\x0b2\x1b.lq.AmuletGameTileScoreData\x12;\n\x16add_tile_score_no_hook\x18\x17 \x03(\x0b2\x1b.lq.AmuletGameTileScoreData\x1a6\n\x1bAmuletActivityAddHookEffect\x12\n\n\x02id\x18\x01 \x01(\r\x12\x0b\n\x03uid\x18\x02 \x01(\r"i\n\x0eAmuletHuleInfo\x12\x0c\n\x04tile\x18\x01 \x01(\r\x12\x1f\n\x08fan_list\x18\x02 \x03(\x0b2\r.lq.AmuletFan\x12\x0b\n\x03fan\x18\x03 \x01(\t\x12\r\n\x05point\x18\x04 \x01(\t\x12\x0c\n\x04base\x18\x05 \x01(\t"\x97\x01\n\x17AmuletHuleOperateResult\x12$\n\x08hu_final\x18\x02 \x01(\x0b2\x12.lq.AmuletHuleInfo\x12#\n\x07hu_base\x18\x03 \x01(\x0b2\x12.lq.AmuletHuleInfo\x121\n\x0bhook_effect\x18\x05 \x03(\x0b2\x1c.lq.AmuletActivityHookEffect"^\n\x17AmuletGangOperateResult\x12\x10\n\x08new_dora\x18\x04 \x03(\r\x121\n\x0bhook_effect\x18\x05 \x03(\x0b2\x1c.lq.AmuletActivityHookEffect"W\n\x14AmuletDealTileResult\x12\x0c\n\x04tile\x18\x01 \x01(\r\x121\n\x0bhook_effect\x18\x05 \x03(\x0b2\x1c.lq.AmuletActivityHookEffect"Z\n\x17AmuletDiscardTileResult\x12\x0c\n\x04tile\x18\x01 \x01(\r\x121\n\x0bhook_effect\x18\x05 \x03(\x0b2\x1c.lq.AmuletActivityHookEffect"J\n\x15AmuletStartGameResult\x121\n\x0bhook_effect\x18\x05 \x03(\x0b2\x1c.lq.AmuletActivityHookEffect"\xa7\x01\n\x11AmuletRoundResult\x12.\n\thu_result\x18\x02 \x01(\x0b2\x1b.lq.AmuletHuleOperateResult\x12-\n\x0bdeal_result\x18\x04 \x01(\x0b2\x18.lq.AmuletDealTileResult\x123\n\x0ediscard_result\x18\x05 \x01(\x0b2\x1b.lq.AmuletDiscardTileResult"\xd9\x01\n\x13AmuletUpgradeResult\x12,\n\rremain_rounds\x18\x01 \x03(\x0b2\x15.lq.AmuletRoundResult\x12\x12\n\npoint_coin\x18\x02 \x01(\r\x12\x12\n\nlevel_coin\x18\x03 \x01(\r\x12$\n\x04shop\x18\x04 \x01(\x0b2\x16.lq.AmuletGameShopData\x121\n\x0bhook_effect\x18\x05 \x03(\x0b2\x1c.lq.AmuletActivityHookEffect\x12\x13\n\x0breward_pack\x18\x06 \x03(\r"9\n\x13QuestionnaireReward\x12\x13\n\x0bresource_id\x18\x01 \x01(\r\x12\r\n\x05count\x18\x02 \x01(\r"\xc8\x02\n\x13QuestionnaireDetail\x12\n\n\x02id\x18\x01 \x01(\r\x12\x12\n\nversion_id\x18\x02 \x01(\r\x12\x1c\n\x14effective_time_start\x18\x03 \x01(\r\x12\x1a\n\x12effective_time_end\x18\x04 \x01(\r\x12(\n\x07rewards\x18\x05 \x03(\x0b2\x17.lq.QuestionnaireReward\x12\x14\n\x0cbanner_title\x18\x06 \x01(\t\x12\r\n\x05title\x18\x07 \x01(\t\x12\x1a\n\x12announcement_title\x18\x08 \x01(\t\x12\x1c\n\x14announcement_content\x18\t \x01(\t\x12\x12\n\nfinal_text\x18\n \x01(\t\x12,\n\tquestions\x18\x0b \x03(\x0b2\x19.lq.QuestionnaireQuestion\x12\x0c\n\x04type\x18\x0c \x01(\r"\xdc\x05\n\x15QuestionnaireQuestion\x12\n\n\x02id\x18\x01 \x01(\r\x12\r\n\x05title\x18\x02 \x01(\t\x12\x10\n\x08describe\x18\x03 \x01(\t\x12\x0c\n\x04type\x18\x04 \x01(\t\x12\x10\n\x08sub_type\x18\x05 \x01(\t\x129\n\x07options\x18\x06 \x03(\x0b2(.lq.QuestionnaireQuestion.QuestionOption\x12\x1a\n\x12option_random_sort\x18\x07 \x01(\x08\x12\x0f\n\x07require\x18\x08 \x01(\x08\x12\x12\n\nmax_choice\x18\t \x01(\r\x12A\n\rnext_question\x18\n \x03(\x0b2*.lq.QuestionnaireQuestion.NextQuestionData\x12\x12\n\nmatrix_row\x18\x0b \x03(\t\x12 \n\x18option_random_sort_index\x18\x0c \x01(\x05\x1aC\n\x0eQuestionOption\x12\r\n\x05label\x18\x01 \x01(\t\x12\r\n\x05value\x18\x02 \x01(\t\x12\x13\n\x0ballow_input\x18\x03 \x01(\x08\x1a\xbb\x02\n\x10NextQuestionData\x12\x1a\n\x12target_question_id\x18\x01 \x01(\r\x12W\n\nconditions\x18\n \x03(\x0b2C.lq.QuestionnaireQuestion.NextQuestionData.QuestionconditionWrapper\x1aD\n\x11QuestionCondition\x12\x13\n\x0bquestion_id\x18\x01 \x01(\r\x12\n\n\x02op\x18\x02 \x01(\t\x12\x0e\n\x06values\x18\x03 \x03(\t\x1al\n\x18QuestionconditionWrapper\x12P\n\nconditions\x18\x01 \x03(\x0b2<.lq.QuestionnaireQuestion.NextQuestionData.QuestionCondition"\xcb\x01\n\x12QuestionnaireBrief\x12\n\n\x02id\x18\x01 \x01(\r\x12\x12\n\nversion_id\x18\x02 \x01(\r\x12\x1c\n\x14effective_time_start\x18\x03 \x01(\r\x12\x1a\n\x12effective_time_end\x18\x04 \x01(\r\x12(\n\x07rewards\x18\x05 \x03(\x0b2\x17.lq.QuestionnaireReward\x12\x14\n\x0cbanner_title\x18\x06 \x01(\t\x12\r\n\x05title\x18\x07 \x01(\t\x12\x0c\n\x04type\x18\x08 \x01(\r"X\n\nSeerReport\x12\x0c\n\x04uuid\x18\x01 \x01(\t\x12\x1d\n\x06events\x18\x02 \x03(\x0b2\r.lq.SeerEvent\x12\x1d\n\x06rounds\x18\x03 \x03(\x0b2\r.lq.SeerRound"\\\n\tSeerEvent\x12\x14\n\x0crecord_index\x18\x01 \x01(\x05\x12\x12\n\nseer_index\x18\x02 \x01(\x05\x12%\n\nrecommends\x18\x03 \x03(\x0b2\x11.lq.SeerRecommend"F\n\rSeerRecommend\x12\x0c\n\x04seat\x18\x01 \x01(\x05\x12\'\n\x0bpredictions\x18\x02 \x03(\x0b2\x12.lq.SeerPrediction"/\n\x0eSeerPrediction\x12\x0e\n\x06action\x18\x01 \x01(\x05\x12\r\n\x05score\x18\x02 \x01(\x05"Y\n\tSeerRound\x12\r\n\x05chang\x18\x01 \x01(\r\x12\n\n\x02ju\x18\x02 \x01(\r\x12\x0b\n\x03ben\x18\x03 \x01(\r\x12$\n\rplayer_scores\x18\x04 \x03(\x0b2\r.lq.SeerScore")\n\tSeerScore\x12\x0c\n\x04seat\x18\x01 \x01(\r\x12\x0e\n\x06rating\x18\x02 \x01(\r"x\n\tSeerBrief\x12\x0c\n\x04uuid\x18\x01 \x01(\t\x12\r\n\x05state\x18\x02 \x01(\r\x12\x13\n\x0bexpire_time\x18\x03 \x01(\r\x12$\n\rplayer_scores\x18\x04 \x03(\x0b2\r.lq.SeerScore\x12\x13\n\x0bcreate_time\x18\x05 \x01(\r"\xf0\x02\n\x16SimulationV2SeasonData\x12\r\n\x05round\x18\x01 \x01(\r\x12(\n\x07ability\x18\x02 \x01(\x0b2\x17.lq.SimulationV2Ability\x12+\n\x0beffect_list\x18\x03 \x03(\x0b2\x16.lq.SimulationV2Effect\x12$\n\x05match\x18\x04 \x01(\x0b2\x15.lq.SimulationV2Match\x12$\n\x05event\x18\x05 \x01(\x0b2\x15.lq.SimulationV2Event\x123\n\revent_history\x18\x06 \x03(\x0b2\x1c.lq.SimulationV2EventHistory\x12&\n\x06record\x18\x07 \x01(\x0b2\x16.lq.SimulationV2Record\x12\x13\n\x0btotal_score\x18\x08 \x01(\x05\x122\n\rmatch_history\x18\t \x03(\x0b2\x1b.lq.SimulationV2MatchRecord"_\n\x18SimulationV2PlayerRecord\x12\n\n\x02id\x18\x01 \x01(\r\x12\x0c\n\x04main\x18\x02 \x01(\x08\x12\r\n\x05score\x18\x03 \x01(\x05\x12\x0c\n\x04rank\x18\x04 \x01(\r\x12\x0c\n\x04seat\x18\x05 \x01(\r"W\n\x17SimulationV2MatchRecord\x12-\n\x07players\x18\x01 \x03(\x0b2\x1c.lq.SimulationV2PlayerRecord\x12\r\n\x05round\x18\x02 \x01(\r"5\n\x18SimulationV2EventHistory\x12\n\n\x02id\x18\x01 \x01(\r\x12\r\n\x05round\x18\x02 \x01(\r"\xb6\x02\n\x11SimulationV2Event\x12\n\n\x02id\x18\x01 \x01(\r\x12D\n\nselections\x18\x02 \x03(\x0b20.lq.SimulationV2Event.SimulationV2EventSelection\x12\x12\n\nnext_round\x18\x03 \x01(\r\x1a\xba\x01\n\x1aSimulationV2EventSelection\x12\n\n\x02id\x18\x01 \x01(\r\x12Y\n\x07results\x18\x02 \x03(\x0b2H.lq.SimulationV2Event.SimulationV2EventSelection.SimulationV2EventResult\x1a5\n\x17SimulationV2EventResult\x12\n\n\x02id\x18\x01 \x01(\r\x12\x0e\n\x06weight\x18\x02 \x01(\r"V\n\x13SimulationV2Ability\x12\x0b\n\x03luk\x18\x01 \x01(\r\x12\x0b\n\x03tec\x18\x02 \x01(\r\x12\x0b\n\x03ins\x18\x03 \x01(\r\x12\x0b\n\x03int\x18\x04 \x01(\r\x12\x0b\n\x03res\x18\x05 \x01(\r"<\n\x10SimulationV2Buff\x12\n\n\x02id\x18\x01 \x01(\r\x12\r\n\x05round\x18\x02 \x01(\r\x12\r\n\x05store\x18\x03 \x03(\r" \n\x12SimulationV2Effect\x12\n\n\x02id\x18\x01 \x01(\r"]\n\x15SimulationV2MatchInfo\x12\r\n\x05chang\x18\x01 \x01(\r\x12\n\n\x02ju\x18\x02 \x01(\r\x12\x0b\n\x03ben\x18\x03 \x01(\r\x12\x0c\n\x04gong\x18\x04 \x01(\r\x12\x0e\n\x06remain\x18\x05 \x01(\r"r\n\x12SimulationV2Record\x12\x10\n\x08hu_count\x18\x01 \x01(\r\x12\x13\n\x0bchong_count\x18\x02 \x01(\r\x12\x12\n\nhighest_hu\x18\x03 \x01(\r\x12\x0c\n\x04rank\x18\x04 \x03(\r\x12\x13\n\x0bround_count\x18\x05 \x01(\r"\xe6\x07\n\x18SimulationV2MatchHistory\x12\x0c\n\x04type\x18\x01 \x01(\r\x12\x0e\n\x06remain\x18\x02 \x01(\r\x12\x14\n\x0cscore_modify\x18\x03 \x03(\x05\x12@\n\x0bround_start\x18\x04 \x01(\x0b2+.lq.SimulationV2MatchHistory.RoundStartArgs\x127\n\x06riichi\x18\x05 \x01(\x0b2\'.lq.SimulationV2MatchHistory.RiichiArgs\x123\n\x04fulu\x18\x06 \x01(\x0b2%.lq.SimulationV2MatchHistory.FuluArgs\x123\n\x04hule\x18\x07 \x03(\x0b2%.lq.SimulationV2MatchHistory.HuleArgs\x12<\n\tpush_ting\x18\x08 \x01(\x0b2).lq.SimulationV2MatchHistory.PushTingArgs\x12<\n\tfind_ting\x18\t \x01(\x0b2).lq.SimulationV2MatchHistory.FindTingArgs\x125\n\x05liuju\x18\n \x01(\x0b2&.lq.SimulationV2MatchHistory.LiujuArgs\x125\n\x05story\x18\x0b \x01(\x0b2&.lq.SimulationV2MatchHistory.StoryArgs\x1as\n\x0eRoundStartArgs\x12\'\n\x04info\x18\x01 \x01(\x0b2\x19.lq.SimulationV2MatchInfo\x12\x0e\n\x06scores\x18\x02 \x03(\x05\x12\x0c\n\x04ting\x18\x03 \x01(\r\x12\x1a\n\x12effected_buff_list\x18\x04 \x03(\r\x1a\x1a\n\nRiichiArgs\x12\x0c\n\x04seat\x18\x01 \x01(\r\x1a4\n\x08FuluArgs\x12\x0c\n\x04seat\x18\x01 \x01(\r\x12\x0c\n\x04ting\x18\x02 \x01(\r\x12\x0c\n\x04fulu\x18\x03 \x01(\r\x1al\n\x08HuleArgs\x12\x0c\n\x04seat\x18\x01 \x01(\r\x12\x0c\n\x04zimo\x18\x02 \x01(\x08\x12\x12\n\nchong_seat\x18\x03 \x01(\r\x12\r\n\x05point\x18\x04 \x01(\x05\x12\x0b\n\x03fan\x18\x05 \x01(\x05\x12\x14\n\x0cscore_modify\x18\x06 \x03(\x05\x1a*\n\x0cPushTingArgs\x12\x0c\n\x04seat\x18\x01 \x01(\r\x12\x0c\n\x04ting\x18\x02 \x01(\r\x1a,\n\x0cFindTingArgs\x12\x0c\n\x04seat\x18\x01 \x01(\r\x12\x0e\n\x06target\x18\x02 \x01(\r\x1a\x19\n\tLiujuArgs\x12\x0c\n\x04ting\x18\x01 \x03(\r\x1a\x1d\n\tStoryArgs\x12\x10\n\x08story_id\x18\x01 \x01(\r"\xd2\x04\n\x11SimulationV2Match\x12\'\n\x04info\x18\x01 \x01(\x0b2\x19.lq.SimulationV2MatchInfo\x129\n\x07players\x18\x02 \x03(\x0b2(.lq.SimulationV2Match.SimulationV2Player\x12-\n\x07history\x18\x03 \x03(\x0b2\x1c.lq.SimulationV2MatchHistory\x12\x0c\n\x04rank\x18\x04 \x03(\r\x12\x14\n\x0cis_match_end\x18\x05 \x01(\x08\x12)\n\x07actions\x18\x06 \x03(\x0b2\x18.lq.SimulationActionData\x12\'\n\tbuff_list\x18\t \x03(\x0b2\x14.lq.SimulationV2Buff\x12\x16\n\x0eis_first_round\x18\n \x01(\x08\x12\x19\n\x11last_event_remain\x18\x0b \x01(\r\x12\x1a\n\x12effected_buff_list\x18\x0c \x03(\r\x12\x17\n\x0ftriggered_story\x18\r \x03(\r\x1a\xc9\x01\n\x12SimulationV2Player\x12\n\n\x02id\x18\x01 \x01(\r\x12\x0c\n\x04main\x18\x02 \x01(\x08\x12\x0c\n\x04ting\x18\x04 \x01(\r\x12\r\n\x05score\x18\x05 \x01(\x05\x12\x0c\n\x04fulu\x18\x06 \x01(\r\x12\x0e\n\x06riichi\x18\x07 \x01(\x08\x12\x11\n\tfind_ting\x18\x08 \x03(\r\x12\x0c\n\x04seat\x18\t \x01(\r\x12\x15\n\rcon_push_ting\x18\n \x01(\r\x12\x15\n\rcon_keep_ting\x18\x0b \x01(\r\x12\x0f\n\x07ippatsu\x18\x0c \x01(\x08"\xae\x05\n\x14SimulationActionData\x12\x0c\n\x04type\x18\x01 \x01(\r\x129\n\x06riichi\x18\x02 \x01(\x0b2).lq.SimulationActionData.ActionRiichiData\x125\n\x04hule\x18\x03 \x01(\x0b2\'.lq.SimulationActionData.ActionHuleData\x125\n\x04fulu\x18\x04 \x01(\x0b2\'.lq.SimulationActionData.ActionFuluData\x12@\n\x0cdiscard_tile\x18\x05 \x01(\x0b2*.lq.SimulationActionData.ActionDiscardData\x12>\n\tdeal_tile\x18\x06 \x01(\x0b2+.lq.SimulationActionData.ActionDealTileData\x1a \n\x10ActionRiichiData\x12\x0c\n\x04seat\x18\x01 \x01(\r\x1a\xc3\x01\n\x0eActionHuleData\x12>\n\x04hule\x18\x01 \x03(\x0b20.lq.SimulationActionData.ActionHuleData.HuleInfo\x1aq\n\x08HuleInfo\x12\x0b\n\x03fan\x18\x01 \x01(\r\x12\x0c\n\x04zimo\x18\x02 \x01(\x08\x12\r\n\x05point\x18\x03 \x01(\r\x12\x0b\n\x03oya\x18\x04 \x01(\x08\x12\x0e\n\x06player\x18\x05 \x01(\r\x12\r\n\x05chong\x18\x06 \x01(\r\x12\x0f\n\x07toutiao\x18\x07 \x01(\x08\x1a\x1e\n\x0eActionFuluData\x12\x0c\n\x04seat\x18\x01 \x01(\r\x1a1\n\x11ActionDiscardData\x12\x0c\n\x04seat\x18\x01 \x01(\r\x12\x0e\n\x06riichi\x18\x02 \x01(\x08\x1a"\n\x12ActionDealTileData\x12\x0c\n\x04seat\x18\x01 \x01(\r"[\n\x11ResConnectionInfo\x12\x18\n\x05error\x18\x01 \x01(\x0b2\t.lq.Error\x12,\n\x0fclient_endpoint\x18\x02 \x01(\x0b2\x13.lq.NetworkEndpoint"K\n\x11ResFetchQueueInfo\x12\x18\n\x05error\x18\x01 \x01(\x0b2\t.lq.Error\x12\x0e\n\x06remain\x18\x02 \x01(\r\x12\x0c\n\x04rank\x18\x03 \x01(\r"-\n\x0eReqOpenidCheck\x12\x0c\n\x04type\x18\x01 \x01(\r\x12\r\n\x05token\x18\x02 \x01(\t"\xa3\x01\n\x10ReqSignupAccount\x12\x0f\n\x07account\x18\x01 \x01(\t\x12\x10\n\x08password\x18\x02 \x01(\t\x12\x0c\n\x04code\x18\x03 \x01(\t\x12\x0c\n\x04type\x18\x04 \x01(\r\x12$\n\x06device\x18\x05 \x01(\x0b2\x14.lq.ClientDeviceInfo\x12\x1d\n\x15client_version_string\x18\x06 \x01(\t\x12\x0b\n\x03tag\x18\x07 \x01(\t",\n\x10ResSignupAccount\x12\x18\n\x05error\x18\x01 \x01(\x0b2\t.lq.Error"\xaa\x02\n\x08ReqLogin\x12\x0f\n\x07account\x18\x01 \x01(\t\x12\x10\n\x08password\x18\x02 \x01(\t\x12\x11\n\treconnect\x18\x03 \x01(\x08\x12$\n\x06device\x18\x04 \x01(\x0b2\x14.lq.ClientDeviceInfo\x12\x12\n\nrandom_key\x18\x05 \x01(\t\x12-\n\x0eclient_version\x18\x06 \x01(\x0b2\x15.lq.ClientVersionInfo\x12\x18\n\x10gen_access_token\x18\x07 \x01(\x08\x12\x1a\n\x12currency_platforms\x18\x08 \x03(\r\x12\x0c\n\x04type\x18\t \x01(\r\x12\x0f\n\x07version\x18\n \x01(\r\x12\x1d\n\x15client_version_string\x18\x0b \x01(\t\x12\x0b\n\x03tag\x18\x0c \x01(\t"\xa9\x02\n\x08ResLogin\x12\x18\n\x05error\x18\x01 \x01(\x0b2\t.lq.Error\x12\x12\n\naccount_id\x18\x02 \x01(\r\x12\x1c\n\x07account\x18\x03 \x01(\x0b2\x0b.lq.Account\x12&\n\tgame_info\x18\x04 \x01(\x0b2\x13.lq.GameConnectInfo\x12\x1f\n\x17has_unread_announcement\x18\x05 \x01(\x08\x12\x14\n\x0caccess_token\x18\x06 \x01(\t\x12\x13\n\x0bsignup_time\x18\x07 \x01(\r\x12\x19\n\x11is_id_card_authed\x18\x08 \x01(\x08\x12\x0f\n\x07country\x18\t \x01(\t\x12\x17\n\x0flogined_version\x18\n \x03(\r\x12\x18\n\x10rewarded_version\x18\x0b \x03(\r"\xcb\x01\n\rReqEmailLogin\x12\r\n\x05email\x18\x01 \x01(\t\x12\x10\n\x08password\x18\x02 \x01(\t\x12\x11\n\treconnect\x18\x03 \x01(\x08\x12$\n\x06device\x18\x04 \x01(\x0b2\x14.lq.ClientDeviceInfo\x12\x12\n\nrandom_key\x18\x05 \x01(\t\x12\x16\n\x0eclient_version\x18\x06 \x01(\t\x12\x18\n\x10gen_access_token\x18\x07 \x01(\x08\x12\x1a\n\x12currency_platforms\x18\x08 \x03(\r"3\n\x0eReqBindAccount\x12\x0f\n\x07account\x18\x01 \x01(\t\x12\x10\n\x08password\x18\x02 \x01(\t"8\n\x18ReqCreatePhoneVerifyCode\x12\r\n\x05phone\x18\x01 \x01(\t\x12\r\n\x05usage\x18\x02 \x01(\r"8\n\x18ReqCreateEmailVerifyCode\x12\r\n\x05email\x18\x01 \x01(\t\x12\r\n\x05usage\x18\x02 \x01(\r"9\n\x16ReqVerifyCodeForSecure\x12\x0c\n\x04code\x18\x01 \x01(\t\x12\x11\n\toperation\x18\x02 \x01(\r"H\n\x16ResVerfiyCodeForSecure\x12\x18\n\x05error\x18\x01 \x01(\x0b2\t.lq.Error\x12\x14\n\x0csecure_token\x18\x02 \x01(\t"_\n\x12ReqBindPhoneNumber\x12\x0c\n\x04code\x18\x01 \x01(\t\x12\r\n\x05phone\x18\x02 \x01(\t\x12\x10\n\x08password\x18\x03 \x01(\t\x12\x1a\n\x12multi_bind_version\x18\x04 \x01(\x08"E\n\x14ReqUnbindPhoneNumber\x12\x0c\n\x04code\x18\x01 \x01(\t\x12\r\n\x05phone\x18\x02 \x01(\t\x12\x10\n\x08password\x18\x03 \x01(\t"G\n\x16ResFetchPhoneLoginBind\x12\x18\n\x05error\x18\x01 \x01(\x0b2\t.lq.Error\x12\x13\n\x0bphone_login\x18\x02 \x01(\r"+\n\x17ReqCreatePhoneLoginBind\x12\x10\n\x08password\x18\x01 \x01(\t"=\n\x0cReqBindEmail\x12\r\n\x05email\x18\x01 \x01(\t\x12\x0c\n\x04code\x18\x02 \x01(\t\x12\x10\n\x08password\x18\x03 \x01(\t"U\n\x11ReqModifyPassword\x12\x14\n\x0cnew_password\x18\x01 \x01(\t\x12\x14\n\x0cold_password\x18\x02 \x01(\t\x12\x14\n\x0csecure_token\x18\x03 \x01(\t"W\n\rReqOauth2Auth\x12\x0c\n\x04type\x18\x01 \x01(\r\x12\x0c\n\x04code\x18\x02 \x01(\t\x12\x0b\n\x03uid\x18\x03 \x01(\t\x12\x1d\n\x15client_version_string\x18\x04 \x01(\t"?\n\rResOauth2Auth\x12\x18\n\x05error\x18\x01 \x01(\x0b2\t.lq.Error\x12\x14\n\x0caccess_token\x18\x02 \x01(\t"4\n\x0eReqOauth2Check\x12\x0c\n\x04type\x18\x01 \x01(\r\x12\x14\n\x0caccess_token\x18\x02 \x01(\t"?\n\x0eResOauth2Check\x12\x18\n\x05error\x18\x01 \x01(\x0b2\t.lq.Error\x12\x13\n\x0bhas_account\x18\x02 \x01(\x08"\xdc\x01\n\x0fReqOauth2Signup\x12\x0c\n\x04type\x18\x01 \x01(\r\x12\x14\n\x0caccess_token\x18\x02 \x01(\t\x12\r\n\x05email\x18\x03 \x01(\t\x12\x15\n\radvertise_str\x18\x04 \x01(\t\x12$\n\x06device\x18\x05 \x01(\x0b2\x14.lq.ClientDeviceInfo\x12-\n\x0eclient_version\x18\x06 \x01(\x0b2\x15.lq.ClientVersionInfo\x12\x1d\n\x15client_version_string\x18\x07 \x01(\t\x12\x0b\n\x03tag\x18\x08 \x01(\t"+\n\x0fResOauth2Signup\x12\x18\n\x05error\x18\x01 \x01(\x0b2\t.lq.Error"\xa3\x02\n\x0eReqOauth2Login\x12\x0c\n\x04type\x18\x01 \x01(\r\x12\x14\n\x0caccess_token\x18\x02 \x01(\t\x12\x11\n\treconnect\x18\x03 \x01(\x08\x12$\n\x06device\x18\x04 \x01(\x0b2\x14.lq.ClientDeviceInfo\x12\x12\n\nrandom_key\x18\x05 \x01(\t\x12-\n\x0eclient_version\x18\x06 \x01(\x0b2\x15.lq.ClientVersionInfo\x12\x18\n\x10gen_access_token\x18\x07 \x01(\x08\x12\x1a\n\x12currency_platforms\x18\x08 \x03(\r\x12\x0f\n\x07version\x18\t \x01(\r\x12\x1d\n\x15client_version_string\x18\n \x01(\t\x12\x0b\n\x03tag\x18\x0b \x01(\t"$\n\x0eReqDMMPreLogin\x12\x12\n\nfinish_url\x18\x01 \x01(\t"=\n\x0eResDMMPreLogin\x12\x18\n\x05error\x18\x02 \x01(\x0b2\t.lq.Error\x12\x11\n\tparameter\x18\x01 \x01(\t"\x0b\n\tReqLogout"%\n\tResLogout\x12\x18\n\x05error\x18\x01 \x01(\x0b2\t.lq.Error"+\n\x0bReqHeatBeat\x12\x1c\n\x14no_operation_counter\x18\x01 \x01(\r"$\n\x15ReqSearchAccountByEid\x12\x0b\n\x03eid\x18\x01 \x01(\r"E\n\x15ResSearchAccountbyEid\x12\x18\n\x05error\x18\x01 \x01(\x0b2\t.lq.Error\x12\x12\n\naccount_id\x18\x02 \x01(\r" \n\x0cReqLoginBeat\x12\x10\n\x08contract\x18\x01 \x01(\t"F\n\x11ReqJoinMatchQueue\x12\x12\n\nmatch_mode\x18\x01 \x01(\r\x12\x1d\n\x15client_version_string\x18\x02 \x01(\t")\n\x13ReqCancelMatchQueue\x12\x12\n\nmatch_mode\x18\x01 \x01(\r"$\n\x0eReqAccountInfo\x12\x12\n\naccount_id\x18\x01 \x01(\r"`\n\x0eResAccountInfo\x12\x18\n\x05error\x18\x01 \x01(\x0b2\t.lq.Error\x12\x1c\n\x07account\x18\x02 \x01(\x0b2\x0b.lq.Account\x12\x16\n\x04room\x18\x03 \x01(\x0b2\x08.lq.Room"I\n\x11ReqCreateNickname\x12\x10\n\x08nickname\x18\x01 \x01(\t\x12\x15\n\radvertise_str\x18\x02 \x01(\t\x12\x0b\n\x03tag\x18\x03 \x01(\t":\n\x11ReqModifyNickname\x12\x10\n\x08nickname\x18\x01 \x01(\t\x12\x13\n\x0buse_item_id\x18\x02 \x01(\r"%\n\x11ReqModifyBirthday\x12\x10\n\x08birthday\x18\x01 \x01(\x05"?\n\x0bResSelfRoom\x12\x18\n\x05error\x18\x01 \x01(\x0b2\t.lq.Error\x12\x16\n\x04room\x18\x02 \x01(\x0b2\x08.lq.Room"V\n\x12ResFetchGamingInfo\x12\x18\n\x05error\x18\x01 \x01(\x0b2\t.lq.Error\x12&\n\tgame_info\x18\x02 \x01(\x0b2\x13.lq.GameConnectInfo"\x87\x01\n\rReqCreateRoom\x12\x14\n\x0cplayer_count\x18\x01 \x01(\r\x12\x1a\n\x04mode\x18\x02 \x01(\x0b2\x0c.lq.GameMode\x12\x13\n\x0bpublic_live\x18\x03 \x01(\x08\x12\x1d\n\x15client_version_string\x18\x04 \x01(\t\x12\x10\n\x08pre_rule\x18\x05 \x01(\t"A\n\rResCreateRoom\x12\x18\n\x05error\x18\x01 \x01(\x0b2\t.lq.Error\x12\x16\n\x04room\x18\x02 \x01(\x0b2\x08.lq.Room"=\n\x0bReqJoinRoom\x12\x0f\n\x07room_id\x18\x01 \x01(\r\x12\x1d\n\x15client_version_string\x18\x02 \x01(\t"?\n\x0bResJoinRoom\x12\x18\n\x05error\x18\x01 \x01(\x0b2\t.lq.Error\x12\x16\n\x04room\x18\x02 \x01(\x0b2\x08.lq.Room"\x1d\n\x0cReqRoomReady\x12\r\n\x05ready\x18\x01 \x01(\x08"#\n\x0fReqRoomDressing\x12\x10\n\x08dressing\x18\x01 \x01(\x08"\x0e\n\x0cReqRoomStart"\x1f\n\x11ReqRoomKickPlayer\x12\n\n\x02id\x18\x01 \x01(\r"$\n\rReqModifyRoom\x12\x13\n\x0brobot_count\x18\x01 \x01(\r"#\n\x0fReqAddRoomRobot\x12\x10\n\x08position\x18\x01 \x01(\r"$\n\x0fReqChangeAvatar\x12\x11\n\tavatar_id\x18\x01 \x01(\r"-\n\x17ReqAccountStatisticInfo\x12\x12\n\naccount_id\x18\x01 \x01(\r"\x98\x01\n\x17ResAccountStatisticInfo\x12\x18\n\x05error\x18\x01 \x01(\x0b2\t.lq.Error\x120\n\x0estatistic_data\x18\x02 \x03(\x0b2\x18.lq.AccountStatisticData\x121\n\x0bdetail_data\x18\x03 \x01(\x0b2\x1c.lq.AccountDetailStatisticV2"\xb9\x01\n\x1bResAccountChallengeRankInfo\x12\x18\n\x05error\x18\x01 \x01(\x0b2\t.lq.Error\x12B\n\x0bseason_info\x18\x02 \x03(\x0b2-.lq.ResAccountChallengeRankInfo.ChallengeRank\x1a<\n\rChallengeRank\x12\x0e\n\x06season\x18\x01 \x01(\r\x12\x0c\n\x04rank\x18\x02 \x01(\r\x12\r\n\x05level\x18\x03 \x01(\r"H\n\x17ResAccountCharacterInfo\x12\x18\n\x05error\x18\x02 \x01(\x0b2\t.lq.Error\x12\x13\n\x0bunlock_list\x18\x01 \x03(\r"+\n\x0fReqShopPurchase\x12\x0c\n\x04type\x18\x01 \x01(\t\x12\n\n\x02id\x18\x02 \x01(\r"N\n\x0fResShopPurchase\x12\x18\n\x05error\x18\x01 \x01(\x0b2\t.lq.Error\x12!\n\x06update\x18\x02 \x01(\x0b2\x11.lq.AccountUpdate"A\n\rReqGameRecord\x12\x11\n\tgame_uuid\x18\x01 \x01(\t\x12\x1d\n\x15client_version_string\x18\x02 \x01(\t"g\n\rResGameRecord\x12\x18\n\x05error\x18\x01 \x01(\x0b2\t.lq.Error\x12\x1c\n\x04head\x18\x03 \x01(\x0b2\x0e.lq.RecordGame\x12\x0c\n\x04data\x18\x04 \x01(\x0c\x12\x10\n\x08data_url\x18\x05 \x01(\t"?\n\x11ReqGameRecordList\x12\r\n\x05start\x18\x01 \x01(\r\x12\r\n\x05count\x18\x02 \x01(\r\x12\x0c\n\x04type\x18\x03 \x01(\r"g\n\x11ResGameRecordList\x12\x18\n\x05error\x18\x01 \x01(\x0b2\t.lq.Error\x12\x13\n\x0btotal_count\x18\x02 \x01(\r\x12#\n\x0brecord_list\x18\x03 \x03(\x0b2\x0e.lq.RecordGame"\x8f\x01\n\x13ReqGameRecordListV2\x12\x0b\n\x03tag\x18\x01 \x01(\r\x12\x12\n\nbegin_time\x18\x02 \x01(\r\x12\x10\n\x08end_time\x18\x03 \x01(\r\x12\r\n\x05ranks\x18\x04 \x03(\r\x12\r\n\x05modes\x18\x05 \x03(\r\x12\x13\n\x0bmax_hu_type\x18\x06 \x01(\r\x12\x12\n\nlevel_mode\x18\x07 \x03(\r"\x8e\x01\n\x13ResGameRecordListV2\x12\x18\n\x05error\x18\x01 \x01(\x0b2\t.lq.Error\x12\x10\n\x08iterator\x18\x02 \x01(\t\x12\x17\n\x0fiterator_expire\x18\x03 \x01(\r\x12\x19\n\x11actual_begin_time\x18\x04 \x01(\r\x12\x17\n\x0factual_end_time\x18\x05 \x01(\r"8\n\x15ReqNextGameRecordList\x12\x10\n\x08iterator\x18\x01 \x01(\t\x12\r\n\x05count\x18\x02 \x01(\r"\x95\x01\n\x15ResNextGameRecordList\x12\x18\n\x05error\x18\x01 \x01(\x0b2\t.lq.Error\x12\x0c\n\x04next\x18\x02 \x01(\x08\x12$\n\x07entries\x18\x03 \x03(\x0b2\x13.lq.RecordListEntry\x12\x17\n\x0fiterator_expire\x18\x04 \x01(\r\x12\x15\n\rnext_end_time\x18\x05 \x01(\r"\x82\x01\n\x1aResCollectedGameRecordList\x12\x18\n\x05error\x18\x01 \x01(\x0b2\t.lq.Error\x12,\n\x0brecord_list\x18\x02 \x03(\x0b2\x17.lq.RecordCollectedData\x12\x1c\n\x14record_collect_limit\x18\x03 \x01(\r")\n\x14ReqGameRecordsDetail\x12\x11\n\tuuid_list\x18\x01 \x03(\t"U\n\x14ResGameRecordsDetail\x12\x18\n\x05error\x18\x01 \x01(\x0b2\t.lq.Error\x12#\n\x0brecord_list\x18\x02 \x03(\x0b2\x0e.lq.RecordGame"+\n\x16ReqGameRecordsDetailV2\x12\x11\n\tuuid_list\x18\x01 \x03(\t"X\n\x16ResGameRecordsDetailV2\x12\x18\n\x05error\x18\x01 \x01(\x0b2\t.lq.Error\x12$\n\x07entries\x18\x02 \x03(\x0b2\x13.lq.RecordListEntry"`\n\x19ReqAddCollectedGameRecord\x12\x0c\n\x04uuid\x18\x01 \x01(\t\x12\x0f\n\x07remarks\x18\x02 \x01(\t\x12\x12\n\nstart_time\x18\x03 \x01(\r\x12\x10\n\x08end_time\x18\x04 \x01(\r"5\n\x19ResAddCollectedGameRecord\x12\x18\n\x05error\x18\x01 \x01(\x0b2\t.lq.Error",\n\x1cReqRemoveCollectedGameRecord\x12\x0c\n\x04uuid\x18\x01 \x01(\t"8\n\x1cResRemoveCollectedGameRecord\x12\x18\n\x05error\x18\x01 \x01(\x0b2\t.lq.Error"D\n#ReqChangeCollectedGameRecordRemarks\x12\x0c\n\x04uuid\x18\x01 \x01(\t\x12\x0f\n\x07remarks\x18\x02 \x01(\t"?\n#ResChangeCollectedGameRecordRemarks\x12\x18\n\x05error\x18\x01 \x01(\x0b2\t.lq.Error"#\n\x13ReqLevelLeaderboard\x12\x0c\n\x04type\x18\x01 \x01(\r"\xac\x01\n\x13ResLevelLeaderboard\x12\x18\n\x05error\x18\x01 \x01(\x0b2\t.lq.Error\x12+\n\x05items\x18\x02 \x03(\x0b2\x1c.lq.ResLevelLeaderboard.Item\x12\x11\n\tself_rank\x18\x03 \x01(\r\x1a;\n\x04Item\x12\x12\n\naccount_id\x18\x01 \x01(\r\x12\x1f\n\x05level\x18\x02 \x01(\x0b2\x10.lq.AccountLevel")\n\x17ReqChallangeLeaderboard\x12\x0e\n\x06season\x18\x01 \x01(\r"\xb4\x01\n\x17ResChallengeLeaderboard\x12\x18\n\x05error\x18\x01 \x01(\x0b2\t.lq.Error\x12/\n\x05items\x18\x02 \x03(\x0b2 .lq.ResChallengeLeaderboard.Item\x12\x11\n\tself_rank\x18\x03 \x01(\r\x1a;\n\x04Item\x12\x12\n\naccount_id\x18\x01 \x01(\r\x12\r\n\x05level\x18\x02 \x01(\r\x12\x10\n\x08nickname\x18\x03 \x01(\t"@\n\x15ReqMutiChallengeLevel\x12\x17\n\x0faccount_id_list\x18\x01 \x03(\r\x12\x0e\n\x06season\x18\x02 \x01(\r"\x8b\x01\n\x15ResMutiChallengeLevel\x12\x18\n\x05error\x18\x01 \x01(\x0b2\t.lq.Error\x12-\n\x05items\x18\x02 \x03(\x0b2\x1e.lq.ResMutiChallengeLevel.Item\x1a)\n\x04Item\x12\x12\n\naccount_id\x18\x01 \x01(\r\x12\r\n\x05level\x18\x02 \x01(\r",\n\x11ReqMultiAccountId\x12\x17\n\x0faccount_id_list\x18\x01 \x03(\r"U\n\x14ResMultiAccountBrief\x12\x18\n\x05error\x18\x01 \x01(\x0b2\t.lq.Error\x12#\n\x07players\x18\x02 \x03(\x0b2\x12.lq.PlayerBaseView"v\n\rResFriendList\x12\x18\n\x05error\x18\x01 \x01(\x0b2\t.lq.Error\x12\x1b\n\x07friends\x18\x02 \x03(\x0b2\n.lq.Friend\x12\x18\n\x10friend_max_count\x18\x03 \x01(\r\x12\x14\n\x0cfriend_count\x18\x04 \x01(\r"\x9a\x01\n\x12ResFriendApplyList\x12\x18\n\x05error\x18\x01 \x01(\x0b2\t.lq.Error\x123\n\x07applies\x18\x02 \x03(\x0b2".lq.ResFriendApplyList.FriendApply\x1a5\n\x0bFriendApply\x12\x12\n\naccount_id\x18\x01 \x01(\r\x12\x12\n\napply_time\x18\x02 \x01(\r"#\n\x0eReqApplyFriend\x12\x11\n\ttarget_id\x18\x01 \x01(\r"9\n\x14ReqHandleFriendApply\x12\x11\n\ttarget_id\x18\x01 \x01(\r\x12\x0e\n\x06method\x18\x02 \x01(\r"$\n\x0fReqRemoveFriend\x12\x11\n\ttarget_id\x18\x01 \x01(\r"A\n\x19ReqSearchAccountByPattern\x12\x13\n\x0bsearch_next\x18\x01 \x01(\x08\x12\x0f\n\x07pattern\x18\x02 \x01(\t"u\n\x19ResSearchAccountByPattern\x12\x18\n\x05error\x18\x01 \x01(\x0b2\t.lq.Error\x12\x13\n\x0bis_finished\x18\x02 \x01(\x08\x12\x16\n\x0ematch_accounts\x18\x03 \x03(\r\x12\x11\n\tdecode_id\x18\x04 \x01(\r")\n\x0eReqAccountList\x12\x17\n\x0faccount_id_list\x18\x01 \x03(\r"T\n\x10ResAccountStates\x12\x18\n\x05error\x18\x01 \x01(\x0b2\t.lq.Error\x12&\n\x06states\x18\x02 \x03(\x0b2\x16.lq.AccountActiveState"*\n\x14ReqSearchAccountById\x12\x12\n\naccount_id\x18\x01 \x01(\r"T\n\x14ResSearchAccountById\x12\x18\n\x05error\x18\x01 \x01(\x0b2\t.lq.Error\x12"\n\x06player\x18\x02 \x01(\x0b2\x12.lq.PlayerBaseView"<\n\nResBagInfo\x12\x18\n\x05error\x18\x01 \x01(\x0b2\t.lq.Error\x12\x14\n\x03bag\x18\x02 \x01(\x0b2\x07.lq.Bag" \n\rReqUseBagItem\x12\x0f\n\x07item_id\x18\x01 \x01(\r"F\n\x11ReqOpenManualItem\x12\x0f\n\x07item_id\x18\x01 \x01(\r\x12\r\n\x05count\x18\x02 \x01(\r\x12\x11\n\tselect_id\x18\x03 \x01(\r"9\n\x17ReqOpenRandomRewardItem\x12\x0f\n\x07item_id\x18\x01 \x01(\r\x12\r\n\x05count\x18\x02 \x01(\r"T\n\x17ResOpenRandomRewardItem\x12\x18\n\x05error\x18\x01 \x01(\x0b2\t.lq.Error\x12\x1f\n\x07results\x18\x02 \x03(\x0b2\x0e.lq.OpenResult"\'\n\x14ReqOpenAllRewardItem\x12\x0f\n\x07item_id\x18\x01 \x01(\r"Q\n\x14ResOpenAllRewardItem\x12\x18\n\x05error\x18\x01 \x01(\x0b2\t.lq.Error\x12\x1f\n\x07results\x18\x02 \x03(\x0b2\x0e.lq.OpenResult""\n\x0fReqComposeShard\x12\x0f\n\x07item_id\x18\x01 \x01(\r"6\n\x14ReqFetchAnnouncement\x12\x0c\n\x04lang\x18\x01 \x01(\t\x12\x10\n\x08platform\x18\x02 \x01(\t"u\n\x0fResAnnouncement\x12\x18\n\x05error\x18\x01 \x01(\x0b2\t.lq.Error\x12\'\n\rannouncements\x18\x02 \x03(\x0b2\x10.lq.Announcement\x12\x0c\n\x04sort\x18\x03 \x03(\r\x12\x11\n\tread_list\x18\x04 \x03(\r"@\n\x0bResMailInfo\x12\x18\n\x05error\x18\x01 \x01(\x0b2\t.lq.Error\x12\x17\n\x05mails\x18\x02 \x03(\x0b2\x08.lq.Mail"\x1e\n\x0bReqReadMail\x12\x0f\n\x07mail_id\x18\x01 \x01(\r" \n\rReqDeleteMail\x12\x0f\n\x07mail_id\x18\x01 \x01(\r"$\n\x11ReqTakeAttachment\x12\x0f\n\x07mail_id\x18\x01 \x01(\r"4\n ReqReceiveAchievementGroupReward\x12\x10\n\x08group_id\x18\x01 \x01(\r"g\n ResReceiveAchievementGroupReward\x12\x18\n\x05error\x18\x01 \x01(\x0b2\t.lq.Error\x12)\n\x0eexecute_reward\x18\x02 \x03(\x0b2\x11.lq.ExecuteReward"5\n\x1bReqReceiveAchievementReward\x12\x16\n\x0eachievement_id\x18\x01 \x01(\r"b\n\x1bResReceiveAchievementReward\x12\x18\n\x05error\x18\x01 \x01(\x0b2\t.lq.Error\x12)\n\x0eexecute_reward\x18\x02 \x03(\x0b2\x11.lq.ExecuteReward"\x9b\x01\n\x17ResFetchAchievementRate\x12\x18\n\x05error\x18\x02 \x01(\x0b2\t.lq.Error\x129\n\x04rate\x18\x01 \x03(\x0b2+.lq.ResFetchAchievementRate.AchievementRate\x1a+\n\x0fAchievementRate\x12\n\n\x02id\x18\x01 \x01(\r\x12\x0c\n\x04rate\x18\x02 \x01(\r"o\n\x0eResAchievement\x12\x18\n\x05error\x18\x01 \x01(\x0b2\t.lq.Error\x12+\n\nprogresses\x18\x02 \x03(\x0b2\x17.lq.AchievementProgress\x12\x16\n\x0erewarded_group\x18\x03 \x03(\r"<\n\x0cResTitleList\x12\x18\n\x05error\x18\x01 \x01(\x0b2\t.lq.Error\x12\x12\n\ntitle_list\x18\x02 \x03(\r"\x1c\n\x0bReqUseTitle\x12\r\n\x05title\x18\x01 \x01(\r"\x1d\n\rReqBuyShiLian\x12\x0c\n\x04type\x18\x01 \x01(\r"2\n\x14ReqUpdateClientValue\x12\x0b\n\x03key\x18\x01 \x01(\r\x12\r\n\x05value\x18\x02 \x01(\r"\x91\x01\n\x0eResClientValue\x12\x18\n\x05error\x18\x03 \x01(\x0b2\t.lq.Error\x12\'\n\x05datas\x18\x01 \x03(\x0b2\x18.lq.ResClientValue.Value\x12\x17\n\x0frecharged_count\x18\x02 \x01(\r\x1a#\n\x05Value\x12\x0b\n\x03key\x18\x01 \x01(\r\x12\r\n\x05value\x18\x02 \x01(\r"6\n\x10ReqClientMessage\x12\x11\n\ttimestamp\x18\x01 \x01(\r\x12\x0f\n\x07message\x18\x02 \x01(\t"(\n\x13ReqCurrentMatchInfo\x12\x11\n\tmode_list\x18\x01 \x03(\r"\xa6\x01\n\x13ResCurrentMatchInfo\x12\x18\n\x05error\x18\x01 \x01(\x0b2\t.lq.Error\x129\n\x07matches\x18\x02 \x03(\x0b2(.lq.ResCurrentMatchInfo.CurrentMatchInfo\x1a:\n\x10CurrentMatchInfo\x12\x0f\n\x07mode_id\x18\x01 \x01(\r\x12\x15\n\rplaying_count\x18\x02 \x01(\r"\xe1\x01\n\x0fReqUserComplain\x12\x11\n\ttarget_id\x18\x01 \x01(\r\x12\x0c\n\x04type\x18\x02 \x01(\r\x12\x0f\n\x07content\x18\x03 \x01(\t\x12\x11\n\tgame_uuid\x18\x04 \x01(\t\x125\n\nround_info\x18\x05 \x01(\x0b2!.lq.ReqUserComplain.GameRoundInfo\x1aR\n\rGameRoundInfo\x12\r\n\x05chang\x18\x01 \x01(\r\x12\n\n\x02ju\x18\x02 \x01(\r\x12\x0b\n\x03ben\x18\x03 \x01(\r\x12\x0c\n\x04seat\x18\x04 \x01(\r\x12\x0b\n\x03xun\x18\x05 \x01(\r"I\n\x13ReqReadAnnouncement\x12\x17\n\x0fannouncement_id\x18\x01 \x01(\r\x12\x19\n\x11announcement_list\x18\x02 \x03(\r"A\n\x11ResReviveCoinInfo\x12\x18\n\x05error\x18\x01 \x01(\x0b2\t.lq.Error\x12\x12\n\nhas_gained\x18\x02 \x01(\x08"\x9e\x01\n\x0cResDailyTask\x12\x18\n\x05error\x18\x01 \x01(\x0b2\t.lq.Error\x12$\n\nprogresses\x18\x02 \x03(\x0b2\x10.lq.TaskProgress\x12\x19\n\x11has_refresh_count\x18\x03 \x01(\x08\x12\x1c\n\x14max_daily_task_count\x18\x04 \x01(\r\x12\x15\n\rrefresh_count\x18\x05 \x01(\r"&\n\x13ReqRefreshDailyTask\x12\x0f\n\x07task_id\x18\x01 \x01(\r"j\n\x13ResRefreshDailyTask\x12\x18\n\x05error\x18\x01 \x01(\x0b2\t.lq.Error\x12"\n\x08progress\x18\x02 \x01(\x0b2\x10.lq.TaskProgress\x12\x15\n\rrefresh_count\x18\x03 \x01(\r"\x1e\n\x0eReqUseGiftCode\x12\x0c\n\x04code\x18\x01 \x01(\t"K\n\x0eResUseGiftCode\x12\x18\n\x05error\x18\x01 \x01(\x0b2\t.lq.Error\x12\x1f\n\x07rewards\x18\x06 \x03(\x0b2\x0e.lq.RewardSlot"U\n\x15ResUseSpecialGiftCode\x12\x18\n\x05error\x18\x01 \x01(\x0b2\t.lq.Error\x12"\n\x07rewards\x18\x02 \x03(\x0b2\x11.lq.ExecuteReward"H\n\x14ReqSendClientMessage\x12\x11\n\ttarget_id\x18\x01 \x01(\r\x12\x0c\n\x04type\x18\x02 \x01(\r\x12\x0f\n\x07content\x18\x03 \x01(\t"$\n\x0fReqGameLiveInfo\x12\x11\n\tgame_uuid\x18\x01 \x01(\t"\xaf\x01\n\x0fResGameLiveInfo\x12\x18\n\x05error\x18\x01 \x01(\x0b2\t.lq.Error\x12\x1a\n\x12left_start_seconds\x18\x02 \x01(\r\x12#\n\tlive_head\x18\x03 \x01(\x0b2\x10.lq.GameLiveHead\x12(\n\x08segments\x18\x04 \x03(\x0b2\x16.lq.GameLiveSegmentUri\x12\x17\n\x0fnow_millisecond\x18\x05 \x01(\r"D\n\x16ReqGameLiveLeftSegment\x12\x11\n\tgame_uuid\x18\x01 \x01(\t\x12\x17\n\x0flast_segment_id\x18\x02 \x01(\r"\xaa\x01\n\x16ResGameLiveLeftSegment\x12\x18\n\x05error\x18\x01 \x01(\x0b2\t.lq.Error\x12\x12\n\nlive_state\x18\x02 \x01(\r\x12(\n\x08segments\x18\x04 \x03(\x0b2\x16.lq.GameLiveSegmentUri\x12\x17\n\x0fnow_millisecond\x18\x05 \x01(\r\x12\x1f\n\x17segment_end_millisecond\x18\x06 \x01(\r"$\n\x0fReqGameLiveList\x12\x11\n\tfilter_id\x18\x01 \x01(\r"P\n\x0fResGameLiveList\x12\x18\n\x05error\x18\x01 \x01(\x0b2\t.lq.Error\x12#\n\tlive_list\x18\x02 \x03(\x0b2\x10.lq.GameLiveHead"D\n\x11ResCommentSetting\x12\x18\n\x05error\x18\x01 \x01(\x0b2\t.lq.Error\x12\x15\n\rcomment_allow\x18\x02 \x01(\r"0\n\x17ReqUpdateCommentSetting\x12\x15\n\rcomment_allow\x18\x01 \x01(\r"(\n\x13ReqFetchCommentList\x12\x11\n\ttarget_id\x18\x01 \x01(\r"u\n\x13ResFetchCommentList\x12\x18\n\x05error\x18\x01 \x01(\x0b2\t.lq.Error\x12\x15\n\rcomment_allow\x18\x02 \x01(\r\x12\x17\n\x0fcomment_id_list\x18\x03 \x03(\r\x12\x14\n\x0clast_read_id\x18\x04 \x01(\r"D\n\x16ReqFetchCommentContent\x12\x11\n\ttarget_id\x18\x01 \x01(\r\x12\x17\n\x0fcomment_id_list\x18\x02 \x03(\r"U\n\x16ResFetchCommentContent\x12\x18\n\x05error\x18\x01 \x01(\x0b2\t.lq.Error\x12!\n\x08comments\x18\x02 \x03(\x0b2\x0f.lq.CommentItem"5\n\x0fReqLeaveComment\x12\x11\n\ttarget_id\x18\x01 \x01(\r\x12\x0f\n\x07content\x18\x02 \x01(\t":\n\x10ReqDeleteComment\x12\x11\n\ttarget_id\x18\x01 \x01(\r\x12\x13\n\x0bdelete_list\x18\x02 \x03(\r"\'\n\x14ReqUpdateReadComment\x12\x0f\n\x07read_id\x18\x01 \x01(\r"T\n\x15ResFetchRollingNotice\x12\x18\n\x05error\x18\x02 \x01(\x0b2\t.lq.Error\x12!\n\x06notice\x18\x03 \x01(\x0b2\x11.lq.RollingNotice"V\n\x16ResFetchMaintainNotice\x12\x18\n\x05error\x18\x01 \x01(\x0b2\t.lq.Error\x12"\n\x06notice\x18\x02 \x01(\x0b2\x12.lq.MaintainNotice"%\n\x15ReqFetchRollingNotice\x12\x0c\n\x04lang\x18\x01 \x01(\t">\n\rResServerTime\x12\x13\n\x0bserver_time\x18\x01 \x01(\r\x12\x18\n\x05error\x18\x02 \x01(\x0b2\t.lq.Error"0\n\x1aReqPlatformBillingProducts\x12\x12\n\nshelves_id\x18\x01 \x01(\r"\\\n\x1aResPlatformBillingProducts\x12\x18\n\x05error\x18\x01 \x01(\x0b2\t.lq.Error\x12$\n\x08products\x18\x02 \x03(\x0b2\x12.lq.BillingProduct"\x8b\x01\n\x15ReqCreateBillingOrder\x12\x10\n\x08goods_id\x18\x01 \x01(\r\x12\x18\n\x10payment_platform\x18\x02 \x01(\r\x12\x13\n\x0bclient_type\x18\x03 \x01(\r\x12\x12\n\naccount_id\x18\x04 \x01(\r\x12\x1d\n\x15client_version_string\x18\x05 \x01(\t"C\n\x15ResCreateBillingOrder\x12\x18\n\x05error\x18\x01 \x01(\x0b2\t.lq.Error\x12\x10\n\x08order_id\x18\x02 \x01(\t"T\n\x17ReqSolveGooglePlayOrder\x12\x1b\n\x13inapp_purchase_data\x18\x02 \x01(\t\x12\x1c\n\x14inapp_data_signature\x18\x03 \x01(\t"h\n\x19ReqSolveGooglePlayOrderV3\x12\x10\n\x08order_id\x18\x01 \x01(\t\x12\x16\n\x0etransaction_id\x18\x02 \x01(\t\x12\r\n\x05token\x18\x03 \x01(\t\x12\x12\n\naccount_id\x18\x04 \x01(\r",\n\x18ReqCancelGooglePlayOrder\x12\x10\n\x08order_id\x18\x01 \x01(\t"\x8a\x01\n\x1aReqCreateWechatNativeOrder\x12\x10\n\x08goods_id\x18\x01 \x01(\r\x12\x13\n\x0bclient_type\x18\x02 \x01(\r\x12\x12\n\naccount_id\x18\x03 \x01(\r\x12\x12\n\naccount_ip\x18\x04 \x01(\t\x12\x1d\n\x15client_version_string\x18\x05 \x01(\t"_\n\x1aResCreateWechatNativeOrder\x12\x18\n\x05error\x18\x01 \x01(\x0b2\t.lq.Error\x12\x15\n\rqrcode_buffer\x18\x02 \x01(\t\x12\x10\n\x08order_id\x18\x03 \x01(\t"\x87\x01\n\x17ReqCreateWechatAppOrder\x12\x10\n\x08goods_id\x18\x01 \x01(\r\x12\x13\n\x0bclient_type\x18\x02 \x01(\r\x12\x12\n\naccount_id\x18\x03 \x01(\r\x12\x12\n\naccount_ip\x18\x04 \x01(\t\x12\x1d\n\x15client_version_string\x18\x05 \x01(\t"\x91\x02\n\x17ResCreateWechatAppOrder\x12\x18\n\x05error\x18\x01 \x01(\x0b2\t.lq.Error\x12M\n\x15call_wechat_app_param\x18\x02 \x01(\x0b2..lq.ResCreateWechatAppOrder.CallWechatAppParam\x1a\x8c\x01\n\x12CallWechatAppParam\x12\r\n\x05appid\x18\x01 \x01(\t\x12\x11\n\tpartnerid\x18\x02 \x01(\t\x12\x10\n\x08prepayid\x18\x03 \x01(\t\x12\x0f\n\x07package\x18\x04 \x01(\t\x12\x10\n\x08noncestr\x18\x05 \x01(\t\x12\x11\n\ttimestamp\x18\x06 \x01(\t\x12\x0c\n\x04sign\x18\x07 \x01(\t"\x9f\x01\n\x14ReqCreateAlipayOrder\x12\x10\n\x08goods_id\x18\x01 \x01(\r\x12\x13\n\x0bclient_type\x18\x02 \x01(\r\x12\x12\n\naccount_id\x18\x03 \x01(\r\x12\x19\n\x11alipay_trade_type\x18\x04 \x01(\t\x12\x12\n\nreturn_url\x18\x05 \x01(\t\x12\x1d\n\x15client_version_string\x18\x06 \x01(\t"D\n\x14ResCreateAlipayOrder\x12\x18\n\x05error\x18\x01 \x01(\x0b2\t.lq.Error\x12\x12\n\nalipay_url\x18\x02 \x01(\t"t\n\x18ReqCreateAlipayScanOrder\x12\x10\n\x08goods_id\x18\x01 \x01(\r\x12\x13\n\x0bclient_type\x18\x02 \x01(\r\x12\x12\n\naccount_id\x18\x03 \x01(\r\x12\x1d\n\x15client_version_string\x18\x04 \x01(\t"n\n\x18ResCreateAlipayScanOrder\x12\x18\n\x05error\x18\x01 \x01(\x0b2\t.lq.Error\x12\x15\n\rqrcode_buffer\x18\x02 \x01(\t\x12\x10\n\x08order_id\x18\x03 \x01(\t\x12\x0f\n\x07qr_code\x18\x04 \x01(\t"s\n\x17ReqCreateAlipayAppOrder\x12\x10\n\x08goods_id\x18\x01 \x01(\r\x12\x13\n\x0bclient_type\x18\x02 \x01(\r\x12\x12\n\naccount_id\x18\x03 \x01(\r\x12\x1d\n\x15client_version_string\x18\x04 \x01(\t"G\n\x17ResCreateAlipayAppOrder\x12\x18\n\x05error\x18\x01 \x01(\x0b2\t.lq.Error\x12\x12\n\nalipay_url\x18\x02 \x01(\t"\xa0\x01\n\x1aReqCreateJPCreditCardOrder\x12\x10\n\x08goods_id\x18\x01 \x01(\r\x12\x13\n\x0bclient_type\x18\x02 \x01(\r\x12\x12\n\naccount_id\x18\x03 \x01(\r\x12\x12\n\nreturn_url\x18\x04 \x01(\t\x12\x14\n\x0caccess_token\x18\x05 \x01(\t\x12\x1d\n\x15client_version_string\x18\x06 \x01(\t"H\n\x1aResCreateJPCreditCardOrder\x12\x18\n\x05error\x18\x01 \x01(\x0b2\t.lq.Error\x12\x10\n\x08order_id\x18\x02 \x01(\t"\x9c\x01\n\x16ReqCreateJPPaypalOrder\x12\x10\n\x08goods_id\x18\x01 \x01(\r\x12\x13\n\x0bclient_type\x18\x02 \x01(\r\x12\x12\n\naccount_id\x18\x03 \x01(\r\x12\x12\n\nreturn_url\x18\x04 \x01(\t\x12\x14\n\x0caccess_token\x18\x05 \x01(\t\x12\x1d\n\x15client_version_string\x18\x06 \x01(\t"D\n\x16ResCreateJPPaypalOrder\x12\x18\n\x05error\x18\x01 \x01(\x0b2\t.lq.Error\x12\x10\n\x08order_id\x18\x02 \x01(\t"\x98\x01\n\x12ReqCreateJPAuOrder\x12\x10\n\x08goods_id\x18\x01 \x01(\r\x12\x13\n\x0bclient_type\x18\x02 \x01(\r\x12\x12\n\naccount_id\x18\x03 \x01(\r\x12\x12\n\nreturn_url\x18\x04 \x01(\t\x12\x14\n\x0caccess_token\x18\x05 \x01(\t\x12\x1d\n\x15client_version_string\x18\x06 \x01(\t"@\n\x12ResCreateJPAuOrder\x12\x18\n\x05error\x18\x01 \x01(\x0b2\t.lq.Error\x12\x10\n\x08order_id\x18\x02 \x01(\t"\x9c\x01\n\x16ReqCreateJPDocomoOrder\x12\x10\n\x08goods_id\x18\x01 \x01(\r\x12\x13\n\x0bclient_type\x18\x02 \x01(\r\x12\x12\n\naccount_id\x18\x03 \x01(\r\x12\x12\n\nreturn_url\x18\x04 \x01(\t\x12\x14\n\x0caccess_token\x18\x05 \x01(\t\x12\x1d\n\x15client_version_string\x18\x06 \x01(\t"D\n\x16ResCreateJPDocomoOrder\x12\x18\n\x05error\x18\x01 \x01(\x0b2\t.lq.Error\x12\x10\n\x08order_id\x18\x02 \x01(\t"\x9e\x01\n\x18ReqCreateJPWebMoneyOrder\x12\x10\n\x08goods_id\x18\x01 \x01(\r\x12\x13\n\x0bclient_type\x18\x02 \x01(\r\x12\x12\n\naccount_id\x18\x03 \x01(\r\x12\x12\n\nreturn_url\x18\x04 \x01(\t\x12\x14\n\x0caccess_token\x18\x05 \x01(\t\x12\x1d\n\x15client_version_string\x18\x06 \x01(\t"F\n\x18ResCreateJPWebMoneyOrder\x12\x18\n\x05error\x18\x01 \x01(\x0b2\t.lq.Error\x12\x10\n\x08order_id\x18\x02 \x01(\t"\x9e\x01\n\x18ReqCreateJPSoftbankOrder\x12\x10\n\x08goods_id\x18\x01 \x01(\r\x12\x13\n\x0bclient_type\x18\x02 \x01(\r\x12\x12\n\naccount_id\x18\x03 \x01(\r\x12\x12\n\nreturn_url\x18\x04 \x01(\t\x12\x14\n\x0caccess_token\x18\x05 \x01(\t\x12\x1d\n\x15client_version_string\x18\x06 \x01(\t"F\n\x18ResCreateJPSoftbankOrder\x12\x18\n\x05error\x18\x01 \x01(\x0b2\t.lq.Error\x12\x10\n\x08order_id\x18\x02 \x01(\t"\x9c\x01\n\x16ReqCreateJPPayPayOrder\x12\x10\n\x08goods_id\x18\x01 \x01(\r\x12\x13\n\x0bclient_type\x18\x02 \x01(\r\x12\x12\n\naccount_id\x18\x03 \x01(\r\x12\x12\n\nreturn_url\x18\x04 \x01(\t\x12\x14\n\x0caccess_token\x18\x05 \x01(\t\x12\x1d\n\x15client_version_string\x18\x06 \x01(\t"D\n\x16ResCreateJPPayPayOrder\x12\x18\n\x05error\x18\x01 \x01(\x0b2\t.lq.Error\x12\x10\n\x08order_id\x18\x02 \x01(\t"G\n\x1fReqFetchJPCommonCreditCardOrder\x12\x10\n\x08order_id\x18\x01 \x01(\t\x12\x12\n\naccount_id\x18\x02 \x01(\r";\n\x1fResFetchJPCommonCreditCardOrder\x12\x18\n\x05error\x18\x01 \x01(\x0b2\t.lq.Error"\x99\x01\n\x13ReqCreateJPGMOOrder\x12\x10\n\x08goods_id\x18\x01 \x01(\r\x12\x13\n\x0bclient_type\x18\x02 \x01(\r\x12\x12\n\naccount_id\x18\x03 \x01(\r\x12\x12\n\nreturn_url\x18\x04 \x01(\t\x12\x14\n\x0caccess_token\x18\x05 \x01(\t\x12\x1d\n\x15client_version_string\x18\x06 \x01(\t"A\n\x13ResCreateJPGMOOrder\x12\x18\n\x05error\x18\x01 \x01(\x0b2\t.lq.Error\x12\x10\n\x08order_id\x18\x02 \x01(\t"\x84\x01\n\x14ReqCreateYostarOrder\x12\x10\n\x08goods_id\x18\x01 \x01(\r\x12\x13\n\x0bclient_type\x18\x02 \x01(\r\x12\x12\n\naccount_id\x18\x03 \x01(\r\x12\x12\n\norder_type\x18\x04 \x01(\r\x12\x1d\n\x15client_version_string\x18\x05 \x01(\t"B\n\x14ResCreateYostarOrder\x12\x18\n\x05error\x18\x01 \x01(\x0b2\t.lq.Error\x12\x10\n\x08order_id\x18\x02 \x01(\t"\x9c\x01\n\x16ReqCreateENPaypalOrder\x12\x10\n\x08goods_id\x18\x01 \x01(\r\x12\x13\n\x0bclient_type\x18\x02 \x01(\r\x12\x12\n\naccount_id\x18\x03 \x01(\r\x12\x12\n\nreturn_url\x18\x04 \x01(\t\x12\x14\n\x0caccess_token\x18\x05 \x01(\t\x12\x1d\n\x15client_version_string\x18\x06 \x01(\t"D\n\x16ResCreateENPaypalOrder\x12\x18\n\x05error\x18\x01 \x01(\x0b2\t.lq.Error\x12\x10\n\x08order_id\x18\x02 \x01(\t"\x99\x01\n\x13ReqCreateENJCBOrder\x12\x10\n\x08goods_id\x18\x01 \x01(\r\x12\x13\n\x0bclient_type\x18\x02 \x01(\r\x12\x12\n\naccount_id\x18\x03 \x01(\r\x12\x12\n\nreturn_url\x18\x04 \x01(\t\x12\x14\n\x0caccess_token\x18\x05 \x01(\t\x12\x1d\n\x15client_version_string\x18\x06 \x01(\t"A\n\x13ResCreateENJCBOrder\x12\x18\n\x05error\x18\x01 \x01(\x0b2\t.lq.Error\x12\x10\n\x08order_id\x18\x02 \x01(\t"\xa0\x01\n\x1aReqCreateENMasterCardOrder\x12\x10\n\x08goods_id\x18\x01 \x01(\r\x12\x13\n\x0bclient_type\x18\x02 \x01(\r\x12\x12\n\naccount_id\x18\x03 \x01(\r\x12\x12\n\nreturn_url\x18\x04 \x01(\t\x12\x14\n\x0caccess_token\x18\x05 \x01(\t\x12\x1d\n\x15client_version_string\x18\x06 \x01(\t"H\n\x1aResCreateENMasterCardOrder\x12\x18\n\x05error\x18\x01 \x01(\x0b2\t.lq.Error\x12\x10\n\x08order_id\x18\x02 \x01(\t"\x9a\x01\n\x14ReqCreateENVisaOrder\x12\x10\n\x08goods_id\x18\x01 \x01(\r\x12\x13\n\x0bclient_type\x18\x02 \x01(\r\x12\x12\n\naccount_id\x18\x03 \x01(\r\x12\x12\n\nreturn_url\x18\x04 \x01(\t\x12\x14\n\x0caccess_token\x18\x05 \x01(\t\x12\x1d\n\x15client_version_string\x18\x06 \x01(\t"B\n\x14ResCreateENVisaOrder\x12\x18\n\x05error\x18\x01 \x01(\x0b2\t.lq.Error\x12\x10\n\x08order_id\x18\x02 \x01(\t"\x9c\x01\n\x16ReqCreateENAlipayOrder\x12\x10\n\x08goods_id\x18\x01 \x01(\r\x12\x13\n\x0bclient_type\x18\x02 \x01(\r\x12\x12\n\naccount_id\x18\x03 \x01(\r\x12\x12\n\nreturn_url\x18\x04 \x01(\t\x12\x14\n\x0caccess_token\x18\x05 \x01(\t\x12\x1d\n\x15client_version_string\x18\x06 \x01(\t"D\n\x16ResCreateENAlipayOrder\x12\x18\n\x05error\x18\x01 \x01(\x0b2\t.lq.Error\x12\x10\n\x08order_id\x18\x02 \x01(\t"\x9c\x01\n\x16ReqCreateKRPaypalOrder\x12\x10\n\x08goods_id\x18\x01 \x01(\r\x12\x13\n\x0bclient_type\x18\x02 \x01(\r\x12\x12\n\naccount_id\x18\x03 \x01(\r\x12\x12\n\nreturn_url\x18\x04 \x01(\t\x12\x14\n\x0caccess_token\x18\x05 \x01(\t\x12\x1d\n\x15client_version_string\x18\x06 \x01(\t"D\n\x16ResCreateKRPaypalOrder\x12\x18\n\x05error\x18\x01 \x01(\x0b2\t.lq.Error\x12\x10\n\x08order_id\x18\x02 \x01(\t"\x99\x01\n\x13ReqCreateKRJCBOrder\x12\x10\n\x08goods_id\x18\x01 \x01(\r\x12\x13\n\x0bclient_type\x18\x02 \x01(\r\x12\x12\n\naccount_id\x18\x03 \x01(\r\x12\x12\n\nreturn_url\x18\x04 \x01(\t\x12\x14\n\x0caccess_token\x18\x05 \x01(\t\x12\x1d\n\x15client_version_string\x18\x06 \x01(\t"A\n\x13ResCreateKRJCBOrder\x12\x18\n\x05error\x18\x01 \x01(\x0b2\t.lq.Error\x12\x10\n\x08order_id\x18\x02 \x01(\t"\xa0\x01\n\x1aReqCreateKRMasterCardOrder\x12\x10\n\x08goods_id\x18\x01 \x01(\r\x12\x13\n\x0bclient_type\x18\x02 \x01(\r\x12\x12\n\naccount_id\x18\x03 \x01(\r\x12\x12\n\nreturn_url\x18\x04 \x01(\t\x12\x14\n\x0caccess_token\x18\x05 \x01(\t\x12\x1d\n\x15client_version_string\x18\x06 \x01(\t"H\n\x1aResCreateKRMasterCardOrder\x12\x18\n\x05error\x18\x01 \x01(\x0b2\t.lq.Error\x12\x10\n\x08order_id\x18\x02 \x01(\t"\x9a\x01\n\x14ReqCreateKRVisaOrder\x12\x10\n\x08goods_id\x18\x01 \x01(\r\x12\x13\n\x0bclient_type\x18\x02 \x01(\r\x12\x12\n\naccount_id\x18\x03 \x01(\r\x12\x12\n\nreturn_url\x18\x04 \x01(\t\x12\x14\n\x0caccess_token\x18\x05 \x01(\t\x12\x1d\n\x15client_version_string\x18\x06 \x01(\t"B\n\x14ResCreateKRVisaOrder\x12\x18\n\x05error\x18\x01 \x01(\x0b2\t.lq.Error\x12\x10\n\x08order_id\x18\x02 \x01(\t"\x9c\x01\n\x16ReqCreateKRAlipayOrder\x12\x10\n\x08goods_id\x18\x01 \x01(\r\x12\x13\n\x0bclient_type\x18\x02 \x01(\r\x12\x12\n\naccount_id\x18\x03 \x01(\r\x12\x12\n\nreturn_url\x18\x04 \x01(\t\x12\x14\n\x0caccess_token\x18\x05 \x01(\t\x12\x1d\n\x15client_version_string\x18\x06 \x01(\t"D\n\x16ResCreateKRAlipayOrder\x12\x18\n\x05error\x18\x01 \x01(\x0b2\t.lq.Error\x12\x10\n\x08order_id\x18\x02 \x01(\t"m\n\x11ReqCreateDMMOrder\x12\x10\n\x08goods_id\x18\x01 \x01(\r\x12\x12\n\naccount_id\x18\x02 \x01(\r\x12\x13\n\x0bclient_type\x18\x03 \x01(\r\x12\x1d\n\x15client_version_string\x18\x04 \x01(\t"\xbb\x01\n\x11ResCreateDmmOrder\x12\x18\n\x05error\x18\x01 \x01(\x0b2\t.lq.Error\x12\x10\n\x08order_id\x18\x02 \x01(\t\x12\x16\n\x0etransaction_id\x18\x03 \x01(\t\x12\x13\n\x0bdmm_user_id\x18\x04 \x01(\t\x12\r\n\x05token\x18\x05 \x01(\t\x12\x14\n\x0ccallback_url\x18\x06 \x01(\t\x12\x14\n\x0crequest_time\x18\t \x01(\t\x12\x12\n\ndmm_app_id\x18\n \x01(\t"\x9a\x01\n\x11ReqCreateIAPOrder\x12\x10\n\x08goods_id\x18\x01 \x01(\r\x12\x13\n\x0bclient_type\x18\x02 \x01(\r\x12\x12\n\naccount_id\x18\x03 \x01(\r\x12\x14\n\x0caccess_token\x18\x04 \x01(\t\x12\x15\n\rdebt_order_id\x18\x05 \x01(\t\x12\x1d\n\x15client_version_string\x18\x06 \x01(\t"?\n\x11ResCreateIAPOrder\x12\x18\n\x05error\x18\x01 \x01(\x0b2\t.lq.Error\x12\x10\n\x08order_id\x18\x02 \x01(\t"m\n\x17ReqVerificationIAPOrder\x12\x10\n\x08order_id\x18\x01 \x01(\t\x12\x16\n\x0etransaction_id\x18\x02 \x01(\t\x12\x14\n\x0creceipt_data\x18\x03 \x01(\t\x12\x12\n\naccount_id\x18\x04 \x01(\r"3\n\x17ResVerificationIAPOrder\x12\x18\n\x05error\x18\x01 \x01(\x0b2\t.lq.Error"\xaa\x01\n\x13ReqCreateSteamOrder\x12\x10\n\x08language\x18\x01 \x01(\t\x12\x12\n\naccount_id\x18\x02 \x01(\r\x12\x13\n\x0bclient_type\x18\x03 \x01(\r\x12\x10\n\x08goods_id\x18\x04 \x01(\r\x12\x10\n\x08steam_id\x18\x05 \x01(\t\x12\x15\n\rdebt_order_id\x18\x06 \x01(\t\x12\x1d\n\x15client_version_string\x18\x07 \x01(\t"\\\n\x13ResCreateSteamOrder\x12\x18\n\x05error\x18\x01 \x01(\x0b2\t.lq.Error\x12\x10\n\x08order_id\x18\x02 \x01(\t\x12\x19\n\x11platform_order_id\x18\x03 \x01(\t"b\n\x12ResRandomCharacter\x12\x18\n\x05error\x18\x01 \x01(\x0b2\t.lq.Error\x12\x0f\n\x07enabled\x18\x02 \x01(\x08\x12!\n\x04pool\x18\x03 \x03(\x0b2\x13.lq.RandomCharacter"H\n\x12ReqRandomCharacter\x12\x0f\n\x07enabled\x18\x01 \x01(\x08\x12!\n\x04pool\x18\x02 \x03(\x0b2\x13.lq.RandomCharacter";\n\x13ReqVerifySteamOrder\x12\x10\n\x08order_id\x18\x01 \x01(\t\x12\x12\n\naccount_id\x18\x02 \x01(\r"\x87\x01\n\x14ReqCreateMyCardOrder\x12\x10\n\x08goods_id\x18\x01 \x01(\r\x12\x13\n\x0bclient_type\x18\x02 \x01(\r\x12\x12\n\naccount_id\x18\x03 \x01(\r\x12\x15\n\rdebt_order_id\x18\x04 \x01(\t\x12\x1d\n\x15client_version_string\x18\x05 \x01(\t"U\n\x14ResCreateMyCardOrder\x12\x18\n\x05error\x18\x01 \x01(\x0b2\t.lq.Error\x12\x11\n\tauth_code\x18\x02 \x01(\t\x12\x10\n\x08order_id\x18\x03 \x01(\t"<\n\x14ReqVerifyMyCardOrder\x12\x10\n\x08order_id\x18\x01 \x01(\t\x12\x12\n\naccount_id\x18\x02 \x01(\r"\x87\x01\n\x14ReqCreatePaypalOrder\x12\x10\n\x08goods_id\x18\x01 \x01(\r\x12\x13\n\x0bclient_type\x18\x02 \x01(\r\x12\x12\n\naccount_id\x18\x03 \x01(\r\x12\x15\n\rdebt_order_id\x18\x04 \x01(\t\x12\x1d\n\x15client_version_string\x18\x05 \x01(\t"O\n\x14ResCreatePaypalOrder\x12\x18\n\x05error\x18\x01 \x01(\x0b2\t.lq.Error\x12\x10\n\x08order_id\x18\x02 \x01(\t\x12\x0b\n\x03url\x18\x03 \x01(\t"\xb3\x01\n\x14ReqCreateXsollaOrder\x12\x10\n\x08goods_id\x18\x01 \x01(\r\x12\x13\n\x0bclient_type\x18\x02 \x01(\r\x12\x12\n\naccount_id\x18\x03 \x01(\r\x12\x16\n\x0epayment_method\x18\x04 \x01(\r\x12\x15\n\rdebt_order_id\x18\x05 \x01(\t\x12\x1d\n\x15client_version_string\x18\x06 \x01(\t\x12\x12\n\naccount_ip\x18\x07 \x01(\t"O\n\x14ResCreateXsollaOrder\x12\x18\n\x05error\x18\x01 \x01(\x0b2\t.lq.Error\x12\x10\n\x08order_id\x18\x02 \x01(\t\x12\x0b\n\x03url\x18\x03 \x01(\t"L\n\x13ReqDeliverAA32Order\x12\x12\n\naccount_id\x18\x01 \x01(\r\x12\x0e\n\x06nsa_id\x18\x02 \x01(\t\x12\x11\n\tnsa_token\x18\x03 \x01(\t"b\n\x0cReqOpenChest\x12\x10\n\x08chest_id\x18\x01 \x01(\r\x12\r\n\x05count\x18\x02 \x01(\r\x12\x12\n\nuse_ticket\x18\x03 \x01(\x08\x12\x1d\n\x15choose_up_activity_id\x18\x04 \x01(\r"\xee\x01\n\x0cResOpenChest\x12\x18\n\x05error\x18\x01 \x01(\x0b2\t.lq.Error\x12\x1f\n\x07results\x18\x02 \x03(\x0b2\x0e.lq.OpenResult\x12\x18\n\x10total_open_count\x18\x03 \x01(\r\x12\x13\n\x0bfaith_count\x18\x04 \x01(\r\x12@\n\x10chest_replace_up\x18\x05 \x03(\x0b2&.lq.ResOpenChest.ChestReplaceCountData\x1a2\n\x15ChestReplaceCountData\x12\n\n\x02id\x18\x01 \x01(\r\x12\r\n\x05count\x18\x02 \x01(\r"6\n\x13ReqBuyFromChestShop\x12\x10\n\x08goods_id\x18\x01 \x01(\r\x12\r\n\x05count\x18\x02 \x01(\r"m\n\x13ResBuyFromChestShop\x12\x18\n\x05error\x18\x01 \x01(\x0b2\t.lq.Error\x12\x10\n\x08chest_id\x18\x02 \x01(\r\x12\x15\n\rconsume_count\x18\x03 \x01(\r\x12\x13\n\x0bfaith_count\x18\x04 \x01(\x05"D\n\x12ResDailySignInInfo\x12\x18\n\x05error\x18\x01 \x01(\x0b2\t.lq.Error\x12\x14\n\x0csign_in_days\x18\x02 \x01(\r"*\n\x13ReqDoActivitySignIn\x12\x13\n\x0bactivity_id\x18\x02 \x01(\r"\xad\x01\n\x13ResDoActivitySignIn\x12\x18\n\x05error\x18\x01 \x01(\x0b2\t.lq.Error\x123\n\x07rewards\x18\x02 \x03(\x0b2".lq.ResDoActivitySignIn.RewardData\x12\x15\n\rsign_in_count\x18\x03 \x01(\r\x1a0\n\nRewardData\x12\x13\n\x0bresource_id\x18\x01 \x01(\r\x12\r\n\x05count\x18\x02 \x01(\r"\xb0\x02\n\x10ResCharacterInfo\x12\x18\n\x05error\x18\x01 \x01(\x0b2\t.lq.Error\x12!\n\ncharacters\x18\x02 \x03(\x0b2\r.lq.Character\x12\r\n\x05skins\x18\x03 \x03(\r\x12\x19\n\x11main_character_id\x18\x04 \x01(\r\x12\x17\n\x0fsend_gift_count\x18\x05 \x01(\r\x12\x17\n\x0fsend_gift_limit\x18\x06 \x01(\r\x12\x18\n\x10finished_endings\x18\x07 \x03(\r\x12\x18\n\x10rewarded_endings\x18\x08 \x03(\r\x12\x16\n\x0echaracter_sort\x18\t \x03(\r\x12\x19\n\x11hidden_characters\x18\n \x03(\r\x12\x1c\n\x14other_character_sort\x18\x0b \x03(\r"U\n\x16ReqUpdateCharacterSort\x12\x0c\n\x04sort\x18\x01 \x03(\r\x12\x12\n\nother_sort\x18\x02 \x03(\r\x12\x19\n\x11hidden_characters\x18\x03 \x03(\r".\n\x16ReqChangeMainCharacter\x12\x14\n\x0ccharacter_id\x18\x01 \x01(\r"<\n\x16ReqChangeCharacterSkin\x12\x14\n\x0ccharacter_id\x18\x01 \x01(\r\x12\x0c\n\x04skin\x18\x02 \x01(\r"M\n\x16ReqChangeCharacterView\x12\x14\n\x0ccharacter_id\x18\x01 \x01(\r\x12\x0c\n\x04slot\x18\x02 \x01(\r\x12\x0f\n\x07item_id\x18\x03 \x01(\r"+\n\x15ReqSetHiddenCharacter\x12\x12\n\nchara_list\x18\x01 \x03(\r"L\n\x15ResSetHiddenCharacter\x12\x18\n\x05error\x18\x01 \x01(\x0b2\t.lq.Error\x12\x19\n\x11hidden_characters\x18\x02 \x03(\r"\x86\x01\n\x16ReqSendGiftToCharacter\x12\x14\n\x0ccharacter_id\x18\x01 \x01(\r\x12.\n\x05gifts\x18\x02 \x03(\x0b2\x1f.lq.ReqSendGiftToCharacter.Gift\x1a&\n\x04Gift\x12\x0f\n\x07item_id\x18\x01 \x01(\r\x12\r\n\x05count\x18\x02 \x01(\r"N\n\x16ResSendGiftToCharacter\x12\x18\n\x05error\x18\x01 \x01(\x0b2\t.lq.Error\x12\r\n\x05level\x18\x02 \x01(\r\x12\x0b\n\x03exp\x18\x03 \x01(\r"Z\n\x0bReqSellItem\x12#\n\x05sells\x18\x01 \x03(\x0b2\x14.lq.ReqSellItem.Item\x1a&\n\x04Item\x12\x0f\n\x07item_id\x18\x01 \x01(\r\x12\r\n\x05count\x18\x02 \x01(\r"u\n\rResCommonView\x12\x18\n\x05error\x18\x01 \x01(\x0b2\t.lq.Error\x12%\n\x05slots\x18\x02 \x03(\x0b2\x16.lq.ResCommonView.Slot\x1a#\n\x04Slot\x12\x0c\n\x04slot\x18\x01 \x01(\r\x12\r\n\x05value\x18\x02 \x01(\r"2\n\x13ReqChangeCommonView\x12\x0c\n\x04slot\x18\x01 \x01(\r\x12\r\n\x05value\x18\x02 \x01(\r"c\n\x12ReqSaveCommonViews\x12\x1b\n\x05views\x18\x01 \x03(\x0b2\x0c.lq.ViewSlot\x12\x12\n\nsave_index\x18\x02 \x01(\r\x12\x0e\n\x06is_use\x18\x03 \x01(\r\x12\x0c\n\x04name\x18\x04 \x01(\t"\x1f\n\x0eReqCommonViews\x12\r\n\x05index\x18\x01 \x01(\r"U\n\x0eResCommonViews\x12\x18\n\x05error\x18\x02 \x01(\x0b2\t.lq.Error\x12\x1b\n\x05views\x18\x01 \x03(\x0b2\x0c.lq.ViewSlot\x12\x0c\n\x04name\x18\x03 \x01(\t"\xaa\x01\n\x11ResAllcommonViews\x12*\n\x05views\x18\x01 \x03(\x0b2\x1b.lq.ResAllcommonViews.Views\x12\x0b\n\x03use\x18\x02 \x01(\r\x12\x18\n\x05error\x18\x03 \x01(\x0b2\t.lq.Error\x1aB\n\x05Views\x12\x1c\n\x06values\x18\x01 \x03(\x0b2\x0c.lq.ViewSlot\x12\r\n\x05index\x18\x02 \x01(\r\x12\x0c\n\x04name\x18\x03 \x01(\t"!\n\x10ReqUseCommonView\x12\r\n\x05index\x18\x03 \x01(\r"+\n\x13ReqUpgradeCharacter\x12\x14\n\x0ccharacter_id\x18\x01 \x01(\r"Q\n\x13ResUpgradeCharacter\x12\x18\n\x05error\x18\x01 \x01(\x0b2\t.lq.Error\x12 \n\tcharacter\x18\x02 \x01(\x0b2\r.lq.Character"N\n\x11ReqFinishedEnding\x12\x14\n\x0ccharacter_id\x18\x01 \x01(\r\x12\x10\n\x08story_id\x18\x02 \x01(\r\x12\x11\n\tending_id\x18\x03 \x01(\r"\x1f\n\x0cReqGMCommand\x12\x0f\n\x07command\x18\x01 \x01(\t"H\n\x0bResShopInfo\x12\x18\n\x05error\x18\x01 \x01(\x0b2\t.lq.Error\x12\x1f\n\tshop_info\x18\x02 \x01(\x0b2\x0c.lq.ShopInfo"\xac\x01\n\x0eReqBuyFromShop\x12\x10\n\x08goods_id\x18\x01 \x01(\r\x12\r\n\x05count\x18\x02 \x01(\r\x12*\n\tver_price\x18\x03 \x03(\x0b2\x17.lq.ReqBuyFromShop.Item\x12*\n\tver_goods\x18\x04 \x03(\x0b2\x17.lq.ReqBuyFromShop.Item\x1a!\n\x04Item\x12\n\n\x02id\x18\x01 \x01(\r\x12\r\n\x05count\x18\x02 \x01(\r"K\n\x0eResBuyFromShop\x12\x18\n\x05error\x18\x01 \x01(\x0b2\t.lq.Error\x12\x1f\n\x07rewards\x18\x02 \x03(\x0b2\x0e.lq.RewardSlot"0\n\rReqBuyFromZHP\x12\x10\n\x08goods_id\x18\x01 \x01(\r\x12\r\n\x05count\x18\x02 \x01(\r"&\n\x11ReqPayMonthTicket\x12\x11\n\tticket_id\x18\x01 \x01(\r"Z\n\x11ResPayMonthTicket\x12\x18\n\x05error\x18\x01 \x01(\x0b2\t.lq.Error\x12\x13\n\x0bresource_id\x18\x02 \x01(\r\x12\x16\n\x0eresource_count\x18\x03 \x01(\r"<\n\x0eReqReshZHPShop\x12\x14\n\x0cfree_refresh\x18\x01 \x01(\r\x12\x14\n\x0ccost_refresh\x18\x02 \x01(\r"G\n\x11ResRefreshZHPShop\x12\x18\n\x05error\x18\x01 \x01(\x0b2\t.lq.Error\x12\x18\n\x03zhp\x18\x02 \x01(\x0b2\x0b.lq.ZHPShop"^\n\x12ResMonthTicketInfo\x12\x18\n\x05error\x18\x02 \x01(\x0b2\t.lq.Error\x12.\n\x11month_ticket_info\x18\x01 \x01(\x0b2\x13.lq.MonthTicketInfo"0\n\x13ReqExchangeCurrency\x12\n\n\x02id\x18\x01 \x01(\r\x12\r\n\x05count\x18\x02 \x01(\r"S\n\x11ResServerSettings\x12\x18\n\x05error\x18\x02 \x01(\x0b2\t.lq.Error\x12$\n\x08settings\x18\x01 \x01(\x0b2\x12.lq.ServerSettings"T\n\x12ResAccountSettings\x12\x18\n\x05error\x18\x01 \x01(\x0b2\t.lq.Error\x12$\n\x08settings\x18\x02 \x03(\x0b2\x12.lq.AccountSetting"?\n\x18ReqUpdateAccountSettings\x12#\n\x07setting\x18\x01 \x01(\x0b2\x12.lq.AccountSetting"E\n\x12ResModNicknameTime\x12\x18\n\x05error\x18\x02 \x01(\x0b2\t.lq.Error\x12\x15\n\rlast_mod_time\x18\x01 \x01(\r"\xef\x01\n\x07ResMisc\x12\x18\n\x05error\x18\x01 \x01(\x0b2\t.lq.Error\x12\x16\n\x0erecharged_list\x18\x02 \x03(\r\x12)\n\x06faiths\x18\x03 \x03(\x0b2\x19.lq.ResMisc.MiscFaithData\x12\x17\n\x0fverified_hidden\x18\x04 \x01(\r\x12\x16\n\x0everified_value\x18\x05 \x01(\r\x12$\n\x1cdisable_room_random_bot_char\x18\x06 \x01(\r\x1a0\n\rMiscFaithData\x12\x10\n\x08faith_id\x18\x01 \x01(\r\x12\r\n\x05count\x18\x02 \x01(\x05"\'\n\x12ReqModifySignature\x12\x11\n\tsignature\x18\x01 \x01(\t"M\n\rResIDCardInfo\x12\x18\n\x05error\x18\x01 \x01(\x0b2\t.lq.Error\x12\x11\n\tis_authed\x18\x02 \x01(\x08\x12\x0f\n\x07country\x18\x03 \x01(\t"8\n\x13ReqUpdateIDCardInfo\x12\x10\n\x08fullname\x18\x01 \x01(\t\x12\x0f\n\x07card_no\x18\x02 \x01(\t"C\n\x0cResVipReward\x12\x18\n\x05error\x18\x01 \x01(\x0b2\t.lq.Error\x12\x19\n\x11gained_vip_levels\x18\x02 \x03(\r"\xf4\x01\n\x13ResFetchRefundOrder\x12\x18\n\x05error\x18\x01 \x01(\x0b2\t.lq.Error\x121\n\x06orders\x18\x02 \x03(\x0b2!.lq.ResFetchRefundOrder.OrderInfo\x12\x16\n\x0eclear_deadline\x18\x03 \x01(\r\x12 \n\x07message\x18\x04 \x03(\x0b2\x0f.lq.I18nContext\x1aV\n\tOrderInfo\x12\x14\n\x0csuccess_time\x18\x01 \x01(\r\x12\x10\n\x08goods_id\x18\x02 \x01(\r\x12\x0f\n\x07cleared\x18\x03 \x01(\r\x12\x10\n\x08order_id\x18\x04 \x01(\t"%\n\x10ReqGainVipReward\x12\x11\n\tvip_level\x18\x01 \x01(\r"K\n\x1dReqFetchCustomizedContestList\x12\r\n\x05start\x18\x01 \x01(\r\x12\r\n\x05count\x18\x02 \x01(\r\x12\x0c\n\x04lang\x18\x03 \x01(\t"\x9a\x01\n\x1dResFetchCustomizedContestList\x12\x18\n\x05error\x18\x01 \x01(\x0b2\t.lq.Error\x12+\n\x08contests\x18\x02 \x03(\x0b2\x19.lq.CustomizedContestBase\x122\n\x0ffollow_contests\x18\x03 \x03(\x0b2\x19.lq.CustomizedContestBase"6\n!ReqFetchCustomizedContestAuthInfo\x12\x11\n\tunique_id\x18\x01 \x01(\r"U\n!ResFetchCustomizedContestAuthInfo\x12\x18\n\x05error\x18\x01 \x01(\x0b2\t.lq.Error\x12\x16\n\x0eobserver_level\x18\x02 \x01(\r"<\n\x19ReqEnterCustomizedContest\x12\x11\n\tunique_id\x18\x01 \x01(\r\x12\x0c\n\x04lang\x18\x02 \x01(\t"\xd7\x01\n\x19ResEnterCustomizedContest\x12\x18\n\x05error\x18\x01 \x01(\x0b2\t.lq.Error\x120\n\x0bdetail_info\x18\x02 \x01(\x0b2\x1b.lq.CustomizedContestDetail\x128\n\rplayer_report\x18\x03 \x01(\x0b2!.lq.CustomizedContestPlayerReport\x12\x13\n\x0bis_followed\x18\x04 \x01(\x08\x12\r\n\x05state\x18\x05 \x01(\r\x12\x10\n\x08is_admin\x18\x06 \x01(\x08"8\n#ReqFetchCustomizedContestOnlineInfo\x12\x11\n\tunique_id\x18\x01 \x01(\r"V\n#ResFetchCustomizedContestOnlineInfo\x12\x18\n\x05error\x18\x01 \x01(\x0b2\t.lq.Error\x12\x15\n\ronline_player\x18\x02 \x01(\r"H\n$ReqFetchCustomizedContestByContestId\x12\x12\n\ncontest_id\x18\x01 \x01(\r\x12\x0c\n\x04lang\x18\x02 \x01(\t"u\n$ResFetchCustomizedContestByContestId\x12\x18\n\x05error\x18\x01 \x01(\x0b2\t.lq.Error\x123\n\x0ccontest_info\x18\x02 \x01(\x0b2\x1d.lq.CustomizedContestAbstract"N\n\x1aReqSignupCustomizedContest\x12\x11\n\tunique_id\x18\x01 \x01(\r\x12\x1d\n\x15client_version_string\x18\x02 \x01(\t"E\n\x1aResSignupCustomizedContest\x12\x18\n\x05error\x18\x01 \x01(\x0b2\t.lq.Error\x12\r\n\x05state\x18\x02 \x01(\r"M\n\x19ReqStartCustomizedContest\x12\x11\n\tunique_id\x18\x01 \x01(\r\x12\x1d\n\x15client_version_string\x18\x02 \x01(\t"-\n\x18ReqStopCustomizedContest\x12\x11\n\tunique_id\x18\x01 \x01(\r"5\n ReqJoinCustomizedContestChatRoom\x12\x11\n\tunique_id\x18\x01 \x01(\r"K\n ResJoinCustomizedContestChatRoom\x12\x18\n\x05error\x18\x01 \x01(\x0b2\t.lq.Error\x12\r\n\x05token\x18\x02 \x01(\t"7\n\x11ReqSayChatMessage\x12\x0f\n\x07content\x18\x01 \x01(\t\x12\x11\n\tunique_id\x18\x02 \x01(\r":\n%ReqFetchCustomizedContestGameLiveList\x12\x11\n\tunique_id\x18\x01 \x01(\r"f\n%ResFetchCustomizedContestGameLiveList\x12\x18\n\x05error\x18\x01 \x01(\x0b2\t.lq.Error\x12#\n\tlive_list\x18\x02 \x03(\x0b2\x10.lq.GameLiveHead"`\n$ReqFetchCustomizedContestGameRecords\x12\x11\n\tunique_id\x18\x01 \x01(\r\x12\x12\n\nlast_index\x18\x02 \x01(\r\x12\x11\n\tseason_id\x18\x03 \x01(\r"y\n$ResFetchCustomizedContestGameRecords\x12\x18\n\x05error\x18\x01 \x01(\x0b2\t.lq.Error\x12\x12\n\nnext_index\x18\x02 \x01(\r\x12#\n\x0brecord_list\x18\x03 \x03(\x0b2\x0e.lq.RecordGame"/\n\x1aReqTargetCustomizedContest\x12\x11\n\tunique_id\x18\x01 \x01(\r"M\n\x0fResActivityList\x12\x18\n\x05error\x18\x01 \x01(\x0b2\t.lq.Error\x12 \n\nactivities\x18\x02 \x03(\x0b2\x0c.lq.Activity"\x9c\x0f\n\x16ResAccountActivityData\x12\x18\n\x05error\x18\x01 \x01(\x0b2\t.lq.Error\x12,\n\x10exchange_records\x18\x02 \x03(\x0b2\x12.lq.ExchangeRecord\x12,\n\x12task_progress_list\x18\x03 \x03(\x0b2\x10.lq.TaskProgress\x12@\n\x16accumulated_point_list\x18\x04 \x03(\x0b2 .lq.ActivityAccumulatedPointData\x121\n\x0erank_data_list\x18\x05 \x03(\x0b2\x19.lq.ActivityRankPointData\x121\n\x17flip_task_progress_list\x18\x06 \x03(\x0b2\x10.lq.TaskProgress\x12C\n\x0csign_in_data\x18\x07 \x03(\x0b2-.lq.ResAccountActivityData.ActivitySignInData\x12D\n\x0crichman_data\x18\x08 \x03(\x0b2..lq.ResAccountActivityData.ActivityRichmanData\x123\n\x19period_task_progress_list\x18\t \x03(\x0b2\x10.lq.TaskProgress\x123\n\x19random_task_progress_list\x18\n \x03(\x0b2\x10.lq.TaskProgress\x12=\n\rchest_up_data\x18\x0b \x03(\x0b2&.lq.ResAccountActivityData.ChestUpData\x12<\n\x08sns_data\x18\x0c \x01(\x0b2*.lq.ResAccountActivityData.ActivitySNSData\x12\'\n\tmine_data\x18\r \x03(\x0b2\x14.lq.MineActivityData\x12!\n\x08rpg_data\x18\x0e \x03(\x0b2\x0f.lq.RPGActivity\x12)\n\narena_data\x18\x0f \x03(\x0b2\x15.lq.ActivityArenaData\x12\'\n\tfeed_data\x18\x10 \x03(\x0b2\x14.lq.FeedActivityData\x12;\n\x1asegment_task_progress_list\x18\x11 \x03(\x0b2\x17.lq.SegmentTaskProgress\x12"\n\x0cvote_records\x18\x12 \x03(\x0b2\x0c.lq.VoteData\x12\'\n\tspot_data\x18\x13 \x03(\x0b2\x14.lq.ActivitySpotData\x124\n\x10friend_gift_data\x18\x14 \x03(\x0b2\x1a.lq.ActivityFriendGiftData\x12-\n\x0cupgrade_data\x18\x15 \x03(\x0b2\x17.lq.ActivityUpgradeData\x12/\n\ngacha_data\x18\x16 \x03(\x0b2\x1b.lq.ActivityGachaUpdateData\x123\n\x0fsimulation_data\x18\x17 \x03(\x0b2\x1a.lq.ActivitySimulationData\x123\n\x0ecombining_data\x18\x18 \x03(\x0b2\x1b.lq.ActivityCombiningLQData\x12-\n\x0cvillage_data\x18\x19 \x03(\x0b2\x17.lq.ActivityVillageData\x12/\n\rfestival_data\x18\x1a \x03(\x0b2\x18.lq.ActivityFestivalData\x12+\n\x0bisland_data\x18\x1b \x03(\x0b2\x16.lq.ActivityIslandData\x12)\n\nstory_data\x18\x1d \x03(\x0b2\x15.lq.ActivityStoryData\x120\n\x0echoose_up_data\x18\x1e \x03(\x0b2\x18.lq.ActivityChooseUpData\x1a[\n\x12ActivitySignInData\x12\x13\n\x0bactivity_id\x18\x01 \x01(\r\x12\x15\n\rsign_in_count\x18\x02 \x01(\r\x12\x19\n\x11last_sign_in_time\x18\x03 \x01(\r\x1a8\n\x08BuffData\x12\x0c\n\x04type\x18\x01 \x01(\r\x12\x0e\n\x06remain\x18\x02 \x01(\r\x12\x0e\n\x06effect\x18\x03 \x01(\r\x1a\xbf\x01\n\x13ActivityRichmanData\x12\x13\n\x0bactivity_id\x18\x01 \x01(\r\x12\x10\n\x08location\x18\x02 \x01(\r\x12\x16\n\x0efinished_count\x18\x03 \x01(\r\x12\x16\n\x0echest_position\x18\x04 \x01(\r\x12\x11\n\tbank_save\x18\x05 \x01(\r\x12\x0b\n\x03exp\x18\x06 \x01(\r\x121\n\x04buff\x18\x07 \x03(\x0b2#.lq.ResAccountActivityData.BuffData\x1a(\n\x0bChestUpData\x12\n\n\x02id\x18\x01 \x01(\r\x12\r\n\x05count\x18\x02 \x01(\r\x1a[\n\x0fActivitySNSData\x12\x19\n\x04blog\x18\x01 \x03(\x0b2\x0b.lq.SNSBlog\x12\x10\n\x08liked_id\x18\x02 \x03(\r\x12\x1b\n\x05reply\x18\x03 \x03(\x0b2\x0c.lq.SNSReply"(\n\x07SNSBlog\x12\n\n\x02id\x18\x01 \x01(\r\x12\x11\n\tread_time\x18\x02 \x01(\r"*\n\x08SNSReply\x12\n\n\x02id\x18\x01 \x01(\r\x12\x12\n\nreply_time\x18\x02 \x01(\r"=\n\x17ReqExchangeActivityItem\x12\x13\n\x0bexchange_id\x18\x01 \x01(\r\x12\r\n\x05count\x18\x02 \x01(\r"^\n\x17ResExchangeActivityItem\x12\x18\n\x05error\x18\x01 \x01(\x0b2\t.lq.Error\x12)\n\x0eexecute_reward\x18\x02 \x03(\x0b2\x11.lq.ExecuteReward"*\n\x17ReqCompleteActivityTask\x12\x0f\n\x07task_id\x18\x01 \x01(\r"1\n\x1cReqCompleteActivityTaskBatch\x12\x11\n\ttask_list\x18\x01 \x03(\r"7\n"ReqCompletePeriodActivityTaskBatch\x12\x11\n\ttask_list\x18\x01 \x03(\r"-\n\x1aReqReceiveActivityFlipTask\x12\x0f\n\x07task_id\x18\x01 \x01(\r"E\n\x1aResReceiveActivityFlipTask\x12\r\n\x05count\x18\x01 \x01(\r\x12\x18\n\x05error\x18\x02 \x01(\x0b2\t.lq.Error">\n\x1cReqCompleteSegmentTaskReward\x12\x0f\n\x07task_id\x18\x01 \x01(\r\x12\r\n\x05count\x18\x02 \x01(\r"\\\n\x1cResCompleteSegmentTaskReward\x12\x18\n\x05error\x18\x01 \x01(\x0b2\t.lq.Error\x12"\n\x07rewards\x18\x02 \x03(\x0b2\x11.lq.ExecuteReward"/\n\x18ReqFetchActivityFlipInfo\x12\x13\n\x0bactivity_id\x18\x01 \x01(\r"T\n\x18ResFetchActivityFlipInfo\x12\x0f\n\x07rewards\x18\x01 \x03(\r\x12\r\n\x05count\x18\x02 \x01(\r\x12\x18\n\x05error\x18\x03 \x01(\x0b2\t.lq.Error"O\n%ReqGainAccumulatedPointActivityReward\x12\x13\n\x0bactivity_id\x18\x01 \x01(\r\x12\x11\n\treward_id\x18\x02 \x01(\r"N\n\x1fReqGainMultiPointActivityReward\x12\x13\n\x0bactivity_id\x18\x01 \x01(\r\x12\x16\n\x0ereward_id_list\x18\x02 \x03(\r"6\n\x1cReqFetchRankPointLeaderboard\x12\x16\n\x0eleaderboard_id\x18\x01 \x01(\r"\xe4\x01\n\x1cResFetchRankPointLeaderboard\x12\x18\n\x05error\x18\x01 \x01(\x0b2\t.lq.Error\x124\n\x05items\x18\x02 \x03(\x0b2%.lq.ResFetchRankPointLeaderboard.Item\x12\x19\n\x11last_refresh_time\x18\x03 \x01(\r\x1aY\n\x04Item\x12\x12\n\naccount_id\x18\x01 \x01(\r\x12\x0c\n\x04rank\x18\x02 \x01(\r\x12 \n\x04view\x18\x03 \x01(\x0b2\x12.lq.PlayerBaseView\x12\r\n\x05point\x18\x04 \x01(\r"E\n\x16ReqGainRankPointReward\x12\x16\n\x0eleaderboard_id\x18\x01 \x01(\r\x12\x13\n\x0bactivity_id\x18\x02 \x01(\r")\n\x12ReqRichmanNextMove\x12\x13\n\x0bactivity_id\x18\x01 \x01(\r"\x94\x04\n\x12ResRichmanNextMove\x12.\n\x05paths\x18\x01 \x03(\x0b2\x1f.lq.ResRichmanNextMove.PathData\x12\x0c\n\x04dice\x18\x02 \x01(\r\x12\x10\n\x08location\x18\x03 \x01(\r\x12\x16\n\x0efinished_count\x18\x04 \x01(\r\x12\x0c\n\x04step\x18\x05 \x01(\r\x12-\n\x04buff\x18\x06 \x03(\x0b2\x1f.lq.ResRichmanNextMove.BuffData\x12\x11\n\tbank_save\x18\x07 \x01(\r\x12\x16\n\x0echest_position\x18\x08 \x01(\r\x12\x0b\n\x03exp\x18\t \x01(\r\x12\x15\n\rbank_save_add\x18\n \x01(\r\x12\x18\n\x05error\x18\x0b \x01(\x0b2\t.lq.Error\x1aT\n\nRewardData\x12\x13\n\x0bresource_id\x18\x01 \x01(\r\x12\r\n\x05count\x18\x02 \x01(\r\x12\x14\n\x0corigin_count\x18\x03 \x01(\r\x12\x0c\n\x04type\x18\x05 \x01(\r\x1a`\n\x08PathData\x12\x10\n\x08location\x18\x01 \x01(\r\x122\n\x07rewards\x18\x02 \x03(\x0b2!.lq.ResRichmanNextMove.RewardData\x12\x0e\n\x06events\x18\x03 \x03(\r\x1a8\n\x08BuffData\x12\x0c\n\x04type\x18\x01 \x01(\r\x12\x0e\n\x06remain\x18\x02 \x01(\r\x12\x0e\n\x06effect\x18\x03 \x01(\r":\n\x15ReqRichmanSpecialMove\x12\x13\n\x0bactivity_id\x18\x01 \x01(\r\x12\x0c\n\x04step\x18\x02 \x01(\r"*\n\x13ReqRichmanChestInfo\x12\x13\n\x0bactivity_id\x18\x01 \x01(\r"\x87\x01\n\x13ResRichmanChestInfo\x12/\n\x05items\x18\x01 \x03(\x0b2 .lq.ResRichmanChestInfo.ItemData\x12\x18\n\x05error\x18\x02 \x01(\x0b2\t.lq.Error\x1a%\n\x08ItemData\x12\n\n\x02id\x18\x01 \x01(\r\x12\r\n\x05count\x18\x02 \x01(\r"-\n\x18ReqCreateGameObserveAuth\x12\x11\n\tgame_uuid\x18\x01 \x01(\t"U\n\x18ResCreateGameObserveAuth\x12\x18\n\x05error\x18\x01 \x01(\x0b2\t.lq.Error\x12\r\n\x05token\x18\x02 \x01(\t\x12\x10\n\x08location\x18\x03 \x01(\t"*\n\x19ReqRefreshGameObserveAuth\x12\r\n\x05token\x18\x01 \x01(\t"B\n\x19ResRefreshGameObserveAuth\x12\x18\n\x05error\x18\x01 \x01(\x0b2\t.lq.Error\x12\x0b\n\x03ttl\x18\x02 \x01(\r"T\n\x0fResActivityBuff\x12\x18\n\x05error\x18\x01 \x01(\x0b2\t.lq.Error\x12\'\n\tbuff_list\x18\x02 \x03(\x0b2\x14.lq.ActivityBuffData")\n\x16ReqUpgradeActivityBuff\x12\x0f\n\x07buff_id\x18\x01 \x01(\r"L\n\x17ReqUpgradeActivityLevel\x12\x13\n\x0bactivity_id\x18\x01 \x01(\r\x12\r\n\x05group\x18\x02 \x01(\r\x12\r\n\x05count\x18\x03 \x01(\r"W\n\x17ResUpgradeActivityLevel\x12\x18\n\x05error\x18\x01 \x01(\x0b2\t.lq.Error\x12"\n\x07rewards\x18\x02 \x03(\x0b2\x11.lq.ExecuteReward"6\n\x1fReqReceiveUpgradeActivityReward\x12\x13\n\x0bactivity_id\x18\x01 \x01(\r"_\n\x1fResReceiveUpgradeActivityReward\x12\x18\n\x05error\x18\x01 \x01(\x0b2\t.lq.Error\x12"\n\x07rewards\x18\x02 \x03(\x0b2\x11.lq.ExecuteReward"0\n\x19ReqReceiveAllActivityGift\x12\x13\n\x0bactivity_id\x18\x01 \x01(\r"\xf4\x01\n\x19ResReceiveAllActivityGift\x12\x18\n\x05error\x18\x01 \x01(\x0b2\t.lq.Error\x12"\n\x07rewards\x18\x02 \x03(\x0b2\x11.lq.ExecuteReward\x12B\n\x0creceive_gift\x18\x03 \x03(\x0b2,.lq.ResReceiveAllActivityGift.ReceiveRewards\x1aU\n\x0eReceiveRewards\x12\n\n\x02id\x18\x01 \x01(\r\x12\x17\n\x0ffrom_account_id\x18\x02 \x01(\r\x12\x0f\n\x07item_id\x18\x03 \x01(\r\x12\r\n\x05count\x18\x04 \x01(\r"\xa6\x01\n\x13ResUpgradeChallenge\x12\x18\n\x05error\x18\x01 \x01(\x0b2\t.lq.Error\x12\'\n\rtask_progress\x18\x02 \x03(\x0b2\x10.lq.TaskProgress\x12\x15\n\rrefresh_count\x18\x03 \x01(\r\x12\r\n\x05level\x18\x04 \x01(\r\x12\x13\n\x0bmatch_count\x18\x05 \x01(\r\x12\x11\n\tticket_id\x18\x06 \x01(\r"\xa6\x01\n\x13ResRefreshChallenge\x12\x18\n\x05error\x18\x01 \x01(\x0b2\t.lq.Error\x12\'\n\rtask_progress\x18\x02 \x03(\x0b2\x10.lq.TaskProgress\x12\x15\n\rrefresh_count\x18\x03 \x01(\r\x12\r\n\x05level\x18\x04 \x01(\r\x12\x13\n\x0bmatch_count\x18\x05 \x01(\r\x12\x11\n\tticket_id\x18\x06 \x01(\r"\xc1\x01\n\x15ResFetchChallengeInfo\x12\x18\n\x05error\x18\x01 \x01(\x0b2\t.lq.Error\x12\'\n\rtask_progress\x18\x02 \x03(\x0b2\x10.lq.TaskProgress\x12\x15\n\rrefresh_count\x18\x03 \x01(\r\x12\r\n\x05level\x18\x04 \x01(\r\x12\x13\n\x0bmatch_count\x18\x05 \x01(\r\x12\x11\n\tticket_id\x18\x06 \x01(\r\x12\x17\n\x0frewarded_season\x18\x07 \x03(\r"0\n\x1dReqForceCompleteChallengeTask\x12\x0f\n\x07task_id\x18\x01 \x01(\r"\xff\x01\n\x0fResFetchABMatch\x12\x18\n\x05error\x18\x01 \x01(\x0b2\t.lq.Error\x12\x10\n\x08match_id\x18\x02 \x01(\r\x12\x13\n\x0bmatch_count\x18\x03 \x01(\r\x12\x14\n\x0cbuy_in_count\x18\x04 \x01(\r\x12\r\n\x05point\x18\x05 \x01(\r\x12\x10\n\x08rewarded\x18\x06 \x01(\x08\x127\n\x0fmatch_max_point\x18\x07 \x03(\x0b2\x1e.lq.ResFetchABMatch.MatchPoint\x12\x0c\n\x04quit\x18\x08 \x01(\x08\x1a-\n\nMatchPoint\x12\x10\n\x08match_id\x18\x01 \x01(\r\x12\r\n\x05point\x18\x02 \x01(\r"H\n\x14ReqStartUnifiedMatch\x12\x11\n\tmatch_sid\x18\x01 \x01(\t\x12\x1d\n\x15client_version_string\x18\x02 \x01(\t"*\n\x15ReqCancelUnifiedMatch\x12\x11\n\tmatch_sid\x18\x01 \x01(\t"\xd4\x01\n\x16ResChallengeSeasonInfo\x12\x18\n\x05error\x18\x02 \x01(\x0b2\t.lq.Error\x12G\n\x15challenge_season_list\x18\x01 \x03(\x0b2(.lq.ResChallengeSeasonInfo.ChallengeInfo\x1aW\n\rChallengeInfo\x12\x11\n\tseason_id\x18\x01 \x01(\r\x12\x12\n\nstart_time\x18\x02 \x01(\r\x12\x10\n\x08end_time\x18\x03 \x01(\r\x12\r\n\x05state\x18\x04 \x01(\r"2\n\x1dReqReceiveChallengeRankReward\x12\x11\n\tseason_id\x18\x01 \x01(\r"\xa2\x01\n\x1dResReceiveChallengeRankReward\x12\x18\n\x05error\x18\x02 \x01(\x0b2\t.lq.Error\x129\n\x07rewards\x18\x01 \x03(\x0b2(.lq.ResReceiveChallengeRankReward.Reward\x1a,\n\x06Reward\x12\x13\n\x0bresource_id\x18\x01 \x01(\r\x12\r\n\x05count\x18\x02 \x01(\r"#\n\x0fReqBuyInABMatch\x12\x10\n\x08match_id\x18\x01 \x01(\r"\'\n\x10ReqGamePointRank\x12\x13\n\x0bactivity_id\x18\x01 \x01(\r"\x9b\x01\n\x10ResGamePointRank\x12\x18\n\x05error\x18\x01 \x01(\x0b2\t.lq.Error\x12+\n\x04rank\x18\x02 \x03(\x0b2\x1d.lq.ResGamePointRank.RankInfo\x12\x11\n\tself_rank\x18\x03 \x01(\r\x1a-\n\x08RankInfo\x12\x12\n\naccount_id\x18\x01 \x01(\r\x12\r\n\x05point\x18\x02 \x01(\r"H\n\x19ResFetchSelfGamePointRank\x12\x18\n\x05error\x18\x01 \x01(\x0b2\t.lq.Error\x12\x11\n\tself_rate\x18\x02 \x01(\r"\x18\n\nReqReadSNS\x12\n\n\x02id\x18\x01 \x01(\r"H\n\nResReadSNS\x12\x18\n\x05error\x18\x01 \x01(\x0b2\t.lq.Error\x12 \n\x0bsns_content\x18\x02 \x01(\x0b2\x0b.lq.SNSBlog"\x19\n\x0bReqReplySNS\x12\n\n\x02id\x18\x01 \x01(\r"H\n\x0bResReplySNS\x12\x18\n\x05error\x18\x01 \x01(\x0b2\t.lq.Error\x12\x1f\n\tsns_reply\x18\x02 \x01(\x0b2\x0c.lq.SNSReply"\x18\n\nReqLikeSNS\x12\n\n\x02id\x18\x01 \x01(\r"8\n\nResLikeSNS\x12\x18\n\x05error\x18\x01 \x01(\x0b2\t.lq.Error\x12\x10\n\x08is_liked\x18\x02 \x01(\r";\n\nReqDigMine\x12\x13\n\x0bactivity_id\x18\x01 \x01(\r\x12\x18\n\x05point\x18\x02 \x01(\x0b2\t.lq.Point"c\n\nResDigMine\x12\x18\n\x05error\x18\x01 \x01(\x0b2\t.lq.Error\x12\x1b\n\x03map\x18\x02 \x03(\x0b2\x0e.lq.MineReward\x12\x1e\n\x06reward\x18\x03 \x03(\x0b2\x0e.lq.RewardSlot"#\n\x13ReqFetchLastPrivacy\x12\x0c\n\x04type\x18\x01 \x03(\r"\x93\x01\n\x13ResFetchLastPrivacy\x12\x18\n\x05error\x18\x01 \x01(\x0b2\t.lq.Error\x124\n\x07privacy\x18\x02 \x03(\x0b2#.lq.ResFetchLastPrivacy.PrivacyInfo\x1a,\n\x0bPrivacyInfo\x12\x0c\n\x04type\x18\x01 \x01(\r\x12\x0f\n\x07version\x18\x02 \x01(\t"\x81\x01\n\x0fReqCheckPrivacy\x12\x13\n\x0bdevice_type\x18\x01 \x01(\t\x12.\n\x08versions\x18\x02 \x03(\x0b2\x1c.lq.ReqCheckPrivacy.Versions\x1a)\n\x08Versions\x12\x0f\n\x07version\x18\x01 \x01(\t\x12\x0c\n\x04type\x18\x03 \x01(\r"/\n\x18ReqFetchRPGBattleHistory\x12\x13\n\x0bactivity_id\x18\x01 \x01(\r"\xce\x03\n\x18ResFetchRPGBattleHistory\x12\x18\n\x05error\x18\x01 \x01(\x0b2\t.lq.Error\x12@\n\rbattle_result\x18\x02 \x03(\x0b2).lq.ResFetchRPGBattleHistory.BattleResult\x12!\n\x0bstart_state\x18\x03 \x01(\x0b2\x0c.lq.RPGState\x12#\n\rcurrent_state\x18\x04 \x01(\x0b2\x0c.lq.RPGState\x1a\x8d\x02\n\x0cBattleResult\x12\x0c\n\x04uuid\x18\x0e \x01(\t\x12\r\n\x05chang\x18\x01 \x01(\r\x12\n\n\x02ju\x18\x02 \x01(\r\x12\x0b\n\x03ben\x18\x03 \x01(\r\x12\x0e\n\x06target\x18\x04 \x01(\r\x12\x0e\n\x06damage\x18\x05 \x01(\r\x12\x0c\n\x04heal\x18\x06 \x01(\r\x12\x13\n\x0bmonster_seq\x18\x07 \x01(\r\x12\x11\n\tchain_atk\x18\x08 \x01(\r\x12\x0e\n\x06killed\x18\t \x01(\r\x12\x0e\n\x06is_luk\x18\n \x01(\r\x12\x0e\n\x06is_dex\x18\x0b \x01(\r\x12\x10\n\x08is_extra\x18\x0c \x01(\r\x12\x0e\n\x06reward\x18\r \x01(\t\x12\x0e\n\x06points\x18\x0f \x01(\r\x12\x0f\n\x07is_zimo\x18\x10 \x01(\r"\xc3\x03\n\x1aResFetchRPGBattleHistoryV2\x12\x18\n\x05error\x18\x01 \x01(\x0b2\t.lq.Error\x12D\n\rbattle_result\x18\x02 \x03(\x0b2-.lq.ResFetchRPGBattleHistoryV2.BattleResultV2\x12!\n\x0bstart_state\x18\x03 \x01(\x0b2\x0c.lq.RPGState\x12#\n\rcurrent_state\x18\x04 \x01(\x0b2\x0c.lq.RPGState\x12K\n\x14recent_battle_result\x18\x05 \x03(\x0b2-.lq.ResFetchRPGBattleHistoryV2.BattleResultV2\x1a\xaf\x01\n\x0eBattleResultV2\x12\x0c\n\x04uuid\x18\x0e \x01(\t\x12\r\n\x05chang\x18\x01 \x01(\r\x12\n\n\x02ju\x18\x02 \x01(\r\x12\x0b\n\x03ben\x18\x03 \x01(\r\x12\x0e\n\x06damage\x18\x05 \x01(\r\x12\x13\n\x0bmonster_seq\x18\x07 \x01(\r\x12\x0e\n\x06killed\x18\t \x01(\r\x12"\n\x04buff\x18\n \x03(\x0b2\x14.lq.ActivityBuffData\x12\x0e\n\x06points\x18\x0b \x01(\r"(\n\x11ReqBuyArenaTicket\x12\x13\n\x0bactivity_id\x18\x01 \x01(\r"%\n\x0eReqArenaReward\x12\x13\n\x0bactivity_id\x18\x01 \x01(\r"$\n\rReqEnterArena\x12\x13\n\x0bactivity_id\x18\x01 \x01(\r"\x81\x01\n\x0eResArenaReward\x12\x18\n\x05error\x18\x01 \x01(\x0b2\t.lq.Error\x12,\n\x05items\x18\x02 \x03(\x0b2\x1d.lq.ResArenaReward.RewardItem\x1a\'\n\nRewardItem\x12\n\n\x02id\x18\x01 \x01(\r\x12\r\n\x05count\x18\x02 \x01(\r"+\n\x14ReqReceiveRPGRewards\x12\x13\n\x0bactivity_id\x18\x01 \x01(\r"?\n\x13ReqReceiveRPGReward\x12\x13\n\x0bactivity_id\x18\x01 \x01(\r\x12\x13\n\x0bmonster_seq\x18\x02 \x01(\r"\x8d\x01\n\x14ResReceiveRPGRewards\x12\x18\n\x05error\x18\x01 \x01(\x0b2\t.lq.Error\x122\n\x05items\x18\x02 \x03(\x0b2#.lq.ResReceiveRPGRewards.RewardItem\x1a\'\n\nRewardItem\x12\n\n\x02id\x18\x01 \x01(\r\x12\r\n\x05count\x18\x02 \x01(\r"\x1f\n\x0fReqFetchOBToken\x12\x0c\n\x04uuid\x18\x01 \x01(\t"r\n\x0fResFetchOBToken\x12\x18\n\x05error\x18\x01 \x01(\x0b2\t.lq.Error\x12\r\n\x05token\x18\x02 \x01(\t\x12\x13\n\x0bcreate_time\x18\x03 \x01(\r\x12\r\n\x05delay\x18\x04 \x01(\r\x12\x12\n\nstart_time\x18\x05 \x01(\r"A\n\x1aReqReceiveCharacterRewards\x12\x14\n\x0ccharacter_id\x18\x01 \x01(\r\x12\r\n\x05level\x18\x02 \x01(\r"\x99\x01\n\x1aResReceiveCharacterRewards\x12\x18\n\x05error\x18\x01 \x01(\x0b2\t.lq.Error\x128\n\x05items\x18\x02 \x03(\x0b2).lq.ResReceiveCharacterRewards.RewardItem\x1a\'\n\nRewardItem\x12\n\n\x02id\x18\x01 \x01(\r\x12\r\n\x05count\x18\x02 \x01(\r"9\n\x13ReqFeedActivityFeed\x12\x13\n\x0bactivity_id\x18\x01 \x01(\r\x12\r\n\x05count\x18\x02 \x01(\r"\x9f\x01\n\x13ResFeedActivityFeed\x12\x18\n\x05error\x18\x01 \x01(\x0b2\t.lq.Error\x121\n\x05items\x18\x02 \x03(\x0b2".lq.ResFeedActivityFeed.RewardItem\x12\x12\n\nfeed_count\x18\x03 \x01(\r\x1a\'\n\nRewardItem\x12\n\n\x02id\x18\x01 \x01(\r\x12\r\n\x05count\x18\x02 \x01(\r"V\n\x1bReqSendActivityGiftToFriend\x12\x13\n\x0bactivity_id\x18\x01 \x01(\r\x12\x0f\n\x07item_id\x18\x02 \x01(\r\x12\x11\n\ttarget_id\x18\x03 \x01(\r"P\n\x1bResSendActivityGiftToFriend\x12\x18\n\x05error\x18\x01 \x01(\x0b2\t.lq.Error\x12\x17\n\x0fsend_gift_count\x18\x02 \x01(\r"9\n\x16ReqReceiveActivityGift\x12\x13\n\x0bactivity_id\x18\x01 \x01(\r\x12\n\n\x02id\x18\x02 \x01(\r"K\n\x1eReqFetchFriendGiftActivityData\x12\x13\n\x0bactivity_id\x18\x01 \x01(\r\x12\x14\n\x0caccount_list\x18\x02 \x03(\r"\x9f\x02\n\x1eResFetchFriendGiftActivityData\x12\x18\n\x05error\x18\x01 \x01(\x0b2\t.lq.Error\x12;\n\x04list\x18\x02 \x03(\x0b2-.lq.ResFetchFriendGiftActivityData.FriendData\x1a,\n\rItemCountData\x12\x0c\n\x04item\x18\x01 \x01(\r\x12\r\n\x05count\x18\x02 \x01(\r\x1ax\n\nFriendData\x12\x12\n\naccount_id\x18\x01 \x01(\r\x12?\n\x05items\x18\x02 \x03(\x0b20.lq.ResFetchFriendGiftActivityData.ItemCountData\x12\x15\n\rreceive_count\x18\x03 \x01(\r"7\n\x13ReqOpenPreChestItem\x12\x0f\n\x07item_id\x18\x01 \x01(\r\x12\x0f\n\x07pool_id\x18\x02 \x01(\r"P\n\x13ResOpenPreChestItem\x12\x18\n\x05error\x18\x01 \x01(\x0b2\t.lq.Error\x12\x1f\n\x07results\x18\x02 \x03(\x0b2\x0e.lq.OpenResult"+\n\x14ReqFetchVoteActivity\x12\x13\n\x0bactivity_id\x18\x01 \x01(\r"X\n\x14ResFetchVoteActivity\x12\x18\n\x05error\x18\x01 \x01(\x0b2\t.lq.Error\x12\x11\n\tvote_rank\x18\x02 \x03(\r\x12\x13\n\x0bupdate_time\x18\x03 \x01(\r"4\n\x0fReqVoteActivity\x12\x0c\n\x04vote\x18\x01 \x01(\r\x12\x13\n\x0bactivity_id\x18\x02 \x01(\r"O\n\x0fResVoteActivity\x12\x18\n\x05error\x18\x01 \x01(\x0b2\t.lq.Error\x12"\n\x0cvote_records\x18\x02 \x03(\x0b2\x0c.lq.VoteData"*\n\x15ReqUnlockActivitySpot\x12\x11\n\tunique_id\x18\x01 \x01(\r"C\n\x1bReqUnlockActivitySpotEnding\x12\x11\n\tunique_id\x18\x01 \x01(\r\x12\x11\n\tending_id\x18\x02 \x01(\r"1\n\x1cReqReceiveActivitySpotReward\x12\x11\n\tunique_id\x18\x01 \x01(\r"\x9d\x01\n\x1cResReceiveActivitySpotReward\x12\x18\n\x05error\x18\x01 \x01(\x0b2\t.lq.Error\x12:\n\x05items\x18\x02 \x03(\x0b2+.lq.ResReceiveActivitySpotReward.RewardItem\x1a\'\n\nRewardItem\x12\n\n\x02id\x18\x01 \x01(\r\x12\r\n\x05count\x18\x02 \x01(\r"/\n\x0cReqLogReport\x12\x0f\n\x07success\x18\x01 \x01(\r\x12\x0e\n\x06failed\x18\x02 \x01(\r",\n\rReqBindOauth2\x12\x0c\n\x04type\x18\x01 \x01(\r\x12\r\n\x05token\x18\x02 \x01(\t"\x1e\n\x0eReqFetchOauth2\x12\x0c\n\x04type\x18\x01 \x01(\r":\n\x0eResFetchOauth2\x12\x18\n\x05error\x18\x01 \x01(\x0b2\t.lq.Error\x12\x0e\n\x06openid\x18\x02 \x01(\t"A\n\x10ResDeleteAccount\x12\x18\n\x05error\x18\x01 \x01(\x0b2\t.lq.Error\x12\x13\n\x0bdelete_time\x18\x02 \x01(\r"$\n\x12ReqSetLoadingImage\x12\x0e\n\x06images\x18\x01 \x03(\r"\x9b\x01\n\x14ResFetchShopInterval\x12\x18\n\x05error\x18\x01 \x01(\x0b2\t.lq.Error\x125\n\x06result\x18\x02 \x03(\x0b2%.lq.ResFetchShopInterval.ShopInterval\x1a2\n\x0cShopInterval\x12\x10\n\x08group_id\x18\x01 \x01(\r\x12\x10\n\x08interval\x18\x02 \x01(\r"\xae\x01\n\x18ResFetchActivityInterval\x12\x18\n\x05error\x18\x01 \x01(\x0b2\t.lq.Error\x12=\n\x06result\x18\x02 \x03(\x0b2-.lq.ResFetchActivityInterval.ActivityInterval\x1a9\n\x10ActivityInterval\x12\x13\n\x0bactivity_id\x18\x01 \x01(\r\x12\x10\n\x08interval\x18\x02 \x01(\r"F\n\x14ResFetchrecentFriend\x12\x18\n\x05error\x18\x01 \x01(\x0b2\t.lq.Error\x12\x14\n\x0caccount_list\x18\x02 \x03(\r"2\n\x0cReqOpenGacha\x12\x13\n\x0bactivity_id\x18\x01 \x01(\r\x12\r\n\x05count\x18\x02 \x01(\r"\xa8\x01\n\x0cResOpenGacha\x12\x18\n\x05error\x18\x01 \x01(\x0b2\t.lq.Error\x12\x13\n\x0bresult_list\x18\x02 \x03(\r\x12\'\n\x0creward_items\x18\x03 \x03(\x0b2\x11.lq.ExecuteReward\x12*\n\x0fsp_reward_items\x18\x04 \x03(\x0b2\x11.lq.ExecuteReward\x12\x14\n\x0cremain_count\x18\x05 \x01(\r" \n\x0eReqTaskRequest\x12\x0e\n\x06params\x18\x01 \x03(\r"?\n\x1aReqSimulationActivityTrain\x12\x13\n\x0bactivity_id\x18\x01 \x01(\r\x12\x0c\n\x04type\x18\x02 \x01(\r"`\n\x1aResSimulationActivityTrain\x12\x18\n\x05error\x18\x01 \x01(\x0b2\t.lq.Error\x12\x13\n\x0bresult_type\x18\x02 \x01(\r\x12\x13\n\x0bfinal_stats\x18\x04 \x03(\r"F\n\x1cReqFetchSimulationGameRecord\x12\x11\n\tgame_uuid\x18\x01 \x01(\t\x12\x13\n\x0bactivity_id\x18\x02 \x01(\r"s\n\x1cResFetchSimulationGameRecord\x12\x18\n\x05error\x18\x01 \x01(\x0b2\t.lq.Error\x129\n\x08messages\x18\x02 \x03(\x0b2\'.lq.ActivitySimulationGameRecordMessage"5\n\x1eReqStartSimulationActivityGame\x12\x13\n\x0bactivity_id\x18\x01 \x01(\r"m\n\x1eResStartSimulationActivityGame\x12\x18\n\x05error\x18\x01 \x01(\x0b2\t.lq.Error\x121\n\x07records\x18\x02 \x03(\x0b2 .lq.ActivitySimulationGameRecord">\n\x1aReqFetchSimulationGameRank\x12\x13\n\x0bactivity_id\x18\x01 \x01(\r\x12\x0b\n\x03day\x18\x02 \x01(\r"\x9b\x01\n\x1aResFetchSimulationGameRank\x12\x18\n\x05error\x18\x01 \x01(\x0b2\t.lq.Error\x125\n\x04rank\x18\x02 \x03(\x0b2\'.lq.ResFetchSimulationGameRank.RankInfo\x1a,\n\x08RankInfo\x12\x11\n\tcharacter\x18\x01 \x01(\r\x12\r\n\x05score\x18\x02 \x01(\x02"@\n\x19ReqGenerateCombiningCraft\x12\x13\n\x0bactivity_id\x18\x01 \x01(\r\x12\x0e\n\x06bin_id\x18\x02 \x01(\r"T\n\x19ResGenerateCombiningCraft\x12\x18\n\x05error\x18\x01 \x01(\x0b2\t.lq.Error\x12\x0b\n\x03pos\x18\x02 \x01(\r\x12\x10\n\x08craft_id\x18\x03 \x01(\r"F\n\x15ReqMoveCombiningCraft\x12\x13\n\x0bactivity_id\x18\x01 \x01(\r\x12\x0c\n\x04from\x18\x02 \x01(\r\x12\n\n\x02to\x18\x03 \x01(\r"\xc2\x01\n\x15ResMoveCombiningCraft\x12\x18\n\x05error\x18\x01 \x01(\x0b2\t.lq.Error\x12\x0b\n\x03pos\x18\x02 \x01(\r\x12\x10\n\x08combined\x18\x03 \x01(\r\x12\x10\n\x08craft_id\x18\x04 \x01(\r\x122\n\x05bonus\x18\x05 \x01(\x0b2#.lq.ResMoveCombiningCraft.BonusData\x1a*\n\tBonusData\x12\x10\n\x08craft_id\x18\x01 \x01(\r\x12\x0b\n\x03pos\x18\x02 \x01(\r"<\n\x18ReqCombiningRecycleCraft\x12\x13\n\x0bactivity_id\x18\x01 \x01(\r\x12\x0b\n\x03pos\x18\x02 \x01(\r"]\n\x18ResCombiningRecycleCraft\x12\x18\n\x05error\x18\x01 \x01(\x0b2\t.lq.Error\x12\'\n\x0creward_items\x18\x02 \x03(\x0b2\x11.lq.ExecuteReward"1\n\x1aReqRecoverCombiningRecycle\x12\x13\n\x0bactivity_id\x18\x01 \x01(\r"U\n\x1aResRecoverCombiningRecycle\x12\x18\n\x05error\x18\x01 \x01(\x0b2\t.lq.Error\x12\x10\n\x08craft_id\x18\x02 \x01(\r\x12\x0b\n\x03pos\x18\x03 \x01(\r"T\n\x17ReqFinishCombiningOrder\x12\x13\n\x0bactivity_id\x18\x01 \x01(\r\x12\x11\n\tcraft_pos\x18\x02 \x01(\r\x12\x11\n\torder_pos\x18\x03 \x01(\r"\\\n\x17ResFinishCombiningOrder\x12\x18\n\x05error\x18\x01 \x01(\x0b2\t.lq.Error\x12\'\n\x0creward_items\x18\x02 \x03(\x0b2\x11.lq.ExecuteReward"\xf3\x0b\n\x0cResFetchInfo\x12\x18\n\x05error\x18\x01 \x01(\x0b2\t.lq.Error\x12&\n\x0bserver_time\x18\x02 \x01(\x0b2\x11.lq.ResServerTime\x12-\n\x0eserver_setting\x18\x03 \x01(\x0b2\x15.lq.ResServerSettings\x12(\n\x0cclient_value\x18\x04 \x01(\x0b2\x12.lq.ResClientValue\x12&\n\x0bfriend_list\x18\x05 \x01(\x0b2\x11.lq.ResFriendList\x121\n\x11friend_apply_list\x18\x06 \x01(\x0b2\x16.lq.ResFriendApplyList\x12/\n\rrecent_friend\x18\x07 \x01(\x0b2\x18.lq.ResFetchrecentFriend\x12"\n\tmail_info\x18\x08 \x01(\x0b2\x0f.lq.ResMailInfo\x120\n\x11receive_coin_info\x18\t \x01(\x0b2\x15.lq.ResReviveCoinInfo\x12$\n\ntitle_list\x18\n \x01(\x0b2\x10.lq.ResTitleList\x12 \n\x08bag_info\x18\x0b \x01(\x0b2\x0e.lq.ResBagInfo\x12"\n\tshop_info\x18\x0c \x01(\x0b2\x0f.lq.ResShopInfo\x12/\n\rshop_interval\x18\r \x01(\x0b2\x18.lq.ResFetchShopInterval\x121\n\ractivity_data\x18\x0e \x01(\x0b2\x1a.lq.ResAccountActivityData\x127\n\x11activity_interval\x18\x0f \x01(\x0b2\x1c.lq.ResFetchActivityInterval\x12*\n\ractivity_buff\x18\x10 \x01(\x0b2\x13.lq.ResActivityBuff\x12$\n\nvip_reward\x18\x11 \x01(\x0b2\x10.lq.ResVipReward\x121\n\x11month_ticket_info\x18\x12 \x01(\x0b2\x16.lq.ResMonthTicketInfo\x12\'\n\x0bachievement\x18\x13 \x01(\x0b2\x12.lq.ResAchievement\x12.\n\x0fcomment_setting\x18\x14 \x01(\x0b2\x15.lq.ResCommentSetting\x120\n\x10account_settings\x18\x15 \x01(\x0b2\x16.lq.ResAccountSettings\x121\n\x11mod_nickname_time\x18\x16 \x01(\x0b2\x16.lq.ResModNicknameTime\x12\x19\n\x04misc\x18\x17 \x01(\x0b2\x0b.lq.ResMisc\x12)\n\x0cannouncement\x18\x18 \x01(\x0b2\x13.lq.ResAnnouncement\x12*\n\ractivity_list\x18\x1a \x01(\x0b2\x13.lq.ResActivityList\x12,\n\x0echaracter_info\x18\x1b \x01(\x0b2\x14.lq.ResCharacterInfo\x12/\n\x10all_common_views\x18\x1c \x01(\x0b2\x15.lq.ResAllcommonViews\x12B\n\x1acollected_game_record_list\x18\x1d \x01(\x0b2\x1e.lq.ResCollectedGameRecordList\x123\n\x0fmaintain_notice\x18\x1e \x01(\x0b2\x1a.lq.ResFetchMaintainNotice\x120\n\x10random_character\x18\x1f \x01(\x0b2\x16.lq.ResRandomCharacter\x12;\n\x10maintenance_info\x18  \x01(\x0b2!.lq.ResFetchServerMaintenanceInfo\x12\'\n\tseer_info\x18! \x01(\x0b2\x14.lq.ResFetchSeerInfo\x128\n\x12annual_report_info\x18" \x01(\x0b2\x1c.lq.ResFetchAnnualReportInfo"k\n\x10ResFetchSeerInfo\x12\x18\n\x05error\x18\x01 \x01(\x0b2\t.lq.Error\x12\x14\n\x0cremain_count\x18\x02 \x01(\r\x12\x12\n\ndate_limit\x18\x03 \x01(\r\x12\x13\n\x0bexpire_time\x18\x04 \x01(\r"\xbb\x01\n\x1dResFetchServerMaintenanceInfo\x12]\n\x14function_maintenance\x18\x01 \x03(\x0b2?.lq.ResFetchServerMaintenanceInfo.ServerFunctionMaintenanceInfo\x1a;\n\x1dServerFunctionMaintenanceInfo\x12\x0c\n\x04name\x18\x01 \x01(\t\x12\x0c\n\x04open\x18\x02 \x01(\x08"E\n\x19ReqUpgradeVillageBuilding\x12\x13\n\x0bbuilding_id\x18\x01 \x01(\r\x12\x13\n\x0bactivity_id\x18\x02 \x01(\r"l\n\x1fReqReceiveVillageBuildingReward\x12\x13\n\x0bactivity_id\x18\x01 \x01(\r\x12\x13\n\x0bbuilding_id\x18\x02 \x01(\r\x12\x1f\n\x07rewards\x18\x03 \x03(\x0b2\x0e.lq.RewardSlot"d\n\x1fResReceiveVillageBuildingReward\x12\x18\n\x05error\x18\x01 \x01(\x0b2\t.lq.Error\x12\'\n\x0creward_items\x18\x02 \x03(\x0b2\x11.lq.ExecuteReward"8\n\x13ReqStartVillageTrip\x12\x0c\n\x04dest\x18\x01 \x01(\r\x12\x13\n\x0bactivity_id\x18\x02 \x01(\r"d\n\x1bReqReceiveVillageTripReward\x12\x13\n\x0bactivity_id\x18\x01 \x01(\r\x12\x0f\n\x07dest_id\x18\x02 \x01(\r\x12\x1f\n\x07rewards\x18\x03 \x03(\x0b2\x0e.lq.RewardSlot"`\n\x1bResReceiveVillageTripReward\x12\x18\n\x05error\x18\x01 \x01(\x0b2\t.lq.Error\x12\'\n\x0creward_items\x18\x02 \x03(\x0b2\x11.lq.ExecuteReward">\n\x16ReqCompleteVillageTask\x12\x0f\n\x07task_id\x18\x01 \x01(\r\x12\x13\n\x0bactivity_id\x18\x02 \x01(\r"[\n\x16ResCompleteVillageTask\x12\x18\n\x05error\x18\x01 \x01(\x0b2\t.lq.Error\x12\'\n\x0creward_items\x18\x02 \x03(\x0b2\x11.lq.ExecuteReward"D\n\x17ReqGetFriendVillageData\x12\x14\n\x0caccount_list\x18\x01 \x03(\r\x12\x13\n\x0bactivity_id\x18\x02 \x01(\r"\xa8\x01\n\x17ResGetFriendVillageData\x12\x18\n\x05error\x18\x01 \x01(\x0b2\t.lq.Error\x12;\n\x04list\x18\x02 \x03(\x0b2-.lq.ResGetFriendVillageData.FriendVillageData\x1a6\n\x11FriendVillageData\x12\x12\n\naccount_id\x18\x01 \x01(\r\x12\r\n\x05level\x18\x02 \x01(\r"S\n\x13ReqSetVillageWorker\x12\x13\n\x0bbuilding_id\x18\x01 \x01(\r\x12\x12\n\nworker_pos\x18\x02 \x01(\r\x12\x13\n\x0bactivity_id\x18\x03 \x01(\r"o\n\x13ResSetVillageWorker\x12\x18\n\x05error\x18\x01 \x01(\x0b2\t.lq.Error\x12)\n\x08building\x18\x02 \x01(\x0b2\x17.lq.VillageBuildingData\x12\x13\n\x0bupdate_time\x18\x03 \x01(\r"*\n\x13ReqNextRoundVillage\x12\x13\n\x0bactivity_id\x18\x01 \x01(\r"_\n\x13ResNextRoundVillage\x12\x18\n\x05error\x18\x01 \x01(\x0b2\t.lq.Error\x12.\n\ractivity_data\x18\x02 \x01(\x0b2\x17.lq.ActivityVillageData"U\n"ReqResolveFestivalActivityProposal\x12\x13\n\x0bactivity_id\x18\x01 \x01(\r\x12\n\n\x02id\x18\x02 \x01(\r\x12\x0e\n\x06select\x18\x03 \x01(\r"\x9d\x01\n"ResResolveFestivalActivityProposal\x12\x18\n\x05error\x18\x01 \x01(\x0b2\t.lq.Error\x12\x15\n\reffected_buff\x18\x02 \x03(\r\x12\x0e\n\x06result\x18\x03 \x01(\r\x12\'\n\x0creward_items\x18\x04 \x03(\x0b2\x11.lq.ExecuteResult\x12\r\n\x05level\x18\x05 \x01(\r"R\n\x1fReqResolveFestivalActivityEvent\x12\x13\n\x0bactivity_id\x18\x01 \x01(\r\x12\n\n\x02id\x18\x02 \x01(\r\x12\x0e\n\x06select\x18\x03 \x01(\r"\x9d\x01\n\x1fResResolveFestivalActivityEvent\x12\x18\n\x05error\x18\x01 \x01(\x0b2\t.lq.Error\x12\x15\n\reffected_buff\x18\x02 \x03(\r\x12\'\n\x0creward_items\x18\x04 \x03(\x0b2\x11.lq.ExecuteResult\x12\x11\n\tending_id\x18\x05 \x01(\r\x12\r\n\x05level\x18\x06 \x01(\r"-\n\x16ReqBuyFestivalProposal\x12\x13\n\x0bactivity_id\x18\x01 \x01(\r"b\n\x16ResBuyFestivalProposal\x12\x18\n\x05error\x18\x01 \x01(\x0b2\t.lq.Error\x12.\n\x0cnew_proposal\x18\x02 \x01(\x0b2\x18.lq.FestivalProposalData"=\n\x15ReqIslandActivityMove\x12\x13\n\x0bactivity_id\x18\x01 \x01(\r\x12\x0f\n\x07zone_id\x18\x02 \x01(\r"\xb7\x01\n\x14ReqIslandActivityBuy\x12\x13\n\x0bactivity_id\x18\x01 \x01(\r\x120\n\x05items\x18\x02 \x03(\x0b2!.lq.ReqIslandActivityBuy.BuyItems\x1aX\n\x08BuyItems\x12\x10\n\x08goods_id\x18\x02 \x01(\r\x12\x0b\n\x03pos\x18\x03 \x03(\r\x12\x0e\n\x06rotate\x18\x04 \x01(\r\x12\x0e\n\x06bag_id\x18\x05 \x01(\r\x12\r\n\x05price\x18\x06 \x01(\r"\x96\x01\n\x15ReqIslandActivitySell\x12\x13\n\x0bactivity_id\x18\x01 \x01(\r\x121\n\x05items\x18\x02 \x03(\x0b2".lq.ReqIslandActivitySell.SellItem\x1a5\n\x08SellItem\x12\x0e\n\x06bag_id\x18\x02 \x01(\r\x12\n\n\x02id\x18\x03 \x01(\r\x12\r\n\x05price\x18\x04 \x01(\r"\x85\x02\n\x18ReqIslandActivityTidyBag\x12\x13\n\x0bactivity_id\x18\x01 \x01(\r\x126\n\x08bag_data\x18\x02 \x03(\x0b2$.lq.ReqIslandActivityTidyBag.BagData\x1a\x9b\x01\n\x07BagData\x12\x0e\n\x06bag_id\x18\x02 \x01(\r\x12<\n\x05items\x18\x03 \x03(\x0b2-.lq.ReqIslandActivityTidyBag.BagData.ITemData\x12\r\n\x05drops\x18\x04 \x03(\r\x1a3\n\x08ITemData\x12\n\n\x02id\x18\x01 \x01(\r\x12\x0b\n\x03pos\x18\x02 \x03(\r\x12\x0e\n\x06rotate\x18\x03 \x01(\r"R\n\x1eReqIslandActivityUnlockBagGrid\x12\x13\n\x0bactivity_id\x18\x01 \x01(\r\x12\x0e\n\x06bag_id\x18\x02 \x01(\r\x12\x0b\n\x03pos\x18\x03 \x03(\r"\x9d\x01\n\x0eContestSetting\x122\n\x0blevel_limit\x18\x01 \x03(\x0b2\x1d.lq.ContestSetting.LevelLimit\x12\x12\n\ngame_limit\x18\x02 \x01(\r\x12\x18\n\x10system_broadcast\x18\x03 \x01(\r\x1a)\n\nLevelLimit\x12\x0c\n\x04type\x18\x01 \x01(\r\x12\r\n\x05value\x18\x02 \x01(\r"\xe0\x01\n\x1aReqCreateCustomizedContest\x12\x0c\n\x04name\x18\x01 \x01(\t\x12\x11\n\topen_show\x18\x02 \x01(\r\x12\'\n\x11game_rule_setting\x18\x03 \x01(\x0b2\x0c.lq.GameMode\x12\x12\n\nstart_time\x18\x04 \x01(\r\x12\x10\n\x08end_time\x18\x05 \x01(\r\x12\x12\n\nauto_match\x18\x06 \x01(\r\x12\x11\n\trank_rule\x18\x07 \x01(\r\x12+\n\x0fcontest_setting\x18\x08 \x01(\x0b2\x12.lq.ContestSetting"I\n\x1aResCreateCustomizedContest\x12\x18\n\x05error\x18\x01 \x01(\x0b2\t.lq.Error\x12\x11\n\tunique_id\x18\x02 \x01(\r"4\n$ReqFetchmanagerCustomizedContestList\x12\x0c\n\x04lang\x18\x01 \x01(\t"m\n$ResFetchManagerCustomizedContestList\x12\x18\n\x05error\x18\x01 \x01(\x0b2\t.lq.Error\x12+\n\x08contests\x18\x02 \x03(\x0b2\x19.lq.CustomizedContestBase"5\n ReqFetchManagerCustomizedContest\x12\x11\n\tunique_id\x18\x01 \x01(\r"\xac\x02\n ResFetchManagerCustomizedContest\x12\x18\n\x05error\x18\x01 \x01(\x0b2\t.lq.Error\x12\x0c\n\x04name\x18\x02 \x01(\t\x12\x11\n\topen_show\x18\x03 \x01(\r\x12\'\n\x11game_rule_setting\x18\x04 \x01(\x0b2\x0c.lq.GameMode\x12\x12\n\nstart_time\x18\x05 \x01(\r\x12\x10\n\x08end_time\x18\x06 \x01(\r\x12\x12\n\nauto_match\x18\x07 \x01(\r\x12\x11\n\trank_rule\x18\x08 \x01(\r\x12\x13\n\x0bcheck_state\x18\t \x01(\r\x12\x15\n\rchecking_name\x18\n \x01(\t\x12+\n\x0fcontest_setting\x18\x0b \x01(\x0b2\x12.lq.ContestSetting"\xfa\x01\n!ReqUpdateManagerCustomizedContest\x12\x0c\n\x04name\x18\x01 \x01(\t\x12\x11\n\topen_show\x18\x02 \x01(\r\x12\'\n\x11game_rule_setting\x18\x03 \x01(\x0b2\x0c.lq.GameMode\x12\x12\n\nstart_time\x18\x04 \x01(\r\x12\x10\n\x08end_time\x18\x05 \x01(\r\x12\x11\n\tunique_id\x18\x06 \x01(\r\x12\x12\n\nauto_match\x18\x07 \x01(\r\x12\x11\n\trank_rule\x18\x08 \x01(\r\x12+\n\x0fcontest_setting\x18\t \x01(\x0b2\x12.lq.ContestSetting"M\n\x19ReqFetchContestPlayerRank\x12\x11\n\tunique_id\x18\x01 \x01(\r\x12\r\n\x05limit\x18\x02 \x01(\r\x12\x0e\n\x06offset\x18\x03 \x01(\r"\xd9\x06\n\x19ResFetchContestPlayerRank\x12\x18\n\x05error\x18\x01 \x01(\x0b2\t.lq.Error\x12\r\n\x05total\x18\x02 \x01(\r\x126\n\x04rank\x18\x03 \x03(\x0b2(.lq.ResFetchContestPlayerRank.SeasonRank\x12=\n\x0bplayer_data\x18\x04 \x01(\x0b2(.lq.ResFetchContestPlayerRank.PlayerData\x1a\xbf\x03\n\x18ContestPlayerAccountData\x12\x18\n\x10total_game_count\x18\x01 \x01(\r\x12^\n\x0crecent_games\x18\x02 \x03(\x0b2H.lq.ResFetchContestPlayerRank.ContestPlayerAccountData.ContestGameResult\x12m\n\x15highest_series_points\x18\x03 \x03(\x0b2N.lq.ResFetchContestPlayerRank.ContestPlayerAccountData.ContestSeriesGameResult\x1a6\n\x11ContestGameResult\x12\x0c\n\x04rank\x18\x01 \x01(\r\x12\x13\n\x0btotal_point\x18\x02 \x01(\x05\x1a\x81\x01\n\x17ContestSeriesGameResult\x12\x0b\n\x03key\x18\x01 \x01(\r\x12Y\n\x07results\x18\x02 \x03(\x0b2H.lq.ResFetchContestPlayerRank.ContestPlayerAccountData.ContestGameResult\x1ax\n\nSeasonRank\x12\x12\n\naccount_id\x18\x01 \x01(\r\x12\x10\n\x08nickname\x18\x02 \x01(\t\x12D\n\x04data\x18\x03 \x01(\x0b26.lq.ResFetchContestPlayerRank.ContestPlayerAccountData\x1a`\n\nPlayerData\x12\x0c\n\x04rank\x18\x01 \x01(\r\x12D\n\x04data\x18\x02 \x01(\x0b26.lq.ResFetchContestPlayerRank.ContestPlayerAccountData",\n\x17ReqFetchReadyPlayerList\x12\x11\n\tunique_id\x18\x01 \x01(\r"\x95\x01\n\x17ResFetchReadyPlayerList\x12\x18\n\x05error\x18\x01 \x01(\x0b2\t.lq.Error\x120\n\x04list\x18\x02 \x03(\x0b2".lq.ResFetchReadyPlayerList.Player\x1a.\n\x06Player\x12\x12\n\naccount_id\x18\x01 \x01(\r\x12\x10\n\x08nickname\x18\x02 \x01(\t"~\n\x11ReqCreateGamePlan\x12\x11\n\tunique_id\x18\x01 \x01(\r\x12\x14\n\x0caccount_list\x18\x02 \x03(\r\x12\x17\n\x0fgame_start_time\x18\x03 \x01(\r\x12\x15\n\rshuffle_seats\x18\x04 \x01(\r\x12\x10\n\x08ai_level\x18\x05 \x01(\r"L\n"ResGenerateContestManagerLoginCode\x12\x18\n\x05error\x18\x01 \x01(\x0b2\t.lq.Error\x12\x0c\n\x04code\x18\x02 \x01(\t"1\n\x1aReqAmuletActivityFetchInfo\x12\x13\n\x0bactivity_id\x18\x01 \x01(\r"\\\n\x1aResAmuletActivityFetchInfo\x12\x18\n\x05error\x18\x01 \x01(\x0b2\t.lq.Error\x12$\n\x04data\x18\x02 \x01(\x0b2\x16.lq.ActivityAmuletData"2\n\x1bReqAmuletActivityFetchBrief\x12\x13\n\x0bactivity_id\x18\x01 \x01(\r"\xd2\x01\n\x1bResAmuletActivityFetchBrief\x12\x18\n\x05error\x18\x01 \x01(\x0b2\t.lq.Error\x12.\n\x07upgrade\x18\x04 \x01(\x0b2\x1d.lq.ActivityAmuletUpgradeData\x12?\n\x10illustrated_book\x18\x05 \x01(\x0b2%.lq.ActivityAmuletIllustratedBookData\x12(\n\x04task\x18\x06 \x01(\x0b2\x1a.lq.ActivityAmuletTaskData"1\n\x1aReqAmuletActivityStartGame\x12\x13\n\x0bactivity_id\x18\x01 \x01(\r"X\n\x1aResAmuletActivityStartGame\x12\x18\n\x05error\x18\x01 \x01(\x0b2\t.lq.Error\x12 \n\x04game\x18\x02 \x01(\x0b2\x12.lq.AmuletGameData"K\n\x18ReqAmuletActivityOperate\x12\x13\n\x0bactivity_id\x18\x01 \x01(\r\x12\x0c\n\x04type\x18\x02 \x01(\r\x12\x0c\n\x04tile\x18\x03 \x03(\r"\xad\x03\n\x18ResAmuletActivityOperate\x12\x18\n\x05error\x18\x01 \x01(\x0b2\t.lq.Error\x12.\n\thu_result\x18\x02 \x01(\x0b2\x1b.lq.AmuletHuleOperateResult\x120\n\x0bgang_result\x18\x03 \x01(\x0b2\x1b.lq.AmuletGangOperateResult\x12-\n\x0bdeal_result\x18\x04 \x01(\x0b2\x18.lq.AmuletDealTileResult\x12/\n\x0eupgrade_result\x18\x05 \x01(\x0b2\x17.lq.AmuletUpgradeResult\x12\x10\n\x08upgraded\x18\x06 \x01(\x08\x12\x0e\n\x06failed\x18\x07 \x01(\x08\x12-\n\x0bgame_update\x18\x08 \x01(\x0b2\x18.lq.AmuletGameUpdateData\x123\n\x0ediscard_result\x18\t \x01(\x0b2\x1b.lq.AmuletDiscardTileResult\x12/\n\x0cstart_result\x18\n \x01(\x0b2\x19.lq.AmuletStartGameResult"B\n\x1cReqAmuletActivityChangeHands\x12\x13\n\x0bactivity_id\x18\x01 \x01(\r\x12\r\n\x05hands\x18\x02 \x03(\r"\xc3\x01\n\x1cResAmuletActivityChangeHands\x12\x18\n\x05error\x18\x01 \x01(\x0b2\t.lq.Error\x12\r\n\x05hands\x18\x02 \x03(\r\x12 \n\x18remain_change_tile_count\x18\x03 \x01(\r\x12-\n\tting_list\x18\x04 \x03(\x0b2\x1a.lq.AmuletActivityTingInfo\x12)\n\x0beffect_list\x18\x05 \x03(\x0b2\x14.lq.AmuletEffectData"/\n\x18ReqAmuletActivityUpgrade\x12\x13\n\x0bactivity_id\x18\x01 \x01(\r"\x89\x01\n\x18ResAmuletActivityUpgrade\x12\x18\n\x05error\x18\x01 \x01(\x0b2\t.lq.Error\x12 \n\x04game\x18\x02 \x01(\x0b2\x12.lq.AmuletGameData\x121\n\x0bhook_effect\x18\x03 \x03(\x0b2\x1c.lq.AmuletActivityHookEffect">\n\x1bReqAmuletActivitySelectPack\x12\x13\n\x0bactivity_id\x18\x01 \x01(\r\x12\n\n\x02id\x18\x02 \x01(\r"\x88\x01\n\x1bResAmuletActivitySelectPack\x12\x18\n\x05error\x18\x01 \x01(\x0b2\t.lq.Error\x12)\n\x0beffect_list\x18\x02 \x03(\x0b2\x14.lq.AmuletEffectData\x12$\n\x04shop\x18\x03 \x01(\x0b2\x16.lq.AmuletGameShopData"7\n\x14ReqAmuletActivityBuy\x12\x13\n\x0bactivity_id\x18\x01 \x01(\r\x12\n\n\x02id\x18\x03 \x01(\r"\xbb\x01\n\x14ResAmuletActivityBuy\x12\x18\n\x05error\x18\x01 \x01(\x0b2\t.lq.Error\x12\x0c\n\x04coin\x18\x02 \x01(\r\x12$\n\x04shop\x18\x03 \x01(\x0b2\x16.lq.AmuletGameShopData\x12\r\n\x05stage\x18\x04 \x01(\r\x12)\n\x0beffect_list\x18\x05 \x03(\x0b2\x14.lq.AmuletEffectData\x12\x1b\n\x13total_consumed_coin\x18\x06 \x01(\r">\n\x1bReqAmuletActivitySellEffect\x12\x13\n\x0bactivity_id\x18\x01 \x01(\r\x12\n\n\x02id\x18\x02 \x01(\r"\x9a\x02\n\x1bResAmuletActivitySellEffect\x12\x18\n\x05error\x18\x01 \x01(\x0b2\t.lq.Error\x12\x0c\n\x04coin\x18\x02 \x01(\r\x12)\n\x0beffect_list\x18\x03 \x03(\x0b2\x14.lq.AmuletEffectData\x12-\n\x0bgame_update\x18\x04 \x01(\x0b2\x18.lq.AmuletGameUpdateData\x12 \n\x18remain_change_tile_count\x18\x05 \x01(\r\x121\n\x0bhook_effect\x18\x06 \x03(\x0b2\x1c.lq.AmuletActivityHookEffect\x12$\n\x04shop\x18\x07 \x01(\x0b2\x16.lq.AmuletGameShopData"E\n\x1bReqAmuletActivityEffectSort\x12\x13\n\x0bactivity_id\x18\x01 \x01(\r\x12\x11\n\tsorted_id\x18\x02 \x03(\r".\n\x17ReqAmuletActivityGiveup\x12\x13\n\x0bactivity_id\x18\x01 \x01(\r"3\n\x1cReqAmuletActivityRefreshShop\x12\x13\n\x0bactivity_id\x18\x01 \x01(\r"\x97\x01\n\x1cResAmuletActivityRefreshShop\x12\x18\n\x05error\x18\x01 \x01(\x0b2\t.lq.Error\x12$\n\x04shop\x18\x02 \x01(\x0b2\x16.lq.AmuletGameShopData\x12\x0c\n\x04coin\x18\x03 \x01(\r\x12)\n\x0beffect_list\x18\x04 \x03(\x0b2\x14.lq.AmuletEffectData"M\n!ReqAmuletActivitySelectFreeEffect\x12\x13\n\x0bactivity_id\x18\x01 \x01(\r\x12\x13\n\x0bselected_id\x18\x02 \x01(\r"\xbe\x01\n!ResAmuletActivitySelectFreeEffect\x12\x18\n\x05error\x18\x01 \x01(\x0b2\t.lq.Error\x12-\n\x0bgame_update\x18\x03 \x01(\x0b2\x18.lq.AmuletGameUpdateData\x12 \n\x18remain_change_tile_count\x18\x04 \x01(\r\x12\x13\n\x0blocked_tile\x18\x05 \x03(\r\x12\x19\n\x11locked_tile_count\x18\x06 \x01(\r"C\n ReqAmuletActivityUpgradeShopBuff\x12\x13\n\x0bactivity_id\x18\x01 \x01(\r\x12\n\n\x02id\x18\x02 \x01(\r"\xb6\x01\n ResAmuletActivityUpgradeShopBuff\x12\x18\n\x05error\x18\x01 \x01(\x0b2\t.lq.Error\x12-\n\x0bgame_update\x18\x03 \x01(\x0b2\x18.lq.AmuletGameUpdateData\x12,\n\x0eshop_buff_list\x18\x04 \x03(\x0b2\x14.lq.AmuletEffectData\x12\x1b\n\x13total_consumed_coin\x18\x05 \x01(\r"3\n\x1cReqAmuletActivityEndShopping\x12\x13\n\x0bactivity_id\x18\x01 \x01(\r"g\n\x1cResAmuletActivityEndShopping\x12\x18\n\x05error\x18\x01 \x01(\x0b2\t.lq.Error\x12-\n\x0bgame_update\x18\x03 \x01(\x0b2\x18.lq.AmuletGameUpdateData"Y\n\x1eReqAmuletActivitySetSkillLevel\x12\x13\n\x0bactivity_id\x18\x01 \x01(\r\x12"\n\x05skill\x18\x02 \x03(\x0b2\x13.lq.AmuletSkillData"G\n\x1dResAmuletActivityMaintainInfo\x12\x18\n\x05error\x18\x01 \x01(\x0b2\t.lq.Error\x12\x0c\n\x04mode\x18\x02 \x01(\t"D\n!ReqAmuletActivitySelectRewardPack\x12\x13\n\x0bactivity_id\x18\x01 \x01(\r\x12\n\n\x02id\x18\x02 \x01(\r"\x92\x01\n!ResAmuletActivitySelectRewardPack\x12\x18\n\x05error\x18\x01 \x01(\x0b2\t.lq.Error\x12-\n\x0bgame_update\x18\x02 \x01(\x0b2\x18.lq.AmuletGameUpdateData\x12$\n\x04shop\x18\x03 \x01(\x0b2\x16.lq.AmuletGameShopData"L\n"ReqAmuletActivityReceiveTaskReward\x12\x13\n\x0bactivity_id\x18\x01 \x01(\r\x12\x11\n\ttask_list\x18\x02 \x03(\r"h\n"ResAmuletActivityReceiveTaskReward\x12\x18\n\x05error\x18\x01 \x01(\x0b2\t.lq.Error\x12(\n\x04task\x18\x02 \x01(\x0b2\x1a.lq.ActivityAmuletTaskData"?\n\x16ReqStoryActivityUnlock\x12\x13\n\x0bactivity_id\x18\x01 \x01(\r\x12\x10\n\x08story_id\x18\x02 \x01(\r"X\n\x1cReqStoryActivityUnlockEnding\x12\x13\n\x0bactivity_id\x18\x01 \x01(\r\x12\x10\n\x08story_id\x18\x02 \x01(\r\x12\x11\n\tending_id\x18\x03 \x01(\r"_\n#ReqStoryActivityReceiveEndingReward\x12\x13\n\x0bactivity_id\x18\x01 \x01(\r\x12\x10\n\x08story_id\x18\x02 \x01(\r\x12\x11\n\tending_id\x18\x03 \x01(\r"S\n\x0eResStoryReward\x12\x18\n\x05error\x18\x01 \x01(\x0b2\t.lq.Error\x12\'\n\x0creward_items\x18\x02 \x03(\x0b2\x11.lq.ExecuteReward"L\n#ReqStoryActivityReceiveFinishReward\x12\x13\n\x0bactivity_id\x18\x01 \x01(\r\x12\x10\n\x08story_id\x18\x02 \x01(\r"O\n&ReqStoryActivityReceiveAllFinishReward\x12\x13\n\x0bactivity_id\x18\x01 \x01(\r\x12\x10\n\x08story_id\x18\x02 \x01(\r"b\n&ReqStoryActivityUnlockEndingAndReceive\x12\x13\n\x0bactivity_id\x18\x01 \x01(\r\x12\x10\n\x08story_id\x18\x02 \x01(\r\x12\x11\n\tending_id\x18\x03 \x01(\r"\xc4\x01\n&ResStoryActivityUnlockEndingAndReceive\x12\x18\n\x05error\x18\x01 \x01(\x0b2\t.lq.Error\x12(\n\rending_reward\x18\x02 \x03(\x0b2\x11.lq.ExecuteReward\x12(\n\rfinish_reward\x18\x03 \x03(\x0b2\x11.lq.ExecuteReward\x12,\n\x11all_finish_reward\x18\x04 \x03(\x0b2\x11.lq.ExecuteReward"A\n\x14ReqFetchActivityRank\x12\x13\n\x0bactivity_id\x18\x01 \x01(\r\x12\x14\n\x0caccount_list\x18\x02 \x03(\r"\xf6\x01\n\x14ResFetchActivityRank\x12\x18\n\x05error\x18\x01 \x01(\x0b2\t.lq.Error\x128\n\x05items\x18\x04 \x03(\x0b2).lq.ResFetchActivityRank.ActivityRankItem\x127\n\x04self\x18\x05 \x01(\x0b2).lq.ResFetchActivityRank.ActivityRankItem\x1aQ\n\x10ActivityRankItem\x12\x12\n\naccount_id\x18\x01 \x01(\r\x12\r\n\x05score\x18\x02 \x01(\x04\x12\x0c\n\x04data\x18\x03 \x01(\t\x12\x0c\n\x04rank\x18\x04 \x01(\r":\n\x19ReqFetchQuestionnaireList\x12\x0c\n\x04lang\x18\x01 \x01(\t\x12\x0f\n\x07channel\x18\x02 \x01(\t"r\n\x19ResFetchQuestionnaireList\x12\x18\n\x05error\x18\x01 \x01(\x0b2\t.lq.Error\x12$\n\x04list\x18\x02 \x03(\x0b2\x16.lq.QuestionnaireBrief\x12\x15\n\rfinished_list\x18\x03 \x03(\r"H\n\x1bReqFetchQuestionnaireDetail\x12\n\n\x02id\x18\x01 \x01(\r\x12\x0c\n\x04lang\x18\x02 \x01(\t\x12\x0f\n\x07channel\x18\x03 \x01(\t"`\n\x1bResFetchQuestionnaireDetail\x12\x18\n\x05error\x18\x01 \x01(\x0b2\t.lq.Error\x12\'\n\x06detail\x18\x02 \x01(\x0b2\x17.lq.QuestionnaireDetail"/\n\x14ReqSetVerifiedHidden\x12\x17\n\x0fverified_hidden\x18\x01 \x01(\r"\x94\x03\n\x16ReqSubmitQuestionnaire\x12\x18\n\x10questionnaire_id\x18\x01 \x01(\r\x12 \n\x18questionnaire_version_id\x18\x02 \x01(\r\x12?\n\x07answers\x18\x03 \x03(\x0b2..lq.ReqSubmitQuestionnaire.QuestionnaireAnswer\x12\x11\n\topen_time\x18\x04 \x01(\r\x12\x13\n\x0bfinish_time\x18\x05 \x01(\r\x12\x0e\n\x06client\x18\x06 \x01(\t\x1a\xc4\x01\n\x13QuestionnaireAnswer\x12\x13\n\x0bquestion_id\x18\x01 \x01(\r\x12W\n\x06values\x18\x02 \x03(\x0b2G.lq.ReqSubmitQuestionnaire.QuestionnaireAnswer.QuestionnaireAnswerValue\x1a?\n\x18QuestionnaireAnswerValue\x12\r\n\x05value\x18\x01 \x01(\t\x12\x14\n\x0ccustom_input\x18\x02 \x01(\t"<\n\x1dReqSetFriendRoomRandomBotChar\x12\x1b\n\x13disable_random_char\x18\x01 \x01(\r"L\n\x1cReqFetchAccountGameHuRecords\x12\x0c\n\x04uuid\x18\x01 \x01(\t\x12\x10\n\x08category\x18\x02 \x01(\r\x12\x0c\n\x04type\x18\x03 \x01(\r"\x82\x02\n\x1cResFetchAccountGameHuRecords\x12\x18\n\x05error\x18\x01 \x01(\x0b2\t.lq.Error\x12?\n\x07records\x18\x02 \x03(\x0b2..lq.ResFetchAccountGameHuRecords.GameHuRecords\x1a\x86\x01\n\rGameHuRecords\x12\r\n\x05chang\x18\x01 \x01(\r\x12\n\n\x02ju\x18\x02 \x01(\r\x12\x0b\n\x03ben\x18\x03 \x01(\r\x12\x10\n\x08title_id\x18\x04 \x01(\r\x12\r\n\x05hands\x18\x05 \x03(\t\x12\x0c\n\x04ming\x18\x06 \x03(\t\x12\r\n\x05hupai\x18\x07 \x01(\t\x12\x0f\n\x07hu_fans\x18\x08 \x03(\r"N\n\x18ReqFetchAccountInfoExtra\x12\x12\n\naccount_id\x18\x01 \x01(\r\x12\x10\n\x08category\x18\x02 \x01(\r\x12\x0c\n\x04type\x18\x03 \x01(\r"\xbb\x06\n\x18ResFetchAccountInfoExtra\x12\x18\n\x05error\x18\x01 \x01(\x0b2\t.lq.Error\x12H\n\x0crecent_games\x18\x02 \x03(\x0b22.lq.ResFetchAccountInfoExtra.AccountInfoGameRecord\x12F\n\x0fhu_type_details\x18\x03 \x03(\x0b2-.lq.ResFetchAccountInfoExtra.GameHuTypeDetail\x12M\n\x11game_rank_details\x18\x04 \x03(\x0b22.lq.ResFetchAccountInfoExtra.AccountGameRankDetail\x1a\xbc\x03\n\x15AccountInfoGameRecord\x12\x0c\n\x04uuid\x18\x01 \x01(\t\x12\x12\n\nstart_time\x18\x02 \x01(\r\x12\x10\n\x08end_time\x18\x03 \x01(\r\x12\x0b\n\x03tag\x18\x04 \x01(\r\x12\x0f\n\x07sub_tag\x18\x05 \x01(\r\x12\x0c\n\x04rank\x18\x06 \x01(\r\x12\x13\n\x0bfinal_point\x18\x07 \x01(\r\x12U\n\x07results\x18\x08 \x03(\x0b2D.lq.ResFetchAccountInfoExtra.AccountInfoGameRecord.AccountGameResult\x1a\xd6\x01\n\x11AccountGameResult\x12\x0c\n\x04rank\x18\x01 \x01(\r\x12\x12\n\naccount_id\x18\x02 \x01(\r\x12\x10\n\x08nickname\x18\x03 \x01(\t\x12\x10\n\x08verified\x18\x04 \x01(\r\x12\x15\n\rgrading_score\x18\x05 \x01(\x05\x12\x13\n\x0bfinal_point\x18\x06 \x01(\x05\x12\x0c\n\x04seat\x18\x07 \x01(\r\x12\x1f\n\x05level\x18\x08 \x01(\x0b2\x10.lq.AccountLevel\x12 \n\x06level3\x18\t \x01(\x0b2\x10.lq.AccountLevel\x1a/\n\x10GameHuTypeDetail\x12\x0c\n\x04type\x18\x01 \x01(\r\x12\r\n\x05count\x18\x02 \x01(\r\x1a4\n\x15AccountGameRankDetail\x12\x0c\n\x04rank\x18\x01 \x01(\r\x12\r\n\x05count\x18\x02 \x01(\r"}\n\x17ReqSetAccountFavoriteHu\x12\x0c\n\x04mode\x18\x01 \x01(\r\x12\x10\n\x08category\x18\x02 \x01(\r\x12\x0c\n\x04type\x18\x03 \x01(\r\x12\x0c\n\x04uuid\x18\x04 \x01(\t\x12\r\n\x05chang\x18\x05 \x01(\r\x12\n\n\x02ju\x18\x06 \x01(\r\x12\x0b\n\x03ben\x18\x07 \x01(\r""\n\x12ReqFetchSeerReport\x12\x0c\n\x04uuid\x18\x01 \x01(\t"N\n\x12ResFetchSeerReport\x12\x18\n\x05error\x18\x01 \x01(\x0b2\t.lq.Error\x12\x1e\n\x06report\x18\x02 \x01(\x0b2\x0e.lq.SeerReport"#\n\x13ReqCreateSeerReport\x12\x0c\n\x04uuid\x18\x01 \x01(\t"S\n\x13ResCreateSeerReport\x12\x18\n\x05error\x18\x01 \x01(\x0b2\t.lq.Error\x12"\n\x0bseer_report\x18\x02 \x01(\x0b2\r.lq.SeerBrief"[\n\x16ResFetchSeerReportList\x12\x18\n\x05error\x18\x01 \x01(\x0b2\t.lq.Error\x12\'\n\x10seer_report_list\x18\x02 \x03(\x0b2\r.lq.SeerBrief"R\n\x16ReqSelectChestChooseUp\x12\x13\n\x0bactivity_id\x18\x01 \x01(\r\x12\x11\n\tselection\x18\x02 \x01(\r\x12\x10\n\x08chest_id\x18\x03 \x01(\r",\n\x1cReqGenerateAnnualReportToken\x12\x0c\n\x04lang\x18\x01 \x01(\t"T\n\x1cResGenerateAnnualReportToken\x12\x18\n\x05error\x18\x01 \x01(\x0b2\t.lq.Error\x12\r\n\x05token\x18\x02 \x01(\t\x12\x0b\n\x03url\x18\x03 \x01(\t"Z\n\x18ResFetchAnnualReportInfo\x12\x18\n\x05error\x18\x01 \x01(\x0b2\t.lq.Error\x12\x12\n\nstart_time\x18\x02 \x01(\r\x12\x10\n\x08end_time\x18\x03 \x01(\r"5\n\x0fReqRemarkFriend\x12\x12\n\naccount_id\x18\x01 \x01(\r\x12\x0e\n\x06remark\x18\x02 \x01(\t"0\n\x19ReqSimV2ActivityFetchInfo\x12\x13\n\x0bactivity_id\x18\x01 \x01(\r"Y\n\x19ResSimV2ActivityFetchInfo\x12\x18\n\x05error\x18\x01 \x01(\x0b2\t.lq.Error\x12"\n\x04data\x18\x02 \x01(\x0b2\x14.lq.SimulationV2Data"2\n\x1bReqSimV2ActivityStartSeason\x12\x13\n\x0bactivity_id\x18\x01 \x01(\r"c\n\x1bResSimV2ActivityStartSeason\x12\x18\n\x05error\x18\x01 \x01(\x0b2\t.lq.Error\x12*\n\x06season\x18\x02 \x01(\x0b2\x1a.lq.SimulationV2SeasonData"K\n\x15ReqSimV2ActivityTrain\x12\x13\n\x0bactivity_id\x18\x01 \x01(\r\x12\x0f\n\x07ability\x18\x02 \x01(\r\x12\x0c\n\x04skip\x18\x03 \x01(\r"\x8b\x02\n\x15ResSimV2ActivityTrain\x12\x18\n\x05error\x18\x01 \x01(\x0b2\t.lq.Error\x12$\n\x05event\x18\x02 \x01(\x0b2\x15.lq.SimulationV2Event\x12(\n\x07ability\x18\x03 \x01(\x0b2\x17.lq.SimulationV2Ability\x12\r\n\x05round\x18\x04 \x01(\r\x12+\n\x0beffect_list\x18\x05 \x03(\x0b2\x16.lq.SimulationV2Effect\x12\x14\n\x0ctrain_result\x18\x06 \x01(\r\x12\x0e\n\x06is_end\x18\x07 \x01(\x08\x12&\n\x06record\x18\x08 \x01(\x0b2\x16.lq.SimulationV2Record"H\n\x1bReqSimV2ActivitySelectEvent\x12\x13\n\x0bactivity_id\x18\x01 \x01(\r\x12\x14\n\x0cselection_id\x18\x02 \x01(\r"\xd0\x02\n\x1bResSimV2ActivitySelectEvent\x12\x18\n\x05error\x18\x01 \x01(\x0b2\t.lq.Error\x12$\n\x05event\x18\x02 \x01(\x0b2\x15.lq.SimulationV2Event\x12(\n\x07ability\x18\x03 \x01(\x0b2\x17.lq.SimulationV2Ability\x12$\n\x05match\x18\x04 \x01(\x0b2\x15.lq.SimulationV2Match\x12+\n\x0beffect_list\x18\x05 \x03(\x0b2\x16.lq.SimulationV2Effect\x12\r\n\x05round\x18\x07 \x01(\r\x12\x0e\n\x06is_end\x18\x08 \x01(\x08\x12\x11\n\tresult_id\x18\t \x01(\r\x12&\n\x06record\x18\n \x01(\x0b2\x16.lq.SimulationV2Record\x12\x1a\n\x12effected_buff_list\x18\x0b \x03(\r"1\n\x1aReqSimV2ActivityStartMatch\x12\x13\n\x0bactivity_id\x18\x01 \x01(\r"\xc5\x01\n\x1aResSimV2ActivityStartMatch\x12\x18\n\x05error\x18\x01 \x01(\x0b2\t.lq.Error\x12$\n\x05event\x18\x02 \x01(\x0b2\x15.lq.SimulationV2Event\x12$\n\x05match\x18\x04 \x01(\x0b2\x15.lq.SimulationV2Match\x12+\n\x0beffect_list\x18\x05 \x03(\x0b2\x16.lq.SimulationV2Effect\x12\x14\n\x0cis_match_end\x18\x06 \x01(\x08"/\n\x18ReqSimV2ActivityEndMatch\x12\x13\n\x0bactivity_id\x18\x01 \x01(\r"\x9b\x03\n\x18ResSimV2ActivityEndMatch\x12\x18\n\x05error\x18\x01 \x01(\x0b2\t.lq.Error\x12\r\n\x05round\x18\x02 \x01(\r\x12\x0e\n\x06is_end\x18\x03 \x01(\x08\x12&\n\x06record\x18\x04 \x01(\x0b2\x16.lq.SimulationV2Record\x12\x13\n\x0btotal_score\x18\x05 \x01(\x05\x122\n\rmatch_history\x18\x06 \x03(\x0b2\x1b.lq.SimulationV2MatchRecord\x12E\n\x07rewards\x18\x07 \x03(\x0b24.lq.ResSimV2ActivityEndMatch.SimulationV2MatchReward\x12+\n\x0beffect_list\x18\x08 \x03(\x0b2\x16.lq.SimulationV2Effect\x12(\n\x07ability\x18\t \x01(\x0b2\x17.lq.SimulationV2Ability\x1a7\n\x17SimulationV2MatchReward\x12\x0c\n\x04type\x18\x01 \x01(\r\x12\x0e\n\x06params\x18\x02 \x03(\r"-\n\x16ReqSimV2ActivityGiveUp\x12\x13\n\x0bactivity_id\x18\x01 \x01(\r"[\n\x1aReqSimV2ActivitySetUpgrade\x12\x13\n\x0bactivity_id\x18\x01 \x01(\r\x12(\n\x07upgrade\x18\x02 \x01(\x0b2\x17.lq.SimulationV2Ability"n\n\x0bReqAuthGame\x12\x12\n\naccount_id\x18\x01 \x01(\r\x12\r\n\x05token\x18\x02 \x01(\t\x12\x11\n\tgame_uuid\x18\x03 \x01(\t\x12\x0f\n\x07session\x18\x04 \x01(\t\x12\x0c\n\x04gift\x18\x05 \x01(\t\x12\n\n\x02vs\x18\x06 \x01(\r"\xd6\x01\n\x0bResAuthGame\x12\x18\n\x05error\x18\x01 \x01(\x0b2\t.lq.Error\x12#\n\x07players\x18\x02 \x03(\x0b2\x12.lq.PlayerGameView\x12\x11\n\tseat_list\x18\x03 \x03(\r\x12\x15\n\ris_game_start\x18\x04 \x01(\x08\x12#\n\x0bgame_config\x18\x05 \x01(\x0b2\x0e.lq.GameConfig\x12\x15\n\rready_id_list\x18\x06 \x03(\r\x12"\n\x06robots\x18\x07 \x03(\x0b2\x12.lq.PlayerGameView"\xb8\x01\n\x0bGameRestore\x12"\n\x08snapshot\x18\x01 \x01(\x0b2\x10.lq.GameSnapshot\x12$\n\x07actions\x18\x02 \x03(\x0b2\x13.lq.ActionPrototype\x12\x1b\n\x13passed_waiting_time\x18\x03 \x01(\r\x12\x12\n\ngame_state\x18\x04 \x01(\r\x12\x12\n\nstart_time\x18\x05 \x01(\r\x12\x1a\n\x12last_pause_time_ms\x18\x06 \x01(\r"m\n\x0cResEnterGame\x12\x18\n\x05error\x18\x01 \x01(\x0b2\t.lq.Error\x12\x0e\n\x06is_end\x18\x02 \x01(\x08\x12\x0c\n\x04step\x18\x03 \x01(\r\x12%\n\x0cgame_restore\x18\x04 \x01(\x0b2\x0f.lq.GameRestore"-\n\x0bReqSyncGame\x12\x10\n\x08round_id\x18\x01 \x01(\t\x12\x0c\n\x04step\x18\x02 \x01(\r"l\n\x0bResSyncGame\x12\x18\n\x05error\x18\x01 \x01(\x0b2\t.lq.Error\x12\x0e\n\x06is_end\x18\x02 \x01(\x08\x12\x0c\n\x04step\x18\x03 \x01(\r\x12%\n\x0cgame_restore\x18\x04 \x01(\x0b2\x0f.lq.GameRestore"\xc8\x01\n\x10ReqSelfOperation\x12\x0c\n\x04type\x18\x01 \x01(\r\x12\r\n\x05index\x18\x02 \x01(\r\x12\x0c\n\x04tile\x18\x03 \x01(\t\x12\x18\n\x10cancel_operation\x18\x04 \x01(\x08\x12\r\n\x05moqie\x18\x05 \x01(\x08\x12\x0f\n\x07timeuse\x18\x06 \x01(\r\x12\x12\n\ntile_state\x18\x07 \x01(\x05\x12\x14\n\x0cchange_tiles\x18\x08 \x03(\t\x12\x13\n\x0btile_states\x18\t \x03(\x05\x12\x10\n\x08gap_type\x18\n \x01(\r"X\n\x0eReqChiPengGang\x12\x0c\n\x04type\x18\x01 \x01(\r\x12\r\n\x05index\x18\x02 \x01(\r\x12\x18\n\x10cancel_operation\x18\x03 \x01(\x08\x12\x0f\n\x07timeuse\x18\x06 \x01(\r":\n\x12ReqBroadcastInGame\x12\x0f\n\x07content\x18\x01 \x01(\t\x12\x13\n\x0bexcept_self\x18\x02 \x01(\x08")\n\x14ReqGMCommandInGaming\x12\x11\n\tjson_data\x18\x01 \x01(\t"W\n\x12ResGamePlayerState\x12\x18\n\x05error\x18\x01 \x01(\x0b2\t.lq.Error\x12\'\n\nstate_list\x18\x02 \x03(\x0e2\x13.lq.GamePlayerState"\x1d\n\x0eReqVoteGameEnd\x12\x0b\n\x03yes\x18\x01 \x01(\x08"U\n\x0eResGameEndVote\x12\x0f\n\x07success\x18\x01 \x01(\x08\x12\x18\n\x10vote_cd_end_time\x18\x02 \x01(\r\x12\x18\n\x05error\x18\x03 \x01(\x0b2\t.lq.Error"\x1f\n\x0eReqAuthObserve\x12\r\n\x05token\x18\x01 \x01(\t"V\n\x0fResStartObserve\x12\x1e\n\x04head\x18\x01 \x01(\x0b2\x10.lq.GameLiveHead\x12#\n\x06passed\x18\x02 \x01(\x0b2\x13.lq.GameLiveSegment"7\n\rNotifyNewGame\x12\x11\n\tgame_uuid\x18\x01 \x01(\t\x12\x13\n\x0bplayer_list\x18\x02 \x03(\t"2\n\x19NotifyPlayerLoadGameReady\x12\x15\n\rready_id_list\x18\x01 \x03(\r"4\n\x13NotifyGameBroadcast\x12\x0c\n\x04seat\x18\x01 \x01(\r\x12\x0f\n\x07content\x18\x02 \x01(\t"8\n\x13NotifyGameEndResult\x12!\n\x06result\x18\x01 \x01(\x0b2\x11.lq.GameEndResult"%\n\x13NotifyGameTerminate\x12\x0e\n\x06reason\x18\x01 \x01(\t"O\n\x1bNotifyPlayerConnectionState\x12\x0c\n\x04seat\x18\x01 \x01(\r\x12"\n\x05state\x18\x02 \x01(\x0e2\x13.lq.GamePlayerState"k\n\x18NotifyAccountLevelChange\x12 \n\x06origin\x18\x01 \x01(\x0b2\x10.lq.AccountLevel\x12\x1f\n\x05final\x18\x02 \x01(\x0b2\x10.lq.AccountLevel\x12\x0c\n\x04type\x18\x03 \x01(\r"\xae\x05\n\x16NotifyGameFinishReward\x12\x0f\n\x07mode_id\x18\x01 \x01(\r\x12<\n\x0clevel_change\x18\x02 \x01(\x0b2&.lq.NotifyGameFinishReward.LevelChange\x12:\n\x0bmatch_chest\x18\x03 \x01(\x0b2%.lq.NotifyGameFinishReward.MatchChest\x12@\n\x0emain_character\x18\x04 \x01(\x0b2(.lq.NotifyGameFinishReward.MainCharacter\x12@\n\x0echaracter_gift\x18\x05 \x01(\x0b2(.lq.NotifyGameFinishReward.CharacterGift\x12(\n\x06badges\x18\x06 \x03(\x0b2\x18.lq.BadgeAchieveProgress\x1a^\n\x0bLevelChange\x12 \n\x06origin\x18\x01 \x01(\x0b2\x10.lq.AccountLevel\x12\x1f\n\x05final\x18\x02 \x01(\x0b2\x10.lq.AccountLevel\x12\x0c\n\x04type\x18\x03 \x01(\r\x1aq\n\nMatchChest\x12\x10\n\x08chest_id\x18\x01 \x01(\r\x12\x0e\n\x06origin\x18\x02 \x01(\r\x12\r\n\x05final\x18\x03 \x01(\r\x12\x11\n\tis_graded\x18\x04 \x01(\x08\x12\x1f\n\x07rewards\x18\x05 \x03(\x0b2\x0e.lq.RewardSlot\x1a8\n\rMainCharacter\x12\r\n\x05level\x18\x01 \x01(\r\x12\x0b\n\x03exp\x18\x02 \x01(\r\x12\x0b\n\x03add\x18\x03 \x01(\r\x1aN\n\rCharacterGift\x12\x0e\n\x06origin\x18\x01 \x01(\r\x12\r\n\x05final\x18\x02 \x01(\r\x12\x0b\n\x03add\x18\x03 \x01(\r\x12\x11\n\tis_graded\x18\x04 \x01(\x08"\xa0\x01\n\x14NotifyActivityReward\x12@\n\x0factivity_reward\x18\x01 \x03(\x0b2\'.lq.NotifyActivityReward.ActivityReward\x1aF\n\x0eActivityReward\x12\x13\n\x0bactivity_id\x18\x01 \x01(\r\x12\x1f\n\x07rewards\x18\x02 \x03(\x0b2\x0e.lq.RewardSlot"\x8a\x01\n\x13NotifyActivityPoint\x12>\n\x0factivity_points\x18\x01 \x03(\x0b2%.lq.NotifyActivityPoint.ActivityPoint\x1a3\n\rActivityPoint\x12\x13\n\x0bactivity_id\x18\x01 \x01(\r\x12\r\n\x05point\x18\x02 \x01(\r"\x9c\x01\n\x16NotifyLeaderboardPoint\x12G\n\x12leaderboard_points\x18\x01 \x03(\x0b2+.lq.NotifyLeaderboardPoint.LeaderboardPoint\x1a9\n\x10LeaderboardPoint\x12\x16\n\x0eleaderboard_id\x18\x01 \x01(\r\x12\r\n\x05point\x18\x02 \x01(\r"!\n\x0fNotifyGamePause\x12\x0e\n\x06paused\x18\x01 \x01(\x08"\xa0\x01\n\x11NotifyEndGameVote\x121\n\x07results\x18\x01 \x03(\x0b2 .lq.NotifyEndGameVote.VoteResult\x12\x12\n\nstart_time\x18\x02 \x01(\r\x12\x15\n\rduration_time\x18\x03 \x01(\r\x1a-\n\nVoteResult\x12\x12\n\naccount_id\x18\x01 \x01(\r\x12\x0b\n\x03yes\x18\x02 \x01(\x08"3\n\x11NotifyObserveData\x12\x1e\n\x04unit\x18\x01 \x01(\x0b2\x10.lq.GameLiveUnit"\x0f\n\rActionMJStart"A\n\x13NewRoundOpenedTiles\x12\x0c\n\x04seat\x18\x01 \x01(\r\x12\r\n\x05tiles\x18\x02 \x03(\t\x12\r\n\x05count\x18\x03 \x03(\r"F\n\x08MuyuInfo\x12\x0c\n\x04seat\x18\x01 \x01(\r\x12\r\n\x05count\x18\x02 \x01(\r\x12\x11\n\tcount_max\x18\x03 \x01(\r\x12\n\n\x02id\x18\x04 \x01(\r"\x8a\x01\n\x0bChuanmaGang\x12\x12\n\nold_scores\x18\x01 \x03(\x05\x12\x14\n\x0cdelta_scores\x18\x02 \x03(\x05\x12\x0e\n\x06scores\x18\x03 \x03(\x05\x12\x1c\n\x07gameend\x18\x04 \x01(\x0b2\x0b.lq.GameEnd\x12#\n\rhules_history\x18\x05 \x03(\x0b2\x0c.lq.HuleInfo"u\n\rYongchangInfo\x12\x0c\n\x04seat\x18\x01 \x01(\r\x12\x13\n\x0bmoqie_count\x18\x02 \x01(\r\x12\x13\n\x0bmoqie_bonus\x18\x03 \x01(\r\x12\x15\n\rshouqie_count\x18\x04 \x01(\r\x12\x15\n\rshouqie_bonus\x18\x05 \x01(\r"$\n\rActionNewCard\x12\x13\n\x0bfield_spell\x18\x01 \x01(\r"$\n\rRecordNewCard\x12\x13\n\x0bfield_spell\x18\x01 \x01(\r"\xea\x03\n\x0eActionNewRound\x12\r\n\x05chang\x18\x01 \x01(\r\x12\n\n\x02ju\x18\x02 \x01(\r\x12\x0b\n\x03ben\x18\x03 \x01(\r\x12\r\n\x05tiles\x18\x04 \x03(\t\x12\x0c\n\x04dora\x18\x05 \x01(\t\x12\x0e\n\x06scores\x18\x06 \x03(\x05\x12,\n\toperation\x18\x07 \x01(\x0b2\x19.lq.OptionalOperationList\x12\x10\n\x08liqibang\x18\x08 \x01(\r\x12)\n\ttingpais0\x18\t \x03(\x0b2\x16.lq.TingPaiDiscardInfo\x12"\n\ttingpais1\x18\n \x03(\x0b2\x0f.lq.TingPaiInfo\x12\n\n\x02al\x18\x0b \x01(\x08\x12\x0b\n\x03md5\x18\x0c \x01(\t\x12\x17\n\x0fleft_tile_count\x18\r \x01(\r\x12\r\n\x05doras\x18\x0e \x03(\t\x12&\n\x05opens\x18\x0f \x03(\x0b2\x17.lq.NewRoundOpenedTiles\x12\x1a\n\x04muyu\x18\x10 \x01(\x0b2\x0c.lq.MuyuInfo\x12\x10\n\x08ju_count\x18\x11 \x01(\r\x12\x13\n\x0bfield_spell\x18\x12 \x01(\r\x12\x0e\n\x06sha256\x18\x13 \x01(\t\x12$\n\tyongchang\x18\x14 \x01(\x0b2\x11.lq.YongchangInfo\x12\x12\n\nsaltSha256\x18\x15 \x01(\t"\xf8\x04\n\x0eRecordNewRound\x12\r\n\x05chang\x18\x01 \x01(\r\x12\n\n\x02ju\x18\x02 \x01(\r\x12\x0b\n\x03ben\x18\x03 \x01(\r\x12\x0c\n\x04dora\x18\x04 \x01(\t\x12\x0e\n\x06scores\x18\x05 \x03(\x05\x12\x10\n\x08liqibang\x18\x06 \x01(\r\x12\x0e\n\x06tiles0\x18\x07 \x03(\t\x12\x0e\n\x06tiles1\x18\x08 \x03(\t\x12\x0e\n\x06tiles2\x18\t \x03(\t\x12\x0e\n\x06tiles3\x18\n \x03(\t\x12+\n\x07tingpai\x18\x0b \x03(\x0b2\x1a.lq.RecordNewRound.TingPai\x12,\n\toperation\x18\x0c \x01(\x0b2\x19.lq.OptionalOperationList\x12\x0b\n\x03md5\x18\r \x01(\t\x12\x0f\n\x07paishan\x18\x0e \x01(\t\x12\x17\n\x0fleft_tile_count\x18\x0f \x01(\r\x12\r\n\x05doras\x18\x10 \x03(\t\x12&\n\x05opens\x18\x11 \x03(\x0b2\x17.lq.NewRoundOpenedTiles\x12\x1a\n\x04muyu\x18\x12 \x01(\x0b2\x0c.lq.MuyuInfo\x12-\n\noperations\x18\x13 \x03(\x0b2\x19.lq.OptionalOperationList\x12\x10\n\x08ju_count\x18\x14 \x01(\r\x12\x13\n\x0bfield_spell\x18\x15 \x01(\r\x12\x0e\n\x06sha256\x18\x16 \x01(\t\x12$\n\tyongchang\x18\x17 \x01(\x0b2\x11.lq.YongchangInfo\x12\x12\n\nsaltSha256\x18\x18 \x01(\t\x12\x0c\n\x04salt\x18\x19 \x01(\t\x1a;\n\x07TingPai\x12\x0c\n\x04seat\x18\x01 \x01(\r\x12"\n\ttingpais1\x18\x02 \x03(\x0b2\x0f.lq.TingPaiInfo"\x99\x03\n\x0cGameSnapshot\x12\r\n\x05chang\x18\x01 \x01(\r\x12\n\n\x02ju\x18\x02 \x01(\r\x12\x0b\n\x03ben\x18\x03 \x01(\r\x12\x14\n\x0cindex_player\x18\x04 \x01(\r\x12\x17\n\x0fleft_tile_count\x18\x05 \x01(\r\x12\r\n\x05hands\x18\x06 \x03(\t\x12\r\n\x05doras\x18\x07 \x03(\t\x12\x10\n\x08liqibang\x18\x08 \x01(\r\x120\n\x07players\x18\t \x03(\x0b2\x1f.lq.GameSnapshot.PlayerSnapshot\x12\x10\n\x08zhenting\x18\n \x01(\x08\x1a\xbd\x01\n\x0ePlayerSnapshot\x12\r\n\x05score\x18\x01 \x01(\x05\x12\x14\n\x0cliqiposition\x18\x02 \x01(\x05\x12\x0f\n\x07tilenum\x18\x03 \x01(\r\x12\x0e\n\x06qipais\x18\x04 \x03(\t\x123\n\x05mings\x18\x05 \x03(\x0b2$.lq.GameSnapshot.PlayerSnapshot.Fulu\x1a0\n\x04Fulu\x12\x0c\n\x04type\x18\x01 \x01(\r\x12\x0c\n\x04tile\x18\x02 \x03(\t\x12\x0c\n\x04from\x18\x03 \x03(\r";\n\x0fActionPrototype\x12\x0c\n\x04step\x18\x01 \x01(\r\x12\x0c\n\x04name\x18\x02 \x01(\t\x12\x0c\n\x04data\x18\x03 \x01(\x0c"c\n\x11GameDetailRecords\x12\x0f\n\x07records\x18\x01 \x03(\x0c\x12\x0f\n\x07version\x18\x02 \x01(\r\x12\x1f\n\x07actions\x18\x03 \x03(\x0b2\x0e.lq.GameAction\x12\x0b\n\x03bar\x18\x04 \x01(\x0c"\xc9\x01\n\x11GameSelfOperation\x12\x0c\n\x04type\x18\x01 \x01(\r\x12\r\n\x05index\x18\x02 \x01(\r\x12\x0c\n\x04tile\x18\x03 \x01(\t\x12\x18\n\x10cancel_operation\x18\x04 \x01(\x08\x12\r\n\x05moqie\x18\x05 \x01(\x08\x12\x0f\n\x07timeuse\x18\x06 \x01(\r\x12\x12\n\ntile_state\x18\x07 \x01(\x05\x12\x14\n\x0cchange_tiles\x18\x08 \x03(\t\x12\x13\n\x0btile_states\x18\t \x03(\x05\x12\x10\n\x08gap_type\x18\n \x01(\r"Y\n\x0fGameChiPengGang\x12\x0c\n\x04type\x18\x01 \x01(\r\x12\r\n\x05index\x18\x02 \x01(\r\x12\x18\n\x10cancel_operation\x18\x03 \x01(\x08\x12\x0f\n\x07timeuse\x18\x06 \x01(\r"\x1e\n\x0fGameVoteGameEnd\x12\x0b\n\x03yes\x18\x01 \x01(\x08"\xa7\x01\n\rGameUserInput\x12\x0c\n\x04seat\x18\x01 \x01(\r\x12\x0c\n\x04type\x18\x02 \x01(\r\x12\x0b\n\x03emo\x18\x03 \x01(\r\x12(\n\toperation\x18\n \x01(\x0b2\x15.lq.GameSelfOperation\x12 \n\x03cpg\x18\x0b \x01(\x0b2\x13.lq.GameChiPengGang\x12!\n\x04vote\x18\x0c \x01(\x0b2\x13.lq.GameVoteGameEnd"+\n\rGameUserEvent\x12\x0c\n\x04seat\x18\x01 \x01(\r\x12\x0c\n\x04type\x18\x02 \x01(\r"\x9c\x01\n\nGameAction\x12\x0e\n\x06passed\x18\x01 \x01(\r\x12\x0c\n\x04type\x18\x02 \x01(\r\x12\x0e\n\x06result\x18\x03 \x01(\x0c\x12%\n\nuser_input\x18\x04 \x01(\x0b2\x11.lq.GameUserInput\x12%\n\nuser_event\x18\x05 \x01(\x0b2\x11.lq.GameUserEvent\x12\x12\n\ngame_event\x18\x06 \x01(\r"z\n\x11OptionalOperation\x12\x0c\n\x04type\x18\x01 \x01(\r\x12\x13\n\x0bcombination\x18\x02 \x03(\t\x12\x14\n\x0cchange_tiles\x18\x03 \x03(\t\x12\x1a\n\x12change_tile_states\x18\x04 \x03(\x05\x12\x10\n\x08gap_type\x18\x05 \x01(\r"z\n\x15OptionalOperationList\x12\x0c\n\x04seat\x18\x01 \x01(\r\x12-\n\x0eoperation_list\x18\x02 \x03(\x0b2\x15.lq.OptionalOperation\x12\x10\n\x08time_add\x18\x04 \x01(\r\x12\x12\n\ntime_fixed\x18\x05 \x01(\r"n\n\x0bLiQiSuccess\x12\x0c\n\x04seat\x18\x01 \x01(\r\x12\r\n\x05score\x18\x02 \x01(\x05\x12\x10\n\x08liqibang\x18\x03 \x01(\r\x12\x0e\n\x06failed\x18\x04 \x01(\x08\x12 \n\x18liqi_type_beishuizhizhan\x18\x05 \x01(\r"0\n\x07FanInfo\x12\x0c\n\x04name\x18\x01 \x01(\t\x12\x0b\n\x03val\x18\x02 \x01(\r\x12\n\n\x02id\x18\x03 \x01(\r"\xe3\x03\n\x08HuleInfo\x12\x0c\n\x04hand\x18\x01 \x03(\t\x12\x0c\n\x04ming\x18\x02 \x03(\t\x12\x0f\n\x07hu_tile\x18\x03 \x01(\t\x12\x0c\n\x04seat\x18\x04 \x01(\r\x12\x0c\n\x04zimo\x18\x05 \x01(\x08\x12\x0e\n\x06qinjia\x18\x06 \x01(\x08\x12\x0c\n\x04liqi\x18\x07 \x01(\x08\x12\r\n\x05doras\x18\x08 \x03(\t\x12\x10\n\x08li_doras\x18\t \x03(\t\x12\r\n\x05yiman\x18\n \x01(\x08\x12\r\n\x05count\x18\x0b \x01(\r\x12\x19\n\x04fans\x18\x0c \x03(\x0b2\x0b.lq.FanInfo\x12\n\n\x02fu\x18\r \x01(\r\x12\r\n\x05title\x18\x0e \x01(\t\x12\x12\n\npoint_rong\x18\x0f \x01(\r\x12\x16\n\x0epoint_zimo_qin\x18\x10 \x01(\r\x12\x17\n\x0fpoint_zimo_xian\x18\x11 \x01(\r\x12\x10\n\x08title_id\x18\x12 \x01(\r\x12\x11\n\tpoint_sum\x18\x13 \x01(\r\x12\x0e\n\x06dadian\x18\x14 \x01(\r\x12\x0e\n\x06baopai\x18\x15 \x01(\r\x12\x14\n\x0cbaopai_seats\x18\x16 \x03(\r\x12\r\n\x05lines\x18\x17 \x03(\t\x12\x16\n\x0etianming_bonus\x18\x18 \x01(\r\x12\x15\n\rbaida_changed\x18\x19 \x03(\t\x12\x1d\n\x15hu_tile_baiDa_changed\x18\x1a \x01(\t"\xa7\x01\n\x0bTingPaiInfo\x12\x0c\n\x04tile\x18\x01 \x01(\t\x12\x0e\n\x06haveyi\x18\x02 \x01(\x08\x12\r\n\x05yiman\x18\x03 \x01(\x08\x12\r\n\x05count\x18\x04 \x01(\r\x12\n\n\x02fu\x18\x05 \x01(\r\x12\x17\n\x0fbiao_dora_count\x18\x06 \x01(\r\x12\x12\n\nyiman_zimo\x18\x07 \x01(\x08\x12\x12\n\ncount_zimo\x18\x08 \x01(\r\x12\x0f\n\x07fu_zimo\x18\t \x01(\r"T\n\x12TingPaiDiscardInfo\x12\x0c\n\x04tile\x18\x01 \x01(\t\x12\x10\n\x08zhenting\x18\x02 \x01(\x08\x12\x1e\n\x05infos\x18\x03 \x03(\x0b2\x0f.lq.TingPaiInfo"Q\n\x12HunZhiYiJiBuffInfo\x12\x0c\n\x04seat\x18\x01 \x01(\r\x12\x1b\n\x13continue_deal_count\x18\x02 \x01(\r\x12\x10\n\x08overload\x18\x03 \x01(\x08"\x19\n\x07GameEnd\x12\x0e\n\x06scores\x18\x01 \x03(\x05"\xa1\x01\n\x0fActionSelectGap\x12\x11\n\tgap_types\x18\x01 \x03(\r\x12)\n\ttingpais0\x18\x02 \x03(\x0b2\x16.lq.TingPaiDiscardInfo\x12"\n\ttingpais1\x18\x03 \x03(\x0b2\x0f.lq.TingPaiInfo\x12,\n\toperation\x18\x04 \x01(\x0b2\x19.lq.OptionalOperationList"\xbd\x01\n\x0fRecordSelectGap\x12\x11\n\tgap_types\x18\x01 \x03(\r\x12,\n\x07tingpai\x18\x02 \x03(\x0b2\x1b.lq.RecordSelectGap.TingPai\x12,\n\toperation\x18\x03 \x01(\x0b2\x19.lq.OptionalOperationList\x1a;\n\x07TingPai\x12\x0c\n\x04seat\x18\x01 \x01(\r\x12"\n\ttingpais1\x18\x02 \x03(\x0b2\x0f.lq.TingPaiInfo"\x89\x02\n\x10ActionChangeTile\x12\x10\n\x08in_tiles\x18\x01 \x03(\t\x12\x16\n\x0ein_tile_states\x18\x02 \x03(\x05\x12\x11\n\tout_tiles\x18\x03 \x03(\t\x12\x17\n\x0fout_tile_states\x18\x04 \x03(\x05\x12\r\n\x05doras\x18\x05 \x03(\t\x12)\n\ttingpais0\x18\x06 \x03(\x0b2\x16.lq.TingPaiDiscardInfo\x12"\n\ttingpais1\x18\x07 \x03(\x0b2\x0f.lq.TingPaiInfo\x12,\n\toperation\x18\x08 \x01(\x0b2\x19.lq.OptionalOperationList\x12\x13\n\x0bchange_type\x18\t \x01(\r"\x9f\x03\n\x10RecordChangeTile\x12\r\n\x05doras\x18\x01 \x03(\t\x12-\n\x07tingpai\x18\x02 \x03(\x0b2\x1c.lq.RecordChangeTile.TingPai\x12:\n\x11change_tile_infos\x18\x03 \x03(\x0b2\x1f.lq.RecordChangeTile.ChangeTile\x12,\n\toperation\x18\x04 \x01(\x0b2\x19.lq.OptionalOperationList\x12\x13\n\x0bchange_type\x18\x05 \x01(\r\x12-\n\noperations\x18\x06 \x03(\x0b2\x19.lq.OptionalOperationList\x1a;\n\x07TingPai\x12\x0c\n\x04seat\x18\x01 \x01(\r\x12"\n\ttingpais1\x18\x02 \x03(\x0b2\x0f.lq.TingPaiInfo\x1ab\n\nChangeTile\x12\x10\n\x08in_tiles\x18\x01 \x03(\t\x12\x16\n\x0ein_tile_states\x18\x02 \x03(\x05\x12\x11\n\tout_tiles\x18\x03 \x03(\t\x12\x17\n\x0fout_tile_states\x18\x04 \x03(\x05"\xe5\x01\n\x10ActionRevealTile\x12\x0c\n\x04seat\x18\x01 \x01(\r\x12\x0f\n\x07is_liqi\x18\x02 \x01(\x08\x12\x10\n\x08is_wliqi\x18\x03 \x01(\x08\x12\r\n\x05moqie\x18\x04 \x01(\x08\x12\x0e\n\x06scores\x18\x05 \x03(\x05\x12\x10\n\x08liqibang\x18\x06 \x01(\r\x12,\n\toperation\x18\x07 \x01(\x0b2\x19.lq.OptionalOperationList\x12!\n\x08tingpais\x18\x08 \x03(\x0b2\x0f.lq.TingPaiInfo\x12\x0c\n\x04tile\x18\t \x01(\t\x12\x10\n\x08zhenting\x18\n \x01(\x08"\xe6\x01\n\x10RecordRevealTile\x12\x0c\n\x04seat\x18\x01 \x01(\r\x12\x0f\n\x07is_liqi\x18\x02 \x01(\x08\x12\x10\n\x08is_wliqi\x18\x03 \x01(\x08\x12\r\n\x05moqie\x18\x04 \x01(\x08\x12\x0e\n\x06scores\x18\x05 \x03(\x05\x12\x10\n\x08liqibang\x18\x06 \x01(\r\x12-\n\noperations\x18\x07 \x03(\x0b2\x19.lq.OptionalOperationList\x12!\n\x08tingpais\x18\x08 \x03(\x0b2\x0f.lq.TingPaiInfo\x12\x0c\n\x04tile\x18\t \x01(\t\x12\x10\n\x08zhenting\x18\n \x03(\x08"p\n\x10ActionUnveilTile\x12\x0c\n\x04seat\x18\x01 \x01(\x05\x12\x0e\n\x06scores\x18\x02 \x03(\x05\x12\x10\n\x08liqibang\x18\x03 \x01(\r\x12,\n\toperation\x18\x04 \x01(\x0b2\x19.lq.OptionalOperationList"p\n\x10RecordUnveilTile\x12\x0c\n\x04seat\x18\x01 \x01(\x05\x12\x0e\n\x06scores\x18\x02 \x03(\x05\x12\x10\n\x08liqibang\x18\x03 \x01(\r\x12,\n\toperation\x18\x04 \x01(\x0b2\x19.lq.OptionalOperationList"\xd4\x01\n\x0eActionLockTile\x12\x0c\n\x04seat\x18\x01 \x01(\r\x12\x0e\n\x06scores\x18\x02 \x03(\x05\x12\x10\n\x08liqibang\x18\x03 \x01(\r\x12\x0c\n\x04tile\x18\x04 \x01(\t\x12,\n\toperation\x18\x05 \x01(\x0b2\x19.lq.OptionalOperationList\x12\x10\n\x08zhenting\x18\x06 \x01(\x08\x12!\n\x08tingpais\x18\x07 \x03(\x0b2\x0f.lq.TingPaiInfo\x12\r\n\x05doras\x18\x08 \x03(\t\x12\x12\n\nlock_state\x18\t \x01(\x05"\xd5\x01\n\x0eRecordLockTile\x12\x0c\n\x04seat\x18\x01 \x01(\r\x12\x0e\n\x06scores\x18\x02 \x03(\x05\x12\x10\n\x08liqibang\x18\x03 \x01(\r\x12\x0c\n\x04tile\x18\x04 \x01(\t\x12,\n\toperation\x18\x05 \x03(\x0b2\x19.lq.OptionalOperationList\x12\x11\n\tzhentings\x18\x06 \x03(\x08\x12!\n\x08tingpais\x18\x07 \x03(\x0b2\x0f.lq.TingPaiInfo\x12\r\n\x05doras\x18\x08 \x03(\t\x12\x12\n\nlock_state\x18\t \x01(\x05"\xb3\x03\n\x11ActionDiscardTile\x12\x0c\n\x04seat\x18\x01 \x01(\r\x12\x0c\n\x04tile\x18\x02 \x01(\t\x12\x0f\n\x07is_liqi\x18\x03 \x01(\x08\x12,\n\toperation\x18\x04 \x01(\x0b2\x19.lq.OptionalOperationList\x12\r\n\x05moqie\x18\x05 \x01(\x08\x12\x10\n\x08zhenting\x18\x06 \x01(\x08\x12!\n\x08tingpais\x18\x07 \x03(\x0b2\x0f.lq.TingPaiInfo\x12\r\n\x05doras\x18\x08 \x03(\t\x12\x10\n\x08is_wliqi\x18\t \x01(\x08\x12\x12\n\ntile_state\x18\n \x01(\r\x12\x1a\n\x04muyu\x18\x0b \x01(\x0b2\x0c.lq.MuyuInfo\x12\x10\n\x08revealed\x18\x0c \x01(\x08\x12\x0e\n\x06scores\x18\r \x03(\x05\x12\x10\n\x08liqibang\x18\x0e \x01(\r\x12$\n\tyongchang\x18\x19 \x01(\x0b2\x11.lq.YongchangInfo\x122\n\x12hun_zhi_yi_ji_info\x18\x1a \x01(\x0b2\x16.lq.HunZhiYiJiBuffInfo\x12 \n\x18liqi_type_beishuizhizhan\x18\x1b \x01(\r"\x80\x03\n\x11RecordDiscardTile\x12\x0c\n\x04seat\x18\x01 \x01(\r\x12\x0c\n\x04tile\x18\x02 \x01(\t\x12\x0f\n\x07is_liqi\x18\x03 \x01(\x08\x12\r\n\x05moqie\x18\x05 \x01(\x08\x12\x10\n\x08zhenting\x18\x06 \x03(\x08\x12!\n\x08tingpais\x18\x07 \x03(\x0b2\x0f.lq.TingPaiInfo\x12\r\n\x05doras\x18\x08 \x03(\t\x12\x10\n\x08is_wliqi\x18\t \x01(\x08\x12-\n\noperations\x18\n \x03(\x0b2\x19.lq.OptionalOperationList\x12\x12\n\ntile_state\x18\x0b \x01(\r\x12\x1a\n\x04muyu\x18\x0c \x01(\x0b2\x0c.lq.MuyuInfo\x12$\n\tyongchang\x18\r \x01(\x0b2\x11.lq.YongchangInfo\x122\n\x12hun_zhi_yi_ji_info\x18\x0e \x01(\x0b2\x16.lq.HunZhiYiJiBuffInfo\x12 \n\x18liqi_type_beishuizhizhan\x18\x1b \x01(\r"\xd5\x02\n\x0eActionDealTile\x12\x0c\n\x04seat\x18\x01 \x01(\r\x12\x0c\n\x04tile\x18\x02 \x01(\t\x12\x17\n\x0fleft_tile_count\x18\x03 \x01(\r\x12,\n\toperation\x18\x04 \x01(\x0b2\x19.lq.OptionalOperationList\x12\x1d\n\x04liqi\x18\x05 \x01(\x0b2\x0f.lq.LiQiSuccess\x12\r\n\x05doras\x18\x06 \x03(\t\x12\x10\n\x08zhenting\x18\x07 \x01(\x08\x12(\n\x08tingpais\x18\x08 \x03(\x0b2\x16.lq.TingPaiDiscardInfo\x12\x12\n\ntile_state\x18\t \x01(\r\x12\x1a\n\x04muyu\x18\n \x01(\x0b2\x0c.lq.MuyuInfo\x12\x12\n\ntile_index\x18\x0b \x01(\r\x122\n\x12hun_zhi_yi_ji_info\x18\x0c \x01(\x0b2\x16.lq.HunZhiYiJiBuffInfo"\xab\x02\n\x0eRecordDealTile\x12\x0c\n\x04seat\x18\x01 \x01(\r\x12\x0c\n\x04tile\x18\x02 \x01(\t\x12\x17\n\x0fleft_tile_count\x18\x03 \x01(\r\x12\x1d\n\x04liqi\x18\x05 \x01(\x0b2\x0f.lq.LiQiSuccess\x12\r\n\x05doras\x18\x06 \x03(\t\x12\x10\n\x08zhenting\x18\x07 \x03(\x08\x12,\n\toperation\x18\x08 \x01(\x0b2\x19.lq.OptionalOperationList\x12\x12\n\ntile_state\x18\t \x01(\r\x12\x1a\n\x04muyu\x18\x0b \x01(\x0b2\x0c.lq.MuyuInfo\x12\x12\n\ntile_index\x18\x0c \x01(\r\x122\n\x12hun_zhi_yi_ji_info\x18\r \x01(\x0b2\x16.lq.HunZhiYiJiBuffInfo"\x97\x01\n\x17ActionFillAwaitingTiles\x12\x16\n\x0eawaiting_tiles\x18\x01 \x03(\t\x12\x17\n\x0fleft_tile_count\x18\x02 \x01(\r\x12,\n\toperation\x18\x03 \x01(\x0b2\x19.lq.OptionalOperationList\x12\x1d\n\x04liqi\x18\x04 \x01(\x0b2\x0f.lq.LiQiSuccess"\x97\x01\n\x17RecordFillAwaitingTiles\x12\x16\n\x0eawaiting_tiles\x18\x01 \x03(\t\x12\x17\n\x0fleft_tile_count\x18\x02 \x01(\r\x12,\n\toperation\x18\x03 \x01(\x0b2\x19.lq.OptionalOperationList\x12\x1d\n\x04liqi\x18\x04 \x01(\x0b2\x0f.lq.LiQiSuccess"\x83\x03\n\x11ActionChiPengGang\x12\x0c\n\x04seat\x18\x01 \x01(\r\x12\x0c\n\x04type\x18\x02 \x01(\r\x12\r\n\x05tiles\x18\x03 \x03(\t\x12\r\n\x05froms\x18\x04 \x03(\r\x12\x1d\n\x04liqi\x18\x05 \x01(\x0b2\x0f.lq.LiQiSuccess\x12,\n\toperation\x18\x06 \x01(\x0b2\x19.lq.OptionalOperationList\x12\x10\n\x08zhenting\x18\x07 \x01(\x08\x12(\n\x08tingpais\x18\x08 \x03(\x0b2\x16.lq.TingPaiDiscardInfo\x12\x13\n\x0btile_states\x18\t \x03(\r\x12\x1a\n\x04muyu\x18\n \x01(\x0b2\x0c.lq.MuyuInfo\x12\x0e\n\x06scores\x18\x0b \x03(\x05\x12\x10\n\x08liqibang\x18\x0c \x01(\r\x12$\n\tyongchang\x18\r \x01(\x0b2\x11.lq.YongchangInfo\x122\n\x12hun_zhi_yi_ji_info\x18\x0e \x01(\x0b2\x16.lq.HunZhiYiJiBuffInfo"\xd9\x02\n\x11RecordChiPengGang\x12\x0c\n\x04seat\x18\x01 \x01(\r\x12\x0c\n\x04type\x18\x02 \x01(\r\x12\r\n\x05tiles\x18\x03 \x03(\t\x12\r\n\x05froms\x18\x04 \x03(\r\x12\x1d\n\x04liqi\x18\x05 \x01(\x0b2\x0f.lq.LiQiSuccess\x12\x10\n\x08zhenting\x18\x07 \x03(\x08\x12,\n\toperation\x18\x08 \x01(\x0b2\x19.lq.OptionalOperationList\x12\x13\n\x0btile_states\x18\t \x03(\r\x12\x1a\n\x04muyu\x18\n \x01(\x0b2\x0c.lq.MuyuInfo\x12\x0e\n\x06scores\x18\x0b \x03(\x05\x12\x10\n\x08liqibang\x18\x0c \x01(\r\x12$\n\tyongchang\x18\r \x01(\x0b2\x11.lq.YongchangInfo\x122\n\x12hun_zhi_yi_ji_info\x18\x0e \x01(\x0b2\x16.lq.HunZhiYiJiBuffInfo"7\n\x10ActionGangResult\x12#\n\ngang_infos\x18\x01 \x01(\x0b2\x0f.lq.ChuanmaGang"7\n\x10RecordGangResult\x12#\n\ngang_infos\x18\x01 \x01(\x0b2\x0f.lq.ChuanmaGang":\n\x13ActionGangResultEnd\x12#\n\ngang_infos\x18\x01 \x01(\x0b2\x0f.lq.ChuanmaGang":\n\x13RecordGangResultEnd\x12#\n\ngang_infos\x18\x01 \x01(\x0b2\x0f.lq.ChuanmaGang"\xce\x01\n\x13ActionAnGangAddGang\x12\x0c\n\x04seat\x18\x01 \x01(\r\x12\x0c\n\x04type\x18\x02 \x01(\r\x12\r\n\x05tiles\x18\x03 \x01(\t\x12,\n\toperation\x18\x04 \x01(\x0b2\x19.lq.OptionalOperationList\x12\r\n\x05doras\x18\x06 \x03(\t\x12\x10\n\x08zhenting\x18\x07 \x01(\x08\x12!\n\x08tingpais\x18\x08 \x03(\x0b2\x0f.lq.TingPaiInfo\x12\x1a\n\x04muyu\x18\t \x01(\x0b2\x0c.lq.MuyuInfo"\x9a\x01\n\x13RecordAnGangAddGang\x12\x0c\n\x04seat\x18\x01 \x01(\r\x12\x0c\n\x04type\x18\x02 \x01(\r\x12\r\n\x05tiles\x18\x03 \x01(\t\x12\r\n\x05doras\x18\x06 \x03(\t\x12-\n\noperations\x18\x07 \x03(\x0b2\x19.lq.OptionalOperationList\x12\x1a\n\x04muyu\x18\x08 \x01(\x0b2\x0c.lq.MuyuInfo"\xcc\x01\n\x0bActionBaBei\x12\x0c\n\x04seat\x18\x01 \x01(\r\x12,\n\toperation\x18\x04 \x01(\x0b2\x19.lq.OptionalOperationList\x12\r\n\x05doras\x18\x06 \x03(\t\x12\x10\n\x08zhenting\x18\x07 \x01(\x08\x12!\n\x08tingpais\x18\x08 \x03(\x0b2\x0f.lq.TingPaiInfo\x12\r\n\x05moqie\x18\t \x01(\x08\x12\x12\n\ntile_state\x18\n \x01(\r\x12\x1a\n\x04muyu\x18\x0b \x01(\x0b2\x0c.lq.MuyuInfo"\x98\x01\n\x0bRecordBaBei\x12\x0c\n\x04seat\x18\x01 \x01(\r\x12\r\n\x05doras\x18\x06 \x03(\t\x12-\n\noperations\x18\x07 \x03(\x0b2\x19.lq.OptionalOperationList\x12\r\n\x05moqie\x18\x08 \x01(\x08\x12\x12\n\ntile_state\x18\n \x01(\r\x12\x1a\n\x04muyu\x18\x0b \x01(\x0b2\x0c.lq.MuyuInfo"\x86\x02\n\nActionHule\x12\x1b\n\x05hules\x18\x01 \x03(\x0b2\x0c.lq.HuleInfo\x12\x12\n\nold_scores\x18\x02 \x03(\x05\x12\x14\n\x0cdelta_scores\x18\x03 \x03(\x05\x12\x14\n\x0cwait_timeout\x18\x04 \x01(\r\x12\x0e\n\x06scores\x18\x05 \x03(\x05\x12\x1c\n\x07gameend\x18\x06 \x01(\x0b2\x0b.lq.GameEnd\x12\r\n\x05doras\x18\x07 \x03(\t\x12\x1a\n\x04muyu\x18\x08 \x01(\x0b2\x0c.lq.MuyuInfo\x12\x0e\n\x06baopai\x18\t \x01(\x05\x122\n\x12hun_zhi_yi_ji_info\x18\n \x01(\x0b2\x16.lq.HunZhiYiJiBuffInfo"\x86\x02\n\nRecordHule\x12\x1b\n\x05hules\x18\x01 \x03(\x0b2\x0c.lq.HuleInfo\x12\x12\n\nold_scores\x18\x02 \x03(\x05\x12\x14\n\x0cdelta_scores\x18\x03 \x03(\x05\x12\x14\n\x0cwait_timeout\x18\x04 \x01(\r\x12\x0e\n\x06scores\x18\x05 \x03(\x05\x12\x1c\n\x07gameend\x18\x06 \x01(\x0b2\x0b.lq.GameEnd\x12\r\n\x05doras\x18\x07 \x03(\t\x12\x1a\n\x04muyu\x18\x08 \x01(\x0b2\x0c.lq.MuyuInfo\x12\x0e\n\x06baopai\x18\t \x01(\x05\x122\n\x12hun_zhi_yi_ji_info\x18\n \x01(\x0b2\x16.lq.HunZhiYiJiBuffInfo"\xc6\x01\n\x10HuInfoXueZhanMid\x12\x0c\n\x04seat\x18\x01 \x01(\r\x12\x12\n\nhand_count\x18\x02 \x01(\r\x12\x0c\n\x04hand\x18\x03 \x03(\t\x12\x0c\n\x04ming\x18\x04 \x03(\t\x12\x0f\n\x07hu_tile\x18\x05 \x01(\t\x12\x0c\n\x04zimo\x18\x06 \x01(\x08\x12\r\n\x05yiman\x18\x07 \x01(\x08\x12\r\n\x05count\x18\x08 \x01(\r\x12\x19\n\x04fans\x18\t \x03(\x0b2\x0b.lq.FanInfo\x12\n\n\x02fu\x18\n \x01(\r\x12\x10\n\x08title_id\x18\x0b \x01(\r"\xd1\x01\n\x14ActionHuleXueZhanMid\x12#\n\x05hules\x18\x01 \x03(\x0b2\x14.lq.HuInfoXueZhanMid\x12\x12\n\nold_scores\x18\x02 \x03(\x05\x12\x14\n\x0cdelta_scores\x18\x03 \x03(\x05\x12\x0e\n\x06scores\x18\x05 \x03(\x05\x12\r\n\x05doras\x18\x07 \x03(\t\x12\x1a\n\x04muyu\x18\x08 \x01(\x0b2\x0c.lq.MuyuInfo\x12\x1d\n\x04liqi\x18\t \x01(\x0b2\x0f.lq.LiQiSuccess\x12\x10\n\x08zhenting\x18\n \x01(\x08"\xd1\x01\n\x14RecordHuleXueZhanMid\x12#\n\x05hules\x18\x01 \x03(\x0b2\x14.lq.HuInfoXueZhanMid\x12\x12\n\nold_scores\x18\x02 \x03(\x05\x12\x14\n\x0cdelta_scores\x18\x03 \x03(\x05\x12\x0e\n\x06scores\x18\x05 \x03(\x05\x12\r\n\x05doras\x18\x07 \x03(\t\x12\x1a\n\x04muyu\x18\x08 \x01(\x0b2\x0c.lq.MuyuInfo\x12\x1d\n\x04liqi\x18\t \x01(\x0b2\x0f.lq.LiQiSuccess\x12\x10\n\x08zhenting\x18\n \x03(\x08"\xf9\x01\n\x14ActionHuleXueZhanEnd\x12#\n\x05hules\x18\x01 \x03(\x0b2\x14.lq.HuInfoXueZhanMid\x12\x12\n\nold_scores\x18\x02 \x03(\x05\x12\x14\n\x0cdelta_scores\x18\x03 \x03(\x05\x12\x0e\n\x06scores\x18\x04 \x03(\x05\x12\x14\n\x0cwait_timeout\x18\x05 \x01(\r\x12\x1c\n\x07gameend\x18\x06 \x01(\x0b2\x0b.lq.GameEnd\x12\r\n\x05doras\x18\x07 \x03(\t\x12\x1a\n\x04muyu\x18\x08 \x01(\x0b2\x0c.lq.MuyuInfo\x12#\n\rhules_history\x18\t \x03(\x0b2\x0c.lq.HuleInfo"\xf9\x01\n\x14RecordHuleXueZhanEnd\x12#\n\x05hules\x18\x01 \x03(\x0b2\x14.lq.HuInfoXueZhanMid\x12\x12\n\nold_scores\x18\x02 \x03(\x05\x12\x14\n\x0cdelta_scores\x18\x03 \x03(\x05\x12\x0e\n\x06scores\x18\x04 \x03(\x05\x12\x14\n\x0cwait_timeout\x18\x05 \x01(\r\x12\x1c\n\x07gameend\x18\x06 \x01(\x0b2\x0b.lq.GameEnd\x12\r\n\x05doras\x18\x07 \x03(\t\x12\x1a\n\x04muyu\x18\x08 \x01(\x0b2\x0c.lq.MuyuInfo\x12#\n\rhules_history\x18\t \x03(\x0b2\x0c.lq.HuleInfo"\xce\x01\n\x0bActionLiuJu\x12\x0c\n\x04type\x18\x01 \x01(\r\x12\x1c\n\x07gameend\x18\x02 \x01(\x0b2\x0b.lq.GameEnd\x12\x0c\n\x04seat\x18\x03 \x01(\r\x12\r\n\x05tiles\x18\x04 \x03(\t\x12\x1d\n\x04liqi\x18\x05 \x01(\x0b2\x0f.lq.LiQiSuccess\x12\x16\n\x0eallplayertiles\x18\x06 \x03(\t\x12\x1a\n\x04muyu\x18\x07 \x01(\x0b2\x0c.lq.MuyuInfo\x12#\n\rhules_history\x18\t \x03(\x0b2\x0c.lq.HuleInfo"\xce\x01\n\x0bRecordLiuJu\x12\x0c\n\x04type\x18\x01 \x01(\r\x12\x1c\n\x07gameend\x18\x02 \x01(\x0b2\x0b.lq.GameEnd\x12\x0c\n\x04seat\x18\x03 \x01(\r\x12\r\n\x05tiles\x18\x04 \x03(\t\x12\x1d\n\x04liqi\x18\x05 \x01(\x0b2\x0f.lq.LiQiSuccess\x12\x16\n\x0eallplayertiles\x18\x06 \x03(\t\x12\x1a\n\x04muyu\x18\x07 \x01(\x0b2\x0c.lq.MuyuInfo\x12#\n\rhules_history\x18\t \x03(\x0b2\x0c.lq.HuleInfo"g\n\x10NoTilePlayerInfo\x12\x0f\n\x07tingpai\x18\x03 \x01(\x08\x12\x0c\n\x04hand\x18\x04 \x03(\t\x12\x1e\n\x05tings\x18\x05 \x03(\x0b2\x0f.lq.TingPaiInfo\x12\x14\n\x0calready_hule\x18\x06 \x01(\x08"\xa1\x01\n\x0fNoTileScoreInfo\x12\x0c\n\x04seat\x18\x01 \x01(\r\x12\x12\n\nold_scores\x18\x02 \x03(\x05\x12\x14\n\x0cdelta_scores\x18\x03 \x03(\x05\x12\x0c\n\x04hand\x18\x04 \x03(\t\x12\x0c\n\x04ming\x18\x05 \x03(\t\x12\r\n\x05doras\x18\x06 \x03(\t\x12\r\n\x05score\x18\x07 \x01(\r\x12\r\n\x05taxes\x18\x08 \x03(\x05\x12\r\n\x05lines\x18\t \x03(\t"\xc2\x01\n\x0cActionNoTile\x12\x14\n\x0cliujumanguan\x18\x01 \x01(\x08\x12%\n\x07players\x18\x02 \x03(\x0b2\x14.lq.NoTilePlayerInfo\x12#\n\x06scores\x18\x03 \x03(\x0b2\x13.lq.NoTileScoreInfo\x12\x0f\n\x07gameend\x18\x04 \x01(\x08\x12\x1a\n\x04muyu\x18\x05 \x01(\x0b2\x0c.lq.MuyuInfo\x12#\n\rhules_history\x18\t \x03(\x0b2\x0c.lq.HuleInfo"\xc2\x01\n\x0cRecordNoTile\x12\x14\n\x0cliujumanguan\x18\x01 \x01(\x08\x12%\n\x07players\x18\x02 \x03(\x0b2\x14.lq.NoTilePlayerInfo\x12#\n\x06scores\x18\x03 \x03(\x0b2\x13.lq.NoTileScoreInfo\x12\x0f\n\x07gameend\x18\x04 \x01(\x08\x12\x1a\n\x04muyu\x18\x05 \x01(\x0b2\x0c.lq.MuyuInfo\x12#\n\rhules_history\x18\t \x03(\x0b2\x0c.lq.HuleInfo"\x1d\n\rPlayerLeaving\x12\x0c\n\x04seat\x18\x01 \x01(\r"I\n\x14ReqRequestConnection\x12\x0c\n\x04type\x18\x02 \x01(\r\x12\x10\n\x08route_id\x18\x03 \x01(\r\x12\x11\n\ttimestamp\x18\x04 \x01(\x04"S\n\x14ResRequestConnection\x12\x18\n\x05error\x18\x01 \x01(\x0b2\t.lq.Error\x12\x11\n\ttimestamp\x18\x02 \x01(\x04\x12\x0e\n\x06result\x18\x03 \x01(\r"G\n\x15ReqRequestRouteChange\x12\x0e\n\x06before\x18\x01 \x01(\r\x12\x10\n\x08route_id\x18\x02 \x01(\r\x12\x0c\n\x04type\x18\x03 \x01(\r"A\n\x15ResRequestRouteChange\x12\x18\n\x05error\x18\x01 \x01(\x0b2\t.lq.Error\x12\x0e\n\x06result\x18\x03 \x01(\r"?\n\x0cReqHeartbeat\x12\x11\n\ttimestamp\x18\x01 \x01(\x04\x12\x1c\n\x14no_operation_counter\x18\x02 \x01(\r"J\n\x0cResHeartbeat\x12\x18\n\x05error\x18\x01 \x01(\x0b2\t.lq.Error\x12\r\n\x05delta\x18\x02 \x01(\x03\x12\x11\n\ttimestamp\x18\x03 \x01(\x04*=\n\x0fGamePlayerState\x12\x08\n\x04NULL\x10\x00\x12\x08\n\x04AUTH\x10\x01\x12\x0b\n\x07SYNCING\x10\x02\x12\t\n\x05READY\x10\x032\xfb\xd4\x01\n\x05Lobby\x12;\n\x13fetchConnectionInfo\x12\r.lq.ReqCommon\x1a\x15.lq.ResConnectionInfo\x126\n\x0efetchQueueInfo\x12\r.lq.ReqCommon\x1a\x15.lq.ResFetchQueueInfo\x12+\n\x0bcancelQueue\x12\r.lq.ReqCommon\x1a\r.lq.ResCommon\x125\n\x0bopenidCheck\x12\x12.lq.ReqOpenidCheck\x1a\x12.lq.ResOauth2Check\x124\n\x06signup\x12\x14.lq.ReqSignupAccount\x1a\x14.lq.ResSignupAccount\x12#\n\x05login\x12\x0c.lq.ReqLogin\x1a\x0c.lq.ResLogin\x12,\n\tfetchInfo\x12\r.lq.ReqCommon\x1a\x10.lq.ResFetchInfo\x12,\n\x0cloginSuccess\x12\r.lq.ReqCommon\x1a\r.lq.ResCommon\x12N\n\x1afetchServerMaintenanceInfo\x12\r.lq.ReqCommon\x1a!.lq.ResFetchServerMaintenanceInfo\x12-\n\nemailLogin\x12\x11.lq.ReqEmailLogin\x1a\x0c.lq.ResLogin\x122\n\noauth2Auth\x12\x11.lq.ReqOauth2Auth\x1a\x11.lq.ResOauth2Auth\x125\n\x0boauth2Check\x12\x12.lq.ReqOauth2Check\x1a\x12.lq.ResOauth2Check\x128\n\x0coauth2Signup\x12\x13.lq.ReqOauth2Signup\x1a\x13.lq.ResOauth2Signup\x12/\n\x0boauth2Login\x12\x12.lq.ReqOauth2Login\x1a\x0c.lq.ResLogin\x125\n\x0bdmmPreLogin\x12\x12.lq.ReqDMMPreLogin\x1a\x12.lq.ResDMMPreLogin\x12D\n\x15createPhoneVerifyCode\x12\x1c.lq.ReqCreatePhoneVerifyCode\x1a\r.lq.ResCommon\x12D\n\x15createEmailVerifyCode\x12\x1c.lq.ReqCreateEmailVerifyCode\x1a\r.lq.ResCommon\x12N\n\x14verfifyCodeForSecure\x12\x1a.lq.ReqVerifyCodeForSecure\x1a\x1a.lq.ResVerfiyCodeForSecure\x128\n\x0fbindPhoneNumber\x12\x16.lq.ReqBindPhoneNumber\x1a\r.lq.ResCommon\x12<\n\x11unbindPhoneNumber\x12\x18.lq.ReqUnbindPhoneNumber\x1a\r.lq.ResCommon\x12@\n\x13fetchPhoneLoginBind\x12\r.lq.ReqCommon\x1a\x1a.lq.ResFetchPhoneLoginBind\x12B\n\x14createPhoneLoginBind\x12\x1b.lq.ReqCreatePhoneLoginBind\x1a\r.lq.ResCommon\x12,\n\tbindEmail\x12\x10.lq.ReqBindEmail\x1a\r.lq.ResCommon\x126\n\x0emodifyPassword\x12\x15.lq.ReqModifyPassword\x1a\r.lq.ResCommon\x120\n\x0bbindAccount\x12\x12.lq.ReqBindAccount\x1a\r.lq.ResCommon\x12&\n\x06logout\x12\r.lq.ReqLogout\x1a\r.lq.ResLogout\x12*\n\x08heatbeat\x12\x0f.lq.ReqHeatBeat\x1a\r.lq.ResCommon\x12J\n\x12searchAccountByEid\x12\x19.lq.ReqSearchAccountByEid\x1a\x19.lq.ResSearchAccountbyEid\x12,\n\tloginBeat\x12\x10.lq.ReqLoginBeat\x1a\r.lq.ResCommon\x126\n\x0ecreateNickname\x12\x15.lq.ReqCreateNickname\x1a\r.lq.ResCommon\x126\n\x0emodifyNickname\x12\x15.lq.ReqModifyNickname\x1a\r.lq.ResCommon\x126\n\x0emodifyBirthday\x12\x15.lq.ReqModifyBirthday\x1a\r.lq.ResCommon\x12+\n\tfetchRoom\x12\r.lq.ReqCommon\x1a\x0f.lq.ResSelfRoom\x128\n\x0ffetchGamingInfo\x12\r.lq.ReqCommon\x1a\x16.lq.ResFetchGamingInfo\x122\n\ncreateRoom\x12\x11.lq.ReqCreateRoom\x1a\x11.lq.ResCreateRoom\x12,\n\x08joinRoom\x12\x0f.lq.ReqJoinRoom\x1a\x0f.lq.ResJoinRoom\x12)\n\tleaveRoom\x12\r.lq.ReqCommon\x1a\r.lq.ResCommon\x12,\n\treadyPlay\x12\x10.lq.ReqRoomReady\x1a\r.lq.ResCommon\x124\n\x0edressingStatus\x12\x13.lq.ReqRoomDressing\x1a\r.lq.ResCommon\x12,\n\tstartRoom\x12\x10.lq.ReqRoomStart\x1a\r.lq.ResCommon\x126\n\x0eroomKickPlayer\x12\x15.lq.ReqRoomKickPlayer\x1a\r.lq.ResCommon\x12.\n\nmodifyRoom\x12\x11.lq.ReqModifyRoom\x1a\r.lq.ResCommon\x122\n\x0caddRoomRobot\x12\x13.lq.ReqAddRoomRobot\x1a\r.lq.ResCommon\x121\n\tmatchGame\x12\x15.lq.ReqJoinMatchQueue\x1a\r.lq.ResCommon\x125\n\x0bcancelMatch\x12\x17.lq.ReqCancelMatchQueue\x1a\r.lq.ResCommon\x12:\n\x10fetchAccountInfo\x12\x12.lq.ReqAccountInfo\x1a\x12.lq.ResAccountInfo\x122\n\x0cchangeAvatar\x12\x13.lq.ReqChangeAvatar\x1a\r.lq.ResCommon\x124\n\x14receiveVersionReward\x12\r.lq.ReqCommon\x1a\r.lq.ResCommon\x12U\n\x19fetchAccountStatisticInfo\x12\x1b.lq.ReqAccountStatisticInfo\x1a\x1b.lq.ResAccountStatisticInfo\x12T\n\x1dfetchAccountChallengeRankInfo\x12\x12.lq.ReqAccountInfo\x1a\x1f.lq.ResAccountChallengeRankInfo\x12G\n\x19fetchAccountCharacterInfo\x12\r.lq.ReqCommon\x1a\x1b.lq.ResAccountCharacterInfo\x128\n\x0cshopPurchase\x12\x13.lq.ReqShopPurchase\x1a\x13.lq.ResShopPurchase\x127\n\x0ffetchGameRecord\x12\x11.lq.ReqGameRecord\x1a\x11.lq.ResGameRecord\x122\n\x0ereadGameRecord\x12\x11.lq.ReqGameRecord\x1a\r.lq.ResCommon\x12C\n\x13fetchGameRecordList\x12\x15.lq.ReqGameRecordList\x1a\x15.lq.ResGameRecordList\x12I\n\x15fetchGameRecordListV2\x12\x17.lq.ReqGameRecordListV2\x1a\x17.lq.ResGameRecordListV2\x12O\n\x17fetchNextGameRecordList\x12\x19.lq.ReqNextGameRecordList\x1a\x19.lq.ResNextGameRecordList\x12M\n\x1cfetchCollectedGameRecordList\x12\r.lq.ReqCommon\x1a\x1e.lq.ResCollectedGameRecordList\x12L\n\x16fetchGameRecordsDetail\x12\x18.lq.ReqGameRecordsDetail\x1a\x18.lq.ResGameRecordsDetail\x12R\n\x18fetchGameRecordsDetailV2\x12\x1a.lq.ReqGameRecordsDetailV2\x1a\x1a.lq.ResGameRecordsDetailV2\x12V\n\x16addCollectedGameRecord\x12\x1d.lq.ReqAddCollectedGameRecord\x1a\x1d.lq.ResAddCollectedGameRecord\x12_\n\x19removeCollectedGameRecord\x12 .lq.ReqRemoveCollectedGameRecord\x1a .lq.ResRemoveCollectedGameRecord\x12t\n changeCollectedGameRecordRemarks\x12\'.lq.ReqChangeCollectedGameRecordRemarks\x1a\'.lq.ResChangeCollectedGameRecordRemarks\x12I\n\x15fetchLevelLeaderboard\x12\x17.lq.ReqLevelLeaderboard\x1a\x17.lq.ResLevelLeaderboard\x12U\n\x19fetchChallengeLeaderboard\x12\x1b.lq.ReqChallangeLeaderboard\x1a\x1b.lq.ResChallengeLeaderboard\x12O\n\x17fetchMutiChallengeLevel\x12\x19.lq.ReqMutiChallengeLevel\x1a\x19.lq.ResMutiChallengeLevel\x12I\n\x16fetchMultiAccountBrief\x12\x15.lq.ReqMultiAccountId\x1a\x18.lq.ResMultiAccountBrief\x123\n\x0ffetchFriendList\x12\r.lq.ReqCommon\x1a\x11.lq.ResFriendList\x12=\n\x14fetchFriendApplyList\x12\r.lq.ReqCommon\x1a\x16.lq.ResFriendApplyList\x120\n\x0bapplyFriend\x12\x12.lq.ReqApplyFriend\x1a\r.lq.ResCommon\x12<\n\x11handleFriendApply\x12\x18.lq.ReqHandleFriendApply\x1a\r.lq.ResCommon\x122\n\x0cremoveFriend\x12\x13.lq.ReqRemoveFriend\x1a\r.lq.ResCommon\x12G\n\x11searchAccountById\x12\x18.lq.ReqSearchAccountById\x1a\x18.lq.ResSearchAccountById\x12V\n\x16searchAccountByPattern\x12\x1d.lq.ReqSearchAccountByPattern\x1a\x1d.lq.ResSearchAccountByPattern\x12=\n\x11fetchAccountState\x12\x12.lq.ReqAccountList\x1a\x14.lq.ResAccountStates\x12-\n\x0cfetchBagInfo\x12\r.lq.ReqCommon\x1a\x0e.lq.ResBagInfo\x12.\n\nuseBagItem\x12\x11.lq.ReqUseBagItem\x1a\r.lq.ResCommon\x126\n\x0eopenManualItem\x12\x15.lq.ReqOpenManualItem\x1a\r.lq.ResCommon\x12P\n\x14openRandomRewardItem\x12\x1b.lq.ReqOpenRandomRewardItem\x1a\x1b.lq.ResOpenRandomRewardItem\x12G\n\x11openAllRewardItem\x12\x18.lq.ReqOpenAllRewardItem\x1a\x18.lq.ResOpenAllRewardItem\x122\n\x0ccomposeShard\x12\x13.lq.ReqComposeShard\x1a\r.lq.ResCommon\x12B\n\x11fetchAnnouncement\x12\x18.lq.ReqFetchAnnouncement\x1a\x13.lq.ResAnnouncement\x12:\n\x10readAnnouncement\x12\x17.lq.ReqReadAnnouncement\x1a\r.lq.ResCommon\x12/\n\rfetchMailInfo\x12\r.lq.ReqCommon\x1a\x0f.lq.ResMailInfo\x12*\n\x08readMail\x12\x0f.lq.ReqReadMail\x1a\r.lq.ResCommon\x12.\n\ndeleteMail\x12\x11.lq.ReqDeleteMail\x1a\r.lq.ResCommon\x12>\n\x16takeAttachmentFromMail\x12\x15.lq.ReqTakeAttachment\x1a\r.lq.ResCommon\x12\\\n\x18receiveAchievementReward\x12\x1f.lq.ReqReceiveAchievementReward\x1a\x1f.lq.ResReceiveAchievementReward\x12k\n\x1dreceiveAchievementGroupReward\x12$.lq.ReqReceiveAchievementGroupReward\x1a$.lq.ResReceiveAchievementGroupReward\x12B\n\x14fetchAchievementRate\x12\r.lq.ReqCommon\x1a\x1b.lq.ResFetchAchievementRate\x125\n\x10fetchAchievement\x12\r.lq.ReqCommon\x1a\x12.lq.ResAchievement\x12.\n\nbuyShiLian\x12\x11.lq.ReqBuyShiLian\x1a\r.lq.ResCommon\x12,\n\x0cmatchShiLian\x12\r.lq.ReqCommon\x1a\r.lq.ResCommon\x12-\n\rgoNextShiLian\x12\r.lq.ReqCommon\x1a\r.lq.ResCommon\x12<\n\x11updateClientValue\x12\x18.lq.ReqUpdateClientValue\x1a\r.lq.ResCommon\x125\n\x10fetchClientValue\x12\r.lq.ReqCommon\x1a\x12.lq.ResClientValue\x124\n\rclientMessage\x12\x14.lq.ReqClientMessage\x1a\r.lq.ResCommon\x12I\n\x15fetchCurrentMatchInfo\x12\x17.lq.ReqCurrentMatchInfo\x1a\x17.lq.ResCurrentMatchInfo\x122\n\x0cuserComplain\x12\x13.lq.ReqUserComplain\x1a\r.lq.ResCommon\x12;\n\x13fetchReviveCoinInfo\x12\r.lq.ReqCommon\x1a\x15.lq.ResReviveCoinInfo\x12.\n\x0egainReviveCoin\x12\r.lq.ReqCommon\x1a\r.lq.ResCommon\x121\n\x0efetchDailyTask\x12\r.lq.ReqCommon\x1a\x10.lq.ResDailyTask\x12D\n\x10refreshDailyTask\x12\x17.lq.ReqRefreshDailyTask\x1a\x17.lq.ResRefreshDailyTask\x125\n\x0buseGiftCode\x12\x12.lq.ReqUseGiftCode\x1a\x12.lq.ResUseGiftCode\x12C\n\x12useSpecialGiftCode\x12\x12.lq.ReqUseGiftCode\x1a\x19.lq.ResUseSpecialGiftCode\x121\n\x0efetchTitleList\x12\r.lq.ReqCommon\x1a\x10.lq.ResTitleList\x12*\n\x08useTitle\x12\x0f.lq.ReqUseTitle\x1a\r.lq.ResCommon\x12<\n\x11sendClientMessage\x12\x18.lq.ReqSendClientMessage\x1a\r.lq.ResCommon\x12=\n\x11fetchGameLiveInfo\x12\x13.lq.ReqGameLiveInfo\x1a\x13.lq.ResGameLiveInfo\x12R\n\x18fetchGameLiveLeftSegment\x12\x1a.lq.ReqGameLiveLeftSegment\x1a\x1a.lq.ResGameLiveLeftSegment\x12=\n\x11fetchGameLiveList\x12\x13.lq.ReqGameLiveList\x1a\x13.lq.ResGameLiveList\x12;\n\x13fetchCommentSetting\x12\r.lq.ReqCommon\x1a\x15.lq.ResCommentSetting\x12B\n\x14updateCommentSetting\x12\x1b.lq.ReqUpdateCommentSetting\x1a\r.lq.ResCommon\x12D\n\x10fetchCommentList\x12\x17.lq.ReqFetchCommentList\x1a\x17.lq.ResFetchCommentList\x12M\n\x13fetchCommentContent\x12\x1a.lq.ReqFetchCommentContent\x1a\x1a.lq.ResFetchCommentContent\x122\n\x0cleaveComment\x12\x13.lq.ReqLeaveComment\x1a\r.lq.ResCommon\x124\n\rdeleteComment\x12\x14.lq.ReqDeleteComment\x1a\r.lq.ResCommon\x12<\n\x11updateReadComment\x12\x18.lq.ReqUpdateReadComment\x1a\r.lq.ResCommon\x12J\n\x12fetchRollingNotice\x12\x19.lq.ReqFetchRollingNotice\x1a\x19.lq.ResFetchRollingNotice\x12@\n\x13fetchMaintainNotice\x12\r.lq.ReqCommon\x1a\x1a.lq.ResFetchMaintainNotice\x123\n\x0ffetchServerTime\x12\r.lq.ReqCommon\x1a\x11.lq.ResServerTime\x12W\n\x15fetchPlatformProducts\x12\x1e.lq.ReqPlatformBillingProducts\x1a\x1e.lq.ResPlatformBillingProducts\x12=\n\x14fetchRandomCharacter\x12\r.lq.ReqCommon\x1a\x16.lq.ResRandomCharacter\x12;\n\x12setRandomCharacter\x12\x16.lq.ReqRandomCharacter\x1a\r.lq.ResCommon\x12D\n\x15cancelGooglePlayOrder\x12\x1c.lq.ReqCancelGooglePlayOrder\x1a\r.lq.ResCommon\x12/\n\topenChest\x12\x10.lq.ReqOpenChest\x1a\x10.lq.ResOpenChest\x12D\n\x10buyFromChestShop\x12\x17.lq.ReqBuyFromChestShop\x1a\x17.lq.ResBuyFromChestShop\x12=\n\x14fetchDailySignInInfo\x12\r.lq.ReqCommon\x1a\x16.lq.ResDailySignInInfo\x12-\n\rdoDailySignIn\x12\r.lq.ReqCommon\x1a\r.lq.ResCommon\x12D\n\x10doActivitySignIn\x12\x17.lq.ReqDoActivitySignIn\x1a\x17.lq.ResDoActivitySignIn\x129\n\x12fetchCharacterInfo\x12\r.lq.ReqCommon\x1a\x14.lq.ResCharacterInfo\x12@\n\x13updateCharacterSort\x12\x1a.lq.ReqUpdateCharacterSort\x1a\r.lq.ResCommon\x12@\n\x13changeMainCharacter\x12\x1a.lq.ReqChangeMainCharacter\x1a\r.lq.ResCommon\x12@\n\x13changeCharacterSkin\x12\x1a.lq.ReqChangeCharacterSkin\x1a\r.lq.ResCommon\x12@\n\x13changeCharacterView\x12\x1a.lq.ReqChangeCharacterView\x1a\r.lq.ResCommon\x12J\n\x12setHiddenCharacter\x12\x19.lq.ReqSetHiddenCharacter\x1a\x19.lq.ResSetHiddenCharacter\x12M\n\x13sendGiftToCharacter\x12\x1a.lq.ReqSendGiftToCharacter\x1a\x1a.lq.ResSendGiftToCharacter\x12*\n\x08sellItem\x12\x0f.lq.ReqSellItem\x1a\r.lq.ResCommon\x123\n\x0ffetchCommonView\x12\r.lq.ReqCommon\x1a\x11.lq.ResCommonView\x12:\n\x10changeCommonView\x12\x17.lq.ReqChangeCommonView\x1a\r.lq.ResCommon\x128\n\x0fsaveCommonViews\x12\x16.lq.ReqSaveCommonViews\x1a\r.lq.ResCommon\x12:\n\x10fetchCommonViews\x12\x12.lq.ReqCommonViews\x1a\x12.lq.ResCommonViews\x12;\n\x13fetchAllCommonViews\x12\r.lq.ReqCommon\x1a\x15.lq.ResAllcommonViews\x124\n\ruseCommonView\x12\x14.lq.ReqUseCommonView\x1a\r.lq.ResCommon\x12D\n\x10upgradeCharacter\x12\x17.lq.ReqUpgradeCharacter\x1a\x17.lq.ResUpgradeCharacter\x129\n\x11addFinishedEnding\x12\x15.lq.ReqFinishedEnding\x1a\r.lq.ResCommon\x12;\n\x13receiveEndingReward\x12\x15.lq.ReqFinishedEnding\x1a\r.lq.ResCommon\x124\n\x11gameMasterCommand\x12\x10.lq.ReqGMCommand\x1a\r.lq.ResCommon\x12/\n\rfetchShopInfo\x12\r.lq.ReqCommon\x1a\x0f.lq.ResShopInfo\x125\n\x0bbuyFromShop\x12\x12.lq.ReqBuyFromShop\x1a\x12.lq.ResBuyFromShop\x12.\n\nbuyFromZHP\x12\x11.lq.ReqBuyFromZHP\x1a\r.lq.ResCommon\x12;\n\x0erefreshZHPShop\x12\x12.lq.ReqReshZHPShop\x1a\x15.lq.ResRefreshZHPShop\x12=\n\x14fetchMonthTicketInfo\x12\r.lq.ReqCommon\x1a\x16.lq.ResMonthTicketInfo\x126\n\x0epayMonthTicket\x12\r.lq.ReqCommon\x1a\x15.lq.ResPayMonthTicket\x12:\n\x10exchangeCurrency\x12\x17.lq.ReqExchangeCurrency\x1a\r.lq.ResCommon\x12<\n\x12exchangeChestStone\x12\x17.lq.ReqExchangeCurrency\x1a\r.lq.ResCommon\x129\n\x0fexchangeDiamond\x12\x17.lq.ReqExchangeCurrency\x1a\r.lq.ResCommon\x12;\n\x13fetchServerSettings\x12\r.lq.ReqCommon\x1a\x15.lq.ResServerSettings\x12=\n\x14fetchAccountSettings\x12\r.lq.ReqCommon\x1a\x16.lq.ResAccountSettings\x12D\n\x15updateAccountSettings\x12\x1c.lq.ReqUpdateAccountSettings\x1a\r.lq.ResCommon\x12=\n\x14fetchModNicknameTime\x12\r.lq.ReqCommon\x1a\x16.lq.ResModNicknameTime\x12Y\n\x17createWechatNativeOrder\x12\x1e.lq.ReqCreateWechatNativeOrder\x1a\x1e.lq.ResCreateWechatNativeOrder\x12P\n\x14createWechatAppOrder\x12\x1b.lq.ReqCreateWechatAppOrder\x1a\x1b.lq.ResCreateWechatAppOrder\x12G\n\x11createAlipayOrder\x12\x18.lq.ReqCreateAlipayOrder\x1a\x18.lq.ResCreateAlipayOrder\x12S\n\x15createAlipayScanOrder\x12\x1c.lq.ReqCreateAlipayScanOrder\x1a\x1c.lq.ResCreateAlipayScanOrder\x12P\n\x14createAlipayAppOrder\x12\x1b.lq.ReqCreateAlipayAppOrder\x1a\x1b.lq.ResCreateAlipayAppOrder\x12Y\n\x17createJPCreditCardOrder\x12\x1e.lq.ReqCreateJPCreditCardOrder\x1a\x1e.lq.ResCreateJPCreditCardOrder\x12M\n\x13createJPPaypalOrder\x12\x1a.lq.ReqCreateJPPaypalOrder\x1a\x1a.lq.ResCreateJPPaypalOrder\x12A\n\x0fcreateJPAuOrder\x12\x16.lq.ReqCreateJPAuOrder\x1a\x16.lq.ResCreateJPAuOrder\x12M\n\x13createJPDocomoOrder\x12\x1a.lq.ReqCreateJPDocomoOrder\x1a\x1a.lq.ResCreateJPDocomoOrder\x12S\n\x15createJPWebMoneyOrder\x12\x1c.lq.ReqCreateJPWebMoneyOrder\x1a\x1c.lq.ResCreateJPWebMoneyOrder\x12S\n\x15createJPSoftbankOrder\x12\x1c.lq.ReqCreateJPSoftbankOrder\x1a\x1c.lq.ResCreateJPSoftbankOrder\x12M\n\x13createJPPayPayOrder\x12\x1a.lq.ReqCreateJPPayPayOrder\x1a\x1a.lq.ResCreateJPPayPayOrder\x12h\n\x1cfetchJPCommonCreditCardOrder\x12#.lq.ReqFetchJPCommonCreditCardOrder\x1a#.lq.ResFetchJPCommonCreditCardOrder\x12D\n\x10createJPGMOOrder\x12\x17.lq.ReqCreateJPGMOOrder\x1a\x17.lq.ResCreateJPGMOOrder\x12M\n\x13createENPaypalOrder\x12\x1a.lq.ReqCreateENPaypalOrder\x1a\x1a.lq.ResCreateENPaypalOrder\x12Y\n\x17createENMasterCardOrder\x12\x1e.lq.ReqCreateENMasterCardOrder\x1a\x1e.lq.ResCreateENMasterCardOrder\x12G\n\x11createENVisaOrder\x12\x18.lq.ReqCreateENVisaOrder\x1a\x18.lq.ResCreateENVisaOrder\x12D\n\x10createENJCBOrder\x12\x17.lq.ReqCreateENJCBOrder\x1a\x17.lq.ResCreateENJCBOrder\x12M\n\x13createENAlipayOrder\x12\x1a.lq.ReqCreateENAlipayOrder\x1a\x1a.lq.ResCreateENAlipayOrder\x12M\n\x13createKRPaypalOrder\x12\x1a.lq.ReqCreateKRPaypalOrder\x1a\x1a.lq.ResCreateKRPaypalOrder\x12Y\n\x17createKRMasterCardOrder\x12\x1e.lq.ReqCreateKRMasterCardOrder\x1a\x1e.lq.ResCreateKRMasterCardOrder\x12G\n\x11createKRVisaOrder\x12\x18.lq.ReqCreateKRVisaOrder\x1a\x18.lq.ResCreateKRVisaOrder\x12D\n\x10createKRJCBOrder\x12\x17.lq.ReqCreateKRJCBOrder\x1a\x17.lq.ResCreateKRJCBOrder\x12M\n\x13createKRAlipayOrder\x12\x1a.lq.ReqCreateKRAlipayOrder\x1a\x1a.lq.ResCreateKRAlipayOrder\x12>\n\x0ecreateDMMOrder\x12\x15.lq.ReqCreateDMMOrder\x1a\x15.lq.ResCreateDmmOrder\x12>\n\x0ecreateIAPOrder\x12\x15.lq.ReqCreateIAPOrder\x1a\x15.lq.ResCreateIAPOrder\x12D\n\x10createSteamOrder\x12\x17.lq.ReqCreateSteamOrder\x1a\x17.lq.ResCreateSteamOrder\x12:\n\x10verifySteamOrder\x12\x17.lq.ReqVerifySteamOrder\x1a\r.lq.ResCommon\x12N\n\x18createMyCardAndroidOrder\x12\x18.lq.ReqCreateMyCardOrder\x1a\x18.lq.ResCreateMyCardOrder\x12J\n\x14createMyCardWebOrder\x12\x18.lq.ReqCreateMyCardOrder\x1a\x18.lq.ResCreateMyCardOrder\x12G\n\x11createPaypalOrder\x12\x18.lq.ReqCreatePaypalOrder\x1a\x18.lq.ResCreatePaypalOrder\x12G\n\x11createXsollaOrder\x12\x18.lq.ReqCreateXsollaOrder\x1a\x18.lq.ResCreateXsollaOrder\x12I\n\x13createXsollaV4Order\x12\x18.lq.ReqCreateXsollaOrder\x1a\x18.lq.ResCreateXsollaOrder\x12<\n\x11verifyMyCardOrder\x12\x18.lq.ReqVerifyMyCardOrder\x1a\r.lq.ResCommon\x12P\n\x14verificationIAPOrder\x12\x1b.lq.ReqVerificationIAPOrder\x1a\x1b.lq.ResVerificationIAPOrder\x12J\n\x14createYostarSDKOrder\x12\x18.lq.ReqCreateYostarOrder\x1a\x18.lq.ResCreateYostarOrder\x12J\n\x12createBillingOrder\x12\x19.lq.ReqCreateBillingOrder\x1a\x19.lq.ResCreateBillingOrder\x12B\n\x14solveGooglePlayOrder\x12\x1b.lq.ReqSolveGooglePlayOrder\x1a\r.lq.ResCommon\x12E\n\x15solveGooglePayOrderV3\x12\x1d.lq.ReqSolveGooglePlayOrderV3\x1a\r.lq.ResCommon\x12:\n\x10deliverAA32Order\x12\x17.lq.ReqDeliverAA32Order\x1a\r.lq.ResCommon\x12\'\n\tfetchMisc\x12\r.lq.ReqCommon\x1a\x0b.lq.ResMisc\x128\n\x0fmodifySignature\x12\x16.lq.ReqModifySignature\x1a\r.lq.ResCommon\x123\n\x0ffetchIDCardInfo\x12\r.lq.ReqCommon\x1a\x11.lq.ResIDCardInfo\x12:\n\x10updateIDCardInfo\x12\x17.lq.ReqUpdateIDCardInfo\x1a\r.lq.ResCommon\x121\n\x0efetchVipReward\x12\r.lq.ReqCommon\x1a\x10.lq.ResVipReward\x124\n\rgainVipReward\x12\x14.lq.ReqGainVipReward\x1a\r.lq.ResCommon\x12:\n\x10fetchRefundOrder\x12\r.lq.ReqCommon\x1a\x17.lq.ResFetchRefundOrder\x12b\n\x1afetchCustomizedContestList\x12!.lq.ReqFetchCustomizedContestList\x1a!.lq.ResFetchCustomizedContestList\x12n\n\x1efetchCustomizedContestAuthInfo\x12%.lq.ReqFetchCustomizedContestAuthInfo\x1a%.lq.ResFetchCustomizedContestAuthInfo\x12V\n\x16enterCustomizedContest\x12\x1d.lq.ReqEnterCustomizedContest\x1a\x1d.lq.ResEnterCustomizedContest\x126\n\x16leaveCustomizedContest\x12\r.lq.ReqCommon\x1a\r.lq.ResCommon\x12t\n fetchCustomizedContestOnlineInfo\x12\'.lq.ReqFetchCustomizedContestOnlineInfo\x1a\'.lq.ResFetchCustomizedContestOnlineInfo\x12w\n!fetchCustomizedContestByContestId\x12(.lq.ReqFetchCustomizedContestByContestId\x1a(.lq.ResFetchCustomizedContestByContestId\x12Y\n\x17signupCustomizedContest\x12\x1e.lq.ReqSignupCustomizedContest\x1a\x1e.lq.ResSignupCustomizedContest\x12F\n\x16startCustomizedContest\x12\x1d.lq.ReqStartCustomizedContest\x1a\r.lq.ResCommon\x12D\n\x15stopCustomizedContest\x12\x1c.lq.ReqStopCustomizedContest\x1a\r.lq.ResCommon\x12k\n\x1djoinCustomizedContestChatRoom\x12$.lq.ReqJoinCustomizedContestChatRoom\x1a$.lq.ResJoinCustomizedContestChatRoom\x12>\n\x1eleaveCustomizedContestChatRoom\x12\r.lq.ReqCommon\x1a\r.lq.ResCommon\x126\n\x0esayChatMessage\x12\x15.lq.ReqSayChatMessage\x1a\r.lq.ResCommon\x12w\n!fetchCustomizedContestGameRecords\x12(.lq.ReqFetchCustomizedContestGameRecords\x1a(.lq.ResFetchCustomizedContestGameRecords\x12z\n"fetchCustomizedContestGameLiveList\x12).lq.ReqFetchCustomizedContestGameLiveList\x1a).lq.ResFetchCustomizedContestGameLiveList\x12H\n\x17followCustomizedContest\x12\x1e.lq.ReqTargetCustomizedContest\x1a\r.lq.ResCommon\x12J\n\x19unfollowCustomizedContest\x12\x1e.lq.ReqTargetCustomizedContest\x1a\r.lq.ResCommon\x127\n\x11fetchActivityList\x12\r.lq.ReqCommon\x1a\x13.lq.ResActivityList\x12E\n\x18fetchAccountActivityData\x12\r.lq.ReqCommon\x1a\x1a.lq.ResAccountActivityData\x12P\n\x14exchangeActivityItem\x12\x1b.lq.ReqExchangeActivityItem\x1a\x1b.lq.ResExchangeActivityItem\x12B\n\x14completeActivityTask\x12\x1b.lq.ReqCompleteActivityTask\x1a\r.lq.ResCommon\x12L\n\x19completeActivityTaskBatch\x12 .lq.ReqCompleteActivityTaskBatch\x1a\r.lq.ResCommon\x12F\n\x18completeActivityFlipTask\x12\x1b.lq.ReqCompleteActivityTask\x1a\r.lq.ResCommon\x12H\n\x1acompletePeriodActivityTask\x12\x1b.lq.ReqCompleteActivityTask\x1a\r.lq.ResCommon\x12X\n\x1fcompletePeriodActivityTaskBatch\x12&.lq.ReqCompletePeriodActivityTaskBatch\x1a\r.lq.ResCommon\x12H\n\x1acompleteRandomActivityTask\x12\x1b.lq.ReqCompleteActivityTask\x1a\r.lq.ResCommon\x12R\n\x1fcompleteRandomActivityTaskBatch\x12 .lq.ReqCompleteActivityTaskBatch\x1a\r.lq.ResCommon\x12Y\n\x17receiveActivityFlipTask\x12\x1e.lq.ReqReceiveActivityFlipTask\x1a\x1e.lq.ResReceiveActivityFlipTask\x12_\n\x19completeSegmentTaskReward\x12 .lq.ReqCompleteSegmentTaskReward\x1a .lq.ResCompleteSegmentTaskReward\x12S\n\x15fetchActivityFlipInfo\x12\x1c.lq.ReqFetchActivityFlipInfo\x1a\x1c.lq.ResFetchActivityFlipInfo\x12^\n"gainAccumulatedPointActivityReward\x12).lq.ReqGainAccumulatedPointActivityReward\x1a\r.lq.ResCommon\x12R\n\x1cgainMultiPointActivityReward\x12#.lq.ReqGainMultiPointActivityReward\x1a\r.lq.ResCommon\x12_\n\x19fetchRankPointLeaderboard\x12 .lq.ReqFetchRankPointLeaderboard\x1a .lq.ResFetchRankPointLeaderboard\x12@\n\x13gainRankPointReward\x12\x1a.lq.ReqGainRankPointReward\x1a\r.lq.ResCommon\x12I\n\x17richmanActivityNextMove\x12\x16.lq.ReqRichmanNextMove\x1a\x16.lq.ResRichmanNextMove\x12P\n\x1brichmanAcitivitySpecialMove\x12\x19.lq.ReqRichmanSpecialMove\x1a\x16.lq.ResRichmanNextMove\x12L\n\x18richmanActivityChestInfo\x12\x17.lq.ReqRichmanChestInfo\x1a\x17.lq.ResRichmanChestInfo\x12S\n\x15createGameObserveAuth\x12\x1c.lq.ReqCreateGameObserveAuth\x1a\x1c.lq.ResCreateGameObserveAuth\x12V\n\x16refreshGameObserveAuth\x12\x1d.lq.ReqRefreshGameObserveAuth\x1a\x1d.lq.ResRefreshGameObserveAuth\x127\n\x11fetchActivityBuff\x12\r.lq.ReqCommon\x1a\x13.lq.ResActivityBuff\x12F\n\x13upgradeActivityBuff\x12\x1a.lq.ReqUpgradeActivityBuff\x1a\x13.lq.ResActivityBuff\x12P\n\x14upgradeActivityLevel\x12\x1b.lq.ReqUpgradeActivityLevel\x1a\x1b.lq.ResUpgradeActivityLevel\x12h\n\x1creceiveUpgradeActivityReward\x12#.lq.ReqReceiveUpgradeActivityReward\x1a#.lq.ResReceiveUpgradeActivityReward\x12:\n\x10upgradeChallenge\x12\r.lq.ReqCommon\x1a\x17.lq.ResUpgradeChallenge\x12:\n\x10refreshChallenge\x12\r.lq.ReqCommon\x1a\x17.lq.ResRefreshChallenge\x12>\n\x12fetchChallengeInfo\x12\r.lq.ReqCommon\x1a\x19.lq.ResFetchChallengeInfo\x12N\n\x1aforceCompleteChallengeTask\x12!.lq.ReqForceCompleteChallengeTask\x1a\r.lq.ResCommon\x12A\n\x14fetchChallengeSeason\x12\r.lq.ReqCommon\x1a\x1a.lq.ResChallengeSeasonInfo\x12b\n\x1areceiveChallengeRankReward\x12!.lq.ReqReceiveChallengeRankReward\x1a!.lq.ResReceiveChallengeRankReward\x126\n\x10fetchABMatchInfo\x12\r.lq.ReqCommon\x1a\x13.lq.ResFetchABMatch\x122\n\x0cbuyInABMatch\x12\x13.lq.ReqBuyInABMatch\x1a\r.lq.ResCommon\x124\n\x14receiveABMatchReward\x12\r.lq.ReqCommon\x1a\r.lq.ResCommon\x12+\n\x0bquitABMatch\x12\r.lq.ReqCommon\x1a\r.lq.ResCommon\x12<\n\x11startUnifiedMatch\x12\x18.lq.ReqStartUnifiedMatch\x1a\r.lq.ResCommon\x12>\n\x12cancelUnifiedMatch\x12\x19.lq.ReqCancelUnifiedMatch\x1a\r.lq.ResCommon\x12@\n\x12fetchGamePointRank\x12\x14.lq.ReqGamePointRank\x1a\x14.lq.ResGamePointRank\x12M\n\x16fetchSelfGamePointRank\x12\x14.lq.ReqGamePointRank\x1a\x1d.lq.ResFetchSelfGamePointRank\x12)\n\x07readSNS\x12\x0e.lq.ReqReadSNS\x1a\x0e.lq.ResReadSNS\x12,\n\x08replySNS\x12\x0f.lq.ReqReplySNS\x1a\x0f.lq.ResReplySNS\x12)\n\x07likeSNS\x12\x0e.lq.ReqLikeSNS\x1a\x0e.lq.ResLikeSNS\x12)\n\x07digMine\x12\x0e.lq.ReqDigMine\x1a\x0e.lq.ResDigMine\x12D\n\x10fetchLastPrivacy\x12\x17.lq.ReqFetchLastPrivacy\x1a\x17.lq.ResFetchLastPrivacy\x122\n\x0ccheckPrivacy\x12\x13.lq.ReqCheckPrivacy\x1a\r.lq.ResCommon\x12S\n\x15fetchRPGBattleHistory\x12\x1c.lq.ReqFetchRPGBattleHistory\x1a\x1c.lq.ResFetchRPGBattleHistory\x12W\n\x17fetchRPGBattleHistoryV2\x12\x1c.lq.ReqFetchRPGBattleHistory\x1a\x1e.lq.ResFetchRPGBattleHistoryV2\x12G\n\x11receiveRPGRewards\x12\x18.lq.ReqReceiveRPGRewards\x1a\x18.lq.ResReceiveRPGRewards\x12E\n\x10receiveRPGReward\x12\x17.lq.ReqReceiveRPGReward\x1a\x18.lq.ResReceiveRPGRewards\x126\n\x0ebuyArenaTicket\x12\x15.lq.ReqBuyArenaTicket\x1a\r.lq.ResCommon\x12.\n\nenterArena\x12\x11.lq.ReqEnterArena\x1a\r.lq.ResCommon\x12<\n\x12receiveArenaReward\x12\x12.lq.ReqArenaReward\x1a\x12.lq.ResArenaReward\x128\n\x0cfetchOBToken\x12\x13.lq.ReqFetchOBToken\x1a\x13.lq.ResFetchOBToken\x12Y\n\x17receiveCharacterRewards\x12\x1e.lq.ReqReceiveCharacterRewards\x1a\x1e.lq.ResReceiveCharacterRewards\x12D\n\x10feedActivityFeed\x12\x17.lq.ReqFeedActivityFeed\x1a\x17.lq.ResFeedActivityFeed\x12\\\n\x18sendActivityGiftToFriend\x12\x1f.lq.ReqSendActivityGiftToFriend\x1a\x1f.lq.ResSendActivityGiftToFriend\x12@\n\x13receiveActivityGift\x12\x1a.lq.ReqReceiveActivityGift\x1a\r.lq.ResCommon\x12V\n\x16receiveAllActivityGift\x12\x1d.lq.ReqReceiveAllActivityGift\x1a\x1d.lq.ResReceiveAllActivityGift\x12e\n\x1bfetchFriendGiftActivityData\x12".lq.ReqFetchFriendGiftActivityData\x1a".lq.ResFetchFriendGiftActivityData\x12D\n\x10openPreChestItem\x12\x17.lq.ReqOpenPreChestItem\x1a\x17.lq.ResOpenPreChestItem\x12G\n\x11fetchVoteActivity\x12\x18.lq.ReqFetchVoteActivity\x1a\x18.lq.ResFetchVoteActivity\x128\n\x0cvoteActivity\x12\x13.lq.ReqVoteActivity\x1a\x13.lq.ResVoteActivity\x12>\n\x12unlockActivitySpot\x12\x19.lq.ReqUnlockActivitySpot\x1a\r.lq.ResCommon\x12J\n\x18unlockActivitySpotEnding\x12\x1f.lq.ReqUnlockActivitySpotEnding\x1a\r.lq.ResCommon\x12_\n\x19receiveActivitySpotReward\x12 .lq.ReqReceiveActivitySpotReward\x1a .lq.ResReceiveActivitySpotReward\x124\n\rdeleteAccount\x12\r.lq.ReqCommon\x1a\x14.lq.ResDeleteAccount\x123\n\x13cancelDeleteAccount\x12\r.lq.ReqCommon\x1a\r.lq.ResCommon\x12,\n\tlogReport\x12\x10.lq.ReqLogReport\x1a\r.lq.ResCommon\x12.\n\nbindOauth2\x12\x11.lq.ReqBindOauth2\x1a\r.lq.ResCommon\x129\n\x0ffetchOauth2Info\x12\x12.lq.ReqFetchOauth2\x1a\x12.lq.ResFetchOauth2\x128\n\x0fsetLoadingImage\x12\x16.lq.ReqSetLoadingImage\x1a\r.lq.ResCommon\x12<\n\x11fetchShopInterval\x12\r.lq.ReqCommon\x1a\x18.lq.ResFetchShopInterval\x12D\n\x15fetchActivityInterval\x12\r.lq.ReqCommon\x1a\x1c.lq.ResFetchActivityInterval\x12<\n\x11fetchRecentFriend\x12\r.lq.ReqCommon\x1a\x18.lq.ResFetchrecentFriend\x12/\n\topenGacha\x12\x10.lq.ReqOpenGacha\x1a\x10.lq.ResOpenGacha\x120\n\x0btaskRequest\x12\x12.lq.ReqTaskRequest\x1a\r.lq.ResCommon\x12Y\n\x17simulationActivityTrain\x12\x1e.lq.ReqSimulationActivityTrain\x1a\x1e.lq.ResSimulationActivityTrain\x12_\n\x19fetchSimulationGameRecord\x12 .lq.ReqFetchSimulationGameRecord\x1a .lq.ResFetchSimulationGameRecord\x12e\n\x1bstartSimulationActivityGame\x12".lq.ReqStartSimulationActivityGame\x1a".lq.ResStartSimulationActivityGame\x12Y\n\x17fetchSimulationGameRank\x12\x1e.lq.ReqFetchSimulationGameRank\x1a\x1e.lq.ResFetchSimulationGameRank\x12V\n\x16generateCombiningCraft\x12\x1d.lq.ReqGenerateCombiningCraft\x1a\x1d.lq.ResGenerateCombiningCraft\x12J\n\x12moveCombiningCraft\x12\x19.lq.ReqMoveCombiningCraft\x1a\x19.lq.ResMoveCombiningCraft\x12S\n\x15combiningRecycleCraft\x12\x1c.lq.ReqCombiningRecycleCraft\x1a\x1c.lq.ResCombiningRecycleCraft\x12Y\n\x17recoverCombiningRecycle\x12\x1e.lq.ReqRecoverCombiningRecycle\x1a\x1e.lq.ResRecoverCombiningRecycle\x12P\n\x14finishCombiningOrder\x12\x1b.lq.ReqFinishCombiningOrder\x1a\x1b.lq.ResFinishCombiningOrder\x12F\n\x16upgradeVillageBuilding\x12\x1d.lq.ReqUpgradeVillageBuilding\x1a\r.lq.ResCommon\x12h\n\x1creceiveVillageBuildingReward\x12#.lq.ReqReceiveVillageBuildingReward\x1a#.lq.ResReceiveVillageBuildingReward\x12:\n\x10startVillageTrip\x12\x17.lq.ReqStartVillageTrip\x1a\r.lq.ResCommon\x12\\\n\x18receiveVillageTripReward\x12\x1f.lq.ReqReceiveVillageTripReward\x1a\x1f.lq.ResReceiveVillageTripReward\x12M\n\x13completeVillageTask\x12\x1a.lq.ReqCompleteVillageTask\x1a\x1a.lq.ResCompleteVillageTask\x12P\n\x14getFriendVillageData\x12\x1b.lq.ReqGetFriendVillageData\x1a\x1b.lq.ResGetFriendVillageData\x12D\n\x10setVillageWorker\x12\x17.lq.ReqSetVillageWorker\x1a\x17.lq.ResSetVillageWorker\x12D\n\x10nextRoundVillage\x12\x17.lq.ReqNextRoundVillage\x1a\x17.lq.ResNextRoundVillage\x12q\n\x1fresolveFestivalActivityProposal\x12&.lq.ReqResolveFestivalActivityProposal\x1a&.lq.ResResolveFestivalActivityProposal\x12h\n\x1cresolveFestivalActivityEvent\x12#.lq.ReqResolveFestivalActivityEvent\x1a#.lq.ResResolveFestivalActivityEvent\x12M\n\x13buyFestivalProposal\x12\x1a.lq.ReqBuyFestivalProposal\x1a\x1a.lq.ResBuyFestivalProposal\x12>\n\x12islandActivityMove\x12\x19.lq.ReqIslandActivityMove\x1a\r.lq.ResCommon\x12<\n\x11islandActivityBuy\x12\x18.lq.ReqIslandActivityBuy\x1a\r.lq.ResCommon\x12>\n\x12islandActivitySell\x12\x19.lq.ReqIslandActivitySell\x1a\r.lq.ResCommon\x12D\n\x15islandActivityTidyBag\x12\x1c.lq.ReqIslandActivityTidyBag\x1a\r.lq.ResCommon\x12P\n\x1bislandActivityUnlockBagGrid\x12".lq.ReqIslandActivityUnlockBagGrid\x1a\r.lq.ResCommon\x12Y\n\x17createCustomizedContest\x12\x1e.lq.ReqCreateCustomizedContest\x1a\x1e.lq.ResCreateCustomizedContest\x12w\n!fetchManagerCustomizedContestList\x12(.lq.ReqFetchmanagerCustomizedContestList\x1a(.lq.ResFetchManagerCustomizedContestList\x12k\n\x1dfetchManagerCustomizedContest\x12$.lq.ReqFetchManagerCustomizedContest\x1a$.lq.ResFetchManagerCustomizedContest\x12V\n\x1eupdateManagerCustomizedContest\x12%.lq.ReqUpdateManagerCustomizedContest\x1a\r.lq.ResCommon\x12V\n\x16fetchContestPlayerRank\x12\x1d.lq.ReqFetchContestPlayerRank\x1a\x1d.lq.ResFetchContestPlayerRank\x12P\n\x14fetchReadyPlayerList\x12\x1b.lq.ReqFetchReadyPlayerList\x1a\x1b.lq.ResFetchReadyPlayerList\x126\n\x0ecreateGamePlan\x12\x15.lq.ReqCreateGamePlan\x1a\r.lq.ResCommon\x12X\n\x1fgenerateContestManagerLoginCode\x12\r.lq.ReqCommon\x1a&.lq.ResGenerateContestManagerLoginCode\x12Y\n\x17amuletActivityFetchInfo\x12\x1e.lq.ReqAmuletActivityFetchInfo\x1a\x1e.lq.ResAmuletActivityFetchInfo\x12\\\n\x18amuletActivityFetchBrief\x12\x1f.lq.ReqAmuletActivityFetchBrief\x1a\x1f.lq.ResAmuletActivityFetchBrief\x12Y\n\x17amuletActivityStartGame\x12\x1e.lq.ReqAmuletActivityStartGame\x1a\x1e.lq.ResAmuletActivityStartGame\x12S\n\x15amuletActivityOperate\x12\x1c.lq.ReqAmuletActivityOperate\x1a\x1c.lq.ResAmuletActivityOperate\x12_\n\x19amuletActivityChangeHands\x12 .lq.ReqAmuletActivityChangeHands\x1a .lq.ResAmuletActivityChangeHands\x12S\n\x15amuletActivityUpgrade\x12\x1c.lq.ReqAmuletActivityUpgrade\x1a\x1c.lq.ResAmuletActivityUpgrade\x12G\n\x11amuletActivityBuy\x12\x18.lq.ReqAmuletActivityBuy\x1a\x18.lq.ResAmuletActivityBuy\x12\\\n\x18amuletActivitySelectPack\x12\x1f.lq.ReqAmuletActivitySelectPack\x1a\x1f.lq.ResAmuletActivitySelectPack\x12\\\n\x18amuletActivitySellEffect\x12\x1f.lq.ReqAmuletActivitySellEffect\x1a\x1f.lq.ResAmuletActivitySellEffect\x12J\n\x18amuletActivityEffectSort\x12\x1f.lq.ReqAmuletActivityEffectSort\x1a\r.lq.ResCommon\x12B\n\x14amuletActivityGiveup\x12\x1b.lq.ReqAmuletActivityGiveup\x1a\r.lq.ResCommon\x12_\n\x19amuletActivityRefreshShop\x12 .lq.ReqAmuletActivityRefreshShop\x1a .lq.ResAmuletActivityRefreshShop\x12n\n\x1eamuletActivitySelectFreeEffect\x12%.lq.ReqAmuletActivitySelectFreeEffect\x1a%.lq.ResAmuletActivitySelectFreeEffect\x12k\n\x1damuletActivityUpgradeShopBuff\x12$.lq.ReqAmuletActivityUpgradeShopBuff\x1a$.lq.ResAmuletActivityUpgradeShopBuff\x12_\n\x19amuletActivityEndShopping\x12 .lq.ReqAmuletActivityEndShopping\x1a .lq.ResAmuletActivityEndShopping\x12P\n\x1bamuletActivitySetSkillLevel\x12".lq.ReqAmuletActivitySetSkillLevel\x1a\r.lq.ResCommon\x12N\n\x1aamuletActivityMaintainInfo\x12\r.lq.ReqCommon\x1a!.lq.ResAmuletActivityMaintainInfo\x12n\n\x1eamuletActivitySelectRewardPack\x12%.lq.ReqAmuletActivitySelectRewardPack\x1a%.lq.ResAmuletActivitySelectRewardPack\x12q\n\x1famuletActivityReceiveTaskReward\x12&.lq.ReqAmuletActivityReceiveTaskReward\x1a&.lq.ResAmuletActivityReceiveTaskReward\x12@\n\x13storyActivityUnlock\x12\x1a.lq.ReqStoryActivityUnlock\x1a\r.lq.ResCommon\x12L\n\x19storyActivityUnlockEnding\x12 .lq.ReqStoryActivityUnlockEnding\x1a\r.lq.ResCommon\x12_\n storyActivityReceiveEndingReward\x12\'.lq.ReqStoryActivityReceiveEndingReward\x1a\x12.lq.ResStoryReward\x12_\n storyActivityReceiveFinishReward\x12\'.lq.ReqStoryActivityReceiveFinishReward\x1a\x12.lq.ResStoryReward\x12e\n#storyActivityReceiveAllFinishReward\x12*.lq.ReqStoryActivityReceiveAllFinishReward\x1a\x12.lq.ResStoryReward\x12}\n#storyActivityUnlockEndingAndReceive\x12*.lq.ReqStoryActivityUnlockEndingAndReceive\x1a*.lq.ResStoryActivityUnlockEndingAndReceive\x12G\n\x11fetchActivityRank\x12\x18.lq.ReqFetchActivityRank\x1a\x18.lq.ResFetchActivityRank\x12<\n\x11setVerifiedHidden\x12\x18.lq.ReqSetVerifiedHidden\x1a\r.lq.ResCommon\x12V\n\x16fetchQuestionnaireList\x12\x1d.lq.ReqFetchQuestionnaireList\x1a\x1d.lq.ResFetchQuestionnaireList\x12\\\n\x18fetchQuestionnaireDetail\x12\x1f.lq.ReqFetchQuestionnaireDetail\x1a\x1f.lq.ResFetchQuestionnaireDetail\x12@\n\x13submitQuestionnaire\x12\x1a.lq.ReqSubmitQuestionnaire\x1a\r.lq.ResCommon\x12N\n\x1asetFriendRoomRandomBotChar\x12!.lq.ReqSetFriendRoomRandomBotChar\x1a\r.lq.ResCommon\x12_\n\x19fetchAccountGameHuRecords\x12 .lq.ReqFetchAccountGameHuRecords\x1a .lq.ResFetchAccountGameHuRecords\x12S\n\x15fetchAccountInfoExtra\x12\x1c.lq.ReqFetchAccountInfoExtra\x1a\x1c.lq.ResFetchAccountInfoExtra\x12B\n\x14setAccountFavoriteHu\x12\x1b.lq.ReqSetAccountFavoriteHu\x1a\r.lq.ResCommon\x12A\n\x0ffetchSeerReport\x12\x16.lq.ReqFetchSeerReport\x1a\x16.lq.ResFetchSeerReport\x12D\n\x10createSeerReport\x12\x17.lq.ReqCreateSeerReport\x1a\x17.lq.ResCreateSeerReport\x12@\n\x13fetchSeerReportList\x12\r.lq.ReqCommon\x1a\x1a.lq.ResFetchSeerReportList\x124\n\rfetchSeerInfo\x12\r.lq.ReqCommon\x1a\x14.lq.ResFetchSeerInfo\x12H\n\x1bselectChestChooseUpActivity\x12\x1a.lq.ReqSelectChestChooseUp\x1a\r.lq.ReqCommon\x12_\n\x19generateAnnualReportToken\x12 .lq.ReqGenerateAnnualReportToken\x1a .lq.ResGenerateAnnualReportToken\x12D\n\x15fetchAnnualReportInfo\x12\r.lq.ReqCommon\x1a\x1c.lq.ResFetchAnnualReportInfo\x122\n\x0cremarkFriend\x12\x13.lq.ReqRemarkFriend\x1a\r.lq.ResCommon\x12V\n\x16simV2ActivityFetchInfo\x12\x1d.lq.ReqSimV2ActivityFetchInfo\x1a\x1d.lq.ResSimV2ActivityFetchInfo\x12\\\n\x18simV2ActivityStartSeason\x12\x1f.lq.ReqSimV2ActivityStartSeason\x1a\x1f.lq.ResSimV2ActivityStartSeason\x12J\n\x12simV2ActivityTrain\x12\x19.lq.ReqSimV2ActivityTrain\x1a\x19.lq.ResSimV2ActivityTrain\x12\\\n\x18simV2ActivitySelectEvent\x12\x1f.lq.ReqSimV2ActivitySelectEvent\x1a\x1f.lq.ResSimV2ActivitySelectEvent\x12Y\n\x17simV2ActivityStartMatch\x12\x1e.lq.ReqSimV2ActivityStartMatch\x1a\x1e.lq.ResSimV2ActivityStartMatch\x12S\n\x15simV2ActivityEndMatch\x12\x1c.lq.ReqSimV2ActivityEndMatch\x1a\x1c.lq.ResSimV2ActivityEndMatch\x12@\n\x13simV2ActivityGiveUp\x12\x1a.lq.ReqSimV2ActivityGiveUp\x1a\r.lq.ResCommon\x12H\n\x17simV2ActivitySetUpgrade\x12\x1e.lq.ReqSimV2ActivitySetUpgrade\x1a\r.lq.ResCommon2\xf5\x06\n\x08FastTest\x12,\n\x08authGame\x12\x0f.lq.ReqAuthGame\x1a\x0f.lq.ResAuthGame\x12,\n\tenterGame\x12\r.lq.ReqCommon\x1a\x10.lq.ResEnterGame\x12,\n\x08syncGame\x12\x0f.lq.ReqSyncGame\x1a\x0f.lq.ResSyncGame\x12.\n\x0efinishSyncGame\x12\r.lq.ReqCommon\x1a\r.lq.ResCommon\x12-\n\rterminateGame\x12\r.lq.ReqCommon\x1a\r.lq.ResCommon\x125\n\x0einputOperation\x12\x14.lq.ReqSelfOperation\x1a\r.lq.ResCommon\x125\n\x10inputChiPengGang\x12\x12.lq.ReqChiPengGang\x1a\r.lq.ResCommon\x12/\n\x0fconfirmNewRound\x12\r.lq.ReqCommon\x1a\r.lq.ResCommon\x128\n\x0fbroadcastInGame\x12\x16.lq.ReqBroadcastInGame\x1a\r.lq.ResCommon\x12=\n\x12inputGameGMCommand\x12\x18.lq.ReqGMCommandInGaming\x1a\r.lq.ResCommon\x12=\n\x14fetchGamePlayerState\x12\r.lq.ReqCommon\x1a\x16.lq.ResGamePlayerState\x121\n\x11checkNetworkDelay\x12\r.lq.ReqCommon\x1a\r.lq.ResCommon\x12,\n\x0cclearLeaving\x12\r.lq.ReqCommon\x1a\r.lq.ResCommon\x125\n\x0bvoteGameEnd\x12\x12.lq.ReqVoteGameEnd\x1a\x12.lq.ResGameEndVote\x120\n\x0bauthObserve\x12\x12.lq.ReqAuthObserve\x1a\r.lq.ResCommon\x122\n\x0cstartObserve\x12\r.lq.ReqCommon\x1a\x13.lq.ResStartObserve\x12+\n\x0bstopObserve\x12\r.lq.ReqCommon\x1a\r.lq.ResCommon2\xcd\x01\n\x05Route\x12G\n\x11requestConnection\x12\x18.lq.ReqRequestConnection\x1a\x18.lq.ResRequestConnection\x12J\n\x12requestRouteChange\x12\x19.lq.ReqRequestRouteChange\x1a\x19.lq.ResRequestRouteChange\x12/\n\theartbeat\x12\x10.lq.ReqHeartbeat\x1a\x10.lq.ResHeartbeatb\x06proto3')
+
+
+_classes = {}
+
+
+def _message_class(desc):
+    # upb only holds generated classes weakly, so a parsed sub-message can outlive its class.
+    # Keep every class reachable from desc alive here, and expose nested types as attributes like protocol_pb2.
+    cls = _classes.get(desc.full_name)
+    if cls is None:
+        cls = _classes[desc.full_name] = message_factory.GetMessageClass(desc)
+        for nested in desc.nested_types:
+            setattr(cls, nested.name, _message_class(nested))
+        for enum in desc.enum_types:
+            setattr(cls, enum.name, enum_type_wrapper.EnumTypeWrapper(enum))
+        for field in desc.fields:
+            if field.message_type is not None:
+                _message_class(field.message_type)
+    return cls
+
+
+def __getattr__(name):
+    desc = DESCRIPTOR.message_types_by_name.get(name)
+    if desc is not None:
+        value = _message_class(desc)
+    elif name in DESCRIPTOR.enum_types_by_name:
+        value = enum_type_wrapper.EnumTypeWrapper(DESCRIPTOR.enum_types_by_name[name])
+    else:
+        raise AttributeError('module {!r} has no attribute {!r}'.format(__name__, name))
+    globals()[name] = value
+    return value
@@ -793,1157 +793,1157 @@ class Lobby(MSRPCService):
     def get_res_class(self, method):
         return Lobby._res[method]
 
-    async def fetch_connection_info(self, req):
-        return await self.call_method('fetchConnectionInfo', req)
+    async def fetch_connection_info(self, req, timeout=None, replay=True):
+        return await self.call_method('fetchConnectionInfo', req, timeout=timeout, replay=replay)
 
-    async def fetch_queue_info(self, req):
-        return await self.call_method('fetchQueueInfo', req)
+    async def fetch_queue_info(self, req, timeout=None, replay=True):
+        return await self.call_method('fetchQueueInfo', req, timeout=timeout, replay=replay)
 
-    async def cancel_queue(self, req):
-        return await self.call_method('cancelQueue', req)
+    async def cancel_queue(self, req, timeout=None, replay=True):
+        return await self.call_method('cancelQueue', req, timeout=timeout, replay=replay)
 
-    async def openid_check(self, req):
-        return await self.call_method('openidCheck', req)
+    async def openid_check(self, req, timeout=None, replay=True):
+        return await self.call_method('openidCheck', req, timeout=timeout, replay=replay)
 
-    async def signup(self, req):
-        return await self.call_method('signup', req)
+    async def signup(self, req, timeout=None, replay=True):
+        return await self.call_method('signup', req, timeout=timeout, replay=replay)
 
-    async def login(self, req):
-        return await self.call_method('login', req)
+    async def login(self, req, timeout=None, replay=True):
+        return await self.call_method('login', req, timeout=timeout, replay=replay)
 
-    async def fetch_info(self, req):
-        return await self.call_method('fetchInfo', req)
+    async def fetch_info(self, req, timeout=None, replay=True):
+        return await self.call_method('fetchInfo', req, timeout=timeout, replay=replay)
 
-    async def login_success(self, req):
-        return await self.call_method('loginSuccess', req)
+    async def login_success(self, req, timeout=None, replay=True):
+        return await self.call_method('loginSuccess', req, timeout=timeout, replay=replay)
 
-    async def fetch_server_maintenance_info(self, req):
-        return await self.call_method('fetchServerMaintenanceInfo', req)
+    async def fetch_server_maintenance_info(self, req, timeout=None, replay=True):
+        return await self.call_method('fetchServerMaintenanceInfo', req, timeout=timeout, replay=replay)
 
-    async def email_login(self, req):
-        return await self.call_method('emailLogin', req)
+    async def email_login(self, req, timeout=None, replay=True):
+        return await self.call_method('emailLogin', req, timeout=timeout, replay=replay)
 
-    async def oauth2_auth(self, req):
-        return await self.call_method('oauth2Auth', req)
+    async def oauth2_auth(self, req, timeout=None, replay=True):
+        return await self.call_method('oauth2Auth', req, timeout=timeout, replay=replay)
 
-    async def oauth2_check(self, req):
-        return await self.call_method('oauth2Check', req)
+    async def oauth2_check(self, req, timeout=None, replay=True):
+        return await self.call_method('oauth2Check', req, timeout=timeout, replay=replay)
 
-    async def oauth2_signup(self, req):
-        return await self.call_method('oauth2Signup', req)
+    async def oauth2_signup(self, req, timeout=None, replay=True):
+        return await self.call_method('oauth2Signup', req, timeout=timeout, replay=replay)
 
-    async def oauth2_login(self, req):
-        return await self.call_method('oauth2Login', req)
+    async def oauth2_login(self, req, timeout=None, replay=True):
+        return await self.call_method('oauth2Login', req, timeout=timeout, replay=replay)
 
-    async def dmm_pre_login(self, req):
-        return await self.call_method('dmmPreLogin', req)
+    async def dmm_pre_login(self, req, timeout=None, replay=True):
+        return await self.call_method('dmmPreLogin', req, timeout=timeout, replay=replay)
 
-    async def create_phone_verify_code(self, req):
-        return await self.call_method('createPhoneVerifyCode', req)
+    async def create_phone_verify_code(self, req, timeout=None, replay=True):
+        return await self.call_method('createPhoneVerifyCode', req, timeout=timeout, replay=replay)
 
-    async def create_email_verify_code(self, req):
-        return await self.call_method('createEmailVerifyCode', req)
+    async def create_email_verify_code(self, req, timeout=None, replay=True):
+        return await self.call_method('createEmailVerifyCode', req, timeout=timeout, replay=replay)
 
-    async def verfify_code_for_secure(self, req):
-        return await self.call_method('verfifyCodeForSecure', req)
+    async def verfify_code_for_secure(self, req, timeout=None, replay=True):
+        return await self.call_method('verfifyCodeForSecure', req, timeout=timeout, replay=replay)
 
-    async def bind_phone_number(self, req):
-        return await self.call_method('bindPhoneNumber', req)
+    async def bind_phone_number(self, req, timeout=None, replay=True):
+        return await self.call_method('bindPhoneNumber', req, timeout=timeout, replay=replay)
 
-    async def unbind_phone_number(self, req):
-        return await self.call_method('unbindPhoneNumber', req)
+    async def unbind_phone_number(self, req, timeout=None, replay=True):
+        return await self.call_method('unbindPhoneNumber', req, timeout=timeout, replay=replay)
 
-    async def fetch_phone_login_bind(self, req):
-        return await self.call_method('fetchPhoneLoginBind', req)
+    async def fetch_phone_login_bind(self, req, timeout=None, replay=True):
+        return await self.call_method('fetchPhoneLoginBind', req, timeout=timeout, replay=replay)
 
-    async def create_phone_login_bind(self, req):
-        return await self.call_method('createPhoneLoginBind', req)
+    async def create_phone_login_bind(self, req, timeout=None, replay=True):
+        return await self.call_method('createPhoneLoginBind', req, timeout=timeout, replay=replay)
 
-    async def bind_email(self, req):
-        return await self.call_method('bindEmail', req)
+    async def bind_email(self, req, timeout=None, replay=True):
+        return await self.call_method('bindEmail', req, timeout=timeout, replay=replay)
 
-    async def modify_password(self, req):
-        return await self.call_method('modifyPassword', req)
+    async def modify_password(self, req, timeout=None, replay=True):
+        return await self.call_method('modifyPassword', req, timeout=timeout, replay=replay)
 
-    async def bind_account(self, req):
-        return await self.call_method('bindAccount', req)
+    async def bind_account(self, req, timeout=None, replay=True):
+        return await self.call_method('bindAccount', req, timeout=timeout, replay=replay)
 
-    async def logout(self, req):
-        return await self.call_method('logout', req)
+    async def logout(self, req, timeout=None, replay=True):
+        return await self.call_method('logout', req, timeout=timeout, replay=replay)
 
-    async def heatbeat(self, req):
-        return await self.call_method('heatbeat', req)
+    async def heatbeat(self, req, timeout=None, replay=True):
+        return await self.call_method('heatbeat', req, timeout=timeout, replay=replay)
 
-    async def search_account_by_eid(self, req):
-        return await self.call_method('searchAccountByEid', req)
+    async def search_account_by_eid(self, req, timeout=None, replay=True):
+        return await self.call_method('searchAccountByEid', req, timeout=timeout, replay=replay)
 
-    async def login_beat(self, req):
-        return await self.call_method('loginBeat', req)
+    async def login_beat(self, req, timeout=None, replay=True):
+        return await self.call_method('loginBeat', req, timeout=timeout, replay=replay)
 
-    async def create_nickname(self, req):
-        return await self.call_method('createNickname', req)
+    async def create_nickname(self, req, timeout=None, replay=True):
+        return await self.call_method('createNickname', req, timeout=timeout, replay=replay)
 
-    async def modify_nickname(self, req):
-        return await self.call_method('modifyNickname', req)
+    async def modify_nickname(self, req, timeout=None, replay=True):
+        return await self.call_method('modifyNickname', req, timeout=timeout, replay=replay)
 
-    async def modify_birthday(self, req):
-        return await self.call_method('modifyBirthday', req)
+    async def modify_birthday(self, req, timeout=None, replay=True):
+        return await self.call_method('modifyBirthday', req, timeout=timeout, replay=replay)
 
-    async def fetch_room(self, req):
-        return await self.call_method('fetchRoom', req)
+    async def fetch_room(self, req, timeout=None, replay=True):
+        return await self.call_method('fetchRoom', req, timeout=timeout, replay=replay)
 
-    async def fetch_gaming_info(self, req):
-        return await self.call_method('fetchGamingInfo', req)
+    async def fetch_gaming_info(self, req, timeout=None, replay=True):
+        return await self.call_method('fetchGamingInfo', req, timeout=timeout, replay=replay)
 
-    async def create_room(self, req):
-        return await self.call_method('createRoom', req)
+    async def create_room(self, req, timeout=None, replay=True):
+        return await self.call_method('createRoom', req, timeout=timeout, replay=replay)
 
-    async def join_room(self, req):
-        return await self.call_method('joinRoom', req)
+    async def join_room(self, req, timeout=None, replay=True):
+        return await self.call_method('joinRoom', req, timeout=timeout, replay=replay)
 
-    async def leave_room(self, req):
-        return await self.call_method('leaveRoom', req)
+    async def leave_room(self, req, timeout=None, replay=True):
+        return await self.call_method('leaveRoom', req, timeout=timeout, replay=replay)
 
-    async def ready_play(self, req):
-        return await self.call_method('readyPlay', req)
+    async def ready_play(self, req, timeout=None, replay=True):
+        return await self.call_method('readyPlay', req, timeout=timeout, replay=replay)
 
-    async def dressing_status(self, req):
-        return await self.call_method('dressingStatus', req)
+    async def dressing_status(self, req, timeout=None, replay=True):
+        return await self.call_method('dressingStatus', req, timeout=timeout, replay=replay)
 
-    async def start_room(self, req):
-        return await self.call_method('startRoom', req)
+    async def start_room(self, req, timeout=None, replay=True):
+        return await self.call_method('startRoom', req, timeout=timeout, replay=replay)
 
-    async def room_kick_player(self, req):
-        return await self.call_method('roomKickPlayer', req)
+    async def room_kick_player(self, req, timeout=None, replay=True):
+        return await self.call_method('roomKickPlayer', req, timeout=timeout, replay=replay)
 
-    async def modify_room(self, req):
-        return await self.call_method('modifyRoom', req)
+    async def modify_room(self, req, timeout=None, replay=True):
+        return await self.call_method('modifyRoom', req, timeout=timeout, replay=replay)
 
-    async def add_room_robot(self, req):
-        return await self.call_method('addRoomRobot', req)
+    async def add_room_robot(self, req, timeout=None, replay=True):
+        return await self.call_method('addRoomRobot', req, timeout=timeout, replay=replay)
 
-    async def match_game(self, req):
-        return await self.call_method('matchGame', req)
+    async def match_game(self, req, timeout=None, replay=True):
+        return await self.call_method('matchGame', req, timeout=timeout, replay=replay)
 
-    async def cancel_match(self, req):
-        return await self.call_method('cancelMatch', req)
+    async def cancel_match(self, req, timeout=None, replay=True):
+        return await self.call_method('cancelMatch', req, timeout=timeout, replay=replay)
 
-    async def fetch_account_info(self, req):
-        return await self.call_method('fetchAccountInfo', req)
+    async def fetch_account_info(self, req, timeout=None, replay=True):
+        return await self.call_method('fetchAccountInfo', req, timeout=timeout, replay=replay)
 
-    async def change_avatar(self, req):
-        return await self.call_method('changeAvatar', req)
+    async def change_avatar(self, req, timeout=None, replay=True):
+        return await self.call_method('changeAvatar', req, timeout=timeout, replay=replay)
 
-    async def receive_version_reward(self, req):
-        return await self.call_method('receiveVersionReward', req)
+    async def receive_version_reward(self, req, timeout=None, replay=True):
+        return await self.call_method('receiveVersionReward', req, timeout=timeout, replay=replay)
 
-    async def fetch_account_statistic_info(self, req):
-        return await self.call_method('fetchAccountStatisticInfo', req)
+    async def fetch_account_statistic_info(self, req, timeout=None, replay=True):
+        return await self.call_method('fetchAccountStatisticInfo', req, timeout=timeout, replay=replay)
 
-    async def fetch_account_challenge_rank_info(self, req):
-        return await self.call_method('fetchAccountChallengeRankInfo', req)
+    async def fetch_account_challenge_rank_info(self, req, timeout=None, replay=True):
+        return await self.call_method('fetchAccountChallengeRankInfo', req, timeout=timeout, replay=replay)
 
-    async def fetch_account_character_info(self, req):
-        return await self.call_method('fetchAccountCharacterInfo', req)
+    async def fetch_account_character_info(self, req, timeout=None, replay=True):
+        return await self.call_method('fetchAccountCharacterInfo', req, timeout=timeout, replay=replay)
 
-    async def shop_purchase(self, req):
-        return await self.call_method('shopPurchase', req)
+    async def shop_purchase(self, req, timeout=None, replay=True):
+        return await self.call_method('shopPurchase', req, timeout=timeout, replay=replay)
 
-    async def fetch_game_record(self, req):
-        return await self.call_method('fetchGameRecord', req)
+    async def fetch_game_record(self, req, timeout=None, replay=True):
+        return await self.call_method('fetchGameRecord', req, timeout=timeout, replay=replay)
 
-    async def read_game_record(self, req):
-        return await self.call_method('readGameRecord', req)
+    async def read_game_record(self, req, timeout=None, replay=True):
+        return await self.call_method('readGameRecord', req, timeout=timeout, replay=replay)
 
-    async def fetch_game_record_list(self, req):
-        return await self.call_method('fetchGameRecordList', req)
+    async def fetch_game_record_list(self, req, timeout=None, replay=True):
+        return await self.call_method('fetchGameRecordList', req, timeout=timeout, replay=replay)
 
-    async def fetch_game_record_list_v2(self, req):
-        return await self.call_method('fetchGameRecordListV2', req)
+    async def fetch_game_record_list_v2(self, req, timeout=None, replay=True):
+        return await self.call_method('fetchGameRecordListV2', req, timeout=timeout, replay=replay)
 
-    async def fetch_next_game_record_list(self, req):
-        return await self.call_method('fetchNextGameRecordList', req)
+    async def fetch_next_game_record_list(self, req, timeout=None, replay=True):
+        return await self.call_method('fetchNextGameRecordList', req, timeout=timeout, replay=replay)
 
-    async def fetch_collected_game_record_list(self, req):
-        return await self.call_method('fetchCollectedGameRecordList', req)
+    async def fetch_collected_game_record_list(self, req, timeout=None, replay=True):
+        return await self.call_method('fetchCollectedGameRecordList', req, timeout=timeout, replay=replay)
 
-    async def fetch_game_records_detail(self, req):
-        return await self.call_method('fetchGameRecordsDetail', req)
+    async def fetch_game_records_detail(self, req, timeout=None, replay=True):
+        return await self.call_method('fetchGameRecordsDetail', req, timeout=timeout, replay=replay)
 
-    async def fetch_game_records_detail_v2(self, req):
-        return await self.call_method('fetchGameRecordsDetailV2', req)
+    async def fetch_game_records_detail_v2(self, req, timeout=None, replay=True):
+        return await self.call_method('fetchGameRecordsDetailV2', req, timeout=timeout, replay=replay)
 
-    async def add_collected_game_record(self, req):
-        return await self.call_method('addCollectedGameRecord', req)
+    async def add_collected_game_record(self, req, timeout=None, replay=True):
+        return await self.call_method('addCollectedGameRecord', req, timeout=timeout, replay=replay)
 
-    async def remove_collected_game_record(self, req):
-        return await self.call_method('removeCollectedGameRecord', req)
+    async def remove_collected_game_record(self, req, timeout=None, replay=True):
+        return await self.call_method('removeCollectedGameRecord', req, timeout=timeout, replay=replay)
 
-    async def change_collected_game_record_remarks(self, req):
-        return await self.call_method('changeCollectedGameRecordRemarks', req)
+    async def change_collected_game_record_remarks(self, req, timeout=None, replay=True):
+        return await self.call_method('changeCollectedGameRecordRemarks', req, timeout=timeout, replay=replay)
 
-    async def fetch_level_leaderboard(self, req):
-        return await self.call_method('fetchLevelLeaderboard', req)
+    async def fetch_level_leaderboard(self, req, timeout=None, replay=True):
+        return await self.call_method('fetchLevelLeaderboard', req, timeout=timeout, replay=replay)
 
-    async def fetch_challenge_leaderboard(self, req):
-        return await self.call_method('fetchChallengeLeaderboard', req)
+    async def fetch_challenge_leaderboard(self, req, timeout=None, replay=True):
+        return await self.call_method('fetchChallengeLeaderboard', req, timeout=timeout, replay=replay)
 
-    async def fetch_muti_challenge_level(self, req):
-        return await self.call_method('fetchMutiChallengeLevel', req)
+    async def fetch_muti_challenge_level(self, req, timeout=None, replay=True):
+        return await self.call_method('fetchMutiChallengeLevel', req, timeout=timeout, replay=replay)
 
-    async def fetch_multi_account_brief(self, req):
-        return await self.call_method('fetchMultiAccountBrief', req)
+    async def fetch_multi_account_brief(self, req, timeout=None, replay=True):
+        return await self.call_method('fetchMultiAccountBrief', req, timeout=timeout, replay=replay)
 
-    async def fetch_friend_list(self, req):
-        return await self.call_method('fetchFriendList', req)
+    async def fetch_friend_list(self, req, timeout=None, replay=True):
+        return await self.call_method('fetchFriendList', req, timeout=timeout, replay=replay)
 
-    async def fetch_friend_apply_list(self, req):
-        return await self.call_method('fetchFriendApplyList', req)
+    async def fetch_friend_apply_list(self, req, timeout=None, replay=True):
+        return await self.call_method('fetchFriendApplyList', req, timeout=timeout, replay=replay)
 
-    async def apply_friend(self, req):
-        return await self.call_method('applyFriend', req)
+    async def apply_friend(self, req, timeout=None, replay=True):
+        return await self.call_method('applyFriend', req, timeout=timeout, replay=replay)
 
-    async def handle_friend_apply(self, req):
-        return await self.call_method('handleFriendApply', req)
+    async def handle_friend_apply(self, req, timeout=None, replay=True):
+        return await self.call_method('handleFriendApply', req, timeout=timeout, replay=replay)
 
-    async def remove_friend(self, req):
-        return await self.call_method('removeFriend', req)
+    async def remove_friend(self, req, timeout=None, replay=True):
+        return await self.call_method('removeFriend', req, timeout=timeout, replay=replay)
 
-    async def search_account_by_id(self, req):
-        return await self.call_method('searchAccountById', req)
+    async def search_account_by_id(self, req, timeout=None, replay=True):
+        return await self.call_method('searchAccountById', req, timeout=timeout, replay=replay)
 
-    async def search_account_by_pattern(self, req):
-        return await self.call_method('searchAccountByPattern', req)
+    async def search_account_by_pattern(self, req, timeout=None, replay=True):
+        return await self.call_method('searchAccountByPattern', req, timeout=timeout, replay=replay)
 
-    async def fetch_account_state(self, req):
-        return await self.call_method('fetchAccountState', req)
+    async def fetch_account_state(self, req, timeout=None, replay=True):
+        return await self.call_method('fetchAccountState', req, timeout=timeout, replay=replay)
 
-    async def fetch_bag_info(self, req):
-        return await self.call_method('fetchBagInfo', req)
+    async def fetch_bag_info(self, req, timeout=None, replay=True):
+        return await self.call_method('fetchBagInfo', req, timeout=timeout, replay=replay)
 
-    async def use_bag_item(self, req):
-        return await self.call_method('useBagItem', req)
+    async def use_bag_item(self, req, timeout=None, replay=True):
+        return await self.call_method('useBagItem', req, timeout=timeout, replay=replay)
 
-    async def open_manual_item(self, req):
-        return await self.call_method('openManualItem', req)
+    async def open_manual_item(self, req, timeout=None, replay=True):
+        return await self.call_method('openManualItem', req, timeout=timeout, replay=replay)
 
-    async def open_random_reward_item(self, req):
-        return await self.call_method('openRandomRewardItem', req)
+    async def open_random_reward_item(self, req, timeout=None, replay=True):
+        return await self.call_method('openRandomRewardItem', req, timeout=timeout, replay=replay)
 
-    async def open_all_reward_item(self, req):
-        return await self.call_method('openAllRewardItem', req)
+    async def open_all_reward_item(self, req, timeout=None, replay=True):
+        return await self.call_method('openAllRewardItem', req, timeout=timeout, replay=replay)
 
-    async def compose_shard(self, req):
-        return await self.call_method('composeShard', req)
+    async def compose_shard(self, req, timeout=None, replay=True):
+        return await self.call_method('composeShard', req, timeout=timeout, replay=replay)
 
-    async def fetch_announcement(self, req):
-        return await self.call_method('fetchAnnouncement', req)
+    async def fetch_announcement(self, req, timeout=None, replay=True):
+        return await self.call_method('fetchAnnouncement', req, timeout=timeout, replay=replay)
 
-    async def read_announcement(self, req):
-        return await self.call_method('readAnnouncement', req)
+    async def read_announcement(self, req, timeout=None, replay=True):
+        return await self.call_method('readAnnouncement', req, timeout=timeout, replay=replay)
 
-    async def fetch_mail_info(self, req):
-        return await self.call_method('fetchMailInfo', req)
+    async def fetch_mail_info(self, req, timeout=None, replay=True):
+        return await self.call_method('fetchMailInfo', req, timeout=timeout, replay=replay)
 
-    async def read_mail(self, req):
-        return await self.call_method('readMail', req)
+    async def read_mail(self, req, timeout=None, replay=True):
+        return await self.call_method('readMail', req, timeout=timeout, replay=replay)
 
-    async def delete_mail(self, req):
-        return await self.call_method('deleteMail', req)
+    async def delete_mail(self, req, timeout=None, replay=True):
+        return await self.call_method('deleteMail', req, timeout=timeout, replay=replay)
 
-    async def take_attachment_from_mail(self, req):
-        return await self.call_method('takeAttachmentFromMail', req)
+    async def take_attachment_from_mail(self, req, timeout=None, replay=True):
+        return await self.call_method('takeAttachmentFromMail', req, timeout=timeout, replay=replay)
 
-    async def receive_achievement_reward(self, req):
-        return await self.call_method('receiveAchievementReward', req)
+    async def receive_achievement_reward(self, req, timeout=None, replay=True):
+        return await self.call_method('receiveAchievementReward', req, timeout=timeout, replay=replay)
 
-    async def receive_achievement_group_reward(self, req):
-        return await self.call_method('receiveAchievementGroupReward', req)
+    async def receive_achievement_group_reward(self, req, timeout=None, replay=True):
+        return await self.call_method('receiveAchievementGroupReward', req, timeout=timeout, replay=replay)
 
-    async def fetch_achievement_rate(self, req):
-        return await self.call_method('fetchAchievementRate', req)
+    async def fetch_achievement_rate(self, req, timeout=None, replay=True):
+        return await self.call_method('fetchAchievementRate', req, timeout=timeout, replay=replay)
 
-    async def fetch_achievement(self, req):
-        return await self.call_method('fetchAchievement', req)
+    async def fetch_achievement(self, req, timeout=None, replay=True):
+        return await self.call_method('fetchAchievement', req, timeout=timeout, replay=replay)
 
-    async def buy_shi_lian(self, req):
-        return await self.call_method('buyShiLian', req)
+    async def buy_shi_lian(self, req, timeout=None, replay=True):
+        return await self.call_method('buyShiLian', req, timeout=timeout, replay=replay)
 
-    async def match_shi_lian(self, req):
-        return await self.call_method('matchShiLian', req)
+    async def match_shi_lian(self, req, timeout=None, replay=True):
+        return await self.call_method('matchShiLian', req, timeout=timeout, replay=replay)
 
-    async def go_next_shi_lian(self, req):
-        return await self.call_method('goNextShiLian', req)
+    async def go_next_shi_lian(self, req, timeout=None, replay=True):
+        return await self.call_method('goNextShiLian', req, timeout=timeout, replay=replay)
 
-    async def update_client_value(self, req):
-        return await self.call_method('updateClientValue', req)
+    async def update_client_value(self, req, timeout=None, replay=True):
+        return await self.call_method('updateClientValue', req, timeout=timeout, replay=replay)
 
-    async def fetch_client_value(self, req):
-        return await self.call_method('fetchClientValue', req)
+    async def fetch_client_value(self, req, timeout=None, replay=True):
+        return await self.call_method('fetchClientValue', req, timeout=timeout, replay=replay)
 
-    async def client_message(self, req):
-        return await self.call_method('clientMessage', req)
+    async def client_message(self, req, timeout=None, replay=True):
+        return await self.call_method('clientMessage', req, timeout=timeout, replay=replay)
 
-    async def fetch_current_match_info(self, req):
-        return await self.call_method('fetchCurrentMatchInfo', req)
+    async def fetch_current_match_info(self, req, timeout=None, replay=True):
+        return await self.call_method('fetchCurrentMatchInfo', req, timeout=timeout, replay=replay)
 
-    async def user_complain(self, req):
-        return await self.call_method('userComplain', req)
+    async def user_complain(self, req, timeout=None, replay=True):
+        return await self.call_method('userComplain', req, timeout=timeout, replay=replay)
 
-    async def fetch_revive_coin_info(self, req):
-        return await self.call_method('fetchReviveCoinInfo', req)
+    async def fetch_revive_coin_info(self, req, timeout=None, replay=True):
+        return await self.call_method('fetchReviveCoinInfo', req, timeout=timeout, replay=replay)
 
-    async def gain_revive_coin(self, req):
-        return await self.call_method('gainReviveCoin', req)
+    async def gain_revive_coin(self, req, timeout=None, replay=True):
+        return await self.call_method('gainReviveCoin', req, timeout=timeout, replay=replay)
 
-    async def fetch_daily_task(self, req):
-        return await self.call_method('fetchDailyTask', req)
+    async def fetch_daily_task(self, req, timeout=None, replay=True):
+        return await self.call_method('fetchDailyTask', req, timeout=timeout, replay=replay)
 
-    async def refresh_daily_task(self, req):
-        return await self.call_method('refreshDailyTask', req)
+    async def refresh_daily_task(self, req, timeout=None, replay=True):
+        return await self.call_method('refreshDailyTask', req, timeout=timeout, replay=replay)
 
-    async def use_gift_code(self, req):
-        return await self.call_method('useGiftCode', req)
+    async def use_gift_code(self, req, timeout=None, replay=True):
+        return await self.call_method('useGiftCode', req, timeout=timeout, replay=replay)
 
-    async def use_special_gift_code(self, req):
-        return await self.call_method('useSpecialGiftCode', req)
+    async def use_special_gift_code(self, req, timeout=None, replay=True):
+        return await self.call_method('useSpecialGiftCode', req, timeout=timeout, replay=replay)
 
-    async def fetch_title_list(self, req):
-        return await self.call_method('fetchTitleList', req)
+    async def fetch_title_list(self, req, timeout=None, replay=True):
+        return await self.call_method('fetchTitleList', req, timeout=timeout, replay=replay)
 
-    async def use_title(self, req):
-        return await self.call_method('useTitle', req)
+    async def use_title(self, req, timeout=None, replay=True):
+        return await self.call_method('useTitle', req, timeout=timeout, replay=replay)
 
-    async def send_client_message(self, req):
-        return await self.call_method('sendClientMessage', req)
+    async def send_client_message(self, req, timeout=None, replay=True):
+        return await self.call_method('sendClientMessage', req, timeout=timeout, replay=replay)
 
-    async def fetch_game_live_info(self, req):
-        return await self.call_method('fetchGameLiveInfo', req)
+    async def fetch_game_live_info(self, req, timeout=None, replay=True):
+        return await self.call_method('fetchGameLiveInfo', req, timeout=timeout, replay=replay)
 
-    async def fetch_game_live_left_segment(self, req):
-        return await self.call_method('fetchGameLiveLeftSegment', req)
+    async def fetch_game_live_left_segment(self, req, timeout=None, replay=True):
+        return await self.call_method('fetchGameLiveLeftSegment', req, timeout=timeout, replay=replay)
 
-    async def fetch_game_live_list(self, req):
-        return await self.call_method('fetchGameLiveList', req)
+    async def fetch_game_live_list(self, req, timeout=None, replay=True):
+        return await self.call_method('fetchGameLiveList', req, timeout=timeout, replay=replay)
 
-    async def fetch_comment_setting(self, req):
-        return await self.call_method('fetchCommentSetting', req)
+    async def fetch_comment_setting(self, req, timeout=None, replay=True):
+        return await self.call_method('fetchCommentSetting', req, timeout=timeout, replay=replay)
 
-    async def update_comment_setting(self, req):
-        return await self.call_method('updateCommentSetting', req)
+    async def update_comment_setting(self, req, timeout=None, replay=True):
+        return await self.call_method('updateCommentSetting', req, timeout=timeout, replay=replay)
 
-    async def fetch_comment_list(self, req):
-        return await self.call_method('fetchCommentList', req)
+    async def fetch_comment_list(self, req, timeout=None, replay=True):
+        return await self.call_method('fetchCommentList', req, timeout=timeout, replay=replay)
 
-    async def fetch_comment_content(self, req):
-        return await self.call_method('fetchCommentContent', req)
+    async def fetch_comment_content(self, req, timeout=None, replay=True):
+        return await self.call_method('fetchCommentContent', req, timeout=timeout, replay=replay)
 
-    async def leave_comment(self, req):
-        return await self.call_method('leaveComment', req)
+    async def leave_comment(self, req, timeout=None, replay=True):
+        return await self.call_method('leaveComment', req, timeout=timeout, replay=replay)
 
-    async def delete_comment(self, req):
-        return await self.call_method('deleteComment', req)
+    async def delete_comment(self, req, timeout=None, replay=True):
+        return await self.call_method('deleteComment', req, timeout=timeout, replay=replay)
 
-    async def update_read_comment(self, req):
-        return await self.call_method('updateReadComment', req)
+    async def update_read_comment(self, req, timeout=None, replay=True):
+        return await self.call_method('updateReadComment', req, timeout=timeout, replay=replay)
 
-    async def fetch_rolling_notice(self, req):
-        return await self.call_method('fetchRollingNotice', req)
+    async def fetch_rolling_notice(self, req, timeout=None, replay=True):
+        return await self.call_method('fetchRollingNotice', req, timeout=timeout, replay=replay)
 
-    async def fetch_maintain_notice(self, req):
-        return await self.call_method('fetchMaintainNotice', req)
+    async def fetch_maintain_notice(self, req, timeout=None, replay=True):
+        return await self.call_method('fetchMaintainNotice', req, timeout=timeout, replay=replay)
 
-    async def fetch_server_time(self, req):
-        return await self.call_method('fetchServerTime', req)
+    async def fetch_server_time(self, req, timeout=None, replay=True):
+        return await self.call_method('fetchServerTime', req, timeout=timeout, replay=replay)
 
-    async def fetch_platform_products(self, req):
-        return await self.call_method('fetchPlatformProducts', req)
+    async def fetch_platform_products(self, req, timeout=None, replay=True):
+        return await self.call_method('fetchPlatformProducts', req, timeout=timeout, replay=replay)
 
-    async def fetch_random_character(self, req):
-        return await self.call_method('fetchRandomCharacter', req)
+    async def fetch_random_character(self, req, timeout=None, replay=True):
+        return await self.call_method('fetchRandomCharacter', req, timeout=timeout, replay=replay)
 
-    async def set_random_character(self, req):
-        return await self.call_method('setRandomCharacter', req)
+    async def set_random_character(self, req, timeout=None, replay=True):
+        return await self.call_method('setRandomCharacter', req, timeout=timeout, replay=replay)
 
-    async def cancel_google_play_order(self, req):
-        return await self.call_method('cancelGooglePlayOrder', req)
+    async def cancel_google_play_order(self, req, timeout=None, replay=True):
+        return await self.call_method('cancelGooglePlayOrder', req, timeout=timeout, replay=replay)
 
-    async def open_chest(self, req):
-        return await self.call_method('openChest', req)
+    async def open_chest(self, req, timeout=None, replay=True):
+        return await self.call_method('openChest', req, timeout=timeout, replay=replay)
 
-    async def buy_from_chest_shop(self, req):
-        return await self.call_method('buyFromChestShop', req)
+    async def buy_from_chest_shop(self, req, timeout=None, replay=True):
+        return await self.call_method('buyFromChestShop', req, timeout=timeout, replay=replay)
 
-    async def fetch_daily_sign_in_info(self, req):
-        return await self.call_method('fetchDailySignInInfo', req)
+    async def fetch_daily_sign_in_info(self, req, timeout=None, replay=True):
+        return await self.call_method('fetchDailySignInInfo', req, timeout=timeout, replay=replay)
 
-    async def do_daily_sign_in(self, req):
-        return await self.call_method('doDailySignIn', req)
+    async def do_daily_sign_in(self, req, timeout=None, replay=True):
+        return await self.call_method('doDailySignIn', req, timeout=timeout, replay=replay)
 
-    async def do_activity_sign_in(self, req):
-        return await self.call_method('doActivitySignIn', req)
+    async def do_activity_sign_in(self, req, timeout=None, replay=True):
+        return await self.call_method('doActivitySignIn', req, timeout=timeout, replay=replay)
 
-    async def fetch_character_info(self, req):
-        return await self.call_method('fetchCharacterInfo', req)
+    async def fetch_character_info(self, req, timeout=None, replay=True):
+        return await self.call_method('fetchCharacterInfo', req, timeout=timeout, replay=replay)
 
-    async def update_character_sort(self, req):
-        return await self.call_method('updateCharacterSort', req)
+    async def update_character_sort(self, req, timeout=None, replay=True):
+        return await self.call_method('updateCharacterSort', req, timeout=timeout, replay=replay)
 
-    async def change_main_character(self, req):
-        return await self.call_method('changeMainCharacter', req)
+    async def change_main_character(self, req, timeout=None, replay=True):
+        return await self.call_method('changeMainCharacter', req, timeout=timeout, replay=replay)
 
-    async def change_character_skin(self, req):
-        return await self.call_method('changeCharacterSkin', req)
+    async def change_character_skin(self, req, timeout=None, replay=True):
+        return await self.call_method('changeCharacterSkin', req, timeout=timeout, replay=replay)
 
-    async def change_character_view(self, req):
-        return await self.call_method('changeCharacterView', req)
+    async def change_character_view(self, req, timeout=None, replay=True):
+        return await self.call_method('changeCharacterView', req, timeout=timeout, replay=replay)
 
-    async def set_hidden_character(self, req):
-        return await self.call_method('setHiddenCharacter', req)
+    async def set_hidden_character(self, req, timeout=None, replay=True):
+        return await self.call_method('setHiddenCharacter', req, timeout=timeout, replay=replay)
 
-    async def send_gift_to_character(self, req):
-        return await self.call_method('sendGiftToCharacter', req)
+    async def send_gift_to_character(self, req, timeout=None, replay=True):
+        return await self.call_method('sendGiftToCharacter', req, timeout=timeout, replay=replay)
 
-    async def sell_item(self, req):
-        return await self.call_method('sellItem', req)
+    async def sell_item(self, req, timeout=None, replay=True):
+        return await self.call_method('sellItem', req, timeout=timeout, replay=replay)
 
-    async def fetch_common_view(self, req):
-        return await self.call_method('fetchCommonView', req)
+    async def fetch_common_view(self, req, timeout=None, replay=True):
+        return await self.call_method('fetchCommonView', req, timeout=timeout, replay=replay)
 
-    async def change_common_view(self, req):
-        return await self.call_method('changeCommonView', req)
+    async def change_common_view(self, req, timeout=None, replay=True):
+        return await self.call_method('changeCommonView', req, timeout=timeout, replay=replay)
 
-    async def save_common_views(self, req):
-        return await self.call_method('saveCommonViews', req)
+    async def save_common_views(self, req, timeout=None, replay=True):
+        return await self.call_method('saveCommonViews', req, timeout=timeout, replay=replay)
 
-    async def fetch_common_views(self, req):
-        return await self.call_method('fetchCommonViews', req)
+    async def fetch_common_views(self, req, timeout=None, replay=True):
+        return await self.call_method('fetchCommonViews', req, timeout=timeout, replay=replay)
 
-    async def fetch_all_common_views(self, req):
-        return await self.call_method('fetchAllCommonViews', req)
+    async def fetch_all_common_views(self, req, timeout=None, replay=True):
+        return await self.call_method('fetchAllCommonViews', req, timeout=timeout, replay=replay)
 
-    async def use_common_view(self, req):
-        return await self.call_method('useCommonView', req)
+    async def use_common_view(self, req, timeout=None, replay=True):
+        return await self.call_method('useCommonView', req, timeout=timeout, replay=replay)
 
-    async def upgrade_character(self, req):
-        return await self.call_method('upgradeCharacter', req)
+    async def upgrade_character(self, req, timeout=None, replay=True):
+        return await self.call_method('upgradeCharacter', req, timeout=timeout, replay=replay)
 
-    async def add_finished_ending(self, req):
-        return await self.call_method('addFinishedEnding', req)
+    async def add_finished_ending(self, req, timeout=None, replay=True):
+        return await self.call_method('addFinishedEnding', req, timeout=timeout, replay=replay)
 
-    async def receive_ending_reward(self, req):
-        return await self.call_method('receiveEndingReward', req)
+    async def receive_ending_reward(self, req, timeout=None, replay=True):
+        return await self.call_method('receiveEndingReward', req, timeout=timeout, replay=replay)
 
-    async def game_master_command(self, req):
-        return await self.call_method('gameMasterCommand', req)
+    async def game_master_command(self, req, timeout=None, replay=True):
+        return await self.call_method('gameMasterCommand', req, timeout=timeout, replay=replay)
 
-    async def fetch_shop_info(self, req):
-        return await self.call_method('fetchShopInfo', req)
+    async def fetch_shop_info(self, req, timeout=None, replay=True):
+        return await self.call_method('fetchShopInfo', req, timeout=timeout, replay=replay)
 
-    async def buy_from_shop(self, req):
-        return await self.call_method('buyFromShop', req)
+    async def buy_from_shop(self, req, timeout=None, replay=True):
+        return await self.call_method('buyFromShop', req, timeout=timeout, replay=replay)
 
-    async def buy_from_zhp(self, req):
-        return await self.call_method('buyFromZHP', req)
+    async def buy_from_zhp(self, req, timeout=None, replay=True):
+        return await self.call_method('buyFromZHP', req, timeout=timeout, replay=replay)
 
-    async def refresh_zhp_shop(self, req):
-        return await self.call_method('refreshZHPShop', req)
+    async def refresh_zhp_shop(self, req, timeout=None, replay=True):
+        return await self.call_method('refreshZHPShop', req, timeout=timeout, replay=replay)
 
-    async def fetch_month_ticket_info(self, req):
-        return await self.call_method('fetchMonthTicketInfo', req)
+    async def fetch_month_ticket_info(self, req, timeout=None, replay=True):
+        return await self.call_method('fetchMonthTicketInfo', req, timeout=timeout, replay=replay)
 
-    async def pay_month_ticket(self, req):
-        return await self.call_method('payMonthTicket', req)
+    async def pay_month_ticket(self, req, timeout=None, replay=True):
+        return await self.call_method('payMonthTicket', req, timeout=timeout, replay=replay)
 
-    async def exchange_currency(self, req):
-        return await self.call_method('exchangeCurrency', req)
+    async def exchange_currency(self, req, timeout=None, replay=True):
+        return await self.call_method('exchangeCurrency', req, timeout=timeout, replay=replay)
 
-    async def exchange_chest_stone(self, req):
-        return await self.call_method('exchangeChestStone', req)
+    async def exchange_chest_stone(self, req, timeout=None, replay=True):
+        return await self.call_method('exchangeChestStone', req, timeout=timeout, replay=replay)
 
-    async def exchange_diamond(self, req):
-        return await self.call_method('exchangeDiamond', req)
+    async def exchange_diamond(self, req, timeout=None, replay=True):
+        return await self.call_method('exchangeDiamond', req, timeout=timeout, replay=replay)
 
-    async def fetch_server_settings(self, req):
-        return await self.call_method('fetchServerSettings', req)
+    async def fetch_server_settings(self, req, timeout=None, replay=True):
+        return await self.call_method('fetchServerSettings', req, timeout=timeout, replay=replay)
 
-    async def fetch_account_settings(self, req):
-        return await self.call_method('fetchAccountSettings', req)
+    async def fetch_account_settings(self, req, timeout=None, replay=True):
+        return await self.call_method('fetchAccountSettings', req, timeout=timeout, replay=replay)
 
-    async def update_account_settings(self, req):
-        return await self.call_method('updateAccountSettings', req)
+    async def update_account_settings(self, req, timeout=None, replay=True):
+        return await self.call_method('updateAccountSettings', req, timeout=timeout, replay=replay)
 
-    async def fetch_mod_nickname_time(self, req):
-        return await self.call_method('fetchModNicknameTime', req)
+    async def fetch_mod_nickname_time(self, req, timeout=None, replay=True):
+        return await self.call_method('fetchModNicknameTime', req, timeout=timeout, replay=replay)
 
-    async def create_wechat_native_order(self, req):
-        return await self.call_method('createWechatNativeOrder', req)
+    async def create_wechat_native_order(self, req, timeout=None, replay=True):
+        return await self.call_method('createWechatNativeOrder', req, timeout=timeout, replay=replay)
 
-    async def create_wechat_app_order(self, req):
-        return await self.call_method('createWechatAppOrder', req)
+    async def create_wechat_app_order(self, req, timeout=None, replay=True):
+        return await self.call_method('createWechatAppOrder', req, timeout=timeout, replay=replay)
 
-    async def create_alipay_order(self, req):
-        return await self.call_method('createAlipayOrder', req)
+    async def create_alipay_order(self, req, timeout=None, replay=True):
+        return await self.call_method('createAlipayOrder', req, timeout=timeout, replay=replay)
 
-    async def create_alipay_scan_order(self, req):
-        return await self.call_method('createAlipayScanOrder', req)
+    async def create_alipay_scan_order(self, req, timeout=None, replay=True):
+        return await self.call_method('createAlipayScanOrder', req, timeout=timeout, replay=replay)
 
-    async def create_alipay_app_order(self, req):
-        return await self.call_method('createAlipayAppOrder', req)
+    async def create_alipay_app_order(self, req, timeout=None, replay=True):
+        return await self.call_method('createAlipayAppOrder', req, timeout=timeout, replay=replay)
 
-    async def create_jp_credit_card_order(self, req):
-        return await self.call_method('createJPCreditCardOrder', req)
+    async def create_jp_credit_card_order(self, req, timeout=None, replay=True):
+        return await self.call_method('createJPCreditCardOrder', req, timeout=timeout, replay=replay)
 
-    async def create_jp_paypal_order(self, req):
-        return await self.call_method('createJPPaypalOrder', req)
+    async def create_jp_paypal_order(self, req, timeout=None, replay=True):
+        return await self.call_method('createJPPaypalOrder', req, timeout=timeout, replay=replay)
 
-    async def create_jp_au_order(self, req):
-        return await self.call_method('createJPAuOrder', req)
+    async def create_jp_au_order(self, req, timeout=None, replay=True):
+        return await self.call_method('createJPAuOrder', req, timeout=timeout, replay=replay)
 
-    async def create_jp_docomo_order(self, req):
-        return await self.call_method('createJPDocomoOrder', req)
+    async def create_jp_docomo_order(self, req, timeout=None, replay=True):
+        return await self.call_method('createJPDocomoOrder', req, timeout=timeout, replay=replay)
 
-    async def create_jp_web_money_order(self, req):
-        return await self.call_method('createJPWebMoneyOrder', req)
+    async def create_jp_web_money_order(self, req, timeout=None, replay=True):
+        return await self.call_method('createJPWebMoneyOrder', req, timeout=timeout, replay=replay)
 
-    async def create_jp_softbank_order(self, req):
-        return await self.call_method('createJPSoftbankOrder', req)
+    async def create_jp_softbank_order(self, req, timeout=None, replay=True):
+        return await self.call_method('createJPSoftbankOrder', req, timeout=timeout, replay=replay)
 
-    async def create_jp_pay_pay_order(self, req):
-        return await self.call_method('createJPPayPayOrder', req)
+    async def create_jp_pay_pay_order(self, req, timeout=None, replay=True):
+        return await self.call_method('createJPPayPayOrder', req, timeout=timeout, replay=replay)
 
-    async def fetch_jp_common_credit_card_order(self, req):
-        return await self.call_method('fetchJPCommonCreditCardOrder', req)
+    async def fetch_jp_common_credit_card_order(self, req, timeout=None, replay=True):
+        return await self.call_method('fetchJPCommonCreditCardOrder', req, timeout=timeout, replay=replay)
 
-    async def create_jpgmo_order(self, req):
-        return await self.call_method('createJPGMOOrder', req)
+    async def create_jpgmo_order(self, req, timeout=None, replay=True):
+        return await self.call_method('createJPGMOOrder', req, timeout=timeout, replay=replay)
 
-    async def create_en_paypal_order(self, req):
-        return await self.call_method('createENPaypalOrder', req)
+    async def create_en_paypal_order(self, req, timeout=None, replay=True):
+        return await self.call_method('createENPaypalOrder', req, timeout=timeout, replay=replay)
 
-    async def create_en_master_card_order(self, req):
-        return await self.call_method('createENMasterCardOrder', req)
+    async def create_en_master_card_order(self, req, timeout=None, replay=True):
+        return await self.call_method('createENMasterCardOrder', req, timeout=timeout, replay=replay)
 
-    async def create_en_visa_order(self, req):
-        return await self.call_method('createENVisaOrder', req)
+    async def create_en_visa_order(self, req, timeout=None, replay=True):
+        return await self.call_method('createENVisaOrder', req, timeout=timeout, replay=replay)
 
-    async def create_enjcb_order(self, req):
-        return await self.call_method('createENJCBOrder', req)
+    async def create_enjcb_order(self, req, timeout=None, replay=True):
+        return await self.call_method('createENJCBOrder', req, timeout=timeout, replay=replay)
 
-    async def create_en_alipay_order(self, req):
-        return await self.call_method('createENAlipayOrder', req)
+    async def create_en_alipay_order(self, req, timeout=None, replay=True):
+        return await self.call_method('createENAlipayOrder', req, timeout=timeout, replay=replay)
 
-    async def create_kr_paypal_order(self, req):
-        return await self.call_method('createKRPaypalOrder', req)
+    async def create_kr_paypal_order(self, req, timeout=None, replay=True):
+        return await self.call_method('createKRPaypalOrder', req, timeout=timeout, replay=replay)
 
-    async def create_kr_master_card_order(self, req):
-        return await self.call_method('createKRMasterCardOrder', req)
+    async def create_kr_master_card_order(self, req, timeout=None, replay=True):
+        return await self.call_method('createKRMasterCardOrder', req, timeout=timeout, replay=replay)
 
-    async def create_kr_visa_order(self, req):
-        return await self.call_method('createKRVisaOrder', req)
+    async def create_kr_visa_order(self, req, timeout=None, replay=True):
+        return await self.call_method('createKRVisaOrder', req, timeout=timeout, replay=replay)
 
-    async def create_krjcb_order(self, req):
-        return await self.call_method('createKRJCBOrder', req)
+    async def create_krjcb_order(self, req, timeout=None, replay=True):
+        return await self.call_method('createKRJCBOrder', req, timeout=timeout, replay=replay)
 
-    async def create_kr_alipay_order(self, req):
-        return await self.call_method('createKRAlipayOrder', req)
+    async def create_kr_alipay_order(self, req, timeout=None, replay=True):
+        return await self.call_method('createKRAlipayOrder', req, timeout=timeout, replay=replay)
 
-    async def create_dmm_order(self, req):
-        return await self.call_method('createDMMOrder', req)
+    async def create_dmm_order(self, req, timeout=None, replay=True):
+        return await self.call_method('createDMMOrder', req, timeout=timeout, replay=replay)
 
-    async def create_iap_order(self, req):
-        return await self.call_method('createIAPOrder', req)
+    async def create_iap_order(self, req, timeout=None, replay=True):
+        return await self.call_method('createIAPOrder', req, timeout=timeout, replay=replay)
 
-    async def create_steam_order(self, req):
-        return await self.call_method('createSteamOrder', req)
+    async def create_steam_order(self, req, timeout=None, replay=True):
+        return await self.call_method('createSteamOrder', req, timeout=timeout, replay=replay)
 
-    async def verify_steam_order(self, req):
-        return await self.call_method('verifySteamOrder', req)
+    async def verify_steam_order(self, req, timeout=None, replay=True):
+        return await self.call_method('verifySteamOrder', req, timeout=timeout, replay=replay)
 
-    async def create_my_card_android_order(self, req):
-        return await self.call_method('createMyCardAndroidOrder', req)
+    async def create_my_card_android_order(self, req, timeout=None, replay=True):
+        return await self.call_method('createMyCardAndroidOrder', req, timeout=timeout, replay=replay)
 
-    async def create_my_card_web_order(self, req):
-        return await self.call_method('createMyCardWebOrder', req)
+    async def create_my_card_web_order(self, req, timeout=None, replay=True):
+        return await self.call_method('createMyCardWebOrder', req, timeout=timeout, replay=replay)
 
-    async def create_paypal_order(self, req):
-        return await self.call_method('createPaypalOrder', req)
+    async def create_paypal_order(self, req, timeout=None, replay=True):
+        return await self.call_method('createPaypalOrder', req, timeout=timeout, replay=replay)
 
-    async def create_xsolla_order(self, req):
-        return await self.call_method('createXsollaOrder', req)
+    async def create_xsolla_order(self, req, timeout=None, replay=True):
+        return await self.call_method('createXsollaOrder', req, timeout=timeout, replay=replay)
 
-    async def create_xsolla_v4_order(self, req):
-        return await self.call_method('createXsollaV4Order', req)
+    async def create_xsolla_v4_order(self, req, timeout=None, replay=True):
+        return await self.call_method('createXsollaV4Order', req, timeout=timeout, replay=replay)
 
-    async def verify_my_card_order(self, req):
-        return await self.call_method('verifyMyCardOrder', req)
+    async def verify_my_card_order(self, req, timeout=None, replay=True):
+        return await self.call_method('verifyMyCardOrder', req, timeout=timeout, replay=replay)
 
-    async def verification_iap_order(self, req):
-        return await self.call_method('verificationIAPOrder', req)
+    async def verification_iap_order(self, req, timeout=None, replay=True):
+        return await self.call_method('verificationIAPOrder', req, timeout=timeout, replay=replay)
 
-    async def create_yostar_sdk_order(self, req):
-        return await self.call_method('createYostarSDKOrder', req)
+    async def create_yostar_sdk_order(self, req, timeout=None, replay=True):
+        return await self.call_method('createYostarSDKOrder', req, timeout=timeout, replay=replay)
 
-    async def create_billing_order(self, req):
-        return await self.call_method('createBillingOrder', req)
+    async def create_billing_order(self, req, timeout=None, replay=True):
+        return await self.call_method('createBillingOrder', req, timeout=timeout, replay=replay)
 
-    async def solve_google_play_order(self, req):
-        return await self.call_method('solveGooglePlayOrder', req)
+    async def solve_google_play_order(self, req, timeout=None, replay=True):
+        return await self.call_method('solveGooglePlayOrder', req, timeout=timeout, replay=replay)
 
-    async def solve_google_pay_order_v3(self, req):
-        return await self.call_method('solveGooglePayOrderV3', req)
+    async def solve_google_pay_order_v3(self, req, timeout=None, replay=True):
+        return await self.call_method('solveGooglePayOrderV3', req, timeout=timeout, replay=replay)
 
-    async def deliver_aa32_order(self, req):
-        return await self.call_method('deliverAA32Order', req)
+    async def deliver_aa32_order(self, req, timeout=None, replay=True):
+        return await self.call_method('deliverAA32Order', req, timeout=timeout, replay=replay)
 
-    async def fetch_misc(self, req):
-        return await self.call_method('fetchMisc', req)
+    async def fetch_misc(self, req, timeout=None, replay=True):
+        return await self.call_method('fetchMisc', req, timeout=timeout, replay=replay)
 
-    async def modify_signature(self, req):
-        return await self.call_method('modifySignature', req)
+    async def modify_signature(self, req, timeout=None, replay=True):
+        return await self.call_method('modifySignature', req, timeout=timeout, replay=replay)
 
-    async def fetch_id_card_info(self, req):
-        return await self.call_method('fetchIDCardInfo', req)
+    async def fetch_id_card_info(self, req, timeout=None, replay=True):
+        return await self.call_method('fetchIDCardInfo', req, timeout=timeout, replay=replay)
 
-    async def update_id_card_info(self, req):
-        return await self.call_method('updateIDCardInfo', req)
+    async def update_id_card_info(self, req, timeout=None, replay=True):
+        return await self.call_method('updateIDCardInfo', req, timeout=timeout, replay=replay)
 
-    async def fetch_vip_reward(self, req):
-        return await self.call_method('fetchVipReward', req)
+    async def fetch_vip_reward(self, req, timeout=None, replay=True):
+        return await self.call_method('fetchVipReward', req, timeout=timeout, replay=replay)
 
-    async def gain_vip_reward(self, req):
-        return await self.call_method('gainVipReward', req)
+    async def gain_vip_reward(self, req, timeout=None, replay=True):
+        return await self.call_method('gainVipReward', req, timeout=timeout, replay=replay)
 
-    async def fetch_refund_order(self, req):
-        return await self.call_method('fetchRefundOrder', req)
+    async def fetch_refund_order(self, req, timeout=None, replay=True):
+        return await self.call_method('fetchRefundOrder', req, timeout=timeout, replay=replay)
 
-    async def fetch_customized_contest_list(self, req):
-        return await self.call_method('fetchCustomizedContestList', req)
+    async def fetch_customized_contest_list(self, req, timeout=None, replay=True):
+        return await self.call_method('fetchCustomizedContestList', req, timeout=timeout, replay=replay)
 
-    async def fetch_customized_contest_auth_info(self, req):
-        return await self.call_method('fetchCustomizedContestAuthInfo', req)
+    async def fetch_customized_contest_auth_info(self, req, timeout=None, replay=True):
+        return await self.call_method('fetchCustomizedContestAuthInfo', req, timeout=timeout, replay=replay)
 
-    async def enter_customized_contest(self, req):
-        return await self.call_method('enterCustomizedContest', req)
+    async def enter_customized_contest(self, req, timeout=None, replay=True):
+        return await self.call_method('enterCustomizedContest', req, timeout=timeout, replay=replay)
 
-    async def leave_customized_contest(self, req):
-        return await self.call_method('leaveCustomizedContest', req)
+    async def leave_customized_contest(self, req, timeout=None, replay=True):
+        return await self.call_method('leaveCustomizedContest', req, timeout=timeout, replay=replay)
 
-    async def fetch_customized_contest_online_info(self, req):
-        return await self.call_method('fetchCustomizedContestOnlineInfo', req)
+    async def fetch_customized_contest_online_info(self, req, timeout=None, replay=True):
+        return await self.call_method('fetchCustomizedContestOnlineInfo', req, timeout=timeout, replay=replay)
 
-    async def fetch_customized_contest_by_contest_id(self, req):
-        return await self.call_method('fetchCustomizedContestByContestId', req)
+    async def fetch_customized_contest_by_contest_id(self, req, timeout=None, replay=True):
+        return await self.call_method('fetchCustomizedContestByContestId', req, timeout=timeout, replay=replay)
 
-    async def signup_customized_contest(self, req):
-        return await self.call_method('signupCustomizedContest', req)
+    async def signup_customized_contest(self, req, timeout=None, replay=True):
+        return await self.call_method('signupCustomizedContest', req, timeout=timeout, replay=replay)
 
-    async def start_customized_contest(self, req):
-        return await self.call_method('startCustomizedContest', req)
+    async def start_customized_contest(self, req, timeout=None, replay=True):
+        return await self.call_method('startCustomizedContest', req, timeout=timeout, replay=replay)
 
-    async def stop_customized_contest(self, req):
-        return await self.call_method('stopCustomizedContest', req)
+    async def stop_customized_contest(self, req, timeout=None, replay=True):
+        return await self.call_method('stopCustomizedContest', req, timeout=timeout, replay=replay)
 
-    async def join_customized_contest_chat_room(self, req):
-        return await self.call_method('joinCustomizedContestChatRoom', req)
+    async def join_customized_contest_chat_room(self, req, timeout=None, replay=True):
+        return await self.call_method('joinCustomizedContestChatRoom', req, timeout=timeout, replay=replay)
 
-    async def leave_customized_contest_chat_room(self, req):
-        return await self.call_method('leaveCustomizedContestChatRoom', req)
+    async def leave_customized_contest_chat_room(self, req, timeout=None, replay=True):
+        return await self.call_method('leaveCustomizedContestChatRoom', req, timeout=timeout, replay=replay)
 
-    async def say_chat_message(self, req):
-        return await self.call_method('sayChatMessage', req)
+    async def say_chat_message(self, req, timeout=None, replay=True):
+        return await self.call_method('sayChatMessage', req, timeout=timeout, replay=replay)
 
-    async def fetch_customized_contest_game_records(self, req):
-        return await self.call_method('fetchCustomizedContestGameRecords', req)
+    async def fetch_customized_contest_game_records(self, req, timeout=None, replay=True):
+        return await self.call_method('fetchCustomizedContestGameRecords', req, timeout=timeout, replay=replay)
 
-    async def fetch_customized_contest_game_live_list(self, req):
-        return await self.call_method('fetchCustomizedContestGameLiveList', req)
+    async def fetch_customized_contest_game_live_list(self, req, timeout=None, replay=True):
+        return await self.call_method('fetchCustomizedContestGameLiveList', req, timeout=timeout, replay=replay)
 
-    async def follow_customized_contest(self, req):
-        return await self.call_method('followCustomizedContest', req)
+    async def follow_customized_contest(self, req, timeout=None, replay=True):
+        return await self.call_method('followCustomizedContest', req, timeout=timeout, replay=replay)
 
-    async def unfollow_customized_contest(self, req):
-        return await self.call_method('unfollowCustomizedContest', req)
+    async def unfollow_customized_contest(self, req, timeout=None, replay=True):
+        return await self.call_method('unfollowCustomizedContest', req, timeout=timeout, replay=replay)
 
-    async def fetch_activity_list(self, req):
-        return await self.call_method('fetchActivityList', req)
+    async def fetch_activity_list(self, req, timeout=None, replay=True):
+        return await self.call_method('fetchActivityList', req, timeout=timeout, replay=replay)
 
-    async def fetch_account_activity_data(self, req):
-        return await self.call_method('fetchAccountActivityData', req)
+    async def fetch_account_activity_data(self, req, timeout=None, replay=True):
+        return await self.call_method('fetchAccountActivityData', req, timeout=timeout, replay=replay)
 
-    async def exchange_activity_item(self, req):
-        return await self.call_method('exchangeActivityItem', req)
+    async def exchange_activity_item(self, req, timeout=None, replay=True):
+        return await self.call_method('exchangeActivityItem', req, timeout=timeout, replay=replay)
 
-    async def complete_activity_task(self, req):
-        return await self.call_method('completeActivityTask', req)
+    async def complete_activity_task(self, req, timeout=None, replay=True):
+        return await self.call_method('completeActivityTask', req, timeout=timeout, replay=replay)
 
-    async def complete_activity_task_batch(self, req):
-        return await self.call_method('completeActivityTaskBatch', req)
+    async def complete_activity_task_batch(self, req, timeout=None, replay=True):
+        return await self.call_method('completeActivityTaskBatch', req, timeout=timeout, replay=replay)
 
-    async def complete_activity_flip_task(self, req):
-        return await self.call_method('completeActivityFlipTask', req)
+    async def complete_activity_flip_task(self, req, timeout=None, replay=True):
+        return await self.call_method('completeActivityFlipTask', req, timeout=timeout, replay=replay)
 
-    async def complete_period_activity_task(self, req):
-        return await self.call_method('completePeriodActivityTask', req)
+    async def complete_period_activity_task(self, req, timeout=None, replay=True):
+        return await self.call_method('completePeriodActivityTask', req, timeout=timeout, replay=replay)
 
-    async def complete_period_activity_task_batch(self, req):
-        return await self.call_method('completePeriodActivityTaskBatch', req)
+    async def complete_period_activity_task_batch(self, req, timeout=None, replay=True):
+        return await self.call_method('completePeriodActivityTaskBatch', req, timeout=timeout, replay=replay)
 
-    async def complete_random_activity_task(self, req):
-        return await self.call_method('completeRandomActivityTask', req)
+    async def complete_random_activity_task(self, req, timeout=None, replay=True):
+        return await self.call_method('completeRandomActivityTask', req, timeout=timeout, replay=replay)
 
-    async def complete_random_activity_task_batch(self, req):
-        return await self.call_method('completeRandomActivityTaskBatch', req)
+    async def complete_random_activity_task_batch(self, req, timeout=None, replay=True):
+        return await self.call_method('completeRandomActivityTaskBatch', req, timeout=timeout, replay=replay)
 
-    async def receive_activity_flip_task(self, req):
-        return await self.call_method('receiveActivityFlipTask', req)
+    async def receive_activity_flip_task(self, req, timeout=None, replay=True):
+        return await self.call_method('receiveActivityFlipTask', req, timeout=timeout, replay=replay)
 
-    async def complete_segment_task_reward(self, req):
-        return await self.call_method('completeSegmentTaskReward', req)
+    async def complete_segment_task_reward(self, req, timeout=None, replay=True):
+        return await self.call_method('completeSegmentTaskReward', req, timeout=timeout, replay=replay)
 
-    async def fetch_activity_flip_info(self, req):
-        return await self.call_method('fetchActivityFlipInfo', req)
+    async def fetch_activity_flip_info(self, req, timeout=None, replay=True):
+        return await self.call_method('fetchActivityFlipInfo', req, timeout=timeout, replay=replay)
 
-    async def gain_accumulated_point_activity_reward(self, req):
-        return await self.call_method('gainAccumulatedPointActivityReward', req)
+    async def gain_accumulated_point_activity_reward(self, req, timeout=None, replay=True):
+        return await self.call_method('gainAccumulatedPointActivityReward', req, timeout=timeout, replay=replay)
 
-    async def gain_multi_point_activity_reward(self, req):
-        return await self.call_method('gainMultiPointActivityReward', req)
+    async def gain_multi_point_activity_reward(self, req, timeout=None, replay=True):
+        return await self.call_method('gainMultiPointActivityReward', req, timeout=timeout, replay=replay)
 
-    async def fetch_rank_point_leaderboard(self, req):
-        return await self.call_method('fetchRankPointLeaderboard', req)
+    async def fetch_rank_point_leaderboard(self, req, timeout=None, replay=True):
+        return await self.call_method('fetchRankPointLeaderboard', req, timeout=timeout, replay=replay)
 
-    async def gain_rank_point_reward(self, req):
-        return await self.call_method('gainRankPointReward', req)
+    async def gain_rank_point_reward(self, req, timeout=None, replay=True):
+        return await self.call_method('gainRankPointReward', req, timeout=timeout, replay=replay)
 
-    async def richman_activity_next_move(self, req):
-        return await self.call_method('richmanActivityNextMove', req)
+    async def richman_activity_next_move(self, req, timeout=None, replay=True):
+        return await self.call_method('richmanActivityNextMove', req, timeout=timeout, replay=replay)
 
-    async def richman_acitivity_special_move(self, req):
-        return await self.call_method('richmanAcitivitySpecialMove', req)
+    async def richman_acitivity_special_move(self, req, timeout=None, replay=True):
+        return await self.call_method('richmanAcitivitySpecialMove', req, timeout=timeout, replay=replay)
 
-    async def richman_activity_chest_info(self, req):
-        return await self.call_method('richmanActivityChestInfo', req)
+    async def richman_activity_chest_info(self, req, timeout=None, replay=True):
+        return await self.call_method('richmanActivityChestInfo', req, timeout=timeout, replay=replay)
 
-    async def create_game_observe_auth(self, req):
-        return await self.call_method('createGameObserveAuth', req)
+    async def create_game_observe_auth(self, req, timeout=None, replay=True):
+        return await self.call_method('createGameObserveAuth', req, timeout=timeout, replay=replay)
 
-    async def refresh_game_observe_auth(self, req):
-        return await self.call_method('refreshGameObserveAuth', req)
+    async def refresh_game_observe_auth(self, req, timeout=None, replay=True):
+        return await self.call_method('refreshGameObserveAuth', req, timeout=timeout, replay=replay)
 
-    async def fetch_activity_buff(self, req):
-        return await self.call_method('fetchActivityBuff', req)
+    async def fetch_activity_buff(self, req, timeout=None, replay=True):
+        return await self.call_method('fetchActivityBuff', req, timeout=timeout, replay=replay)
 
-    async def upgrade_activity_buff(self, req):
-        return await self.call_method('upgradeActivityBuff', req)
+    async def upgrade_activity_buff(self, req, timeout=None, replay=True):
+        return await self.call_method('upgradeActivityBuff', req, timeout=timeout, replay=replay)
 
-    async def upgrade_activity_level(self, req):
-        return await self.call_method('upgradeActivityLevel', req)
+    async def upgrade_activity_level(self, req, timeout=None, replay=True):
+        return await self.call_method('upgradeActivityLevel', req, timeout=timeout, replay=replay)
 
-    async def receive_upgrade_activity_reward(self, req):
-        return await self.call_method('receiveUpgradeActivityReward', req)
+    async def receive_upgrade_activity_reward(self, req, timeout=None, replay=True):
+        return await self.call_method('receiveUpgradeActivityReward', req, timeout=timeout, replay=replay)
 
-    async def upgrade_challenge(self, req):
-        return await self.call_method('upgradeChallenge', req)
+    async def upgrade_challenge(self, req, timeout=None, replay=True):
+        return await self.call_method('upgradeChallenge', req, timeout=timeout, replay=replay)
 
-    async def refresh_challenge(self, req):
-        return await self.call_method('refreshChallenge', req)
+    async def refresh_challenge(self, req, timeout=None, replay=True):
+        return await self.call_method('refreshChallenge', req, timeout=timeout, replay=replay)
 
-    async def fetch_challenge_info(self, req):
-        return await self.call_method('fetchChallengeInfo', req)
+    async def fetch_challenge_info(self, req, timeout=None, replay=True):
+        return await self.call_method('fetchChallengeInfo', req, timeout=timeout, replay=replay)
 
-    async def force_complete_challenge_task(self, req):
-        return await self.call_method('forceCompleteChallengeTask', req)
+    async def force_complete_challenge_task(self, req, timeout=None, replay=True):
+        return await self.call_method('forceCompleteChallengeTask', req, timeout=timeout, replay=replay)
 
-    async def fetch_challenge_season(self, req):
-        return await self.call_method('fetchChallengeSeason', req)
+    async def fetch_challenge_season(self, req, timeout=None, replay=True):
+        return await self.call_method('fetchChallengeSeason', req, timeout=timeout, replay=replay)
 
-    async def receive_challenge_rank_reward(self, req):
-        return await self.call_method('receiveChallengeRankReward', req)
+    async def receive_challenge_rank_reward(self, req, timeout=None, replay=True):
+        return await self.call_method('receiveChallengeRankReward', req, timeout=timeout, replay=replay)
 
-    async def fetch_ab_match_info(self, req):
-        return await self.call_method('fetchABMatchInfo', req)
+    async def fetch_ab_match_info(self, req, timeout=None, replay=True):
+        return await self.call_method('fetchABMatchInfo', req, timeout=timeout, replay=replay)
 
-    async def buy_in_ab_match(self, req):
-        return await self.call_method('buyInABMatch', req)
+    async def buy_in_ab_match(self, req, timeout=None, replay=True):
+        return await self.call_method('buyInABMatch', req, timeout=timeout, replay=replay)
 
-    async def receive_ab_match_reward(self, req):
-        return await self.call_method('receiveABMatchReward', req)
+    async def receive_ab_match_reward(self, req, timeout=None, replay=True):
+        return await self.call_method('receiveABMatchReward', req, timeout=timeout, replay=replay)
 
-    async def quit_ab_match(self, req):
-        return await self.call_method('quitABMatch', req)
+    async def quit_ab_match(self, req, timeout=None, replay=True):
+        return await self.call_method('quitABMatch', req, timeout=timeout, replay=replay)
 
-    async def start_unified_match(self, req):
-        return await self.call_method('startUnifiedMatch', req)
+    async def start_unified_match(self, req, timeout=None, replay=True):
+        return await self.call_method('startUnifiedMatch', req, timeout=timeout, replay=replay)
 
-    async def cancel_unified_match(self, req):
-        return await self.call_method('cancelUnifiedMatch', req)
+    async def cancel_unified_match(self, req, timeout=None, replay=True):
+        return await self.call_method('cancelUnifiedMatch', req, timeout=timeout, replay=replay)
 
-    async def fetch_game_point_rank(self, req):
-        return await self.call_method('fetchGamePointRank', req)
+    async def fetch_game_point_rank(self, req, timeout=None, replay=True):
+        return await self.call_method('fetchGamePointRank', req, timeout=timeout, replay=replay)
 
-    async def fetch_self_game_point_rank(self, req):
-        return await self.call_method('fetchSelfGamePointRank', req)
+    async def fetch_self_game_point_rank(self, req, timeout=None, replay=True):
+        return await self.call_method('fetchSelfGamePointRank', req, timeout=timeout, replay=replay)
 
-    async def read_sns(self, req):
-        return await self.call_method('readSNS', req)
+    async def read_sns(self, req, timeout=None, replay=True):
+        return await self.call_method('readSNS', req, timeout=timeout, replay=replay)
 
-    async def reply_sns(self, req):
-        return await self.call_method('replySNS', req)
+    async def reply_sns(self, req, timeout=None, replay=True):
+        return await self.call_method('replySNS', req, timeout=timeout, replay=replay)
 
-    async def like_sns(self, req):
-        return await self.call_method('likeSNS', req)
+    async def like_sns(self, req, timeout=None, replay=True):
+        return await self.call_method('likeSNS', req, timeout=timeout, replay=replay)
 
-    async def dig_mine(self, req):
-        return await self.call_method('digMine', req)
+    async def dig_mine(self, req, timeout=None, replay=True):
+        return await self.call_method('digMine', req, timeout=timeout, replay=replay)
 
-    async def fetch_last_privacy(self, req):
-        return await self.call_method('fetchLastPrivacy', req)
+    async def fetch_last_privacy(self, req, timeout=None, replay=True):
+        return await self.call_method('fetchLastPrivacy', req, timeout=timeout, replay=replay)
 
-    async def check_privacy(self, req):
-        return await self.call_method('checkPrivacy', req)
+    async def check_privacy(self, req, timeout=None, replay=True):
+        return await self.call_method('checkPrivacy', req, timeout=timeout, replay=replay)
 
-    async def fetch_rpg_battle_history(self, req):
-        return await self.call_method('fetchRPGBattleHistory', req)
+    async def fetch_rpg_battle_history(self, req, timeout=None, replay=True):
+        return await self.call_method('fetchRPGBattleHistory', req, timeout=timeout, replay=replay)
 
-    async def fetch_rpg_battle_history_v2(self, req):
-        return await self.call_method('fetchRPGBattleHistoryV2', req)
+    async def fetch_rpg_battle_history_v2(self, req, timeout=None, replay=True):
+        return await self.call_method('fetchRPGBattleHistoryV2', req, timeout=timeout, replay=replay)
 
-    async def receive_rpg_rewards(self, req):
-        return await self.call_method('receiveRPGRewards', req)
+    async def receive_rpg_rewards(self, req, timeout=None, replay=True):
+        return await self.call_method('receiveRPGRewards', req, timeout=timeout, replay=replay)
 
-    async def receive_rpg_reward(self, req):
-        return await self.call_method('receiveRPGReward', req)
+    async def receive_rpg_reward(self, req, timeout=None, replay=True):
+        return await self.call_method('receiveRPGReward', req, timeout=timeout, replay=replay)
 
-    async def buy_arena_ticket(self, req):
-        return await self.call_method('buyArenaTicket', req)
+    async def buy_arena_ticket(self, req, timeout=None, replay=True):
+        return await self.call_method('buyArenaTicket', req, timeout=timeout, replay=replay)
 
-    async def enter_arena(self, req):
-        return await self.call_method('enterArena', req)
+    async def enter_arena(self, req, timeout=None, replay=True):
+        return await self.call_method('enterArena', req, timeout=timeout, replay=replay)
 
-    async def receive_arena_reward(self, req):
-        return await self.call_method('receiveArenaReward', req)
+    async def receive_arena_reward(self, req, timeout=None, replay=True):
+        return await self.call_method('receiveArenaReward', req, timeout=timeout, replay=replay)
 
-    async def fetch_ob_token(self, req):
-        return await self.call_method('fetchOBToken', req)
+    async def fetch_ob_token(self, req, timeout=None, replay=True):
+        return await self.call_method('fetchOBToken', req, timeout=timeout, replay=replay)
 
-    async def receive_character_rewards(self, req):
-        return await self.call_method('receiveCharacterRewards', req)
+    async def receive_character_rewards(self, req, timeout=None, replay=True):
+        return await self.call_method('receiveCharacterRewards', req, timeout=timeout, replay=replay)
 
-    async def feed_activity_feed(self, req):
-        return await self.call_method('feedActivityFeed', req)
+    async def feed_activity_feed(self, req, timeout=None, replay=True):
+        return await self.call_method('feedActivityFeed', req, timeout=timeout, replay=replay)
 
-    async def send_activity_gift_to_friend(self, req):
-        return await self.call_method('sendActivityGiftToFriend', req)
+    async def send_activity_gift_to_friend(self, req, timeout=None, replay=True):
+        return await self.call_method('sendActivityGiftToFriend', req, timeout=timeout, replay=replay)
 
-    async def receive_activity_gift(self, req):
-        return await self.call_method('receiveActivityGift', req)
+    async def receive_activity_gift(self, req, timeout=None, replay=True):
+        return await self.call_method('receiveActivityGift', req, timeout=timeout, replay=replay)
 
-    async def receive_all_activity_gift(self, req):
-        return await self.call_method('receiveAllActivityGift', req)
+    async def receive_all_activity_gift(self, req, timeout=None, replay=True):
+        return await self.call_method('receiveAllActivityGift', req, timeout=timeout, replay=replay)
 
-    async def fetch_friend_gift_activity_data(self, req):
-        return await self.call_method('fetchFriendGiftActivityData', req)
+    async def fetch_friend_gift_activity_data(self, req, timeout=None, replay=True):
+        return await self.call_method('fetchFriendGiftActivityData', req, timeout=timeout, replay=replay)
 
-    async def open_pre_chest_item(self, req):
-        return await self.call_method('openPreChestItem', req)
+    async def open_pre_chest_item(self, req, timeout=None, replay=True):
+        return await self.call_method('openPreChestItem', req, timeout=timeout, replay=replay)
 
-    async def fetch_vote_activity(self, req):
-        return await self.call_method('fetchVoteActivity', req)
+    async def fetch_vote_activity(self, req, timeout=None, replay=True):
+        return await self.call_method('fetchVoteActivity', req, timeout=timeout, replay=replay)
 
-    async def vote_activity(self, req):
-        return await self.call_method('voteActivity', req)
+    async def vote_activity(self, req, timeout=None, replay=True):
+        return await self.call_method('voteActivity', req, timeout=timeout, replay=replay)
 
-    async def unlock_activity_spot(self, req):
-        return await self.call_method('unlockActivitySpot', req)
+    async def unlock_activity_spot(self, req, timeout=None, replay=True):
+        return await self.call_method('unlockActivitySpot', req, timeout=timeout, replay=replay)
 
-    async def unlock_activity_spot_ending(self, req):
-        return await self.call_method('unlockActivitySpotEnding', req)
+    async def unlock_activity_spot_ending(self, req, timeout=None, replay=True):
+        return await self.call_method('unlockActivitySpotEnding', req, timeout=timeout, replay=replay)
 
-    async def receive_activity_spot_reward(self, req):
-        return await self.call_method('receiveActivitySpotReward', req)
+    async def receive_activity_spot_reward(self, req, timeout=None, replay=True):
+        return await self.call_method('receiveActivitySpotReward', req, timeout=timeout, replay=replay)
 
-    async def delete_account(self, req):
-        return await self.call_method('deleteAccount', req)
+    async def delete_account(self, req, timeout=None, replay=True):
+        return await self.call_method('deleteAccount', req, timeout=timeout, replay=replay)
 
-    async def cancel_delete_account(self, req):
-        return await self.call_method('cancelDeleteAccount', req)
+    async def cancel_delete_account(self, req, timeout=None, replay=True):
+        return await self.call_method('cancelDeleteAccount', req, timeout=timeout, replay=replay)
 
-    async def log_report(self, req):
-        return await self.call_method('logReport', req)
+    async def log_report(self, req, timeout=None, replay=True):
+        return await self.call_method('logReport', req, timeout=timeout, replay=replay)
 
-    async def bind_oauth2(self, req):
-        return await self.call_method('bindOauth2', req)
+    async def bind_oauth2(self, req, timeout=None, replay=True):
+        return await self.call_method('bindOauth2', req, timeout=timeout, replay=replay)
 
-    async def fetch_oauth2_info(self, req):
-        return await self.call_method('fetchOauth2Info', req)
+    async def fetch_oauth2_info(self, req, timeout=None, replay=True):
+        return await self.call_method('fetchOauth2Info', req, timeout=timeout, replay=replay)
 
-    async def set_loading_image(self, req):
-        return await self.call_method('setLoadingImage', req)
+    async def set_loading_image(self, req, timeout=None, replay=True):
+        return await self.call_method('setLoadingImage', req, timeout=timeout, replay=replay)
 
-    async def fetch_shop_interval(self, req):
-        return await self.call_method('fetchShopInterval', req)
+    async def fetch_shop_interval(self, req, timeout=None, replay=True):
+        return await self.call_method('fetchShopInterval', req, timeout=timeout, replay=replay)
 
-    async def fetch_activity_interval(self, req):
-        return await self.call_method('fetchActivityInterval', req)
+    async def fetch_activity_interval(self, req, timeout=None, replay=True):
+        return await self.call_method('fetchActivityInterval', req, timeout=timeout, replay=replay)
 
-    async def fetch_recent_friend(self, req):
-        return await self.call_method('fetchRecentFriend', req)
+    async def fetch_recent_friend(self, req, timeout=None, replay=True):
+        return await self.call_method('fetchRecentFriend', req, timeout=timeout, replay=replay)
 
-    async def open_gacha(self, req):
-        return await self.call_method('openGacha', req)
+    async def open_gacha(self, req, timeout=None, replay=True):
+        return await self.call_method('openGacha', req, timeout=timeout, replay=replay)
 
-    async def task_request(self, req):
-        return await self.call_method('taskRequest', req)
+    async def task_request(self, req, timeout=None, replay=True):
+        return await self.call_method('taskRequest', req, timeout=timeout, replay=replay)
 
-    async def simulation_activity_train(self, req):
-        return await self.call_method('simulationActivityTrain', req)
+    async def simulation_activity_train(self, req, timeout=None, replay=True):
+        return await self.call_method('simulationActivityTrain', req, timeout=timeout, replay=replay)
 
-    async def fetch_simulation_game_record(self, req):
-        return await self.call_method('fetchSimulationGameRecord', req)
+    async def fetch_simulation_game_record(self, req, timeout=None, replay=True):
+        return await self.call_method('fetchSimulationGameRecord', req, timeout=timeout, replay=replay)
 
-    async def start_simulation_activity_game(self, req):
-        return await self.call_method('startSimulationActivityGame', req)
+    async def start_simulation_activity_game(self, req, timeout=None, replay=True):
+        return await self.call_method('startSimulationActivityGame', req, timeout=timeout, replay=replay)
 
-    async def fetch_simulation_game_rank(self, req):
-        return await self.call_method('fetchSimulationGameRank', req)
+    async def fetch_simulation_game_rank(self, req, timeout=None, replay=True):
+        return await self.call_method('fetchSimulationGameRank', req, timeout=timeout, replay=replay)
 
-    async def generate_combining_craft(self, req):
-        return await self.call_method('generateCombiningCraft', req)
+    async def generate_combining_craft(self, req, timeout=None, replay=True):
+        return await self.call_method('generateCombiningCraft', req, timeout=timeout, replay=replay)
 
-    async def move_combining_craft(self, req):
-        return await self.call_method('moveCombiningCraft', req)
+    async def move_combining_craft(self, req, timeout=None, replay=True):
+        return await self.call_method('moveCombiningCraft', req, timeout=timeout, replay=replay)
 
-    async def combining_recycle_craft(self, req):
-        return await self.call_method('combiningRecycleCraft', req)
+    async def combining_recycle_craft(self, req, timeout=None, replay=True):
+        return await self.call_method('combiningRecycleCraft', req, timeout=timeout, replay=replay)
 
-    async def recover_combining_recycle(self, req):
-        return await self.call_method('recoverCombiningRecycle', req)
+    async def recover_combining_recycle(self, req, timeout=None, replay=True):
+        return await self.call_method('recoverCombiningRecycle', req, timeout=timeout, replay=replay)
 
-    async def finish_combining_order(self, req):
-        return await self.call_method('finishCombiningOrder', req)
+    async def finish_combining_order(self, req, timeout=None, replay=True):
+        return await self.call_method('finishCombiningOrder', req, timeout=timeout, replay=replay)
 
-    async def upgrade_village_building(self, req):
-        return await self.call_method('upgradeVillageBuilding', req)
+    async def upgrade_village_building(self, req, timeout=None, replay=True):
+        return await self.call_method('upgradeVillageBuilding', req, timeout=timeout, replay=replay)
 
-    async def receive_village_building_reward(self, req):
-        return await self.call_method('receiveVillageBuildingReward', req)
+    async def receive_village_building_reward(self, req, timeout=None, replay=True):
+        return await self.call_method('receiveVillageBuildingReward', req, timeout=timeout, replay=replay)
 
-    async def start_village_trip(self, req):
-        return await self.call_method('startVillageTrip', req)
+    async def start_village_trip(self, req, timeout=None, replay=True):
+        return await self.call_method('startVillageTrip', req, timeout=timeout, replay=replay)
 
-    async def receive_village_trip_reward(self, req):
-        return await self.call_method('receiveVillageTripReward', req)
+    async def receive_village_trip_reward(self, req, timeout=None, replay=True):
+        return await self.call_method('receiveVillageTripReward', req, timeout=timeout, replay=replay)
 
-    async def complete_village_task(self, req):
-        return await self.call_method('completeVillageTask', req)
+    async def complete_village_task(self, req, timeout=None, replay=True):
+        return await self.call_method('completeVillageTask', req, timeout=timeout, replay=replay)
 
-    async def get_friend_village_data(self, req):
-        return await self.call_method('getFriendVillageData', req)
+    async def get_friend_village_data(self, req, timeout=None, replay=True):
+        return await self.call_method('getFriendVillageData', req, timeout=timeout, replay=replay)
 
-    async def set_village_worker(self, req):
-        return await self.call_method('setVillageWorker', req)
+    async def set_village_worker(self, req, timeout=None, replay=True):
+        return await self.call_method('setVillageWorker', req, timeout=timeout, replay=replay)
 
-    async def next_round_village(self, req):
-        return await self.call_method('nextRoundVillage', req)
+    async def next_round_village(self, req, timeout=None, replay=True):
+        return await self.call_method('nextRoundVillage', req, timeout=timeout, replay=replay)
 
-    async def resolve_festival_activity_proposal(self, req):
-        return await self.call_method('resolveFestivalActivityProposal', req)
+    async def resolve_festival_activity_proposal(self, req, timeout=None, replay=True):
+        return await self.call_method('resolveFestivalActivityProposal', req, timeout=timeout, replay=replay)
 
-    async def resolve_festival_activity_event(self, req):
-        return await self.call_method('resolveFestivalActivityEvent', req)
+    async def resolve_festival_activity_event(self, req, timeout=None, replay=True):
+        return await self.call_method('resolveFestivalActivityEvent', req, timeout=timeout, replay=replay)
 
-    async def buy_festival_proposal(self, req):
-        return await self.call_method('buyFestivalProposal', req)
+    async def buy_festival_proposal(self, req, timeout=None, replay=True):
+        return await self.call_method('buyFestivalProposal', req, timeout=timeout, replay=replay)
 
-    async def island_activity_move(self, req):
-        return await self.call_method('islandActivityMove', req)
+    async def island_activity_move(self, req, timeout=None, replay=True):
+        return await self.call_method('islandActivityMove', req, timeout=timeout, replay=replay)
 
-    async def island_activity_buy(self, req):
-        return await self.call_method('islandActivityBuy', req)
+    async def island_activity_buy(self, req, timeout=None, replay=True):
+        return await self.call_method('islandActivityBuy', req, timeout=timeout, replay=replay)
 
-    async def island_activity_sell(self, req):
-        return await self.call_method('islandActivitySell', req)
+    async def island_activity_sell(self, req, timeout=None, replay=True):
+        return await self.call_method('islandActivitySell', req, timeout=timeout, replay=replay)
 
-    async def island_activity_tidy_bag(self, req):
-        return await self.call_method('islandActivityTidyBag', req)
+    async def island_activity_tidy_bag(self, req, timeout=None, replay=True):
+        return await self.call_method('islandActivityTidyBag', req, timeout=timeout, replay=replay)
 
-    async def island_activity_unlock_bag_grid(self, req):
-        return await self.call_method('islandActivityUnlockBagGrid', req)
+    async def island_activity_unlock_bag_grid(self, req, timeout=None, replay=True):
+        return await self.call_method('islandActivityUnlockBagGrid', req, timeout=timeout, replay=replay)
 
-    async def create_customized_contest(self, req):
-        return await self.call_method('createCustomizedContest', req)
+    async def create_customized_contest(self, req, timeout=None, replay=True):
+        return await self.call_method('createCustomizedContest', req, timeout=timeout, replay=replay)
 
-    async def fetch_manager_customized_contest_list(self, req):
-        return await self.call_method('fetchManagerCustomizedContestList', req)
+    async def fetch_manager_customized_contest_list(self, req, timeout=None, replay=True):
+        return await self.call_method('fetchManagerCustomizedContestList', req, timeout=timeout, replay=replay)
 
-    async def fetch_manager_customized_contest(self, req):
-        return await self.call_method('fetchManagerCustomizedContest', req)
+    async def fetch_manager_customized_contest(self, req, timeout=None, replay=True):
+        return await self.call_method('fetchManagerCustomizedContest', req, timeout=timeout, replay=replay)
 
-    async def update_manager_customized_contest(self, req):
-        return await self.call_method('updateManagerCustomizedContest', req)
+    async def update_manager_customized_contest(self, req, timeout=None, replay=True):
+        return await self.call_method('updateManagerCustomizedContest', req, timeout=timeout, replay=replay)
 
-    async def fetch_contest_player_rank(self, req):
-        return await self.call_method('fetchContestPlayerRank', req)
+    async def fetch_contest_player_rank(self, req, timeout=None, replay=True):
+        return await self.call_method('fetchContestPlayerRank', req, timeout=timeout, replay=replay)
 
-    async def fetch_ready_player_list(self, req):
-        return await self.call_method('fetchReadyPlayerList', req)
+    async def fetch_ready_player_list(self, req, timeout=None, replay=True):
+        return await self.call_method('fetchReadyPlayerList', req, timeout=timeout, replay=replay)
 
-    async def create_game_plan(self, req):
-        return await self.call_method('createGamePlan', req)
+    async def create_game_plan(self, req, timeout=None, replay=True):
+        return await self.call_method('createGamePlan', req, timeout=timeout, replay=replay)
 
-    async def generate_contest_manager_login_code(self, req):
-        return await self.call_method('generateContestManagerLoginCode', req)
+    async def generate_contest_manager_login_code(self, req, timeout=None, replay=True):
+        return await self.call_method('generateContestManagerLoginCode', req, timeout=timeout, replay=replay)
 
-    async def amulet_activity_fetch_info(self, req):
-        return await self.call_method('amuletActivityFetchInfo', req)
+    async def amulet_activity_fetch_info(self, req, timeout=None, replay=True):
+        return await self.call_method('amuletActivityFetchInfo', req, timeout=timeout, replay=replay)
 
-    async def amulet_activity_fetch_brief(self, req):
-        return await self.call_method('amuletActivityFetchBrief', req)
+    async def amulet_activity_fetch_brief(self, req, timeout=None, replay=True):
+        return await self.call_method('amuletActivityFetchBrief', req, timeout=timeout, replay=replay)
 
-    async def amulet_activity_start_game(self, req):
-        return await self.call_method('amuletActivityStartGame', req)
+    async def amulet_activity_start_game(self, req, timeout=None, replay=True):
+        return await self.call_method('amuletActivityStartGame', req, timeout=timeout, replay=replay)
 
-    async def amulet_activity_operate(self, req):
-        return await self.call_method('amuletActivityOperate', req)
+    async def amulet_activity_operate(self, req, timeout=None, replay=True):
+        return await self.call_method('amuletActivityOperate', req, timeout=timeout, replay=replay)
 
-    async def amulet_activity_change_hands(self, req):
-        return await self.call_method('amuletActivityChangeHands', req)
+    async def amulet_activity_change_hands(self, req, timeout=None, replay=True):
+        return await self.call_method('amuletActivityChangeHands', req, timeout=timeout, replay=replay)
 
-    async def amulet_activity_upgrade(self, req):
-        return await self.call_method('amuletActivityUpgrade', req)
+    async def amulet_activity_upgrade(self, req, timeout=None, replay=True):
+        return await self.call_method('amuletActivityUpgrade', req, timeout=timeout, replay=replay)
 
-    async def amulet_activity_buy(self, req):
-        return await self.call_method('amuletActivityBuy', req)
+    async def amulet_activity_buy(self, req, timeout=None, replay=True):
+        return await self.call_method('amuletActivityBuy', req, timeout=timeout, replay=replay)
 
-    async def amulet_activity_select_pack(self, req):
-        return await self.call_method('amuletActivitySelectPack', req)
+    async def amulet_activity_select_pack(self, req, timeout=None, replay=True):
+        return await self.call_method('amuletActivitySelectPack', req, timeout=timeout, replay=replay)
 
-    async def amulet_activity_sell_effect(self, req):
-        return await self.call_method('amuletActivitySellEffect', req)
+    async def amulet_activity_sell_effect(self, req, timeout=None, replay=True):
+        return await self.call_method('amuletActivitySellEffect', req, timeout=timeout, replay=replay)
 
-    async def amulet_activity_effect_sort(self, req):
-        return await self.call_method('amuletActivityEffectSort', req)
+    async def amulet_activity_effect_sort(self, req, timeout=None, replay=True):
+        return await self.call_method('amuletActivityEffectSort', req, timeout=timeout, replay=replay)
 
-    async def amulet_activity_giveup(self, req):
-        return await self.call_method('amuletActivityGiveup', req)
+    async def amulet_activity_giveup(self, req, timeout=None, replay=True):
+        return await self.call_method('amuletActivityGiveup', req, timeout=timeout, replay=replay)
 
-    async def amulet_activity_refresh_shop(self, req):
-        return await self.call_method('amuletActivityRefreshShop', req)
+    async def amulet_activity_refresh_shop(self, req, timeout=None, replay=True):
+        return await self.call_method('amuletActivityRefreshShop', req, timeout=timeout, replay=replay)
 
-    async def amulet_activity_select_free_effect(self, req):
-        return await self.call_method('amuletActivitySelectFreeEffect', req)
+    async def amulet_activity_select_free_effect(self, req, timeout=None, replay=True):
+        return await self.call_method('amuletActivitySelectFreeEffect', req, timeout=timeout, replay=replay)
 
-    async def amulet_activity_upgrade_shop_buff(self, req):
-        return await self.call_method('amuletActivityUpgradeShopBuff', req)
+    async def amulet_activity_upgrade_shop_buff(self, req, timeout=None, replay=True):
+        return await self.call_method('amuletActivityUpgradeShopBuff', req, timeout=timeout, replay=replay)
 
-    async def amulet_activity_end_shopping(self, req):
-        return await self.call_method('amuletActivityEndShopping', req)
+    async def amulet_activity_end_shopping(self, req, timeout=None, replay=True):
+        return await self.call_method('amuletActivityEndShopping', req, timeout=timeout, replay=replay)
 
-    async def amulet_activity_set_skill_level(self, req):
-        return await self.call_method('amuletActivitySetSkillLevel', req)
+    async def amulet_activity_set_skill_level(self, req, timeout=None, replay=True):
+        return await self.call_method('amuletActivitySetSkillLevel', req, timeout=timeout, replay=replay)
 
-    async def amulet_activity_maintain_info(self, req):
-        return await self.call_method('amuletActivityMaintainInfo', req)
+    async def amulet_activity_maintain_info(self, req, timeout=None, replay=True):
+        return await self.call_method('amuletActivityMaintainInfo', req, timeout=timeout, replay=replay)
 
-    async def amulet_activity_select_reward_pack(self, req):
-        return await self.call_method('amuletActivitySelectRewardPack', req)
+    async def amulet_activity_select_reward_pack(self, req, timeout=None, replay=True):
+        return await self.call_method('amuletActivitySelectRewardPack', req, timeout=timeout, replay=replay)
 
-    async def amulet_activity_receive_task_reward(self, req):
-        return await self.call_method('amuletActivityReceiveTaskReward', req)
+    async def amulet_activity_receive_task_reward(self, req, timeout=None, replay=True):
+        return await self.call_method('amuletActivityReceiveTaskReward', req, timeout=timeout, replay=replay)
 
-    async def story_activity_unlock(self, req):
-        return await self.call_method('storyActivityUnlock', req)
+    async def story_activity_unlock(self, req, timeout=None, replay=True):
+        return await self.call_method('storyActivityUnlock', req, timeout=timeout, replay=replay)
 
-    async def story_activity_unlock_ending(self, req):
-        return await self.call_method('storyActivityUnlockEnding', req)
+    async def story_activity_unlock_ending(self, req, timeout=None, replay=True):
+        return await self.call_method('storyActivityUnlockEnding', req, timeout=timeout, replay=replay)
 
-    async def story_activity_receive_ending_reward(self, req):
-        return await self.call_method('storyActivityReceiveEndingReward', req)
+    async def story_activity_receive_ending_reward(self, req, timeout=None, replay=True):
+        return await self.call_method('storyActivityReceiveEndingReward', req, timeout=timeout, replay=replay)
 
-    async def story_activity_receive_finish_reward(self, req):
-        return await self.call_method('storyActivityReceiveFinishReward', req)
+    async def story_activity_receive_finish_reward(self, req, timeout=None, replay=True):
+        return await self.call_method('storyActivityReceiveFinishReward', req, timeout=timeout, replay=replay)
 
-    async def story_activity_receive_all_finish_reward(self, req):
-        return await self.call_method('storyActivityReceiveAllFinishReward', req)
+    async def story_activity_receive_all_finish_reward(self, req, timeout=None, replay=True):
+        return await self.call_method('storyActivityReceiveAllFinishReward', req, timeout=timeout, replay=replay)
 
-    async def story_activity_unlock_ending_and_receive(self, req):
-        return await self.call_method('storyActivityUnlockEndingAndReceive', req)
+    async def story_activity_unlock_ending_and_receive(self, req, timeout=None, replay=True):
+        return await self.call_method('storyActivityUnlockEndingAndReceive', req, timeout=timeout, replay=replay)
 
-    async def fetch_activity_rank(self, req):
-        return await self.call_method('fetchActivityRank', req)
+    async def fetch_activity_rank(self, req, timeout=None, replay=True):
+        return await self.call_method('fetchActivityRank', req, timeout=timeout, replay=replay)
 
-    async def set_verified_hidden(self, req):
-        return await self.call_method('setVerifiedHidden', req)
+    async def set_verified_hidden(self, req, timeout=None, replay=True):
+        return await self.call_method('setVerifiedHidden', req, timeout=timeout, replay=replay)
 
-    async def fetch_questionnaire_list(self, req):
-        return await self.call_method('fetchQuestionnaireList', req)
+    async def fetch_questionnaire_list(self, req, timeout=None, replay=True):
+        return await self.call_method('fetchQuestionnaireList', req, timeout=timeout, replay=replay)
 
-    async def fetch_questionnaire_detail(self, req):
-        return await self.call_method('fetchQuestionnaireDetail', req)
+    async def fetch_questionnaire_detail(self, req, timeout=None, replay=True):
+        return await self.call_method('fetchQuestionnaireDetail', req, timeout=timeout, replay=replay)
 
-    async def submit_questionnaire(self, req):
-        return await self.call_method('submitQuestionnaire', req)
+    async def submit_questionnaire(self, req, timeout=None, replay=True):
+        return await self.call_method('submitQuestionnaire', req, timeout=timeout, replay=replay)
 
-    async def set_friend_room_random_bot_char(self, req):
-        return await self.call_method('setFriendRoomRandomBotChar', req)
+    async def set_friend_room_random_bot_char(self, req, timeout=None, replay=True):
+        return await self.call_method('setFriendRoomRandomBotChar', req, timeout=timeout, replay=replay)
 
-    async def fetch_account_game_hu_records(self, req):
-        return await self.call_method('fetchAccountGameHuRecords', req)
+    async def fetch_account_game_hu_records(self, req, timeout=None, replay=True):
+        return await self.call_method('fetchAccountGameHuRecords', req, timeout=timeout, replay=replay)
 
-    async def fetch_account_info_extra(self, req):
-        return await self.call_method('fetchAccountInfoExtra', req)
+    async def fetch_account_info_extra(self, req, timeout=None, replay=True):
+        return await self.call_method('fetchAccountInfoExtra', req, timeout=timeout, replay=replay)
 
-    async def set_account_favorite_hu(self, req):
-        return await self.call_method('setAccountFavoriteHu', req)
+    async def set_account_favorite_hu(self, req, timeout=None, replay=True):
+        return await self.call_method('setAccountFavoriteHu', req, timeout=timeout, replay=replay)
 
-    async def fetch_seer_report(self, req):
-        return await self.call_method('fetchSeerReport', req)
+    async def fetch_seer_report(self, req, timeout=None, replay=True):
+        return await self.call_method('fetchSeerReport', req, timeout=timeout, replay=replay)
 
-    async def create_seer_report(self, req):
-        return await self.call_method('createSeerReport', req)
+    async def create_seer_report(self, req, timeout=None, replay=True):
+        return await self.call_method('createSeerReport', req, timeout=timeout, replay=replay)
 
-    async def fetch_seer_report_list(self, req):
-        return await self.call_method('fetchSeerReportList', req)
+    async def fetch_seer_report_list(self, req, timeout=None, replay=True):
+        return await self.call_method('fetchSeerReportList', req, timeout=timeout, replay=replay)
 
-    async def fetch_seer_info(self, req):
-        return await self.call_method('fetchSeerInfo', req)
+    async def fetch_seer_info(self, req, timeout=None, replay=True):
+        return await self.call_method('fetchSeerInfo', req, timeout=timeout, replay=replay)
 
-    async def select_chest_choose_up_activity(self, req):
-        return await self.call_method('selectChestChooseUpActivity', req)
+    async def select_chest_choose_up_activity(self, req, timeout=None, replay=True):
+        return await self.call_method('selectChestChooseUpActivity', req, timeout=timeout, replay=replay)
 
-    async def generate_annual_report_token(self, req):
-        return await self.call_method('generateAnnualReportToken', req)
+    async def generate_annual_report_token(self, req, timeout=None, replay=True):
+        return await self.call_method('generateAnnualReportToken', req, timeout=timeout, replay=replay)
 
-    async def fetch_annual_report_info(self, req):
-        return await self.call_method('fetchAnnualReportInfo', req)
+    async def fetch_annual_report_info(self, req, timeout=None, replay=True):
+        return await self.call_method('fetchAnnualReportInfo', req, timeout=timeout, replay=replay)
 
-    async def remark_friend(self, req):
-        return await self.call_method('remarkFriend', req)
+    async def remark_friend(self, req, timeout=None, replay=True):
+        return await self.call_method('remarkFriend', req, timeout=timeout, replay=replay)
 
-    async def sim_v2_activity_fetch_info(self, req):
-        return await self.call_method('simV2ActivityFetchInfo', req)
+    async def sim_v2_activity_fetch_info(self, req, timeout=None, replay=True):
+        return await self.call_method('simV2ActivityFetchInfo', req, timeout=timeout, replay=replay)
 
-    async def sim_v2_activity_start_season(self, req):
-        return await self.call_method('simV2ActivityStartSeason', req)
+    async def sim_v2_activity_start_season(self, req, timeout=None, replay=True):
+        return await self.call_method('simV2ActivityStartSeason', req, timeout=timeout, replay=replay)
 
-    async def sim_v2_activity_train(self, req):
-        return await self.call_method('simV2ActivityTrain', req)
+    async def sim_v2_activity_train(self, req, timeout=None, replay=True):
+        return await self.call_method('simV2ActivityTrain', req, timeout=timeout, replay=replay)
 
-    async def sim_v2_activity_select_event(self, req):
-        return await self.call_method('simV2ActivitySelectEvent', req)
+    async def sim_v2_activity_select_event(self, req, timeout=None, replay=True):
+        return await self.call_method('simV2ActivitySelectEvent', req, timeout=timeout, replay=replay)
 
-    async def sim_v2_activity_start_match(self, req):
-        return await self.call_method('simV2ActivityStartMatch', req)
+    async def sim_v2_activity_start_match(self, req, timeout=None, replay=True):
+        return await self.call_method('simV2ActivityStartMatch', req, timeout=timeout, replay=replay)
 
-    async def sim_v2_activity_end_match(self, req):
-        return await self.call_method('simV2ActivityEndMatch', req)
+    async def sim_v2_activity_end_match(self, req, timeout=None, replay=True):
+        return await self.call_method('simV2ActivityEndMatch', req, timeout=timeout, replay=replay)
 
-    async def sim_v2_activity_give_up(self, req):
-        return await self.call_method('simV2ActivityGiveUp', req)
+    async def sim_v2_activity_give_up(self, req, timeout=None, replay=True):
+        return await self.call_method('simV2ActivityGiveUp', req, timeout=timeout, replay=replay)
 
-    async def sim_v2_activity_set_upgrade(self, req):
-        return await self.call_method('simV2ActivitySetUpgrade', req)
+    async def sim_v2_activity_set_upgrade(self, req, timeout=None, replay=True):
+        return await self.call_method('simV2ActivitySetUpgrade', req, timeout=timeout, replay=replay)
 
 
 class FastTest(MSRPCService):
@@ -2000,56 +2000,56 @@ class FastTest(MSRPCService):
     def get_res_class(self, method):
         return FastTest._res[method]
 
-    async def auth_game(self, req):
-        return await self.call_method('authGame', req)
+    async def auth_game(self, req, timeout=None, replay=True):
+        return await self.call_method('authGame', req, timeout=timeout, replay=replay)
 
-    async def enter_game(self, req):
-        return await self.call_method('enterGame', req)
+    async def enter_game(self, req, timeout=None, replay=True):
+        return await self.call_method('enterGame', req, timeout=timeout, replay=replay)
 
-    async def sync_game(self, req):
-        return await self.call_method('syncGame', req)
+    async def sync_game(self, req, timeout=None, replay=True):
+        return await self.call_method('syncGame', req, timeout=timeout, replay=replay)
 
-    async def finish_sync_game(self, req):
-        return await self.call_method('finishSyncGame', req)
+    async def finish_sync_game(self, req, timeout=None, replay=True):
+        return await self.call_method('finishSyncGame', req, timeout=timeout, replay=replay)
 
-    async def terminate_game(self, req):
-        return await self.call_method('terminateGame', req)
+    async def terminate_game(self, req, timeout=None, replay=True):
+        return await self.call_method('terminateGame', req, timeout=timeout, replay=replay)
 
-    async def input_operation(self, req):
-        return await self.call_method('inputOperation', req)
+    async def input_operation(self, req, timeout=None, replay=True):
+        return await self.call_method('inputOperation', req, timeout=timeout, replay=replay)
 
-    async def input_chi_peng_gang(self, req):
-        return await self.call_method('inputChiPengGang', req)
+    async def input_chi_peng_gang(self, req, timeout=None, replay=True):
+        return await self.call_method('inputChiPengGang', req, timeout=timeout, replay=replay)
 
-    async def confirm_new_round(self, req):
-        return await self.call_method('confirmNewRound', req)
+    async def confirm_new_round(self, req, timeout=None, replay=True):
+        return await self.call_method('confirmNewRound', req, timeout=timeout, replay=replay)
 
-    async def broadcast_in_game(self, req):
-        return await self.call_method('broadcastInGame', req)
+    async def broadcast_in_game(self, req, timeout=None, replay=True):
+        return await self.call_method('broadcastInGame', req, timeout=timeout, replay=replay)
 
-    async def input_game_gm_command(self, req):
-        return await self.call_method('inputGameGMCommand', req)
+    async def input_game_gm_command(self, req, timeout=None, replay=True):
+        return await self.call_method('inputGameGMCommand', req, timeout=timeout, replay=replay)
 
-    async def fetch_game_player_state(self, req):
-        return await self.call_method('fetchGamePlayerState', req)
+    async def fetch_game_player_state(self, req, timeout=None, replay=True):
+        return await self.call_method('fetchGamePlayerState', req, timeout=timeout, replay=replay)
 
-    async def check_network_delay(self, req):
-        return await self.call_method('checkNetworkDelay', req)
+    async def check_network_delay(self, req, timeout=None, replay=True):
+        return await self.call_method('checkNetworkDelay', req, timeout=timeout, replay=replay)
 
-    async def clear_leaving(self, req):
-        return await self.call_method('clearLeaving', req)
+    async def clear_leaving(self, req, timeout=None, replay=True):
+        return await self.call_method('clearLeaving', req, timeout=timeout, replay=replay)
 
-    async def vote_game_end(self, req):
-        return await self.call_method('voteGameEnd', req)
+    async def vote_game_end(self, req, timeout=None, replay=True):
+        return await self.call_method('voteGameEnd', req, timeout=timeout, replay=replay)
 
-    async def auth_observe(self, req):
-        return await self.call_method('authObserve', req)
+    async def auth_observe(self, req, timeout=None, replay=True):
+        return await self.call_method('authObserve', req, timeout=timeout, replay=replay)
 
-    async def start_observe(self, req):
-        return await self.call_method('startObserve', req)
+    async def start_observe(self, req, timeout=None, replay=True):
+        return await self.call_method('startObserve', req, timeout=timeout, replay=replay)
 
-    async def stop_observe(self, req):
-        return await self.call_method('stopObserve', req)
+    async def stop_observe(self, req, timeout=None, replay=True):
+        return await self.call_method('stopObserve', req, timeout=timeout, replay=replay)
 
 
 class Route(MSRPCService):
@@ -2078,11 +2078,11 @@ class Route(MSRPCService):
     def get_res_class(self, method):
         return Route._res[method]
 
-    async def request_connection(self, req):
-        return await self.call_method('requestConnection', req)
+    async def request_connection(self, req, timeout=None, replay=True):
+        return await self.call_method('requestConnection', req, timeout=timeout, replay=replay)
 
-    async def request_route_change(self, req):
-        return await self.call_method('requestRouteChange', req)
+    async def request_route_change(self, req, timeout=None, replay=True):
+        return await self.call_method('requestRouteChange', req, timeout=timeout, replay=replay)
 
-    async def heartbeat(self, req):
-        return await self.call_method('heartbeat', req)
+    async def heartbeat(self, req, timeout=None, replay=True):
+        return await self.call_method('heartbeat', req, timeout=timeout, replay=replay)
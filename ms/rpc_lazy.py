@@ -0,0 +1,1735 @@
+# -*- coding: utf-8 -*-
+# Generated.  DO NOT EDIT!
+
+import ms.protocol_lazy as pb
+from ms.base import MSRPCService
+
+
+class Lobby(MSRPCService):
+    version = None
+
+    _req = {
+        'fetchConnectionInfo': 'ReqCommon',
+        'fetchQueueInfo': 'ReqCommon',
+        'cancelQueue': 'ReqCommon',
+        'openidCheck': 'ReqOpenidCheck',
+        'signup': 'ReqSignupAccount',
+        'login': 'ReqLogin',
+        'fetchInfo': 'ReqCommon',
+        'loginSuccess': 'ReqCommon',
+        'fetchServerMaintenanceInfo': 'ReqCommon',
+        'emailLogin': 'ReqEmailLogin',
+        'oauth2Auth': 'ReqOauth2Auth',
+        'oauth2Check': 'ReqOauth2Check',
+        'oauth2Signup': 'ReqOauth2Signup',
+        'oauth2Login': 'ReqOauth2Login',
+        'dmmPreLogin': 'ReqDMMPreLogin',
+        'createPhoneVerifyCode': 'ReqCreatePhoneVerifyCode',
+        'createEmailVerifyCode': 'ReqCreateEmailVerifyCode',
+        'verfifyCodeForSecure': 'ReqVerifyCodeForSecure',
+        'bindPhoneNumber': 'ReqBindPhoneNumber',
+        'unbindPhoneNumber': 'ReqUnbindPhoneNumber',
+        'fetchPhoneLoginBind': 'ReqCommon',
+        'createPhoneLoginBind': 'ReqCreatePhoneLoginBind',
+        'bindEmail': 'ReqBindEmail',
+        'modifyPassword': 'ReqModifyPassword',
+        'bindAccount': 'ReqBindAccount',
+        'logout': 'ReqLogout',
+        'heatbeat': 'ReqHeatBeat',
+        'searchAccountByEid': 'ReqSearchAccountByEid',
+        'loginBeat': 'ReqLoginBeat',
+        'createNickname': 'ReqCreateNickname',
+        'modifyNickname': 'ReqModifyNickname',
+        'modifyBirthday': 'ReqModifyBirthday',
+        'fetchRoom': 'ReqCommon',
+        'fetchGamingInfo': 'ReqCommon',
+        'createRoom': 'ReqCreateRoom',
+        'joinRoom': 'ReqJoinRoom',
+        'leaveRoom': 'ReqCommon',
+        'readyPlay': 'ReqRoomReady',
+        'dressingStatus': 'ReqRoomDressing',
+        'startRoom': 'ReqRoomStart',
+        'roomKickPlayer': 'ReqRoomKickPlayer',
+        'modifyRoom': 'ReqModifyRoom',
+        'addRoomRobot': 'ReqAddRoomRobot',
+        'matchGame': 'ReqJoinMatchQueue',
+        'cancelMatch': 'ReqCancelMatchQueue',
+        'fetchAccountInfo': 'ReqAccountInfo',
+        'changeAvatar': 'ReqChangeAvatar',
+        'receiveVersionReward': 'ReqCommon',
+        'fetchAccountStatisticInfo': 'ReqAccountStatisticInfo',
+        'fetchAccountChallengeRankInfo': 'ReqAccountInfo',
+        'fetchAccountCharacterInfo': 'ReqCommon',
+        'shopPurchase': 'ReqShopPurchase',
+        'fetchGameRecord': 'ReqGameRecord',
+        'readGameRecord': 'ReqGameRecord',
+        'fetchGameRecordList': 'ReqGameRecordList',
+        'fetchGameRecordListV2': 'ReqGameRecordListV2',
+        'fetchNextGameRecordList': 'ReqNextGameRecordList',
+        'fetchCollectedGameRecordList': 'ReqCommon',
+        'fetchGameRecordsDetail': 'ReqGameRecordsDetail',
+        'fetchGameRecordsDetailV2': 'ReqGameRecordsDetailV2',
+        'addCollectedGameRecord': 'ReqAddCollectedGameRecord',
+        'removeCollectedGameRecord': 'ReqRemoveCollectedGameRecord',
+        'changeCollectedGameRecordRemarks': 'ReqChangeCollectedGameRecordRemarks',
+        'fetchLevelLeaderboard': 'ReqLevelLeaderboard',
+        'fetchChallengeLeaderboard': 'ReqChallangeLeaderboard',
+        'fetchMutiChallengeLevel': 'ReqMutiChallengeLevel',
+        'fetchMultiAccountBrief': 'ReqMultiAccountId',
+        'fetchFriendList': 'ReqCommon',
+        'fetchFriendApplyList': 'ReqCommon',
+        'applyFriend': 'ReqApplyFriend',
+        'handleFriendApply': 'ReqHandleFriendApply',
+        'removeFriend': 'ReqRemoveFriend',
+        'searchAccountById': 'ReqSearchAccountById',
+        'searchAccountByPattern': 'ReqSearchAccountByPattern',
+        'fetchAccountState': 'ReqAccountList',
+        'fetchBagInfo': 'ReqCommon',
+        'useBagItem': 'ReqUseBagItem',
+        'openManualItem': 'ReqOpenManualItem',
+        'openRandomRewardItem': 'ReqOpenRandomRewardItem',
+        'openAllRewardItem': 'ReqOpenAllRewardItem',
+        'composeShard': 'ReqComposeShard',
+        'fetchAnnouncement': 'ReqFetchAnnouncement',
+        'readAnnouncement': 'ReqReadAnnouncement',
+        'fetchMailInfo': 'ReqCommon',
+        'readMail': 'ReqReadMail',
+        'deleteMail': 'ReqDeleteMail',
+        'takeAttachmentFromMail': 'ReqTakeAttachment',
+        'receiveAchievementReward': 'ReqReceiveAchievementReward',
+        'receiveAchievementGroupReward': 'ReqReceiveAchievementGroupReward',
+        'fetchAchievementRate': 'ReqCommon',
+        'fetchAchievement': 'ReqCommon',
+        'buyShiLian': 'ReqBuyShiLian',
+        'matchShiLian': 'ReqCommon',
+        'goNextShiLian': 'ReqCommon',
+        'updateClientValue': 'ReqUpdateClientValue',
+        'fetchClientValue': 'ReqCommon',
+        'clientMessage': 'ReqClientMessage',
+        'fetchCurrentMatchInfo': 'ReqCurrentMatchInfo',
+        'userComplain': 'ReqUserComplain',
+        'fetchReviveCoinInfo': 'ReqCommon',
+        'gainReviveCoin': 'ReqCommon',
+        'fetchDailyTask': 'ReqCommon',
+        'refreshDailyTask': 'ReqRefreshDailyTask',
+        'useGiftCode': 'ReqUseGiftCode',
+        'useSpecialGiftCode': 'ReqUseGiftCode',
+        'fetchTitleList': 'ReqCommon',
+        'useTitle': 'ReqUseTitle',
+        'sendClientMessage': 'ReqSendClientMessage',
+        'fetchGameLiveInfo': 'ReqGameLiveInfo',
+        'fetchGameLiveLeftSegment': 'ReqGameLiveLeftSegment',
+        'fetchGameLiveList': 'ReqGameLiveList',
+        'fetchCommentSetting': 'ReqCommon',
+        'updateCommentSetting': 'ReqUpdateCommentSetting',
+        'fetchCommentList': 'ReqFetchCommentList',
+        'fetchCommentContent': 'ReqFetchCommentContent',
+        'leaveComment': 'ReqLeaveComment',
+        'deleteComment': 'ReqDeleteComment',
+        'updateReadComment': 'ReqUpdateReadComment',
+        'fetchRollingNotice': 'ReqFetchRollingNotice',
+        'fetchMaintainNotice': 'ReqCommon',
+        'fetchServerTime': 'ReqCommon',
+        'fetchPlatformProducts': 'ReqPlatformBillingProducts',
+        'fetchRandomCharacter': 'ReqCommon',
+        'setRandomCharacter': 'ReqRandomCharacter',
+        'cancelGooglePlayOrder': 'ReqCancelGooglePlayOrder',
+        'openChest': 'ReqOpenChest',
+        'buyFromChestShop': 'ReqBuyFromChestShop',
+        'fetchDailySignInInfo': 'ReqCommon',
+        'doDailySignIn': 'ReqCommon',
+        'doActivitySignIn': 'ReqDoActivitySignIn',
+        'fetchCharacterInfo': 'ReqCommon',
+        'updateCharacterSort': 'ReqUpdateCharacterSort',
+        'changeMainCharacter': 'ReqChangeMainCharacter',
+        'changeCharacterSkin': 'ReqChangeCharacterSkin',
+        'changeCharacterView': 'ReqChangeCharacterView',
+        'setHiddenCharacter': 'ReqSetHiddenCharacter',
+        'sendGiftToCharacter': 'ReqSendGiftToCharacter',
+        'sellItem': 'ReqSellItem',
+        'fetchCommonView': 'ReqCommon',
+        'changeCommonView': 'ReqChangeCommonView',
+        'saveCommonViews': 'ReqSaveCommonViews',
+        'fetchCommonViews': 'ReqCommonViews',
+        'fetchAllCommonViews': 'ReqCommon',
+        'useCommonView': 'ReqUseCommonView',
+        'upgradeCharacter': 'ReqUpgradeCharacter',
+        'addFinishedEnding': 'ReqFinishedEnding',
+        'receiveEndingReward': 'ReqFinishedEnding',
+        'gameMasterCommand': 'ReqGMCommand',
+        'fetchShopInfo': 'ReqCommon',
+        'buyFromShop': 'ReqBuyFromShop',
+        'buyFromZHP': 'ReqBuyFromZHP',
+        'refreshZHPShop': 'ReqReshZHPShop',
+        'fetchMonthTicketInfo': 'ReqCommon',
+        'payMonthTicket': 'ReqCommon',
+        'exchangeCurrency': 'ReqExchangeCurrency',
+        'exchangeChestStone': 'ReqExchangeCurrency',
+        'exchangeDiamond': 'ReqExchangeCurrency',
+        'fetchServerSettings': 'ReqCommon',
+        'fetchAccountSettings': 'ReqCommon',
+        'updateAccountSettings': 'ReqUpdateAccountSettings',
+        'fetchModNicknameTime': 'ReqCommon',
+        'createWechatNativeOrder': 'ReqCreateWechatNativeOrder',
+        'createWechatAppOrder': 'ReqCreateWechatAppOrder',
+        'createAlipayOrder': 'ReqCreateAlipayOrder',
+        'createAlipayScanOrder': 'ReqCreateAlipayScanOrder',
+        'createAlipayAppOrder': 'ReqCreateAlipayAppOrder',
+        'createJPCreditCardOrder': 'ReqCreateJPCreditCardOrder',
+        'createJPPaypalOrder': 'ReqCreateJPPaypalOrder',
+        'createJPAuOrder': 'ReqCreateJPAuOrder',
+        'createJPDocomoOrder': 'ReqCreateJPDocomoOrder',
+        'createJPWebMoneyOrder': 'ReqCreateJPWebMoneyOrder',
+        'createJPSoftbankOrder': 'ReqCreateJPSoftbankOrder',
+        'createJPPayPayOrder': 'ReqCreateJPPayPayOrder',
+        'fetchJPCommonCreditCardOrder': 'ReqFetchJPCommonCreditCardOrder',
+        'createJPGMOOrder': 'ReqCreateJPGMOOrder',
+        'createENPaypalOrder': 'ReqCreateENPaypalOrder',
+        'createENMasterCardOrder': 'ReqCreateENMasterCardOrder',
+        'createENVisaOrder': 'ReqCreateENVisaOrder',
+        'createENJCBOrder': 'ReqCreateENJCBOrder',
+        'createENAlipayOrder': 'ReqCreateENAlipayOrder',
+        'createKRPaypalOrder': 'ReqCreateKRPaypalOrder',
+        'createKRMasterCardOrder': 'ReqCreateKRMasterCardOrder',
+        'createKRVisaOrder': 'ReqCreateKRVisaOrder',
+        'createKRJCBOrder': 'ReqCreateKRJCBOrder',
+        'createKRAlipayOrder': 'ReqCreateKRAlipayOrder',
+        'createDMMOrder': 'ReqCreateDMMOrder',
+        'createIAPOrder': 'ReqCreateIAPOrder',
+        'createSteamOrder': 'ReqCreateSteamOrder',
+        'verifySteamOrder': 'ReqVerifySteamOrder',
+        'createMyCardAndroidOrder': 'ReqCreateMyCardOrder',
+        'createMyCardWebOrder': 'ReqCreateMyCardOrder',
+        'createPaypalOrder': 'ReqCreatePaypalOrder',
+        'createXsollaOrder': 'ReqCreateXsollaOrder',
+        'createXsollaV4Order': 'ReqCreateXsollaOrder',
+        'verifyMyCardOrder': 'ReqVerifyMyCardOrder',
+        'verificationIAPOrder': 'ReqVerificationIAPOrder',
+        'createYostarSDKOrder': 'ReqCreateYostarOrder',
+        'createBillingOrder': 'ReqCreateBillingOrder',
+        'solveGooglePlayOrder': 'ReqSolveGooglePlayOrder',
+        'solveGooglePayOrderV3': 'ReqSolveGooglePlayOrderV3',
+        'deliverAA32Order': 'ReqDeliverAA32Order',
+        'fetchMisc': 'ReqCommon',
+        'modifySignature': 'ReqModifySignature',
+        'fetchIDCardInfo': 'ReqCommon',
+        'updateIDCardInfo': 'ReqUpdateIDCardInfo',
+        'fetchVipReward': 'ReqCommon',
+        'gainVipReward': 'ReqGainVipReward',
+        'fetchRefundOrder': 'ReqCommon',
+        'fetchCustomizedContestList': 'ReqFetchCustomizedContestList',
+        'fetchCustomizedContestAuthInfo': 'ReqFetchCustomizedContestAuthInfo',
+        'enterCustomizedContest': 'ReqEnterCustomizedContest',
+        'leaveCustomizedContest': 'ReqCommon',
+        'fetchCustomizedContestOnlineInfo': 'ReqFetchCustomizedContestOnlineInfo',
+        'fetchCustomizedContestByContestId': 'ReqFetchCustomizedContestByContestId',
+        'signupCustomizedContest': 'ReqSignupCustomizedContest',
+        'startCustomizedContest': 'ReqStartCustomizedContest',
+        'stopCustomizedContest': 'ReqStopCustomizedContest',
+        'joinCustomizedContestChatRoom': 'ReqJoinCustomizedContestChatRoom',
+        'leaveCustomizedContestChatRoom': 'ReqCommon',
+        'sayChatMessage': 'ReqSayChatMessage',
+        'fetchCustomizedContestGameRecords': 'ReqFetchCustomizedContestGameRecords',
+        'fetchCustomizedContestGameLiveList': 'ReqFetchCustomizedContestGameLiveList',
+        'followCustomizedContest': 'ReqTargetCustomizedContest',
+        'unfollowCustomizedContest': 'ReqTargetCustomizedContest',
+        'fetchActivityList': 'ReqCommon',
+        'fetchAccountActivityData': 'ReqCommon',
+        'exchangeActivityItem': 'ReqExchangeActivityItem',
+        'completeActivityTask': 'ReqCompleteActivityTask',
+        'completeActivityTaskBatch': 'ReqCompleteActivityTaskBatch',
+        'completeActivityFlipTask': 'ReqCompleteActivityTask',
+        'completePeriodActivityTask': 'ReqCompleteActivityTask',
+        'completePeriodActivityTaskBatch': 'ReqCompletePeriodActivityTaskBatch',
+        'completeRandomActivityTask': 'ReqCompleteActivityTask',
+        'completeRandomActivityTaskBatch': 'ReqCompleteActivityTaskBatch',
+        'receiveActivityFlipTask': 'ReqReceiveActivityFlipTask',
+        'completeSegmentTaskReward': 'ReqCompleteSegmentTaskReward',
+        'fetchActivityFlipInfo': 'ReqFetchActivityFlipInfo',
+        'gainAccumulatedPointActivityReward': 'ReqGainAccumulatedPointActivityReward',
+        'gainMultiPointActivityReward': 'ReqGainMultiPointActivityReward',
+        'fetchRankPointLeaderboard': 'ReqFetchRankPointLeaderboard',
+        'gainRankPointReward': 'ReqGainRankPointReward',
+        'richmanActivityNextMove': 'ReqRichmanNextMove',
+        'richmanAcitivitySpecialMove': 'ReqRichmanSpecialMove',
+        'richmanActivityChestInfo': 'ReqRichmanChestInfo',
+        'createGameObserveAuth': 'ReqCreateGameObserveAuth',
+        'refreshGameObserveAuth': 'ReqRefreshGameObserveAuth',
+        'fetchActivityBuff': 'ReqCommon',
+        'upgradeActivityBuff': 'ReqUpgradeActivityBuff',
+        'upgradeActivityLevel': 'ReqUpgradeActivityLevel',
+        'receiveUpgradeActivityReward': 'ReqReceiveUpgradeActivityReward',
+        'upgradeChallenge': 'ReqCommon',
+        'refreshChallenge': 'ReqCommon',
+        'fetchChallengeInfo': 'ReqCommon',
+        'forceCompleteChallengeTask': 'ReqForceCompleteChallengeTask',
+        'fetchChallengeSeason': 'ReqCommon',
+        'receiveChallengeRankReward': 'ReqReceiveChallengeRankReward',
+        'fetchABMatchInfo': 'ReqCommon',
+        'buyInABMatch': 'ReqBuyInABMatch',
+        'receiveABMatchReward': 'ReqCommon',
+        'quitABMatch': 'ReqCommon',
+        'startUnifiedMatch': 'ReqStartUnifiedMatch',
+        'cancelUnifiedMatch': 'ReqCancelUnifiedMatch',
+        'fetchGamePointRank': 'ReqGamePointRank',
+        'fetchSelfGamePointRank': 'ReqGamePointRank',
+        'readSNS': 'ReqReadSNS',
+        'replySNS': 'ReqReplySNS',
+        'likeSNS': 'ReqLikeSNS',
+        'digMine': 'ReqDigMine',
+        'fetchLastPrivacy': 'ReqFetchLastPrivacy',
+        'checkPrivacy': 'ReqCheckPrivacy',
+        'fetchRPGBattleHistory': 'ReqFetchRPGBattleHistory',
+        'fetchRPGBattleHistoryV2': 'ReqFetchRPGBattleHistory',
+        'receiveRPGRewards': 'ReqReceiveRPGRewards',
+        'receiveRPGReward': 'ReqReceiveRPGReward',
+        'buyArenaTicket': 'ReqBuyArenaTicket',
+        'enterArena': 'ReqEnterArena',
+        'receiveArenaReward': 'ReqArenaReward',
+        'fetchOBToken': 'ReqFetchOBToken',
+        'receiveCharacterRewards': 'ReqReceiveCharacterRewards',
+        'feedActivityFeed': 'ReqFeedActivityFeed',
+        'sendActivityGiftToFriend': 'ReqSendActivityGiftToFriend',
+        'receiveActivityGift': 'ReqReceiveActivityGift',
+        'receiveAllActivityGift': 'ReqReceiveAllActivityGift',
+        'fetchFriendGiftActivityData': 'ReqFetchFriendGiftActivityData',
+        'openPreChestItem': 'ReqOpenPreChestItem',
+        'fetchVoteActivity': 'ReqFetchVoteActivity',
+        'voteActivity': 'ReqVoteActivity',
+        'unlockActivitySpot': 'ReqUnlockActivitySpot',
+        'unlockActivitySpotEnding': 'ReqUnlockActivitySpotEnding',
+        'receiveActivitySpotReward': 'ReqReceiveActivitySpotReward',
+        'deleteAccount': 'ReqCommon',
+        'cancelDeleteAccount': 'ReqCommon',
+        'logReport': 'ReqLogReport',
+        'bindOauth2': 'ReqBindOauth2',
+        'fetchOauth2Info': 'ReqFetchOauth2',
+        'setLoadingImage': 'ReqSetLoadingImage',
+        'fetchShopInterval': 'ReqCommon',
+        'fetchActivityInterval': 'ReqCommon',
+        'fetchRecentFriend': 'ReqCommon',
+        'openGacha': 'ReqOpenGacha',
+        'taskRequest': 'ReqTaskRequest',
+        'simulationActivityTrain': 'ReqSimulationActivityTrain',
+        'fetchSimulationGameRecord': 'ReqFetchSimulationGameRecord',
+        'startSimulationActivityGame': 'ReqStartSimulationActivityGame',
+        'fetchSimulationGameRank': 'ReqFetchSimulationGameRank',
+        'generateCombiningCraft': 'ReqGenerateCombiningCraft',
+        'moveCombiningCraft': 'ReqMoveCombiningCraft',
+        'combiningRecycleCraft': 'ReqCombiningRecycleCraft',
+        'recoverCombiningRecycle': 'ReqRecoverCombiningRecycle',
+        'finishCombiningOrder': 'ReqFinishCombiningOrder',
+        'upgradeVillageBuilding': 'ReqUpgradeVillageBuilding',
+        'receiveVillageBuildingReward': 'ReqReceiveVillageBuildingReward',
+        'startVillageTrip': 'ReqStartVillageTrip',
+        'receiveVillageTripReward': 'ReqReceiveVillageTripReward',
+        'completeVillageTask': 'ReqCompleteVillageTask',
+        'getFriendVillageData': 'ReqGetFriendVillageData',
+        'setVillageWorker': 'ReqSetVillageWorker',
+        'nextRoundVillage': 'ReqNextRoundVillage',
+        'resolveFestivalActivityProposal': 'ReqResolveFestivalActivityProposal',
+        'resolveFestivalActivityEvent': 'ReqResolveFestivalActivityEvent',
+        'buyFestivalProposal': 'ReqBuyFestivalProposal',
+        'islandActivityMove': 'ReqIslandActivityMove',
+        'islandActivityBuy': 'ReqIslandActivityBuy',
+        'islandActivitySell': 'ReqIslandActivitySell',
+        'islandActivityTidyBag': 'ReqIslandActivityTidyBag',
+        'islandActivityUnlockBagGrid': 'ReqIslandActivityUnlockBagGrid',
+        'createCustomizedContest': 'ReqCreateCustomizedContest',
+        'fetchManagerCustomizedContestList': 'ReqFetchmanagerCustomizedContestList',
+        'fetchManagerCustomizedContest': 'ReqFetchManagerCustomizedContest',
+        'updateManagerCustomizedContest': 'ReqUpdateManagerCustomizedContest',
+        'fetchContestPlayerRank': 'ReqFetchContestPlayerRank',
+        'fetchReadyPlayerList': 'ReqFetchReadyPlayerList',
+        'createGamePlan': 'ReqCreateGamePlan',
+        'generateContestManagerLoginCode': 'ReqCommon',
+        'amuletActivityFetchInfo': 'ReqAmuletActivityFetchInfo',
+        'amuletActivityFetchBrief': 'ReqAmuletActivityFetchBrief',
+        'amuletActivityStartGame': 'ReqAmuletActivityStartGame',
+        'amuletActivityOperate': 'ReqAmuletActivityOperate',
+        'amuletActivityChangeHands': 'ReqAmuletActivityChangeHands',
+        'amuletActivityUpgrade': 'ReqAmuletActivityUpgrade',
+        'amuletActivityBuy': 'ReqAmuletActivityBuy',
+        'amuletActivitySelectPack': 'ReqAmuletActivitySelectPack',
+        'amuletActivitySellEffect': 'ReqAmuletActivitySellEffect',
+        'amuletActivityEffectSort': 'ReqAmuletActivityEffectSort',
+        'amuletActivityGiveup': 'ReqAmuletActivityGiveup',
+        'amuletActivityRefreshShop': 'ReqAmuletActivityRefreshShop',
+        'amuletActivitySelectFreeEffect': 'ReqAmuletActivitySelectFreeEffect',
+        'amuletActivityUpgradeShopBuff': 'ReqAmuletActivityUpgradeShopBuff',
+        'amuletActivityEndShopping': 'ReqAmuletActivityEndShopping',
+        'amuletActivitySetSkillLevel': 'ReqAmuletActivitySetSkillLevel',
+        'amuletActivityMaintainInfo': 'ReqCommon',
+        'amuletActivitySelectRewardPack': 'ReqAmuletActivitySelectRewardPack',
+        'amuletActivityReceiveTaskReward': 'ReqAmuletActivityReceiveTaskReward',
+        'storyActivityUnlock': 'ReqStoryActivityUnlock',
+        'storyActivityUnlockEnding': 'ReqStoryActivityUnlockEnding',
+        'storyActivityReceiveEndingReward': 'ReqStoryActivityReceiveEndingReward',
+        'storyActivityReceiveFinishReward': 'ReqStoryActivityReceiveFinishReward',
+        'storyActivityReceiveAllFinishReward': 'ReqStoryActivityReceiveAllFinishReward',
+        'storyActivityUnlockEndingAndReceive': 'ReqStoryActivityUnlockEndingAndReceive',
+        'fetchActivityRank': 'ReqFetchActivityRank',
+        'setVerifiedHidden': 'ReqSetVerifiedHidden',
+        'fetchQuestionnaireList': 'ReqFetchQuestionnaireList',
+        'fetchQuestionnaireDetail': 'ReqFetchQuestionnaireDetail',
+        'submitQuestionnaire': 'ReqSubmitQuestionnaire',
+        'setFriendRoomRandomBotChar': 'ReqSetFriendRoomRandomBotChar',
+        'fetchAccountGameHuRecords': 'ReqFetchAccountGameHuRecords',
+        'fetchAccountInfoExtra': 'ReqFetchAccountInfoExtra',
+        'setAccountFavoriteHu': 'ReqSetAccountFavoriteHu',
+        'fetchSeerReport': 'ReqFetchSeerReport',
+        'createSeerReport': 'ReqCreateSeerReport',
+        'fetchSeerReportList': 'ReqCommon',
+        'fetchSeerInfo': 'ReqCommon',
+        'selectChestChooseUpActivity': 'ReqSelectChestChooseUp',
+        'generateAnnualReportToken': 'ReqGenerateAnnualReportToken',
+        'fetchAnnualReportInfo': 'ReqCommon',
+        'remarkFriend': 'ReqRemarkFriend',
+        'simV2ActivityFetchInfo': 'ReqSimV2ActivityFetchInfo',
+        'simV2ActivityStartSeason': 'ReqSimV2ActivityStartSeason',
+        'simV2ActivityTrain': 'ReqSimV2ActivityTrain',
+        'simV2ActivitySelectEvent': 'ReqSimV2ActivitySelectEvent',
+        'simV2ActivityStartMatch': 'ReqSimV2ActivityStartMatch',
+        'simV2ActivityEndMatch': 'ReqSimV2ActivityEndMatch',
+        'simV2ActivityGiveUp': 'ReqSimV2ActivityGiveUp',
+        'simV2ActivitySetUpgrade': 'ReqSimV2ActivitySetUpgrade',
+    }
+    _res = {
+        'fetchConnectionInfo': 'ResConnectionInfo',
+        'fetchQueueInfo': 'ResFetchQueueInfo',
+        'cancelQueue': 'ResCommon',
+        'openidCheck': 'ResOauth2Check',
+        'signup': 'ResSignupAccount',
+        'login': 'ResLogin',
+        'fetchInfo': 'ResFetchInfo',
+        'loginSuccess': 'ResCommon',
+        'fetchServerMaintenanceInfo': 'ResFetchServerMaintenanceInfo',
+        'emailLogin': 'ResLogin',
+        'oauth2Auth': 'ResOauth2Auth',
+        'oauth2Check': 'ResOauth2Check',
+        'oauth2Signup': 'ResOauth2Signup',
+        'oauth2Login': 'ResLogin',
+        'dmmPreLogin': 'ResDMMPreLogin',
+        'createPhoneVerifyCode': 'ResCommon',
+        'createEmailVerifyCode': 'ResCommon',
+        'verfifyCodeForSecure': 'ResVerfiyCodeForSecure',
+        'bindPhoneNumber': 'ResCommon',
+        'unbindPhoneNumber': 'ResCommon',
+        'fetchPhoneLoginBind': 'ResFetchPhoneLoginBind',
+        'createPhoneLoginBind': 'ResCommon',
+        'bindEmail': 'ResCommon',
+        'modifyPassword': 'ResCommon',
+        'bindAccount': 'ResCommon',
+        'logout': 'ResLogout',
+        'heatbeat': 'ResCommon',
+        'searchAccountByEid': 'ResSearchAccountbyEid',
+        'loginBeat': 'ResCommon',
+        'createNickname': 'ResCommon',
+        'modifyNickname': 'ResCommon',
+        'modifyBirthday': 'ResCommon',
+        'fetchRoom': 'ResSelfRoom',
+        'fetchGamingInfo': 'ResFetchGamingInfo',
+        'createRoom': 'ResCreateRoom',
+        'joinRoom': 'ResJoinRoom',
+        'leaveRoom': 'ResCommon',
+        'readyPlay': 'ResCommon',
+        'dressingStatus': 'ResCommon',
+        'startRoom': 'ResCommon',
+        'roomKickPlayer': 'ResCommon',
+        'modifyRoom': 'ResCommon',
+        'addRoomRobot': 'ResCommon',
+        'matchGame': 'ResCommon',
+        'cancelMatch': 'ResCommon',
+        'fetchAccountInfo': 'ResAccountInfo',
+        'changeAvatar': 'ResCommon',
+        'receiveVersionReward': 'ResCommon',
+        'fetchAccountStatisticInfo': 'ResAccountStatisticInfo',
+        'fetchAccountChallengeRankInfo': 'ResAccountChallengeRankInfo',
+        'fetchAccountCharacterInfo': 'ResAccountCharacterInfo',
+        'shopPurchase': 'ResShopPurchase',
+        'fetchGameRecord': 'ResGameRecord',
+        'readGameRecord': 'ResCommon',
+        'fetchGameRecordList': 'ResGameRecordList',
+        'fetchGameRecordListV2': 'ResGameRecordListV2',
+        'fetchNextGameRecordList': 'ResNextGameRecordList',
+        'fetchCollectedGameRecordList': 'ResCollectedGameRecordList',
+        'fetchGameRecordsDetail': 'ResGameRecordsDetail',
+        'fetchGameRecordsDetailV2': 'ResGameRecordsDetailV2',
+        'addCollectedGameRecord': 'ResAddCollectedGameRecord',
+        'removeCollectedGameRecord': 'ResRemoveCollectedGameRecord',
+        'changeCollectedGameRecordRemarks': 'ResChangeCollectedGameRecordRemarks',
+        'fetchLevelLeaderboard': 'ResLevelLeaderboard',
+        'fetchChallengeLeaderboard': 'ResChallengeLeaderboard',
+        'fetchMutiChallengeLevel': 'ResMutiChallengeLevel',
+        'fetchMultiAccountBrief': 'ResMultiAccountBrief',
+        'fetchFriendList': 'ResFriendList',
+        'fetchFriendApplyList': 'ResFriendApplyList',
+        'applyFriend': 'ResCommon',
+        'handleFriendApply': 'ResCommon',
+        'removeFriend': 'ResCommon',
+        'searchAccountById': 'ResSearchAccountById',
+        'searchAccountByPattern': 'ResSearchAccountByPattern',
+        'fetchAccountState': 'ResAccountStates',
+        'fetchBagInfo': 'ResBagInfo',
+        'useBagItem': 'ResCommon',
+        'openManualItem': 'ResCommon',
+        'openRandomRewardItem': 'ResOpenRandomRewardItem',
+        'openAllRewardItem': 'ResOpenAllRewardItem',
+        'composeShard': 'ResCommon',
+        'fetchAnnouncement': 'ResAnnouncement',
+        'readAnnouncement': 'ResCommon',
+        'fetchMailInfo': 'ResMailInfo',
+        'readMail': 'ResCommon',
+        'deleteMail': 'ResCommon',
+        'takeAttachmentFromMail': 'ResCommon',
+        'receiveAchievementReward': 'ResReceiveAchievementReward',
+        'receiveAchievementGroupReward': 'ResReceiveAchievementGroupReward',
+        'fetchAchievementRate': 'ResFetchAchievementRate',
+        'fetchAchievement': 'ResAchievement',
+        'buyShiLian': 'ResCommon',
+        'matchShiLian': 'ResCommon',
+        'goNextShiLian': 'ResCommon',
+        'updateClientValue': 'ResCommon',
+        'fetchClientValue': 'ResClientValue',
+        'clientMessage': 'ResCommon',
+        'fetchCurrentMatchInfo': 'ResCurrentMatchInfo',
+        'userComplain': 'ResCommon',
+        'fetchReviveCoinInfo': 'ResReviveCoinInfo',
+        'gainReviveCoin': 'ResCommon',
+        'fetchDailyTask': 'ResDailyTask',
+        'refreshDailyTask': 'ResRefreshDailyTask',
+        'useGiftCode': 'ResUseGiftCode',
+        'useSpecialGiftCode': 'ResUseSpecialGiftCode',
+        'fetchTitleList': 'ResTitleList',
+        'useTitle': 'ResCommon',
+        'sendClientMessage': 'ResCommon',
+        'fetchGameLiveInfo': 'ResGameLiveInfo',
+        'fetchGameLiveLeftSegment': 'ResGameLiveLeftSegment',
+        'fetchGameLiveList': 'ResGameLiveList',
+        'fetchCommentSetting': 'ResCommentSetting',
+        'updateCommentSetting': 'ResCommon',
+        'fetchCommentList': 'ResFetchCommentList',
+        'fetchCommentContent': 'ResFetchCommentContent',
+        'leaveComment': 'ResCommon',
+        'deleteComment': 'ResCommon',
+        'updateReadComment': 'ResCommon',
+        'fetchRollingNotice': 'ResFetchRollingNotice',
+        'fetchMaintainNotice': 'ResFetchMaintainNotice',
+        'fetchServerTime': 'ResServerTime',
+        'fetchPlatformProducts': 'ResPlatformBillingProducts',
+        'fetchRandomCharacter': 'ResRandomCharacter',
+        'setRandomCharacter': 'ResCommon',
+        'cancelGooglePlayOrder': 'ResCommon',
+        'openChest': 'ResOpenChest',
+        'buyFromChestShop': 'ResBuyFromChestShop',
+        'fetchDailySignInInfo': 'ResDailySignInInfo',
+        'doDailySignIn': 'ResCommon',
+        'doActivitySignIn': 'ResDoActivitySignIn',
+        'fetchCharacterInfo': 'ResCharacterInfo',
+        'updateCharacterSort': 'ResCommon',
+        'changeMainCharacter': 'ResCommon',
+        'changeCharacterSkin': 'ResCommon',
+        'changeCharacterView': 'ResCommon',
+        'setHiddenCharacter': 'ResSetHiddenCharacter',
+        'sendGiftToCharacter': 'ResSendGiftToCharacter',
+        'sellItem': 'ResCommon',
+        'fetchCommonView': 'ResCommonView',
+        'changeCommonView': 'ResCommon',
+        'saveCommonViews': 'ResCommon',
+        'fetchCommonViews': 'ResCommonViews',
+        'fetchAllCommonViews': 'ResAllcommonViews',
+        'useCommonView': 'ResCommon',
+        'upgradeCharacter': 'ResUpgradeCharacter',
+        'addFinishedEnding': 'ResCommon',
+        'receiveEndingReward': 'ResCommon',
+        'gameMasterCommand': 'ResCommon',
+        'fetchShopInfo': 'ResShopInfo',
+        'buyFromShop': 'ResBuyFromShop',
+        'buyFromZHP': 'ResCommon',
+        'refreshZHPShop': 'ResRefreshZHPShop',
+        'fetchMonthTicketInfo': 'ResMonthTicketInfo',
+        'payMonthTicket': 'ResPayMonthTicket',
+        'exchangeCurrency': 'ResCommon',
+        'exchangeChestStone': 'ResCommon',
+        'exchangeDiamond': 'ResCommon',
+        'fetchServerSettings': 'ResServerSettings',
+        'fetchAccountSettings': 'ResAccountSettings',
+        'updateAccountSettings': 'ResCommon',
+        'fetchModNicknameTime': 'ResModNicknameTime',
+        'createWechatNativeOrder': 'ResCreateWechatNativeOrder',
+        'createWechatAppOrder': 'ResCreateWechatAppOrder',
+        'createAlipayOrder': 'ResCreateAlipayOrder',
+        'createAlipayScanOrder': 'ResCreateAlipayScanOrder',
+        'createAlipayAppOrder': 'ResCreateAlipayAppOrder',
+        'createJPCreditCardOrder': 'ResCreateJPCreditCardOrder',
+        'createJPPaypalOrder': 'ResCreateJPPaypalOrder',
+        'createJPAuOrder': 'ResCreateJPAuOrder',
+        'createJPDocomoOrder': 'ResCreateJPDocomoOrder',
+        'createJPWebMoneyOrder': 'ResCreateJPWebMoneyOrder',
+        'createJPSoftbankOrder': 'ResCreateJPSoftbankOrder',
+        'createJPPayPayOrder': 'ResCreateJPPayPayOrder',
+        'fetchJPCommonCreditCardOrder': 'ResFetchJPCommonCreditCardOrder',
+        'createJPGMOOrder': 'ResCreateJPGMOOrder',
+        'createENPaypalOrder': 'ResCreateENPaypalOrder',
+        'createENMasterCardOrder': 'ResCreateENMasterCardOrder',
+        'createENVisaOrder': 'ResCreateENVisaOrder',
+        'createENJCBOrder': 'ResCreateENJCBOrder',
+        'createENAlipayOrder': 'ResCreateENAlipayOrder',
+        'createKRPaypalOrder': 'ResCreateKRPaypalOrder',
+        'createKRMasterCardOrder': 'ResCreateKRMasterCardOrder',
+        'createKRVisaOrder': 'ResCreateKRVisaOrder',
+        'createKRJCBOrder': 'ResCreateKRJCBOrder',
+        'createKRAlipayOrder': 'ResCreateKRAlipayOrder',
+        'createDMMOrder': 'ResCreateDmmOrder',
+        'createIAPOrder': 'ResCreateIAPOrder',
+        'createSteamOrder': 'ResCreateSteamOrder',
+        'verifySteamOrder': 'ResCommon',
+        'createMyCardAndroidOrder': 'ResCreateMyCardOrder',
+        'createMyCardWebOrder': 'ResCreateMyCardOrder',
+        'createPaypalOrder': 'ResCreatePaypalOrder',
+        'createXsollaOrder': 'ResCreateXsollaOrder',
+        'createXsollaV4Order': 'ResCreateXsollaOrder',
+        'verifyMyCardOrder': 'ResCommon',
+        'verificationIAPOrder': 'ResVerificationIAPOrder',
+        'createYostarSDKOrder': 'ResCreateYostarOrder',
+        'createBillingOrder': 'ResCreateBillingOrder',
+        'solveGooglePlayOrder': 'ResCommon',
+        'solveGooglePayOrderV3': 'ResCommon',
+        'deliverAA32Order': 'ResCommon',
+        'fetchMisc': 'ResMisc',
+        'modifySignature': 'ResCommon',
+        'fetchIDCardInfo': 'ResIDCardInfo',
+        'updateIDCardInfo': 'ResCommon',
+        'fetchVipReward': 'ResVipReward',
+        'gainVipReward': 'ResCommon',
+        'fetchRefundOrder': 'ResFetchRefundOrder',
+        'fetchCustomizedContestList': 'ResFetchCustomizedContestList',
+        'fetchCustomizedContestAuthInfo': 'ResFetchCustomizedContestAuthInfo',
+        'enterCustomizedContest': 'ResEnterCustomizedContest',
+        'leaveCustomizedContest': 'ResCommon',
+        'fetchCustomizedContestOnlineInfo': 'ResFetchCustomizedContestOnlineInfo',
+        'fetchCustomizedContestByContestId': 'ResFetchCustomizedContestByContestId',
+        'signupCustomizedContest': 'ResSignupCustomizedContest',
+        'startCustomizedContest': 'ResCommon',
+        'stopCustomizedContest': 'ResCommon',
+        'joinCustomizedContestChatRoom': 'ResJoinCustomizedContestChatRoom',
+        'leaveCustomizedContestChatRoom': 'ResCommon',
+        'sayChatMessage': 'ResCommon',
+        'fetchCustomizedContestGameRecords': 'ResFetchCustomizedContestGameRecords',
+        'fetchCustomizedContestGameLiveList': 'ResFetchCustomizedContestGameLiveList',
+        'followCustomizedContest': 'ResCommon',
+        'unfollowCustomizedContest': 'ResCommon',
+        'fetchActivityList': 'ResActivityList',
+        'fetchAccountActivityData': 'ResAccountActivityData',
+        'exchangeActivityItem': 'ResExchangeActivityItem',
+        'completeActivityTask': 'ResCommon',
+        'completeActivityTaskBatch': 'ResCommon',
+        'completeActivityFlipTask': 'ResCommon',
+        'completePeriodActivityTask': 'ResCommon',
+        'completePeriodActivityTaskBatch': 'ResCommon',
+        'completeRandomActivityTask': 'ResCommon',
+        'completeRandomActivityTaskBatch': 'ResCommon',
+        'receiveActivityFlipTask': 'ResReceiveActivityFlipTask',
+        'completeSegmentTaskReward': 'ResCompleteSegmentTaskReward',
+        'fetchActivityFlipInfo': 'ResFetchActivityFlipInfo',
+        'gainAccumulatedPointActivityReward': 'ResCommon',
+        'gainMultiPointActivityReward': 'ResCommon',
+        'fetchRankPointLeaderboard': 'ResFetchRankPointLeaderboard',
+        'gainRankPointReward': 'ResCommon',
+        'richmanActivityNextMove': 'ResRichmanNextMove',
+        'richmanAcitivitySpecialMove': 'ResRichmanNextMove',
+        'richmanActivityChestInfo': 'ResRichmanChestInfo',
+        'createGameObserveAuth': 'ResCreateGameObserveAuth',
+        'refreshGameObserveAuth': 'ResRefreshGameObserveAuth',
+        'fetchActivityBuff': 'ResActivityBuff',
+        'upgradeActivityBuff': 'ResActivityBuff',
+        'upgradeActivityLevel': 'ResUpgradeActivityLevel',
+        'receiveUpgradeActivityReward': 'ResReceiveUpgradeActivityReward',
+        'upgradeChallenge': 'ResUpgradeChallenge',
+        'refreshChallenge': 'ResRefreshChallenge',
+        'fetchChallengeInfo': 'ResFetchChallengeInfo',
+        'forceCompleteChallengeTask': 'ResCommon',
+        'fetchChallengeSeason': 'ResChallengeSeasonInfo',
+        'receiveChallengeRankReward': 'ResReceiveChallengeRankReward',
+        'fetchABMatchInfo': 'ResFetchABMatch',
+        'buyInABMatch': 'ResCommon',
+        'receiveABMatchReward': 'ResCommon',
+        'quitABMatch': 'ResCommon',
+        'startUnifiedMatch': 'ResCommon',
+        'cancelUnifiedMatch': 'ResCommon',
+        'fetchGamePointRank': 'ResGamePointRank',
+        'fetchSelfGamePointRank': 'ResFetchSelfGamePointRank',
+        'readSNS': 'ResReadSNS',
+        'replySNS': 'ResReplySNS',
+        'likeSNS': 'ResLikeSNS',
+        'digMine': 'ResDigMine',
+        'fetchLastPrivacy': 'ResFetchLastPrivacy',
+        'checkPrivacy': 'ResCommon',
+        'fetchRPGBattleHistory': 'ResFetchRPGBattleHistory',
+        'fetchRPGBattleHistoryV2': 'ResFetchRPGBattleHistoryV2',
+        'receiveRPGRewards': 'ResReceiveRPGRewards',
+        'receiveRPGReward': 'ResReceiveRPGRewards',
+        'buyArenaTicket': 'ResCommon',
+        'enterArena': 'ResCommon',
+        'receiveArenaReward': 'ResArenaReward',
+        'fetchOBToken': 'ResFetchOBToken',
+        'receiveCharacterRewards': 'ResReceiveCharacterRewards',
+        'feedActivityFeed': 'ResFeedActivityFeed',
+        'sendActivityGiftToFriend': 'ResSendActivityGiftToFriend',
+        'receiveActivityGift': 'ResCommon',
+        'receiveAllActivityGift': 'ResReceiveAllActivityGift',
+        'fetchFriendGiftActivityData': 'ResFetchFriendGiftActivityData',
+        'openPreChestItem': 'ResOpenPreChestItem',
+        'fetchVoteActivity': 'ResFetchVoteActivity',
+        'voteActivity': 'ResVoteActivity',
+        'unlockActivitySpot': 'ResCommon',
+        'unlockActivitySpotEnding': 'ResCommon',
+        'receiveActivitySpotReward': 'ResReceiveActivitySpotReward',
+        'deleteAccount': 'ResDeleteAccount',
+        'cancelDeleteAccount': 'ResCommon',
+        'logReport': 'ResCommon',
+        'bindOauth2': 'ResCommon',
+        'fetchOauth2Info': 'ResFetchOauth2',
+        'setLoadingImage': 'ResCommon',
+        'fetchShopInterval': 'ResFetchShopInterval',
+        'fetchActivityInterval': 'ResFetchActivityInterval',
+        'fetchRecentFriend': 'ResFetchrecentFriend',
+        'openGacha': 'ResOpenGacha',
+        'taskRequest': 'ResCommon',
+        'simulationActivityTrain': 'ResSimulationActivityTrain',
+        'fetchSimulationGameRecord': 'ResFetchSimulationGameRecord',
+        'startSimulationActivityGame': 'ResStartSimulationActivityGame',
+        'fetchSimulationGameRank': 'ResFetchSimulationGameRank',
+        'generateCombiningCraft': 'ResGenerateCombiningCraft',
+        'moveCombiningCraft': 'ResMoveCombiningCraft',
+        'combiningRecycleCraft': 'ResCombiningRecycleCraft',
+        'recoverCombiningRecycle': 'ResRecoverCombiningRecycle',
+        'finishCombiningOrder': 'ResFinishCombiningOrder',
+        'upgradeVillageBuilding': 'ResCommon',
+        'receiveVillageBuildingReward': 'ResReceiveVillageBuildingReward',
+        'startVillageTrip': 'ResCommon',
+        'receiveVillageTripReward': 'ResReceiveVillageTripReward',
+        'completeVillageTask': 'ResCompleteVillageTask',
+        'getFriendVillageData': 'ResGetFriendVillageData',
+        'setVillageWorker': 'ResSetVillageWorker',
+        'nextRoundVillage': 'ResNextRoundVillage',
+        'resolveFestivalActivityProposal': 'ResResolveFestivalActivityProposal',
+        'resolveFestivalActivityEvent': 'ResResolveFestivalActivityEvent',
+        'buyFestivalProposal': 'ResBuyFestivalProposal',
+        'islandActivityMove': 'ResCommon',
+        'islandActivityBuy': 'ResCommon',
+        'islandActivitySell': 'ResCommon',
+        'islandActivityTidyBag': 'ResCommon',
+        'islandActivityUnlockBagGrid': 'ResCommon',
+        'createCustomizedContest': 'ResCreateCustomizedContest',
+        'fetchManagerCustomizedContestList': 'ResFetchManagerCustomizedContestList',
+        'fetchManagerCustomizedContest': 'ResFetchManagerCustomizedContest',
+        'updateManagerCustomizedContest': 'ResCommon',
+        'fetchContestPlayerRank': 'ResFetchContestPlayerRank',
+        'fetchReadyPlayerList': 'ResFetchReadyPlayerList',
+        'createGamePlan': 'ResCommon',
+        'generateContestManagerLoginCode': 'ResGenerateContestManagerLoginCode',
+        'amuletActivityFetchInfo': 'ResAmuletActivityFetchInfo',
+        'amuletActivityFetchBrief': 'ResAmuletActivityFetchBrief',
+        'amuletActivityStartGame': 'ResAmuletActivityStartGame',
+        'amuletActivityOperate': 'ResAmuletActivityOperate',
+        'amuletActivityChangeHands': 'ResAmuletActivityChangeHands',
+        'amuletActivityUpgrade': 'ResAmuletActivityUpgrade',
+        'amuletActivityBuy': 'ResAmuletActivityBuy',
+        'amuletActivitySelectPack': 'ResAmuletActivitySelectPack',
+        'amuletActivitySellEffect': 'ResAmuletActivitySellEffect',
+        'amuletActivityEffectSort': 'ResCommon',
+        'amuletActivityGiveup': 'ResCommon',
+        'amuletActivityRefreshShop': 'ResAmuletActivityRefreshShop',
+        'amuletActivitySelectFreeEffect': 'ResAmuletActivitySelectFreeEffect',
+        'amuletActivityUpgradeShopBuff': 'ResAmuletActivityUpgradeShopBuff',
+        'amuletActivityEndShopping': 'ResAmuletActivityEndShopping',
+        'amuletActivitySetSkillLevel': 'ResCommon',
+        'amuletActivityMaintainInfo': 'ResAmuletActivityMaintainInfo',
+        'amuletActivitySelectRewardPack': 'ResAmuletActivitySelectRewardPack',
+        'amuletActivityReceiveTaskReward': 'ResAmuletActivityReceiveTaskReward',
+        'storyActivityUnlock': 'ResCommon',
+        'storyActivityUnlockEnding': 'ResCommon',
+        'storyActivityReceiveEndingReward': 'ResStoryReward',
+        'storyActivityReceiveFinishReward': 'ResStoryReward',
+        'storyActivityReceiveAllFinishReward': 'ResStoryReward',
+        'storyActivityUnlockEndingAndReceive': 'ResStoryActivityUnlockEndingAndReceive',
+        'fetchActivityRank': 'ResFetchActivityRank',
+        'setVerifiedHidden': 'ResCommon',
+        'fetchQuestionnaireList': 'ResFetchQuestionnaireList',
+        'fetchQuestionnaireDetail': 'ResFetchQuestionnaireDetail',
+        'submitQuestionnaire': 'ResCommon',
+        'setFriendRoomRandomBotChar': 'ResCommon',
+        'fetchAccountGameHuRecords': 'ResFetchAccountGameHuRecords',
+        'fetchAccountInfoExtra': 'ResFetchAccountInfoExtra',
+        'setAccountFavoriteHu': 'ResCommon',
+        'fetchSeerReport': 'ResFetchSeerReport',
+        'createSeerReport': 'ResCreateSeerReport',
+        'fetchSeerReportList': 'ResFetchSeerReportList',
+        'fetchSeerInfo': 'ResFetchSeerInfo',
+        'selectChestChooseUpActivity': 'ReqCommon',
+        'generateAnnualReportToken': 'ResGenerateAnnualReportToken',
+        'fetchAnnualReportInfo': 'ResFetchAnnualReportInfo',
+        'remarkFriend': 'ResCommon',
+        'simV2ActivityFetchInfo': 'ResSimV2ActivityFetchInfo',
+        'simV2ActivityStartSeason': 'ResSimV2ActivityStartSeason',
+        'simV2ActivityTrain': 'ResSimV2ActivityTrain',
+        'simV2ActivitySelectEvent': 'ResSimV2ActivitySelectEvent',
+        'simV2ActivityStartMatch': 'ResSimV2ActivityStartMatch',
+        'simV2ActivityEndMatch': 'ResSimV2ActivityEndMatch',
+        'simV2ActivityGiveUp': 'ResCommon',
+        'simV2ActivitySetUpgrade': 'ResCommon',
+    }
+    _methods = {
+        'fetch_connection_info': 'fetchConnectionInfo',
+        'fetch_queue_info': 'fetchQueueInfo',
+        'cancel_queue': 'cancelQueue',
+        'openid_check': 'openidCheck',
+        'signup': 'signup',
+        'login': 'login',
+        'fetch_info': 'fetchInfo',
+        'login_success': 'loginSuccess',
+        'fetch_server_maintenance_info': 'fetchServerMaintenanceInfo',
+        'email_login': 'emailLogin',
+        'oauth2_auth': 'oauth2Auth',
+        'oauth2_check': 'oauth2Check',
+        'oauth2_signup': 'oauth2Signup',
+        'oauth2_login': 'oauth2Login',
+        'dmm_pre_login': 'dmmPreLogin',
+        'create_phone_verify_code': 'createPhoneVerifyCode',
+        'create_email_verify_code': 'createEmailVerifyCode',
+        'verfify_code_for_secure': 'verfifyCodeForSecure',
+        'bind_phone_number': 'bindPhoneNumber',
+        'unbind_phone_number': 'unbindPhoneNumber',
+        'fetch_phone_login_bind': 'fetchPhoneLoginBind',
+        'create_phone_login_bind': 'createPhoneLoginBind',
+        'bind_email': 'bindEmail',
+        'modify_password': 'modifyPassword',
+        'bind_account': 'bindAccount',
+        'logout': 'logout',
+        'heatbeat': 'heatbeat',
+        'search_account_by_eid': 'searchAccountByEid',
+        'login_beat': 'loginBeat',
+        'create_nickname': 'createNickname',
+        'modify_nickname': 'modifyNickname',
+        'modify_birthday': 'modifyBirthday',
+        'fetch_room': 'fetchRoom',
+        'fetch_gaming_info': 'fetchGamingInfo',
+        'create_room': 'createRoom',
+        'join_room': 'joinRoom',
+        'leave_room': 'leaveRoom',
+        'ready_play': 'readyPlay',
+        'dressing_status': 'dressingStatus',
+        'start_room': 'startRoom',
+        'room_kick_player': 'roomKickPlayer',
+        'modify_room': 'modifyRoom',
+        'add_room_robot': 'addRoomRobot',
+        'match_game': 'matchGame',
+        'cancel_match': 'cancelMatch',
+        'fetch_account_info': 'fetchAccountInfo',
+        'change_avatar': 'changeAvatar',
+        'receive_version_reward': 'receiveVersionReward',
+        'fetch_account_statistic_info': 'fetchAccountStatisticInfo',
+        'fetch_account_challenge_rank_info': 'fetchAccountChallengeRankInfo',
+        'fetch_account_character_info': 'fetchAccountCharacterInfo',
+        'shop_purchase': 'shopPurchase',
+        'fetch_game_record': 'fetchGameRecord',
+        'read_game_record': 'readGameRecord',
+        'fetch_game_record_list': 'fetchGameRecordList',
+        'fetch_game_record_list_v2': 'fetchGameRecordListV2',
+        'fetch_next_game_record_list': 'fetchNextGameRecordList',
+        'fetch_collected_game_record_list': 'fetchCollectedGameRecordList',
+        'fetch_game_records_detail': 'fetchGameRecordsDetail',
+        'fetch_game_records_detail_v2': 'fetchGameRecordsDetailV2',
+        'add_collected_game_record': 'addCollectedGameRecord',
+        'remove_collected_game_record': 'removeCollectedGameRecord',
+        'change_collected_game_record_remarks': 'changeCollectedGameRecordRemarks',
+        'fetch_level_leaderboard': 'fetchLevelLeaderboard',
+        'fetch_challenge_leaderboard': 'fetchChallengeLeaderboard',
+        'fetch_muti_challenge_level': 'fetchMutiChallengeLevel',
+        'fetch_multi_account_brief': 'fetchMultiAccountBrief',
+        'fetch_friend_list': 'fetchFriendList',
+        'fetch_friend_apply_list': 'fetchFriendApplyList',
+        'apply_friend': 'applyFriend',
+        'handle_friend_apply': 'handleFriendApply',
+        'remove_friend': 'removeFriend',
+        'search_account_by_id': 'searchAccountById',
+        'search_account_by_pattern': 'searchAccountByPattern',
+        'fetch_account_state': 'fetchAccountState',
+        'fetch_bag_info': 'fetchBagInfo',
+        'use_bag_item': 'useBagItem',
+        'open_manual_item': 'openManualItem',
+        'open_random_reward_item': 'openRandomRewardItem',
+        'open_all_reward_item': 'openAllRewardItem',
+        'compose_shard': 'composeShard',
+        'fetch_announcement': 'fetchAnnouncement',
+        'read_announcement': 'readAnnouncement',
+        'fetch_mail_info': 'fetchMailInfo',
+        'read_mail': 'readMail',
+        'delete_mail': 'deleteMail',
+        'take_attachment_from_mail': 'takeAttachmentFromMail',
+        'receive_achievement_reward': 'receiveAchievementReward',
+        'receive_achievement_group_reward': 'receiveAchievementGroupReward',
+        'fetch_achievement_rate': 'fetchAchievementRate',
+        'fetch_achievement': 'fetchAchievement',
+        'buy_shi_lian': 'buyShiLian',
+        'match_shi_lian': 'matchShiLian',
+        'go_next_shi_lian': 'goNextShiLian',
+        'update_client_value': 'updateClientValue',
+        'fetch_client_value': 'fetchClientValue',
+        'client_message': 'clientMessage',
+        'fetch_current_match_info': 'fetchCurrentMatchInfo',
+        'user_complain': 'userComplain',
+        'fetch_revive_coin_info': 'fetchReviveCoinInfo',
+        'gain_revive_coin': 'gainReviveCoin',
+        'fetch_daily_task': 'fetchDailyTask',
+        'refresh_daily_task': 'refreshDailyTask',
+        'use_gift_code': 'useGiftCode',
+        'use_special_gift_code': 'useSpecialGiftCode',
+        'fetch_title_list': 'fetchTitleList',
+        'use_title': 'useTitle',
+        'send_client_message': 'sendClientMessage',
+        'fetch_game_live_info': 'fetchGameLiveInfo',
+        'fetch_game_live_left_segment': 'fetchGameLiveLeftSegment',
+        'fetch_game_live_list': 'fetchGameLiveList',
+        'fetch_comment_setting': 'fetchCommentSetting',
+        'update_comment_setting': 'updateCommentSetting',
+        'fetch_comment_list': 'fetchCommentList',
+        'fetch_comment_content': 'fetchCommentContent',
+        'leave_comment': 'leaveComment',
+        'delete_comment': 'deleteComment',
+        'update_read_comment': 'updateReadComment',
+        'fetch_rolling_notice': 'fetchRollingNotice',
+        'fetch_maintain_notice': 'fetchMaintainNotice',
+        'fetch_server_time': 'fetchServerTime',
+        'fetch_platform_products': 'fetchPlatformProducts',
+        'fetch_random_character': 'fetchRandomCharacter',
+        'set_random_character': 'setRandomCharacter',
+        'cancel_google_play_order': 'cancelGooglePlayOrder',
+        'open_chest': 'openChest',
+        'buy_from_chest_shop': 'buyFromChestShop',
+        'fetch_daily_sign_in_info': 'fetchDailySignInInfo',
+        'do_daily_sign_in': 'doDailySignIn',
+        'do_activity_sign_in': 'doActivitySignIn',
+        'fetch_character_info': 'fetchCharacterInfo',
+        'update_character_sort': 'updateCharacterSort',
+        'change_main_character': 'changeMainCharacter',
+        'change_character_skin': 'changeCharacterSkin',
+        'change_character_view': 'changeCharacterView',
+        'set_hidden_character': 'setHiddenCharacter',
+        'send_gift_to_character': 'sendGiftToCharacter',
+        'sell_item': 'sellItem',
+        'fetch_common_view': 'fetchCommonView',
+        'change_common_view': 'changeCommonView',
+        'save_common_views': 'saveCommonViews',
+        'fetch_common_views': 'fetchCommonViews',
+        'fetch_all_common_views': 'fetchAllCommonViews',
+        'use_common_view': 'useCommonView',
+        'upgrade_character': 'upgradeCharacter',
+        'add_finished_ending': 'addFinishedEnding',
+        'receive_ending_reward': 'receiveEndingReward',
+        'game_master_command': 'gameMasterCommand',
+        'fetch_shop_info': 'fetchShopInfo',
+        'buy_from_shop': 'buyFromShop',
+        'buy_from_zhp': 'buyFromZHP',
+        'refresh_zhp_shop': 'refreshZHPShop',
+        'fetch_month_ticket_info': 'fetchMonthTicketInfo',
+        'pay_month_ticket': 'payMonthTicket',
+        'exchange_currency': 'exchangeCurrency',
+        'exchange_chest_stone': 'exchangeChestStone',
+        'exchange_diamond': 'exchangeDiamond',
+        'fetch_server_settings': 'fetchServerSettings',
+        'fetch_account_settings': 'fetchAccountSettings',
+        'update_account_settings': 'updateAccountSettings',
+        'fetch_mod_nickname_time': 'fetchModNicknameTime',
+        'create_wechat_native_order': 'createWechatNativeOrder',
+        'create_wechat_app_order': 'createWechatAppOrder',
+        'create_alipay_order': 'createAlipayOrder',
+        'create_alipay_scan_order': 'createAlipayScanOrder',
+        'create_alipay_app_order': 'createAlipayAppOrder',
+        'create_jp_credit_card_order': 'createJPCreditCardOrder',
+        'create_jp_paypal_order': 'createJPPaypalOrder',
+        'create_jp_au_order': 'createJPAuOrder',
+        'create_jp_docomo_order': 'createJPDocomoOrder',
+        'create_jp_web_money_order': 'createJPWebMoneyOrder',
+        'create_jp_softbank_order': 'createJPSoftbankOrder',
+        'create_jp_pay_pay_order': 'createJPPayPayOrder',
+        'fetch_jp_common_credit_card_order': 'fetchJPCommonCreditCardOrder',
+        'create_jpgmo_order': 'createJPGMOOrder',
+        'create_en_paypal_order': 'createENPaypalOrder',
+        'create_en_master_card_order': 'createENMasterCardOrder',
+        'create_en_visa_order': 'createENVisaOrder',
+        'create_enjcb_order': 'createENJCBOrder',
+        'create_en_alipay_order': 'createENAlipayOrder',
+        'create_kr_paypal_order': 'createKRPaypalOrder',
+        'create_kr_master_card_order': 'createKRMasterCardOrder',
+        'create_kr_visa_order': 'createKRVisaOrder',
+        'create_krjcb_order': 'createKRJCBOrder',
+        'create_kr_alipay_order': 'createKRAlipayOrder',
+        'create_dmm_order': 'createDMMOrder',
+        'create_iap_order': 'createIAPOrder',
+        'create_steam_order': 'createSteamOrder',
+        'verify_steam_order': 'verifySteamOrder',
+        'create_my_card_android_order': 'createMyCardAndroidOrder',
+        'create_my_card_web_order': 'createMyCardWebOrder',
+        'create_paypal_order': 'createPaypalOrder',
+        'create_xsolla_order': 'createXsollaOrder',
+        'create_xsolla_v4_order': 'createXsollaV4Order',
+        'verify_my_card_order': 'verifyMyCardOrder',
+        'verification_iap_order': 'verificationIAPOrder',
+        'create_yostar_sdk_order': 'createYostarSDKOrder',
+        'create_billing_order': 'createBillingOrder',
+        'solve_google_play_order': 'solveGooglePlayOrder',
+        'solve_google_pay_order_v3': 'solveGooglePayOrderV3',
+        'deliver_aa32_order': 'deliverAA32Order',
+        'fetch_misc': 'fetchMisc',
+        'modify_signature': 'modifySignature',
+        'fetch_id_card_info': 'fetchIDCardInfo',
+        'update_id_card_info': 'updateIDCardInfo',
+        'fetch_vip_reward': 'fetchVipReward',
+        'gain_vip_reward': 'gainVipReward',
+        'fetch_refund_order': 'fetchRefundOrder',
+        'fetch_customized_contest_list': 'fetchCustomizedContestList',
+        'fetch_customized_contest_auth_info': 'fetchCustomizedContestAuthInfo',
+        'enter_customized_contest': 'enterCustomizedContest',
+        'leave_customized_contest': 'leaveCustomizedContest',
+        'fetch_customized_contest_online_info': 'fetchCustomizedContestOnlineInfo',
+        'fetch_customized_contest_by_contest_id': 'fetchCustomizedContestByContestId',
+        'signup_customized_contest': 'signupCustomizedContest',
+        'start_customized_contest': 'startCustomizedContest',
+        'stop_customized_contest': 'stopCustomizedContest',
+        'join_customized_contest_chat_room': 'joinCustomizedContestChatRoom',
+        'leave_customized_contest_chat_room': 'leaveCustomizedContestChatRoom',
+        'say_chat_message': 'sayChatMessage',
+        'fetch_customized_contest_game_records': 'fetchCustomizedContestGameRecords',
+        'fetch_customized_contest_game_live_list': 'fetchCustomizedContestGameLiveList',
+        'follow_customized_contest': 'followCustomizedContest',
+        'unfollow_customized_contest': 'unfollowCustomizedContest',
+        'fetch_activity_list': 'fetchActivityList',
+        'fetch_account_activity_data': 'fetchAccountActivityData',
+        'exchange_activity_item': 'exchangeActivityItem',
+        'complete_activity_task': 'completeActivityTask',
+        'complete_activity_task_batch': 'completeActivityTaskBatch',
+        'complete_activity_flip_task': 'completeActivityFlipTask',
+        'complete_period_activity_task': 'completePeriodActivityTask',
+        'complete_period_activity_task_batch': 'completePeriodActivityTaskBatch',
+        'complete_random_activity_task': 'completeRandomActivityTask',
+        'complete_random_activity_task_batch': 'completeRandomActivityTaskBatch',
+        'receive_activity_flip_task': 'receiveActivityFlipTask',
+        'complete_segment_task_reward': 'completeSegmentTaskReward',
+        'fetch_activity_flip_info': 'fetchActivityFlipInfo',
+        'gain_accumulated_point_activity_reward': 'gainAccumulatedPointActivityReward',
+        'gain_multi_point_activity_reward': 'gainMultiPointActivityReward',
+        'fetch_rank_point_leaderboard': 'fetchRankPointLeaderboard',
+        'gain_rank_point_reward': 'gainRankPointReward',
+        'richman_activity_next_move': 'richmanActivityNextMove',
+        'richman_acitivity_special_move': 'richmanAcitivitySpecialMove',
+        'richman_activity_chest_info': 'richmanActivityChestInfo',
+        'create_game_observe_auth': 'createGameObserveAuth',
+        'refresh_game_observe_auth': 'refreshGameObserveAuth',
+        'fetch_activity_buff': 'fetchActivityBuff',
+        'upgrade_activity_buff': 'upgradeActivityBuff',
+        'upgrade_activity_level': 'upgradeActivityLevel',
+        'receive_upgrade_activity_reward': 'receiveUpgradeActivityReward',
+        'upgrade_challenge': 'upgradeChallenge',
+        'refresh_challenge': 'refreshChallenge',
+        'fetch_challenge_info': 'fetchChallengeInfo',
+        'force_complete_challenge_task': 'forceCompleteChallengeTask',
+        'fetch_challenge_season': 'fetchChallengeSeason',
+        'receive_challenge_rank_reward': 'receiveChallengeRankReward',
+        'fetch_ab_match_info': 'fetchABMatchInfo',
+        'buy_in_ab_match': 'buyInABMatch',
+        'receive_ab_match_reward': 'receiveABMatchReward',
+        'quit_ab_match': 'quitABMatch',
+        'start_unified_match': 'startUnifiedMatch',
+        'cancel_unified_match': 'cancelUnifiedMatch',
+        'fetch_game_point_rank': 'fetchGamePointRank',
+        'fetch_self_game_point_rank': 'fetchSelfGamePointRank',
+        'read_sns': 'readSNS',
+        'reply_sns': 'replySNS',
+        'like_sns': 'likeSNS',
+        'dig_mine': 'digMine',
+        'fetch_last_privacy': 'fetchLastPrivacy',
+        'check_privacy': 'checkPrivacy',
+        'fetch_rpg_battle_history': 'fetchRPGBattleHistory',
+        'fetch_rpg_battle_history_v2': 'fetchRPGBattleHistoryV2',
+        'receive_rpg_rewards': 'receiveRPGRewards',
+        'receive_rpg_reward': 'receiveRPGReward',
+        'buy_arena_ticket': 'buyArenaTicket',
+        'enter_arena': 'enterArena',
+        'receive_arena_reward': 'receiveArenaReward',
+        'fetch_ob_token': 'fetchOBToken',
+        'receive_character_rewards': 'receiveCharacterRewards',
+        'feed_activity_feed': 'feedActivityFeed',
+        'send_activity_gift_to_friend': 'sendActivityGiftToFriend',
+        'receive_activity_gift': 'receiveActivityGift',
+        'receive_all_activity_gift': 'receiveAllActivityGift',
+        'fetch_friend_gift_activity_data': 'fetchFriendGiftActivityData',
+        'open_pre_chest_item': 'openPreChestItem',
+        'fetch_vote_activity': 'fetchVoteActivity',
+        'vote_activity': 'voteActivity',
+        'unlock_activity_spot': 'unlockActivitySpot',
+        'unlock_activity_spot_ending': 'unlockActivitySpotEnding',
+        'receive_activity_spot_reward': 'receiveActivitySpotReward',
+        'delete_account': 'deleteAccount',
+        'cancel_delete_account': 'cancelDeleteAccount',
+        'log_report': 'logReport',
+        'bind_oauth2': 'bindOauth2',
+        'fetch_oauth2_info': 'fetchOauth2Info',
+        'set_loading_image': 'setLoadingImage',
+        'fetch_shop_interval': 'fetchShopInterval',
+        'fetch_activity_interval': 'fetchActivityInterval',
+        'fetch_recent_friend': 'fetchRecentFriend',
+        'open_gacha': 'openGacha',
+        'task_request': 'taskRequest',
+        'simulation_activity_train': 'simulationActivityTrain',
+        'fetch_simulation_game_record': 'fetchSimulationGameRecord',
+        'start_simulation_activity_game': 'startSimulationActivityGame',
+        'fetch_simulation_game_rank': 'fetchSimulationGameRank',
+        'generate_combining_craft': 'generateCombiningCraft',
+        'move_combining_craft': 'moveCombiningCraft',
+        'combining_recycle_craft': 'combiningRecycleCraft',
+        'recover_combining_recycle': 'recoverCombiningRecycle',
+        'finish_combining_order': 'finishCombiningOrder',
+        'upgrade_village_building': 'upgradeVillageBuilding',
+        'receive_village_building_reward': 'receiveVillageBuildingReward',
+        'start_village_trip': 'startVillageTrip',
+        'receive_village_trip_reward': 'receiveVillageTripReward',
+        'complete_village_task': 'completeVillageTask',
+        'get_friend_village_data': 'getFriendVillageData',
+        'set_village_worker': 'setVillageWorker',
+        'next_round_village': 'nextRoundVillage',
+        'resolve_festival_activity_proposal': 'resolveFestivalActivityProposal',
+        'resolve_festival_activity_event': 'resolveFestivalActivityEvent',
+        'buy_festival_proposal': 'buyFestivalProposal',
+        'island_activity_move': 'islandActivityMove',
+        'island_activity_buy': 'islandActivityBuy',
+        'island_activity_sell': 'islandActivitySell',
+        'island_activity_tidy_bag': 'islandActivityTidyBag',
+        'island_activity_unlock_bag_grid': 'islandActivityUnlockBagGrid',
+        'create_customized_contest': 'createCustomizedContest',
+        'fetch_manager_customized_contest_list': 'fetchManagerCustomizedContestList',
+        'fetch_manager_customized_contest': 'fetchManagerCustomizedContest',
+        'update_manager_customized_contest': 'updateManagerCustomizedContest',
+        'fetch_contest_player_rank': 'fetchContestPlayerRank',
+        'fetch_ready_player_list': 'fetchReadyPlayerList',
+        'create_game_plan': 'createGamePlan',
+        'generate_contest_manager_login_code': 'generateContestManagerLoginCode',
+        'amulet_activity_fetch_info': 'amuletActivityFetchInfo',
+        'amulet_activity_fetch_brief': 'amuletActivityFetchBrief',
+        'amulet_activity_start_game': 'amuletActivityStartGame',
+        'amulet_activity_operate': 'amuletActivityOperate',
+        'amulet_activity_change_hands': 'amuletActivityChangeHands',
+        'amulet_activity_upgrade': 'amuletActivityUpgrade',
+        'amulet_activity_buy': 'amuletActivityBuy',
+        'amulet_activity_select_pack': 'amuletActivitySelectPack',
+        'amulet_activity_sell_effect': 'amuletActivitySellEffect',
+        'amulet_activity_effect_sort': 'amuletActivityEffectSort',
+        'amulet_activity_giveup': 'amuletActivityGiveup',
+        'amulet_activity_refresh_shop': 'amuletActivityRefreshShop',
+        'amulet_activity_select_free_effect': 'amuletActivitySelectFreeEffect',
+        'amulet_activity_upgrade_shop_buff': 'amuletActivityUpgradeShopBuff',
+        'amulet_activity_end_shopping': 'amuletActivityEndShopping',
+        'amulet_activity_set_skill_level': 'amuletActivitySetSkillLevel',
+        'amulet_activity_maintain_info': 'amuletActivityMaintainInfo',
+        'amulet_activity_select_reward_pack': 'amuletActivitySelectRewardPack',
+        'amulet_activity_receive_task_reward': 'amuletActivityReceiveTaskReward',
+        'story_activity_unlock': 'storyActivityUnlock',
+        'story_activity_unlock_ending': 'storyActivityUnlockEnding',
+        'story_activity_receive_ending_reward': 'storyActivityReceiveEndingReward',
+        'story_activity_receive_finish_reward': 'storyActivityReceiveFinishReward',
+        'story_activity_receive_all_finish_reward': 'storyActivityReceiveAllFinishReward',
+        'story_activity_unlock_ending_and_receive': 'storyActivityUnlockEndingAndReceive',
+        'fetch_activity_rank': 'fetchActivityRank',
+        'set_verified_hidden': 'setVerifiedHidden',
+        'fetch_questionnaire_list': 'fetchQuestionnaireList',
+        'fetch_questionnaire_detail': 'fetchQuestionnaireDetail',
+        'submit_questionnaire': 'submitQuestionnaire',
+        'set_friend_room_random_bot_char': 'setFriendRoomRandomBotChar',
+        'fetch_account_game_hu_records': 'fetchAccountGameHuRecords',
+        'fetch_account_info_extra': 'fetchAccountInfoExtra',
+        'set_account_favorite_hu': 'setAccountFavoriteHu',
+        'fetch_seer_report': 'fetchSeerReport',
+        'create_seer_report': 'createSeerReport',
+        'fetch_seer_report_list': 'fetchSeerReportList',
+        'fetch_seer_info': 'fetchSeerInfo',
+        'select_chest_choose_up_activity': 'selectChestChooseUpActivity',
+        'generate_annual_report_token': 'generateAnnualReportToken',
+        'fetch_annual_report_info': 'fetchAnnualReportInfo',
+        'remark_friend': 'remarkFriend',
+        'sim_v2_activity_fetch_info': 'simV2ActivityFetchInfo',
+        'sim_v2_activity_start_season': 'simV2ActivityStartSeason',
+        'sim_v2_activity_train': 'simV2ActivityTrain',
+        'sim_v2_activity_select_event': 'simV2ActivitySelectEvent',
+        'sim_v2_activity_start_match': 'simV2ActivityStartMatch',
+        'sim_v2_activity_end_match': 'simV2ActivityEndMatch',
+        'sim_v2_activity_give_up': 'simV2ActivityGiveUp',
+        'sim_v2_activity_set_upgrade': 'simV2ActivitySetUpgrade',
+    }
+    # method -> (full method name, pre-serialized Wrapper.name field) for the request path
+    _names = {
+        'fetchConnectionInfo': ('.lq.Lobby.fetchConnectionInfo', b'\n\x1d.lq.Lobby.fetchConnectionInfo'),
+        'fetchQueueInfo': ('.lq.Lobby.fetchQueueInfo', b'\n\x18.lq.Lobby.fetchQueueInfo'),
+        'cancelQueue': ('.lq.Lobby.cancelQueue', b'\n\x15.lq.Lobby.cancelQueue'),
+        'openidCheck': ('.lq.Lobby.openidCheck', b'\n\x15.lq.Lobby.openidCheck'),
+        'signup': ('.lq.Lobby.signup', b'\n\x10.lq.Lobby.signup'),
+        'login': ('.lq.Lobby.login', b'\n\x0f.lq.Lobby.login'),
+        'fetchInfo': ('.lq.Lobby.fetchInfo', b'\n\x13.lq.Lobby.fetchInfo'),
+        'loginSuccess': ('.lq.Lobby.loginSuccess', b'\n\x16.lq.Lobby.loginSuccess'),
+        'fetchServerMaintenanceInfo': ('.lq.Lobby.fetchServerMaintenanceInfo', b'\n$.lq.Lobby.fetchServerMaintenanceInfo'),
+        'emailLogin': ('.lq.Lobby.emailLogin', b'\n\x14.lq.Lobby.emailLogin'),
+        'oauth2Auth': ('.lq.Lobby.oauth2Auth', b'\n\x14.lq.Lobby.oauth2Auth'),
+        'oauth2Check': ('.lq.Lobby.oauth2Check', b'\n\x15.lq.Lobby.oauth2Check'),
+        'oauth2Signup': ('.lq.Lobby.oauth2Signup', b'\n\x16.lq.Lobby.oauth2Signup'),
+        'oauth2Login': ('.lq.Lobby.oauth2Login', b'\n\x15.lq.Lobby.oauth2Login'),
+        'dmmPreLogin': ('.lq.Lobby.dmmPreLogin', b'\n\x15.lq.Lobby.dmmPreLogin'),
+        'createPhoneVerifyCode': ('.lq.Lobby.createPhoneVerifyCode', b'\n\x1f.lq.Lobby.createPhoneVerifyCode'),
+        'createEmailVerifyCode': ('.lq.Lobby.createEmailVerifyCode', b'\n\x1f.lq.Lobby.createEmailVerifyCode'),
+        'verfifyCodeForSecure': ('.lq.Lobby.verfifyCodeForSecure', b'\n\x1e.lq.Lobby.verfifyCodeForSecure'),
+        'bindPhoneNumber': ('.lq.Lobby.bindPhoneNumber', b'\n\x19.lq.Lobby.bindPhoneNumber'),
+        'unbindPhoneNumber': ('.lq.Lobby.unbindPhoneNumber', b'\n\x1b.lq.Lobby.unbindPhoneNumber'),
+        'fetchPhoneLoginBind': ('.lq.Lobby.fetchPhoneLoginBind', b'\n\x1d.lq.Lobby.fetchPhoneLoginBind'),
+        'createPhoneLoginBind': ('.lq.Lobby.createPhoneLoginBind', b'\n\x1e.lq.Lobby.createPhoneLoginBind'),
+        'bindEmail': ('.lq.Lobby.bindEmail', b'\n\x13.lq.Lobby.bindEmail'),
+        'modifyPassword': ('.lq.Lobby.modifyPassword', b'\n\x18.lq.Lobby.modifyPassword'),
+        'bindAccount': ('.lq.Lobby.bindAccount', b'\n\x15.lq.Lobby.bindAccount'),
+        'logout': ('.lq.Lobby.logout', b'\n\x10.lq.Lobby.logout'),
+        'heatbeat': ('.lq.Lobby.heatbeat', b'\n\x12.lq.Lobby.heatbeat'),
+        'searchAccountByEid': ('.lq.Lobby.searchAccountByEid', b'\n\x1c.lq.Lobby.searchAccountByEid'),
+        'loginBeat': ('.lq.Lobby.loginBeat', b'\n\x13.lq.Lobby.loginBeat'),
+        'createNickname': ('.lq.Lobby.createNickname', b'\n\x18.lq.Lobby.createNickname'),
+        'modifyNickname': ('.lq.Lobby.modifyNickname', b'\n\x18.lq.Lobby.modifyNickname'),
+        'modifyBirthday': ('.lq.Lobby.modifyBirthday', b'\n\x18.lq.Lobby.modifyBirthday'),
+        'fetchRoom': ('.lq.Lobby.fetchRoom', b'\n\x13.lq.Lobby.fetchRoom'),
+        'fetchGamingInfo': ('.lq.Lobby.fetchGamingInfo', b'\n\x19.lq.Lobby.fetchGamingInfo'),
+        'createRoom': ('.lq.Lobby.createRoom', b'\n\x14.lq.Lobby.createRoom'),
+        'joinRoom': ('.lq.Lobby.joinRoom', b'\n\x12.lq.Lobby.joinRoom'),
+        'leaveRoom': ('.lq.Lobby.leaveRoom', b'\n\x13.lq.Lobby.leaveRoom'),
+        'readyPlay': ('.lq.Lobby.readyPlay', b'\n\x13.lq.Lobby.readyPlay'),
+        'dressingStatus': ('.lq.Lobby.dressingStatus', b'\n\x18.lq.Lobby.dressingStatus'),
+        'startRoom': ('.lq.Lobby.startRoom', b'\n\x13.lq.Lobby.startRoom'),
+        'roomKickPlayer': ('.lq.Lobby.roomKickPlayer', b'\n\x18.lq.Lobby.roomKickPlayer'),
+        'modifyRoom': ('.lq.Lobby.modifyRoom', b'\n\x14.lq.Lobby.modifyRoom'),
+        'addRoomRobot': ('.lq.Lobby.addRoomRobot', b'\n\x16.lq.Lobby.addRoomRobot'),
+        'matchGame': ('.lq.Lobby.matchGame', b'\n\x13.lq.Lobby.matchGame'),
+        'cancelMatch': ('.lq.Lobby.cancelMatch', b'\n\x15.lq.Lobby.cancelMatch'),
+        'fetchAccountInfo': ('.lq.Lobby.fetchAccountInfo', b'\n\x1a.lq.Lobby.fetchAccountInfo'),
+        'changeAvatar': ('.lq.Lobby.changeAvatar', b'\n\x16.lq.Lobby.changeAvatar'),
+        'receiveVersionReward': ('.lq.Lobby.receiveVersionReward', b'\n\x1e.lq.Lobby.receiveVersionReward'),
+        'fetchAccountStatisticInfo': ('.lq.Lobby.fetchAccountStatisticInfo', b'\n#.lq.Lobby.fetchAccountStatisticInfo'),
+        'fetchAccountChallengeRankInfo': ('.lq.Lobby.fetchAccountChallengeRankInfo', b"\n'.lq.Lobby.fetchAccountChallengeRankInfo"),
+        'fetchAccountCharacterInfo': ('.lq.Lobby.fetchAccountCharacterInfo', b'\n#.lq.Lobby.fetchAccountCharacterInfo'),
+        'shopPurchase': ('.lq.Lobby.shopPurchase', b'\n\x16.lq.Lobby.shopPurchase'),
+        'fetchGameRecord': ('.lq.Lobby.fetchGameRecord', b'\n\x19.lq.Lobby.fetchGameRecord'),
+        'readGameRecord': ('.lq.Lobby.readGameRecord', b'\n\x18.lq.Lobby.readGameRecord'),
+        'fetchGameRecordList': ('.lq.Lobby.fetchGameRecordList', b'\n\x1d.lq.Lobby.fetchGameRecordList'),
+        'fetchGameRecordListV2': ('.lq.Lobby.fetchGameRecordListV2', b'\n\x1f.lq.Lobby.fetchGameRecordListV2'),
+        'fetchNextGameRecordList': ('.lq.Lobby.fetchNextGameRecordList', b'\n!.lq.Lobby.fetchNextGameRecordList'),
+        'fetchCollectedGameRecordList': ('.lq.Lobby.fetchCollectedGameRecordList', b'\n&.lq.Lobby.fetchCollectedGameRecordList'),
+        'fetchGameRecordsDetail': ('.lq.Lobby.fetchGameRecordsDetail', b'\n .lq.Lobby.fetchGameRecordsDetail'),
+        'fetchGameRecordsDetailV2': ('.lq.Lobby.fetchGameRecordsDetailV2', b'\n".lq.Lobby.fetchGameRecordsDetailV2'),
+        'addCollectedGameRecord': ('.lq.Lobby.addCollectedGameRecord', b'\n .lq.Lobby.addCollectedGameRecord'),
+        'removeCollectedGameRecord': ('.lq.Lobby.removeCollectedGameRecord', b'\n#.lq.Lobby.removeCollectedGameRecord'),
+        'changeCollectedGameRecordRemarks': ('.lq.Lobby.changeCollectedGameRecordRemarks', b'\n*.lq.Lobby.changeCollectedGameRecordRemarks'),
+        'fetchLevelLeaderboard': ('.lq.Lobby.fetchLevelLeaderboard', b'\n\x1f.lq.Lobby.fetchLevelLeaderboard'),
+        'fetchChallengeLeaderboard': ('.lq.Lobby.fetchChallengeLeaderboard', b'\n#.lq.Lobby.fetchChallengeLeaderboard'),
+        'fetchMutiChallengeLevel': ('.lq.Lobby.fetchMutiChallengeLevel', b'\n!.lq.Lobby.fetchMutiChallengeLevel'),
+        'fetchMultiAccountBrief': ('.lq.Lobby.fetchMultiAccountBrief', b'\n .lq.Lobby.fetchMultiAccountBrief'),
+        'fetchFriendList': ('.lq.Lobby.fetchFriendList', b'\n\x19.lq.Lobby.fetchFriendList'),
+        'fetchFriendApplyList': ('.lq.Lobby.fetchFriendApplyList', b'\n\x1e.lq.Lobby.fetchFriendApplyList'),
+        'applyFriend': ('.lq.Lobby.applyFriend', b'\n\x15.lq.Lobby.applyFriend'),
+        'handleFriendApply': ('.lq.Lobby.handleFriendApply', b'\n\x1b.lq.Lobby.handleFriendApply'),
+        'removeFriend': ('.lq.Lobby.removeFriend', b'\n\x16.lq.Lobby.removeFriend'),
+        'searchAccountById': ('.lq.Lobby.searchAccountById', b'\n\x1b.lq.Lobby.searchAccountById'),
+        'searchAccountByPattern': ('.lq.Lobby.searchAccountByPattern', b'\n .lq.Lobby.searchAccountByPattern'),
+        'fetchAccountState': ('.lq.Lobby.fetchAccountState', b'\n\x1b.lq.Lobby.fetchAccountState'),
+        'fetchBagInfo': ('.lq.Lobby.fetchBagInfo', b'\n\x16.lq.Lobby.fetchBagInfo'),
+        'useBagItem': ('.lq.Lobby.useBagItem', b'\n\x14.lq.Lobby.useBagItem'),
+        'openManualItem': ('.lq.Lobby.openManualItem', b'\n\x18.lq.Lobby.openManualItem'),
+        'openRandomRewardItem': ('.lq.Lobby.openRandomRewardItem', b'\n\x1e.lq.Lobby.openRandomRewardItem'),
+        'openAllRewardItem': ('.lq.Lobby.openAllRewardItem', b'\n\x1b.lq.Lobby.openAllRewardItem'),
+        'composeShard': ('.lq.Lobby.composeShard', b'\n\x16.lq.Lobby.composeShard'),
+        'fetchAnnouncement': ('.lq.Lobby.fetchAnnouncement', b'\n\x1b.lq.Lobby.fetchAnnouncement'),
+        'readAnnouncement': ('.lq.Lobby.readAnnouncement', b'\n\x1a.lq.Lobby.readAnnouncement'),
+        'fetchMailInfo': ('.lq.Lobby.fetchMailInfo', b'\n\x17.lq.Lobby.fetchMailInfo'),
+        'readMail': ('.lq.Lobby.readMail', b'\n\x12.lq.Lobby.readMail'),
+        'deleteMail': ('.lq.Lobby.deleteMail', b'\n\x14.lq.Lobby.deleteMail'),
+        'takeAttachmentFromMail': ('.lq.Lobby.takeAttachmentFromMail', b'\n .lq.Lobby.takeAttachmentFromMail'),
+        'receiveAchievementReward': ('.lq.Lobby.receiveAchievementReward', b'\n".lq.Lobby.receiveAchievementReward'),
+        'receiveAchievementGroupReward': ('.lq.Lobby.receiveAchievementGroupReward', b"\n'.lq.Lobby.receiveAchievementGroupReward"),
+        'fetchAchievementRate': ('.lq.Lobby.fetchAchievementRate', b'\n\x1e.lq.Lobby.fetchAchievementRate'),
+        'fetchAchievement': ('.lq.Lobby.fetchAchievement', b'\n\x1a.lq.Lobby.fetchAchievement'),
+        'buyShiLian': ('.lq.Lobby.buyShiLian', b'\n\x14.lq.Lobby.buyShiLian'),
+        'matchShiLian': ('.lq.Lobby.matchShiLian', b'\n\x16.lq.Lobby.matchShiLian'),
+        'goNextShiLian': ('.lq.Lobby.goNextShiLian', b'\n\x17.lq.Lobby.goNextShiLian'),
+        'updateClientValue': ('.lq.Lobby.updateClientValue', b'\n\x1b.lq.Lobby.updateClientValue'),
+        'fetchClientValue': ('.lq.Lobby.fetchClientValue', b'\n\x1a.lq.Lobby.fetchClientValue'),
+        'clientMessage': ('.lq.Lobby.clientMessage', b'\n\x17.lq.Lobby.clientMessage'),
+        'fetchCurrentMatchInfo': ('.lq.Lobby.fetchCurrentMatchInfo', b'\n\x1f.lq.Lobby.fetchCurrentMatchInfo'),
+        'userComplain': ('.lq.Lobby.userComplain', b'\n\x16.lq.Lobby.userComplain'),
+        'fetchReviveCoinInfo': ('.lq.Lobby.fetchReviveCoinInfo', b'\n\x1d.lq.Lobby.fetchReviveCoinInfo'),
+        'gainReviveCoin': ('.lq.Lobby.gainReviveCoin', b'\n\x18.lq.Lobby.gainReviveCoin'),
+        'fetchDailyTask': ('.lq.Lobby.fetchDailyTask', b'\n\x18.lq.Lobby.fetchDailyTask'),
+        'refreshDailyTask': ('.lq.Lobby.refreshDailyTask', b'\n\x1a.lq.Lobby.refreshDailyTask'),
+        'useGiftCode': ('.lq.Lobby.useGiftCode', b'\n\x15.lq.Lobby.useGiftCode'),
+        'useSpecialGiftCode': ('.lq.Lobby.useSpecialGiftCode', b'\n\x1c.lq.Lobby.useSpecialGiftCode'),
+        'fetchTitleList': ('.lq.Lobby.fetchTitleList', b'\n\x18.lq.Lobby.fetchTitleList'),
+        'useTitle': ('.lq.Lobby.useTitle', b'\n\x12.lq.Lobby.useTitle'),
+        'sendClientMessage': ('.lq.Lobby.sendClientMessage', b'\n\x1b.lq.Lobby.sendClientMessage'),
+        'fetchGameLiveInfo': ('.lq.Lobby.fetchGameLiveInfo', b'\n\x1b.lq.Lobby.fetchGameLiveInfo'),
+        'fetchGameLiveLeftSegment': ('.lq.Lobby.fetchGameLiveLeftSegment', b'\n".lq.Lobby.fetchGameLiveLeftSegment'),
+        'fetchGameLiveList': ('.lq.Lobby.fetchGameLiveList', b'\n\x1b.lq.Lobby.fetchGameLiveList'),
+        'fetchCommentSetting': ('.lq.Lobby.fetchCommentSetting', b'\n\x1d.lq.Lobby.fetchCommentSetting'),
+        'updateCommentSetting': ('.lq.Lobby.updateCommentSetting', b'\n\x1e.lq.Lobby.updateCommentSetting'),
+        'fetchCommentList': ('.lq.Lobby.fetchCommentList', b'\n\x1a.lq.Lobby.fetchCommentList'),
+        'fetchCommentContent': ('.lq.Lobby.fetchCommentContent', b'\n\x1d.lq.Lobby.fetchCommentContent'),
+        'leaveComment': ('.lq.Lobby.leaveComment', b'\n\x16.lq.Lobby.leaveComment'),
+        'deleteComment': ('.lq.Lobby.deleteComment', b'\n\x17.lq.Lobby.deleteComment'),
+        'updateReadComment': ('.lq.Lobby.updateReadComment', b'\n\x1b.lq.Lobby.updateReadComment'),
+        'fetchRollingNotice': ('.lq.Lobby.fetchRollingNotice', b'\n\x1c.lq.Lobby.fetchRollingNotice'),
+        'fetchMaintainNotice': ('.lq.Lobby.fetchMaintainNotice', b'\n\x1d.lq.Lobby.fetchMaintainNotice'),
+        'fetchServerTime': ('.lq.Lobby.fetchServerTime', b'\n\x19.lq.Lobby.fetchServerTime'),
+        'fetchPlatformProducts': ('.lq.Lobby.fetchPlatformProducts', b'\n\x1f.lq.Lobby.fetchPlatformProducts'),
+        'fetchRandomCharacter': ('.lq.Lobby.fetchRandomCharacter', b'\n\x1e.lq.Lobby.fetchRandomCharacter'),
+        'setRandomCharacter': ('.lq.Lobby.setRandomCharacter', b'\n\x1c.lq.Lobby.setRandomCharacter'),
+        'cancelGooglePlayOrder': ('.lq.Lobby.cancelGooglePlayOrder', b'\n\x1f.lq.Lobby.cancelGooglePlayOrder'),
+        'openChest': ('.lq.Lobby.openChest', b'\n\x13.lq.Lobby.openChest'),
+        'buyFromChestShop': ('.lq.Lobby.buyFromChestShop', b'\n\x1a.lq.Lobby.buyFromChestShop'),
+        'fetchDailySignInInfo': ('.lq.Lobby.fetchDailySignInInfo', b'\n\x1e.lq.Lobby.fetchDailySignInInfo'),
+        'doDailySignIn': ('.lq.Lobby.doDailySignIn', b'\n\x17.lq.Lobby.doDailySignIn'),
+        'doActivitySignIn': ('.lq.Lobby.doActivitySignIn', b'\n\x1a.lq.Lobby.doActivitySignIn'),
+        'fetchCharacterInfo': ('.lq.Lobby.fetchCharacterInfo', b'\n\x1c.lq.Lobby.fetchCharacterInfo'),
+        'updateCharacterSort': ('.lq.Lobby.updateCharacterSort', b'\n\x1d.lq.Lobby.updateCharacterSort'),
+        'changeMainCharacter': ('.lq.Lobby.changeMainCharacter', b'\n\x1d.lq.Lobby.changeMainCharacter'),
+        'changeCharacterSkin': ('.lq.Lobby.changeCharacterSkin', b'\n\x1d.lq.Lobby.changeCharacterSkin'),
+        'changeCharacterView': ('.lq.Lobby.changeCharacterView', b'\n\x1d.lq.Lobby.changeCharacterView'),
+        'setHiddenCharacter': ('.lq.Lobby.setHiddenCharacter', b'\n\x1c.lq.Lobby.setHiddenCharacter'),
+        'sendGiftToCharacter': ('.lq.Lobby.sendGiftToCharacter', b'\n\x1d.lq.Lobby.sendGiftToCharacter'),
+        'sellItem': ('.lq.Lobby.sellItem', b'\n\x12.lq.Lobby.sellItem'),
+        'fetchCommonView': ('.lq.Lobby.fetchCommonView', b'\n\x19.lq.Lobby.fetchCommonView'),
+        'changeCommonView': ('.lq.Lobby.changeCommonView', b'\n\x1a.lq.Lobby.changeCommonView'),
+        'saveCommonViews': ('.lq.Lobby.saveCommonViews', b'\n\x19.lq.Lobby.saveCommonViews'),
+        'fetchCommonViews': ('.lq.Lobby.fetchCommonViews', b'\n\x1a.lq.Lobby.fetchCommonViews'),
+        'fetchAllCommonViews': ('.lq.Lobby.fetchAllCommonViews', b'\n\x1d.lq.Lobby.fetchAllCommonViews'),
+        'useCommonView': ('.lq.Lobby.useCommonView', b'\n\x17.lq.Lobby.useCommonView'),
+        'upgradeCharacter': ('.lq.Lobby.upgradeCharacter', b'\n\x1a.lq.Lobby.upgradeCharacter'),
+        'addFinishedEnding': ('.lq.Lobby.addFinishedEnding', b'\n\x1b.lq.Lobby.addFinishedEnding'),
+        'receiveEndingReward': ('.lq.Lobby.receiveEndingReward', b'\n\x1d.lq.Lobby.receiveEndingReward'),
+        'gameMasterCommand': ('.lq.Lobby.gameMasterCommand', b'\n\x1b.lq.Lobby.gameMasterCommand'),
+        'fetchShopInfo': ('.lq.Lobby.fetchShopInfo', b'\n\x17.lq.Lobby.fetchShopInfo'),
+        'buyFromShop': ('.lq.Lobby.buyFromShop', b'\n\x15.lq.Lobby.buyFromShop'),
+        'buyFromZHP': ('.lq.Lobby.buyFromZHP', b'\n\x14.lq.Lobby.buyFromZHP'),
+        'refreshZHPShop': ('.lq.Lobby.refreshZHPShop', b'\n\x18.lq.Lobby.refreshZHPShop'),
+        'fetchMonthTicketInfo': ('.lq.Lobby.fetchMonthTicketInfo', b'\n\x1e.lq.Lobby.fetchMonthTicketInfo'),
+        'payMonthTicket': ('.lq.Lobby.payMonthTicket', b'\n\x18.lq.Lobby.payMonthTicket'),
+        'exchangeCurrency': ('.lq.Lobby.exchangeCurrency', b'\n\x1a.lq.Lobby.exchangeCurrency'),
+        'exchangeChestStone': ('.lq.Lobby.exchangeChestStone', b'\n\x1c.lq.Lobby.exchangeChestStone'),
+        'exchangeDiamond': ('.lq.Lobby.exchangeDiamond', b'\n\x19.lq.Lobby.exchangeDiamond'),
+        'fetchServerSettings': ('.lq.Lobby.fetchServerSettings', b'\n\x1d.lq.Lobby.fetchServerSettings'),
+        'fetchAccountSettings': ('.lq.Lobby.fetchAccountSettings', b'\n\x1e.lq.Lobby.fetchAccountSettings'),
+        'updateAccountSettings': ('.lq.Lobby.updateAccountSettings', b'\n\x1f.lq.Lobby.updateAccountSettings'),
+        'fetchModNicknameTime': ('.lq.Lobby.fetchModNicknameTime', b'\n\x1e.lq.Lobby.fetchModNicknameTime'),
+        'createWechatNativeOrder': ('.lq.Lobby.createWechatNativeOrder', b'\n!.lq.Lobby.createWechatNativeOrder'),
+        'createWechatAppOrder': ('.lq.Lobby.createWechatAppOrder', b'\n\x1e.lq.Lobby.createWechatAppOrder'),
+        'createAlipayOrder': ('.lq.Lobby.createAlipayOrder', b'\n\x1b.lq.Lobby.createAlipayOrder'),
+        'createAlipayScanOrder': ('.lq.Lobby.createAlipayScanOrder', b'\n\x1f.lq.Lobby.createAlipayScanOrder'),
+        'createAlipayAppOrder': ('.lq.Lobby.createAlipayAppOrder', b'\n\x1e.lq.Lobby.createAlipayAppOrder'),
+        'createJPCreditCardOrder': ('.lq.Lobby.createJPCreditCardOrder', b'\n!.lq.Lobby.createJPCreditCardOrder'),
+        'createJPPaypalOrder': ('.lq.Lobby.createJPPaypalOrder', b'\n\x1d.lq.Lobby.createJPPaypalOrder'),
+        'createJPAuOrder': ('.lq.Lobby.createJPAuOrder', b'\n\x19.lq.Lobby.createJPAuOrder'),
+        'createJPDocomoOrder': ('.lq.Lobby.createJPDocomoOrder', b'\n\x1d.lq.Lobby.createJPDocomoOrder'),
+        'createJPWebMoneyOrder': ('.lq.Lobby.createJPWebMoneyOrder', b'\n\x1f.lq.Lobby.createJPWebMoneyOrder'),
+        'createJPSoftbankOrder': ('.lq.Lobby.createJPSoftbankOrder', b'\n\x1f.lq.Lobby.createJPSoftbankOrder'),
+        'createJPPayPayOrder': ('.lq.Lobby.createJPPayPayOrder', b'\n\x1d.lq.Lobby.createJPPayPayOrder'),
+        'fetchJPCommonCreditCardOrder': ('.lq.Lobby.fetchJPCommonCreditCardOrder', b'\n&.lq.Lobby.fetchJPCommonCreditCardOrder'),
+        'createJPGMOOrder': ('.lq.Lobby.createJPGMOOrder', b'\n\x1a.lq.Lobby.createJPGMOOrder'),
+        'createENPaypalOrder': ('.lq.Lobby.createENPaypalOrder', b'\n\x1d.lq.Lobby.createENPaypalOrder'),
+        'createENMasterCardOrder': ('.lq.Lobby.createENMasterCardOrder', b'\n!.lq.Lobby.createENMasterCardOrder'),
+        'createENVisaOrder': ('.lq.Lobby.createENVisaOrder', b'\n\x1b.lq.Lobby.createENVisaOrder'),
+        'createENJCBOrder': ('.lq.Lobby.createENJCBOrder', b'\n\x1a.lq.Lobby.createENJCBOrder'),
+        'createENAlipayOrder': ('.lq.Lobby.createENAlipayOrder', b'\n\x1d.lq.Lobby.createENAlipayOrder'),
+        'createKRPaypalOrder': ('.lq.Lobby.createKRPaypalOrder', b'\n\x1d.lq.Lobby.createKRPaypalOrder'),
+        'createKRMasterCardOrder': ('.lq.Lobby.createKRMasterCardOrder', b'\n!.lq.Lobby.createKRMasterCardOrder'),
+        'createKRVisaOrder': ('.lq.Lobby.createKRVisaOrder', b'\n\x1b.lq.Lobby.createKRVisaOrder'),
+        'createKRJCBOrder': ('.lq.Lobby.createKRJCBOrder', b'\n\x1a.lq.Lobby.createKRJCBOrder'),
+        'createKRAlipayOrder': ('.lq.Lobby.createKRAlipayOrder', b'\n\x1d.lq.Lobby.createKRAlipayOrder'),
+        'createDMMOrder': ('.lq.Lobby.createDMMOrder', b'\n\x18.lq.Lobby.createDMMOrder'),
+        'createIAPOrder': ('.lq.Lobby.createIAPOrder', b'\n\x18.lq.Lobby.createIAPOrder'),
+        'createSteamOrder': ('.lq.Lobby.createSteamOrder', b'\n\x1a.lq.Lobby.createSteamOrder'),
+        'verifySteamOrder': ('.lq.Lobby.verifySteamOrder', b'\n\x1a.lq.Lobby.verifySteamOrder'),
+        'createMyCardAndroidOrder': ('.lq.Lobby.createMyCardAndroidOrder', b'\n".lq.Lobby.createMyCardAndroidOrder'),
+        'createMyCardWebOrder': ('.lq.Lobby.createMyCardWebOrder', b'\n\x1e.lq.Lobby.createMyCardWebOrder'),
+        'createPaypalOrder': ('.lq.Lobby.createPaypalOrder', b'\n\x1b.lq.Lobby.createPaypalOrder'),
+        'createXsollaOrder': ('.lq.Lobby.createXsollaOrder', b'\n\x1b.lq.Lobby.createXsollaOrder'),
+        'createXsollaV4Order': ('.lq.Lobby.createXsollaV4Order', b'\n\x1d.lq.Lobby.createXsollaV4Order'),
+        'verifyMyCardOrder': ('.lq.Lobby.verifyMyCardOrder', b'\n\x1b.lq.Lobby.verifyMyCardOrder'),
+        'verificationIAPOrder': ('.lq.Lobby.verificationIAPOrder', b'\n\x1e.lq.Lobby.verificationIAPOrder'),
+        'createYostarSDKOrder': ('.lq.Lobby.createYostarSDKOrder', b'\n\x1e.lq.Lobby.createYostarSDKOrder'),
+        'createBillingOrder': ('.lq.Lobby.createBillingOrder', b'\n\x1c.lq.Lobby.createBillingOrder'),
+        'solveGooglePlayOrder': ('.lq.Lobby.solveGooglePlayOrder', b'\n\x1e.lq.Lobby.solveGooglePlayOrder'),
+        'solveGooglePayOrderV3': ('.lq.Lobby.solveGooglePayOrderV3', b'\n\x1f.lq.Lobby.solveGooglePayOrderV3'),
+        'deliverAA32Order': ('.lq.Lobby.deliverAA32Order', b'\n\x1a.lq.Lobby.deliverAA32Order'),
+        'fetchMisc': ('.lq.Lobby.fetchMisc', b'\n\x13.lq.Lobby.fetchMisc'),
+        'modifySignature': ('.lq.Lobby.modifySignature', b'\n\x19.lq.Lobby.modifySignature'),
+        'fetchIDCardInfo': ('.lq.Lobby.fetchIDCardInfo', b'\n\x19.lq.Lobby.fetchIDCardInfo'),
+        'updateIDCardInfo': ('.lq.Lobby.updateIDCardInfo', b'\n\x1a.lq.Lobby.updateIDCardInfo'),
+        'fetchVipReward': ('.lq.Lobby.fetchVipReward', b'\n\x18.lq.Lobby.fetchVipReward'),
+        'gainVipReward': ('.lq.Lobby.gainVipReward', b'\n\x17.lq.Lobby.gainVipReward'),
+        'fetchRefundOrder': ('.lq.Lobby.fetchRefundOrder', b'\n\x1a.lq.Lobby.fetchRefundOrder'),
+        'fetchCustomizedContestList': ('.lq.Lobby.fetchCustomizedContestList', b'\n$.lq.Lobby.fetchCustomizedContestList'),
+        'fetchCustomizedContestAuthInfo': ('.lq.Lobby.fetchCustomizedContestAuthInfo', b'\n(.lq.Lobby.fetchCustomizedContestAuthInfo'),
+        'enterCustomizedContest': ('.lq.Lobby.enterCustomizedContest', b'\n .lq.Lobby.enterCustomizedContest'),
+        'leaveCustomizedContest': ('.lq.Lobby.leaveCustomizedContest', b'\n .lq.Lobby.leaveCustomizedContest'),
+        'fetchCustomizedContestOnlineInfo': ('.lq.Lobby.fetchCustomizedContestOnlineInfo', b'\n*.lq.Lobby.fetchCustomizedContestOnlineInfo'),
+        'fetchCustomizedContestByContestId': ('.lq.Lobby.fetchCustomizedContestByContestId', b'\n+.lq.Lobby.fetchCustomizedContestByContestId'),
+        'signupCustomizedContest': ('.lq.Lobby.signupCustomizedContest', b'\n!.lq.Lobby.signupCustomizedContest'),
+        'startCustomizedContest': ('.lq.Lobby.startCustomizedContest', b'\n .lq.Lobby.startCustomizedContest'),
+        'stopCustomizedContest': ('.lq.Lobby.stopCustomizedContest', b'\n\x1f.lq.Lobby.stopCustomizedContest'),
+        'joinCustomizedContestChatRoom': ('.lq.Lobby.joinCustomizedContestChatRoom', b"\n'.lq.Lobby.joinCustomizedContestChatRoom"),
+        'leaveCustomizedContestChatRoom': ('.lq.Lobby.leaveCustomizedContestChatRoom', b'\n(.lq.Lobby.leaveCustomizedContestChatRoom'),
+        'sayChatMessage': ('.lq.Lobby.sayChatMessage', b'\n\x18.lq.Lobby.sayChatMessage'),
+        'fetchCustomizedContestGameRecords': ('.lq.Lobby.fetchCustomizedContestGameRecords', b'\n+.lq.Lobby.fetchCustomizedContestGameRecords'),
+        'fetchCustomizedContestGameLiveList': ('.lq.Lobby.fetchCustomizedContestGameLiveList', b'\n,.lq.Lobby.fetchCustomizedContestGameLiveList'),
+        'followCustomizedContest': ('.lq.Lobby.followCustomizedContest', b'\n!.lq.Lobby.followCustomizedContest'),
+        'unfollowCustomizedContest': ('.lq.Lobby.unfollowCustomizedContest', b'\n#.lq.Lobby.unfollowCustomizedContest'),
+        'fetchActivityList': ('.lq.Lobby.fetchActivityList', b'\n\x1b.lq.Lobby.fetchActivityList'),
+        'fetchAccountActivityData': ('.lq.Lobby.fetchAccountActivityData', b'\n".lq.Lobby.fetchAccountActivityData'),
+        'exchangeActivityItem': ('.lq.Lobby.exchangeActivityItem', b'\n\x1e.lq.Lobby.exchangeActivityItem'),
+        'completeActivityTask': ('.lq.Lobby.completeActivityTask', b'\n\x1e.lq.Lobby.completeActivityTask'),
+        'completeActivityTaskBatch': ('.lq.Lobby.completeActivityTaskBatch', b'\n#.lq.Lobby.completeActivityTaskBatch'),
+        'completeActivityFlipTask': ('.lq.Lobby.completeActivityFlipTask', b'\n".lq.Lobby.completeActivityFlipTask'),
+        'completePeriodActivityTask': ('.lq.Lobby.completePeriodActivityTask', b'\n$.lq.Lobby.completePeriodActivityTask'),
+        'completePeriodActivityTaskBatch': ('.lq.Lobby.completePeriodActivityTaskBatch', b'\n).lq.Lobby.completePeriodActivityTaskBatch'),
+        'completeRandomActivityTask': ('.lq.Lobby.completeRandomActivityTask', b'\n$.lq.Lobby.completeRandomActivityTask'),
+        'completeRandomActivityTaskBatch': ('.lq.Lobby.completeRandomActivityTaskBatch', b'\n).lq.Lobby.completeRandomActivityTaskBatch'),
+        'receiveActivityFlipTask': ('.lq.Lobby.receiveActivityFlipTask', b'\n!.lq.Lobby.receiveActivityFlipTask'),
+        'completeSegmentTaskReward': ('.lq.Lobby.completeSegmentTaskReward', b'\n#.lq.Lobby.completeSegmentTaskReward'),
+        'fetchActivityFlipInfo': ('.lq.Lobby.fetchActivityFlipInfo', b'\n\x1f.lq.Lobby.fetchActivityFlipInfo'),
+        'gainAccumulatedPointActivityReward': ('.lq.Lobby.gainAccumulatedPointActivityReward', b'\n,.lq.Lobby.gainAccumulatedPointActivityReward'),
+        'gainMultiPointActivityReward': ('.lq.Lobby.gainMultiPointActivityReward', b'\n&.lq.Lobby.gainMultiPointActivityReward'),
+        'fetchRankPointLeaderboard': ('.lq.Lobby.fetchRankPointLeaderboard', b'\n#.lq.Lobby.fetchRankPointLeaderboard'),
+        'gainRankPointReward': ('.lq.Lobby.gainRankPointReward', b'\n\x1d.lq.Lobby.gainRankPointReward'),
+        'richmanActivityNextMove': ('.lq.Lobby.richmanActivityNextMove', b'\n!.lq.Lobby.richmanActivityNextMove'),
+        'richmanAcitivitySpecialMove': ('.lq.Lobby.richmanAcitivitySpecialMove', b'\n%.lq.Lobby.richmanAcitivitySpecialMove'),
+        'richmanActivityChestInfo': ('.lq.Lobby.richmanActivityChestInfo', b'\n".lq.Lobby.richmanActivityChestInfo'),
+        'createGameObserveAuth': ('.lq.Lobby.createGameObserveAuth', b'\n\x1f.lq.Lobby.createGameObserveAuth'),
+        'refreshGameObserveAuth': ('.lq.Lobby.refreshGameObserveAuth', b'\n .lq.Lobby.refreshGameObserveAuth'),
+        'fetchActivityBuff': ('.lq.Lobby.fetchActivityBuff', b'\n\x1b.lq.Lobby.fetchActivityBuff'),
+        'upgradeActivityBuff': ('.lq.Lobby.upgradeActivityBuff', b'\n\x1d.lq.Lobby.upgradeActivityBuff'),
+        'upgradeActivityLevel': ('.lq.Lobby.upgradeActivityLevel', b'\n\x1e.lq.Lobby.upgradeActivityLevel'),
+        'receiveUpgradeActivityReward': ('.lq.Lobby.receiveUpgradeActivityReward', b'\n&.lq.Lobby.receiveUpgradeActivityReward'),
+        'upgradeChallenge': ('.lq.Lobby.upgradeChallenge', b'\n\x1a.lq.Lobby.upgradeChallenge'),
+        'refreshChallenge': ('.lq.Lobby.refreshChallenge', b'\n\x1a.lq.Lobby.refreshChallenge'),
+        'fetchChallengeInfo': ('.lq.Lobby.fetchChallengeInfo', b'\n\x1c.lq.Lobby.fetchChallengeInfo'),
+        'forceCompleteChallengeTask': ('.lq.Lobby.forceCompleteChallengeTask', b'\n$.lq.Lobby.forceCompleteChallengeTask'),
+        'fetchChallengeSeason': ('.lq.Lobby.fetchChallengeSeason', b'\n\x1e.lq.Lobby.fetchChallengeSeason'),
+        'receiveChallengeRankReward': ('.lq.Lobby.receiveChallengeRankReward', b'\n$.lq.Lobby.receiveChallengeRankReward'),
+        'fetchABMatchInfo': ('.lq.Lobby.fetchABMatchInfo', b'\n\x1a.lq.Lobby.fetchABMatchInfo'),
+        'buyInABMatch': ('.lq.Lobby.buyInABMatch', b'\n\x16.lq.Lobby.buyInABMatch'),
+        'receiveABMatchReward': ('.lq.Lobby.receiveABMatchReward', b'\n\x1e.lq.Lobby.receiveABMatchReward'),
+        'quitABMatch': ('.lq.Lobby.quitABMatch', b'\n\x15.lq.Lobby.quitABMatch'),
+        'startUnifiedMatch': ('.lq.Lobby.startUnifiedMatch', b'\n\x1b.lq.Lobby.startUnifiedMatch'),
+        'cancelUnifiedMatch': ('.lq.Lobby.cancelUnifiedMatch', b'\n\x1c.lq.Lobby.cancelUnifiedMatch'),
+        'fetchGamePointRank': ('.lq.Lobby.fetchGamePointRank', b'\n\x1c.lq.Lobby.fetchGamePointRank'),
+        'fetchSelfGamePointRank': ('.lq.Lobby.fetchSelfGamePointRank', b'\n .lq.Lobby.fetchSelfGamePointRank'),
+        'readSNS': ('.lq.Lobby.readSNS', b'\n\x11.lq.Lobby.readSNS'),
+        'replySNS': ('.lq.Lobby.replySNS', b'\n\x12.lq.Lobby.replySNS'),
+        'likeSNS': ('.lq.Lobby.likeSNS', b'\n\x11.lq.Lobby.likeSNS'),
+        'digMine': ('.lq.Lobby.digMine', b'\n\x11.lq.Lobby.digMine'),
+        'fetchLastPrivacy': ('.lq.Lobby.fetchLastPrivacy', b'\n\x1a.lq.Lobby.fetchLastPrivacy'),
+        'checkPrivacy': ('.lq.Lobby.checkPrivacy', b'\n\x16.lq.Lobby.checkPrivacy'),
+        'fetchRPGBattleHistory': ('.lq.Lobby.fetchRPGBattleHistory', b'\n\x1f.lq.Lobby.fetchRPGBattleHistory'),
+        'fetchRPGBattleHistoryV2': ('.lq.Lobby.fetchRPGBattleHistoryV2', b'\n!.lq.Lobby.fetchRPGBattleHistoryV2'),
+        'receiveRPGRewards': ('.lq.Lobby.receiveRPGRewards', b'\n\x1b.lq.Lobby.receiveRPGRewards'),
+        'receiveRPGReward': ('.lq.Lobby.receiveRPGReward', b'\n\x1a.lq.Lobby.receiveRPGReward'),
+        'buyArenaTicket': ('.lq.Lobby.buyArenaTicket', b'\n\x18.lq.Lobby.buyArenaTicket'),
+        'enterArena': ('.lq.Lobby.enterArena', b'\n\x14.lq.Lobby.enterArena'),
+        'receiveArenaReward': ('.lq.Lobby.receiveArenaReward', b'\n\x1c.lq.Lobby.receiveArenaReward'),
+        'fetchOBToken': ('.lq.Lobby.fetchOBToken', b'\n\x16.lq.Lobby.fetchOBToken'),
+        'receiveCharacterRewards': ('.lq.Lobby.receiveCharacterRewards', b'\n!.lq.Lobby.receiveCharacterRewards'),
+        'feedActivityFeed': ('.lq.Lobby.feedActivityFeed', b'\n\x1a.lq.Lobby.feedActivityFeed'),
+        'sendActivityGiftToFriend': ('.lq.Lobby.sendActivityGiftToFriend', b'\n".lq.Lobby.sendActivityGiftToFriend'),
+        'receiveActivityGift': ('.lq.Lobby.receiveActivityGift', b'\n\x1d.lq.Lobby.receiveActivityGift'),
+        'receiveAllActivityGift': ('.lq.Lobby.receiveAllActivityGift', b'\n .lq.Lobby.receiveAllActivityGift'),
+        'fetchFriendGiftActivityData': ('.lq.Lobby.fetchFriendGiftActivityData', b'\n%.lq.Lobby.fetchFriendGiftActivityData'),
+        'openPreChestItem': ('.lq.Lobby.openPreChestItem', b'\n\x1a.lq.Lobby.openPreChestItem'),
+        'fetchVoteActivity': ('.lq.Lobby.fetchVoteActivity', b'\n\x1b.lq.Lobby.fetchVoteActivity'),
+        'voteActivity': ('.lq.Lobby.voteActivity', b'\n\x16.lq.Lobby.voteActivity'),
+        'unlockActivitySpot': ('.lq.Lobby.unlockActivitySpot', b'\n\x1c.lq.Lobby.unlockActivitySpot'),
+        'unlockActivitySpotEnding': ('.lq.Lobby.unlockActivitySpotEnding', b'\n".lq.Lobby.unlockActivitySpotEnding'),
+        'receiveActivitySpotReward': ('.lq.Lobby.receiveActivitySpotReward', b'\n#.lq.Lobby.receiveActivitySpotReward'),
+        'deleteAccount': ('.lq.Lobby.deleteAccount', b'\n\x17.lq.Lobby.deleteAccount'),
+        'cancelDeleteAccount': ('.lq.Lobby.cancelDeleteAccount', b'\n\x1d.lq.Lobby.cancelDeleteAccount'),
+        'logReport': ('.lq.Lobby.logReport', b'\n\x13.lq.Lobby.logReport'),
+        'bindOauth2': ('.lq.Lobby.bindOauth2', b'\n\x14.lq.Lobby.bindOauth2'),
+        'fetchOauth2Info': ('.lq.Lobby.fetchOauth2Info', b'\n\x19.lq.Lobby.fetchOauth2Info'),
+        'setLoadingImage': ('.lq.Lobby.setLoadingImage', b'\n\x19.lq.Lobby.setLoadingImage'),
+        'fetchShopInterval': ('.lq.Lobby.fetchShopInterval', b'\n\x1b.lq.Lobby.fetchShopInterval'),
+        'fetchActivityInterval': ('.lq.Lobby.fetchActivityInterval', b'\n\x1f.lq.Lobby.fetchActivityInterval'),
+        'fetchRecentFriend': ('.lq.Lobby.fetchRecentFriend', b'\n\x1b.lq.Lobby.fetchRecentFriend'),
+        'openGacha': ('.lq.Lobby.openGacha', b'\n\x13.lq.Lobby.openGacha'),
+        'taskRequest': ('.lq.Lobby.taskRequest', b'\n\x15.lq.Lobby.taskRequest'),
+        'simulationActivityTrain': ('.lq.Lobby.simulationActivityTrain', b'\n!.lq.Lobby.simulationActivityTrain'),
+        'fetchSimulationGameRecord': ('.lq.Lobby.fetchSimulationGameRecord', b'\n#.lq.Lobby.fetchSimulationGameRecord'),
+        'startSimulationActivityGame': ('.lq.Lobby.startSimulationActivityGame', b'\n%.lq.Lobby.startSimulationActivityGame'),
+        'fetchSimulationGameRank': ('.lq.Lobby.fetchSimulationGameRank', b'\n!.lq.Lobby.fetchSimulationGameRank'),
+        'generateCombiningCraft': ('.lq.Lobby.generateCombiningCraft', b'\n .lq.Lobby.generateCombiningCraft'),
+        'moveCombiningCraft': ('.lq.Lobby.moveCombiningCraft', b'\n\x1c.lq.Lobby.moveCombiningCraft'),
+        'combiningRecycleCraft': ('.lq.Lobby.combiningRecycleCraft', b'\n\x1f.lq.Lobby.combiningRecycleCraft'),
+        'recoverCombiningRecycle': ('.lq.Lobby.recoverCombiningRecycle', b'\n!.lq.Lobby.recoverCombiningRecycle'),
+        'finishCombiningOrder': ('.lq.Lobby.finishCombiningOrder', b'\n\x1e.lq.Lobby.finishCombiningOrder'),
+        'upgradeVillageBuilding': ('.lq.Lobby.upgradeVillageBuilding', b'\n .lq.Lobby.upgradeVillageBuilding'),
+        'receiveVillageBuildingReward': ('.lq.Lobby.receiveVillageBuildingReward', b'\n&.lq.Lobby.receiveVillageBuildingReward'),
+        'startVillageTrip': ('.lq.Lobby.startVillageTrip', b'\n\x1a.lq.Lobby.startVillageTrip'),
+        'receiveVillageTripReward': ('.lq.Lobby.receiveVillageTripReward', b'\n".lq.Lobby.receiveVillageTripReward'),
+        'completeVillageTask': ('.lq.Lobby.completeVillageTask', b'\n\x1d.lq.Lobby.completeVillageTask'),
+        'getFriendVillageData': ('.lq.Lobby.getFriendVillageData', b'\n\x1e.lq.Lobby.getFriendVillageData'),
+        'setVillageWorker': ('.lq.Lobby.setVillageWorker', b'\n\x1a.lq.Lobby.setVillageWorker'),
+        'nextRoundVillage': ('.lq.Lobby.nextRoundVillage', b'\n\x1a.lq.Lobby.nextRoundVillage'),
+        'resolveFestivalActivityProposal': ('.lq.Lobby.resolveFestivalActivityProposal', b'\n).lq.Lobby.resolveFestivalActivityProposal'),
+        'resolveFestivalActivityEvent': ('.lq.Lobby.resolveFestivalActivityEvent', b'\n&.lq.Lobby.resolveFestivalActivityEvent'),
+        'buyFestivalProposal': ('.lq.Lobby.buyFestivalProposal', b'\n\x1d.lq.Lobby.buyFestivalProposal'),
+        'islandActivityMove': ('.lq.Lobby.islandActivityMove', b'\n\x1c.lq.Lobby.islandActivityMove'),
+        'islandActivityBuy': ('.lq.Lobby.islandActivityBuy', b'\n\x1b.lq.Lobby.islandActivityBuy'),
+        'islandActivitySell': ('.lq.Lobby.islandActivitySell', b'\n\x1c.lq.Lobby.islandActivitySell'),
+        'islandActivityTidyBag': ('.lq.Lobby.islandActivityTidyBag', b'\n\x1f.lq.Lobby.islandActivityTidyBag'),
+        'islandActivityUnlockBagGrid': ('.lq.Lobby.islandActivityUnlockBagGrid', b'\n%.lq.Lobby.islandActivityUnlockBagGrid'),
+        'createCustomizedContest': ('.lq.Lobby.createCustomizedContest', b'\n!.lq.Lobby.createCustomizedContest'),
+        'fetchManagerCustomizedContestList': ('.lq.Lobby.fetchManagerCustomizedContestList', b'\n+.lq.Lobby.fetchManagerCustomizedContestList'),
+        'fetchManagerCustomizedContest': ('.lq.Lobby.fetchManagerCustomizedContest', b"\n'.lq.Lobby.fetchManagerCustomizedContest"),
+        'updateManagerCustomizedContest': ('.lq.Lobby.updateManagerCustomizedContest', b'\n(.lq.Lobby.updateManagerCustomizedContest'),
+        'fetchContestPlayerRank': ('.lq.Lobby.fetchContestPlayerRank', b'\n .lq.Lobby.fetchContestPlayerRank'),
+        'fetchReadyPlayerList': ('.lq.Lobby.fetchReadyPlayerList', b'\n\x1e.lq.Lobby.fetchReadyPlayerList'),
+        'createGamePlan': ('.lq.Lobby.createGamePlan', b'\n\x18.lq.Lobby.createGamePlan'),
+        'generateContestManagerLoginCode': ('.lq.Lobby.generateContestManagerLoginCode', b'\n).lq.Lobby.generateContestManagerLoginCode'),
+        'amuletActivityFetchInfo': ('.lq.Lobby.amuletActivityFetchInfo', b'\n!.lq.Lobby.amuletActivityFetchInfo'),
+        'amuletActivityFetchBrief': ('.lq.Lobby.amuletActivityFetchBrief', b'\n".lq.Lobby.amuletActivityFetchBrief'),
+        'amuletActivityStartGame': ('.lq.Lobby.amuletActivityStartGame', b'\n!.lq.Lobby.amuletActivityStartGame'),
+        'amuletActivityOperate': ('.lq.Lobby.amuletActivityOperate', b'\n\x1f.lq.Lobby.amuletActivityOperate'),
+        'amuletActivityChangeHands': ('.lq.Lobby.amuletActivityChangeHands', b'\n#.lq.Lobby.amuletActivityChangeHands'),
+        'amuletActivityUpgrade': ('.lq.Lobby.amuletActivityUpgrade', b'\n\x1f.lq.Lobby.amuletActivityUpgrade'),
+        'amuletActivityBuy': ('.lq.Lobby.amuletActivityBuy', b'\n\x1b.lq.Lobby.amuletActivityBuy'),
+        'amuletActivitySelectPack': ('.lq.Lobby.amuletActivitySelectPack', b'\n".lq.Lobby.amuletActivitySelectPack'),
+        'amuletActivitySellEffect': ('.lq.Lobby.amuletActivitySellEffect', b'\n".lq.Lobby.amuletActivitySellEffect'),
+        'amuletActivityEffectSort': ('.lq.Lobby.amuletActivityEffectSort', b'\n".lq.Lobby.amuletActivityEffectSort'),
+        'amuletActivityGiveup': ('.lq.Lobby.amuletActivityGiveup', b'\n\x1e.lq.Lobby.amuletActivityGiveup'),
+        'amuletActivityRefreshShop': ('.lq.Lobby.amuletActivityRefreshShop', b'\n#.lq.Lobby.amuletActivityRefreshShop'),
+        'amuletActivitySelectFreeEffect': ('.lq.Lobby.amuletActivitySelectFreeEffect', b'\n(.lq.Lobby.amuletActivitySelectFreeEffect'),
+        'amuletActivityUpgradeShopBuff': ('.lq.Lobby.amuletActivityUpgradeShopBuff', b"\n'.lq.Lobby.amuletActivityUpgradeShopBuff"),
+        'amuletActivityEndShopping': ('.lq.Lobby.amuletActivityEndShopping', b'\n#.lq.Lobby.amuletActivityEndShopping'),
+        'amuletActivitySetSkillLevel': ('.lq.Lobby.amuletActivitySetSkillLevel', b'\n%.lq.Lobby.amuletActivitySetSkillLevel'),
+        'amuletActivityMaintainInfo': ('.lq.Lobby.amuletActivityMaintainInfo', b'\n$.lq.Lobby.amuletActivityMaintainInfo'),
+        'amuletActivitySelectRewardPack': ('.lq.Lobby.amuletActivitySelectRewardPack', b'\n(.lq.Lobby.amuletActivitySelectRewardPack'),
+        'amuletActivityReceiveTaskReward': ('.lq.Lobby.amuletActivityReceiveTaskReward', b'\n).lq.Lobby.amuletActivityReceiveTaskReward'),
+        'storyActivityUnlock': ('.lq.Lobby.storyActivityUnlock', b'\n\x1d.lq.Lobby.storyActivityUnlock'),
+        'storyActivityUnlockEnding': ('.lq.Lobby.storyActivityUnlockEnding', b'\n#.lq.Lobby.storyActivityUnlockEnding'),
+        'storyActivityReceiveEndingReward': ('.lq.Lobby.storyActivityReceiveEndingReward', b'\n*.lq.Lobby.storyActivityReceiveEndingReward'),
+        'storyActivityReceiveFinishReward': ('.lq.Lobby.storyActivityReceiveFinishReward', b'\n*.lq.Lobby.storyActivityReceiveFinishReward'),
+        'storyActivityReceiveAllFinishReward': ('.lq.Lobby.storyActivityReceiveAllFinishReward', b'\n-.lq.Lobby.storyActivityReceiveAllFinishReward'),
+        'storyActivityUnlockEndingAndReceive': ('.lq.Lobby.storyActivityUnlockEndingAndReceive', b'\n-.lq.Lobby.storyActivityUnlockEndingAndReceive'),
+        'fetchActivityRank': ('.lq.Lobby.fetchActivityRank', b'\n\x1b.lq.Lobby.fetchActivityRank'),
+        'setVerifiedHidden': ('.lq.Lobby.setVerifiedHidden', b'\n\x1b.lq.Lobby.setVerifiedHidden'),
+        'fetchQuestionnaireList': ('.lq.Lobby.fetchQuestionnaireList', b'\n .lq.Lobby.fetchQuestionnaireList'),
+        'fetchQuestionnaireDetail': ('.lq.Lobby.fetchQuestionnaireDetail', b'\n".lq.Lobby.fetchQuestionnaireDetail'),
+        'submitQuestionnaire': ('.lq.Lobby.submitQuestionnaire', b'\n\x1d.lq.Lobby.submitQuestionnaire'),
+        'setFriendRoomRandomBotChar': ('.lq.Lobby.setFriendRoomRandomBotChar', b'\n$.lq.Lobby.setFriendRoomRandomBotChar'),
+        'fetchAccountGameHuRecords': ('.lq.Lobby.fetchAccountGameHuRecords', b'\n#.lq.Lobby.fetchAccountGameHuRecords'),
+        'fetchAccountInfoExtra': ('.lq.Lobby.fetchAccountInfoExtra', b'\n\x1f.lq.Lobby.fetchAccountInfoExtra'),
+        'setAccountFavoriteHu': ('.lq.Lobby.setAccountFavoriteHu', b'\n\x1e.lq.Lobby.setAccountFavoriteHu'),
+        'fetchSeerReport': ('.lq.Lobby.fetchSeerReport', b'\n\x19.lq.Lobby.fetchSeerReport'),
+        'createSeerReport': ('.lq.Lobby.createSeerReport', b'\n\x1a.lq.Lobby.createSeerReport'),
+        'fetchSeerReportList': ('.lq.Lobby.fetchSeerReportList', b'\n\x1d.lq.Lobby.fetchSeerReportList'),
+        'fetchSeerInfo': ('.lq.Lobby.fetchSeerInfo', b'\n\x17.lq.Lobby.fetchSeerInfo'),
+        'selectChestChooseUpActivity': ('.lq.Lobby.selectChestChooseUpActivity', b'\n%.lq.Lobby.selectChestChooseUpActivity'),
+        'generateAnnualReportToken': ('.lq.Lobby.generateAnnualReportToken', b'\n#.lq.Lobby.generateAnnualReportToken'),
+        'fetchAnnualReportInfo': ('.lq.Lobby.fetchAnnualReportInfo', b'\n\x1f.lq.Lobby.fetchAnnualReportInfo'),
+        'remarkFriend': ('.lq.Lobby.remarkFriend', b'\n\x16.lq.Lobby.remarkFriend'),
+        'simV2ActivityFetchInfo': ('.lq.Lobby.simV2ActivityFetchInfo', b'\n .lq.Lobby.simV2ActivityFetchInfo'),
+        'simV2ActivityStartSeason': ('.lq.Lobby.simV2ActivityStartSeason', b'\n".lq.Lobby.simV2ActivityStartSeason'),
+        'simV2ActivityTrain': ('.lq.Lobby.simV2ActivityTrain', b'\n\x1c.lq.Lobby.simV2ActivityTrain'),
+        'simV2ActivitySelectEvent': ('.lq.Lobby.simV2ActivitySelectEvent', b'\n".lq.Lobby.simV2ActivitySelectEvent'),
+        'simV2ActivityStartMatch': ('.lq.Lobby.simV2ActivityStartMatch', b'\n!.lq.Lobby.simV2ActivityStartMatch'),
+        'simV2ActivityEndMatch': ('.lq.Lobby.simV2ActivityEndMatch', b'\n\x1f.lq.Lobby.simV2ActivityEndMatch'),
+        'simV2ActivityGiveUp': ('.lq.Lobby.simV2ActivityGiveUp', b'\n\x1d.lq.Lobby.simV2ActivityGiveUp'),
+        'simV2ActivitySetUpgrade': ('.lq.Lobby.simV2ActivitySetUpgrade', b'\n!.lq.Lobby.simV2ActivitySetUpgrade'),
+    }
+
+    def get_package_name(self):
+        return 'lq'
+
+    def get_service_name(self):
+        return 'Lobby'
+
+    def get_req_class(self, method):
+        return getattr(pb, Lobby._req[method])
+
+    def get_res_class(self, method):
+        return getattr(pb, Lobby._res[method])
+
+    def __getattr__(self, name):
+        method = Lobby._methods.get(name)
+        if method is None:
+            raise AttributeError("{!r} object has no attribute {!r}".format(type(self).__name__, name))
+
+        async def call(req, timeout=None, replay=True):
+            return await self.call_method(method, req, timeout=timeout, replay=replay)
+
+        call.__name__ = name
+        setattr(self, name, call)
+        return call
+
+
+class FastTest(MSRPCService):
+    version = None
+
+    _req = {
+        'authGame': 'ReqAuthGame',
+        'enterGame': 'ReqCommon',
+        'syncGame': 'ReqSyncGame',
+        'finishSyncGame': 'ReqCommon',
+        'terminateGame': 'ReqCommon',
+        'inputOperation': 'ReqSelfOperation',
+        'inputChiPengGang': 'ReqChiPengGang',
+        'confirmNewRound': 'ReqCommon',
+        'broadcastInGame': 'ReqBroadcastInGame',
+        'inputGameGMCommand': 'ReqGMCommandInGaming',
+        'fetchGamePlayerState': 'ReqCommon',
+        'checkNetworkDelay': 'ReqCommon',
+        'clearLeaving': 'ReqCommon',
+        'voteGameEnd': 'ReqVoteGameEnd',
+        'authObserve': 'ReqAuthObserve',
+        'startObserve': 'ReqCommon',
+        'stopObserve': 'ReqCommon',
+    }
+    _res = {
+        'authGame': 'ResAuthGame',
+        'enterGame': 'ResEnterGame',
+        'syncGame': 'ResSyncGame',
+        'finishSyncGame': 'ResCommon',
+        'terminateGame': 'ResCommon',
+        'inputOperation': 'ResCommon',
+        'inputChiPengGang': 'ResCommon',
+        'confirmNewRound': 'ResCommon',
+        'broadcastInGame': 'ResCommon',
+        'inputGameGMCommand': 'ResCommon',
+        'fetchGamePlayerState': 'ResGamePlayerState',
+        'checkNetworkDelay': 'ResCommon',
+        'clearLeaving': 'ResCommon',
+        'voteGameEnd': 'ResGameEndVote',
+        'authObserve': 'ResCommon',
+        'startObserve': 'ResStartObserve',
+        'stopObserve': 'ResCommon',
+    }
+    _methods = {
+        'auth_game': 'authGame',
+        'enter_game': 'enterGame',
+        'sync_game': 'syncGame',
+        'finish_sync_game': 'finishSyncGame',
+        'terminate_game': 'terminateGame',
+        'input_operation': 'inputOperation',
+        'input_chi_peng_gang': 'inputChiPengGang',
+        'confirm_new_round': 'confirmNewRound',
+        'broadcast_in_game': 'broadcastInGame',
+        'input_game_gm_command': 'inputGameGMCommand',
+        'fetch_game_player_state': 'fetchGamePlayerState',
+        'check_network_delay': 'checkNetworkDelay',
+        'clear_leaving': 'clearLeaving',
+        'vote_game_end': 'voteGameEnd',
+        'auth_observe': 'authObserve',
+        'start_observe': 'startObserve',
+        'stop_observe': 'stopObserve',
+    }
+    # method -> (full method name, pre-serialized Wrapper.name field) for the request path
+    _names = {
+        'authGame': ('.lq.FastTest.authGame', b'\n\x15.lq.FastTest.authGame'),
+        'enterGame': ('.lq.FastTest.enterGame', b'\n\x16.lq.FastTest.enterGame'),
+        'syncGame': ('.lq.FastTest.syncGame', b'\n\x15.lq.FastTest.syncGame'),
+        'finishSyncGame': ('.lq.FastTest.finishSyncGame', b'\n\x1b.lq.FastTest.finishSyncGame'),
+        'terminateGame': ('.lq.FastTest.terminateGame', b'\n\x1a.lq.FastTest.terminateGame'),
+        'inputOperation': ('.lq.FastTest.inputOperation', b'\n\x1b.lq.FastTest.inputOperation'),
+        'inputChiPengGang': ('.lq.FastTest.inputChiPengGang', b'\n\x1d.lq.FastTest.inputChiPengGang'),
+        'confirmNewRound': ('.lq.FastTest.confirmNewRound', b'\n\x1c.lq.FastTest.confirmNewRound'),
+        'broadcastInGame': ('.lq.FastTest.broadcastInGame', b'\n\x1c.lq.FastTest.broadcastInGame'),
+        'inputGameGMCommand': ('.lq.FastTest.inputGameGMCommand', b'\n\x1f.lq.FastTest.inputGameGMCommand'),
+        'fetchGamePlayerState': ('.lq.FastTest.fetchGamePlayerState', b'\n!.lq.FastTest.fetchGamePlayerState'),
+        'checkNetworkDelay': ('.lq.FastTest.checkNetworkDelay', b'\n\x1e.lq.FastTest.checkNetworkDelay'),
+        'clearLeaving': ('.lq.FastTest.clearLeaving', b'\n\x19.lq.FastTest.clearLeaving'),
+        'voteGameEnd': ('.lq.FastTest.voteGameEnd', b'\n\x18.lq.FastTest.voteGameEnd'),
+        'authObserve': ('.lq.FastTest.authObserve', b'\n\x18.lq.FastTest.authObserve'),
+        'startObserve': ('.lq.FastTest.startObserve', b'\n\x19.lq.FastTest.startObserve'),
+        'stopObserve': ('.lq.FastTest.stopObserve', b'\n\x18.lq.FastTest.stopObserve'),
+    }
+
+    def get_package_name(self):
+        return 'lq'
+
+    def get_service_name(self):
+        return 'FastTest'
+
+    def get_req_class(self, method):
+        return getattr(pb, FastTest._req[method])
+
+    def get_res_class(self, method):
+        return getattr(pb, FastTest._res[method])
+
+    def __getattr__(self, name):
+        method = FastTest._methods.get(name)
+        if method is None:
+            raise AttributeError("{!r} object has no attribute {!r}".format(type(self).__name__, name))
+
+        async def call(req, timeout=None, replay=True):
+            return await self.call_method(method, req, timeout=timeout, replay=replay)
+
+        call.__name__ = name
+        setattr(self, name, call)
+        return call
+
+
+class Route(MSRPCService):
+    version = None
+
+    _req = {
+        'requestConnection': 'ReqRequestConnection',
+        'requestRouteChange': 'ReqRequestRouteChange',
+        'heartbeat': 'ReqHeartbeat',
+    }
+    _res = {
+        'requestConnection': 'ResRequestConnection',
+        'requestRouteChange': 'ResRequestRouteChange',
+        'heartbeat': 'ResHeartbeat',
+    }
+    _methods = {
+        'request_connection': 'requestConnection',
+        'request_route_change': 'requestRouteChange',
+        'heartbeat': 'heartbeat',
+    }
+    # method -> (full method name, pre-serialized Wrapper.name field) for the request path
+    _names = {
+        'requestConnection': ('.lq.Route.requestConnection', b'\n\x1b.lq.Route.requestConnection'),
+        'requestRouteChange': ('.lq.Route.requestRouteChange', b'\n\x1c.lq.Route.requestRouteChange'),
+        'heartbeat': ('.lq.Route.heartbeat', b'\n\x13.lq.Route.heartbeat'),
+    }
+
+    def get_package_name(self):
+        return 'lq'
+
+    def get_service_name(self):
+        return 'Route'
+
+    def get_req_class(self, method):
+        return getattr(pb, Route._req[method])
+
+    def get_res_class(self, method):
+        return getattr(pb, Route._res[method])
+
+    def __getattr__(self, name):
+        method = Route._methods.get(name)
+        if method is None:
+            raise AttributeError("{!r} object has no attribute {!r}".format(type(self).__name__, name))
+
+        async def call(req, timeout=None, replay=True):
+            return await self.call_method(method, req, timeout=timeout, replay=replay)
+
+        call.__name__ = name
+        setattr(self, name, call)
+        return call
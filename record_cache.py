@@ -0,0 +1,94 @@
+import hashlib
+import json
+import os
+import tempfile
+import threading
+
+
+def _atomic_write(path, data):
+    # 같은 디렉터리에 임시 파일로 쓴 뒤 os.replace 로 교체한다. 도중에 죽어도 반쯤 쓰인 파일이 남지 않는다.
+    directory = os.path.dirname(path)
+    fd, tmp_path = tempfile.mkstemp(dir=directory, prefix=".tmp-")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, path)
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
+
+
+class RecordCache:
+    # 패보 원본(ResGameRecord.data, 즉 직렬화된 Wrapper)을 디스크에 보관한다.
+    # blob 은 sha256 으로 주소를 매겨 저장하고, index.json 이 game_uuid -> sha256 을 기록한다.
+    # 끝난 게임의 패보는 바뀌지 않으므로 한 번 쓴 항목은 덮어쓰지 않는다 (blob 이 깨졌을 때만 다시 쓴다).
+    # put() 은 blob 만 바로 쓰고 index 는 메모리에서 고친다. index.json 은 flush() 에서 한 번에 쓴다
+    # (게임마다 index 전체를 다시 쓰면 n 개를 받을 때 O(n²) 이다). flush 전에 죽으면 그 blob 들은 다음에 다시 받는다.
+
+    def __init__(self, root):
+        self._root = root
+        self._blob_dir = os.path.join(root, "blobs")
+        self._index_path = os.path.join(root, "index.json")
+        os.makedirs(self._blob_dir, exist_ok=True)
+
+        self._index = {}
+        self._dirty = False
+        # put() 은 여러 스레드에서 동시에 불릴 수 있다 (main 은 asyncio.to_thread 로 부른다)
+        self._lock = threading.Lock()
+        if os.path.exists(self._index_path):
+            with open(self._index_path, "r", encoding="utf-8") as f:
+                self._index = json.load(f)
+
+    def __contains__(self, game_uuid):
+        return game_uuid in self._index
+
+    def __len__(self):
+        return len(self._index)
+
+    def _blob_path(self, digest):
+        return os.path.join(self._blob_dir, digest[:2], digest)
+
+    def _read_blob(self, digest):
+        # 내용이 digest 와 맞는 blob 만 돌려준다. 없거나 깨졌으면 None.
+        try:
+            with open(self._blob_path(digest), "rb") as f:
+                data = f.read()
+        except FileNotFoundError:
+            return None
+        if hashlib.sha256(data).hexdigest() != digest:
+            return None
+        return data
+
+    def get(self, game_uuid):
+        digest = self._index.get(game_uuid)
+        if digest is None:
+            return None
+        return self._read_blob(digest)
+
+    def put(self, game_uuid, data):
+        # 이미 있는 항목은 blob 이 멀쩡할 때만 그대로 둔다. blob 이 없어졌거나 깨졌으면 다시 쓴다.
+        digest = self._index.get(game_uuid)
+        if digest is not None and self._read_blob(digest) is not None:
+            return digest
+
+        digest = hashlib.sha256(data).hexdigest()
+        if self._read_blob(digest) is None:
+            blob_path = self._blob_path(digest)
+            os.makedirs(os.path.dirname(blob_path), exist_ok=True)
+            _atomic_write(blob_path, data)
+
+        with self._lock:
+            if self._index.get(game_uuid) != digest:
+                self._index[game_uuid] = digest
+                self._dirty = True
+        return digest
+
+    def flush(self):
+        with self._lock:
+            if not self._dirty:
+                return
+            self._dirty = False
+            data = json.dumps(self._index, sort_keys=True).encode("utf-8")
+        _atomic_write(self._index_path, data)
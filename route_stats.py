@@ -0,0 +1,122 @@
+import asyncio
+import json
+import os
+import time
+
+# 지수이동평균(EWMA) 가중치. 클수록 최근 측정값을 더 믿는다.
+EWMA_ALPHA = 0.3
+
+
+def _host_port(domain):
+    host, _, port = domain.partition(":")
+    return host, int(port) if port else 443
+
+
+async def probe_route(domain, timeout, use_ssl=True):
+    # TCP(+TLS) 연결이 맺어지는 데 걸린 시간(초). 실패하거나 timeout 을 넘기면 None.
+    host, port = _host_port(domain)
+    start = time.perf_counter()
+    try:
+        _, writer = await asyncio.wait_for(
+            asyncio.open_connection(host, port, ssl=True if use_ssl else None), timeout
+        )
+    except (OSError, asyncio.TimeoutError):
+        return None
+    latency = time.perf_counter() - start
+    writer.close()
+    try:
+        await writer.wait_closed()
+    except OSError:
+        pass
+    return latency
+
+
+class RouteStats:
+    # route id 별 연결 지연(EWMA)과 연속 실패 횟수를 실행 간에 보관한다. path 가 비어 있으면 메모리에만 둔다.
+
+    def __init__(self, path=None):
+        self._path = path
+        self._stats = {}
+        if path and os.path.exists(path):
+            try:
+                with open(path, "r", encoding="utf-8") as f:
+                    self._stats = json.load(f)
+            except json.JSONDecodeError:
+                self._stats = {}
+
+    def record_latency(self, route_id, latency):
+        entry = self._stats.setdefault(route_id, {"ewma": latency, "samples": 0, "failures": 0})
+        entry["ewma"] = latency if entry["samples"] == 0 else EWMA_ALPHA * latency + (1 - EWMA_ALPHA) * entry["ewma"]
+        entry["samples"] += 1
+        entry["failures"] = 0
+        entry["updated_at"] = time.time()
+
+    def record_failure(self, route_id):
+        entry = self._stats.setdefault(route_id, {"ewma": None, "samples": 0, "failures": 0})
+        entry["failures"] += 1
+        entry["updated_at"] = time.time()
+
+    def score(self, route_id):
+        # 정렬 키: 연속 실패가 적은 쪽, 그 다음 평균 지연이 짧은 쪽. 측정 기록이 없으면 맨 뒤.
+        entry = self._stats.get(route_id)
+        if entry is None or entry["ewma"] is None:
+            return (entry["failures"] if entry else 0, float("inf"))
+        return (entry["failures"], entry["ewma"])
+
+    def save(self):
+        if not self._path:
+            return
+        directory = os.path.dirname(self._path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        tmp_path = self._path + ".tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(self._stats, f)
+        os.replace(tmp_path, self._path)
+
+
+# 백그라운드에서 마저 기다리는 probe 작업. 참조를 잡아두지 않으면 끝나기 전에 GC 될 수 있다.
+_late_probes = set()
+
+
+def _record_probe(stats, route, latency):
+    if latency is None:
+        stats.record_failure(route["id"])
+    else:
+        stats.record_latency(route["id"], latency)
+
+
+async def _record_late_probes(probes, stats):
+    await asyncio.wait(probes)
+    for task, route in probes.items():
+        _record_probe(stats, route, task.result())
+    stats.save()
+
+
+async def rank_routes(routes, stats, timeout, use_ssl=True):
+    # 모든 후보 route 에 동시에 연결을 시도해 보고, 가장 먼저 연결된 route 를 맨 앞에, 나머지는 누적 통계 순으로 돌려준다.
+    # 느리거나 막힌 route 의 probe 는 기다리지 않는다 (연결할 때마다 timeout 만큼 늦어지지 않게).
+    # 그런 probe 는 백그라운드에서 끝까지 돌고 결과를 통계에 남긴다. 모두 실패하면 timeout 까지 기다린다.
+    probes = {asyncio.ensure_future(probe_route(route["domain"], timeout, use_ssl)): route for route in routes}
+    pending = set(probes)
+    first = None
+    while pending and first is None:
+        done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+        # 같은 순간에 여러 개가 끝났으면 그중 지연이 짧은 쪽을 고른다.
+        for task in sorted(done, key=lambda task: float("inf") if task.result() is None else task.result()):
+            latency = task.result()
+            _record_probe(stats, probes[task], latency)
+            if latency is not None and first is None:
+                first = probes[task]
+    stats.save()
+
+    if pending:
+        task = asyncio.ensure_future(_record_late_probes({task: probes[task] for task in pending}, stats))
+        _late_probes.add(task)
+        task.add_done_callback(_late_probes.discard)
+
+    ranked = sorted(routes, key=lambda route: stats.score(route["id"]))
+    if first is not None:
+        ranked.remove(first)
+        ranked.insert(0, first)
+    return ranked
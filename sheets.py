@@ -0,0 +1,117 @@
+import asyncio
+import logging
+import random
+import re
+
+from datetime import datetime, timedelta
+
+import gspread
+from oauth2client.service_account import ServiceAccountCredentials
+
+SCOPE = ["https://spreadsheets.google.com/feeds", "https://www.googleapis.com/auth/drive"]
+
+
+def authorize(keyfile="credentials.json"):
+    creds = ServiceAccountCredentials.from_json_keyfile_name(keyfile, SCOPE)
+    return gspread.authorize(creds)
+
+
+# 시트의 날짜 셀(1899-12-30 기준 일수)로 바꿔 쓰는 "YYYY-MM-DD HH:MM" 문자열 (main.format_time 형식)
+_DATE_TIME = re.compile(r"^\d{4}-\d{2}-\d{2} \d{2}:\d{2}$")
+_SHEETS_EPOCH = datetime(1899, 12, 30)
+
+
+def _cell(value):
+    # USER_ENTERED 로 붙이던 값과 같은 셀이 되도록 appendCells 의 CellData 로 바꾼다.
+    if isinstance(value, bool):
+        return {"userEnteredValue": {"boolValue": value}}
+    if isinstance(value, (int, float)):
+        return {"userEnteredValue": {"numberValue": value}}
+    if isinstance(value, str) and _DATE_TIME.match(value):
+        days = (datetime.strptime(value, "%Y-%m-%d %H:%M") - _SHEETS_EPOCH) / timedelta(days=1)
+        return {
+            "userEnteredValue": {"numberValue": days},
+            "userEnteredFormat": {"numberFormat": {"type": "DATE_TIME", "pattern": "yyyy-mm-dd hh:mm"}},
+        }
+    return {"userEnteredValue": {"stringValue": "" if value is None else str(value)}}
+
+
+def _append_cells(sheet_id, rows):
+    # 서버가 워크시트의 마지막 행 다음을 찾아 붙이고, 모자란 그리드 행도 늘린다.
+    return {
+        "appendCells": {
+            "sheetId": sheet_id,
+            "rows": [{"values": [_cell(value) for value in row]} for row in rows],
+            "fields": "userEnteredValue,userEnteredFormat.numberFormat",
+        }
+    }
+
+
+async def _call_with_retry(max_retries, fn, *args, **kwargs):
+    for attempt in range(max_retries + 1):
+        try:
+            return await asyncio.to_thread(fn, *args, **kwargs)
+        except gspread.exceptions.APIError as e:
+            if e.code != 429 or attempt == max_retries:
+                raise
+            delay = min(2 ** attempt, 64) + random.random()
+            logging.warning(f"Sheets quota exceeded (429), retrying in {delay:.1f}s")
+            await asyncio.sleep(delay)
+
+
+class SheetSink:
+    # 스프레드시트 하나를 한 번만 열어두고, 여러 워크시트에 붙일 행을 append_rows() 한 번에 쓴다.
+    # 워크시트마다 appendCells 요청을 만들어 batchUpdate 한 번으로 보낸다. 다음 행 번호는 서버가 정하고
+    # (모자란 그리드 행도 서버가 늘린다), 한 번의 batchUpdate 는 전부 쓰이거나 전부 안 쓰인다.
+    # 같은 스프레드시트에 쓰는 대회끼리는 sink 하나를 같이 쓰고, append_rows() 는 lock 으로 차례로 보낸다.
+    # 429(quota) 응답은 지수 백오프로 재시도한다.
+    # gspread 호출은 blocking 이라 asyncio.to_thread 로 돌리고, 백오프도 asyncio.sleep 으로 기다려 이벤트 루프를 막지 않는다.
+    # 만들 때는 await SheetSink.open(client, spreadsheet_name).
+
+    def __init__(self, spreadsheet, max_retries=6):
+        self._max_retries = max_retries
+        self._spreadsheet = spreadsheet
+        self._worksheets = None
+        self._lock = asyncio.Lock()
+
+    @classmethod
+    async def open(cls, client, spreadsheet_name, max_retries=6):
+        spreadsheet = await _call_with_retry(max_retries, client.open, spreadsheet_name)
+        return cls(spreadsheet, max_retries)
+
+    async def _call(self, fn, *args, **kwargs):
+        return await _call_with_retry(self._max_retries, fn, *args, **kwargs)
+
+    async def worksheet(self, title):
+        if self._worksheets is None:
+            self._worksheets = {ws.title: ws for ws in await self._call(self._spreadsheet.worksheets)}
+        return self._worksheets[title]
+
+    async def append_rows(self, rows_by_title):
+        # {워크시트 이름: [행, ...]} 를 한 번의 batchUpdate 로 붙인다.
+        requests = []
+        for title, rows in rows_by_title.items():
+            if not rows:
+                continue
+            ws = await self.worksheet(title)
+            requests.append(_append_cells(ws.id, rows))
+        if not requests:
+            return
+        async with self._lock:
+            await self._call(self._spreadsheet.batch_update, {"requests": requests})
+
+    async def replace_rows(self, rows_by_title):
+        # 각 워크시트의 머리행 아래 값을 모두 지우고 rows 로 바꾼다. 역시 batchUpdate 한 번이라 전부 바뀌거나 그대로다.
+        requests = []
+        for title, rows in rows_by_title.items():
+            ws = await self.worksheet(title)
+            requests.append({
+                "updateCells": {
+                    "range": {"sheetId": ws.id, "startRowIndex": 1},
+                    "fields": "userEnteredValue",
+                }
+            })
+            if rows:
+                requests.append(_append_cells(ws.id, rows))
+        async with self._lock:
+            await self._call(self._spreadsheet.batch_update, {"requests": requests})
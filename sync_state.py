@@ -0,0 +1,109 @@
+import os
+import sqlite3
+import time
+
+
+class SyncState:
+    # 시트에 이미 올린 게임 uuid 를 로컬 sqlite 에 기록해 둔다.
+    # 매 실행마다 시트의 패보 링크 열 전체를 읽는 대신 새 기록만 인덱스에서 확인하고,
+    # reconcile() 로 가끔씩 시트 내용과 맞춘다 (시트가 기준).
+
+    def __init__(self, path):
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self._conn = sqlite3.connect(path)
+        self._conn.executescript(
+            """
+            CREATE TABLE IF NOT EXISTS synced_uuids (
+                tournament_id INTEGER NOT NULL,
+                uuid TEXT NOT NULL,
+                PRIMARY KEY (tournament_id, uuid)
+            );
+            CREATE TABLE IF NOT EXISTS reconciled (
+                tournament_id INTEGER PRIMARY KEY,
+                reconciled_at REAL NOT NULL
+            );
+            CREATE TABLE IF NOT EXISTS high_water (
+                tournament_id INTEGER PRIMARY KEY,
+                end_time INTEGER NOT NULL
+            );
+            CREATE TABLE IF NOT EXISTS fetch_failures (
+                tournament_id INTEGER NOT NULL,
+                uuid TEXT NOT NULL,
+                attempts INTEGER NOT NULL,
+                PRIMARY KEY (tournament_id, uuid)
+            );
+            """
+        )
+
+    def close(self):
+        self._conn.close()
+
+    def is_synced(self, tournament_id, uuid):
+        row = self._conn.execute(
+            "SELECT 1 FROM synced_uuids WHERE tournament_id = ? AND uuid = ?", (tournament_id, uuid)
+        ).fetchone()
+        return row is not None
+
+    def mark_synced(self, tournament_id, uuids):
+        with self._conn:
+            self._conn.executemany(
+                "INSERT OR IGNORE INTO synced_uuids (tournament_id, uuid) VALUES (?, ?)",
+                [(tournament_id, uuid) for uuid in uuids],
+            )
+            self._conn.executemany(
+                "DELETE FROM fetch_failures WHERE tournament_id = ? AND uuid = ?",
+                [(tournament_id, uuid) for uuid in uuids],
+            )
+
+    def record_fetch_failure(self, tournament_id, uuid):
+        # 패보를 받지 못한 횟수를 하나 올리고 지금까지의 횟수를 돌려준다. 시트에 올리면 mark_synced 가 지운다.
+        with self._conn:
+            self._conn.execute(
+                "INSERT INTO fetch_failures (tournament_id, uuid, attempts) VALUES (?, ?, 1) "
+                "ON CONFLICT (tournament_id, uuid) DO UPDATE SET attempts = attempts + 1",
+                (tournament_id, uuid),
+            )
+        return self._conn.execute(
+            "SELECT attempts FROM fetch_failures WHERE tournament_id = ? AND uuid = ?", (tournament_id, uuid)
+        ).fetchone()[0]
+
+    def reconcile_due(self, tournament_id, interval):
+        row = self._conn.execute(
+            "SELECT reconciled_at FROM reconciled WHERE tournament_id = ?", (tournament_id,)
+        ).fetchone()
+        return row is None or time.time() - row[0] >= interval
+
+    def reconcile(self, tournament_id, sheet_uuids):
+        # 인덱스를 시트의 uuid 목록으로 교체하고, 어긋나 있던 개수를 (인덱스에만 있음, 시트에만 있음) 으로 돌려준다.
+        local = {
+            row[0]
+            for row in self._conn.execute("SELECT uuid FROM synced_uuids WHERE tournament_id = ?", (tournament_id,))
+        }
+        sheet_uuids = set(sheet_uuids)
+        with self._conn:
+            self._conn.execute("DELETE FROM synced_uuids WHERE tournament_id = ?", (tournament_id,))
+            self._conn.executemany(
+                "INSERT INTO synced_uuids (tournament_id, uuid) VALUES (?, ?)",
+                [(tournament_id, uuid) for uuid in sheet_uuids],
+            )
+            self._conn.execute(
+                "INSERT OR REPLACE INTO reconciled (tournament_id, reconciled_at) VALUES (?, ?)",
+                (tournament_id, time.time()),
+            )
+        return len(local - sheet_uuids), len(sheet_uuids - local)
+
+    def get_high_water(self, tournament_id):
+        # 이 대회에서 시트까지 반영을 끝낸 마지막 게임의 endTime (없으면 0)
+        row = self._conn.execute(
+            "SELECT end_time FROM high_water WHERE tournament_id = ?", (tournament_id,)
+        ).fetchone()
+        return row[0] if row else 0
+
+    def set_high_water(self, tournament_id, end_time):
+        with self._conn:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO high_water (tournament_id, end_time) VALUES (?, ?)",
+                (tournament_id, end_time),
+            )